@@ -81,6 +81,7 @@ cdef set _ITERABLE_LIKE_TYPES
 cdef class FastPrimitivesCoderImpl(StreamCoderImpl):
   cdef CoderImpl fallback_coder_impl
   cdef CoderImpl iterable_coder_impl
+  cdef dict _fallback_sizes
   @cython.locals(dict_value=dict, int_value=libc.stdint.int64_t,
                  unicode_value=unicode)
   cpdef encode_to_stream(self, value, OutputStream stream, bint nested)
@@ -92,6 +93,10 @@ cdef class BytesCoderImpl(CoderImpl):
   pass
 
 
+cdef class StrUtf8CoderImpl(StreamCoderImpl):
+  pass
+
+
 cdef class BooleanCoderImpl(CoderImpl):
   pass
 
@@ -154,6 +159,16 @@ cdef class IterableCoderImpl(SequenceCoderImpl):
   pass
 
 
+cdef class MapCoderImpl(StreamCoderImpl):
+  cdef CoderImpl _key_coder
+  cdef CoderImpl _value_coder
+
+  @cython.locals(dict_value=dict)
+  cpdef encode_to_stream(self, value, OutputStream out, bint nested)
+  @cython.locals(result=dict, size=libc.stdint.int32_t)
+  cpdef decode_from_stream(self, InputStream in_stream, bint nested)
+
+
 cdef object IntervalWindow
 
 cdef class IntervalWindowCoderImpl(StreamCoderImpl):
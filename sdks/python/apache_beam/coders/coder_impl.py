@@ -36,6 +36,7 @@ For internal use only; no backwards-compatibility guarantees.
 from __future__ import absolute_import
 from __future__ import division
 
+import itertools
 import json
 from builtins import chr
 from builtins import object
@@ -43,6 +44,7 @@ from io import BytesIO
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Iterable
 from typing import Iterator
 from typing import List
@@ -365,12 +367,40 @@ ITERABLE_LIKE_TYPE = 10
 # for the value list types created in GroupByKey.
 _ITERABLE_LIKE_TYPES = set()
 
+# The sizes of containers with more elements than this are extrapolated from
+# the sizes of _SIZE_ESTIMATE_SAMPLE_SIZE evenly spaced elements.
+_MAX_EXHAUSTIVE_SIZE_ESTIMATE = 64
+_SIZE_ESTIMATE_SAMPLE_SIZE = 32
+
+# The encoded size of values of types the FastPrimitivesCoderImpl does not
+# know about is assumed to be fixed once it has been the same this many times,
+# and checked again every _FIXED_SIZE_CHECK_PERIOD estimates.
+_FIXED_SIZE_MIN_OBSERVATIONS = 8
+_FIXED_SIZE_CHECK_PERIOD = 64
+
+
+def _size_estimate_sample(values, count):
+  # type: (Iterable[Any], int) -> Tuple[Iterable[Any], float]
+
+  """Returns the elements of values to estimate the sizes of, along with the
+  factor to scale their total size by.
+  """
+  if count <= _MAX_EXHAUSTIVE_SIZE_ESTIMATE:
+    return values, 1.0
+  step = count // _SIZE_ESTIMATE_SAMPLE_SIZE
+  return (
+      itertools.islice(values, 0, step * _SIZE_ESTIMATE_SAMPLE_SIZE, step),
+      count / _SIZE_ESTIMATE_SAMPLE_SIZE)
+
 
 class FastPrimitivesCoderImpl(StreamCoderImpl):
   """For internal use only; no backwards-compatibility guarantees."""
   def __init__(self, fallback_coder_impl):
     self.fallback_coder_impl = fallback_coder_impl
     self.iterable_coder_impl = IterableCoderImpl(self)
+    # Maps (type, nested) to [size, observations] for the types encoded by
+    # the fallback coder, where size is None if it was not always the same.
+    self._fallback_sizes = {}  # type: Dict[Tuple[type, bool], List[Any]]
 
   @staticmethod
   def register_iterable_like_type(t):
@@ -381,10 +411,65 @@ class FastPrimitivesCoderImpl(StreamCoderImpl):
     if isinstance(value, observable.ObservableMixin):
       # FastPrimitivesCoderImpl can presumably encode the elements too.
       return 1, [(value, self)]
+    return self.estimate_size(value, nested), []
 
-    out = ByteCountingOutputStream()
-    self.encode_to_stream(value, out, nested)
-    return out.get_count(), []
+  def estimate_size(self, value, nested=False):
+    # type: (Any, bool) -> int
+
+    """Estimates the encoded size of the given value, in bytes.
+
+    The sizes of primitives and of their containers are computed from their
+    structure rather than by encoding them, and those of large containers are
+    extrapolated from a sample of their elements.
+    """
+    t = type(value)
+    if value is None:
+      return 1
+    elif t is int:
+      if -(1 << 63) <= value < (1 << 63):
+        return 1 + get_varint_size(value)
+      return 1 + self._estimate_fallback_size(value, nested)
+    elif t is float:
+      return 9
+    elif t is bytes:
+      return 1 + self._get_nested_size(len(value), nested)
+    elif t is past_unicode:
+      return 1 + self._get_nested_size(len(value.encode('utf-8')), nested)
+    elif t is list or t is tuple or t is set:
+      count = len(value)
+      sample, scale = _size_estimate_sample(value, count)
+      return 1 + get_varint_size(count) + int(
+          scale * sum(self.estimate_size(e, True) for e in sample))
+    elif t is dict:
+      count = len(value)
+      sample, scale = _size_estimate_sample(value.items(), count)
+      return 1 + get_varint_size(count) + int(
+          scale * sum(
+              self.estimate_size(k, True) + self.estimate_size(v, True) for k,
+              v in sample))
+    elif t is bool:
+      return 2
+    elif t in _ITERABLE_LIKE_TYPES:
+      return 1 + self.iterable_coder_impl.estimate_size(value, nested)
+    return 1 + self._estimate_fallback_size(value, nested)
+
+  def _estimate_fallback_size(self, value, nested):
+    # type: (Any, bool) -> int
+    key = type(value), nested
+    model = self._fallback_sizes.get(key)
+    if model is None:
+      size = self.fallback_coder_impl.estimate_size(value, nested)
+      self._fallback_sizes[key] = [size, 1]
+      return size
+    fixed_size, observations = model
+    model[1] = observations + 1
+    if fixed_size is not None and (observations >= _FIXED_SIZE_MIN_OBSERVATIONS
+                                   and observations % _FIXED_SIZE_CHECK_PERIOD):
+      return fixed_size
+    size = self.fallback_coder_impl.estimate_size(value, nested)
+    if size != fixed_size:
+      model[0] = None
+    return size
 
   def encode_to_stream(self, value, stream, nested):
     # type: (Any, create_OutputStream, bool) -> None
@@ -499,6 +584,25 @@ class BytesCoderImpl(CoderImpl):
     return encoded
 
 
+class StrUtf8CoderImpl(StreamCoderImpl):
+  """For internal use only; no backwards-compatibility guarantees.
+
+  A coder for unicode strings, encoded as UTF-8."""
+  def encode_to_stream(self, value, out, nested):
+    # type: (str, create_OutputStream, bool) -> None
+    out.write(value.encode('utf-8'), nested)
+
+  def decode_from_stream(self, in_stream, nested):
+    # type: (create_InputStream, bool) -> str
+    return in_stream.read_all(nested).decode('utf-8')
+
+  def encode(self, value):
+    return value.encode('utf-8')
+
+  def decode(self, encoded):
+    return encoded.decode('utf-8')
+
+
 class BooleanCoderImpl(CoderImpl):
   """For internal use only; no backwards-compatibility guarantees.
 
@@ -994,6 +1098,48 @@ class IterableCoderImpl(SequenceCoderImpl):
     return components
 
 
+class MapCoderImpl(StreamCoderImpl):
+  """For internal use only; no backwards-compatibility guarantees.
+
+  A coder for dicts of homogeneous keys and values.
+
+  The number of entries is encoded as a big endian int32, followed by the
+  nested keys and values of the entries.
+  """
+  def __init__(self, key_coder, value_coder):
+    # type: (CoderImpl, CoderImpl) -> None
+    self._key_coder = key_coder
+    self._value_coder = value_coder
+
+  def encode_to_stream(self, value, out, nested):
+    # type: (Dict[Any, Any], create_OutputStream, bool) -> None
+    dict_value = value  # for typing
+    out.write_bigendian_int32(len(dict_value))
+    for k, v in dict_value.items():
+      self._key_coder.encode_to_stream(k, out, True)
+      self._value_coder.encode_to_stream(v, out, True)
+
+  def decode_from_stream(self, in_stream, nested):
+    # type: (create_InputStream, bool) -> Dict[Any, Any]
+    size = in_stream.read_bigendian_int32()
+    result = {}
+    for _ in range(size):
+      # Keys must be decoded before their values.
+      key = self._key_coder.decode_from_stream(in_stream, True)
+      result[key] = self._value_coder.decode_from_stream(in_stream, True)
+    return result
+
+  def estimate_size(self, value, nested=False):
+    # type: (Any, bool) -> int
+    count = len(value)
+    sample, scale = _size_estimate_sample(value.items(), count)
+    return 4 + int(
+        scale * sum(
+            self._key_coder.estimate_size(k, True) +
+            self._value_coder.estimate_size(v, True) for k,
+            v in sample))
+
+
 class PaneInfoEncoding(object):
   """For internal use only; no backwards-compatibility guarantees.
 
@@ -83,6 +83,7 @@ __all__ = [
     'FastPrimitivesCoder',
     'FloatCoder',
     'IterableCoder',
+    'MapCoder',
     'PickleCoder',
     'ProtoCoder',
     'SingletonCoder',
@@ -413,6 +414,9 @@ class StrUtf8Coder(Coder):
   def decode(self, value):
     return value.decode('utf-8')
 
+  def _create_impl(self):
+    return coder_impl.StrUtf8CoderImpl()
+
   def is_deterministic(self):
     return True
 
@@ -1127,6 +1131,57 @@ class IterableCoder(FastCoder):
 Coder.register_structured_urn(common_urns.coders.ITERABLE.urn, IterableCoder)
 
 
+class MapCoder(FastCoder):
+  """Coder of dicts of homogeneous keys and values."""
+  def __init__(self, key_coder, value_coder):
+    # type: (Coder, Coder) -> None
+    self._key_coder = key_coder
+    self._value_coder = value_coder
+
+  def _create_impl(self):
+    return coder_impl.MapCoderImpl(
+        self._key_coder.get_impl(), self._value_coder.get_impl())
+
+  def is_deterministic(self):
+    # () -> bool
+    # The entries of equal dicts may be iterated in different orders.
+    return False
+
+  def to_type_hint(self):
+    return typehints.Dict[self._key_coder.to_type_hint(),
+                          self._value_coder.to_type_hint()]
+
+  @staticmethod
+  def from_type_hint(typehint, registry):
+    # type: (Any, CoderRegistry) -> MapCoder
+    return MapCoder(
+        registry.get_coder(typehint.key_type),
+        registry.get_coder(typehint.value_type))
+
+  def key_coder(self):
+    # type: () -> Coder
+    return self._key_coder
+
+  def value_coder(self):
+    # type: () -> Coder
+    return self._value_coder
+
+  def _get_component_coders(self):
+    # type: () -> Tuple[Coder, ...]
+    return (self._key_coder, self._value_coder)
+
+  def __repr__(self):
+    return 'MapCoder[%r, %r]' % (self._key_coder, self._value_coder)
+
+  def __eq__(self, other):
+    return (
+        type(self) == type(other) and self._key_coder == other.key_coder() and
+        self._value_coder == other.value_coder())
+
+  def __hash__(self):
+    return hash((type(self), self._key_coder, self._value_coder))
+
+
 class GlobalWindowCoder(SingletonCoder):
   """Coder for global windows."""
   def __init__(self):
@@ -50,6 +50,23 @@ class CustomCoder(coders.Coder):
     return int(encoded) - 1
 
 
+class FixedSizeCoder(coders.Coder):
+  """Estimates the size of all values to a given size."""
+  def __init__(self, size):
+    self.size = size
+    self.estimates = 0
+
+  def encode(self, value):
+    return b''
+
+  def decode(self, encoded):
+    return None
+
+  def estimate_size(self, value):
+    self.estimates += 1
+    return self.size
+
+
 # These tests need to all be run in the same process due to the asserts
 # in tearDownClass.
 @pytest.mark.no_xdist
@@ -161,6 +178,27 @@ class CodersTest(unittest.TestCase):
     coder = coders.FastPrimitivesCoder()
     self.check_coder(coder, 10**100)
 
+  def test_fast_primitives_coder_size_estimation(self):
+    coder = coders.FastPrimitivesCoder()
+    for value in [list(range(10000)),
+                  {str(i): [i] * (i % 7) for i in range(1000)},
+                  [b'x' * 100] * 500]:
+      actual_size = len(coder.encode(value))
+      self.assertAlmostEqual(
+          coder.estimate_size(value), actual_size, delta=actual_size * 0.05)
+
+  def test_fast_primitives_coder_fallback_size_estimation(self):
+    fallback_coder = FixedSizeCoder(10)
+    coder = coders.FastPrimitivesCoder(fallback_coder)
+    for _ in range(100):
+      self.assertEqual(coder.estimate_size(CodersTest), 11)
+    # Fixed sizes are only checked every so often.
+    self.assertLess(fallback_coder.estimates, 20)
+    fallback_coder.size = 20
+    for _ in range(100):
+      coder.estimate_size(CodersTest)
+    self.assertEqual(coder.estimate_size(CodersTest), 21)
+
   def test_bytes_coder(self):
     self.check_coder(coders.BytesCoder(), b'a', b'\0', b'z' * 1000)
 
@@ -292,6 +330,21 @@ class CodersTest(unittest.TestCase):
             (coders.VarIntCoder(), coders.IterableCoder(coders.VarIntCoder()))),
         (1, [1, 2, 3]))
 
+  def test_map_coder(self):
+    map_coder = coders.MapCoder(coders.StrUtf8Coder(), coders.FloatCoder())
+    self.check_coder(map_coder, {}, {u'a': 1.5, u'\u0101': -2.0})
+    self.check_coder(
+        coders.TupleCoder((coders.VarIntCoder(), map_coder)),
+        (1, {
+            u'a': 0.0, u'b': 1.0
+        }))
+    large_dict = {u'%d' % i: float(i) for i in range(10000)}
+    self.assertEqual(large_dict, map_coder.decode(map_coder.encode(large_dict)))
+    self.assertAlmostEqual(
+        map_coder.estimate_size(large_dict),
+        len(map_coder.encode(large_dict)),
+        delta=len(map_coder.encode(large_dict)) * 0.05)
+
   def test_iterable_coder_unknown_length(self):
     # Empty
     self._test_iterable_coder_of_unknown_length(0)
@@ -0,0 +1,123 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Coder of NumPy arrays."""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import numpy as np
+
+from apache_beam.coders.coder_impl import StreamCoderImpl
+from apache_beam.coders.coder_impl import get_varint_size
+from apache_beam.coders.coders import FastCoder
+from apache_beam.coders.coders import FastPrimitivesCoder
+from apache_beam.coders.coders import PickleCoder
+
+__all__ = ['NumpyArrayCoder']
+
+
+class NumpyArrayCoder(FastCoder):
+  """Coder of NumPy arrays.
+
+  The data of arrays is encoded as is, along with their dtype and shape. It is
+  not copied when decoding, hence decoded arrays are read-only, as all decoded
+  elements should be treated.
+  """
+  def _create_impl(self):
+    return NumpyArrayCoderImpl()
+
+  def is_deterministic(self):
+    # type: () -> bool
+    # Arrays of objects may hold values that are not encoded deterministically.
+    return False
+
+  def to_type_hint(self):
+    return np.ndarray
+
+  def __eq__(self, other):
+    return type(self) == type(other)
+
+  def __hash__(self):
+    return hash(type(self))
+
+
+class NumpyArrayCoderImpl(StreamCoderImpl):
+  """For internal use only; no backwards-compatibility guarantees.
+
+  An array is encoded as a byte for the kind of its encoding, followed by:
+    - for arrays of a plain dtype, the number of dimensions, the dimensions,
+      the dtype string, and the data of the array in C order.
+    - for arrays of objects, the number of dimensions, the dimensions, and the
+      nested elements in C order, encoded by a FastPrimitivesCoder.
+    - for other arrays, such as arrays of structured dtypes or subclasses of
+      ndarray, the array encoded by a PickleCoder.
+  """
+  _RAW = 0
+  _OBJECT = 1
+  _PICKLED = 2
+
+  def __init__(self):
+    self._element_coder = FastPrimitivesCoder().get_impl()
+    self._pickle_coder = PickleCoder().get_impl()
+
+  def _kind(self, value):
+    if type(value) is not np.ndarray or value.dtype.fields is not None:
+      return self._PICKLED
+    elif value.dtype.hasobject:
+      return self._OBJECT
+    return self._RAW
+
+  def encode_to_stream(self, value, out, nested):
+    kind = self._kind(value)
+    out.write_byte(kind)
+    if kind == self._PICKLED:
+      self._pickle_coder.encode_to_stream(value, out, nested)
+      return
+    out.write_var_int64(value.ndim)
+    for dim in value.shape:
+      out.write_var_int64(dim)
+    if kind == self._OBJECT:
+      for element in value.ravel():
+        self._element_coder.encode_to_stream(element, out, True)
+    else:
+      out.write(value.dtype.str.encode('ascii'), True)
+      out.write(np.ascontiguousarray(value).tobytes(), nested)
+
+  def decode_from_stream(self, in_stream, nested):
+    kind = in_stream.read_byte()
+    if kind == self._PICKLED:
+      return self._pickle_coder.decode_from_stream(in_stream, nested)
+    shape = tuple(
+        in_stream.read_var_int64() for _ in range(in_stream.read_var_int64()))
+    if kind == self._OBJECT:
+      value = np.empty(shape, dtype=object)
+      elements = value.reshape(-1)
+      for i in range(elements.size):
+        elements[i] = self._element_coder.decode_from_stream(in_stream, True)
+      return value
+    dtype = np.dtype(in_stream.read_all(True).decode('ascii'))
+    return np.frombuffer(in_stream.read_all(nested), dtype=dtype).reshape(shape)
+
+  def estimate_size(self, value, nested=False):
+    if self._kind(value) != self._RAW:
+      return super(NumpyArrayCoderImpl, self).estimate_size(value, nested)
+    header_size = 1 + get_varint_size(value.ndim) + sum(
+        get_varint_size(dim) for dim in value.shape) + self._get_nested_size(
+            len(value.dtype.str), True)
+    return header_size + self._get_nested_size(value.nbytes, nested)
@@ -0,0 +1,81 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for the NumPy array coder."""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import unittest
+
+import numpy as np
+
+from apache_beam.coders import coders
+from apache_beam.coders.numpy_coder import NumpyArrayCoder
+from apache_beam.coders.typecoders import registry as coders_registry
+from apache_beam.internal import pickler
+from apache_beam.typehints import typehints
+
+
+class NumpyArrayCoderTest(unittest.TestCase):
+  def check_array(self, coder, value):
+    decoded = coder.decode(coder.encode(value))
+    self.assertIs(type(decoded), type(value))
+    self.assertEqual(decoded.dtype, value.dtype)
+    np.testing.assert_array_equal(decoded, value)
+
+  def test_arrays(self):
+    coder = NumpyArrayCoder()
+    nested_coder = coders.TupleCoder([coder, coder])
+    for value in [np.arange(12, dtype=np.float32).reshape(3, 4),
+                  np.arange(12).reshape(3, 4).T,
+                  np.array(2.5),
+                  np.array([], dtype=np.int16),
+                  np.array(['a', 'bc']),
+                  np.array(['2020-01-01'], dtype='datetime64[ns]'),
+                  np.array([1, 2], dtype='>i8'),
+                  np.array([{'a': 1}, 'b', None], dtype=object),
+                  np.zeros(2, dtype=[('x', np.int32), ('y', np.float64)]),
+                  np.ma.masked_array([1, 2], mask=[True, False])]:
+      self.check_array(coder, value)
+      self.check_array(pickler.loads(pickler.dumps(coder)), value)
+      first, second = nested_coder.decode(nested_coder.encode((value, value)))
+      np.testing.assert_array_equal(first, value)
+      np.testing.assert_array_equal(second, value)
+      self.assertEqual(coder.estimate_size(value), len(coder.encode(value)))
+      self.assertEqual(
+          nested_coder.estimate_size((value, value)),
+          len(nested_coder.encode((value, value))))
+
+  def test_raw_encoding(self):
+    coder = NumpyArrayCoder()
+    value = np.arange(1000, dtype=np.float64)
+    self.assertLess(len(coder.encode(value)), value.nbytes + 16)
+    decoded = coder.decode(coder.encode(value))
+    # Decoded arrays are views of the encoded data.
+    self.assertFalse(decoded.flags.writeable)
+
+  def test_registry(self):
+    self.assertEqual(NumpyArrayCoder(), coders_registry.get_coder(np.ndarray))
+    self.assertEqual(
+        coders.TupleCoder([coders.StrUtf8Coder(), NumpyArrayCoder()]),
+        coders_registry.get_coder(typehints.Tuple[str, np.ndarray]))
+
+
+if __name__ == '__main__':
+  unittest.main()
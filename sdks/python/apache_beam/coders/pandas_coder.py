@@ -0,0 +1,184 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Coders of pandas DataFrames and Series.
+
+This module is not imported along with the other coders, since pandas is an
+optional dependency. The coder registry picks these coders for the pandas
+type hints, such as ``pd.DataFrame``, once pandas has been imported.
+"""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import numpy as np
+import pandas as pd
+
+from apache_beam.coders.coder_impl import StreamCoderImpl
+from apache_beam.coders.coders import FastCoder
+from apache_beam.coders.coders import FastPrimitivesCoder
+from apache_beam.coders.coders import PickleCoder
+from apache_beam.coders.numpy_coder import NumpyArrayCoderImpl
+
+__all__ = ['PandasDataFrameCoder', 'PandasSeriesCoder']
+
+
+class PandasDataFrameCoder(FastCoder):
+  """Coder of pandas DataFrames, which encodes their columns as arrays."""
+  def _create_impl(self):
+    return PandasDataFrameCoderImpl()
+
+  def is_deterministic(self):
+    # type: () -> bool
+    return False
+
+  def to_type_hint(self):
+    return pd.DataFrame
+
+  def __eq__(self, other):
+    return type(self) == type(other)
+
+  def __hash__(self):
+    return hash(type(self))
+
+
+class PandasSeriesCoder(FastCoder):
+  """Coder of pandas Series, which encodes their values as an array."""
+  def _create_impl(self):
+    return PandasSeriesCoderImpl()
+
+  def is_deterministic(self):
+    # type: () -> bool
+    return False
+
+  def to_type_hint(self):
+    return pd.Series
+
+  def __eq__(self, other):
+    return type(self) == type(other)
+
+  def __hash__(self):
+    return hash(type(self))
+
+
+def _values(series):
+  # The values of extension types, such as categorical data or timezone aware
+  # datetimes, are not NumPy arrays, and are pickled by the array coder.
+  if isinstance(series.dtype, np.dtype):
+    return series.values
+  return series.array
+
+
+def _range_bounds(index):
+  # The bounds of RangeIndex are only public as of pandas 0.25.
+  if hasattr(index, 'start'):
+    return index.start, index.stop, index.step
+  return index._start, index._stop, index._step
+
+
+class _PandasCoderImplBase(StreamCoderImpl):
+  """For internal use only; no backwards-compatibility guarantees.
+
+  Encodes the values and indexes of pandas objects. An index is encoded as a
+  byte for the kind of its encoding, followed by:
+    - for range indexes, their start, stop and step.
+    - for indexes of a NumPy dtype, their values as an array and their name.
+    - for other indexes, such as multi-indexes, the index encoded by a
+      PickleCoder.
+  """
+  _RANGE_INDEX = 0
+  _ARRAY_INDEX = 1
+  _PICKLED_INDEX = 2
+
+  def __init__(self):
+    self._array_coder = NumpyArrayCoderImpl()
+    self._name_coder = FastPrimitivesCoder().get_impl()
+    self._pickle_coder = PickleCoder().get_impl()
+
+  def _encode_index(self, index, out):
+    if type(index) is pd.RangeIndex:
+      out.write_byte(self._RANGE_INDEX)
+      for bound in _range_bounds(index):
+        out.write_var_int64(bound)
+      self._name_coder.encode_to_stream(index.name, out, True)
+    elif (isinstance(index.dtype, np.dtype) and
+          not isinstance(index, pd.MultiIndex)):
+      out.write_byte(self._ARRAY_INDEX)
+      self._array_coder.encode_to_stream(index.values, out, True)
+      self._name_coder.encode_to_stream(index.name, out, True)
+    else:
+      out.write_byte(self._PICKLED_INDEX)
+      self._pickle_coder.encode_to_stream(index, out, True)
+
+  def _decode_index(self, in_stream):
+    kind = in_stream.read_byte()
+    if kind == self._RANGE_INDEX:
+      start, stop, step = [in_stream.read_var_int64() for _ in range(3)]
+      return pd.RangeIndex(
+          start,
+          stop,
+          step,
+          name=self._name_coder.decode_from_stream(in_stream, True))
+    elif kind == self._ARRAY_INDEX:
+      values = self._array_coder.decode_from_stream(in_stream, True)
+      return pd.Index(
+          values, name=self._name_coder.decode_from_stream(in_stream, True))
+    return self._pickle_coder.decode_from_stream(in_stream, True)
+
+
+class PandasSeriesCoderImpl(_PandasCoderImplBase):
+  """For internal use only; no backwards-compatibility guarantees.
+
+  A Series is encoded as its index, its name and its values.
+  """
+  def encode_to_stream(self, value, out, nested):
+    self._encode_index(value.index, out)
+    self._name_coder.encode_to_stream(value.name, out, True)
+    self._array_coder.encode_to_stream(_values(value), out, True)
+
+  def decode_from_stream(self, in_stream, nested):
+    index = self._decode_index(in_stream)
+    name = self._name_coder.decode_from_stream(in_stream, True)
+    values = self._array_coder.decode_from_stream(in_stream, True)
+    return pd.Series(values, index=index, name=name)
+
+
+class PandasDataFrameCoderImpl(_PandasCoderImplBase):
+  """For internal use only; no backwards-compatibility guarantees.
+
+  A DataFrame is encoded as its index, its column labels as an index, and the
+  values of its columns.
+  """
+  def encode_to_stream(self, value, out, nested):
+    self._encode_index(value.index, out)
+    self._encode_index(value.columns, out)
+    for i in range(len(value.columns)):
+      self._array_coder.encode_to_stream(_values(value.iloc[:, i]), out, True)
+
+  def decode_from_stream(self, in_stream, nested):
+    index = self._decode_index(in_stream)
+    columns = self._decode_index(in_stream)
+    values = [
+        self._array_coder.decode_from_stream(in_stream, True)
+        for _ in range(len(columns))
+    ]
+    # Columns are keyed by position, since their labels may not be unique.
+    frame = pd.DataFrame(
+        dict(enumerate(values)), index=index, columns=range(len(values)))
+    frame.columns = columns
+    return frame
@@ -0,0 +1,77 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for the pandas coders."""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import unittest
+
+import pandas as pd
+
+from apache_beam.coders import coders
+from apache_beam.coders.pandas_coder import PandasDataFrameCoder
+from apache_beam.coders.pandas_coder import PandasSeriesCoder
+from apache_beam.coders.typecoders import registry as coders_registry
+from apache_beam.internal import pickler
+
+
+class PandasCoderTest(unittest.TestCase):
+  def setUp(self):
+    self.frame = pd.DataFrame({
+        'int': [1, 2, 3],
+        'str': ['a', 'b', None],
+        'float': [1.5, None, -2.0],
+        'category': pd.Categorical(['x', 'y', 'x']),
+        'time': pd.date_range('2020-01-01', periods=3, tz='UTC'),
+    })
+
+  def test_data_frame_coder(self):
+    coder = PandasDataFrameCoder()
+    nested_coder = coders.TupleCoder([coders.VarIntCoder(), coder])
+    for frame in [self.frame,
+                  self.frame.iloc[1:],
+                  self.frame.set_index('str'),
+                  self.frame.set_index(['int', 'str']),
+                  pd.DataFrame([[1, 2]], columns=['a', 'a']),
+                  pd.DataFrame()]:
+      pd.testing.assert_frame_equal(frame, coder.decode(coder.encode(frame)))
+      pd.testing.assert_frame_equal(
+          frame,
+          pickler.loads(pickler.dumps(coder)).decode(coder.encode(frame)))
+      _, decoded = nested_coder.decode(nested_coder.encode((1, frame)))
+      pd.testing.assert_frame_equal(frame, decoded)
+
+  def test_series_coder(self):
+    coder = PandasSeriesCoder()
+    for series in [self.frame['int'],
+                   self.frame.set_index('time')['float'],
+                   self.frame['category'],
+                   self.frame['time'],
+                   pd.Series([], name=('a', 1))]:
+      pd.testing.assert_series_equal(series, coder.decode(coder.encode(series)))
+
+  def test_registry(self):
+    self.assertEqual(
+        PandasDataFrameCoder(), coders_registry.get_coder(pd.DataFrame))
+    self.assertEqual(PandasSeriesCoder(), coders_registry.get_coder(pd.Series))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -62,6 +62,20 @@ example, the above function can be decorated::
     return complex_operation_returning_Xyz(v)
 
 See apache_beam.typehints.decorators module for more details.
+
+Elements whose type hints are not covered by a registered coder, such as
+dictionaries, are encoded with a fallback coder that writes the type of each
+value before the value itself. Registries can instead pick coders specialized
+for the hinted types of the keys and values of dictionaries and the items of
+homogeneous tuples, which are much faster for typed primitives::
+
+  coders.registry.use_specialized_coders()
+
+These coders rely on the type hints being correct, hence they are opt-in, and
+only apply to pipelines constructed after the call.
+
+NumPy arrays, as well as pandas DataFrames and Series, are encoded by the
+coders of the numpy_coder and pandas_coder modules when hinted by their types.
 """
 
 # pytype: skip-file
@@ -75,9 +89,11 @@ from typing import Iterable
 from typing import List
 from typing import Type
 
+import numpy as np
 from past.builtins import unicode
 
 from apache_beam.coders import coders
+from apache_beam.coders import numpy_coder
 from apache_beam.typehints import typehints
 
 __all__ = ['registry']
@@ -88,6 +104,7 @@ class CoderRegistry(object):
   def __init__(self, fallback_coder=None):
     self._coders = {}  # type: Dict[Any, Type[coders.Coder]]
     self.custom_types = []  # type: List[Any]
+    self._specialized_coders = {}  # type: Dict[Any, Type[coders.Coder]]
     self.register_standard_coders(fallback_coder)
 
   def register_standard_coders(self, fallback_coder):
@@ -98,10 +115,16 @@ class CoderRegistry(object):
     self._register_coder_internal(bool, coders.BooleanCoder)
     self._register_coder_internal(unicode, coders.StrUtf8Coder)
     self._register_coder_internal(typehints.TupleConstraint, coders.TupleCoder)
+    self._register_coder_internal(np.ndarray, numpy_coder.NumpyArrayCoder)
     # Default fallback coders applied in that order until the first matching
     # coder found.
     default_fallback_coders = [coders.ProtoCoder, coders.FastPrimitivesCoder]
     self._fallback_coder = fallback_coder or FirstOf(default_fallback_coders)
+    # Coders for type hints that are otherwise encoded by the fallback coder.
+    self._specialized_coders[typehints.DictConstraint] = coders.MapCoder
+    self._specialized_coders[typehints.TupleSequenceConstraint] = (
+        coders.TupleSequenceCoder)
+    self._use_specialized_coders = False
 
   def _register_coder_internal(self, typehint_type, typehint_coder_class):
     # type: (Any, Type[coders.Coder]) -> None
@@ -117,12 +140,30 @@ class CoderRegistry(object):
       self.custom_types.append(typehint_type)
     self._register_coder_internal(typehint_type, typehint_coder_class)
 
+  def use_specialized_coders(self, enabled=True):
+    # type: (bool) -> None
+
+    """Picks coders specialized for the hinted types of dicts and tuples.
+
+    Type hints such as ``Dict[str, float]`` or ``Tuple[int, ...]`` are then
+    encoded by composing the coders of their component types, without writing
+    the type of every value as the fallback coder does. The values must match
+    their type hints, which are not checked when encoding them.
+    """
+    self._use_specialized_coders = enabled
+
   def get_coder(self, typehint):
     # type: (Any) -> coders.Coder
-    coder = self._coders.get(
+    key = (
         typehint.__class__
-        if isinstance(typehint, typehints.TypeConstraint) else typehint,
-        None)
+        if isinstance(typehint, typehints.TypeConstraint) else typehint)
+    coder = self._coders.get(key, None)
+    if coder is None and (getattr(key, '__module__', None) or
+                          '').split('.')[0] == 'pandas':
+      self._register_pandas_coders()
+      coder = self._coders.get(key, None)
+    if coder is None and self._use_specialized_coders:
+      coder = self._specialized_coders.get(key, None)
     if isinstance(typehint, typehints.TypeConstraint) and coder is not None:
       return coder.from_type_hint(typehint, self)
     if coder is None:
@@ -153,6 +194,15 @@ class CoderRegistry(object):
       coder = self._fallback_coder
     return coder.from_type_hint(typehint, self)
 
+  def _register_pandas_coders(self):
+    # pandas is not imported along with Beam, hence its coders are registered
+    # once a type hint refers to it.
+    from apache_beam.coders import pandas_coder
+    self._coders.setdefault(
+        pandas_coder.pd.DataFrame, pandas_coder.PandasDataFrameCoder)
+    self._coders.setdefault(
+        pandas_coder.pd.Series, pandas_coder.PandasSeriesCoder)
+
   def get_custom_type_coder_tuples(self, types):
     """Returns type/coder tuples for all custom types passed in."""
     return [(t, self._coders[t]) for t in types if t in self.custom_types]
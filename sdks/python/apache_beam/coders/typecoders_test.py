@@ -97,6 +97,15 @@ class TypeCodersTest(unittest.TestCase):
     coder = typecoders.registry.get_coder(typehints.Any)
     self.assertEqual(('abc', 123), coder.decode(coder.encode(('abc', 123))))
 
+  def test_fallbackcoder_without_module(self):
+    class NoModule(object):
+      pass
+
+    NoModule.__module__ = None
+    self.assertEqual(
+        coders.FastPrimitivesCoder,
+        typecoders.registry.get_coder(NoModule).__class__)
+
   def test_get_coder_can_be_pickled(self):
     coder = typecoders.registry.get_coder(typehints.Tuple[str, int])
     revived_coder = pickler.loads(pickler.dumps(coder))
@@ -147,6 +156,37 @@ class TypeCodersTest(unittest.TestCase):
     self.assertIs(
         list, type(expected_coder.decode(expected_coder.encode(values))))
 
+  def test_specialized_coders(self):
+    registry = typecoders.CoderRegistry()
+    dict_hint = typehints.Dict[str, float]
+    tuple_hint = typehints.Tuple[int, ...]
+    self.assertEqual(
+        coders.FastPrimitivesCoder(), registry.get_coder(dict_hint))
+    self.assertEqual(
+        coders.FastPrimitivesCoder(), registry.get_coder(tuple_hint))
+
+    registry.use_specialized_coders()
+    dict_coder = registry.get_coder(dict_hint)
+    self.assertEqual(
+        coders.MapCoder(coders.StrUtf8Coder(), coders.FloatCoder()), dict_coder)
+    self.assertEqual({'a': 1.5},
+                     dict_coder.decode(dict_coder.encode({'a': 1.5})))
+    self.assertEqual(
+        coders.TupleSequenceCoder(coders.VarIntCoder()),
+        registry.get_coder(tuple_hint))
+    self.assertEqual(
+        coders.TupleCoder([
+            coders.VarIntCoder(),
+            coders.MapCoder(coders.VarIntCoder(), coders.FastPrimitivesCoder())
+        ]),
+        registry.get_coder(
+            typehints.Tuple[int, typehints.Dict[int, typehints.Any]]))
+    # Specialized coders do not take over registered ones.
+    registry.register_coder(int, CustomCoder)
+    self.assertEqual(
+        coders.TupleSequenceCoder(CustomCoder()),
+        registry.get_coder(tuple_hint))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -241,6 +241,10 @@ if 'save_module' in dir(dill.dill):
 # Turn off verbose logging from the dill pickler.
 logging.getLogger('dill').setLevel(logging.WARN)
 
+# Pickles of at least this size are compressed with a fast compression level,
+# as the best level takes seconds for pickles of a few MBs.
+_FAST_COMPRESSION_MIN_BYTES = 1 << 20
+
 
 # TODO(ccy): Currently, there are still instances of pickler.dumps() and
 # pickler.loads() being used for data, which results in an unnecessary base64
@@ -263,8 +267,8 @@ def dumps(o, enable_trace=True):
 
   # Compress as compactly as possible to decrease peak memory usage (of multiple
   # in-memory copies) and free up some possibly large and no-longer-needed
-  # memory.
-  c = zlib.compress(s, 9)
+  # memory, unless this would take too long.
+  c = zlib.compress(s, 9 if len(s) < _FAST_COMPRESSION_MIN_BYTES else 1)
   del s
 
   return base64.b64encode(c)
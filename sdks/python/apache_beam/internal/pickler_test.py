@@ -21,6 +21,7 @@
 
 from __future__ import absolute_import
 
+import os
 import sys
 import types
 import unittest
@@ -105,6 +106,10 @@ from apache_beam.internal.module_test import DataClass
 self.assertEqual(DataClass(datum='abc'), loads(dumps(DataClass(datum='abc'))))
     ''')
 
+  def test_large_payload(self):
+    data = os.urandom(1 << 20)
+    self.assertEqual(data, loads(dumps(data)))
+
 
 if __name__ == '__main__':
   unittest.main()
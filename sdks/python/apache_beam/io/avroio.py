@@ -487,9 +487,13 @@ class _FastAvroSource(filebasedsource.FileBasedSource):
       while range_tracker.try_claim(next_block_start):
         block = next(blocks)
         next_block_start = block.offset + block.size
-        for record in block:
+        for record in self._block_records(block):
           yield record
 
+  def _block_records(self, block):
+    """Returns the outputs of the records of a block."""
+    return block
+
 
 class WriteToAvro(beam.transforms.PTransform):
   """A ``PTransform`` for writing avro files."""
@@ -238,10 +238,12 @@ import decimal
 import itertools
 import json
 import logging
+import queue
 import time
 import uuid
 from builtins import object
 from builtins import zip
+from concurrent import futures
 
 from future.utils import itervalues
 from past.builtins import unicode
@@ -251,6 +253,7 @@ from apache_beam import coders
 from apache_beam import pvalue
 from apache_beam.internal.gcp.json_value import from_json_value
 from apache_beam.internal.gcp.json_value import to_json_value
+from apache_beam.io.avroio import _FastAvroSource
 from apache_beam.io.filesystems import CompressionTypes
 from apache_beam.io.filesystems import FileSystems
 from apache_beam.io.gcp import bigquery_tools
@@ -597,6 +600,19 @@ class _JsonToDictCoder(coders.Coder):
     return dict
 
 
+class _ColumnarAvroSource(_FastAvroSource):
+  """Reads the records of each block of Avro files as a batch of columns.
+
+  A batch is a dict mapping the names of the fields of the records to the lists
+  of their values.
+  """
+  def _block_records(self, block):
+    records = list(block)
+    if not records:
+      return []
+    return [{name: [record[name] for record in records] for name in records[0]}]
+
+
 class _CustomBigQuerySource(BoundedSource):
   def __init__(
       self,
@@ -609,7 +625,11 @@ class _CustomBigQuerySource(BoundedSource):
       coder=None,
       use_standard_sql=False,
       flatten_results=True,
-      kms_key=None):
+      kms_key=None,
+      use_avro_exports=False,
+      columnar_batches=False):
+    if columnar_batches and not use_avro_exports:
+      raise ValueError('Columnar batches can only be read from Avro exports.')
     if table is not None and query is not None:
       raise ValueError(
           'Both a BigQuery table and a query were specified.'
@@ -633,6 +653,8 @@ class _CustomBigQuerySource(BoundedSource):
     self.flatten_results = flatten_results
     self.coder = coder or _JsonToDictCoder
     self.kms_key = kms_key
+    self.use_avro_exports = use_avro_exports
+    self.columnar_batches = columnar_batches
     self.split_result = None
 
   def estimate_size(self):
@@ -665,12 +687,8 @@ class _CustomBigQuerySource(BoundedSource):
 
       schema, metadata_list = self._export_files(bq)
       self.split_result = [
-          TextSource(
-              metadata.path,
-              0,
-              CompressionTypes.UNCOMPRESSED,
-              True,
-              self.coder(schema)) for metadata in metadata_list
+          self._create_source(metadata.path, schema)
+          for metadata in metadata_list
       ]
 
       if self.query is not None:
@@ -679,6 +697,14 @@ class _CustomBigQuerySource(BoundedSource):
     for source in self.split_result:
       yield SourceBundle(0, source, None, None)
 
+  def _create_source(self, path, schema):
+    if not self.use_avro_exports:
+      return TextSource(
+          path, 0, CompressionTypes.UNCOMPRESSED, True, self.coder(schema))
+    elif self.columnar_batches:
+      return _ColumnarAvroSource(path)
+    return _FastAvroSource(path)
+
   def get_range_tracker(self, start_position, stop_position):
     class CustomBigQuerySourceRangeTracker(RangeTracker):
       """A RangeTracker that always returns positions as None."""
@@ -717,10 +743,14 @@ class _CustomBigQuerySource(BoundedSource):
       bigquery.TableSchema instance, a list of FileMetadata instances
     """
     job_id = uuid.uuid4().hex
+    if self.use_avro_exports:
+      file_format = bigquery_tools.FileFormat.AVRO
+    else:
+      file_format = bigquery_tools.FileFormat.JSON
     job_ref = bq.perform_extract_job([self.gcs_location],
                                      job_id,
                                      self.table_reference,
-                                     bigquery_tools.FileFormat.JSON,
+                                     file_format,
                                      include_header=False)
     bq.wait_for_bq_job(job_ref)
     metadata_list = FileSystems.match([self.gcs_location])[0].metadata_list
@@ -900,10 +930,19 @@ bigquery_v2_messages.TableSchema` object.
 
 
 class BigQueryWriteFn(DoFn):
-  """A ``DoFn`` that streams writes to BigQuery once the table is created."""
+  """A ``DoFn`` that streams writes to BigQuery once the table is created.
+
+  Batches of rows are inserted by a bounded pool of threads, so that several
+  insert requests are in flight while the bundle keeps being processed. The
+  inserts of a bundle are awaited when it finishes.
+  """
 
   DEFAULT_MAX_BUFFERED_ROWS = 2000
   DEFAULT_MAX_BATCH_SIZE = 500
+  # A request to insert rows must not exceed 10MB, which leaves room for the
+  # overhead of the request over the estimated size of its rows.
+  DEFAULT_MAX_BATCH_SIZE_BYTES = 5 << 20
+  DEFAULT_MAX_INSERTS_IN_FLIGHT = 4
 
   FAILED_ROWS = 'FailedRows'
 
@@ -917,7 +956,9 @@ class BigQueryWriteFn(DoFn):
       test_client=None,
       max_buffered_rows=None,
       retry_strategy=None,
-      additional_bq_parameters=None):
+      additional_bq_parameters=None,
+      max_batch_size_bytes=None,
+      max_inserts_in_flight=None):
     """Initialize a WriteToBigQuery transform.
 
     Args:
@@ -953,6 +994,11 @@ class BigQueryWriteFn(DoFn):
         to be passed when creating a BigQuery table. These are passed when
         triggering a load job for FILE_LOADS, and when creating a new table for
         STREAMING_INSERTS.
+      max_batch_size_bytes: The maximum size of the rows of a batch, as
+        estimated from their JSON encoding. A batch is flushed once it holds
+        either batch_size rows or this many bytes.
+      max_inserts_in_flight: The maximum number of concurrent requests to
+        insert batches of rows.
     """
     self.schema = schema
     self.test_client = test_client
@@ -965,6 +1011,8 @@ class BigQueryWriteFn(DoFn):
     self._total_buffered_rows = 0
     self.kms_key = kms_key
     self._max_batch_size = batch_size or BigQueryWriteFn.DEFAULT_MAX_BATCH_SIZE
+    self._max_batch_size_bytes = (
+        max_batch_size_bytes or BigQueryWriteFn.DEFAULT_MAX_BATCH_SIZE_BYTES)
     self._max_buffered_rows = (
         max_buffered_rows or BigQueryWriteFn.DEFAULT_MAX_BUFFERED_ROWS)
     self._retry_strategy = (
@@ -972,10 +1020,20 @@ class BigQueryWriteFn(DoFn):
 
     self.additional_bq_parameters = additional_bq_parameters or {}
 
+    self._max_inserts_in_flight = (
+        max_inserts_in_flight or BigQueryWriteFn.DEFAULT_MAX_INSERTS_IN_FLIGHT)
+    # The insert threads and the wrappers of their HTTP clients are created by
+    # the first bundle, and kept until teardown.
+    self._insert_executor = None
+    self._idle_wrappers = None
+    self._pending_inserts = []
+
   def display_data(self):
     return {
         'max_batch_size': self._max_batch_size,
+        'max_batch_size_bytes': self._max_batch_size_bytes,
         'max_buffered_rows': self._max_buffered_rows,
+        'max_inserts_in_flight': self._max_inserts_in_flight,
         'retry_strategy': self._retry_strategy,
         'create_disposition': str(self.create_disposition),
         'write_disposition': str(self.write_disposition),
@@ -984,6 +1042,7 @@ class BigQueryWriteFn(DoFn):
 
   def _reset_rows_buffer(self):
     self._rows_buffer = collections.defaultdict(lambda: [])
+    self._buffered_bytes = collections.defaultdict(int)
 
   @staticmethod
   def get_table_schema(schema):
@@ -1008,15 +1067,26 @@ class BigQueryWriteFn(DoFn):
 
   def start_bundle(self):
     self._reset_rows_buffer()
+    self._total_buffered_rows = 0
 
     self.bigquery_wrapper = bigquery_tools.BigQueryWrapper(
         client=self.test_client)
 
     self._observed_tables = set()
 
-    self._backoff_calculator = iter(
-        retry.FuzzedExponentialIntervals(
-            initial_delay_secs=0.2, num_retries=10000, max_delay_secs=1500))
+    if self._insert_executor is None:
+      self._insert_executor = futures.ThreadPoolExecutor(
+          max_workers=self._max_inserts_in_flight)
+      self._idle_wrappers = queue.Queue()
+    # Inserts may be left in flight by a bundle that failed.
+    futures.wait(self._pending_inserts)
+    self._pending_inserts = []
+
+  def teardown(self):
+    if self._insert_executor is not None:
+      self._insert_executor.shutdown()
+      self._insert_executor = None
+      self._idle_wrappers = None
 
   def _create_table_if_needed(self, table_reference, schema=None):
     str_table_reference = '%s:%s.%s' % (
@@ -1066,14 +1136,18 @@ class BigQueryWriteFn(DoFn):
 
     row_and_insert_id = element[1]
     self._rows_buffer[destination].append(row_and_insert_id)
+    self._buffered_bytes[destination] += len(
+        json.dumps(row_and_insert_id, default=str))
     self._total_buffered_rows += 1
-    if len(self._rows_buffer[destination]) >= self._max_batch_size:
+    if (len(self._rows_buffer[destination]) >= self._max_batch_size or
+        self._buffered_bytes[destination] >= self._max_batch_size_bytes):
       return self._flush_batch(destination)
     elif self._total_buffered_rows >= self._max_buffered_rows:
       return self._flush_all_batches()
 
   def finish_bundle(self):
-    return self._flush_all_batches()
+    failed_rows = list(self._flush_all_batches())
+    return failed_rows + self._collect_failed_rows(futures.ALL_COMPLETED)
 
   def _flush_all_batches(self):
     _LOGGER.debug(
@@ -1088,9 +1162,62 @@ class BigQueryWriteFn(DoFn):
         ])
 
   def _flush_batch(self, destination):
+    """Submits the current batch of rows of a destination to be inserted.
+
+    Waits for an insert to complete first if as many as allowed are in flight.
+
+    Returns:
+      The failed rows of the inserts that have completed.
+    """
+    rows_and_insert_ids = self._rows_buffer.pop(destination)
+    self._buffered_bytes.pop(destination, None)
+    self._total_buffered_rows -= len(rows_and_insert_ids)
+
+    if len(self._pending_inserts) >= self._max_inserts_in_flight:
+      failed_rows = self._collect_failed_rows(futures.FIRST_COMPLETED)
+    else:
+      failed_rows = self._collect_failed_rows()
+    self._pending_inserts.append(
+        self._insert_executor.submit(
+            self._insert_batch, destination, rows_and_insert_ids))
+    return failed_rows
+
+  def _collect_failed_rows(self, return_when=None):
+    """Returns the failed rows of the inserts that have completed.
 
-    # Flush the current batch of rows to BigQuery.
-    rows_and_insert_ids = self._rows_buffer[destination]
+    Args:
+      return_when: If set, waits for the inserts in flight as in
+        ``concurrent.futures.wait`` beforehand.
+
+    Raises:
+      Any error of the completed inserts.
+    """
+    if return_when and self._pending_inserts:
+      futures.wait(self._pending_inserts, return_when=return_when)
+    pending_inserts = []
+    failed_rows = []
+    for insert in self._pending_inserts:
+      if insert.done():
+        failed_rows.extend(insert.result())
+      else:
+        pending_inserts.append(insert)
+    self._pending_inserts = pending_inserts
+    return failed_rows
+
+  def _insert_batch(self, destination, rows_and_insert_ids):
+    # HTTP clients are not thread safe, hence each insert takes one out of
+    # the pool for its duration. The pool holds a client per insert thread.
+    try:
+      bigquery_wrapper = self._idle_wrappers.get_nowait()
+    except queue.Empty:
+      bigquery_wrapper = bigquery_tools.BigQueryWrapper(client=self.test_client)
+    try:
+      return self._insert_rows(
+          bigquery_wrapper, destination, rows_and_insert_ids)
+    finally:
+      self._idle_wrappers.put(bigquery_wrapper)
+
+  def _insert_rows(self, bigquery_wrapper, destination, rows_and_insert_ids):
     table_reference = bigquery_tools.parse_table_reference(destination)
 
     if table_reference.projectId is None:
@@ -1105,8 +1232,12 @@ class BigQueryWriteFn(DoFn):
     rows = [r[0] for r in rows_and_insert_ids]
     insert_ids = [r[1] for r in rows_and_insert_ids]
 
+    backoff_calculator = iter(
+        retry.FuzzedExponentialIntervals(
+            initial_delay_secs=0.2, num_retries=10000, max_delay_secs=1500))
+
     while True:
-      passed, errors = self.bigquery_wrapper.insert_rows(
+      passed, errors = bigquery_wrapper.insert_rows(
           project_id=table_reference.projectId,
           dataset_id=table_reference.datasetId,
           table_id=table_reference.tableId,
@@ -1127,19 +1258,19 @@ class BigQueryWriteFn(DoFn):
         else:
           _LOGGER.error(message)
 
+      # Retried rows keep their insert ids, so that BigQuery may deduplicate
+      # them.
+      insert_ids = [insert_ids[entry.index] for entry in errors]
       rows = failed_rows
 
       if not should_retry:
         break
       else:
-        retry_backoff = next(self._backoff_calculator)
+        retry_backoff = next(backoff_calculator)
         _LOGGER.info(
             'Sleeping %s seconds before retrying insertion.', retry_backoff)
         time.sleep(retry_backoff)
 
-    self._total_buffered_rows -= len(self._rows_buffer[destination])
-    del self._rows_buffer[destination]
-
     return [
         pvalue.TaggedOutput(
             BigQueryWriteFn.FAILED_ROWS,
@@ -1513,7 +1644,7 @@ class _ReadFromBigQuery(PTransform):
   """Read data from BigQuery.
 
     This PTransform uses a BigQuery export job to take a snapshot of the table
-    on GCS, and then reads from each produced JSON file.
+    on GCS, and then reads from each produced JSON or Avro file.
 
     Do note that currently this source does not work with DirectRunner.
 
@@ -1555,6 +1686,16 @@ class _ReadFromBigQuery(PTransform):
       the extracted table should be written as a string or
       a :class:`~apache_beam.options.value_provider.ValueProvider`. If
       :data:`None`, then the temp_location parameter is used.
+    use_avro_exports (bool): Exports the table as Avro rather than JSON files,
+      which are much faster to decode. The coder argument is then ignored, and
+      the values of the rows are those decoded by fastavro, which differ from
+      the values decoded from JSON for some types: BYTES are raw rather than
+      base64 encoded, and TIMESTAMP values are timezone aware datetimes. The
+      default value is :data:`False`.
+    columnar_batches (bool): Outputs batches of rows as dicts mapping the names
+      of the columns to the lists of their values, rather than outputting each
+      row as a dict. A batch holds the rows of an Avro block. Requires
+      use_avro_exports. The default value is :data:`False`.
    """
   def __init__(self, gcs_location=None, validate=False, *args, **kwargs):
     if gcs_location:
@@ -1568,6 +1709,7 @@ class _ReadFromBigQuery(PTransform):
         gcs_location = StaticValueProvider(str, gcs_location)
     self.gcs_location = gcs_location
     self.validate = validate
+    self._use_avro_exports = kwargs.get('use_avro_exports', False)
 
     self._args = args
     self._kwargs = kwargs
@@ -1576,7 +1718,10 @@ class _ReadFromBigQuery(PTransform):
     """Returns the fully qualified Google Cloud Storage URI where the
     extracted table should be written.
     """
-    file_pattern = 'bigquery-table-dump-*.json'
+    if self._use_avro_exports:
+      file_pattern = 'bigquery-table-dump-*.avro'
+    else:
+      file_pattern = 'bigquery-table-dump-*.json'
 
     if self.gcs_location is not None:
       gcs_base = self.gcs_location.get()
@@ -1599,7 +1744,7 @@ class _ReadFromBigQuery(PTransform):
       raise ValueError('Invalid GCS location: {}'.format(gcs_location))
 
   def expand(self, pcoll):
-    class RemoveJsonFiles(beam.DoFn):
+    class RemoveExportedFiles(beam.DoFn):
       def __init__(self, gcs_location):
         self._gcs_location = gcs_location
 
@@ -1622,4 +1767,4 @@ class _ReadFromBigQuery(PTransform):
                 validate=self.validate,
                 *self._args,
                 **self._kwargs))
-        | _PassThroughThenCleanup(RemoveJsonFiles(gcs_location)))
+        | _PassThroughThenCleanup(RemoveExportedFiles(gcs_location)))
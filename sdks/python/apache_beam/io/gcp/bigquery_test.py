@@ -28,10 +28,14 @@ import os
 import pickle
 import random
 import re
+import shutil
+import tempfile
+import threading
 import time
 import unittest
 import uuid
 
+import fastavro
 # patches unittest.TestCase to be python3 compatible
 import future.tests.base  # pylint: disable=unused-import
 import hamcrest as hc
@@ -46,6 +50,7 @@ from apache_beam.io.filebasedsink_test import _TestCaseWithTempDirCleanUp
 from apache_beam.io.gcp import bigquery_tools
 from apache_beam.io.gcp.bigquery import TableRowJsonCoder
 from apache_beam.io.gcp.bigquery import WriteToBigQuery
+from apache_beam.io.gcp.bigquery import _CustomBigQuerySource
 from apache_beam.io.gcp.bigquery import _JsonToDictCoder
 from apache_beam.io.gcp.bigquery import _StreamToBigQuery
 from apache_beam.io.gcp.bigquery_file_loads_test import _ELEMENTS
@@ -57,6 +62,7 @@ from apache_beam.io.gcp.tests import utils
 from apache_beam.io.gcp.tests.bigquery_matcher import BigqueryFullResultMatcher
 from apache_beam.io.gcp.tests.bigquery_matcher import BigqueryFullResultStreamingMatcher
 from apache_beam.io.gcp.tests.bigquery_matcher import BigQueryTableMatcher
+from apache_beam.io.source_test_utils import read_from_source
 from apache_beam.options import value_provider
 from apache_beam.options.pipeline_options import GoogleCloudOptions
 from apache_beam.options.pipeline_options import StandardOptions
@@ -354,6 +360,54 @@ class TestReadFromBigQuery(unittest.TestCase):
     self.assertEqual(
         'Invalid GCS location: fs://bad_location', str(context.exception))
 
+  def test_avro_exports_destination_uri(self):
+    read = beam.io._ReadFromBigQuery(
+        table='project:dataset.table', use_avro_exports=True)
+    self.assertTrue(read._get_destination_uri('gs://bucket').endswith('.avro'))
+
+  def test_columnar_batches_require_avro_exports(self):
+    with self.assertRaises(ValueError):
+      _CustomBigQuerySource(
+          table='project:dataset.table', columnar_batches=True)
+
+  @mock.patch('apache_beam.io.gcp.bigquery_tools.BigQueryWrapper')
+  def test_read_avro_exports(self, BigQueryWrapper):
+    directory = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, directory)
+    schema = fastavro.parse_schema({
+        'type': 'record',
+        'name': 'Root',
+        'fields': [{
+            'name': 'n', 'type': 'long'
+        }, {
+            'name': 's', 'type': ['null', 'string']
+        }],
+    })
+    rows = [{'n': i, 's': None if i % 2 else str(i)} for i in range(10)]
+    with open(os.path.join(directory, 'bigquery-table-dump-0.avro'), 'wb') as f:
+      fastavro.writer(f, schema, rows)
+    pattern = os.path.join(directory, 'bigquery-table-dump-*.avro')
+
+    def read(**kwargs):
+      source = _CustomBigQuerySource(
+          gcs_location=pattern,
+          table='project:dataset.table',
+          use_avro_exports=True,
+          **kwargs)
+      return [
+          output for bundle in source.split(0)
+          for output in read_from_source(bundle.source)
+      ]
+
+    self.assertEqual(rows, read())
+    self.assertEqual(
+        bigquery_tools.FileFormat.AVRO,
+        BigQueryWrapper.return_value.perform_extract_job.call_args[0][3])
+    self.assertEqual([{
+        'n': [row['n'] for row in rows], 's': [row['s'] for row in rows]
+    }],
+                     read(columnar_batches=True))
+
 
 @unittest.skipIf(HttpError is None, 'GCP dependencies are not installed')
 class TestBigQuerySink(unittest.TestCase):
@@ -614,8 +668,13 @@ class BigQueryStreamingInsertTransformTests(unittest.TestCase):
     client.tables.Get.return_value = bigquery.Table(
         tableReference=bigquery.TableReference(
             projectId='project_id', datasetId='dataset_id', tableId='table_id'))
-    client.tabledata.InsertAll.return_value = (
-        bigquery.TableDataInsertAllResponse(insertErrors=[]))
+    inserted = threading.Event()
+
+    def insert_all(request):
+      inserted.set()
+      return bigquery.TableDataInsertAllResponse(insertErrors=[])
+
+    client.tabledata.InsertAll.side_effect = insert_all
     create_disposition = beam.io.BigQueryDisposition.CREATE_NEVER
     write_disposition = beam.io.BigQueryDisposition.WRITE_APPEND
 
@@ -629,8 +688,8 @@ class BigQueryStreamingInsertTransformTests(unittest.TestCase):
     fn.start_bundle()
     fn.process(('project_id:dataset_id.table_id', ({'month': 1}, 'insertid1')))
     fn.process(('project_id:dataset_id.table_id', ({'month': 2}, 'insertid2')))
-    # InsertRows called as batch size is hit
-    self.assertTrue(client.tabledata.InsertAll.called)
+    # InsertRows called as batch size is hit, before the bundle finishes
+    self.assertTrue(inserted.wait(60))
 
   def test_dofn_client_finish_bundle_flush_called(self):
     client = mock.Mock()
@@ -689,6 +748,122 @@ class BigQueryStreamingInsertTransformTests(unittest.TestCase):
     self.assertFalse(client.tabledata.InsertAll.called)
 
 
+@unittest.skipIf(HttpError is None, 'GCP dependencies are not installed')
+class ConcurrentStreamingInsertTest(unittest.TestCase):
+  class _FakeTableData(object):
+    """Records the rows of inserts, which take a while and may fail."""
+    def __init__(self, latency_secs=0, failures=None):
+      self.latency_secs = latency_secs
+      # The insert ids of the rows to fail once, mapped to their reasons.
+      self.failures = dict(failures or {})
+      self.requests = []
+      self.inserts_in_flight = 0
+      self.max_inserts_in_flight = 0
+      self._lock = threading.Lock()
+
+    def InsertAll(self, request):  # pylint: disable=invalid-name
+      with self._lock:
+        self.inserts_in_flight += 1
+        self.max_inserts_in_flight = max(
+            self.max_inserts_in_flight, self.inserts_in_flight)
+      time.sleep(self.latency_secs)
+      rows = request.tableDataInsertAllRequest.rows
+      with self._lock:
+        self.inserts_in_flight -= 1
+        self.requests.append([r.insertId for r in rows])
+        errors = [
+            bigquery.TableDataInsertAllResponse.InsertErrorsValueListEntry(
+                index=i,
+                errors=[
+                    bigquery.ErrorProto(reason=self.failures.pop(r.insertId))
+                ]) for i,
+            r in enumerate(rows) if r.insertId in self.failures
+        ]
+      return bigquery.TableDataInsertAllResponse(insertErrors=errors)
+
+  def _write_fn(self, tabledata, **kwargs):
+    client = mock.Mock()
+    client.tabledata = tabledata
+    return beam.io.gcp.bigquery.BigQueryWriteFn(
+        create_disposition=beam.io.BigQueryDisposition.CREATE_NEVER,
+        write_disposition=beam.io.BigQueryDisposition.WRITE_APPEND,
+        test_client=client,
+        **kwargs)
+
+  def _process(self, fn, insert_ids, destination='project:dataset.table'):
+    failed_rows = []
+    for insert_id in insert_ids:
+      failed_rows.extend(
+          fn.process((destination, ({
+              'id': insert_id
+          }, insert_id))) or [])
+    return failed_rows
+
+  def test_inserts_in_flight_are_bounded(self):
+    tabledata = self._FakeTableData(latency_secs=0.05)
+    fn = self._write_fn(tabledata, batch_size=1, max_inserts_in_flight=3)
+    fn.start_bundle()
+    self._process(fn, ['id%d' % i for i in range(12)])
+    fn.finish_bundle()
+    fn.teardown()
+
+    self.assertEqual(len(tabledata.requests), 12)
+    self.assertEqual(tabledata.inserts_in_flight, 0)
+    self.assertGreater(tabledata.max_inserts_in_flight, 1)
+    self.assertLessEqual(tabledata.max_inserts_in_flight, 3)
+
+  def test_finish_bundle_awaits_inserts(self):
+    tabledata = self._FakeTableData(latency_secs=0.2)
+    fn = self._write_fn(tabledata, batch_size=2)
+    fn.start_bundle()
+    self._process(fn, ['a', 'b', 'c'])
+    fn.finish_bundle()
+
+    self.assertEqual(sorted(tabledata.requests), [['a', 'b'], ['c']])
+    fn.teardown()
+
+  def test_batches_are_sized_by_bytes(self):
+    tabledata = self._FakeTableData()
+    row_size = len(json.dumps(({'id': 'id0'}, 'id0')))
+    fn = self._write_fn(
+        tabledata, batch_size=100, max_batch_size_bytes=3 * row_size)
+    fn.start_bundle()
+    self._process(fn, ['id%d' % i for i in range(7)])
+    fn.finish_bundle()
+    fn.teardown()
+
+    self.assertEqual(
+        sorted(tabledata.requests),
+        [['id0', 'id1', 'id2'], ['id3', 'id4', 'id5'], ['id6']])
+
+  def test_retries_keep_insert_ids(self):
+    tabledata = self._FakeTableData(failures={'b': 'timeout', 'd': 'invalid'})
+    fn = self._write_fn(
+        tabledata,
+        batch_size=10,
+        retry_strategy=bigquery_tools.RetryStrategy.RETRY_ON_TRANSIENT_ERROR)
+    fn.start_bundle()
+    self._process(fn, ['a', 'b', 'c', 'd'])
+    with mock.patch('time.sleep'):
+      failed_rows = list(fn.finish_bundle())
+    fn.teardown()
+
+    # Both rows are retried along with their own insert ids, and the invalid
+    # row is retried as the other row failed transiently.
+    self.assertEqual(tabledata.requests, [['a', 'b', 'c', 'd'], ['b', 'd']])
+    self.assertEqual(failed_rows, [])
+
+  def test_insert_errors_are_raised(self):
+    tabledata = mock.Mock()
+    tabledata.InsertAll.side_effect = RuntimeError('insert failed')
+    fn = self._write_fn(tabledata, batch_size=1)
+    fn.start_bundle()
+    self._process(fn, ['a'])
+    with self.assertRaisesRegex(RuntimeError, 'insert failed'):
+      fn.finish_bundle()
+    fn.teardown()
+
+
 @unittest.skipIf(HttpError is None, 'GCP dependencies are not installed')
 class PipelineBasedStreamingInsertTest(_TestCaseWithTempDirCleanUp):
   def test_failure_has_same_insert_ids(self):
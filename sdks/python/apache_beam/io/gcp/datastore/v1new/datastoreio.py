@@ -32,9 +32,13 @@ This module is experimental, no backwards compatibility guarantees.
 from __future__ import absolute_import
 from __future__ import division
 
+import collections
 import logging
+import threading
 import time
+from builtins import object
 from builtins import round
+from concurrent import futures
 
 from apache_beam import typehints
 from apache_beam.io.gcp.datastore.v1 import util
@@ -49,6 +53,7 @@ from apache_beam.transforms import ParDo
 from apache_beam.transforms import PTransform
 from apache_beam.transforms import Reshuffle
 from apache_beam.utils import retry
+from apache_beam.utils import shared
 
 __all__ = ['ReadFromDatastore', 'WriteToDatastore', 'DeleteFromDatastore']
 
@@ -280,6 +285,23 @@ class ReadFromDatastore(PTransform):
         yield types.Entity.from_client_entity(client_entity)
 
 
+class _MutationBatch(object):
+  """The mutations of a commit to Cloud Datastore.
+
+  Along with the client batch of the mutations, holds the elements they are
+  built from, so that the batch can be built again when its commit is retried,
+  and the keys of the entities they mutate.
+  """
+  def __init__(self, client_batch=None):
+    self.client_batch = client_batch
+    self.elements = []
+    self.keys = set()
+    self.bytes_size = 0
+    # The RPC stats of the commit, which are recorded by the bundle thread.
+    self.rpc_stats = collections.Counter()
+    self.commit = None
+
+
 class _Mutate(PTransform):
   """A ``PTransform`` that writes mutations to Cloud Datastore.
 
@@ -303,33 +325,65 @@ class _Mutate(PTransform):
     Mutations are written in batches, where the maximum batch size is
     `util.WRITE_BATCH_SIZE`.
 
+    Batches are committed by a pool of threads shared by the instances of the
+    ``DoFn`` of a worker, so that up to `max_commits_in_flight` commits are in
+    flight at once. A mutation is not added to a batch while an earlier
+    mutation of the same entity is in flight, nor to a batch that already
+    mutates the entity, hence the mutations of an entity are committed in
+    order.
+
     Commits are non-transactional. If a commit fails because of a conflict over
     an entity group, the commit will be retried. This means that the mutation
     should be idempotent (`upsert` and `delete` mutations) to prevent duplicate
     data or errors.
     """
-    def __init__(self, project):
+    DEFAULT_MAX_COMMITS_IN_FLIGHT = 4
+
+    def __init__(self, project, max_commits_in_flight=None):
       """
       Args:
         project: (str) cloud project id
+        max_commits_in_flight: (int) maximum number of concurrent commit RPCs
+          of a worker
       """
       self._project = project
       self._client = None
+      self._max_commits_in_flight = (
+          max_commits_in_flight or
+          _Mutate.DatastoreMutateFn.DEFAULT_MAX_COMMITS_IN_FLIGHT)
       self._rpc_successes = Metrics.counter(
           _Mutate.DatastoreMutateFn, "datastoreRpcSuccesses")
       self._rpc_errors = Metrics.counter(
           _Mutate.DatastoreMutateFn, "datastoreRpcErrors")
       self._throttled_secs = Metrics.counter(
           _Mutate.DatastoreMutateFn, "cumulativeThrottlingSeconds")
+      self._rpc_latency_ms = Metrics.distribution(
+          _Mutate.DatastoreMutateFn, "datastoreRpcLatencyMs")
       self._throttler = AdaptiveThrottler(
           window_ms=120000, bucket_ms=1000, overload_ratio=1.25)
+      # The throttler is used by the threads committing batches.
+      self._throttler_lock = threading.Lock()
+      self._shared_commit_executor = shared.Shared()
+      self._commit_executor = None
+      self._pending_commits = []
 
     def _update_rpc_stats(self, successes=0, errors=0, throttled_secs=0):
       self._rpc_successes.inc(successes)
       self._rpc_errors.inc(errors)
       self._throttled_secs.inc(throttled_secs)
 
+    def setup(self):
+      self._commit_executor = self._shared_commit_executor.acquire(
+          lambda: futures.ThreadPoolExecutor(
+              max_workers=self._max_commits_in_flight))
+
     def start_bundle(self):
+      if self._commit_executor is None:
+        self.setup()
+      # Commits may be left in flight by a bundle that failed.
+      futures.wait([batch.commit for batch in self._pending_commits])
+      self._pending_commits = []
+
       self._client = helper.get_client(self._project, namespace=None)
       self._init_batch()
 
@@ -337,15 +391,23 @@ class _Mutate(PTransform):
       self._target_batch_size = self._batch_sizer.get_batch_size(
           time.time() * 1000)
 
+    def teardown(self):
+      self._commit_executor = None
+      self._shared_commit_executor.release()
+
     def element_to_client_batch_item(self, element):
       raise NotImplementedError
 
-    def add_to_batch(self, client_batch_item):
+    def client_batch_item_key(self, client_batch_item):
+      raise NotImplementedError
+
+    def add_to_batch(self, client_batch, client_batch_item):
       raise NotImplementedError
 
     @retry.with_exponential_backoff(
         num_retries=5, retry_filter=helper.retry_on_rpc_error)
-    def write_mutations(self, throttler, rpc_stats_callback, throttle_delay=1):
+    def write_mutations(
+        self, batch, throttler, rpc_stats_callback, throttle_delay=1):
       """Writes a batch of mutations to Cloud Datastore.
 
       If a commit fails, it will be retried up to 5 times. All mutations in the
@@ -360,6 +422,7 @@ class _Mutate(PTransform):
       retry config.
 
       Args:
+        batch: (``_MutationBatch``) the batch of mutations to commit.
         rpc_stats_callback: a function to call with arguments `successes` and
             `failures` and `throttled_secs`; this is called to record successful
             and failed RPCs to Datastore and time spent waiting for throttling.
@@ -373,70 +436,118 @@ class _Mutate(PTransform):
         (int) The latency of the successful RPC in milliseconds.
       """
       # Client-side throttling.
-      while throttler.throttle_request(time.time() * 1000):
+      while self._throttle_request(throttler):
         _LOGGER.info(
             "Delaying request for %ds due to previous failures", throttle_delay)
         time.sleep(throttle_delay)
         rpc_stats_callback(throttled_secs=throttle_delay)
 
-      if self._batch is None:
+      if batch.client_batch is None:
         # this will only happen when we re-try previously failed batch
-        self._batch = self._client.batch()
-        self._batch.begin()
-        for element in self._batch_elements:
-          self.add_to_batch(element)
+        batch.client_batch = self._client.batch()
+        batch.client_batch.begin()
+        for element in batch.elements:
+          self.add_to_batch(batch.client_batch, element)
 
       try:
         start_time = time.time()
-        self._batch.commit()
+        batch.client_batch.commit()
         end_time = time.time()
 
         rpc_stats_callback(successes=1)
-        throttler.successful_request(start_time * 1000)
+        with self._throttler_lock:
+          throttler.successful_request(start_time * 1000)
         commit_time_ms = int((end_time - start_time) * 1000)
         return commit_time_ms
       except Exception:
-        self._batch = None
+        batch.client_batch = None
         rpc_stats_callback(errors=1)
         raise
 
+    def _throttle_request(self, throttler):
+      with self._throttler_lock:
+        return throttler.throttle_request(time.time() * 1000)
+
     def process(self, element):
       client_element = self.element_to_client_batch_item(element)
-      self._batch_elements.append(client_element)
-      self.add_to_batch(client_element)
-      self._batch_bytes_size += self._batch.mutations[-1].ByteSize()
-
-      if (len(self._batch.mutations) >= self._target_batch_size or
-          self._batch_bytes_size > util.WRITE_BATCH_MAX_BYTES_SIZE):
+      key = self.client_batch_item_key(client_element)
+      if key in self._batch.keys:
+        # A non-transactional commit may not mutate an entity more than once.
+        self._flush_batch()
+      conflicting_commits = [
+          batch for batch in self._pending_commits if key in batch.keys
+      ]
+      if conflicting_commits:
+        self._wait_for_commits(futures.ALL_COMPLETED, conflicting_commits)
+
+      self._batch.elements.append(client_element)
+      self._batch.keys.add(key)
+      self.add_to_batch(self._batch.client_batch, client_element)
+      self._batch.bytes_size += (
+          self._batch.client_batch.mutations[-1].ByteSize())
+
+      if (len(self._batch.elements) >= self._target_batch_size or
+          self._batch.bytes_size > util.WRITE_BATCH_MAX_BYTES_SIZE):
         self._flush_batch()
 
     def finish_bundle(self):
-      if self._batch_elements:
+      if self._batch.elements:
         self._flush_batch()
+      self._wait_for_commits(futures.ALL_COMPLETED)
 
     def _init_batch(self):
-      self._batch_bytes_size = 0
-      self._batch = self._client.batch()
-      self._batch.begin()
-      self._batch_elements = []
+      client_batch = self._client.batch()
+      client_batch.begin()
+      self._batch = _MutationBatch(client_batch)
 
     def _flush_batch(self):
-      # Flush the current batch of mutations to Cloud Datastore.
-      latency_ms = self.write_mutations(
+      # Flush the current batch of mutations to Cloud Datastore, once fewer
+      # than the maximum number of commits are in flight.
+      if len(self._pending_commits) >= self._max_commits_in_flight:
+        self._wait_for_commits(futures.FIRST_COMPLETED)
+      batch = self._batch
+      batch.commit = self._commit_executor.submit(
+          self.write_mutations,
+          batch,
           self._throttler,
-          rpc_stats_callback=self._update_rpc_stats,
+          rpc_stats_callback=batch.rpc_stats.update,
           throttle_delay=util.WRITE_BATCH_TARGET_LATENCY_MS // 1000)
-      _LOGGER.debug(
-          "Successfully wrote %d mutations in %dms.",
-          len(self._batch.mutations),
-          latency_ms)
+      self._pending_commits.append(batch)
+      self._init_batch()
 
-      now = time.time() * 1000
-      self._batch_sizer.report_latency(
-          now, latency_ms, len(self._batch.mutations))
-      self._target_batch_size = self._batch_sizer.get_batch_size(now)
+    def _wait_for_commits(self, return_when, batches=None):
+      """Waits for commits in flight, and records the completed ones.
 
-      self._init_batch()
+      Args:
+        return_when: when to return, as in ``concurrent.futures.wait``.
+        batches: the batches whose commits to wait for, defaults to all the
+          batches in flight.
+
+      Raises:
+        The error of a failed commit.
+      """
+      if batches is None:
+        batches = self._pending_commits
+      futures.wait([batch.commit for batch in batches], return_when=return_when)
+
+      pending_commits = []
+      for batch in self._pending_commits:
+        if not batch.commit.done():
+          pending_commits.append(batch)
+          continue
+        # Metrics are only recorded by the bundle thread.
+        self._update_rpc_stats(**batch.rpc_stats)
+        latency_ms = batch.commit.result()
+        _LOGGER.debug(
+            "Successfully wrote %d mutations in %dms.",
+            len(batch.elements),
+            latency_ms)
+        self._rpc_latency_ms.update(latency_ms)
+        self._batch_sizer.report_latency(
+            time.time() * 1000, latency_ms, len(batch.elements))
+      self._pending_commits = pending_commits
+      self._target_batch_size = self._batch_sizer.get_batch_size(
+          time.time() * 1000)
 
 
 @typehints.with_input_types(types.Entity)
@@ -450,13 +561,16 @@ class WriteToDatastore(_Mutate):
   property key is empty then it is filled with the project ID passed to this
   transform.
   """
-  def __init__(self, project):
+  def __init__(self, project, max_commits_in_flight=None):
     """Initialize the `WriteToDatastore` transform.
 
     Args:
       project: (:class:`str`) The ID of the project to write entities to.
+      max_commits_in_flight: (:class:`int`) The maximum number of concurrent
+        commit RPCs of each worker. Defaults to 4.
     """
-    mutate_fn = WriteToDatastore._DatastoreWriteFn(project)
+    mutate_fn = WriteToDatastore._DatastoreWriteFn(
+        project, max_commits_in_flight)
     super(WriteToDatastore, self).__init__(mutate_fn)
 
   class _DatastoreWriteFn(_Mutate.DatastoreMutateFn):
@@ -474,8 +588,11 @@ class WriteToDatastore(_Mutate):
             'have complete keys:\n%s' % client_entity)
       return client_entity
 
-    def add_to_batch(self, client_entity):
-      self._batch.put(client_entity)
+    def client_batch_item_key(self, client_entity):
+      return client_entity.key
+
+    def add_to_batch(self, client_batch, client_entity):
+      client_batch.put(client_entity)
 
     def display_data(self):
       return {
@@ -495,14 +612,17 @@ class DeleteFromDatastore(_Mutate):
   project ID passed to this transform. If ``project`` field in key is empty then
   it is filled with the project ID passed to this transform.
   """
-  def __init__(self, project):
+  def __init__(self, project, max_commits_in_flight=None):
     """Initialize the `DeleteFromDatastore` transform.
 
     Args:
       project: (:class:`str`) The ID of the project from which the entities will
         be deleted.
+      max_commits_in_flight: (:class:`int`) The maximum number of concurrent
+        commit RPCs of each worker. Defaults to 4.
     """
-    mutate_fn = DeleteFromDatastore._DatastoreDeleteFn(project)
+    mutate_fn = DeleteFromDatastore._DatastoreDeleteFn(
+        project, max_commits_in_flight)
     super(DeleteFromDatastore, self).__init__(mutate_fn)
 
   class _DatastoreDeleteFn(_Mutate.DatastoreMutateFn):
@@ -520,8 +640,11 @@ class DeleteFromDatastore(_Mutate):
             'complete:\n%s' % client_key)
       return client_key
 
-    def add_to_batch(self, client_key):
-      self._batch.delete(client_key)
+    def client_batch_item_key(self, client_key):
+      return client_key
+
+    def add_to_batch(self, client_batch, client_key):
+      client_batch.delete(client_key)
 
     def display_data(self):
       return {
@@ -25,6 +25,8 @@ from __future__ import print_function
 
 import datetime
 import math
+import threading
+import time
 import unittest
 
 from mock import MagicMock
@@ -41,6 +43,7 @@ try:
   from apache_beam.io.gcp.datastore.v1new.datastoreio import DeleteFromDatastore
   from apache_beam.io.gcp.datastore.v1new.datastoreio import ReadFromDatastore
   from apache_beam.io.gcp.datastore.v1new.datastoreio import WriteToDatastore
+  from apache_beam.io.gcp.datastore.v1new.types import Entity
   from apache_beam.io.gcp.datastore.v1new.types import Key
   from google.cloud.datastore import client
   from google.cloud.datastore import entity
@@ -120,8 +123,8 @@ class MutateTest(unittest.TestCase):
     rpc_stats_callback = MagicMock()
     mock_throttler.throttle_request.return_value = []
     mutate = datastoreio._Mutate.DatastoreMutateFn(lambda: None)
-    mutate._batch = mock_batch
-    mutate.write_mutations(mock_throttler, rpc_stats_callback)
+    batch = datastoreio._MutationBatch(mock_batch)
+    mutate.write_mutations(batch, mock_throttler, rpc_stats_callback)
     rpc_stats_callback.assert_has_calls([
         call(successes=1),
     ])
@@ -137,12 +140,12 @@ class MutateTest(unittest.TestCase):
     rpc_stats_callback = MagicMock()
     mock_throttler.throttle_request.return_value = []
     mutate = datastoreio._Mutate.DatastoreMutateFn(lambda: None)
-    mutate._batch = mock_batch
+    batch = datastoreio._MutationBatch(mock_batch)
+    batch.elements = [None]
     mutate._client = MagicMock()
-    mutate._batch_elements = [None]
     mock_add_to_batch = MagicMock()
     mutate.add_to_batch = mock_add_to_batch
-    mutate.write_mutations(mock_throttler, rpc_stats_callback)
+    mutate.write_mutations(batch, mock_throttler, rpc_stats_callback)
     rpc_stats_callback.assert_has_calls([
         call(successes=1),
     ])
@@ -160,10 +163,10 @@ class MutateTest(unittest.TestCase):
     # Second try: no throttle [False]
     mock_throttler.throttle_request.side_effect = [True, False, False]
     mutate = datastoreio._Mutate.DatastoreMutateFn(lambda: None)
-    mutate._batch = mock_batch
-    mutate._batch_elements = []
+    batch = datastoreio._MutationBatch(mock_batch)
     mutate._client = MagicMock()
-    mutate.write_mutations(mock_throttler, rpc_stats_callback, throttle_delay=0)
+    mutate.write_mutations(
+        batch, mock_throttler, rpc_stats_callback, throttle_delay=0)
     rpc_stats_callback.assert_has_calls([
         call(successes=1),
         call(throttled_secs=ANY),
@@ -181,10 +184,10 @@ class MutateTest(unittest.TestCase):
     rpc_stats_callback = MagicMock()
     mock_throttler.throttle_request.return_value = False
     mutate = datastoreio._Mutate.DatastoreMutateFn(lambda: None)
-    mutate._batch = mock_batch
+    batch = datastoreio._MutationBatch(mock_batch)
     with self.assertRaises(exceptions.InvalidArgument):
       mutate.write_mutations(
-          mock_throttler, rpc_stats_callback, throttle_delay=0)
+          batch, mock_throttler, rpc_stats_callback, throttle_delay=0)
     rpc_stats_callback.assert_called_once_with(errors=1)
 
 
@@ -332,6 +335,76 @@ class DatastoreioTest(DatastoreioTestBase):
 
       self.assertEqual(2, commit_count[0])
 
+  def test_DatastoreWriteConcurrentCommits(self):
+    with patch.object(helper, 'get_client', return_value=self._mock_client):
+      commits_in_flight = [0]
+      max_commits_in_flight = [0]
+      lock = threading.Lock()
+
+      class SlowBatch(FakeBatch):
+        def commit(self):
+          with lock:
+            commits_in_flight[0] += 1
+            max_commits_in_flight[0] = max(
+                max_commits_in_flight[0], commits_in_flight[0])
+          time.sleep(0.05)
+          with lock:
+            commits_in_flight[0] -= 1
+
+      self._mock_client.batch.side_effect = SlowBatch
+
+      datastore_write_fn = WriteToDatastore._DatastoreWriteFn(
+          self._PROJECT, max_commits_in_flight=3)
+      datastore_write_fn._rpc_latency_ms = MagicMock()
+      datastore_write_fn.start_bundle()
+      datastore_write_fn._target_batch_size = 1
+      for entity in helper.create_entities(12):
+        datastore_write_fn.process(entity)
+        datastore_write_fn._target_batch_size = 1
+      datastore_write_fn.finish_bundle()
+      datastore_write_fn.teardown()
+
+      self.assertEqual(0, commits_in_flight[0])
+      self.assertGreater(max_commits_in_flight[0], 1)
+      self.assertLessEqual(max_commits_in_flight[0], 3)
+      # The latency of every commit is recorded.
+      self.assertEqual(12, datastore_write_fn._rpc_latency_ms.update.call_count)
+
+  def test_DatastoreWriteConflictingKeys(self):
+    with patch.object(helper, 'get_client', return_value=self._mock_client):
+      committed = []
+      batch_keys = []
+
+      class RecordingBatch(FakeBatch):
+        def commit(self):
+          keys = [m.entity.key.flat_path for m in self.mutations]
+          batch_keys.append(keys)
+          # Commits of the first entity are slow.
+          if ('k', 1) in keys:
+            time.sleep(0.1)
+          committed.extend(keys)
+
+      self._mock_client.batch.side_effect = RecordingBatch
+
+      datastore_write_fn = WriteToDatastore._DatastoreWriteFn(self._PROJECT)
+      datastore_write_fn.start_bundle()
+      entities = []
+      for version, id_ in enumerate([1, 2, 1, 3, 1]):
+        entity = Entity(Key(['k', id_], project=self._PROJECT))
+        entity.set_properties({'version': version})
+        entities.append(entity)
+      for entity in entities:
+        datastore_write_fn.process(entity)
+      datastore_write_fn.finish_bundle()
+      datastore_write_fn.teardown()
+
+      # A batch mutates an entity at most once.
+      self.assertEqual([[('k', 1), ('k', 2)], [('k', 1), ('k', 3)], [('k', 1)]],
+                       batch_keys)
+      # The mutations of an entity are committed in order.
+      self.assertEqual([('k', 1)] * 3,
+                       [key for key in committed if key == ('k', 1)])
+
   def check_estimated_size_bytes(self, entity_bytes, timestamp, namespace=None):
     """A helper method to test get_estimated_size_bytes"""
     self._mock_client.namespace = namespace
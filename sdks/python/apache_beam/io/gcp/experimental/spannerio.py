@@ -152,8 +152,17 @@ to 50 rows, max_number_cells is set to 500 cells and max_batch_size_bytes is
 set to 1MB (1048576 bytes). These parameter used to reduce the number of
 transactions sent to spanner by grouping the mutation into batches. Setting
 these param values either to smaller value or zero to disable batching.
-Unlike the Java connector, this connector does not create batches of
-transactions sorted by table and primary key.
+Like the Java connector, this connector sorts the mutations of a bundle by table
+and key before batching them, so that batches span few splits of the database.
+The key of a mutation is taken to be the values of its first row, in the order
+of its columns, hence key columns are best listed first.
+
+The batching limits are scaled down while commits take longer than 5 seconds or
+are aborted, and grow back to the configured limits as commits get faster. Up
+to max_commits_in_flight batches are committed at once by each worker thread.
+The latency of commits is exported as the SpannerCommitLatencyMs distribution,
+and the number of aborted commits, which are retried, as the
+SpannerCommitAborts counter.
 
 WriteToSpanner transforms starts with the grouping into batches. The first step
 in this process is to make the make the mutation groups of the WriteMutation
@@ -169,10 +178,21 @@ mutation groups together to process. If the Mutation references a table or
 column does not exits, it will cause a exception and fails the entire pipeline.
 """
 from __future__ import absolute_import
-
+from __future__ import division
+
+import datetime
+import decimal
+import logging
+import numbers
+import threading
+import time
 import typing
+from collections import Counter
 from collections import deque
 from collections import namedtuple
+from concurrent import futures
+
+from past.builtins import unicode
 
 from apache_beam import Create
 from apache_beam import DoFn
@@ -189,9 +209,12 @@ from apache_beam.transforms import window
 from apache_beam.transforms.display import DisplayDataItem
 from apache_beam.typehints import with_input_types
 from apache_beam.typehints import with_output_types
+from apache_beam.utils import retry
+from apache_beam.utils import shared
 from apache_beam.utils.annotations import experimental
 
 try:
+  from google.api_core.exceptions import Aborted
   from google.cloud.spanner import Client
   from google.cloud.spanner import KeySet
   from google.cloud.spanner_v1 import batch
@@ -211,6 +234,8 @@ __all__ = [
     'MutationGroup'
 ]
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class _SPANNER_TRANSACTION(namedtuple("SPANNER_TRANSACTION", ["transaction"])):
   """
@@ -704,7 +729,8 @@ class WriteToSpanner(PTransform):
       credentials=None,
       max_batch_size_bytes=1048576,
       max_number_rows=50,
-      max_number_cells=500):
+      max_number_cells=500,
+      max_commits_in_flight=4):
     """
     A PTransform to write onto Google Cloud Spanner.
 
@@ -722,6 +748,8 @@ class WriteToSpanner(PTransform):
       max_number_cells: (optional) Split the mutations into batches to
         reduce the number of transaction sent to Spanner. By default it is
         set to 500 cells per batch.
+      max_commits_in_flight: (optional) The maximum number of concurrent
+        commits of batches of each worker thread. By default it is set to 4.
     """
     self._configuration = _BeamSpannerConfiguration(
         project=project_id,
@@ -734,6 +762,9 @@ class WriteToSpanner(PTransform):
     self._max_batch_size_bytes = max_batch_size_bytes
     self._max_number_rows = max_number_rows
     self._max_number_cells = max_number_cells
+    self._max_commits_in_flight = max_commits_in_flight
+    # Batching limits are scaled by the latency of the commits of the worker.
+    self._batch_scaler = shared.Shared()
     self._database_id = database_id
     self._project_id = project_id
     self._instance_id = instance_id
@@ -751,6 +782,8 @@ class WriteToSpanner(PTransform):
             self._max_number_rows, label="Max Rows"),
         'max_number_cells': DisplayDataItem(
             self._max_number_cells, label="Max Cells"),
+        'max_commits_in_flight': DisplayDataItem(
+            self._max_commits_in_flight, label="Max Commits In Flight"),
     }
     return res
 
@@ -760,9 +793,13 @@ class WriteToSpanner(PTransform):
         | "make batches" >> _WriteGroup(
             max_batch_size_bytes=self._max_batch_size_bytes,
             max_number_rows=self._max_number_rows,
-            max_number_cells=self._max_number_cells)
-        |
-        'Writing to spanner' >> ParDo(_WriteToSpannerDoFn(self._configuration)))
+            max_number_cells=self._max_number_cells,
+            batch_scaler=self._batch_scaler)
+        | 'Writing to spanner' >> ParDo(
+            _WriteToSpannerDoFn(
+                self._configuration,
+                max_commits_in_flight=self._max_commits_in_flight,
+                batch_scaler=self._batch_scaler)))
 
 
 class _Mutator(namedtuple('_Mutator',
@@ -984,22 +1021,86 @@ class WriteMutation(object):
         })
 
 
+_ORDERED_TYPES = (bytes, unicode, numbers.Real, decimal.Decimal, datetime.date)
+
+
+def _orderable(value):
+  # Values of different types are ordered by the name of their type, and
+  # values which are not ordered, such as arrays and structs, by their repr.
+  # Naive and aware datetimes do not compare, so aware ones are converted to
+  # naive UTC, which is how Spanner reads naive timestamps.
+  if isinstance(value, datetime.datetime) and value.utcoffset() is not None:
+    return type(value).__name__, value.replace(tzinfo=None) - value.utcoffset()
+  if isinstance(value, _ORDERED_TYPES):
+    return type(value).__name__, value
+  return type(value).__name__, repr(value)
+
+
+def _mutation_sort_key(mutation_group):
+  """The table of the first mutation of a group and the values of its first
+  row, which include its key if the key columns come first."""
+  mutation = mutation_group.primary()
+  values = mutation.kwargs.get('values') or [()]
+  return (
+      mutation.kwargs['table'], tuple(_orderable(value) for value in values[0]))
+
+
+class _BatchScaler(object):
+  """Scales the batching limits of mutations by the latency of commits.
+
+  The scale is halved when a commit takes longer than the target latency or is
+  aborted, and grows back by a tenth when a commit is faster. It is shared by
+  the batching and writing ``DoFn`` instances of a worker, and is thread safe.
+  """
+  TARGET_COMMIT_LATENCY_MS = 5000
+  MIN_SCALE = 1 / 16
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._scale = 1.0
+
+  def scale(self):
+    return self._scale
+
+  def report_commit(self, latency_ms, aborted=False):
+    with self._lock:
+      if aborted or latency_ms > _BatchScaler.TARGET_COMMIT_LATENCY_MS:
+        self._scale = max(self._scale / 2, _BatchScaler.MIN_SCALE)
+      else:
+        self._scale = min(self._scale + 0.1, 1.0)
+
+
 @with_input_types(typing.Union[MutationGroup, TaggedOutput])
 @with_output_types(MutationGroup)
 class _BatchFn(DoFn):
   """
   Batches mutations together.
+
+  Mutation groups are buffered, up to GROUPING_FACTOR batches of the maximum
+  size, and sorted by table and key before being batched.
   """
-  def __init__(self, max_batch_size_bytes, max_number_rows, max_number_cells):
+  GROUPING_FACTOR = 25
+
+  def __init__(
+      self,
+      max_batch_size_bytes,
+      max_number_rows,
+      max_number_cells,
+      batch_scaler=None):
     self._max_batch_size_bytes = max_batch_size_bytes
     self._max_number_rows = max_number_rows
     self._max_number_cells = max_number_cells
+    self._batch_scaler = batch_scaler
+    self._scaler = None
+
+  def setup(self):
+    if self._batch_scaler is not None:
+      self._scaler = self._batch_scaler.acquire(_BatchScaler)
 
   def start_bundle(self):
-    self._batch = MutationGroup()
-    self._size_in_bytes = 0
-    self._rows = 0
-    self._cells = 0
+    self._buffer = []
+    self._buffered_bytes = 0
+    self._reset_count()
 
   def _reset_count(self):
     self._batch = MutationGroup()
@@ -1009,30 +1110,54 @@ class _BatchFn(DoFn):
 
   def process(self, element):
     mg_info = element.info
-
-    if mg_info['byte_size'] + self._size_in_bytes > self._max_batch_size_bytes \
-        or mg_info['cells'] + self._cells > self._max_number_cells \
-        or mg_info['rows'] + self._rows > self._max_number_rows:
-      # Batch is full, output the batch and resetting the count.
-      if self._batch:
-        yield self._batch
-      self._reset_count()
-
-    self._batch.extend(element)
-
-    # total byte size of the mutation group.
-    self._size_in_bytes += mg_info['byte_size']
-
-    # total rows in the mutation group.
-    self._rows += mg_info['rows']
-
-    # total cells in the mutation group.
-    self._cells += mg_info['cells']
+    self._buffer.append((element, mg_info))
+    self._buffered_bytes += mg_info['byte_size']
+    if (self._buffered_bytes >=
+        self._max_batch_size_bytes * _BatchFn.GROUPING_FACTOR):
+      for batch in self._flush_buffer():
+        yield batch
+
+  def _flush_buffer(self):
+    scale = self._scaler.scale() if self._scaler is not None else 1
+    max_batch_size_bytes = self._max_batch_size_bytes * scale
+    max_number_cells = self._max_number_cells * scale
+    max_number_rows = self._max_number_rows * scale
+
+    self._buffer.sort(
+        key=lambda group_and_info: _mutation_sort_key(group_and_info[0]))
+    for element, mg_info in self._buffer:
+      if mg_info['byte_size'] + self._size_in_bytes > max_batch_size_bytes \
+          or mg_info['cells'] + self._cells > max_number_cells \
+          or mg_info['rows'] + self._rows > max_number_rows:
+        # Batch is full, output the batch and resetting the count.
+        if self._batch:
+          yield self._batch
+        self._reset_count()
+
+      self._batch.extend(element)
+
+      # total byte size of the mutation group.
+      self._size_in_bytes += mg_info['byte_size']
+
+      # total rows in the mutation group.
+      self._rows += mg_info['rows']
+
+      # total cells in the mutation group.
+      self._cells += mg_info['cells']
+    self._buffer = []
+    self._buffered_bytes = 0
 
   def finish_bundle(self):
-    if self._batch is not None:
+    for batch in self._flush_buffer():
+      yield window.GlobalWindows.windowed_value(batch)
+    if self._batch:
       yield window.GlobalWindows.windowed_value(self._batch)
-      self._batch = None
+    self._reset_count()
+
+  def teardown(self):
+    if self._batch_scaler is not None:
+      self._scaler = None
+      self._batch_scaler.release()
 
 
 @with_input_types(MutationGroup)
@@ -1066,10 +1191,25 @@ class _BatchableFilterFn(DoFn):
 
 
 class _WriteToSpannerDoFn(DoFn):
-  def __init__(self, spanner_configuration):
+  """Commits batches of mutations, up to max_commits_in_flight at once.
+
+  Aborted commits are retried, up to MAX_ABORT_RETRIES times.
+  """
+  MAX_ABORT_RETRIES = 5
+
+  def __init__(
+      self, spanner_configuration, max_commits_in_flight=1, batch_scaler=None):
     self._spanner_configuration = spanner_configuration
+    self._max_commits_in_flight = max_commits_in_flight
+    self._batch_scaler = batch_scaler
+    self._scaler = None
     self._db_instance = None
+    self._commit_executor = None
+    self._pending_commits = []
     self.batches = Metrics.counter(self.__class__, 'SpannerBatches')
+    self.commit_latency_ms = Metrics.distribution(
+        self.__class__, 'SpannerCommitLatencyMs')
+    self.commit_aborts = Metrics.counter(self.__class__, 'SpannerCommitAborts')
 
   def setup(self):
     spanner_client = Client(self._spanner_configuration.project)
@@ -1077,9 +1217,76 @@ class _WriteToSpannerDoFn(DoFn):
     self._db_instance = instance.database(
         self._spanner_configuration.database,
         pool=self._spanner_configuration.pool)
+    self._commit_executor = futures.ThreadPoolExecutor(
+        max_workers=self._max_commits_in_flight)
+    if self._batch_scaler is not None:
+      self._scaler = self._batch_scaler.acquire(_BatchScaler)
+
+  def start_bundle(self):
+    # Commits may be left in flight by a bundle that failed.
+    futures.wait([commit for commit, _ in self._pending_commits])
+    self._pending_commits = []
 
   def process(self, element):
     self.batches.inc()
+    if len(self._pending_commits) >= self._max_commits_in_flight:
+      self._wait_for_commits(futures.FIRST_COMPLETED)
+    # The stats of the commit are recorded by the bundle thread.
+    commit_stats = Counter()
+    self._pending_commits.append((
+        self._commit_executor.submit(self._commit, element, commit_stats),
+        commit_stats))
+
+  def finish_bundle(self):
+    self._wait_for_commits(futures.ALL_COMPLETED)
+
+  def teardown(self):
+    if self._commit_executor is not None:
+      self._commit_executor.shutdown()
+      self._commit_executor = None
+    if self._batch_scaler is not None:
+      self._scaler = None
+      self._batch_scaler.release()
+
+  def _wait_for_commits(self, return_when):
+    futures.wait([commit for commit, _ in self._pending_commits],
+                 return_when=return_when)
+    pending_commits = []
+    for commit, commit_stats in self._pending_commits:
+      if not commit.done():
+        pending_commits.append((commit, commit_stats))
+        continue
+      self.commit_aborts.inc(commit_stats['aborts'])
+      # Raises the error of a failed commit.
+      latency_ms = commit.result()
+      self.commit_latency_ms.update(latency_ms)
+      if self._scaler is not None:
+        self._scaler.report_commit(
+            latency_ms, aborted=commit_stats['aborts'] > 0)
+    self._pending_commits = pending_commits
+
+  def _commit(self, element, commit_stats):
+    """Commits a batch of mutations, and returns the latency of the commit in
+    milliseconds."""
+    backoff_calculator = iter(
+        retry.FuzzedExponentialIntervals(
+            initial_delay_secs=1,
+            num_retries=_WriteToSpannerDoFn.MAX_ABORT_RETRIES))
+    while True:
+      start_time = time.time()
+      try:
+        self._write_batch(element)
+        return int((time.time() - start_time) * 1000)
+      except Aborted:
+        commit_stats['aborts'] += 1
+        retry_backoff = next(backoff_calculator, None)
+        if retry_backoff is None:
+          raise
+        _LOGGER.info(
+            'Commit to Spanner aborted, retrying in %s seconds.', retry_backoff)
+        time.sleep(retry_backoff)
+
+  def _write_batch(self, element):
     with self._db_instance.batch() as b:
       for m in element:
         if m.operation == WriteMutation._OPERATION_DELETE:
@@ -1116,10 +1323,16 @@ class _MakeMutationGroupsFn(DoFn):
 
 
 class _WriteGroup(PTransform):
-  def __init__(self, max_batch_size_bytes, max_number_rows, max_number_cells):
+  def __init__(
+      self,
+      max_batch_size_bytes,
+      max_number_rows,
+      max_number_cells,
+      batch_scaler=None):
     self._max_batch_size_bytes = max_batch_size_bytes
     self._max_number_rows = max_number_rows
     self._max_number_cells = max_number_cells
+    self._batch_scaler = batch_scaler
 
   def expand(self, pcoll):
     filter_batchable_mutations = (
@@ -1139,7 +1352,8 @@ class _WriteGroup(PTransform):
             _BatchFn(
                 max_batch_size_bytes=self._max_batch_size_bytes,
                 max_number_rows=self._max_number_rows,
-                max_number_cells=self._max_number_cells)))
+                max_number_cells=self._max_number_cells,
+                batch_scaler=self._batch_scaler)))
 
     return ((
         batching_batchables,
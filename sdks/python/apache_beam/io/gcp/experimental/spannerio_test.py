@@ -18,9 +18,12 @@
 from __future__ import absolute_import
 
 import datetime
+import functools
 import logging
 import random
 import string
+import threading
+import time
 import unittest
 
 import mock
@@ -35,6 +38,7 @@ from apache_beam.testing.util import equal_to
 # pylint: disable=wrong-import-order, wrong-import-position, ungrouped-imports
 # pylint: disable=unused-import
 try:
+  from google.api_core.exceptions import Aborted
   from google.cloud import spanner
   from apache_beam.io.gcp.experimental.spannerio import create_transaction
   from apache_beam.io.gcp.experimental.spannerio import ReadOperation
@@ -43,6 +47,8 @@ try:
   from apache_beam.io.gcp.experimental.spannerio import MutationGroup
   from apache_beam.io.gcp.experimental.spannerio import WriteToSpanner
   from apache_beam.io.gcp.experimental.spannerio import _BatchFn
+  from apache_beam.io.gcp.experimental.spannerio import _BatchScaler
+  from apache_beam.io.gcp.experimental.spannerio import _WriteToSpannerDoFn
 except ImportError:
   spanner = None
 # pylint: enable=wrong-import-order, wrong-import-position, ungrouped-imports
@@ -610,6 +616,208 @@ class SpannerWriteTest(unittest.TestCase):
     self.assertTrue("max_number_cells" in data)
 
 
+class _FakeDatabase(object):
+  """Fake Spanner database, which records the mutations of committed batches.
+
+  Commits take latency_secs, and the first aborts commits are aborted.
+  """
+  def __init__(self, latency_secs=0, aborts=0):
+    self.latency_secs = latency_secs
+    self.aborts = aborts
+    self.committed = []
+    self.commits_in_flight = 0
+    self.max_commits_in_flight = 0
+    self._lock = threading.Lock()
+
+  def batch(self):
+    return _FakeBatchCheckout(self)
+
+
+class _FakeBatchCheckout(object):
+  def __init__(self, database):
+    self._database = database
+    self._mutations = []
+
+  def _record(self, operation, **kwargs):
+    self._mutations.append((operation, kwargs))
+
+  def __enter__(self):
+    batch = mock.MagicMock()
+    for operation in ('insert',
+                      'update',
+                      'insert_or_update',
+                      'replace',
+                      'delete'):
+      getattr(batch, operation).side_effect = functools.partial(
+          self._record, operation)
+    return batch
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    database = self._database
+    with database._lock:
+      database.commits_in_flight += 1
+      database.max_commits_in_flight = max(
+          database.max_commits_in_flight, database.commits_in_flight)
+    time.sleep(database.latency_secs)
+    with database._lock:
+      database.commits_in_flight -= 1
+      if database.aborts:
+        database.aborts -= 1
+        raise Aborted('aborted')
+      database.committed.append(self._mutations)
+
+
+@unittest.skipIf(spanner is None, 'GCP dependencies are not installed.')
+class SpannerBatchingTest(unittest.TestCase):
+  def _insert(self, table, key):
+    return MutationGroup(
+        [WriteMutation.insert(table, ("key", "value"), [(key, "value")])])
+
+  def _batches(self, batch_fn, mutation_groups):
+    batch_fn.setup()
+    batch_fn.start_bundle()
+    batches = []
+    for mutation_group in mutation_groups:
+      batches.extend(batch_fn.process(mutation_group))
+    batches.extend(wv.value for wv in batch_fn.finish_bundle())
+    batch_fn.teardown()
+    return [[(m.kwargs['table'], m.kwargs['values'][0][0]) for m in batch]
+            for batch in batches]
+
+  def test_batches_are_sorted_by_table_and_key(self):
+    mutation_groups = [
+        self._insert('users', 3),
+        self._insert('roles', 'b'),
+        self._insert('users', 1),
+        self._insert('roles', 'a'),
+        self._insert('users', 2),
+    ]
+    batch_fn = _BatchFn(
+        max_batch_size_bytes=1048576, max_number_rows=2, max_number_cells=500)
+    self.assertEqual([[('roles', 'a'),
+                       ('roles', 'b')], [('users', 1),
+                                         ('users', 2)], [('users', 3)]],
+                     self._batches(batch_fn, mutation_groups))
+
+  def test_sorting_mixed_types(self):
+    mutation_groups = [
+        self._insert('t', None),
+        self._insert('t', 'a'),
+        self._insert('t', 1),
+        self._insert('t', [1, 'a']),
+    ]
+    batch_fn = _BatchFn(
+        max_batch_size_bytes=1048576, max_number_rows=50, max_number_cells=500)
+    self.assertEqual(4, len(self._batches(batch_fn, mutation_groups)[0]))
+
+  def test_sorting_naive_and_aware_datetimes(self):
+    class _Offset(datetime.tzinfo):
+      def utcoffset(self, dt):
+        return datetime.timedelta(hours=2)
+
+      def dst(self, dt):
+        return datetime.timedelta(0)
+
+    aware = datetime.datetime(2020, 1, 1, 12, tzinfo=_Offset())
+    naive = datetime.datetime(2020, 1, 1, 11)
+    mutation_groups = [self._insert('t', naive), self._insert('t', aware)]
+    batch_fn = _BatchFn(
+        max_batch_size_bytes=1048576, max_number_rows=50, max_number_cells=500)
+    self.assertEqual([[('t', aware), ('t', naive)]],
+                     self._batches(batch_fn, mutation_groups))
+
+  def test_batch_scaler(self):
+    scaler = _BatchScaler()
+    scaler.report_commit(100)
+    self.assertEqual(1, scaler.scale())
+    scaler.report_commit(_BatchScaler.TARGET_COMMIT_LATENCY_MS + 1)
+    self.assertEqual(0.5, scaler.scale())
+    scaler.report_commit(100, aborted=True)
+    self.assertEqual(0.25, scaler.scale())
+    for _ in range(10):
+      scaler.report_commit(_BatchScaler.TARGET_COMMIT_LATENCY_MS * 2)
+    self.assertEqual(_BatchScaler.MIN_SCALE, scaler.scale())
+    scaler.report_commit(100)
+    self.assertAlmostEqual(_BatchScaler.MIN_SCALE + 0.1, scaler.scale())
+
+  def test_batch_limits_are_scaled(self):
+    handle = mock.MagicMock()
+    handle.acquire.return_value.scale.return_value = 0.5
+    batch_fn = _BatchFn(
+        max_batch_size_bytes=1048576,
+        max_number_rows=4,
+        max_number_cells=500,
+        batch_scaler=handle)
+    batches = self._batches(
+        batch_fn, [self._insert('users', i) for i in range(5)])
+    self.assertEqual([2, 2, 1], [len(batch) for batch in batches])
+    handle.release.assert_called_once_with()
+
+
+@unittest.skipIf(spanner is None, 'GCP dependencies are not installed.')
+@mock.patch('apache_beam.io.gcp.experimental.spannerio.Client')
+class SpannerConcurrentWriteTest(unittest.TestCase):
+  def _write_fn(self, mock_client_class, database, **kwargs):
+    mock_client_class.return_value.instance.return_value.database.\
+      return_value = database
+    write_fn = _WriteToSpannerDoFn(mock.MagicMock(), **kwargs)
+    write_fn.commit_latency_ms = mock.MagicMock()
+    write_fn.commit_aborts = mock.MagicMock()
+    return write_fn
+
+  def _batch(self, key):
+    return MutationGroup([
+        WriteMutation.insert("users", ("key", "value"), [(key, "value")]),
+        WriteMutation.delete("roles", spanner.KeySet(keys=[[key]])),
+    ])
+
+  def test_concurrent_commits(self, mock_client_class):
+    database = _FakeDatabase(latency_secs=0.05)
+    write_fn = self._write_fn(
+        mock_client_class, database, max_commits_in_flight=3)
+    write_fn.setup()
+    write_fn.start_bundle()
+    for key in range(12):
+      write_fn.process(self._batch(key))
+    write_fn.finish_bundle()
+    write_fn.teardown()
+
+    self.assertEqual(
+        list(range(12)),
+        sorted(batch[0][1]['values'][0][0] for batch in database.committed))
+    self.assertEqual(['insert', 'delete'],
+                     [op for op, _ in database.committed[0]])
+    self.assertGreater(database.max_commits_in_flight, 1)
+    self.assertLessEqual(database.max_commits_in_flight, 3)
+    self.assertEqual(12, write_fn.commit_latency_ms.update.call_count)
+
+  def test_aborted_commits_are_retried(self, mock_client_class):
+    database = _FakeDatabase(aborts=2)
+    write_fn = self._write_fn(mock_client_class, database)
+    write_fn.setup()
+    write_fn.start_bundle()
+    with mock.patch('time.sleep'):
+      write_fn.process(self._batch(1))
+      write_fn.finish_bundle()
+    write_fn.teardown()
+
+    self.assertEqual(1, len(database.committed))
+    write_fn.commit_aborts.inc.assert_called_once_with(2)
+
+  def test_commit_errors_are_raised(self, mock_client_class):
+    database = _FakeDatabase(aborts=_WriteToSpannerDoFn.MAX_ABORT_RETRIES + 1)
+    write_fn = self._write_fn(mock_client_class, database)
+    write_fn.setup()
+    write_fn.start_bundle()
+    with mock.patch('time.sleep'):
+      write_fn.process(self._batch(1))
+      with self.assertRaises(Aborted):
+        write_fn.finish_bundle()
+    write_fn.teardown()
+    write_fn.commit_aborts.inc.assert_called_once_with(
+        _WriteToSpannerDoFn.MAX_ABORT_RETRIES + 1)
+
+
 if __name__ == '__main__':
   logging.getLogger().setLevel(logging.INFO)
   unittest.main()
@@ -18,7 +18,8 @@
 """Google Cloud PubSub sources and sinks.
 
 Cloud Pub/Sub sources and sinks are currently supported only in streaming
-pipelines, during remote execution.
+pipelines, during remote execution. On the DirectRunner, messages are published
+from Python, in batches whose size and latency ``WriteToPubSub`` sets.
 
 This API is currently under development and is subject to change.
 """
@@ -28,7 +29,9 @@ This API is currently under development and is subject to change.
 from __future__ import absolute_import
 
 import re
+import time
 from builtins import object
+from concurrent import futures
 from typing import Any
 from typing import Optional
 
@@ -38,7 +41,9 @@ from past.builtins import unicode
 from apache_beam import coders
 from apache_beam.io.iobase import Read
 from apache_beam.io.iobase import Write
+from apache_beam.metrics import Metrics
 from apache_beam.runners.dataflow.native_io import iobase as dataflow_io
+from apache_beam.transforms import DoFn
 from apache_beam.transforms import Map
 from apache_beam.transforms import PTransform
 from apache_beam.transforms.display import DisplayDataItem
@@ -71,26 +76,35 @@ class PubsubMessage(object):
     attributes: (dict) Key-value map of str to str, containing both user-defined
       and service generated attributes (such as id_label and
       timestamp_attribute). May be None.
+    ordering_key: (str) Messages of the same ordering key are delivered in the
+      order they were published, if the subscription enables message
+      ordering. May be None.
   """
-  def __init__(self, data, attributes):
+  def __init__(self, data, attributes, ordering_key=None):
     if data is None and not attributes:
       raise ValueError(
           'Either data (%r) or attributes (%r) must be set.', data, attributes)
     self.data = data
     self.attributes = attributes
+    self.ordering_key = ordering_key
 
   def __hash__(self):
-    return hash((self.data, frozenset(self.attributes.items())))
+    return hash(
+        (self.data, frozenset(self.attributes.items()), self.ordering_key))
 
   def __eq__(self, other):
     return isinstance(other, PubsubMessage) and (
-        self.data == other.data and self.attributes == other.attributes)
+        self.data == other.data and self.attributes == other.attributes and
+        self.ordering_key == other.ordering_key)
 
   def __ne__(self, other):
     # TODO(BEAM-5949): Needed for Python 2 compatibility.
     return not self == other
 
   def __repr__(self):
+    if self.ordering_key:
+      return 'PubsubMessage(%s, %s, ordering_key=%s)' % (
+          self.data, self.attributes, self.ordering_key)
     return 'PubsubMessage(%s, %s)' % (self.data, self.attributes)
 
   @staticmethod
@@ -110,7 +124,9 @@ class PubsubMessage(object):
     msg.ParseFromString(proto_msg)
     # Convert ScalarMapContainer to dict.
     attributes = dict((key, msg.attributes[key]) for key in msg.attributes)
-    return PubsubMessage(msg.data, attributes)
+    # Older releases of google-cloud-pubsub have no ordering keys.
+    return PubsubMessage(
+        msg.data, attributes, getattr(msg, 'ordering_key', None) or None)
 
   def _to_proto_str(self):
     """Get serialized form of ``PubsubMessage``.
@@ -127,8 +143,18 @@ class PubsubMessage(object):
     msg.data = self.data
     for key, value in iteritems(self.attributes):
       msg.attributes[key] = value
+    self._set_ordering_key(msg)
     return msg.SerializeToString()
 
+  def _set_ordering_key(self, msg):
+    if not self.ordering_key:
+      return
+    if 'ordering_key' not in msg.DESCRIPTOR.fields_by_name:
+      raise ValueError(
+          'Ordering keys are not supported by the installed release of '
+          'google-cloud-pubsub.')
+    msg.ordering_key = self.ordering_key
+
   @staticmethod
   def _from_message(msg):
     # type: (Any) -> PubsubMessage
@@ -250,6 +276,7 @@ class _WriteStringsToPubSub(PTransform):
     super(_WriteStringsToPubSub, self).__init__()
     self._sink = _PubSubSink(
         topic, id_label=None, with_attributes=False, timestamp_attribute=None)
+    self._publish_settings = {}
 
   def expand(self, pcoll):
     pcoll = pcoll | 'EncodeString' >> Map(lambda s: s.encode('utf-8'))
@@ -266,7 +293,11 @@ class WriteToPubSub(PTransform):
                topic,  # type: str
                with_attributes=False,  # type: bool
                id_label=None,  # type: Optional[str]
-               timestamp_attribute=None  # type: Optional[str]
+               timestamp_attribute=None,  # type: Optional[str]
+               max_batch_size=None,  # type: Optional[int]
+               max_batch_size_bytes=None,  # type: Optional[int]
+               max_latency_secs=None,  # type: Optional[float]
+               max_publishes_in_flight=None  # type: Optional[int]
               ):
     # type: (...) -> None
 
@@ -283,6 +314,14 @@ class WriteToPubSub(PTransform):
         in a ReadFromPubSub PTransform to deduplicate messages.
       timestamp_attribute: If set, will set an attribute for each Cloud Pub/Sub
         message with the given name and the message's publish time as the value.
+      max_batch_size: The maximum number of messages published by a request,
+        when publishing from Python, such as on the DirectRunner.
+      max_batch_size_bytes: The maximum size of the messages published by a
+        request, when publishing from Python.
+      max_latency_secs: The time after which a batch of messages is published
+        even if it is not full, when publishing from Python.
+      max_publishes_in_flight: The maximum number of publish requests sent at
+        once by a worker thread, when publishing from Python.
     """
     super(WriteToPubSub, self).__init__()
     self.with_attributes = with_attributes
@@ -290,6 +329,11 @@ class WriteToPubSub(PTransform):
     self.timestamp_attribute = timestamp_attribute
     self._sink = _PubSubSink(
         topic, id_label, with_attributes, timestamp_attribute)
+    self._publish_settings = dict(
+        max_batch_size=max_batch_size,
+        max_batch_size_bytes=max_batch_size_bytes,
+        max_latency_secs=max_latency_secs,
+        max_publishes_in_flight=max_publishes_in_flight)
 
   @staticmethod
   def to_proto_str(element):
@@ -316,6 +360,202 @@ class WriteToPubSub(PTransform):
     return self.to_runner_api_pickled(context)
 
 
+class _PublishBatch(object):
+  """The messages of an ordering key to be published by a single request."""
+  def __init__(self):
+    self.messages = []
+    self.bytes_size = 0
+    self.start_time = time.time()
+
+
+class _PubSubWriteDoFn(DoFn):
+  """Publishes messages to a Cloud Pub/Sub topic from Python.
+
+  Messages are published in batches, which are sent once they hold
+  ``max_batch_size`` messages or ``max_batch_size_bytes`` bytes, or once their
+  first message is ``max_latency_secs`` old. At most
+  ``max_publishes_in_flight`` batches are published at once, and a bundle
+  completes once all of its messages are published.
+
+  Messages of an ordering key are batched apart from the others, and a batch of
+  an ordering key is only published once the previous one is, so that the
+  messages of the key keep their order.
+
+  The publisher uses the Pub/Sub emulator if ``PUBSUB_EMULATOR_HOST`` is set.
+  """
+  DEFAULT_MAX_BATCH_SIZE = 100
+  DEFAULT_MAX_BATCH_SIZE_BYTES = 1 << 20
+  DEFAULT_MAX_LATENCY_SECS = 0.01
+  DEFAULT_MAX_PUBLISHES_IN_FLIGHT = 10
+
+  # The limits of a publish request, leaving room for its overhead.
+  MAX_BATCH_SIZE = 1000
+  MAX_BATCH_SIZE_BYTES = 9 << 20
+
+  PUBLISH_TIMEOUT_SECS = 60
+
+  def __init__(self,
+               sink,  # type: _PubSubSink
+               max_batch_size=None,  # type: Optional[int]
+               max_batch_size_bytes=None,  # type: Optional[int]
+               max_latency_secs=None,  # type: Optional[float]
+               max_publishes_in_flight=None  # type: Optional[int]
+              ):
+    self.project = sink.project
+    self.short_topic_name = sink.topic_name
+    self.id_label = sink.id_label
+    self.timestamp_attribute = sink.timestamp_attribute
+    self.with_attributes = sink.with_attributes
+
+    # TODO(BEAM-4275): Add support for id_label and timestamp_attribute.
+    if sink.id_label:
+      raise NotImplementedError(
+          'id_label is not supported for PubSub writes from Python')
+    if sink.timestamp_attribute:
+      raise NotImplementedError(
+          'timestamp_attribute is not supported for PubSub writes from Python')
+
+    self._max_batch_size = max_batch_size or self.DEFAULT_MAX_BATCH_SIZE
+    self._max_batch_size_bytes = (
+        max_batch_size_bytes or self.DEFAULT_MAX_BATCH_SIZE_BYTES)
+    self._max_latency_secs = (
+        max_latency_secs
+        if max_latency_secs is not None else self.DEFAULT_MAX_LATENCY_SECS)
+    self._max_publishes_in_flight = (
+        max_publishes_in_flight or self.DEFAULT_MAX_PUBLISHES_IN_FLIGHT)
+    if self._max_batch_size > self.MAX_BATCH_SIZE:
+      raise ValueError(
+          'max_batch_size must be at most %d (got %d).' %
+          (self.MAX_BATCH_SIZE, self._max_batch_size))
+    if self._max_batch_size_bytes > self.MAX_BATCH_SIZE_BYTES:
+      raise ValueError(
+          'max_batch_size_bytes must be at most %d (got %d).' %
+          (self.MAX_BATCH_SIZE_BYTES, self._max_batch_size_bytes))
+
+    self._published_messages = Metrics.counter(
+        self.__class__, 'PubSubPublishedMessages')
+    self._publish_latency_ms = Metrics.distribution(
+        self.__class__, 'PubSubPublishLatencyMs')
+    self._client = None
+    self._executor = None
+    self._pending_publishes = []
+
+  def display_data(self):
+    return {
+        'max_batch_size': self._max_batch_size,
+        'max_batch_size_bytes': self._max_batch_size_bytes,
+        'max_latency_secs': self._max_latency_secs,
+        'max_publishes_in_flight': self._max_publishes_in_flight,
+    }
+
+  def start_bundle(self):
+    # Not every runner calls setup, hence the publisher is set up here.
+    if self._client is None:
+      self._client = pubsub.PublisherClient()
+      self._topic = self._client.topic_path(self.project, self.short_topic_name)
+      self._executor = futures.ThreadPoolExecutor(
+          max_workers=self._max_publishes_in_flight)
+    # Publishes left over by a failed bundle are waited for, and dropped.
+    futures.wait(self._pending_publishes)
+    self._pending_publishes = []
+    self._batches = {}
+    self._publishes_by_key = {}
+
+  def process(self, element):
+    message = self._to_message(element)
+    message_size = message.ByteSize()
+    key = getattr(message, 'ordering_key', '')
+    batch = self._batches.get(key)
+    if batch and batch.bytes_size + message_size > self._max_batch_size_bytes:
+      self._flush_batch(key)
+      batch = None
+    if batch is None:
+      batch = self._batches[key] = _PublishBatch()
+    batch.messages.append(message)
+    batch.bytes_size += message_size
+    if len(batch.messages) >= self._max_batch_size:
+      self._flush_batch(key)
+
+    expiry_time = time.time() - self._max_latency_secs
+    expired_keys = [
+        expired_key for expired_key,
+        expired_batch in iteritems(self._batches)
+        if expired_batch.start_time <= expiry_time
+    ]
+    for expired_key in expired_keys:
+      self._flush_batch(expired_key)
+    self._collect_publishes()
+
+  def finish_bundle(self):
+    for key in list(self._batches):
+      self._flush_batch(key)
+    self._collect_publishes(futures.ALL_COMPLETED)
+    self._publishes_by_key = {}
+
+  def teardown(self):
+    if self._executor is not None:
+      self._executor.shutdown()
+      self._executor = None
+      self._client = None
+
+  def _to_message(self, element):
+    if self.with_attributes:
+      message = pubsub.types.PubsubMessage(
+          data=element.data, attributes=element.attributes)
+      element._set_ordering_key(message)
+      return message
+    if isinstance(element, unicode):
+      # The elements of WriteStringsToPubSub are not encoded, as this DoFn
+      # replaces its encoding step as well.
+      element = element.encode('utf-8')
+    return pubsub.types.PubsubMessage(data=element)
+
+  def _flush_batch(self, key):
+    batch = self._batches.pop(key)
+    previous_publish = self._publishes_by_key.get(key) if key else None
+    if previous_publish is not None:
+      # A batch of an ordering key follows the previous one, which must
+      # succeed beforehand.
+      futures.wait([previous_publish])
+      self._collect_publishes()
+    if len(self._pending_publishes) >= self._max_publishes_in_flight:
+      self._collect_publishes(futures.FIRST_COMPLETED)
+    publish = self._executor.submit(self._publish, batch.messages)
+    self._pending_publishes.append(publish)
+    if key:
+      self._publishes_by_key[key] = publish
+
+  def _collect_publishes(self, return_when=None):
+    """Records the metrics of the publishes that have completed.
+
+    Args:
+      return_when: If set, waits for the publishes in flight as in
+        ``concurrent.futures.wait`` beforehand.
+
+    Raises:
+      Any error of the completed publishes.
+    """
+    if return_when and self._pending_publishes:
+      futures.wait(self._pending_publishes, return_when=return_when)
+    pending_publishes = []
+    for publish in self._pending_publishes:
+      if publish.done():
+        # Metrics are recorded on the bundle thread, as they are kept by
+        # thread.
+        message_count, latency_ms = publish.result()
+        self._published_messages.inc(message_count)
+        self._publish_latency_ms.update(latency_ms)
+      else:
+        pending_publishes.append(publish)
+    self._pending_publishes = pending_publishes
+
+  def _publish(self, messages):
+    start_time = time.time()
+    self._client.api.publish(
+        self._topic, messages, timeout=self.PUBLISH_TIMEOUT_SECS)
+    return len(messages), int((time.time() - start_time) * 1000)
+
+
 PROJECT_ID_REGEXP = '[a-z][-a-z0-9:.]{4,61}[a-z0-9]'
 SUBSCRIPTION_REGEXP = 'projects/([^/]+)/subscriptions/(.+)'
 TOPIC_REGEXP = 'projects/([^/]+)/topics/(.+)'
@@ -23,6 +23,8 @@
 from __future__ import absolute_import
 
 import logging
+import threading
+import time
 import unittest
 from builtins import object
 
@@ -39,6 +41,8 @@ from apache_beam.io.gcp.pubsub import WriteStringsToPubSub
 from apache_beam.io.gcp.pubsub import WriteToPubSub
 from apache_beam.io.gcp.pubsub import _PubSubSink
 from apache_beam.io.gcp.pubsub import _PubSubSource
+from apache_beam.io.gcp.pubsub import _PubSubWriteDoFn
+from apache_beam.metrics.metric import MetricsFilter
 from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.options.pipeline_options import StandardOptions
 from apache_beam.runners.direct import transform_evaluator
@@ -83,6 +87,37 @@ class TestPubsubMessage(unittest.TestCase):
     m_converted = PubsubMessage._from_proto_str(m._to_proto_str())
     self.assertEqual(m_converted.data, data)
     self.assertEqual(m_converted.attributes, attributes)
+    self.assertIsNone(m_converted.ordering_key)
+
+  @unittest.skipIf(pubsub is None, 'GCP dependencies are not installed')
+  def test_proto_conversion_ordering_key(self):
+    m = PubsubMessage(b'data', {'k1': 'v1'}, ordering_key='key')
+    self.assertEqual(PubsubMessage._from_proto_str(m._to_proto_str()), m)
+
+  @unittest.skipIf(pubsub is None, 'GCP dependencies are not installed')
+  def test_proto_conversion_without_ordering_keys(self):
+    # Older releases of google-cloud-pubsub have no ordering keys.
+    descriptor = mock.Mock()
+    descriptor.fields_by_name = {}
+    proto = mock.Mock(
+        spec=[
+            'data',
+            'attributes',
+            'DESCRIPTOR',
+            'ParseFromString',
+            'SerializeToString'
+        ])
+    proto.data = b'data'
+    proto.attributes = {'k1': 'v1'}
+    proto.DESCRIPTOR = descriptor
+    with mock.patch.object(pubsub.types.pubsub_pb2,
+                           'PubsubMessage',
+                           return_value=proto):
+      self.assertEqual(
+          PubsubMessage._from_proto_str(b''),
+          PubsubMessage(b'data', {'k1': 'v1'}))
+      with self.assertRaisesRegex(ValueError, 'Ordering keys'):
+        PubsubMessage(b'data', {}, ordering_key='key')._to_proto_str()
 
   def test_eq(self):
     a = PubsubMessage(b'abc', {1: 2, 3: 4})
@@ -91,6 +126,7 @@ class TestPubsubMessage(unittest.TestCase):
     self.assertTrue(a == b)
     self.assertTrue(a != c)
     self.assertTrue(b != c)
+    self.assertTrue(a != PubsubMessage(b'abc', {1: 2, 3: 4}, 'key'))
 
   def test_hash(self):
     a = PubsubMessage(b'abc', {1: 2, 3: 4})
@@ -595,8 +631,11 @@ class TestWriteToPubSub(unittest.TestCase):
           | Create(payloads)
           | WriteToPubSub(
               'projects/fakeprj/topics/a_topic', with_attributes=False))
-    mock_pubsub.return_value.publish.assert_has_calls(
-        [mock.call(mock.ANY, data)])
+    mock_pubsub.return_value.api.publish.assert_has_calls([
+        mock.call(
+            mock.ANY, [pubsub.types.PubsubMessage(data=b'data')],
+            timeout=mock.ANY)
+    ])
 
   def test_write_messages_deprecated(self, mock_pubsub):
     data = 'data'
@@ -609,8 +648,11 @@ class TestWriteToPubSub(unittest.TestCase):
           p
           | Create(payloads)
           | WriteStringsToPubSub('projects/fakeprj/topics/a_topic'))
-    mock_pubsub.return_value.publish.assert_has_calls(
-        [mock.call(mock.ANY, data)])
+    mock_pubsub.return_value.api.publish.assert_has_calls([
+        mock.call(
+            mock.ANY, [pubsub.types.PubsubMessage(data=b'data')],
+            timeout=mock.ANY)
+    ])
 
   def test_write_messages_with_attributes_success(self, mock_pubsub):
     data = b'data'
@@ -625,8 +667,12 @@ class TestWriteToPubSub(unittest.TestCase):
           | Create(payloads)
           | WriteToPubSub(
               'projects/fakeprj/topics/a_topic', with_attributes=True))
-    mock_pubsub.return_value.publish.assert_has_calls(
-        [mock.call(mock.ANY, data, **attributes)])
+    mock_pubsub.return_value.api.publish.assert_has_calls([
+        mock.call(
+            mock.ANY,
+            [pubsub.types.PubsubMessage(data=data, attributes=attributes)],
+            timeout=mock.ANY)
+    ])
 
   def test_write_messages_with_attributes_error(self, mock_pubsub):
     data = 'data'
@@ -672,6 +718,139 @@ class TestWriteToPubSub(unittest.TestCase):
                 timestamp_attribute='timestamp'))
 
 
+class _FakePublisherApi(object):
+  """Records the publish requests, as the Pub/Sub emulator would receive them.
+
+  A publish of an ordering key that overlaps another one of the same key is
+  recorded as out of order.
+  """
+  def __init__(self, publish_delay_secs=0, error=None):
+    self.requests = []
+    self.max_in_flight = 0
+    self.out_of_order_keys = set()
+    self._publish_delay_secs = publish_delay_secs
+    self._error = error
+    self._in_flight_keys = []
+    self._lock = threading.Lock()
+
+  def publish(self, topic, messages, timeout=None):
+    keys = set(message.ordering_key for message in messages)
+    with self._lock:
+      self.out_of_order_keys.update(
+          key for key in keys if key and key in self._in_flight_keys)
+      self._in_flight_keys.append(keys)
+      self.max_in_flight = max(self.max_in_flight, len(self._in_flight_keys))
+    time.sleep(self._publish_delay_secs)
+    with self._lock:
+      self._in_flight_keys.remove(keys)
+      if self._error:
+        raise self._error
+      self.requests.append([message.data for message in messages])
+    return pubsub.types.PublishResponse(
+        message_ids=[str(i) for i in range(len(messages))])
+
+
+@unittest.skipIf(pubsub is None, 'GCP dependencies are not installed')
+class TestPubSubWriteDoFn(unittest.TestCase):
+  def setUp(self):
+    self.api = _FakePublisherApi()
+    patcher = mock.patch('google.cloud.pubsub.PublisherClient')
+    self.addCleanup(patcher.stop)
+    patcher.start().return_value.api = self.api
+
+  def write(self, elements, with_attributes=False, **publish_settings):
+    sink = _PubSubSink(
+        'projects/fakeprj/topics/a_topic',
+        id_label=None,
+        with_attributes=with_attributes,
+        timestamp_attribute=None)
+    fn = _PubSubWriteDoFn(sink, **publish_settings)
+    try:
+      fn.start_bundle()
+      for element in elements:
+        fn.process(element)
+      fn.finish_bundle()
+    finally:
+      fn.teardown()
+
+  def test_batches_by_size(self):
+    data = [b'%d' % i for i in range(7)]
+    self.write(data, max_batch_size=3, max_latency_secs=60)
+    self.assertEqual(self.api.requests, [data[:3], data[3:6], data[6:]])
+
+  def test_batches_by_bytes(self):
+    # Each message takes 12 bytes once encoded.
+    data = [b'%010d' % i for i in range(5)]
+    self.write(data, max_batch_size_bytes=30, max_latency_secs=60)
+    self.assertEqual(self.api.requests, [data[:2], data[2:4], data[4:]])
+
+  def test_batches_by_latency(self):
+    data = [b'%d' % i for i in range(3)]
+    self.write(data, max_latency_secs=0, max_publishes_in_flight=1)
+    self.assertEqual(self.api.requests, [[b'0'], [b'1'], [b'2']])
+
+  def test_bounds_publishes_in_flight(self):
+    self.api = _FakePublisherApi(publish_delay_secs=0.02)
+    pubsub.PublisherClient.return_value.api = self.api
+    data = [b'%d' % i for i in range(10)]
+    self.write(data, max_batch_size=1, max_publishes_in_flight=3)
+    self.assertEqual(sorted(sum(self.api.requests, [])), data)
+    self.assertEqual(self.api.max_in_flight, 3)
+
+  def test_batches_by_ordering_key(self):
+    self.api = _FakePublisherApi(publish_delay_secs=0.02)
+    pubsub.PublisherClient.return_value.api = self.api
+    messages = [
+        PubsubMessage(b'%s%d' % (key, i), {}, key.decode('ascii') or None)
+        for i in range(6) for key in [b'a', b'b', b'']
+    ]
+    self.write(
+        messages,
+        with_attributes=True,
+        max_batch_size=2,
+        max_latency_secs=60,
+        max_publishes_in_flight=4)
+    self.assertEqual(self.api.out_of_order_keys, set())
+    for key in [b'a', b'b']:
+      self.assertEqual(
+          [batch for batch in self.api.requests if batch[0].startswith(key)],
+          [[key + b'0', key + b'1'], [key + b'2', key + b'3'],
+           [key + b'4', key + b'5']])
+    self.assertEqual(
+        sorted(sum(self.api.requests, [])),
+        sorted(message.data for message in messages))
+
+  def test_publish_error(self):
+    self.api = _FakePublisherApi(error=ValueError('publish failed'))
+    pubsub.PublisherClient.return_value.api = self.api
+    with self.assertRaisesRegex(ValueError, 'publish failed'):
+      self.write([b'data'])
+
+  def test_invalid_batch_size(self):
+    with self.assertRaisesRegex(ValueError, 'max_batch_size must be at most'):
+      self.write([], max_batch_size=_PubSubWriteDoFn.MAX_BATCH_SIZE + 1)
+
+  def test_metrics(self):
+    options = PipelineOptions([])
+    options.view_as(StandardOptions).streaming = True
+    p = TestPipeline(options=options)
+    _ = (
+        p
+        | Create([b'%d' % i for i in range(5)])
+        | WriteToPubSub('projects/fakeprj/topics/a_topic', max_batch_size=2))
+    result = p.run()
+    result.wait_until_finish()
+    self.assertEqual(
+        sorted(sum(self.api.requests, [])), [b'%d' % i for i in range(5)])
+
+    published = result.metrics().query(
+        MetricsFilter().with_name('PubSubPublishedMessages'))['counters']
+    self.assertEqual(published[0].committed, 5)
+    latencies = result.metrics().query(
+        MetricsFilter().with_name('PubSubPublishLatencyMs'))['distributions']
+    self.assertEqual(latencies[0].committed.count, len(self.api.requests))
+
+
 if __name__ == '__main__':
   logging.getLogger().setLevel(logging.INFO)
   unittest.main()
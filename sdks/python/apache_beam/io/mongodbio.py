@@ -32,14 +32,21 @@ Example usage::
                              db='testdb',
                              coll='input')
 
+The collection is split into ranges of ``_id``, which are read in parallel.
+The ranges are found by the ``splitVector`` command, or by a ``$bucketAuto``
+aggregation where ``splitVector`` is not available, such as on managed
+services where it is not permitted. Only the documents matching the filter,
+and only the fields of the projection, are sent by the server.
+
 
 Write to MongoDB:
 -----------------
 :class:`WriteToMongoDB` is a ``PTransform`` that writes MongoDB documents to
-configured sink, and the write is conducted through a mongodb bulk_write of
-``ReplaceOne`` operations. If the document's _id field already existed in the
-MongoDB collection, it results in an overwrite, otherwise, a new document
-will be inserted.
+configured sink, and the write is conducted through unordered mongodb
+bulk_writes of ``ReplaceOne`` operations. If the document's _id field already
+existed in the MongoDB collection, it results in an overwrite, otherwise, a new
+document will be inserted. Each instance of the writing ``DoFn`` keeps a single
+``MongoClient``, along with its connection pool, for its lifetime.
 
 Example usage::
 
@@ -59,7 +66,10 @@ from __future__ import division
 
 import json
 import logging
+import math
 import struct
+from collections import OrderedDict
+from concurrent import futures
 
 import apache_beam as beam
 from apache_beam.io import iobase
@@ -76,6 +86,7 @@ try:
   # (https://github.com/py-bson/bson/issues/82). Try to import objectid and if
   # it fails because bson package is installed, MongoDB IO will not work but at
   # least rest of the SDK will work.
+  from bson import BSON
   from bson import objectid
 
   # pymongo also internally depends on bson.
@@ -83,6 +94,7 @@ try:
   from pymongo import DESCENDING
   from pymongo import MongoClient
   from pymongo import ReplaceOne
+  from pymongo.errors import OperationFailure
 except ImportError:
   objectid = None
   _LOGGER.warning("Could not find a compatible bson package.")
@@ -101,7 +113,9 @@ class ReadFromMongoDB(PTransform):
       coll=None,
       filter=None,
       projection=None,
-      extra_client_params=None):
+      extra_client_params=None,
+      bucket_auto=False,
+      cursor_batch_size=None):
     """Initialize a :class:`ReadFromMongoDB`
 
     Args:
@@ -117,6 +131,12 @@ class ReadFromMongoDB(PTransform):
       extra_client_params(dict): Optional `MongoClient
         <https://api.mongodb.com/python/current/api/pymongo/mongo_client.html>`_
         parameters
+      bucket_auto (bool): If True, splits the collection by a ``$bucketAuto``
+        aggregation on ``_id``, which only counts matching documents, rather
+        than by the ``splitVector`` command. Defaults to False, in which case
+        ``$bucketAuto`` is used only if ``splitVector`` fails.
+      cursor_batch_size (int): The number of documents per batch returned by
+        the server when reading. Defaults to the server default.
 
     Returns:
       :class:`~apache_beam.transforms.ptransform.PTransform`
@@ -136,7 +156,9 @@ class ReadFromMongoDB(PTransform):
         coll=coll,
         filter=filter,
         projection=projection,
-        extra_client_params=extra_client_params)
+        extra_client_params=extra_client_params,
+        bucket_auto=bucket_auto,
+        cursor_batch_size=cursor_batch_size)
 
   def expand(self, pcoll):
     return pcoll | iobase.Read(self._mongo_source)
@@ -150,7 +172,9 @@ class _BoundedMongoSource(iobase.BoundedSource):
       coll=None,
       filter=None,
       projection=None,
-      extra_client_params=None):
+      extra_client_params=None,
+      bucket_auto=False,
+      cursor_batch_size=None):
     if extra_client_params is None:
       extra_client_params = {}
     if filter is None:
@@ -161,6 +185,8 @@ class _BoundedMongoSource(iobase.BoundedSource):
     self.filter = filter
     self.projection = projection
     self.spec = extra_client_params
+    self.bucket_auto = bucket_auto
+    self.cursor_batch_size = cursor_batch_size
 
   def estimate_size(self):
     with MongoClient(self.uri, **self.spec) as client:
@@ -199,14 +225,19 @@ class _BoundedMongoSource(iobase.BoundedSource):
     return _ObjectIdRangeTracker(start_position, stop_position)
 
   def read(self, range_tracker):
+    projection, strip_id = self._get_read_projection()
     with MongoClient(self.uri, **self.spec) as client:
-      all_filters = self._merge_id_filter(range_tracker)
-      docs_cursor = client[self.db][self.coll].find(filter=all_filters).sort([
-          ('_id', ASCENDING)
-      ])
+      all_filters = self._merge_id_filter(
+          range_tracker.start_position(), range_tracker.stop_position())
+      docs_cursor = client[self.db][self.coll].find(
+          filter=all_filters,
+          projection=projection,
+          batch_size=self.cursor_batch_size or 0).sort([('_id', ASCENDING)])
       for doc in docs_cursor:
         if not range_tracker.try_claim(doc['_id']):
           return
+        if strip_id:
+          del doc['_id']
         yield doc
 
   def display_data(self):
@@ -217,8 +248,22 @@ class _BoundedMongoSource(iobase.BoundedSource):
     res['filter'] = json.dumps(self.filter)
     res['projection'] = str(self.projection)
     res['mongo_client_spec'] = json.dumps(self.spec)
+    res['bucket_auto'] = self.bucket_auto
+    res['cursor_batch_size'] = str(self.cursor_batch_size)
     return res
 
+  def _get_read_projection(self):
+    # The _id of documents is read in any case, since reads are tracked by
+    # it. Returns the projection to read with, and whether the _id of the
+    # documents read is to be removed. An empty projection reads only the _id,
+    # so None is returned to read all fields instead.
+    if (isinstance(self.projection, dict) and '_id' in self.projection and
+        not self.projection['_id']):
+      projection = dict(self.projection)
+      del projection['_id']
+      return projection or None, True
+    return self.projection, False
+
   def _get_split_keys(self, desired_chunk_size_in_mb, start_pos, end_pos):
     # calls mongodb splitVector command to get document ids at split position
     # for desired bundle size, if desired chunk size smaller than 1mb, use
@@ -228,18 +273,63 @@ class _BoundedMongoSource(iobase.BoundedSource):
     if start_pos >= end_pos:
       # single document not splittable
       return []
+    if self.bucket_auto:
+      return self._get_auto_buckets(
+          desired_chunk_size_in_mb, start_pos, end_pos)
     with MongoClient(self.uri, **self.spec) as client:
       name_space = '%s.%s' % (self.db, self.coll)
-      return (client[self.db].command(
-          'splitVector',
-          name_space,
-          keyPattern={'_id': 1},  # Ascending index
-          min={'_id': start_pos},
-          max={'_id': end_pos},
-          maxChunkSize=desired_chunk_size_in_mb)['splitKeys'])
-
-  def _merge_id_filter(self, range_tracker):
-    # Merge the default filter with refined _id field range of range_tracker.
+      try:
+        return (client[self.db].command(
+            'splitVector',
+            name_space,
+            keyPattern={'_id': 1},  # Ascending index
+            min={'_id': start_pos},
+            max={'_id': end_pos},
+            maxChunkSize=desired_chunk_size_in_mb)['splitKeys'])
+      except OperationFailure as e:
+        # splitVector requires privileges which users of managed deployments
+        # are usually not granted, and is not supported by mongos.
+        _LOGGER.info(
+            'Could not split with splitVector, falling back to $bucketAuto: '
+            '%s',
+            e)
+    return self._get_auto_buckets(desired_chunk_size_in_mb, start_pos, end_pos)
+
+  def _get_auto_buckets(self, desired_chunk_size_in_mb, start_pos, end_pos):
+    # Splits the documents matching the filter in the range in buckets of about
+    # the same number of documents, by a $bucketAuto aggregation on _id. The
+    # number of buckets is that of chunks of the desired size in the estimated
+    # size of the documents.
+    # see more at
+    # https://docs.mongodb.com/manual/reference/operator/aggregation/bucketAuto/
+    all_filters = self._merge_id_filter(start_pos, end_pos)
+    with MongoClient(self.uri, **self.spec) as client:
+      avg_doc_size = client[self.db].command('collstats',
+                                             self.coll).get('avgObjSize', 0)
+      doc_count = client[self.db][self.coll].count_documents(all_filters)
+      bucket_count = int(
+          math.ceil(
+              avg_doc_size * doc_count / (desired_chunk_size_in_mb << 20)))
+      if bucket_count < 2:
+        return []
+      pipeline = [
+          {
+              '$match': all_filters
+          },
+          {
+              '$bucketAuto': {
+                  'groupBy': '$_id', 'buckets': bucket_count
+              }
+          },
+      ]
+      buckets = list(
+          client[self.db][self.coll].aggregate(pipeline, allowDiskUse=True))
+    # The lower bounds of the buckets but the first are the split keys, in the
+    # format of those returned by splitVector.
+    return [{'_id': bucket['_id']['min']} for bucket in buckets[1:]]
+
+  def _merge_id_filter(self, start_position, stop_position):
+    # Merge the default filter with refined _id field range.
     # see more at https://docs.mongodb.com/manual/reference/operator/query/and/
     all_filters = {
         '$and': [
@@ -251,8 +341,7 @@ class _BoundedMongoSource(iobase.BoundedSource):
             # https://docs.mongodb.com/manual/reference/operator/query/lt/
             {
                 '_id': {
-                    '$gte': range_tracker.start_position(),
-                    '$lt': range_tracker.stop_position()
+                    '$gte': start_position, '$lt': stop_position
                 }
             },
         ]
@@ -389,7 +478,9 @@ class WriteToMongoDB(PTransform):
       db=None,
       coll=None,
       batch_size=100,
-      extra_client_params=None):
+      extra_client_params=None,
+      max_batch_size_bytes=None,
+      max_writes_in_flight=1):
     """
 
     Args:
@@ -401,6 +492,11 @@ class WriteToMongoDB(PTransform):
       extra_client_params(dict): Optional `MongoClient
        <https://api.mongodb.com/python/current/api/pymongo/mongo_client.html>`_
        parameters as keyword arguments
+      max_batch_size_bytes(int): Maximum BSON size of the documents of a
+        bulk_write, default to 16MB
+      max_writes_in_flight(int): Maximum number of concurrent bulk_writes of
+        each worker thread, default to 1, in which case documents are written
+        synchronously
 
     Returns:
       :class:`~apache_beam.transforms.ptransform.PTransform`
@@ -414,18 +510,25 @@ class WriteToMongoDB(PTransform):
       raise ValueError(
           'WriteToMongoDB coll param must be specified as a '
           'string')
+    if max_writes_in_flight < 1:
+      raise ValueError(
+          'WriteToMongoDB max_writes_in_flight param must be positive')
     self._uri = uri
     self._db = db
     self._coll = coll
     self._batch_size = batch_size
     self._spec = extra_client_params
+    self._max_batch_size_bytes = max_batch_size_bytes
+    self._max_writes_in_flight = max_writes_in_flight
 
   def expand(self, pcoll):
     return pcoll \
            | beam.ParDo(_GenerateObjectIdFn()) \
            | Reshuffle() \
            | beam.ParDo(_WriteMongoFn(self._uri, self._db, self._coll,
-                                      self._batch_size, self._spec))
+                                      self._batch_size, self._spec,
+                                      self._max_batch_size_bytes,
+                                      self._max_writes_in_flight))
 
 
 class _GenerateObjectIdFn(DoFn):
@@ -445,8 +548,19 @@ class _GenerateObjectIdFn(DoFn):
 
 
 class _WriteMongoFn(DoFn):
+  # The maximum size of a BSON document is 16MB, hence a batch holds at least
+  # one document of any size.
+  DEFAULT_MAX_BATCH_SIZE_BYTES = 16 << 20
+
   def __init__(
-      self, uri=None, db=None, coll=None, batch_size=100, extra_params=None):
+      self,
+      uri=None,
+      db=None,
+      coll=None,
+      batch_size=100,
+      extra_params=None,
+      max_batch_size_bytes=None,
+      max_writes_in_flight=1):
     if extra_params is None:
       extra_params = {}
     self.uri = uri
@@ -454,22 +568,74 @@ class _WriteMongoFn(DoFn):
     self.coll = coll
     self.spec = extra_params
     self.batch_size = batch_size
+    self.max_batch_size_bytes = (
+        max_batch_size_bytes or _WriteMongoFn.DEFAULT_MAX_BATCH_SIZE_BYTES)
+    self.max_writes_in_flight = max_writes_in_flight
+    self.batch = []
+    self.batch_bytes = 0
+    self._sink = None
+    self._write_executor = None
+    self._pending_writes = []
+
+  def setup(self):
+    # MongoClient is thread safe and pools its connections, hence a single
+    # client serves every bundle and concurrent write of this DoFn.
+    self._sink = _MongoSink(self.uri, self.db, self.coll, self.spec)
+    self._sink.open()
+    if self.max_writes_in_flight > 1:
+      self._write_executor = futures.ThreadPoolExecutor(
+          max_workers=self.max_writes_in_flight)
+
+  def start_bundle(self):
     self.batch = []
+    self.batch_bytes = 0
+    # Writes may be left in flight by a bundle that failed.
+    futures.wait(self._pending_writes)
+    self._pending_writes = []
 
   def finish_bundle(self):
     self._flush()
+    self._wait_for_writes(futures.ALL_COMPLETED)
 
   def process(self, element, *args, **kwargs):
     self.batch.append(element)
-    if len(self.batch) >= self.batch_size:
+    self.batch_bytes += len(BSON.encode(element))
+    if (len(self.batch) >= self.batch_size or
+        self.batch_bytes >= self.max_batch_size_bytes):
       self._flush()
 
+  def teardown(self):
+    if self._write_executor is not None:
+      self._write_executor.shutdown()
+      self._write_executor = None
+    if self._sink is not None:
+      self._sink.close()
+      self._sink = None
+
   def _flush(self):
     if len(self.batch) == 0:
       return
-    with _MongoSink(self.uri, self.db, self.coll, self.spec) as sink:
-      sink.write(self.batch)
-      self.batch = []
+    batch = self.batch
+    self.batch = []
+    self.batch_bytes = 0
+    if self._write_executor is None:
+      self._sink.write(batch)
+      return
+    if len(self._pending_writes) >= self.max_writes_in_flight:
+      self._wait_for_writes(futures.FIRST_COMPLETED)
+    self._pending_writes.append(
+        self._write_executor.submit(self._sink.write, batch))
+
+  def _wait_for_writes(self, return_when):
+    futures.wait(self._pending_writes, return_when=return_when)
+    pending_writes = []
+    for write in self._pending_writes:
+      if write.done():
+        # Raises the error of a failed write.
+        write.result()
+      else:
+        pending_writes.append(write)
+    self._pending_writes = pending_writes
 
   def display_data(self):
     res = super(_WriteMongoFn, self).display_data()
@@ -478,6 +644,8 @@ class _WriteMongoFn(DoFn):
     res['collection'] = self.coll
     res['mongo_client_params'] = json.dumps(self.spec)
     res['batch_size'] = self.batch_size
+    res['max_batch_size_bytes'] = self.max_batch_size_bytes
+    res['max_writes_in_flight'] = self.max_writes_in_flight
     return res
 
 
@@ -491,9 +659,28 @@ class _MongoSink(object):
     self.spec = extra_params
     self.client = None
 
-  def write(self, documents):
+  def open(self):
     if self.client is None:
       self.client = MongoClient(host=self.uri, **self.spec)
+
+  def close(self):
+    if self.client is not None:
+      self.client.close()
+      self.client = None
+
+  def write(self, documents):
+    self.open()
+    documents = list(documents)
+    try:
+      # Only the last write of each _id is kept, so that the remaining writes
+      # are independent and the server may apply them in any order.
+      documents = list(
+          OrderedDict(
+              (doc.get('_id', None), doc) for doc in documents).values())
+      ordered = False
+    except TypeError:
+      # Ids such as embedded documents are not hashable, write them in order.
+      ordered = True
     requests = []
     for doc in documents:
       # match document based on _id field, if not found in current collection,
@@ -503,7 +690,7 @@ class _MongoSink(object):
               filter={'_id': doc.get('_id', None)},
               replacement=doc,
               upsert=True))
-    resp = self.client[self.db][self.coll].bulk_write(requests)
+    resp = self.client[self.db][self.coll].bulk_write(requests, ordered=ordered)
     _LOGGER.debug(
         'BulkWrite to MongoDB result in nModified:%d, nUpserted:%d, '
         'nMatched:%d, Errors:%s' % (
@@ -513,10 +700,8 @@ class _MongoSink(object):
             resp.bulk_api_result.get('writeErrors')))
 
   def __enter__(self):
-    if self.client is None:
-      self.client = MongoClient(host=self.uri, **self.spec)
+    self.open()
     return self
 
   def __exit__(self, exc_type, exc_val, exc_tb):
-    if self.client is not None:
-      self.client.close()
+    self.close()
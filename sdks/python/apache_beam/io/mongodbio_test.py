@@ -21,8 +21,11 @@ from __future__ import division
 
 import datetime
 import logging
+import math
 import random
 import sys
+import threading
+import time
 import unittest
 from unittest import TestCase
 
@@ -30,6 +33,7 @@ import mock
 from bson import objectid
 from pymongo import ASCENDING
 from pymongo import ReplaceOne
+from pymongo.errors import OperationFailure
 
 import apache_beam as beam
 from apache_beam.io import ReadFromMongoDB
@@ -69,8 +73,26 @@ class _MockMongoColl(object):
       match.append(doc)
     return match
 
-  def find(self, filter=None, **kwargs):
-    return _MockMongoColl(self._filter(filter))
+  def _project(self, docs, projection):
+    if projection is None:
+      return docs
+    if isinstance(projection, list):
+      projection = {field: True for field in projection}
+    if not projection:
+      # Like pymongo, which reads only the _id of documents then.
+      projection = {'_id': True}
+    if all(projection.values()):
+      projection.setdefault('_id', True)
+      return [{k: v for k, v in doc.items() if k in projection} for doc in docs]
+    return [{k: v
+             for k, v in doc.items() if projection.get(k, True)}
+            for doc in docs]
+
+  def find(self, filter=None, projection=None, **kwargs):
+    docs = self._filter(filter)
+    if projection is not None:
+      docs = self._project(list(docs), projection)
+    return _MockMongoColl(docs)
 
   def sort(self, sort_items):
     key, order = sort_items[0]
@@ -84,22 +106,40 @@ class _MockMongoColl(object):
   def count_documents(self, filter):
     return len(self._filter(filter))
 
+  def aggregate(self, pipeline, **kwargs):
+    # simulate a $match stage followed by a $bucketAuto stage on _id.
+    match, bucket_auto = pipeline
+    docs = self._filter(match['$match'])
+    bucket_count = bucket_auto['$bucketAuto']['buckets']
+    bucket_size = int(math.ceil(len(docs) / bucket_count))
+    return [{
+        '_id': {
+            'min': docs[i]['_id'],
+            'max': docs[min(i + bucket_size, len(docs)) - 1]['_id']
+        },
+        'count': len(docs[i:i + bucket_size])
+    } for i in range(0, len(docs), bucket_size)]
+
   def __getitem__(self, index):
     return self.docs[index]
 
 
 class _MockMongoDb(object):
   """Fake Mongo Db."""
-  def __init__(self, docs):
+  def __init__(self, docs, split_vector=True):
     self.docs = docs
+    self.split_vector = split_vector
 
   def __getitem__(self, coll_name):
     return _MockMongoColl(self.docs)
 
   def command(self, command, *args, **kwargs):
     if command == 'collstats':
-      return {'size': 5, 'avgSize': 1}
+      # every doc is considered 1Mb in size.
+      return {'size': 5, 'avgSize': 1, 'avgObjSize': 1024 * 1024}
     elif command == 'splitVector':
+      if not self.split_vector:
+        raise OperationFailure('not authorized to execute command splitVector')
       return self.get_split_keys(command, *args, **kwargs)
 
   def get_split_keys(self, command, ns, min, max, maxChunkSize, **kwargs):
@@ -130,11 +170,12 @@ class _MockMongoDb(object):
 
 
 class _MockMongoClient(object):
-  def __init__(self, docs):
+  def __init__(self, docs, split_vector=True):
     self.docs = docs
+    self.split_vector = split_vector
 
   def __getitem__(self, db_name):
-    return _MockMongoDb(self.docs)
+    return _MockMongoDb(self.docs, self.split_vector)
 
   def __enter__(self):
     return self
@@ -143,6 +184,41 @@ class _MockMongoClient(object):
     pass
 
 
+class _FakeWriteColl(object):
+  """Fake mongodb collection, which records the ids of bulk writes."""
+  def __init__(self, latency_secs=0):
+    self.latency_secs = latency_secs
+    self.batches = []
+    self.writes_in_flight = 0
+    self.max_writes_in_flight = 0
+    self._lock = threading.Lock()
+
+  def bulk_write(self, requests, ordered=True):
+    assert not ordered
+    with self._lock:
+      self.writes_in_flight += 1
+      self.max_writes_in_flight = max(
+          self.max_writes_in_flight, self.writes_in_flight)
+    time.sleep(self.latency_secs)
+    with self._lock:
+      self.writes_in_flight -= 1
+      self.batches.append([r._filter['_id'] for r in requests])
+    return mock.MagicMock()
+
+
+class _FakeWriteClient(object):
+  def __init__(self, coll):
+    self.coll = coll
+
+  def __getitem__(self, db_name):
+    db = mock.MagicMock()
+    db.__getitem__.return_value = self.coll
+    return db
+
+  def close(self):
+    pass
+
+
 class MongoSourceTest(unittest.TestCase):
   @mock.patch('apache_beam.io.mongodbio.MongoClient')
   def setUp(self, mock_client):
@@ -179,6 +255,45 @@ class MongoSourceTest(unittest.TestCase):
       source_test_utils.assert_sources_equal_reference_source(
           reference_info, sources_info)
 
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_split_with_bucket_auto(self, mock_client):
+    # splitVector is not available, or bucket_auto is requested.
+    for split_vector, bucket_auto in [(False, False), (True, True)]:
+      mock_client.return_value = _MockMongoClient(self._docs, split_vector)
+      source = _BoundedMongoSource(
+          'mongodb://test', 'testdb', 'testcoll', bucket_auto=bucket_auto)
+      for size, expected_splits in [(1, 5), (2, 3), (10, 1)]:
+        splits = list(
+            source.split(
+                start_position=None,
+                stop_position=None,
+                desired_bundle_size=size * 1024 * 1024))
+        self.assertEqual(len(splits), expected_splits)
+
+        reference_info = (source, None, None)
+        sources_info = ([
+            (split.source, split.start_position, split.stop_position)
+            for split in splits
+        ])
+        source_test_utils.assert_sources_equal_reference_source(
+            reference_info, sources_info)
+
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_split_with_bucket_auto_counts_filtered_docs(self, mock_client):
+    mock_client.return_value = _MockMongoClient(self._docs)
+    source = _BoundedMongoSource(
+        'mongodb://test', 'testdb', 'testcoll', bucket_auto=True)
+    # Only the documents in the range are split.
+    splits = list(
+        source.split(
+            start_position=self._ids[0],
+            stop_position=self._ids[2],
+            desired_bundle_size=1024 * 1024))
+    self.assertEqual([(self._ids[0], self._ids[1]),
+                      (self._ids[1], self._ids[2])],
+                     [(split.start_position, split.stop_position)
+                      for split in splits])
+
   @mock.patch('apache_beam.io.mongodbio.MongoClient')
   def test_dynamic_work_rebalancing(self, mock_client):
     mock_client.return_value = _MockMongoClient(self._docs)
@@ -236,6 +351,45 @@ class MongoSourceTest(unittest.TestCase):
       result = list(self.mongo_source.read(mock_tracker))
       self.assertListEqual(case['expected'], result)
 
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_read_with_projection(self, mock_client):
+    mock_tracker = mock.MagicMock()
+    mock_tracker.start_position.return_value = self._ids[0]
+    mock_tracker.stop_position.return_value = self._ids[2]
+    docs = [{'_id': doc['_id'], 'x': doc['x'], 'y': 0} for doc in self._docs]
+    mock_client.return_value = _MockMongoClient(docs)
+    test_cases = [
+        (['x'], [{
+            '_id': self._ids[i], 'x': i
+        } for i in range(2)]),
+        ({
+            '_id': False, 'x': True
+        }, [{
+            'x': i
+        } for i in range(2)]),
+        ({
+            '_id': 0
+        }, [{
+            'x': i, 'y': 0
+        } for i in range(2)]),
+    ]
+    for projection, expected in test_cases:
+      source = _BoundedMongoSource(
+          'mongodb://test', 'testdb', 'testcoll', projection=projection)
+      self.assertListEqual(expected, list(source.read(mock_tracker)))
+
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_read_with_cursor_batch_size(self, mock_client):
+    mock_tracker = mock.MagicMock()
+    mock_tracker.start_position.return_value = self._ids[0]
+    mock_tracker.stop_position.return_value = self._ids[2]
+    source = _BoundedMongoSource(
+        'mongodb://test', 'testdb', 'testcoll', cursor_batch_size=500)
+    list(source.read(mock_tracker))
+    mock_client.return_value.__enter__.return_value.__getitem__.return_value.\
+      __getitem__.return_value.find.assert_called_once_with(
+          filter=mock.ANY, projection=None, batch_size=500)
+
   def test_display_data(self):
     data = self.mongo_source.display_data()
     self.assertTrue('uri' in data)
@@ -279,8 +433,64 @@ class WriteMongoFnTest(unittest.TestCase):
           | "Write" >> beam.ParDo(_WriteMongoFn(batch_size=2)))
       p.run()
 
-      self.assertEqual(
-          2, mock_sink.return_value.__enter__.return_value.write.call_count)
+      self.assertEqual(2, mock_sink.return_value.write.call_count)
+
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_client_persists_across_bundles(self, mock_client):
+    fn = _WriteMongoFn(uri='test', db='test', coll='test', batch_size=2)
+    fn.setup()
+    for bundle in range(3):
+      fn.start_bundle()
+      for x in range(3):
+        fn.process({'_id': bundle * 3 + x})
+      fn.finish_bundle()
+    self.assertEqual(1, mock_client.call_count)
+    self.assertFalse(mock_client.return_value.close.called)
+    fn.teardown()
+    mock_client.return_value.close.assert_called_once_with()
+
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_batches_are_sized_by_bytes(self, mock_client):
+    coll = _FakeWriteColl()
+    mock_client.return_value = _FakeWriteClient(coll)
+    docs = [{'_id': i, 'x': 'x' * 1000} for i in range(5)]
+    fn = _WriteMongoFn(batch_size=100, max_batch_size_bytes=2000)
+    fn.setup()
+    fn.start_bundle()
+    for doc in docs:
+      fn.process(doc)
+    fn.finish_bundle()
+    fn.teardown()
+    self.assertEqual([[0, 1], [2, 3], [4]], coll.batches)
+
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_concurrent_writes(self, mock_client):
+    coll = _FakeWriteColl(latency_secs=0.05)
+    mock_client.return_value = _FakeWriteClient(coll)
+    fn = _WriteMongoFn(batch_size=1, max_writes_in_flight=3)
+    fn.setup()
+    fn.start_bundle()
+    for i in range(12):
+      fn.process({'_id': i})
+    fn.finish_bundle()
+    # All the writes of the bundle complete before it finishes.
+    self.assertEqual(
+        list(range(12)), sorted(batch[0] for batch in coll.batches))
+    self.assertGreater(coll.max_writes_in_flight, 1)
+    self.assertLessEqual(coll.max_writes_in_flight, 3)
+    fn.teardown()
+
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_concurrent_write_errors_are_raised(self, mock_client):
+    mock_client.return_value.__getitem__.return_value.__getitem__. \
+      return_value.bulk_write.side_effect = ValueError('write failed')
+    fn = _WriteMongoFn(batch_size=1, max_writes_in_flight=2)
+    fn.setup()
+    fn.start_bundle()
+    fn.process({'_id': 1})
+    with self.assertRaisesRegex(ValueError, 'write failed'):
+      fn.finish_bundle()
+    fn.teardown()
 
   def test_display_data(self):
     data = _WriteMongoFn(batch_size=10).display_data()
@@ -296,6 +506,26 @@ class MongoSinkTest(unittest.TestCase):
         mock_client.return_value.__getitem__.return_value.__getitem__.
         return_value.bulk_write.called)
 
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_write_duplicate_ids(self, mock_client):
+    docs = [{'_id': 1, 'x': 1}, {'_id': 2, 'x': 2}, {'_id': 1, 'x': 3}]
+    _MongoSink(uri='test', db='test', coll='test').write(docs)
+    mock_client.return_value.__getitem__.return_value.__getitem__. \
+      return_value.bulk_write.assert_called_with([
+          ReplaceOne({'_id': 1}, {'_id': 1, 'x': 3}, True, None),
+          ReplaceOne({'_id': 2}, {'_id': 2, 'x': 2}, True, None)
+      ], ordered=False)
+
+  @mock.patch('apache_beam.io.mongodbio.MongoClient')
+  def test_write_unhashable_ids(self, mock_client):
+    docs = [{'_id': {'a': 1}, 'x': 1}, {'_id': {'a': 1}, 'x': 2}]
+    _MongoSink(uri='test', db='test', coll='test').write(docs)
+    mock_client.return_value.__getitem__.return_value.__getitem__. \
+      return_value.bulk_write.assert_called_with([
+          ReplaceOne({'_id': {'a': 1}}, {'_id': {'a': 1}, 'x': 1}, True, None),
+          ReplaceOne({'_id': {'a': 1}}, {'_id': {'a': 1}, 'x': 2}, True, None)
+      ], ordered=True)
+
 
 class WriteToMongoDBTest(unittest.TestCase):
   @mock.patch('apache_beam.io.mongodbio.MongoClient')
@@ -309,7 +539,8 @@ class WriteToMongoDBTest(unittest.TestCase):
           | "Write" >> WriteToMongoDB(db='test', coll='test'))
       p.run()
       mock_client.return_value.__getitem__.return_value.__getitem__. \
-        return_value.bulk_write.assert_called_with(expected_update)
+        return_value.bulk_write.assert_called_with(
+          expected_update, ordered=False)
 
   @mock.patch('apache_beam.io.mongodbio.MongoClient')
   def test_write_to_mongodb_with_generated_id(self, mock_client):
@@ -325,7 +556,8 @@ class WriteToMongoDBTest(unittest.TestCase):
           | "Write" >> WriteToMongoDB(db='test', coll='test'))
       p.run()
       mock_client.return_value.__getitem__.return_value.__getitem__. \
-        return_value.bulk_write.assert_called_with(expected_update)
+        return_value.bulk_write.assert_called_with(
+          expected_update, ordered=False)
 
 
 class ObjectIdHelperTest(TestCase):
@@ -37,6 +37,7 @@ from apache_beam.metrics.cells import GaugeData
 from apache_beam.metrics.cells import GaugeResult
 from apache_beam.portability import common_urns
 from apache_beam.portability.api import metrics_pb2
+from apache_beam.utils.histogram import LogLinearHistogram
 
 SAMPLED_BYTE_SIZE_URN = (
     common_urns.monitoring_info_specs.SAMPLED_BYTE_SIZE.spec.urn)
@@ -63,9 +64,13 @@ DISTRIBUTION_INT64_TYPE = (
 LATEST_INT64_TYPE = common_urns.monitoring_info_types.LATEST_INT64_TYPE.urn
 LATEST_DOUBLES_TYPE = common_urns.monitoring_info_types.LATEST_DOUBLES_TYPE.urn
 
+# Not a standard type, the payload is an encoded LogLinearHistogram.
+HISTOGRAM_INT64_TYPE = 'beam:metrics:histogram_int_64'
+
 COUNTER_TYPES = set([SUM_INT64_TYPE])
 DISTRIBUTION_TYPES = set([DISTRIBUTION_INT64_TYPE])
 GAUGE_TYPES = set([LATEST_INT64_TYPE])
+HISTOGRAM_TYPES = set([HISTOGRAM_INT64_TYPE])
 
 # TODO(migryz) extract values from beam_fn_api.proto::MonitoringInfoLabels
 PCOLLECTION_LABEL = (
@@ -116,6 +121,17 @@ def extract_distribution(monitoring_info_proto):
   return None
 
 
+def extract_histogram(monitoring_info_proto):
+  """Returns the LogLinearHistogram of the monitoring info.
+
+  Args:
+    monitoring_info_proto: The monitoring info for the histogram.
+  """
+  if is_histogram(monitoring_info_proto):
+    return LogLinearHistogram.decode(monitoring_info_proto.payload)
+  return None
+
+
 def create_labels(ptransform=None, tag=None, namespace=None, name=None):
   """Create the label dictionary based on the provided tags.
 
@@ -241,6 +257,23 @@ def int64_gauge(urn, metric, ptransform=None, tag=None):
   return create_monitoring_info(urn, LATEST_INT64_TYPE, metric, labels)
 
 
+def int64_histogram(urn, histogram, ptransform=None, tag=None):
+  """Return the histogram monitoring info for the URN, histogram and labels.
+
+  Args:
+    urn: The URN of the monitoring info/metric.
+    histogram: The LogLinearHistogram to use in the monitoring info.
+    ptransform: The ptransform/step name used as a label.
+    tag: The output tag name, used as a label.
+  """
+  return metrics_pb2.MonitoringInfo(
+      urn=urn,
+      type=HISTOGRAM_INT64_TYPE,
+      labels=create_labels(ptransform=ptransform, tag=tag),
+      payload=histogram.encode(),
+      timestamp=to_timestamp_proto(time.time()))
+
+
 def create_monitoring_info(urn, type_urn, metric_proto, labels=None):
   # type: (...) -> metrics_pb2.MonitoringInfo
 
@@ -277,6 +310,11 @@ def is_gauge(monitoring_info_proto):
   return monitoring_info_proto.type in GAUGE_TYPES
 
 
+def is_histogram(monitoring_info_proto):
+  """Returns true if the monitoring info is a histogram metric."""
+  return monitoring_info_proto.type in HISTOGRAM_TYPES
+
+
 def _is_user_monitoring_info(monitoring_info_proto):
   return monitoring_info_proto.urn == USER_COUNTER_URN
 
@@ -369,6 +407,18 @@ _KNOWN_COMBINERS = {
 }
 
 
+def histogram_merge(a, b):
+  histogram = extract_histogram(a)
+  histogram.merge(extract_histogram(b))
+  return metrics_pb2.MonitoringInfo(
+      urn=a.urn,
+      type=a.type,
+      labels=dict((label, value) for label,
+                  value in a.labels.items() if b.labels.get(label) == value),
+      payload=histogram.encode(),
+      timestamp=max_timestamp(a.timestamp, b.timestamp))
+
+
 def max_timestamp(a, b):
   if a.ToNanoseconds() > b.ToNanoseconds():
     return a
@@ -399,6 +449,8 @@ def consolidate(metrics, key=to_key):
               timestamp=max_timestamp(a.timestamp, b.timestamp))
 
         yield reduce(merge, values)
+      elif is_histogram(values[0]):
+        yield reduce(histogram_merge, values)
       else:
         for value in values:
           yield value
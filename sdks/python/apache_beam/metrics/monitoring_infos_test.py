@@ -21,6 +21,7 @@ from __future__ import absolute_import
 import unittest
 
 from apache_beam.metrics import monitoring_infos
+from apache_beam.utils.histogram import LogLinearHistogram
 
 
 class MonitoringInfosTest(unittest.TestCase):
@@ -53,6 +54,23 @@ class MonitoringInfosTest(unittest.TestCase):
     self.assertEqual(namespace, "counternamespace")
     self.assertEqual(name, "countername")
 
+  def test_consolidate_histograms(self):
+    a = LogLinearHistogram()
+    a.add(10)
+    b = LogLinearHistogram()
+    b.add(1000)
+    infos = [
+        monitoring_infos.int64_histogram('urn', a, ptransform='t1'),
+        monitoring_infos.int64_histogram('urn', b, ptransform='t1'),
+        monitoring_infos.int64_histogram('urn', b, ptransform='t2'),
+    ]
+    consolidated = dict((
+        mi.labels[monitoring_infos.PTRANSFORM_LABEL],
+        monitoring_infos.extract_histogram(mi))
+                        for mi in monitoring_infos.consolidate(infos))
+    a.merge(b)
+    self.assertEqual(consolidated, {'t1': a, 't2': b})
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -859,6 +859,33 @@ class ProfilingOptions(PipelineOptions):
         default=1.0,
         help='A number between 0 and 1 indicating the ratio '
         'of bundles that should be profiled.')
+    parser.add_argument(
+        '--profile_stacks',
+        action='store_true',
+        help='Enable continuous sampling of the stacks of the worker threads, '
+        'attributed to the steps they execute. The sampled stacks are '
+        'reported in the worker status and saved to profile_location.')
+    parser.add_argument(
+        '--profile_stacks_sampling_period_ms',
+        type=int,
+        default=10,
+        help='The time between two samples of the worker stacks.')
+    parser.add_argument(
+        '--profile_step_memory',
+        action='store_true',
+        help='Enable tracing the memory allocations of the worker with '
+        'tracemalloc, to report an estimate of the memory held by each step '
+        'and the top allocation sites. Only available in Python 3.')
+    parser.add_argument(
+        '--profile_process_latency',
+        action='store_true',
+        help='Enable timing a sample of the calls to process of each ParDo, '
+        'to report histograms of their latencies.')
+    parser.add_argument(
+        '--profile_process_latency_sampling_period',
+        type=int,
+        default=100,
+        help='Time about one in this many calls to process.')
 
 
 class SetupOptions(PipelineOptions):
@@ -1015,6 +1042,15 @@ class PortableOptions(PipelineOptions):
         help=(
             'Create an executable jar at this path rather than running '
             'the pipeline.'))
+    parser.add_argument(
+        '--skip_staged_artifacts',
+        default=False,
+        action='store_true',
+        help=(
+            'Do not upload again the artifacts staged by previous submissions '
+            'to the same artifact endpoint. Requires an artifact service that '
+            'resolves the artifacts by their hash, such as the one of the '
+            'Python job server.'))
 
 
 class JobServerOptions(PipelineOptions):
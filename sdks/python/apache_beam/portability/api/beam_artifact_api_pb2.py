@@ -0,0 +1,696 @@
+from __future__ import absolute_import
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_artifact_api.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='beam_artifact_api.proto',
+  package='org.apache.beam.model.job_management.v1',
+  syntax='proto3',
+  serialized_pb=_b('\n\x17\x62\x65\x61m_artifact_api.proto\x12\'org.apache.beam.model.job_management.v1\x1a\x15\x62\x65\x61m_runner_api.proto\"E\n\x10\x41rtifactMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0bpermissions\x18\x02 \x01(\r\x12\x0e\n\x06sha256\x18\x04 \x01(\t\"W\n\x08Manifest\x12K\n\x08\x61rtifact\x18\x01 \x03(\x0b\x32\x39.org.apache.beam.model.job_management.v1.ArtifactMetadata\"\xce\x01\n\rProxyManifest\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\x12Q\n\x08location\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.job_management.v1.ProxyManifest.Location\x1a%\n\x08Location\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03uri\x18\x02 \x01(\t\"-\n\x12GetManifestRequest\x12\x17\n\x0fretrieval_token\x18\x01 \x01(\t\"Z\n\x13GetManifestResponse\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\";\n\x12GetArtifactRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x17\n\x0fretrieval_token\x18\x02 \x01(\t\"\x1d\n\rArtifactChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x81\x01\n\x13PutArtifactMetadata\x12\x1d\n\x15staging_session_token\x18\x01 \x01(\t\x12K\n\x08metadata\x18\x02 \x01(\x0b\x32\x39.org.apache.beam.model.job_management.v1.ArtifactMetadata\"\xb9\x01\n\x12PutArtifactRequest\x12P\n\x08metadata\x18\x01 \x01(\x0b\x32<.org.apache.beam.model.job_management.v1.PutArtifactMetadataH\x00\x12\x46\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x36.org.apache.beam.model.job_management.v1.ArtifactChunkH\x00\x42\t\n\x07\x63ontent\"\x15\n\x13PutArtifactResponse\"{\n\x15\x43ommitManifestRequest\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\x12\x1d\n\x15staging_session_token\x18\x02 \x01(\t\"|\n\x16\x43ommitManifestResponse\x12\x17\n\x0fretrieval_token\x18\x01 \x01(\t\"I\n\tConstants\x12<\n\x19NO_ARTIFACTS_STAGED_TOKEN\x10\x00\x1a\x1d\xaa\xb4\xfa\xc2\x05\x17__no_artifacts_staged__2\xb9\x02\n\x16\x41rtifactStagingService\x12\x8a\x01\n\x0bPutArtifact\x12;.org.apache.beam.model.job_management.v1.PutArtifactRequest\x1a<.org.apache.beam.model.job_management.v1.PutArtifactResponse(\x01\x12\x91\x01\n\x0e\x43ommitManifest\x12>.org.apache.beam.model.job_management.v1.CommitManifestRequest\x1a?.org.apache.beam.model.job_management.v1.CommitManifestResponse2\xac\x02\n\x18\x41rtifactRetrievalService\x12\x88\x01\n\x0bGetManifest\x12;.org.apache.beam.model.job_management.v1.GetManifestRequest\x1a<.org.apache.beam.model.job_management.v1.GetManifestResponse\x12\x84\x01\n\x0bGetArtifact\x12;.org.apache.beam.model.job_management.v1.GetArtifactRequest\x1a\x36.org.apache.beam.model.job_management.v1.ArtifactChunk0\x01\x42G\n&org.apache.beam.model.jobmanagement.v1B\x0b\x41rtifactApiZ\x10jobmanagement_v1b\x06proto3')
+  ,
+  dependencies=[beam__runner__api__pb2.DESCRIPTOR,])
+
+
+
+_COMMITMANIFESTRESPONSE_CONSTANTS = _descriptor.EnumDescriptor(
+  name='Constants',
+  full_name='org.apache.beam.model.job_management.v1.CommitManifestResponse.Constants',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='NO_ARTIFACTS_STAGED_TOKEN', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\252\264\372\302\005\027__no_artifacts_staged__')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1210,
+  serialized_end=1283,
+)
+_sym_db.RegisterEnumDescriptor(_COMMITMANIFESTRESPONSE_CONSTANTS)
+
+
+_ARTIFACTMETADATA = _descriptor.Descriptor(
+  name='ArtifactMetadata',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactMetadata',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.job_management.v1.ArtifactMetadata.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='permissions', full_name='org.apache.beam.model.job_management.v1.ArtifactMetadata.permissions', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sha256', full_name='org.apache.beam.model.job_management.v1.ArtifactMetadata.sha256', index=2,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=91,
+  serialized_end=160,
+)
+
+
+_MANIFEST = _descriptor.Descriptor(
+  name='Manifest',
+  full_name='org.apache.beam.model.job_management.v1.Manifest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifact', full_name='org.apache.beam.model.job_management.v1.Manifest.artifact', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=162,
+  serialized_end=249,
+)
+
+
+_PROXYMANIFEST_LOCATION = _descriptor.Descriptor(
+  name='Location',
+  full_name='org.apache.beam.model.job_management.v1.ProxyManifest.Location',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.job_management.v1.ProxyManifest.Location.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='uri', full_name='org.apache.beam.model.job_management.v1.ProxyManifest.Location.uri', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=421,
+  serialized_end=458,
+)
+
+_PROXYMANIFEST = _descriptor.Descriptor(
+  name='ProxyManifest',
+  full_name='org.apache.beam.model.job_management.v1.ProxyManifest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='manifest', full_name='org.apache.beam.model.job_management.v1.ProxyManifest.manifest', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='location', full_name='org.apache.beam.model.job_management.v1.ProxyManifest.location', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROXYMANIFEST_LOCATION, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=252,
+  serialized_end=458,
+)
+
+
+_GETMANIFESTREQUEST = _descriptor.Descriptor(
+  name='GetManifestRequest',
+  full_name='org.apache.beam.model.job_management.v1.GetManifestRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='retrieval_token', full_name='org.apache.beam.model.job_management.v1.GetManifestRequest.retrieval_token', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=460,
+  serialized_end=505,
+)
+
+
+_GETMANIFESTRESPONSE = _descriptor.Descriptor(
+  name='GetManifestResponse',
+  full_name='org.apache.beam.model.job_management.v1.GetManifestResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='manifest', full_name='org.apache.beam.model.job_management.v1.GetManifestResponse.manifest', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=507,
+  serialized_end=597,
+)
+
+
+_GETARTIFACTREQUEST = _descriptor.Descriptor(
+  name='GetArtifactRequest',
+  full_name='org.apache.beam.model.job_management.v1.GetArtifactRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.job_management.v1.GetArtifactRequest.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='retrieval_token', full_name='org.apache.beam.model.job_management.v1.GetArtifactRequest.retrieval_token', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=599,
+  serialized_end=658,
+)
+
+
+_ARTIFACTCHUNK = _descriptor.Descriptor(
+  name='ArtifactChunk',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactChunk',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.job_management.v1.ArtifactChunk.data', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=660,
+  serialized_end=689,
+)
+
+
+_PUTARTIFACTMETADATA = _descriptor.Descriptor(
+  name='PutArtifactMetadata',
+  full_name='org.apache.beam.model.job_management.v1.PutArtifactMetadata',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='staging_session_token', full_name='org.apache.beam.model.job_management.v1.PutArtifactMetadata.staging_session_token', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='metadata', full_name='org.apache.beam.model.job_management.v1.PutArtifactMetadata.metadata', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=692,
+  serialized_end=821,
+)
+
+
+_PUTARTIFACTREQUEST = _descriptor.Descriptor(
+  name='PutArtifactRequest',
+  full_name='org.apache.beam.model.job_management.v1.PutArtifactRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='metadata', full_name='org.apache.beam.model.job_management.v1.PutArtifactRequest.metadata', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.job_management.v1.PutArtifactRequest.data', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='content', full_name='org.apache.beam.model.job_management.v1.PutArtifactRequest.content',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=824,
+  serialized_end=1009,
+)
+
+
+_PUTARTIFACTRESPONSE = _descriptor.Descriptor(
+  name='PutArtifactResponse',
+  full_name='org.apache.beam.model.job_management.v1.PutArtifactResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1011,
+  serialized_end=1032,
+)
+
+
+_COMMITMANIFESTREQUEST = _descriptor.Descriptor(
+  name='CommitManifestRequest',
+  full_name='org.apache.beam.model.job_management.v1.CommitManifestRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='manifest', full_name='org.apache.beam.model.job_management.v1.CommitManifestRequest.manifest', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='staging_session_token', full_name='org.apache.beam.model.job_management.v1.CommitManifestRequest.staging_session_token', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1034,
+  serialized_end=1157,
+)
+
+
+_COMMITMANIFESTRESPONSE = _descriptor.Descriptor(
+  name='CommitManifestResponse',
+  full_name='org.apache.beam.model.job_management.v1.CommitManifestResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='retrieval_token', full_name='org.apache.beam.model.job_management.v1.CommitManifestResponse.retrieval_token', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _COMMITMANIFESTRESPONSE_CONSTANTS,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1159,
+  serialized_end=1283,
+)
+
+_MANIFEST.fields_by_name['artifact'].message_type = _ARTIFACTMETADATA
+_PROXYMANIFEST_LOCATION.containing_type = _PROXYMANIFEST
+_PROXYMANIFEST.fields_by_name['manifest'].message_type = _MANIFEST
+_PROXYMANIFEST.fields_by_name['location'].message_type = _PROXYMANIFEST_LOCATION
+_GETMANIFESTRESPONSE.fields_by_name['manifest'].message_type = _MANIFEST
+_PUTARTIFACTMETADATA.fields_by_name['metadata'].message_type = _ARTIFACTMETADATA
+_PUTARTIFACTREQUEST.fields_by_name['metadata'].message_type = _PUTARTIFACTMETADATA
+_PUTARTIFACTREQUEST.fields_by_name['data'].message_type = _ARTIFACTCHUNK
+_PUTARTIFACTREQUEST.oneofs_by_name['content'].fields.append(
+  _PUTARTIFACTREQUEST.fields_by_name['metadata'])
+_PUTARTIFACTREQUEST.fields_by_name['metadata'].containing_oneof = _PUTARTIFACTREQUEST.oneofs_by_name['content']
+_PUTARTIFACTREQUEST.oneofs_by_name['content'].fields.append(
+  _PUTARTIFACTREQUEST.fields_by_name['data'])
+_PUTARTIFACTREQUEST.fields_by_name['data'].containing_oneof = _PUTARTIFACTREQUEST.oneofs_by_name['content']
+_COMMITMANIFESTREQUEST.fields_by_name['manifest'].message_type = _MANIFEST
+_COMMITMANIFESTRESPONSE_CONSTANTS.containing_type = _COMMITMANIFESTRESPONSE
+DESCRIPTOR.message_types_by_name['ArtifactMetadata'] = _ARTIFACTMETADATA
+DESCRIPTOR.message_types_by_name['Manifest'] = _MANIFEST
+DESCRIPTOR.message_types_by_name['ProxyManifest'] = _PROXYMANIFEST
+DESCRIPTOR.message_types_by_name['GetManifestRequest'] = _GETMANIFESTREQUEST
+DESCRIPTOR.message_types_by_name['GetManifestResponse'] = _GETMANIFESTRESPONSE
+DESCRIPTOR.message_types_by_name['GetArtifactRequest'] = _GETARTIFACTREQUEST
+DESCRIPTOR.message_types_by_name['ArtifactChunk'] = _ARTIFACTCHUNK
+DESCRIPTOR.message_types_by_name['PutArtifactMetadata'] = _PUTARTIFACTMETADATA
+DESCRIPTOR.message_types_by_name['PutArtifactRequest'] = _PUTARTIFACTREQUEST
+DESCRIPTOR.message_types_by_name['PutArtifactResponse'] = _PUTARTIFACTRESPONSE
+DESCRIPTOR.message_types_by_name['CommitManifestRequest'] = _COMMITMANIFESTREQUEST
+DESCRIPTOR.message_types_by_name['CommitManifestResponse'] = _COMMITMANIFESTRESPONSE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ArtifactMetadata = _reflection.GeneratedProtocolMessageType('ArtifactMetadata', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTMETADATA,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactMetadata)
+  ))
+_sym_db.RegisterMessage(ArtifactMetadata)
+
+Manifest = _reflection.GeneratedProtocolMessageType('Manifest', (_message.Message,), dict(
+  DESCRIPTOR = _MANIFEST,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.Manifest)
+  ))
+_sym_db.RegisterMessage(Manifest)
+
+ProxyManifest = _reflection.GeneratedProtocolMessageType('ProxyManifest', (_message.Message,), dict(
+
+  Location = _reflection.GeneratedProtocolMessageType('Location', (_message.Message,), dict(
+    DESCRIPTOR = _PROXYMANIFEST_LOCATION,
+    __module__ = 'beam_artifact_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ProxyManifest.Location)
+    ))
+  ,
+  DESCRIPTOR = _PROXYMANIFEST,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ProxyManifest)
+  ))
+_sym_db.RegisterMessage(ProxyManifest)
+_sym_db.RegisterMessage(ProxyManifest.Location)
+
+GetManifestRequest = _reflection.GeneratedProtocolMessageType('GetManifestRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETMANIFESTREQUEST,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetManifestRequest)
+  ))
+_sym_db.RegisterMessage(GetManifestRequest)
+
+GetManifestResponse = _reflection.GeneratedProtocolMessageType('GetManifestResponse', (_message.Message,), dict(
+  DESCRIPTOR = _GETMANIFESTRESPONSE,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetManifestResponse)
+  ))
+_sym_db.RegisterMessage(GetManifestResponse)
+
+GetArtifactRequest = _reflection.GeneratedProtocolMessageType('GetArtifactRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETARTIFACTREQUEST,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetArtifactRequest)
+  ))
+_sym_db.RegisterMessage(GetArtifactRequest)
+
+ArtifactChunk = _reflection.GeneratedProtocolMessageType('ArtifactChunk', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTCHUNK,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactChunk)
+  ))
+_sym_db.RegisterMessage(ArtifactChunk)
+
+PutArtifactMetadata = _reflection.GeneratedProtocolMessageType('PutArtifactMetadata', (_message.Message,), dict(
+  DESCRIPTOR = _PUTARTIFACTMETADATA,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactMetadata)
+  ))
+_sym_db.RegisterMessage(PutArtifactMetadata)
+
+PutArtifactRequest = _reflection.GeneratedProtocolMessageType('PutArtifactRequest', (_message.Message,), dict(
+  DESCRIPTOR = _PUTARTIFACTREQUEST,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactRequest)
+  ))
+_sym_db.RegisterMessage(PutArtifactRequest)
+
+PutArtifactResponse = _reflection.GeneratedProtocolMessageType('PutArtifactResponse', (_message.Message,), dict(
+  DESCRIPTOR = _PUTARTIFACTRESPONSE,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactResponse)
+  ))
+_sym_db.RegisterMessage(PutArtifactResponse)
+
+CommitManifestRequest = _reflection.GeneratedProtocolMessageType('CommitManifestRequest', (_message.Message,), dict(
+  DESCRIPTOR = _COMMITMANIFESTREQUEST,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CommitManifestRequest)
+  ))
+_sym_db.RegisterMessage(CommitManifestRequest)
+
+CommitManifestResponse = _reflection.GeneratedProtocolMessageType('CommitManifestResponse', (_message.Message,), dict(
+  DESCRIPTOR = _COMMITMANIFESTRESPONSE,
+  __module__ = 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CommitManifestResponse)
+  ))
+_sym_db.RegisterMessage(CommitManifestResponse)
+
+
+DESCRIPTOR.has_options = True
+DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\n&org.apache.beam.model.jobmanagement.v1B\013ArtifactApiZ\020jobmanagement_v1'))
+_COMMITMANIFESTRESPONSE_CONSTANTS.values_by_name["NO_ARTIFACTS_STAGED_TOKEN"].has_options = True
+_COMMITMANIFESTRESPONSE_CONSTANTS.values_by_name["NO_ARTIFACTS_STAGED_TOKEN"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\252\264\372\302\005\027__no_artifacts_staged__'))
+
+_ARTIFACTSTAGINGSERVICE = _descriptor.ServiceDescriptor(
+  name='ArtifactStagingService',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactStagingService',
+  file=DESCRIPTOR,
+  index=0,
+  options=None,
+  serialized_start=1286,
+  serialized_end=1599,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='PutArtifact',
+    full_name='org.apache.beam.model.job_management.v1.ArtifactStagingService.PutArtifact',
+    index=0,
+    containing_service=None,
+    input_type=_PUTARTIFACTREQUEST,
+    output_type=_PUTARTIFACTRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='CommitManifest',
+    full_name='org.apache.beam.model.job_management.v1.ArtifactStagingService.CommitManifest',
+    index=1,
+    containing_service=None,
+    input_type=_COMMITMANIFESTREQUEST,
+    output_type=_COMMITMANIFESTRESPONSE,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_ARTIFACTSTAGINGSERVICE)
+
+DESCRIPTOR.services_by_name['ArtifactStagingService'] = _ARTIFACTSTAGINGSERVICE
+
+
+_ARTIFACTRETRIEVALSERVICE = _descriptor.ServiceDescriptor(
+  name='ArtifactRetrievalService',
+  full_name='org.apache.beam.model.job_management.v1.ArtifactRetrievalService',
+  file=DESCRIPTOR,
+  index=1,
+  options=None,
+  serialized_start=1602,
+  serialized_end=1902,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='GetManifest',
+    full_name='org.apache.beam.model.job_management.v1.ArtifactRetrievalService.GetManifest',
+    index=0,
+    containing_service=None,
+    input_type=_GETMANIFESTREQUEST,
+    output_type=_GETMANIFESTRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetArtifact',
+    full_name='org.apache.beam.model.job_management.v1.ArtifactRetrievalService.GetArtifact',
+    index=1,
+    containing_service=None,
+    input_type=_GETARTIFACTREQUEST,
+    output_type=_ARTIFACTCHUNK,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_ARTIFACTRETRIEVALSERVICE)
+
+DESCRIPTOR.services_by_name['ArtifactRetrievalService'] = _ARTIFACTRETRIEVALSERVICE
+
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,363 @@
+# @generated by generate_proto_mypy_stubs.py.  Do not edit!
+import sys
+from google.protobuf.descriptor import (
+    Descriptor as google___protobuf___descriptor___Descriptor,
+    EnumDescriptor as google___protobuf___descriptor___EnumDescriptor,
+)
+
+from google.protobuf.internal.containers import (
+    RepeatedCompositeFieldContainer as google___protobuf___internal___containers___RepeatedCompositeFieldContainer,
+)
+
+from google.protobuf.message import (
+    Message as google___protobuf___message___Message,
+)
+
+from typing import (
+    Iterable as typing___Iterable,
+    List as typing___List,
+    Optional as typing___Optional,
+    Text as typing___Text,
+    Tuple as typing___Tuple,
+    Union as typing___Union,
+    cast as typing___cast,
+)
+
+from typing_extensions import (
+    Literal as typing_extensions___Literal,
+)
+
+
+builtin___bool = bool
+builtin___bytes = bytes
+builtin___float = float
+builtin___int = int
+builtin___str = str
+if sys.version_info < (3,):
+    builtin___buffer = buffer
+    builtin___unicode = unicode
+
+
+class ArtifactMetadata(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    name = ... # type: typing___Text
+    permissions = ... # type: builtin___int
+    sha256 = ... # type: typing___Text
+
+    def __init__(self,
+        *,
+        name : typing___Optional[typing___Text] = None,
+        permissions : typing___Optional[builtin___int] = None,
+        sha256 : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> ArtifactMetadata: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ArtifactMetadata: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"name",u"permissions",u"sha256"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"name",b"name",u"permissions",b"permissions",u"sha256",b"sha256"]) -> None: ...
+
+class Manifest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def artifact(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[ArtifactMetadata]: ...
+
+    def __init__(self,
+        *,
+        artifact : typing___Optional[typing___Iterable[ArtifactMetadata]] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> Manifest: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> Manifest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"artifact"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"artifact",b"artifact"]) -> None: ...
+
+class ProxyManifest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Location(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        name = ... # type: typing___Text
+        uri = ... # type: typing___Text
+
+        def __init__(self,
+            *,
+            name : typing___Optional[typing___Text] = None,
+            uri : typing___Optional[typing___Text] = None,
+            ) -> None: ...
+        if sys.version_info >= (3,):
+            @classmethod
+            def FromString(cls, s: builtin___bytes) -> ProxyManifest.Location: ...
+        else:
+            @classmethod
+            def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ProxyManifest.Location: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"name",u"uri"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"name",b"name",u"uri",b"uri"]) -> None: ...
+
+
+    @property
+    def manifest(self) -> Manifest: ...
+
+    @property
+    def location(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[ProxyManifest.Location]: ...
+
+    def __init__(self,
+        *,
+        manifest : typing___Optional[Manifest] = None,
+        location : typing___Optional[typing___Iterable[ProxyManifest.Location]] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> ProxyManifest: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ProxyManifest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"manifest"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"location",u"manifest"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"manifest",b"manifest"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"location",b"location",u"manifest",b"manifest"]) -> None: ...
+
+class GetManifestRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    retrieval_token = ... # type: typing___Text
+
+    def __init__(self,
+        *,
+        retrieval_token : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> GetManifestRequest: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> GetManifestRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"retrieval_token"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"retrieval_token",b"retrieval_token"]) -> None: ...
+
+class GetManifestResponse(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def manifest(self) -> Manifest: ...
+
+    def __init__(self,
+        *,
+        manifest : typing___Optional[Manifest] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> GetManifestResponse: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> GetManifestResponse: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"manifest"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"manifest"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"manifest",b"manifest"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"manifest",b"manifest"]) -> None: ...
+
+class GetArtifactRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    name = ... # type: typing___Text
+    retrieval_token = ... # type: typing___Text
+
+    def __init__(self,
+        *,
+        name : typing___Optional[typing___Text] = None,
+        retrieval_token : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> GetArtifactRequest: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> GetArtifactRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"name",u"retrieval_token"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"name",b"name",u"retrieval_token",b"retrieval_token"]) -> None: ...
+
+class ArtifactChunk(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    data = ... # type: builtin___bytes
+
+    def __init__(self,
+        *,
+        data : typing___Optional[builtin___bytes] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> ArtifactChunk: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ArtifactChunk: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"data"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"data",b"data"]) -> None: ...
+
+class PutArtifactMetadata(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    staging_session_token = ... # type: typing___Text
+
+    @property
+    def metadata(self) -> ArtifactMetadata: ...
+
+    def __init__(self,
+        *,
+        staging_session_token : typing___Optional[typing___Text] = None,
+        metadata : typing___Optional[ArtifactMetadata] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> PutArtifactMetadata: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> PutArtifactMetadata: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"metadata"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"metadata",u"staging_session_token"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"metadata",b"metadata"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"metadata",b"metadata",u"staging_session_token",b"staging_session_token"]) -> None: ...
+
+class PutArtifactRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def metadata(self) -> PutArtifactMetadata: ...
+
+    @property
+    def data(self) -> ArtifactChunk: ...
+
+    def __init__(self,
+        *,
+        metadata : typing___Optional[PutArtifactMetadata] = None,
+        data : typing___Optional[ArtifactChunk] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> PutArtifactRequest: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> PutArtifactRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"content",u"data",u"metadata"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"content",u"data",u"metadata"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"content",b"content",u"data",b"data",u"metadata",b"metadata"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"content",b"content",u"data",b"data",u"metadata",b"metadata"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"content",b"content"]) -> typing_extensions___Literal["metadata","data"]: ...
+
+class PutArtifactResponse(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    def __init__(self,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> PutArtifactResponse: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> PutArtifactResponse: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class CommitManifestRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    staging_session_token = ... # type: typing___Text
+
+    @property
+    def manifest(self) -> Manifest: ...
+
+    def __init__(self,
+        *,
+        manifest : typing___Optional[Manifest] = None,
+        staging_session_token : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> CommitManifestRequest: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> CommitManifestRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"manifest"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"manifest",u"staging_session_token"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"manifest",b"manifest"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"manifest",b"manifest",u"staging_session_token",b"staging_session_token"]) -> None: ...
+
+class CommitManifestResponse(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Constants(builtin___int):
+        DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+        @classmethod
+        def Name(cls, number: builtin___int) -> builtin___str: ...
+        @classmethod
+        def Value(cls, name: builtin___str) -> 'CommitManifestResponse.Constants': ...
+        @classmethod
+        def keys(cls) -> typing___List[builtin___str]: ...
+        @classmethod
+        def values(cls) -> typing___List['CommitManifestResponse.Constants']: ...
+        @classmethod
+        def items(cls) -> typing___List[typing___Tuple[builtin___str, 'CommitManifestResponse.Constants']]: ...
+        NO_ARTIFACTS_STAGED_TOKEN = typing___cast('CommitManifestResponse.Constants', 0)
+    NO_ARTIFACTS_STAGED_TOKEN = typing___cast('CommitManifestResponse.Constants', 0)
+
+    retrieval_token = ... # type: typing___Text
+
+    def __init__(self,
+        *,
+        retrieval_token : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> CommitManifestResponse: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> CommitManifestResponse: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"retrieval_token"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"retrieval_token",b"retrieval_token"]) -> None: ...
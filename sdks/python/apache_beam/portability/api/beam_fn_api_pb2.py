@@ -0,0 +1,3869 @@
+from __future__ import absolute_import
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_fn_api.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+from . import endpoints_pb2 as endpoints__pb2
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
+from . import metrics_pb2 as metrics__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='beam_fn_api.proto',
+  package='org.apache.beam.model.fn_execution.v1',
+  syntax='proto3',
+  serialized_pb=_b('\n\x11\x62\x65\x61m_fn_api.proto\x12%org.apache.beam.model.fn_execution.v1\x1a\x15\x62\x65\x61m_runner_api.proto\x1a\x0f\x65ndpoints.proto\x1a google/protobuf/descriptor.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1egoogle/protobuf/wrappers.proto\x1a\rmetrics.proto\"{\n\x0eRemoteGrpcPort\x12W\n\x16\x61pi_service_descriptor\x18\x01 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12\x10\n\x08\x63oder_id\x18\x02 \x01(\t\"\x82\x04\n\x12InstructionRequest\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12K\n\x08register\x18\xe8\x07 \x01(\x0b\x32\x36.org.apache.beam.model.fn_execution.v1.RegisterRequestH\x00\x12V\n\x0eprocess_bundle\x18\xe9\x07 \x01(\x0b\x32;.org.apache.beam.model.fn_execution.v1.ProcessBundleRequestH\x00\x12g\n\x17process_bundle_progress\x18\xea\x07 \x01(\x0b\x32\x43.org.apache.beam.model.fn_execution.v1.ProcessBundleProgressRequestH\x00\x12\x61\n\x14process_bundle_split\x18\xeb\x07 \x01(\x0b\x32@.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequestH\x00\x12X\n\x0f\x66inalize_bundle\x18\xec\x07 \x01(\x0b\x32<.org.apache.beam.model.fn_execution.v1.FinalizeBundleRequestH\x00\x42\t\n\x07request\"\x98\x04\n\x13InstructionResponse\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12L\n\x08register\x18\xe8\x07 \x01(\x0b\x32\x37.org.apache.beam.model.fn_execution.v1.RegisterResponseH\x00\x12W\n\x0eprocess_bundle\x18\xe9\x07 \x01(\x0b\x32<.org.apache.beam.model.fn_execution.v1.ProcessBundleResponseH\x00\x12h\n\x17process_bundle_progress\x18\xea\x07 \x01(\x0b\x32\x44.org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponseH\x00\x12\x62\n\x14process_bundle_split\x18\xeb\x07 \x01(\x0b\x32\x41.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponseH\x00\x12Y\n\x0f\x66inalize_bundle\x18\xec\x07 \x01(\x0b\x32=.org.apache.beam.model.fn_execution.v1.FinalizeBundleResponseH\x00\x42\n\n\x08response\"t\n\x0fRegisterRequest\x12\x61\n\x19process_bundle_descriptor\x18\x01 \x03(\x0b\x32>.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor\"\x12\n\x10RegisterResponse\"\x82\t\n\x17ProcessBundleDescriptor\x12\n\n\x02id\x18\x01 \x01(\t\x12\x62\n\ntransforms\x18\x02 \x03(\x0b\x32N.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.TransformsEntry\x12\x66\n\x0cpcollections\x18\x03 \x03(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.PcollectionsEntry\x12u\n\x14windowing_strategies\x18\x04 \x03(\x0b\x32W.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.WindowingStrategiesEntry\x12Z\n\x06\x63oders\x18\x05 \x03(\x0b\x32J.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.CodersEntry\x12\x66\n\x0c\x65nvironments\x18\x06 \x03(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.EnvironmentsEntry\x12]\n\x1cstate_api_service_descriptor\x18\x07 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x1a`\n\x0fTransformsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12<\n\x05value\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform:\x02\x38\x01\x1a\x63\n\x11PcollectionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.PCollection:\x02\x38\x01\x1ap\n\x18WindowingStrategiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x43\n\x05value\x18\x02 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowingStrategy:\x02\x38\x01\x1aW\n\x0b\x43odersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x37\n\x05value\x18\x02 \x01(\x0b\x32(.org.apache.beam.model.pipeline.v1.Coder:\x02\x38\x01\x1a\x63\n\x11\x45nvironmentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment:\x02\x38\x01\"\xd3\x02\n\x11\x42undleApplication\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x10\n\x08input_id\x18\x02 \x01(\t\x12\x0f\n\x07\x65lement\x18\x03 \x01(\x0c\x12i\n\x11output_watermarks\x18\x04 \x03(\x0b\x32N.org.apache.beam.model.fn_execution.v1.BundleApplication.OutputWatermarksEntry\x12\x45\n\nis_bounded\x18\x05 \x01(\x0e\x32\x31.org.apache.beam.model.pipeline.v1.IsBounded.Enum\x1aS\n\x15OutputWatermarksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp:\x02\x38\x01\"\xa2\x01\n\x18\x44\x65layedBundleApplication\x12M\n\x0b\x61pplication\x18\x01 \x01(\x0b\x32\x38.org.apache.beam.model.fn_execution.v1.BundleApplication\x12\x37\n\x14requested_time_delay\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Duration\"\xd7\x03\n\x14ProcessBundleRequest\x12$\n\x1cprocess_bundle_descriptor_id\x18\x01 \x01(\t\x12\\\n\x0c\x63\x61\x63he_tokens\x18\x02 \x03(\x0b\x32\x46.org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken\x1a\xba\x02\n\nCacheToken\x12\x66\n\nuser_state\x18\x01 \x01(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.UserStateH\x00\x12\x66\n\nside_input\x18\x02 \x01(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.SideInputH\x00\x12\r\n\x05token\x18\n \x01(\x0c\x1a\x0b\n\tUserState\x1a\x38\n\tSideInput\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\rside_input_id\x18\x02 \x01(\tB\x06\n\x04type\"\x9d\x02\n\x15ProcessBundleResponse\x12?\n\x07metrics\x18\x01 \x01(\x0b\x32..org.apache.beam.model.fn_execution.v1.Metrics\x12W\n\x0eresidual_roots\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.fn_execution.v1.DelayedBundleApplication\x12K\n\x10monitoring_infos\x18\x03 \x03(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo\x12\x1d\n\x15requires_finalization\x18\x04 \x01(\x08\"6\n\x1cProcessBundleProgressRequest\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\"\xa9\x10\n\x07Metrics\x12T\n\x0bptransforms\x18\x01 \x03(\x0b\x32?.org.apache.beam.model.fn_execution.v1.Metrics.PtransformsEntry\x1a\xfc\t\n\nPTransform\x12g\n\x12processed_elements\x18\x01 \x01(\x0b\x32K.org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ProcessedElements\x12\x61\n\x0f\x61\x63tive_elements\x18\x02 \x01(\x0b\x32H.org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements\x12]\n\nwatermarks\x18\x03 \x03(\x0b\x32I.org.apache.beam.model.fn_execution.v1.Metrics.PTransform.WatermarksEntry\x12\x41\n\x04user\x18\x04 \x03(\x0b\x32\x33.org.apache.beam.model.fn_execution.v1.Metrics.User\x1a\x91\x03\n\x08Measured\x12x\n\x14input_element_counts\x18\x01 \x03(\x0b\x32Z.org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.InputElementCountsEntry\x12z\n\x15output_element_counts\x18\x02 \x03(\x0b\x32[.org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.OutputElementCountsEntry\x12\x18\n\x10total_time_spent\x18\x03 \x01(\x01\x1a\x39\n\x17InputElementCountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x1a:\n\x18OutputElementCountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x1ai\n\x11ProcessedElements\x12T\n\x08measured\x18\x01 \x01(\x0b\x32\x42.org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured\x1a\xcd\x02\n\x0e\x41\x63tiveElements\x12T\n\x08measured\x18\x01 \x01(\x0b\x32\x42.org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured\x12\x1a\n\x12\x66raction_remaining\x18\x02 \x01(\x01\x12\x88\x01\n\x19output_elements_remaining\x18\x03 \x03(\x0b\x32\x65.org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements.OutputElementsRemainingEntry\x1a>\n\x1cOutputElementsRemainingEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x1a\x31\n\x0fWatermarksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x1a\xd9\x04\n\x04User\x12S\n\x0bmetric_name\x18\x01 \x01(\x0b\x32>.org.apache.beam.model.fn_execution.v1.Metrics.User.MetricName\x12X\n\x0c\x63ounter_data\x18\xe9\x07 \x01(\x0b\x32?.org.apache.beam.model.fn_execution.v1.Metrics.User.CounterDataH\x00\x12\x62\n\x11\x64istribution_data\x18\xea\x07 \x01(\x0b\x32\x44.org.apache.beam.model.fn_execution.v1.Metrics.User.DistributionDataH\x00\x12T\n\ngauge_data\x18\xeb\x07 \x01(\x0b\x32=.org.apache.beam.model.fn_execution.v1.Metrics.User.GaugeDataH\x00\x1a-\n\nMetricName\x12\x11\n\tnamespace\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x1a\x1c\n\x0b\x43ounterData\x12\r\n\x05value\x18\x01 \x01(\x03\x1aH\n\x10\x44istributionData\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12\x0b\n\x03sum\x18\x02 \x01(\x03\x12\x0b\n\x03min\x18\x03 \x01(\x03\x12\x0b\n\x03max\x18\x04 \x01(\x03\x1aI\n\tGaugeData\x12\r\n\x05value\x18\x01 \x01(\x03\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x06\n\x04\x64\x61ta\x1am\n\x10PtransformsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12H\n\x05value\x18\x02 \x01(\x0b\x32\x39.org.apache.beam.model.fn_execution.v1.Metrics.PTransform:\x02\x38\x01\"\xfe\x01\n\x1dProcessBundleProgressResponse\x12?\n\x07metrics\x18\x01 \x01(\x0b\x32..org.apache.beam.model.fn_execution.v1.Metrics\x12K\n\x10monitoring_infos\x18\x03 \x03(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo\x12O\n\rprimary_roots\x18\x04 \x03(\x0b\x32\x38.org.apache.beam.model.fn_execution.v1.BundleApplication\"\x95\x03\n\x19ProcessBundleSplitRequest\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12k\n\x0e\x64\x65sired_splits\x18\x03 \x03(\x0b\x32S.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplitsEntry\x1am\n\x0c\x44\x65siredSplit\x12\x1d\n\x15\x66raction_of_remainder\x18\x01 \x01(\x01\x12\x1c\n\x14\x61llowed_split_points\x18\x03 \x03(\x03\x12 \n\x18\x65stimated_input_elements\x18\x02 \x01(\x03\x1a\x83\x01\n\x12\x44\x65siredSplitsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\\\n\x05value\x18\x02 \x01(\x0b\x32M.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplit:\x02\x38\x01\"\x92\x03\n\x1aProcessBundleSplitResponse\x12O\n\rprimary_roots\x18\x01 \x03(\x0b\x32\x38.org.apache.beam.model.fn_execution.v1.BundleApplication\x12W\n\x0eresidual_roots\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.fn_execution.v1.DelayedBundleApplication\x12\x66\n\x0e\x63hannel_splits\x18\x03 \x03(\x0b\x32N.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.ChannelSplit\x1a\x62\n\x0c\x43hannelSplit\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x1c\n\x14last_primary_element\x18\x02 \x01(\x03\x12\x1e\n\x16\x66irst_residual_element\x18\x03 \x01(\x03\"/\n\x15\x46inalizeBundleRequest\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\"\x18\n\x16\x46inalizeBundleResponse\"\x92\x01\n\x08\x45lements\x12\x42\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x34.org.apache.beam.model.fn_execution.v1.Elements.Data\x1a\x42\n\x04\x44\x61ta\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12\x14\n\x0ctransform_id\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"\xe3\x02\n\x0cStateRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\x0einstruction_id\x18\x02 \x01(\t\x12\x42\n\tstate_key\x18\x03 \x01(\x0b\x32/.org.apache.beam.model.fn_execution.v1.StateKey\x12\x46\n\x03get\x18\xe8\x07 \x01(\x0b\x32\x36.org.apache.beam.model.fn_execution.v1.StateGetRequestH\x00\x12L\n\x06\x61ppend\x18\xe9\x07 \x01(\x0b\x32\x39.org.apache.beam.model.fn_execution.v1.StateAppendRequestH\x00\x12J\n\x05\x63lear\x18\xea\x07 \x01(\x0b\x32\x38.org.apache.beam.model.fn_execution.v1.StateClearRequestH\x00\x42\t\n\x07request\"\x9b\x02\n\rStateResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12G\n\x03get\x18\xe8\x07 \x01(\x0b\x32\x37.org.apache.beam.model.fn_execution.v1.StateGetResponseH\x00\x12M\n\x06\x61ppend\x18\xe9\x07 \x01(\x0b\x32:.org.apache.beam.model.fn_execution.v1.StateAppendResponseH\x00\x12K\n\x05\x63lear\x18\xea\x07 \x01(\x0b\x32\x39.org.apache.beam.model.fn_execution.v1.StateClearResponseH\x00\x42\n\n\x08response\"\xdb\x06\n\x08StateKey\x12H\n\x06runner\x18\x01 \x01(\x0b\x32\x36.org.apache.beam.model.fn_execution.v1.StateKey.RunnerH\x00\x12`\n\x13multimap_side_input\x18\x02 \x01(\x0b\x32\x41.org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInputH\x00\x12V\n\x0e\x62\x61g_user_state\x18\x03 \x01(\x0b\x32<.org.apache.beam.model.fn_execution.v1.StateKey.BagUserStateH\x00\x12`\n\x13iterable_side_input\x18\x04 \x01(\x0b\x32\x41.org.apache.beam.model.fn_execution.v1.StateKey.IterableSideInputH\x00\x12i\n\x18multimap_keys_side_input\x18\x05 \x01(\x0b\x32\x45.org.apache.beam.model.fn_execution.v1.StateKey.MultimapKeysSideInputH\x00\x1a\x15\n\x06Runner\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x1aP\n\x11IterableSideInput\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\rside_input_id\x18\x02 \x01(\t\x12\x0e\n\x06window\x18\x03 \x01(\x0c\x1a]\n\x11MultimapSideInput\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\rside_input_id\x18\x02 \x01(\t\x12\x0e\n\x06window\x18\x03 \x01(\x0c\x12\x0b\n\x03key\x18\x04 \x01(\x0c\x1aT\n\x15MultimapKeysSideInput\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\rside_input_id\x18\x02 \x01(\t\x12\x0e\n\x06window\x18\x03 \x01(\x0c\x1aX\n\x0c\x42\x61gUserState\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\ruser_state_id\x18\x02 \x01(\t\x12\x0e\n\x06window\x18\x03 \x01(\x0c\x12\x0b\n\x03key\x18\x04 \x01(\x0c\x42\x06\n\x04type\"-\n\x0fStateGetRequest\x12\x1a\n\x12\x63ontinuation_token\x18\x01 \x01(\x0c\"<\n\x10StateGetResponse\x12\x1a\n\x12\x63ontinuation_token\x18\x01 \x01(\x0c\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"\"\n\x12StateAppendRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x15\n\x13StateAppendResponse\"\x13\n\x11StateClearRequest\"\x14\n\x12StateClearResponse\"\xc0\x03\n\x08LogEntry\x12O\n\x08severity\x18\x01 \x01(\x0e\x32=.org.apache.beam.model.fn_execution.v1.LogEntry.Severity.Enum\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\r\n\x05trace\x18\x04 \x01(\t\x12\x16\n\x0einstruction_id\x18\x05 \x01(\t\x12\x14\n\x0ctransform_id\x18\x06 \x01(\t\x12\x14\n\x0clog_location\x18\x07 \x01(\t\x12\x0e\n\x06thread\x18\x08 \x01(\t\x1aL\n\x04List\x12\x44\n\x0blog_entries\x18\x01 \x03(\x0b\x32/.org.apache.beam.model.fn_execution.v1.LogEntry\x1ar\n\x08Severity\"f\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\t\n\x05TRACE\x10\x01\x12\t\n\x05\x44\x45\x42UG\x10\x02\x12\x08\n\x04INFO\x10\x03\x12\n\n\x06NOTICE\x10\x04\x12\x08\n\x04WARN\x10\x05\x12\t\n\x05\x45RROR\x10\x06\x12\x0c\n\x08\x43RITICAL\x10\x07\"\x0c\n\nLogControl\"\xfc\x03\n\x12StartWorkerRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12Q\n\x10\x63ontrol_endpoint\x18\x02 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12Q\n\x10logging_endpoint\x18\x03 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12R\n\x11\x61rtifact_endpoint\x18\x04 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12S\n\x12provision_endpoint\x18\x05 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12U\n\x06params\x18\n \x03(\x0b\x32\x45.org.apache.beam.model.fn_execution.v1.StartWorkerRequest.ParamsEntry\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"$\n\x13StartWorkerResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\"&\n\x11StopWorkerRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\"#\n\x12StopWorkerResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\"!\n\x13WorkerStatusRequest\x12\n\n\x02id\x18\x01 \x01(\t\"F\n\x14WorkerStatusResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x13\n\x0bstatus_info\x18\x03 \x01(\t2\x98\x01\n\rBeamFnControl\x12\x86\x01\n\x07\x43ontrol\x12:.org.apache.beam.model.fn_execution.v1.InstructionResponse\x1a\x39.org.apache.beam.model.fn_execution.v1.InstructionRequest\"\x00(\x01\x30\x01\x32|\n\nBeamFnData\x12n\n\x04\x44\x61ta\x12/.org.apache.beam.model.fn_execution.v1.Elements\x1a/.org.apache.beam.model.fn_execution.v1.Elements\"\x00(\x01\x30\x01\x32\x87\x01\n\x0b\x42\x65\x61mFnState\x12x\n\x05State\x12\x33.org.apache.beam.model.fn_execution.v1.StateRequest\x1a\x34.org.apache.beam.model.fn_execution.v1.StateResponse\"\x00(\x01\x30\x01\x32\x89\x01\n\rBeamFnLogging\x12x\n\x07Logging\x12\x34.org.apache.beam.model.fn_execution.v1.LogEntry.List\x1a\x31.org.apache.beam.model.fn_execution.v1.LogControl\"\x00(\x01\x30\x01\x32\xa9\x02\n\x18\x42\x65\x61mFnExternalWorkerPool\x12\x86\x01\n\x0bStartWorker\x12\x39.org.apache.beam.model.fn_execution.v1.StartWorkerRequest\x1a:.org.apache.beam.model.fn_execution.v1.StartWorkerResponse\"\x00\x12\x83\x01\n\nStopWorker\x12\x38.org.apache.beam.model.fn_execution.v1.StopWorkerRequest\x1a\x39.org.apache.beam.model.fn_execution.v1.StopWorkerResponse\"\x00\x32\xa4\x01\n\x12\x42\x65\x61mFnWorkerStatus\x12\x8d\x01\n\x0cWorkerStatus\x12;.org.apache.beam.model.fn_execution.v1.WorkerStatusResponse\x1a:.org.apache.beam.model.fn_execution.v1.WorkerStatusRequest\"\x00(\x01\x30\x01\x42\x41\n$org.apache.beam.model.fnexecution.v1B\tBeamFnApiZ\x0e\x66nexecution_v1b\x06proto3')
+  ,
+  dependencies=[beam__runner__api__pb2.DESCRIPTOR,endpoints__pb2.DESCRIPTOR,google_dot_protobuf_dot_descriptor__pb2.DESCRIPTOR,google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,google_dot_protobuf_dot_duration__pb2.DESCRIPTOR,google_dot_protobuf_dot_wrappers__pb2.DESCRIPTOR,metrics__pb2.DESCRIPTOR,])
+
+
+
+_LOGENTRY_SEVERITY_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.fn_execution.v1.LogEntry.Severity.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TRACE', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DEBUG', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INFO', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NOTICE', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WARN', index=5, number=5,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ERROR', index=6, number=6,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CRITICAL', index=7, number=7,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=9497,
+  serialized_end=9599,
+)
+_sym_db.RegisterEnumDescriptor(_LOGENTRY_SEVERITY_ENUM)
+
+
+_REMOTEGRPCPORT = _descriptor.Descriptor(
+  name='RemoteGrpcPort',
+  full_name='org.apache.beam.model.fn_execution.v1.RemoteGrpcPort',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='api_service_descriptor', full_name='org.apache.beam.model.fn_execution.v1.RemoteGrpcPort.api_service_descriptor', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='coder_id', full_name='org.apache.beam.model.fn_execution.v1.RemoteGrpcPort.coder_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=246,
+  serialized_end=369,
+)
+
+
+_INSTRUCTIONREQUEST = _descriptor.Descriptor(
+  name='InstructionRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.InstructionRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='instruction_id', full_name='org.apache.beam.model.fn_execution.v1.InstructionRequest.instruction_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='register', full_name='org.apache.beam.model.fn_execution.v1.InstructionRequest.register', index=1,
+      number=1000, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='process_bundle', full_name='org.apache.beam.model.fn_execution.v1.InstructionRequest.process_bundle', index=2,
+      number=1001, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='process_bundle_progress', full_name='org.apache.beam.model.fn_execution.v1.InstructionRequest.process_bundle_progress', index=3,
+      number=1002, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='process_bundle_split', full_name='org.apache.beam.model.fn_execution.v1.InstructionRequest.process_bundle_split', index=4,
+      number=1003, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='finalize_bundle', full_name='org.apache.beam.model.fn_execution.v1.InstructionRequest.finalize_bundle', index=5,
+      number=1004, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='request', full_name='org.apache.beam.model.fn_execution.v1.InstructionRequest.request',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=372,
+  serialized_end=886,
+)
+
+
+_INSTRUCTIONRESPONSE = _descriptor.Descriptor(
+  name='InstructionResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='instruction_id', full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse.instruction_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse.error', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='register', full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse.register', index=2,
+      number=1000, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='process_bundle', full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse.process_bundle', index=3,
+      number=1001, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='process_bundle_progress', full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse.process_bundle_progress', index=4,
+      number=1002, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='process_bundle_split', full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse.process_bundle_split', index=5,
+      number=1003, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='finalize_bundle', full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse.finalize_bundle', index=6,
+      number=1004, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='response', full_name='org.apache.beam.model.fn_execution.v1.InstructionResponse.response',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=889,
+  serialized_end=1425,
+)
+
+
+_REGISTERREQUEST = _descriptor.Descriptor(
+  name='RegisterRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.RegisterRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='process_bundle_descriptor', full_name='org.apache.beam.model.fn_execution.v1.RegisterRequest.process_bundle_descriptor', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1427,
+  serialized_end=1543,
+)
+
+
+_REGISTERRESPONSE = _descriptor.Descriptor(
+  name='RegisterResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.RegisterResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1545,
+  serialized_end=1563,
+)
+
+
+_PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY = _descriptor.Descriptor(
+  name='TransformsEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.TransformsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.TransformsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.TransformsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2219,
+  serialized_end=2315,
+)
+
+_PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY = _descriptor.Descriptor(
+  name='PcollectionsEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.PcollectionsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.PcollectionsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.PcollectionsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2317,
+  serialized_end=2416,
+)
+
+_PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY = _descriptor.Descriptor(
+  name='WindowingStrategiesEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.WindowingStrategiesEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.WindowingStrategiesEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.WindowingStrategiesEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2418,
+  serialized_end=2530,
+)
+
+_PROCESSBUNDLEDESCRIPTOR_CODERSENTRY = _descriptor.Descriptor(
+  name='CodersEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.CodersEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.CodersEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.CodersEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2532,
+  serialized_end=2619,
+)
+
+_PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY = _descriptor.Descriptor(
+  name='EnvironmentsEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.EnvironmentsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.EnvironmentsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.EnvironmentsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2621,
+  serialized_end=2720,
+)
+
+_PROCESSBUNDLEDESCRIPTOR = _descriptor.Descriptor(
+  name='ProcessBundleDescriptor',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='transforms', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.transforms', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pcollections', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.pcollections', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='windowing_strategies', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.windowing_strategies', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='coders', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.coders', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environments', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.environments', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state_api_service_descriptor', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.state_api_service_descriptor', index=6,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY, _PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY, _PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY, _PROCESSBUNDLEDESCRIPTOR_CODERSENTRY, _PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1566,
+  serialized_end=2720,
+)
+
+
+_BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY = _descriptor.Descriptor(
+  name='OutputWatermarksEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.BundleApplication.OutputWatermarksEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.BundleApplication.OutputWatermarksEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.BundleApplication.OutputWatermarksEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2979,
+  serialized_end=3062,
+)
+
+_BUNDLEAPPLICATION = _descriptor.Descriptor(
+  name='BundleApplication',
+  full_name='org.apache.beam.model.fn_execution.v1.BundleApplication',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.BundleApplication.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input_id', full_name='org.apache.beam.model.fn_execution.v1.BundleApplication.input_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='element', full_name='org.apache.beam.model.fn_execution.v1.BundleApplication.element', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='output_watermarks', full_name='org.apache.beam.model.fn_execution.v1.BundleApplication.output_watermarks', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='is_bounded', full_name='org.apache.beam.model.fn_execution.v1.BundleApplication.is_bounded', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2723,
+  serialized_end=3062,
+)
+
+
+_DELAYEDBUNDLEAPPLICATION = _descriptor.Descriptor(
+  name='DelayedBundleApplication',
+  full_name='org.apache.beam.model.fn_execution.v1.DelayedBundleApplication',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='application', full_name='org.apache.beam.model.fn_execution.v1.DelayedBundleApplication.application', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='requested_time_delay', full_name='org.apache.beam.model.fn_execution.v1.DelayedBundleApplication.requested_time_delay', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3065,
+  serialized_end=3227,
+)
+
+
+_PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE = _descriptor.Descriptor(
+  name='UserState',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.UserState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3624,
+  serialized_end=3635,
+)
+
+_PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT = _descriptor.Descriptor(
+  name='SideInput',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.SideInput',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.SideInput.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_input_id', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.SideInput.side_input_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3637,
+  serialized_end=3693,
+)
+
+_PROCESSBUNDLEREQUEST_CACHETOKEN = _descriptor.Descriptor(
+  name='CacheToken',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='user_state', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.user_state', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_input', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.side_input', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='token', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.token', index=2,
+      number=10, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE, _PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='type', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.type',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=3387,
+  serialized_end=3701,
+)
+
+_PROCESSBUNDLEREQUEST = _descriptor.Descriptor(
+  name='ProcessBundleRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='process_bundle_descriptor_id', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.process_bundle_descriptor_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cache_tokens', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.cache_tokens', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROCESSBUNDLEREQUEST_CACHETOKEN, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3230,
+  serialized_end=3701,
+)
+
+
+_PROCESSBUNDLERESPONSE = _descriptor.Descriptor(
+  name='ProcessBundleResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='metrics', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleResponse.metrics', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='residual_roots', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleResponse.residual_roots', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='monitoring_infos', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleResponse.monitoring_infos', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='requires_finalization', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleResponse.requires_finalization', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3704,
+  serialized_end=3989,
+)
+
+
+_PROCESSBUNDLEPROGRESSREQUEST = _descriptor.Descriptor(
+  name='ProcessBundleProgressRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleProgressRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='instruction_id', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleProgressRequest.instruction_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3991,
+  serialized_end=4045,
+)
+
+
+_METRICS_PTRANSFORM_MEASURED_INPUTELEMENTCOUNTSENTRY = _descriptor.Descriptor(
+  name='InputElementCountsEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.InputElementCountsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.InputElementCountsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.InputElementCountsEntry.value', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4811,
+  serialized_end=4868,
+)
+
+_METRICS_PTRANSFORM_MEASURED_OUTPUTELEMENTCOUNTSENTRY = _descriptor.Descriptor(
+  name='OutputElementCountsEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.OutputElementCountsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.OutputElementCountsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.OutputElementCountsEntry.value', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4870,
+  serialized_end=4928,
+)
+
+_METRICS_PTRANSFORM_MEASURED = _descriptor.Descriptor(
+  name='Measured',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='input_element_counts', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.input_element_counts', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='output_element_counts', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.output_element_counts', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total_time_spent', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.total_time_spent', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_METRICS_PTRANSFORM_MEASURED_INPUTELEMENTCOUNTSENTRY, _METRICS_PTRANSFORM_MEASURED_OUTPUTELEMENTCOUNTSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4527,
+  serialized_end=4928,
+)
+
+_METRICS_PTRANSFORM_PROCESSEDELEMENTS = _descriptor.Descriptor(
+  name='ProcessedElements',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ProcessedElements',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='measured', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ProcessedElements.measured', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4930,
+  serialized_end=5035,
+)
+
+_METRICS_PTRANSFORM_ACTIVEELEMENTS_OUTPUTELEMENTSREMAININGENTRY = _descriptor.Descriptor(
+  name='OutputElementsRemainingEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements.OutputElementsRemainingEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements.OutputElementsRemainingEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements.OutputElementsRemainingEntry.value', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5309,
+  serialized_end=5371,
+)
+
+_METRICS_PTRANSFORM_ACTIVEELEMENTS = _descriptor.Descriptor(
+  name='ActiveElements',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='measured', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements.measured', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fraction_remaining', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements.fraction_remaining', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='output_elements_remaining', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements.output_elements_remaining', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_METRICS_PTRANSFORM_ACTIVEELEMENTS_OUTPUTELEMENTSREMAININGENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5038,
+  serialized_end=5371,
+)
+
+_METRICS_PTRANSFORM_WATERMARKSENTRY = _descriptor.Descriptor(
+  name='WatermarksEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.WatermarksEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.WatermarksEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.WatermarksEntry.value', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5373,
+  serialized_end=5422,
+)
+
+_METRICS_PTRANSFORM = _descriptor.Descriptor(
+  name='PTransform',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='processed_elements', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.processed_elements', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='active_elements', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.active_elements', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='watermarks', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.watermarks', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='user', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PTransform.user', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_METRICS_PTRANSFORM_MEASURED, _METRICS_PTRANSFORM_PROCESSEDELEMENTS, _METRICS_PTRANSFORM_ACTIVEELEMENTS, _METRICS_PTRANSFORM_WATERMARKSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4146,
+  serialized_end=5422,
+)
+
+_METRICS_USER_METRICNAME = _descriptor.Descriptor(
+  name='MetricName',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.MetricName',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='namespace', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.MetricName.namespace', index=0,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.MetricName.name', index=1,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5794,
+  serialized_end=5839,
+)
+
+_METRICS_USER_COUNTERDATA = _descriptor.Descriptor(
+  name='CounterData',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.CounterData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.CounterData.value', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5841,
+  serialized_end=5869,
+)
+
+_METRICS_USER_DISTRIBUTIONDATA = _descriptor.Descriptor(
+  name='DistributionData',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.DistributionData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='count', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.DistributionData.count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sum', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.DistributionData.sum', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='min', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.DistributionData.min', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.DistributionData.max', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5871,
+  serialized_end=5943,
+)
+
+_METRICS_USER_GAUGEDATA = _descriptor.Descriptor(
+  name='GaugeData',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.GaugeData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.GaugeData.value', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.GaugeData.timestamp', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5945,
+  serialized_end=6018,
+)
+
+_METRICS_USER = _descriptor.Descriptor(
+  name='User',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.User',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='metric_name', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.metric_name', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='counter_data', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.counter_data', index=1,
+      number=1001, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='distribution_data', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.distribution_data', index=2,
+      number=1002, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='gauge_data', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.gauge_data', index=3,
+      number=1003, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_METRICS_USER_METRICNAME, _METRICS_USER_COUNTERDATA, _METRICS_USER_DISTRIBUTIONDATA, _METRICS_USER_GAUGEDATA, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='data', full_name='org.apache.beam.model.fn_execution.v1.Metrics.User.data',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=5425,
+  serialized_end=6026,
+)
+
+_METRICS_PTRANSFORMSENTRY = _descriptor.Descriptor(
+  name='PtransformsEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics.PtransformsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PtransformsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.Metrics.PtransformsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6028,
+  serialized_end=6137,
+)
+
+_METRICS = _descriptor.Descriptor(
+  name='Metrics',
+  full_name='org.apache.beam.model.fn_execution.v1.Metrics',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ptransforms', full_name='org.apache.beam.model.fn_execution.v1.Metrics.ptransforms', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_METRICS_PTRANSFORM, _METRICS_USER, _METRICS_PTRANSFORMSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4048,
+  serialized_end=6137,
+)
+
+
+_PROCESSBUNDLEPROGRESSRESPONSE = _descriptor.Descriptor(
+  name='ProcessBundleProgressResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='metrics', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponse.metrics', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='monitoring_infos', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponse.monitoring_infos', index=1,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='primary_roots', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponse.primary_roots', index=2,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6140,
+  serialized_end=6394,
+)
+
+
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT = _descriptor.Descriptor(
+  name='DesiredSplit',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplit',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='fraction_of_remainder', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplit.fraction_of_remainder', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='allowed_split_points', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplit.allowed_split_points', index=1,
+      number=3, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='estimated_input_elements', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplit.estimated_input_elements', index=2,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6559,
+  serialized_end=6668,
+)
+
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY = _descriptor.Descriptor(
+  name='DesiredSplitsEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplitsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplitsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplitsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6671,
+  serialized_end=6802,
+)
+
+_PROCESSBUNDLESPLITREQUEST = _descriptor.Descriptor(
+  name='ProcessBundleSplitRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='instruction_id', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.instruction_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='desired_splits', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.desired_splits', index=1,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT, _PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6397,
+  serialized_end=6802,
+)
+
+
+_PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT = _descriptor.Descriptor(
+  name='ChannelSplit',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.ChannelSplit',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.ChannelSplit.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_primary_element', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.ChannelSplit.last_primary_element', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='first_residual_element', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.ChannelSplit.first_residual_element', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7109,
+  serialized_end=7207,
+)
+
+_PROCESSBUNDLESPLITRESPONSE = _descriptor.Descriptor(
+  name='ProcessBundleSplitResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='primary_roots', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.primary_roots', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='residual_roots', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.residual_roots', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='channel_splits', full_name='org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.channel_splits', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6805,
+  serialized_end=7207,
+)
+
+
+_FINALIZEBUNDLEREQUEST = _descriptor.Descriptor(
+  name='FinalizeBundleRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.FinalizeBundleRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='instruction_id', full_name='org.apache.beam.model.fn_execution.v1.FinalizeBundleRequest.instruction_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7209,
+  serialized_end=7256,
+)
+
+
+_FINALIZEBUNDLERESPONSE = _descriptor.Descriptor(
+  name='FinalizeBundleResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.FinalizeBundleResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7258,
+  serialized_end=7282,
+)
+
+
+_ELEMENTS_DATA = _descriptor.Descriptor(
+  name='Data',
+  full_name='org.apache.beam.model.fn_execution.v1.Elements.Data',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='instruction_id', full_name='org.apache.beam.model.fn_execution.v1.Elements.Data.instruction_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.Elements.Data.transform_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.fn_execution.v1.Elements.Data.data', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7365,
+  serialized_end=7431,
+)
+
+_ELEMENTS = _descriptor.Descriptor(
+  name='Elements',
+  full_name='org.apache.beam.model.fn_execution.v1.Elements',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.fn_execution.v1.Elements.data', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_ELEMENTS_DATA, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7285,
+  serialized_end=7431,
+)
+
+
+_STATEREQUEST = _descriptor.Descriptor(
+  name='StateRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.StateRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='org.apache.beam.model.fn_execution.v1.StateRequest.id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='instruction_id', full_name='org.apache.beam.model.fn_execution.v1.StateRequest.instruction_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state_key', full_name='org.apache.beam.model.fn_execution.v1.StateRequest.state_key', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='get', full_name='org.apache.beam.model.fn_execution.v1.StateRequest.get', index=3,
+      number=1000, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='append', full_name='org.apache.beam.model.fn_execution.v1.StateRequest.append', index=4,
+      number=1001, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='clear', full_name='org.apache.beam.model.fn_execution.v1.StateRequest.clear', index=5,
+      number=1002, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='request', full_name='org.apache.beam.model.fn_execution.v1.StateRequest.request',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=7434,
+  serialized_end=7789,
+)
+
+
+_STATERESPONSE = _descriptor.Descriptor(
+  name='StateResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.StateResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='org.apache.beam.model.fn_execution.v1.StateResponse.id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='org.apache.beam.model.fn_execution.v1.StateResponse.error', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='get', full_name='org.apache.beam.model.fn_execution.v1.StateResponse.get', index=2,
+      number=1000, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='append', full_name='org.apache.beam.model.fn_execution.v1.StateResponse.append', index=3,
+      number=1001, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='clear', full_name='org.apache.beam.model.fn_execution.v1.StateResponse.clear', index=4,
+      number=1002, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='response', full_name='org.apache.beam.model.fn_execution.v1.StateResponse.response',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=7792,
+  serialized_end=8075,
+)
+
+
+_STATEKEY_RUNNER = _descriptor.Descriptor(
+  name='Runner',
+  full_name='org.apache.beam.model.fn_execution.v1.StateKey.Runner',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.StateKey.Runner.key', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8555,
+  serialized_end=8576,
+)
+
+_STATEKEY_ITERABLESIDEINPUT = _descriptor.Descriptor(
+  name='IterableSideInput',
+  full_name='org.apache.beam.model.fn_execution.v1.StateKey.IterableSideInput',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.StateKey.IterableSideInput.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_input_id', full_name='org.apache.beam.model.fn_execution.v1.StateKey.IterableSideInput.side_input_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='window', full_name='org.apache.beam.model.fn_execution.v1.StateKey.IterableSideInput.window', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8578,
+  serialized_end=8658,
+)
+
+_STATEKEY_MULTIMAPSIDEINPUT = _descriptor.Descriptor(
+  name='MultimapSideInput',
+  full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInput',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInput.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_input_id', full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInput.side_input_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='window', full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInput.window', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInput.key', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8660,
+  serialized_end=8753,
+)
+
+_STATEKEY_MULTIMAPKEYSSIDEINPUT = _descriptor.Descriptor(
+  name='MultimapKeysSideInput',
+  full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapKeysSideInput',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapKeysSideInput.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_input_id', full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapKeysSideInput.side_input_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='window', full_name='org.apache.beam.model.fn_execution.v1.StateKey.MultimapKeysSideInput.window', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8755,
+  serialized_end=8839,
+)
+
+_STATEKEY_BAGUSERSTATE = _descriptor.Descriptor(
+  name='BagUserState',
+  full_name='org.apache.beam.model.fn_execution.v1.StateKey.BagUserState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.StateKey.BagUserState.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='user_state_id', full_name='org.apache.beam.model.fn_execution.v1.StateKey.BagUserState.user_state_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='window', full_name='org.apache.beam.model.fn_execution.v1.StateKey.BagUserState.window', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.StateKey.BagUserState.key', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8841,
+  serialized_end=8929,
+)
+
+_STATEKEY = _descriptor.Descriptor(
+  name='StateKey',
+  full_name='org.apache.beam.model.fn_execution.v1.StateKey',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='runner', full_name='org.apache.beam.model.fn_execution.v1.StateKey.runner', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='multimap_side_input', full_name='org.apache.beam.model.fn_execution.v1.StateKey.multimap_side_input', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bag_user_state', full_name='org.apache.beam.model.fn_execution.v1.StateKey.bag_user_state', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='iterable_side_input', full_name='org.apache.beam.model.fn_execution.v1.StateKey.iterable_side_input', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='multimap_keys_side_input', full_name='org.apache.beam.model.fn_execution.v1.StateKey.multimap_keys_side_input', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_STATEKEY_RUNNER, _STATEKEY_ITERABLESIDEINPUT, _STATEKEY_MULTIMAPSIDEINPUT, _STATEKEY_MULTIMAPKEYSSIDEINPUT, _STATEKEY_BAGUSERSTATE, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='type', full_name='org.apache.beam.model.fn_execution.v1.StateKey.type',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=8078,
+  serialized_end=8937,
+)
+
+
+_STATEGETREQUEST = _descriptor.Descriptor(
+  name='StateGetRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.StateGetRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='continuation_token', full_name='org.apache.beam.model.fn_execution.v1.StateGetRequest.continuation_token', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8939,
+  serialized_end=8984,
+)
+
+
+_STATEGETRESPONSE = _descriptor.Descriptor(
+  name='StateGetResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.StateGetResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='continuation_token', full_name='org.apache.beam.model.fn_execution.v1.StateGetResponse.continuation_token', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.fn_execution.v1.StateGetResponse.data', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8986,
+  serialized_end=9046,
+)
+
+
+_STATEAPPENDREQUEST = _descriptor.Descriptor(
+  name='StateAppendRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.StateAppendRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.fn_execution.v1.StateAppendRequest.data', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9048,
+  serialized_end=9082,
+)
+
+
+_STATEAPPENDRESPONSE = _descriptor.Descriptor(
+  name='StateAppendResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.StateAppendResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9084,
+  serialized_end=9105,
+)
+
+
+_STATECLEARREQUEST = _descriptor.Descriptor(
+  name='StateClearRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.StateClearRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9107,
+  serialized_end=9126,
+)
+
+
+_STATECLEARRESPONSE = _descriptor.Descriptor(
+  name='StateClearResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.StateClearResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9128,
+  serialized_end=9148,
+)
+
+
+_LOGENTRY_LIST = _descriptor.Descriptor(
+  name='List',
+  full_name='org.apache.beam.model.fn_execution.v1.LogEntry.List',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='log_entries', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.List.log_entries', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9407,
+  serialized_end=9483,
+)
+
+_LOGENTRY_SEVERITY = _descriptor.Descriptor(
+  name='Severity',
+  full_name='org.apache.beam.model.fn_execution.v1.LogEntry.Severity',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _LOGENTRY_SEVERITY_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9485,
+  serialized_end=9599,
+)
+
+_LOGENTRY = _descriptor.Descriptor(
+  name='LogEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.LogEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='severity', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.severity', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.timestamp', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='message', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.message', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='trace', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.trace', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='instruction_id', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.instruction_id', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.transform_id', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='log_location', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.log_location', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='thread', full_name='org.apache.beam.model.fn_execution.v1.LogEntry.thread', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_LOGENTRY_LIST, _LOGENTRY_SEVERITY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9151,
+  serialized_end=9599,
+)
+
+
+_LOGCONTROL = _descriptor.Descriptor(
+  name='LogControl',
+  full_name='org.apache.beam.model.fn_execution.v1.LogControl',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9601,
+  serialized_end=9613,
+)
+
+
+_STARTWORKERREQUEST_PARAMSENTRY = _descriptor.Descriptor(
+  name='ParamsEntry',
+  full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.ParamsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.ParamsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.ParamsEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10079,
+  serialized_end=10124,
+)
+
+_STARTWORKERREQUEST = _descriptor.Descriptor(
+  name='StartWorkerRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='worker_id', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.worker_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='control_endpoint', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.control_endpoint', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='logging_endpoint', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.logging_endpoint', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='artifact_endpoint', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.artifact_endpoint', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='provision_endpoint', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.provision_endpoint', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='params', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerRequest.params', index=5,
+      number=10, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_STARTWORKERREQUEST_PARAMSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9616,
+  serialized_end=10124,
+)
+
+
+_STARTWORKERRESPONSE = _descriptor.Descriptor(
+  name='StartWorkerResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.StartWorkerResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='error', full_name='org.apache.beam.model.fn_execution.v1.StartWorkerResponse.error', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10126,
+  serialized_end=10162,
+)
+
+
+_STOPWORKERREQUEST = _descriptor.Descriptor(
+  name='StopWorkerRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.StopWorkerRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='worker_id', full_name='org.apache.beam.model.fn_execution.v1.StopWorkerRequest.worker_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10164,
+  serialized_end=10202,
+)
+
+
+_STOPWORKERRESPONSE = _descriptor.Descriptor(
+  name='StopWorkerResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.StopWorkerResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='error', full_name='org.apache.beam.model.fn_execution.v1.StopWorkerResponse.error', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10204,
+  serialized_end=10239,
+)
+
+
+_WORKERSTATUSREQUEST = _descriptor.Descriptor(
+  name='WorkerStatusRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.WorkerStatusRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='org.apache.beam.model.fn_execution.v1.WorkerStatusRequest.id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10241,
+  serialized_end=10274,
+)
+
+
+_WORKERSTATUSRESPONSE = _descriptor.Descriptor(
+  name='WorkerStatusResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.WorkerStatusResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='org.apache.beam.model.fn_execution.v1.WorkerStatusResponse.id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='org.apache.beam.model.fn_execution.v1.WorkerStatusResponse.error', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status_info', full_name='org.apache.beam.model.fn_execution.v1.WorkerStatusResponse.status_info', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10276,
+  serialized_end=10346,
+)
+
+_REMOTEGRPCPORT.fields_by_name['api_service_descriptor'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_INSTRUCTIONREQUEST.fields_by_name['register'].message_type = _REGISTERREQUEST
+_INSTRUCTIONREQUEST.fields_by_name['process_bundle'].message_type = _PROCESSBUNDLEREQUEST
+_INSTRUCTIONREQUEST.fields_by_name['process_bundle_progress'].message_type = _PROCESSBUNDLEPROGRESSREQUEST
+_INSTRUCTIONREQUEST.fields_by_name['process_bundle_split'].message_type = _PROCESSBUNDLESPLITREQUEST
+_INSTRUCTIONREQUEST.fields_by_name['finalize_bundle'].message_type = _FINALIZEBUNDLEREQUEST
+_INSTRUCTIONREQUEST.oneofs_by_name['request'].fields.append(
+  _INSTRUCTIONREQUEST.fields_by_name['register'])
+_INSTRUCTIONREQUEST.fields_by_name['register'].containing_oneof = _INSTRUCTIONREQUEST.oneofs_by_name['request']
+_INSTRUCTIONREQUEST.oneofs_by_name['request'].fields.append(
+  _INSTRUCTIONREQUEST.fields_by_name['process_bundle'])
+_INSTRUCTIONREQUEST.fields_by_name['process_bundle'].containing_oneof = _INSTRUCTIONREQUEST.oneofs_by_name['request']
+_INSTRUCTIONREQUEST.oneofs_by_name['request'].fields.append(
+  _INSTRUCTIONREQUEST.fields_by_name['process_bundle_progress'])
+_INSTRUCTIONREQUEST.fields_by_name['process_bundle_progress'].containing_oneof = _INSTRUCTIONREQUEST.oneofs_by_name['request']
+_INSTRUCTIONREQUEST.oneofs_by_name['request'].fields.append(
+  _INSTRUCTIONREQUEST.fields_by_name['process_bundle_split'])
+_INSTRUCTIONREQUEST.fields_by_name['process_bundle_split'].containing_oneof = _INSTRUCTIONREQUEST.oneofs_by_name['request']
+_INSTRUCTIONREQUEST.oneofs_by_name['request'].fields.append(
+  _INSTRUCTIONREQUEST.fields_by_name['finalize_bundle'])
+_INSTRUCTIONREQUEST.fields_by_name['finalize_bundle'].containing_oneof = _INSTRUCTIONREQUEST.oneofs_by_name['request']
+_INSTRUCTIONRESPONSE.fields_by_name['register'].message_type = _REGISTERRESPONSE
+_INSTRUCTIONRESPONSE.fields_by_name['process_bundle'].message_type = _PROCESSBUNDLERESPONSE
+_INSTRUCTIONRESPONSE.fields_by_name['process_bundle_progress'].message_type = _PROCESSBUNDLEPROGRESSRESPONSE
+_INSTRUCTIONRESPONSE.fields_by_name['process_bundle_split'].message_type = _PROCESSBUNDLESPLITRESPONSE
+_INSTRUCTIONRESPONSE.fields_by_name['finalize_bundle'].message_type = _FINALIZEBUNDLERESPONSE
+_INSTRUCTIONRESPONSE.oneofs_by_name['response'].fields.append(
+  _INSTRUCTIONRESPONSE.fields_by_name['register'])
+_INSTRUCTIONRESPONSE.fields_by_name['register'].containing_oneof = _INSTRUCTIONRESPONSE.oneofs_by_name['response']
+_INSTRUCTIONRESPONSE.oneofs_by_name['response'].fields.append(
+  _INSTRUCTIONRESPONSE.fields_by_name['process_bundle'])
+_INSTRUCTIONRESPONSE.fields_by_name['process_bundle'].containing_oneof = _INSTRUCTIONRESPONSE.oneofs_by_name['response']
+_INSTRUCTIONRESPONSE.oneofs_by_name['response'].fields.append(
+  _INSTRUCTIONRESPONSE.fields_by_name['process_bundle_progress'])
+_INSTRUCTIONRESPONSE.fields_by_name['process_bundle_progress'].containing_oneof = _INSTRUCTIONRESPONSE.oneofs_by_name['response']
+_INSTRUCTIONRESPONSE.oneofs_by_name['response'].fields.append(
+  _INSTRUCTIONRESPONSE.fields_by_name['process_bundle_split'])
+_INSTRUCTIONRESPONSE.fields_by_name['process_bundle_split'].containing_oneof = _INSTRUCTIONRESPONSE.oneofs_by_name['response']
+_INSTRUCTIONRESPONSE.oneofs_by_name['response'].fields.append(
+  _INSTRUCTIONRESPONSE.fields_by_name['finalize_bundle'])
+_INSTRUCTIONRESPONSE.fields_by_name['finalize_bundle'].containing_oneof = _INSTRUCTIONRESPONSE.oneofs_by_name['response']
+_REGISTERREQUEST.fields_by_name['process_bundle_descriptor'].message_type = _PROCESSBUNDLEDESCRIPTOR
+_PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY.fields_by_name['value'].message_type = beam__runner__api__pb2._PTRANSFORM
+_PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY.containing_type = _PROCESSBUNDLEDESCRIPTOR
+_PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY.fields_by_name['value'].message_type = beam__runner__api__pb2._PCOLLECTION
+_PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY.containing_type = _PROCESSBUNDLEDESCRIPTOR
+_PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY.fields_by_name['value'].message_type = beam__runner__api__pb2._WINDOWINGSTRATEGY
+_PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY.containing_type = _PROCESSBUNDLEDESCRIPTOR
+_PROCESSBUNDLEDESCRIPTOR_CODERSENTRY.fields_by_name['value'].message_type = beam__runner__api__pb2._CODER
+_PROCESSBUNDLEDESCRIPTOR_CODERSENTRY.containing_type = _PROCESSBUNDLEDESCRIPTOR
+_PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY.fields_by_name['value'].message_type = beam__runner__api__pb2._ENVIRONMENT
+_PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY.containing_type = _PROCESSBUNDLEDESCRIPTOR
+_PROCESSBUNDLEDESCRIPTOR.fields_by_name['transforms'].message_type = _PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY
+_PROCESSBUNDLEDESCRIPTOR.fields_by_name['pcollections'].message_type = _PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY
+_PROCESSBUNDLEDESCRIPTOR.fields_by_name['windowing_strategies'].message_type = _PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY
+_PROCESSBUNDLEDESCRIPTOR.fields_by_name['coders'].message_type = _PROCESSBUNDLEDESCRIPTOR_CODERSENTRY
+_PROCESSBUNDLEDESCRIPTOR.fields_by_name['environments'].message_type = _PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY
+_PROCESSBUNDLEDESCRIPTOR.fields_by_name['state_api_service_descriptor'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY.fields_by_name['value'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY.containing_type = _BUNDLEAPPLICATION
+_BUNDLEAPPLICATION.fields_by_name['output_watermarks'].message_type = _BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY
+_BUNDLEAPPLICATION.fields_by_name['is_bounded'].enum_type = beam__runner__api__pb2._ISBOUNDED_ENUM
+_DELAYEDBUNDLEAPPLICATION.fields_by_name['application'].message_type = _BUNDLEAPPLICATION
+_DELAYEDBUNDLEAPPLICATION.fields_by_name['requested_time_delay'].message_type = google_dot_protobuf_dot_duration__pb2._DURATION
+_PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE.containing_type = _PROCESSBUNDLEREQUEST_CACHETOKEN
+_PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT.containing_type = _PROCESSBUNDLEREQUEST_CACHETOKEN
+_PROCESSBUNDLEREQUEST_CACHETOKEN.fields_by_name['user_state'].message_type = _PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE
+_PROCESSBUNDLEREQUEST_CACHETOKEN.fields_by_name['side_input'].message_type = _PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT
+_PROCESSBUNDLEREQUEST_CACHETOKEN.containing_type = _PROCESSBUNDLEREQUEST
+_PROCESSBUNDLEREQUEST_CACHETOKEN.oneofs_by_name['type'].fields.append(
+  _PROCESSBUNDLEREQUEST_CACHETOKEN.fields_by_name['user_state'])
+_PROCESSBUNDLEREQUEST_CACHETOKEN.fields_by_name['user_state'].containing_oneof = _PROCESSBUNDLEREQUEST_CACHETOKEN.oneofs_by_name['type']
+_PROCESSBUNDLEREQUEST_CACHETOKEN.oneofs_by_name['type'].fields.append(
+  _PROCESSBUNDLEREQUEST_CACHETOKEN.fields_by_name['side_input'])
+_PROCESSBUNDLEREQUEST_CACHETOKEN.fields_by_name['side_input'].containing_oneof = _PROCESSBUNDLEREQUEST_CACHETOKEN.oneofs_by_name['type']
+_PROCESSBUNDLEREQUEST.fields_by_name['cache_tokens'].message_type = _PROCESSBUNDLEREQUEST_CACHETOKEN
+_PROCESSBUNDLERESPONSE.fields_by_name['metrics'].message_type = _METRICS
+_PROCESSBUNDLERESPONSE.fields_by_name['residual_roots'].message_type = _DELAYEDBUNDLEAPPLICATION
+_PROCESSBUNDLERESPONSE.fields_by_name['monitoring_infos'].message_type = metrics__pb2._MONITORINGINFO
+_METRICS_PTRANSFORM_MEASURED_INPUTELEMENTCOUNTSENTRY.containing_type = _METRICS_PTRANSFORM_MEASURED
+_METRICS_PTRANSFORM_MEASURED_OUTPUTELEMENTCOUNTSENTRY.containing_type = _METRICS_PTRANSFORM_MEASURED
+_METRICS_PTRANSFORM_MEASURED.fields_by_name['input_element_counts'].message_type = _METRICS_PTRANSFORM_MEASURED_INPUTELEMENTCOUNTSENTRY
+_METRICS_PTRANSFORM_MEASURED.fields_by_name['output_element_counts'].message_type = _METRICS_PTRANSFORM_MEASURED_OUTPUTELEMENTCOUNTSENTRY
+_METRICS_PTRANSFORM_MEASURED.containing_type = _METRICS_PTRANSFORM
+_METRICS_PTRANSFORM_PROCESSEDELEMENTS.fields_by_name['measured'].message_type = _METRICS_PTRANSFORM_MEASURED
+_METRICS_PTRANSFORM_PROCESSEDELEMENTS.containing_type = _METRICS_PTRANSFORM
+_METRICS_PTRANSFORM_ACTIVEELEMENTS_OUTPUTELEMENTSREMAININGENTRY.containing_type = _METRICS_PTRANSFORM_ACTIVEELEMENTS
+_METRICS_PTRANSFORM_ACTIVEELEMENTS.fields_by_name['measured'].message_type = _METRICS_PTRANSFORM_MEASURED
+_METRICS_PTRANSFORM_ACTIVEELEMENTS.fields_by_name['output_elements_remaining'].message_type = _METRICS_PTRANSFORM_ACTIVEELEMENTS_OUTPUTELEMENTSREMAININGENTRY
+_METRICS_PTRANSFORM_ACTIVEELEMENTS.containing_type = _METRICS_PTRANSFORM
+_METRICS_PTRANSFORM_WATERMARKSENTRY.containing_type = _METRICS_PTRANSFORM
+_METRICS_PTRANSFORM.fields_by_name['processed_elements'].message_type = _METRICS_PTRANSFORM_PROCESSEDELEMENTS
+_METRICS_PTRANSFORM.fields_by_name['active_elements'].message_type = _METRICS_PTRANSFORM_ACTIVEELEMENTS
+_METRICS_PTRANSFORM.fields_by_name['watermarks'].message_type = _METRICS_PTRANSFORM_WATERMARKSENTRY
+_METRICS_PTRANSFORM.fields_by_name['user'].message_type = _METRICS_USER
+_METRICS_PTRANSFORM.containing_type = _METRICS
+_METRICS_USER_METRICNAME.containing_type = _METRICS_USER
+_METRICS_USER_COUNTERDATA.containing_type = _METRICS_USER
+_METRICS_USER_DISTRIBUTIONDATA.containing_type = _METRICS_USER
+_METRICS_USER_GAUGEDATA.fields_by_name['timestamp'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_METRICS_USER_GAUGEDATA.containing_type = _METRICS_USER
+_METRICS_USER.fields_by_name['metric_name'].message_type = _METRICS_USER_METRICNAME
+_METRICS_USER.fields_by_name['counter_data'].message_type = _METRICS_USER_COUNTERDATA
+_METRICS_USER.fields_by_name['distribution_data'].message_type = _METRICS_USER_DISTRIBUTIONDATA
+_METRICS_USER.fields_by_name['gauge_data'].message_type = _METRICS_USER_GAUGEDATA
+_METRICS_USER.containing_type = _METRICS
+_METRICS_USER.oneofs_by_name['data'].fields.append(
+  _METRICS_USER.fields_by_name['counter_data'])
+_METRICS_USER.fields_by_name['counter_data'].containing_oneof = _METRICS_USER.oneofs_by_name['data']
+_METRICS_USER.oneofs_by_name['data'].fields.append(
+  _METRICS_USER.fields_by_name['distribution_data'])
+_METRICS_USER.fields_by_name['distribution_data'].containing_oneof = _METRICS_USER.oneofs_by_name['data']
+_METRICS_USER.oneofs_by_name['data'].fields.append(
+  _METRICS_USER.fields_by_name['gauge_data'])
+_METRICS_USER.fields_by_name['gauge_data'].containing_oneof = _METRICS_USER.oneofs_by_name['data']
+_METRICS_PTRANSFORMSENTRY.fields_by_name['value'].message_type = _METRICS_PTRANSFORM
+_METRICS_PTRANSFORMSENTRY.containing_type = _METRICS
+_METRICS.fields_by_name['ptransforms'].message_type = _METRICS_PTRANSFORMSENTRY
+_PROCESSBUNDLEPROGRESSRESPONSE.fields_by_name['metrics'].message_type = _METRICS
+_PROCESSBUNDLEPROGRESSRESPONSE.fields_by_name['monitoring_infos'].message_type = metrics__pb2._MONITORINGINFO
+_PROCESSBUNDLEPROGRESSRESPONSE.fields_by_name['primary_roots'].message_type = _BUNDLEAPPLICATION
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT.containing_type = _PROCESSBUNDLESPLITREQUEST
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY.fields_by_name['value'].message_type = _PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY.containing_type = _PROCESSBUNDLESPLITREQUEST
+_PROCESSBUNDLESPLITREQUEST.fields_by_name['desired_splits'].message_type = _PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY
+_PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT.containing_type = _PROCESSBUNDLESPLITRESPONSE
+_PROCESSBUNDLESPLITRESPONSE.fields_by_name['primary_roots'].message_type = _BUNDLEAPPLICATION
+_PROCESSBUNDLESPLITRESPONSE.fields_by_name['residual_roots'].message_type = _DELAYEDBUNDLEAPPLICATION
+_PROCESSBUNDLESPLITRESPONSE.fields_by_name['channel_splits'].message_type = _PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT
+_ELEMENTS_DATA.containing_type = _ELEMENTS
+_ELEMENTS.fields_by_name['data'].message_type = _ELEMENTS_DATA
+_STATEREQUEST.fields_by_name['state_key'].message_type = _STATEKEY
+_STATEREQUEST.fields_by_name['get'].message_type = _STATEGETREQUEST
+_STATEREQUEST.fields_by_name['append'].message_type = _STATEAPPENDREQUEST
+_STATEREQUEST.fields_by_name['clear'].message_type = _STATECLEARREQUEST
+_STATEREQUEST.oneofs_by_name['request'].fields.append(
+  _STATEREQUEST.fields_by_name['get'])
+_STATEREQUEST.fields_by_name['get'].containing_oneof = _STATEREQUEST.oneofs_by_name['request']
+_STATEREQUEST.oneofs_by_name['request'].fields.append(
+  _STATEREQUEST.fields_by_name['append'])
+_STATEREQUEST.fields_by_name['append'].containing_oneof = _STATEREQUEST.oneofs_by_name['request']
+_STATEREQUEST.oneofs_by_name['request'].fields.append(
+  _STATEREQUEST.fields_by_name['clear'])
+_STATEREQUEST.fields_by_name['clear'].containing_oneof = _STATEREQUEST.oneofs_by_name['request']
+_STATERESPONSE.fields_by_name['get'].message_type = _STATEGETRESPONSE
+_STATERESPONSE.fields_by_name['append'].message_type = _STATEAPPENDRESPONSE
+_STATERESPONSE.fields_by_name['clear'].message_type = _STATECLEARRESPONSE
+_STATERESPONSE.oneofs_by_name['response'].fields.append(
+  _STATERESPONSE.fields_by_name['get'])
+_STATERESPONSE.fields_by_name['get'].containing_oneof = _STATERESPONSE.oneofs_by_name['response']
+_STATERESPONSE.oneofs_by_name['response'].fields.append(
+  _STATERESPONSE.fields_by_name['append'])
+_STATERESPONSE.fields_by_name['append'].containing_oneof = _STATERESPONSE.oneofs_by_name['response']
+_STATERESPONSE.oneofs_by_name['response'].fields.append(
+  _STATERESPONSE.fields_by_name['clear'])
+_STATERESPONSE.fields_by_name['clear'].containing_oneof = _STATERESPONSE.oneofs_by_name['response']
+_STATEKEY_RUNNER.containing_type = _STATEKEY
+_STATEKEY_ITERABLESIDEINPUT.containing_type = _STATEKEY
+_STATEKEY_MULTIMAPSIDEINPUT.containing_type = _STATEKEY
+_STATEKEY_MULTIMAPKEYSSIDEINPUT.containing_type = _STATEKEY
+_STATEKEY_BAGUSERSTATE.containing_type = _STATEKEY
+_STATEKEY.fields_by_name['runner'].message_type = _STATEKEY_RUNNER
+_STATEKEY.fields_by_name['multimap_side_input'].message_type = _STATEKEY_MULTIMAPSIDEINPUT
+_STATEKEY.fields_by_name['bag_user_state'].message_type = _STATEKEY_BAGUSERSTATE
+_STATEKEY.fields_by_name['iterable_side_input'].message_type = _STATEKEY_ITERABLESIDEINPUT
+_STATEKEY.fields_by_name['multimap_keys_side_input'].message_type = _STATEKEY_MULTIMAPKEYSSIDEINPUT
+_STATEKEY.oneofs_by_name['type'].fields.append(
+  _STATEKEY.fields_by_name['runner'])
+_STATEKEY.fields_by_name['runner'].containing_oneof = _STATEKEY.oneofs_by_name['type']
+_STATEKEY.oneofs_by_name['type'].fields.append(
+  _STATEKEY.fields_by_name['multimap_side_input'])
+_STATEKEY.fields_by_name['multimap_side_input'].containing_oneof = _STATEKEY.oneofs_by_name['type']
+_STATEKEY.oneofs_by_name['type'].fields.append(
+  _STATEKEY.fields_by_name['bag_user_state'])
+_STATEKEY.fields_by_name['bag_user_state'].containing_oneof = _STATEKEY.oneofs_by_name['type']
+_STATEKEY.oneofs_by_name['type'].fields.append(
+  _STATEKEY.fields_by_name['iterable_side_input'])
+_STATEKEY.fields_by_name['iterable_side_input'].containing_oneof = _STATEKEY.oneofs_by_name['type']
+_STATEKEY.oneofs_by_name['type'].fields.append(
+  _STATEKEY.fields_by_name['multimap_keys_side_input'])
+_STATEKEY.fields_by_name['multimap_keys_side_input'].containing_oneof = _STATEKEY.oneofs_by_name['type']
+_LOGENTRY_LIST.fields_by_name['log_entries'].message_type = _LOGENTRY
+_LOGENTRY_LIST.containing_type = _LOGENTRY
+_LOGENTRY_SEVERITY.containing_type = _LOGENTRY
+_LOGENTRY_SEVERITY_ENUM.containing_type = _LOGENTRY_SEVERITY
+_LOGENTRY.fields_by_name['severity'].enum_type = _LOGENTRY_SEVERITY_ENUM
+_LOGENTRY.fields_by_name['timestamp'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_STARTWORKERREQUEST_PARAMSENTRY.containing_type = _STARTWORKERREQUEST
+_STARTWORKERREQUEST.fields_by_name['control_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_STARTWORKERREQUEST.fields_by_name['logging_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_STARTWORKERREQUEST.fields_by_name['artifact_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_STARTWORKERREQUEST.fields_by_name['provision_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_STARTWORKERREQUEST.fields_by_name['params'].message_type = _STARTWORKERREQUEST_PARAMSENTRY
+DESCRIPTOR.message_types_by_name['RemoteGrpcPort'] = _REMOTEGRPCPORT
+DESCRIPTOR.message_types_by_name['InstructionRequest'] = _INSTRUCTIONREQUEST
+DESCRIPTOR.message_types_by_name['InstructionResponse'] = _INSTRUCTIONRESPONSE
+DESCRIPTOR.message_types_by_name['RegisterRequest'] = _REGISTERREQUEST
+DESCRIPTOR.message_types_by_name['RegisterResponse'] = _REGISTERRESPONSE
+DESCRIPTOR.message_types_by_name['ProcessBundleDescriptor'] = _PROCESSBUNDLEDESCRIPTOR
+DESCRIPTOR.message_types_by_name['BundleApplication'] = _BUNDLEAPPLICATION
+DESCRIPTOR.message_types_by_name['DelayedBundleApplication'] = _DELAYEDBUNDLEAPPLICATION
+DESCRIPTOR.message_types_by_name['ProcessBundleRequest'] = _PROCESSBUNDLEREQUEST
+DESCRIPTOR.message_types_by_name['ProcessBundleResponse'] = _PROCESSBUNDLERESPONSE
+DESCRIPTOR.message_types_by_name['ProcessBundleProgressRequest'] = _PROCESSBUNDLEPROGRESSREQUEST
+DESCRIPTOR.message_types_by_name['Metrics'] = _METRICS
+DESCRIPTOR.message_types_by_name['ProcessBundleProgressResponse'] = _PROCESSBUNDLEPROGRESSRESPONSE
+DESCRIPTOR.message_types_by_name['ProcessBundleSplitRequest'] = _PROCESSBUNDLESPLITREQUEST
+DESCRIPTOR.message_types_by_name['ProcessBundleSplitResponse'] = _PROCESSBUNDLESPLITRESPONSE
+DESCRIPTOR.message_types_by_name['FinalizeBundleRequest'] = _FINALIZEBUNDLEREQUEST
+DESCRIPTOR.message_types_by_name['FinalizeBundleResponse'] = _FINALIZEBUNDLERESPONSE
+DESCRIPTOR.message_types_by_name['Elements'] = _ELEMENTS
+DESCRIPTOR.message_types_by_name['StateRequest'] = _STATEREQUEST
+DESCRIPTOR.message_types_by_name['StateResponse'] = _STATERESPONSE
+DESCRIPTOR.message_types_by_name['StateKey'] = _STATEKEY
+DESCRIPTOR.message_types_by_name['StateGetRequest'] = _STATEGETREQUEST
+DESCRIPTOR.message_types_by_name['StateGetResponse'] = _STATEGETRESPONSE
+DESCRIPTOR.message_types_by_name['StateAppendRequest'] = _STATEAPPENDREQUEST
+DESCRIPTOR.message_types_by_name['StateAppendResponse'] = _STATEAPPENDRESPONSE
+DESCRIPTOR.message_types_by_name['StateClearRequest'] = _STATECLEARREQUEST
+DESCRIPTOR.message_types_by_name['StateClearResponse'] = _STATECLEARRESPONSE
+DESCRIPTOR.message_types_by_name['LogEntry'] = _LOGENTRY
+DESCRIPTOR.message_types_by_name['LogControl'] = _LOGCONTROL
+DESCRIPTOR.message_types_by_name['StartWorkerRequest'] = _STARTWORKERREQUEST
+DESCRIPTOR.message_types_by_name['StartWorkerResponse'] = _STARTWORKERRESPONSE
+DESCRIPTOR.message_types_by_name['StopWorkerRequest'] = _STOPWORKERREQUEST
+DESCRIPTOR.message_types_by_name['StopWorkerResponse'] = _STOPWORKERRESPONSE
+DESCRIPTOR.message_types_by_name['WorkerStatusRequest'] = _WORKERSTATUSREQUEST
+DESCRIPTOR.message_types_by_name['WorkerStatusResponse'] = _WORKERSTATUSRESPONSE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+RemoteGrpcPort = _reflection.GeneratedProtocolMessageType('RemoteGrpcPort', (_message.Message,), dict(
+  DESCRIPTOR = _REMOTEGRPCPORT,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.RemoteGrpcPort)
+  ))
+_sym_db.RegisterMessage(RemoteGrpcPort)
+
+InstructionRequest = _reflection.GeneratedProtocolMessageType('InstructionRequest', (_message.Message,), dict(
+  DESCRIPTOR = _INSTRUCTIONREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.InstructionRequest)
+  ))
+_sym_db.RegisterMessage(InstructionRequest)
+
+InstructionResponse = _reflection.GeneratedProtocolMessageType('InstructionResponse', (_message.Message,), dict(
+  DESCRIPTOR = _INSTRUCTIONRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.InstructionResponse)
+  ))
+_sym_db.RegisterMessage(InstructionResponse)
+
+RegisterRequest = _reflection.GeneratedProtocolMessageType('RegisterRequest', (_message.Message,), dict(
+  DESCRIPTOR = _REGISTERREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.RegisterRequest)
+  ))
+_sym_db.RegisterMessage(RegisterRequest)
+
+RegisterResponse = _reflection.GeneratedProtocolMessageType('RegisterResponse', (_message.Message,), dict(
+  DESCRIPTOR = _REGISTERRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.RegisterResponse)
+  ))
+_sym_db.RegisterMessage(RegisterResponse)
+
+ProcessBundleDescriptor = _reflection.GeneratedProtocolMessageType('ProcessBundleDescriptor', (_message.Message,), dict(
+
+  TransformsEntry = _reflection.GeneratedProtocolMessageType('TransformsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.TransformsEntry)
+    ))
+  ,
+
+  PcollectionsEntry = _reflection.GeneratedProtocolMessageType('PcollectionsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.PcollectionsEntry)
+    ))
+  ,
+
+  WindowingStrategiesEntry = _reflection.GeneratedProtocolMessageType('WindowingStrategiesEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.WindowingStrategiesEntry)
+    ))
+  ,
+
+  CodersEntry = _reflection.GeneratedProtocolMessageType('CodersEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSBUNDLEDESCRIPTOR_CODERSENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.CodersEntry)
+    ))
+  ,
+
+  EnvironmentsEntry = _reflection.GeneratedProtocolMessageType('EnvironmentsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.EnvironmentsEntry)
+    ))
+  ,
+  DESCRIPTOR = _PROCESSBUNDLEDESCRIPTOR,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor)
+  ))
+_sym_db.RegisterMessage(ProcessBundleDescriptor)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.TransformsEntry)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.PcollectionsEntry)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.WindowingStrategiesEntry)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.CodersEntry)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.EnvironmentsEntry)
+
+BundleApplication = _reflection.GeneratedProtocolMessageType('BundleApplication', (_message.Message,), dict(
+
+  OutputWatermarksEntry = _reflection.GeneratedProtocolMessageType('OutputWatermarksEntry', (_message.Message,), dict(
+    DESCRIPTOR = _BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.BundleApplication.OutputWatermarksEntry)
+    ))
+  ,
+  DESCRIPTOR = _BUNDLEAPPLICATION,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.BundleApplication)
+  ))
+_sym_db.RegisterMessage(BundleApplication)
+_sym_db.RegisterMessage(BundleApplication.OutputWatermarksEntry)
+
+DelayedBundleApplication = _reflection.GeneratedProtocolMessageType('DelayedBundleApplication', (_message.Message,), dict(
+  DESCRIPTOR = _DELAYEDBUNDLEAPPLICATION,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.DelayedBundleApplication)
+  ))
+_sym_db.RegisterMessage(DelayedBundleApplication)
+
+ProcessBundleRequest = _reflection.GeneratedProtocolMessageType('ProcessBundleRequest', (_message.Message,), dict(
+
+  CacheToken = _reflection.GeneratedProtocolMessageType('CacheToken', (_message.Message,), dict(
+
+    UserState = _reflection.GeneratedProtocolMessageType('UserState', (_message.Message,), dict(
+      DESCRIPTOR = _PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.UserState)
+      ))
+    ,
+
+    SideInput = _reflection.GeneratedProtocolMessageType('SideInput', (_message.Message,), dict(
+      DESCRIPTOR = _PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.SideInput)
+      ))
+    ,
+    DESCRIPTOR = _PROCESSBUNDLEREQUEST_CACHETOKEN,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken)
+    ))
+  ,
+  DESCRIPTOR = _PROCESSBUNDLEREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleRequest)
+  ))
+_sym_db.RegisterMessage(ProcessBundleRequest)
+_sym_db.RegisterMessage(ProcessBundleRequest.CacheToken)
+_sym_db.RegisterMessage(ProcessBundleRequest.CacheToken.UserState)
+_sym_db.RegisterMessage(ProcessBundleRequest.CacheToken.SideInput)
+
+ProcessBundleResponse = _reflection.GeneratedProtocolMessageType('ProcessBundleResponse', (_message.Message,), dict(
+  DESCRIPTOR = _PROCESSBUNDLERESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleResponse)
+  ))
+_sym_db.RegisterMessage(ProcessBundleResponse)
+
+ProcessBundleProgressRequest = _reflection.GeneratedProtocolMessageType('ProcessBundleProgressRequest', (_message.Message,), dict(
+  DESCRIPTOR = _PROCESSBUNDLEPROGRESSREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleProgressRequest)
+  ))
+_sym_db.RegisterMessage(ProcessBundleProgressRequest)
+
+Metrics = _reflection.GeneratedProtocolMessageType('Metrics', (_message.Message,), dict(
+
+  PTransform = _reflection.GeneratedProtocolMessageType('PTransform', (_message.Message,), dict(
+
+    Measured = _reflection.GeneratedProtocolMessageType('Measured', (_message.Message,), dict(
+
+      InputElementCountsEntry = _reflection.GeneratedProtocolMessageType('InputElementCountsEntry', (_message.Message,), dict(
+        DESCRIPTOR = _METRICS_PTRANSFORM_MEASURED_INPUTELEMENTCOUNTSENTRY,
+        __module__ = 'beam_fn_api_pb2'
+        # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.InputElementCountsEntry)
+        ))
+      ,
+
+      OutputElementCountsEntry = _reflection.GeneratedProtocolMessageType('OutputElementCountsEntry', (_message.Message,), dict(
+        DESCRIPTOR = _METRICS_PTRANSFORM_MEASURED_OUTPUTELEMENTCOUNTSENTRY,
+        __module__ = 'beam_fn_api_pb2'
+        # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured.OutputElementCountsEntry)
+        ))
+      ,
+      DESCRIPTOR = _METRICS_PTRANSFORM_MEASURED,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PTransform.Measured)
+      ))
+    ,
+
+    ProcessedElements = _reflection.GeneratedProtocolMessageType('ProcessedElements', (_message.Message,), dict(
+      DESCRIPTOR = _METRICS_PTRANSFORM_PROCESSEDELEMENTS,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ProcessedElements)
+      ))
+    ,
+
+    ActiveElements = _reflection.GeneratedProtocolMessageType('ActiveElements', (_message.Message,), dict(
+
+      OutputElementsRemainingEntry = _reflection.GeneratedProtocolMessageType('OutputElementsRemainingEntry', (_message.Message,), dict(
+        DESCRIPTOR = _METRICS_PTRANSFORM_ACTIVEELEMENTS_OUTPUTELEMENTSREMAININGENTRY,
+        __module__ = 'beam_fn_api_pb2'
+        # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements.OutputElementsRemainingEntry)
+        ))
+      ,
+      DESCRIPTOR = _METRICS_PTRANSFORM_ACTIVEELEMENTS,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PTransform.ActiveElements)
+      ))
+    ,
+
+    WatermarksEntry = _reflection.GeneratedProtocolMessageType('WatermarksEntry', (_message.Message,), dict(
+      DESCRIPTOR = _METRICS_PTRANSFORM_WATERMARKSENTRY,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PTransform.WatermarksEntry)
+      ))
+    ,
+    DESCRIPTOR = _METRICS_PTRANSFORM,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PTransform)
+    ))
+  ,
+
+  User = _reflection.GeneratedProtocolMessageType('User', (_message.Message,), dict(
+
+    MetricName = _reflection.GeneratedProtocolMessageType('MetricName', (_message.Message,), dict(
+      DESCRIPTOR = _METRICS_USER_METRICNAME,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.User.MetricName)
+      ))
+    ,
+
+    CounterData = _reflection.GeneratedProtocolMessageType('CounterData', (_message.Message,), dict(
+      DESCRIPTOR = _METRICS_USER_COUNTERDATA,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.User.CounterData)
+      ))
+    ,
+
+    DistributionData = _reflection.GeneratedProtocolMessageType('DistributionData', (_message.Message,), dict(
+      DESCRIPTOR = _METRICS_USER_DISTRIBUTIONDATA,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.User.DistributionData)
+      ))
+    ,
+
+    GaugeData = _reflection.GeneratedProtocolMessageType('GaugeData', (_message.Message,), dict(
+      DESCRIPTOR = _METRICS_USER_GAUGEDATA,
+      __module__ = 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.User.GaugeData)
+      ))
+    ,
+    DESCRIPTOR = _METRICS_USER,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.User)
+    ))
+  ,
+
+  PtransformsEntry = _reflection.GeneratedProtocolMessageType('PtransformsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _METRICS_PTRANSFORMSENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics.PtransformsEntry)
+    ))
+  ,
+  DESCRIPTOR = _METRICS,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Metrics)
+  ))
+_sym_db.RegisterMessage(Metrics)
+_sym_db.RegisterMessage(Metrics.PTransform)
+_sym_db.RegisterMessage(Metrics.PTransform.Measured)
+_sym_db.RegisterMessage(Metrics.PTransform.Measured.InputElementCountsEntry)
+_sym_db.RegisterMessage(Metrics.PTransform.Measured.OutputElementCountsEntry)
+_sym_db.RegisterMessage(Metrics.PTransform.ProcessedElements)
+_sym_db.RegisterMessage(Metrics.PTransform.ActiveElements)
+_sym_db.RegisterMessage(Metrics.PTransform.ActiveElements.OutputElementsRemainingEntry)
+_sym_db.RegisterMessage(Metrics.PTransform.WatermarksEntry)
+_sym_db.RegisterMessage(Metrics.User)
+_sym_db.RegisterMessage(Metrics.User.MetricName)
+_sym_db.RegisterMessage(Metrics.User.CounterData)
+_sym_db.RegisterMessage(Metrics.User.DistributionData)
+_sym_db.RegisterMessage(Metrics.User.GaugeData)
+_sym_db.RegisterMessage(Metrics.PtransformsEntry)
+
+ProcessBundleProgressResponse = _reflection.GeneratedProtocolMessageType('ProcessBundleProgressResponse', (_message.Message,), dict(
+  DESCRIPTOR = _PROCESSBUNDLEPROGRESSRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponse)
+  ))
+_sym_db.RegisterMessage(ProcessBundleProgressResponse)
+
+ProcessBundleSplitRequest = _reflection.GeneratedProtocolMessageType('ProcessBundleSplitRequest', (_message.Message,), dict(
+
+  DesiredSplit = _reflection.GeneratedProtocolMessageType('DesiredSplit', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplit)
+    ))
+  ,
+
+  DesiredSplitsEntry = _reflection.GeneratedProtocolMessageType('DesiredSplitsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplitsEntry)
+    ))
+  ,
+  DESCRIPTOR = _PROCESSBUNDLESPLITREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest)
+  ))
+_sym_db.RegisterMessage(ProcessBundleSplitRequest)
+_sym_db.RegisterMessage(ProcessBundleSplitRequest.DesiredSplit)
+_sym_db.RegisterMessage(ProcessBundleSplitRequest.DesiredSplitsEntry)
+
+ProcessBundleSplitResponse = _reflection.GeneratedProtocolMessageType('ProcessBundleSplitResponse', (_message.Message,), dict(
+
+  ChannelSplit = _reflection.GeneratedProtocolMessageType('ChannelSplit', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.ChannelSplit)
+    ))
+  ,
+  DESCRIPTOR = _PROCESSBUNDLESPLITRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse)
+  ))
+_sym_db.RegisterMessage(ProcessBundleSplitResponse)
+_sym_db.RegisterMessage(ProcessBundleSplitResponse.ChannelSplit)
+
+FinalizeBundleRequest = _reflection.GeneratedProtocolMessageType('FinalizeBundleRequest', (_message.Message,), dict(
+  DESCRIPTOR = _FINALIZEBUNDLEREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.FinalizeBundleRequest)
+  ))
+_sym_db.RegisterMessage(FinalizeBundleRequest)
+
+FinalizeBundleResponse = _reflection.GeneratedProtocolMessageType('FinalizeBundleResponse', (_message.Message,), dict(
+  DESCRIPTOR = _FINALIZEBUNDLERESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.FinalizeBundleResponse)
+  ))
+_sym_db.RegisterMessage(FinalizeBundleResponse)
+
+Elements = _reflection.GeneratedProtocolMessageType('Elements', (_message.Message,), dict(
+
+  Data = _reflection.GeneratedProtocolMessageType('Data', (_message.Message,), dict(
+    DESCRIPTOR = _ELEMENTS_DATA,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Elements.Data)
+    ))
+  ,
+  DESCRIPTOR = _ELEMENTS,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Elements)
+  ))
+_sym_db.RegisterMessage(Elements)
+_sym_db.RegisterMessage(Elements.Data)
+
+StateRequest = _reflection.GeneratedProtocolMessageType('StateRequest', (_message.Message,), dict(
+  DESCRIPTOR = _STATEREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateRequest)
+  ))
+_sym_db.RegisterMessage(StateRequest)
+
+StateResponse = _reflection.GeneratedProtocolMessageType('StateResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STATERESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateResponse)
+  ))
+_sym_db.RegisterMessage(StateResponse)
+
+StateKey = _reflection.GeneratedProtocolMessageType('StateKey', (_message.Message,), dict(
+
+  Runner = _reflection.GeneratedProtocolMessageType('Runner', (_message.Message,), dict(
+    DESCRIPTOR = _STATEKEY_RUNNER,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.Runner)
+    ))
+  ,
+
+  IterableSideInput = _reflection.GeneratedProtocolMessageType('IterableSideInput', (_message.Message,), dict(
+    DESCRIPTOR = _STATEKEY_ITERABLESIDEINPUT,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.IterableSideInput)
+    ))
+  ,
+
+  MultimapSideInput = _reflection.GeneratedProtocolMessageType('MultimapSideInput', (_message.Message,), dict(
+    DESCRIPTOR = _STATEKEY_MULTIMAPSIDEINPUT,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInput)
+    ))
+  ,
+
+  MultimapKeysSideInput = _reflection.GeneratedProtocolMessageType('MultimapKeysSideInput', (_message.Message,), dict(
+    DESCRIPTOR = _STATEKEY_MULTIMAPKEYSSIDEINPUT,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.MultimapKeysSideInput)
+    ))
+  ,
+
+  BagUserState = _reflection.GeneratedProtocolMessageType('BagUserState', (_message.Message,), dict(
+    DESCRIPTOR = _STATEKEY_BAGUSERSTATE,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.BagUserState)
+    ))
+  ,
+  DESCRIPTOR = _STATEKEY,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey)
+  ))
+_sym_db.RegisterMessage(StateKey)
+_sym_db.RegisterMessage(StateKey.Runner)
+_sym_db.RegisterMessage(StateKey.IterableSideInput)
+_sym_db.RegisterMessage(StateKey.MultimapSideInput)
+_sym_db.RegisterMessage(StateKey.MultimapKeysSideInput)
+_sym_db.RegisterMessage(StateKey.BagUserState)
+
+StateGetRequest = _reflection.GeneratedProtocolMessageType('StateGetRequest', (_message.Message,), dict(
+  DESCRIPTOR = _STATEGETREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateGetRequest)
+  ))
+_sym_db.RegisterMessage(StateGetRequest)
+
+StateGetResponse = _reflection.GeneratedProtocolMessageType('StateGetResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STATEGETRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateGetResponse)
+  ))
+_sym_db.RegisterMessage(StateGetResponse)
+
+StateAppendRequest = _reflection.GeneratedProtocolMessageType('StateAppendRequest', (_message.Message,), dict(
+  DESCRIPTOR = _STATEAPPENDREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateAppendRequest)
+  ))
+_sym_db.RegisterMessage(StateAppendRequest)
+
+StateAppendResponse = _reflection.GeneratedProtocolMessageType('StateAppendResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STATEAPPENDRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateAppendResponse)
+  ))
+_sym_db.RegisterMessage(StateAppendResponse)
+
+StateClearRequest = _reflection.GeneratedProtocolMessageType('StateClearRequest', (_message.Message,), dict(
+  DESCRIPTOR = _STATECLEARREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateClearRequest)
+  ))
+_sym_db.RegisterMessage(StateClearRequest)
+
+StateClearResponse = _reflection.GeneratedProtocolMessageType('StateClearResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STATECLEARRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateClearResponse)
+  ))
+_sym_db.RegisterMessage(StateClearResponse)
+
+LogEntry = _reflection.GeneratedProtocolMessageType('LogEntry', (_message.Message,), dict(
+
+  List = _reflection.GeneratedProtocolMessageType('List', (_message.Message,), dict(
+    DESCRIPTOR = _LOGENTRY_LIST,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.LogEntry.List)
+    ))
+  ,
+
+  Severity = _reflection.GeneratedProtocolMessageType('Severity', (_message.Message,), dict(
+    DESCRIPTOR = _LOGENTRY_SEVERITY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.LogEntry.Severity)
+    ))
+  ,
+  DESCRIPTOR = _LOGENTRY,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.LogEntry)
+  ))
+_sym_db.RegisterMessage(LogEntry)
+_sym_db.RegisterMessage(LogEntry.List)
+_sym_db.RegisterMessage(LogEntry.Severity)
+
+LogControl = _reflection.GeneratedProtocolMessageType('LogControl', (_message.Message,), dict(
+  DESCRIPTOR = _LOGCONTROL,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.LogControl)
+  ))
+_sym_db.RegisterMessage(LogControl)
+
+StartWorkerRequest = _reflection.GeneratedProtocolMessageType('StartWorkerRequest', (_message.Message,), dict(
+
+  ParamsEntry = _reflection.GeneratedProtocolMessageType('ParamsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _STARTWORKERREQUEST_PARAMSENTRY,
+    __module__ = 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StartWorkerRequest.ParamsEntry)
+    ))
+  ,
+  DESCRIPTOR = _STARTWORKERREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StartWorkerRequest)
+  ))
+_sym_db.RegisterMessage(StartWorkerRequest)
+_sym_db.RegisterMessage(StartWorkerRequest.ParamsEntry)
+
+StartWorkerResponse = _reflection.GeneratedProtocolMessageType('StartWorkerResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STARTWORKERRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StartWorkerResponse)
+  ))
+_sym_db.RegisterMessage(StartWorkerResponse)
+
+StopWorkerRequest = _reflection.GeneratedProtocolMessageType('StopWorkerRequest', (_message.Message,), dict(
+  DESCRIPTOR = _STOPWORKERREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StopWorkerRequest)
+  ))
+_sym_db.RegisterMessage(StopWorkerRequest)
+
+StopWorkerResponse = _reflection.GeneratedProtocolMessageType('StopWorkerResponse', (_message.Message,), dict(
+  DESCRIPTOR = _STOPWORKERRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StopWorkerResponse)
+  ))
+_sym_db.RegisterMessage(StopWorkerResponse)
+
+WorkerStatusRequest = _reflection.GeneratedProtocolMessageType('WorkerStatusRequest', (_message.Message,), dict(
+  DESCRIPTOR = _WORKERSTATUSREQUEST,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.WorkerStatusRequest)
+  ))
+_sym_db.RegisterMessage(WorkerStatusRequest)
+
+WorkerStatusResponse = _reflection.GeneratedProtocolMessageType('WorkerStatusResponse', (_message.Message,), dict(
+  DESCRIPTOR = _WORKERSTATUSRESPONSE,
+  __module__ = 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.WorkerStatusResponse)
+  ))
+_sym_db.RegisterMessage(WorkerStatusResponse)
+
+
+DESCRIPTOR.has_options = True
+DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\n$org.apache.beam.model.fnexecution.v1B\tBeamFnApiZ\016fnexecution_v1'))
+_PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY.has_options = True
+_PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY.has_options = True
+_PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY.has_options = True
+_PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PROCESSBUNDLEDESCRIPTOR_CODERSENTRY.has_options = True
+_PROCESSBUNDLEDESCRIPTOR_CODERSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY.has_options = True
+_PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY.has_options = True
+_BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_METRICS_PTRANSFORM_MEASURED_INPUTELEMENTCOUNTSENTRY.has_options = True
+_METRICS_PTRANSFORM_MEASURED_INPUTELEMENTCOUNTSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_METRICS_PTRANSFORM_MEASURED_OUTPUTELEMENTCOUNTSENTRY.has_options = True
+_METRICS_PTRANSFORM_MEASURED_OUTPUTELEMENTCOUNTSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_METRICS_PTRANSFORM_ACTIVEELEMENTS_OUTPUTELEMENTSREMAININGENTRY.has_options = True
+_METRICS_PTRANSFORM_ACTIVEELEMENTS_OUTPUTELEMENTSREMAININGENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_METRICS_PTRANSFORM_WATERMARKSENTRY.has_options = True
+_METRICS_PTRANSFORM_WATERMARKSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_METRICS_PTRANSFORMSENTRY.has_options = True
+_METRICS_PTRANSFORMSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY.has_options = True
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_STARTWORKERREQUEST_PARAMSENTRY.has_options = True
+_STARTWORKERREQUEST_PARAMSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+
+_BEAMFNCONTROL = _descriptor.ServiceDescriptor(
+  name='BeamFnControl',
+  full_name='org.apache.beam.model.fn_execution.v1.BeamFnControl',
+  file=DESCRIPTOR,
+  index=0,
+  options=None,
+  serialized_start=10349,
+  serialized_end=10501,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Control',
+    full_name='org.apache.beam.model.fn_execution.v1.BeamFnControl.Control',
+    index=0,
+    containing_service=None,
+    input_type=_INSTRUCTIONRESPONSE,
+    output_type=_INSTRUCTIONREQUEST,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_BEAMFNCONTROL)
+
+DESCRIPTOR.services_by_name['BeamFnControl'] = _BEAMFNCONTROL
+
+
+_BEAMFNDATA = _descriptor.ServiceDescriptor(
+  name='BeamFnData',
+  full_name='org.apache.beam.model.fn_execution.v1.BeamFnData',
+  file=DESCRIPTOR,
+  index=1,
+  options=None,
+  serialized_start=10503,
+  serialized_end=10627,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Data',
+    full_name='org.apache.beam.model.fn_execution.v1.BeamFnData.Data',
+    index=0,
+    containing_service=None,
+    input_type=_ELEMENTS,
+    output_type=_ELEMENTS,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_BEAMFNDATA)
+
+DESCRIPTOR.services_by_name['BeamFnData'] = _BEAMFNDATA
+
+
+_BEAMFNSTATE = _descriptor.ServiceDescriptor(
+  name='BeamFnState',
+  full_name='org.apache.beam.model.fn_execution.v1.BeamFnState',
+  file=DESCRIPTOR,
+  index=2,
+  options=None,
+  serialized_start=10630,
+  serialized_end=10765,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='State',
+    full_name='org.apache.beam.model.fn_execution.v1.BeamFnState.State',
+    index=0,
+    containing_service=None,
+    input_type=_STATEREQUEST,
+    output_type=_STATERESPONSE,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_BEAMFNSTATE)
+
+DESCRIPTOR.services_by_name['BeamFnState'] = _BEAMFNSTATE
+
+
+_BEAMFNLOGGING = _descriptor.ServiceDescriptor(
+  name='BeamFnLogging',
+  full_name='org.apache.beam.model.fn_execution.v1.BeamFnLogging',
+  file=DESCRIPTOR,
+  index=3,
+  options=None,
+  serialized_start=10768,
+  serialized_end=10905,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Logging',
+    full_name='org.apache.beam.model.fn_execution.v1.BeamFnLogging.Logging',
+    index=0,
+    containing_service=None,
+    input_type=_LOGENTRY_LIST,
+    output_type=_LOGCONTROL,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_BEAMFNLOGGING)
+
+DESCRIPTOR.services_by_name['BeamFnLogging'] = _BEAMFNLOGGING
+
+
+_BEAMFNEXTERNALWORKERPOOL = _descriptor.ServiceDescriptor(
+  name='BeamFnExternalWorkerPool',
+  full_name='org.apache.beam.model.fn_execution.v1.BeamFnExternalWorkerPool',
+  file=DESCRIPTOR,
+  index=4,
+  options=None,
+  serialized_start=10908,
+  serialized_end=11205,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='StartWorker',
+    full_name='org.apache.beam.model.fn_execution.v1.BeamFnExternalWorkerPool.StartWorker',
+    index=0,
+    containing_service=None,
+    input_type=_STARTWORKERREQUEST,
+    output_type=_STARTWORKERRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='StopWorker',
+    full_name='org.apache.beam.model.fn_execution.v1.BeamFnExternalWorkerPool.StopWorker',
+    index=1,
+    containing_service=None,
+    input_type=_STOPWORKERREQUEST,
+    output_type=_STOPWORKERRESPONSE,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_BEAMFNEXTERNALWORKERPOOL)
+
+DESCRIPTOR.services_by_name['BeamFnExternalWorkerPool'] = _BEAMFNEXTERNALWORKERPOOL
+
+
+_BEAMFNWORKERSTATUS = _descriptor.ServiceDescriptor(
+  name='BeamFnWorkerStatus',
+  full_name='org.apache.beam.model.fn_execution.v1.BeamFnWorkerStatus',
+  file=DESCRIPTOR,
+  index=5,
+  options=None,
+  serialized_start=11208,
+  serialized_end=11372,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='WorkerStatus',
+    full_name='org.apache.beam.model.fn_execution.v1.BeamFnWorkerStatus.WorkerStatus',
+    index=0,
+    containing_service=None,
+    input_type=_WORKERSTATUSRESPONSE,
+    output_type=_WORKERSTATUSREQUEST,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_BEAMFNWORKERSTATUS)
+
+DESCRIPTOR.services_by_name['BeamFnWorkerStatus'] = _BEAMFNWORKERSTATUS
+
+# @@protoc_insertion_point(module_scope)
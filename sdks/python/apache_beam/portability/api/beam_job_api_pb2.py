@@ -0,0 +1,1349 @@
+from __future__ import absolute_import
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_job_api.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+from . import endpoints_pb2 as endpoints__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from . import metrics_pb2 as metrics__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='beam_job_api.proto',
+  package='org.apache.beam.model.job_management.v1',
+  syntax='proto3',
+  serialized_pb=_b('\n\x12\x62\x65\x61m_job_api.proto\x12\'org.apache.beam.model.job_management.v1\x1a\x15\x62\x65\x61m_runner_api.proto\x1a\x0f\x65ndpoints.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\rmetrics.proto\"\x97\x01\n\x11PrepareJobRequest\x12=\n\x08pipeline\x18\x01 \x01(\x0b\x32+.org.apache.beam.model.pipeline.v1.Pipeline\x12\x31\n\x10pipeline_options\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x10\n\x08job_name\x18\x03 \x01(\t\"\xa7\x01\n\x12PrepareJobResponse\x12\x16\n\x0epreparation_id\x18\x01 \x01(\t\x12Z\n\x19\x61rtifact_staging_endpoint\x18\x02 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12\x1d\n\x15staging_session_token\x18\x03 \x01(\t\"@\n\rRunJobRequest\x12\x16\n\x0epreparation_id\x18\x01 \x01(\t\x12\x17\n\x0fretrieval_token\x18\x02 \x01(\t\" \n\x0eRunJobResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\"\n\x10\x43\x61ncelJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"Z\n\x11\x43\x61ncelJobResponse\x12\x45\n\x05state\x18\x01 \x01(\x0e\x32\x36.org.apache.beam.model.job_management.v1.JobState.Enum\"\xa5\x01\n\x07JobInfo\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x10\n\x08job_name\x18\x02 \x01(\t\x12\x31\n\x10pipeline_options\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x45\n\x05state\x18\x04 \x01(\x0e\x32\x36.org.apache.beam.model.job_management.v1.JobState.Enum\"\x10\n\x0eGetJobsRequest\"U\n\x0fGetJobsResponse\x12\x42\n\x08job_info\x18\x01 \x03(\x0b\x32\x30.org.apache.beam.model.job_management.v1.JobInfo\"$\n\x12GetJobStateRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x85\x01\n\rJobStateEvent\x12\x45\n\x05state\x18\x01 \x01(\x0e\x32\x36.org.apache.beam.model.job_management.v1.JobState.Enum\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\'\n\x15GetJobPipelineRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"W\n\x16GetJobPipelineResponse\x12=\n\x08pipeline\x18\x01 \x01(\x0b\x32+.org.apache.beam.model.pipeline.v1.Pipeline\"$\n\x12JobMessagesRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\xd1\x02\n\nJobMessage\x12\x12\n\nmessage_id\x18\x01 \x01(\t\x12\x0c\n\x04time\x18\x02 \x01(\t\x12Y\n\nimportance\x18\x03 \x01(\x0e\x32\x45.org.apache.beam.model.job_management.v1.JobMessage.MessageImportance\x12\x14\n\x0cmessage_text\x18\x04 \x01(\t\"\xaf\x01\n\x11MessageImportance\x12\"\n\x1eMESSAGE_IMPORTANCE_UNSPECIFIED\x10\x00\x12\x15\n\x11JOB_MESSAGE_DEBUG\x10\x01\x12\x18\n\x14JOB_MESSAGE_DETAILED\x10\x02\x12\x15\n\x11JOB_MESSAGE_BASIC\x10\x03\x12\x17\n\x13JOB_MESSAGE_WARNING\x10\x04\x12\x15\n\x11JOB_MESSAGE_ERROR\x10\x05\"\xc4\x01\n\x13JobMessagesResponse\x12O\n\x10message_response\x18\x01 \x01(\x0b\x32\x33.org.apache.beam.model.job_management.v1.JobMessageH\x00\x12P\n\x0estate_response\x18\x02 \x01(\x0b\x32\x36.org.apache.beam.model.job_management.v1.JobStateEventH\x00\x42\n\n\x08response\"\xb7\x01\n\x08JobState\"\xaa\x01\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0b\n\x07STOPPED\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\x08\n\x04\x44ONE\x10\x03\x12\n\n\x06\x46\x41ILED\x10\x04\x12\r\n\tCANCELLED\x10\x05\x12\x0b\n\x07UPDATED\x10\x06\x12\x0c\n\x08\x44RAINING\x10\x07\x12\x0b\n\x07\x44RAINED\x10\x08\x12\x0c\n\x08STARTING\x10\t\x12\x0e\n\nCANCELLING\x10\n\x12\x0c\n\x08UPDATING\x10\x0b\"&\n\x14GetJobMetricsRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"`\n\x15GetJobMetricsResponse\x12G\n\x07metrics\x18\x01 \x01(\x0b\x32\x36.org.apache.beam.model.job_management.v1.MetricResults\"\x9b\x01\n\rMetricResults\x12\x44\n\tattempted\x18\x01 \x03(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo\x12\x44\n\tcommitted\x18\x02 \x03(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo\" \n\x1e\x44\x65scribePipelineOptionsRequest\"e\n\x12PipelineOptionType\"O\n\x04\x45num\x12\n\n\x06STRING\x10\x00\x12\x0b\n\x07\x42OOLEAN\x10\x01\x12\x0b\n\x07INTEGER\x10\x02\x12\n\n\x06NUMBER\x10\x03\x12\t\n\x05\x41RRAY\x10\x04\x12\n\n\x06OBJECT\x10\x05\"\xb3\x01\n\x18PipelineOptionDescriptor\x12\x0c\n\x04name\x18\x01 \x01(\t\x12N\n\x04type\x18\x02 \x01(\x0e\x32@.org.apache.beam.model.job_management.v1.PipelineOptionType.Enum\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x15\n\rdefault_value\x18\x04 \x01(\t\x12\r\n\x05group\x18\x05 \x01(\t\"u\n\x1f\x44\x65scribePipelineOptionsResponse\x12R\n\x07options\x18\x01 \x03(\x0b\x32\x41.org.apache.beam.model.job_management.v1.PipelineOptionDescriptor2\xf6\n\n\nJobService\x12\x82\x01\n\x07Prepare\x12:.org.apache.beam.model.job_management.v1.PrepareJobRequest\x1a;.org.apache.beam.model.job_management.v1.PrepareJobResponse\x12v\n\x03Run\x12\x36.org.apache.beam.model.job_management.v1.RunJobRequest\x1a\x37.org.apache.beam.model.job_management.v1.RunJobResponse\x12|\n\x07GetJobs\x12\x37.org.apache.beam.model.job_management.v1.GetJobsRequest\x1a\x38.org.apache.beam.model.job_management.v1.GetJobsResponse\x12\x7f\n\x08GetState\x12;.org.apache.beam.model.job_management.v1.GetJobStateRequest\x1a\x36.org.apache.beam.model.job_management.v1.JobStateEvent\x12\x8e\x01\n\x0bGetPipeline\x12>.org.apache.beam.model.job_management.v1.GetJobPipelineRequest\x1a?.org.apache.beam.model.job_management.v1.GetJobPipelineResponse\x12\x7f\n\x06\x43\x61ncel\x12\x39.org.apache.beam.model.job_management.v1.CancelJobRequest\x1a:.org.apache.beam.model.job_management.v1.CancelJobResponse\x12\x87\x01\n\x0eGetStateStream\x12;.org.apache.beam.model.job_management.v1.GetJobStateRequest\x1a\x36.org.apache.beam.model.job_management.v1.JobStateEvent0\x01\x12\x8f\x01\n\x10GetMessageStream\x12;.org.apache.beam.model.job_management.v1.JobMessagesRequest\x1a<.org.apache.beam.model.job_management.v1.JobMessagesResponse0\x01\x12\x8e\x01\n\rGetJobMetrics\x12=.org.apache.beam.model.job_management.v1.GetJobMetricsRequest\x1a>.org.apache.beam.model.job_management.v1.GetJobMetricsResponse\x12\xac\x01\n\x17\x44\x65scribePipelineOptions\x12G.org.apache.beam.model.job_management.v1.DescribePipelineOptionsRequest\x1aH.org.apache.beam.model.job_management.v1.DescribePipelineOptionsResponseBB\n&org.apache.beam.model.jobmanagement.v1B\x06JobApiZ\x10jobmanagement_v1b\x06proto3')
+  ,
+  dependencies=[beam__runner__api__pb2.DESCRIPTOR,endpoints__pb2.DESCRIPTOR,google_dot_protobuf_dot_struct__pb2.DESCRIPTOR,google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,metrics__pb2.DESCRIPTOR,])
+
+
+
+_JOBMESSAGE_MESSAGEIMPORTANCE = _descriptor.EnumDescriptor(
+  name='MessageImportance',
+  full_name='org.apache.beam.model.job_management.v1.JobMessage.MessageImportance',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='MESSAGE_IMPORTANCE_UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='JOB_MESSAGE_DEBUG', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='JOB_MESSAGE_DETAILED', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='JOB_MESSAGE_BASIC', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='JOB_MESSAGE_WARNING', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='JOB_MESSAGE_ERROR', index=5, number=5,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1511,
+  serialized_end=1686,
+)
+_sym_db.RegisterEnumDescriptor(_JOBMESSAGE_MESSAGEIMPORTANCE)
+
+_JOBSTATE_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.job_management.v1.JobState.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STOPPED', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='RUNNING', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DONE', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FAILED', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CANCELLED', index=5, number=5,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UPDATED', index=6, number=6,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRAINING', index=7, number=7,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRAINED', index=8, number=8,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STARTING', index=9, number=9,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CANCELLING', index=10, number=10,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UPDATING', index=11, number=11,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1901,
+  serialized_end=2071,
+)
+_sym_db.RegisterEnumDescriptor(_JOBSTATE_ENUM)
+
+_PIPELINEOPTIONTYPE_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.job_management.v1.PipelineOptionType.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='STRING', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BOOLEAN', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INTEGER', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NUMBER', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ARRAY', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='OBJECT', index=5, number=5,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2425,
+  serialized_end=2504,
+)
+_sym_db.RegisterEnumDescriptor(_PIPELINEOPTIONTYPE_ENUM)
+
+
+_PREPAREJOBREQUEST = _descriptor.Descriptor(
+  name='PrepareJobRequest',
+  full_name='org.apache.beam.model.job_management.v1.PrepareJobRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pipeline', full_name='org.apache.beam.model.job_management.v1.PrepareJobRequest.pipeline', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pipeline_options', full_name='org.apache.beam.model.job_management.v1.PrepareJobRequest.pipeline_options', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='job_name', full_name='org.apache.beam.model.job_management.v1.PrepareJobRequest.job_name', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=182,
+  serialized_end=333,
+)
+
+
+_PREPAREJOBRESPONSE = _descriptor.Descriptor(
+  name='PrepareJobResponse',
+  full_name='org.apache.beam.model.job_management.v1.PrepareJobResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='preparation_id', full_name='org.apache.beam.model.job_management.v1.PrepareJobResponse.preparation_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='artifact_staging_endpoint', full_name='org.apache.beam.model.job_management.v1.PrepareJobResponse.artifact_staging_endpoint', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='staging_session_token', full_name='org.apache.beam.model.job_management.v1.PrepareJobResponse.staging_session_token', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=336,
+  serialized_end=503,
+)
+
+
+_RUNJOBREQUEST = _descriptor.Descriptor(
+  name='RunJobRequest',
+  full_name='org.apache.beam.model.job_management.v1.RunJobRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='preparation_id', full_name='org.apache.beam.model.job_management.v1.RunJobRequest.preparation_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='retrieval_token', full_name='org.apache.beam.model.job_management.v1.RunJobRequest.retrieval_token', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=505,
+  serialized_end=569,
+)
+
+
+_RUNJOBRESPONSE = _descriptor.Descriptor(
+  name='RunJobResponse',
+  full_name='org.apache.beam.model.job_management.v1.RunJobResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='job_id', full_name='org.apache.beam.model.job_management.v1.RunJobResponse.job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=571,
+  serialized_end=603,
+)
+
+
+_CANCELJOBREQUEST = _descriptor.Descriptor(
+  name='CancelJobRequest',
+  full_name='org.apache.beam.model.job_management.v1.CancelJobRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='job_id', full_name='org.apache.beam.model.job_management.v1.CancelJobRequest.job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=605,
+  serialized_end=639,
+)
+
+
+_CANCELJOBRESPONSE = _descriptor.Descriptor(
+  name='CancelJobResponse',
+  full_name='org.apache.beam.model.job_management.v1.CancelJobResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='state', full_name='org.apache.beam.model.job_management.v1.CancelJobResponse.state', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=641,
+  serialized_end=731,
+)
+
+
+_JOBINFO = _descriptor.Descriptor(
+  name='JobInfo',
+  full_name='org.apache.beam.model.job_management.v1.JobInfo',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='job_id', full_name='org.apache.beam.model.job_management.v1.JobInfo.job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='job_name', full_name='org.apache.beam.model.job_management.v1.JobInfo.job_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pipeline_options', full_name='org.apache.beam.model.job_management.v1.JobInfo.pipeline_options', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='org.apache.beam.model.job_management.v1.JobInfo.state', index=3,
+      number=4, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=734,
+  serialized_end=899,
+)
+
+
+_GETJOBSREQUEST = _descriptor.Descriptor(
+  name='GetJobsRequest',
+  full_name='org.apache.beam.model.job_management.v1.GetJobsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=901,
+  serialized_end=917,
+)
+
+
+_GETJOBSRESPONSE = _descriptor.Descriptor(
+  name='GetJobsResponse',
+  full_name='org.apache.beam.model.job_management.v1.GetJobsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='job_info', full_name='org.apache.beam.model.job_management.v1.GetJobsResponse.job_info', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=919,
+  serialized_end=1004,
+)
+
+
+_GETJOBSTATEREQUEST = _descriptor.Descriptor(
+  name='GetJobStateRequest',
+  full_name='org.apache.beam.model.job_management.v1.GetJobStateRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='job_id', full_name='org.apache.beam.model.job_management.v1.GetJobStateRequest.job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1006,
+  serialized_end=1042,
+)
+
+
+_JOBSTATEEVENT = _descriptor.Descriptor(
+  name='JobStateEvent',
+  full_name='org.apache.beam.model.job_management.v1.JobStateEvent',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='state', full_name='org.apache.beam.model.job_management.v1.JobStateEvent.state', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='org.apache.beam.model.job_management.v1.JobStateEvent.timestamp', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1045,
+  serialized_end=1178,
+)
+
+
+_GETJOBPIPELINEREQUEST = _descriptor.Descriptor(
+  name='GetJobPipelineRequest',
+  full_name='org.apache.beam.model.job_management.v1.GetJobPipelineRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='job_id', full_name='org.apache.beam.model.job_management.v1.GetJobPipelineRequest.job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1180,
+  serialized_end=1219,
+)
+
+
+_GETJOBPIPELINERESPONSE = _descriptor.Descriptor(
+  name='GetJobPipelineResponse',
+  full_name='org.apache.beam.model.job_management.v1.GetJobPipelineResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pipeline', full_name='org.apache.beam.model.job_management.v1.GetJobPipelineResponse.pipeline', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1221,
+  serialized_end=1308,
+)
+
+
+_JOBMESSAGESREQUEST = _descriptor.Descriptor(
+  name='JobMessagesRequest',
+  full_name='org.apache.beam.model.job_management.v1.JobMessagesRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='job_id', full_name='org.apache.beam.model.job_management.v1.JobMessagesRequest.job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1310,
+  serialized_end=1346,
+)
+
+
+_JOBMESSAGE = _descriptor.Descriptor(
+  name='JobMessage',
+  full_name='org.apache.beam.model.job_management.v1.JobMessage',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='message_id', full_name='org.apache.beam.model.job_management.v1.JobMessage.message_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='time', full_name='org.apache.beam.model.job_management.v1.JobMessage.time', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='importance', full_name='org.apache.beam.model.job_management.v1.JobMessage.importance', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='message_text', full_name='org.apache.beam.model.job_management.v1.JobMessage.message_text', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _JOBMESSAGE_MESSAGEIMPORTANCE,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1349,
+  serialized_end=1686,
+)
+
+
+_JOBMESSAGESRESPONSE = _descriptor.Descriptor(
+  name='JobMessagesResponse',
+  full_name='org.apache.beam.model.job_management.v1.JobMessagesResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='message_response', full_name='org.apache.beam.model.job_management.v1.JobMessagesResponse.message_response', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state_response', full_name='org.apache.beam.model.job_management.v1.JobMessagesResponse.state_response', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='response', full_name='org.apache.beam.model.job_management.v1.JobMessagesResponse.response',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=1689,
+  serialized_end=1885,
+)
+
+
+_JOBSTATE = _descriptor.Descriptor(
+  name='JobState',
+  full_name='org.apache.beam.model.job_management.v1.JobState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _JOBSTATE_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1888,
+  serialized_end=2071,
+)
+
+
+_GETJOBMETRICSREQUEST = _descriptor.Descriptor(
+  name='GetJobMetricsRequest',
+  full_name='org.apache.beam.model.job_management.v1.GetJobMetricsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='job_id', full_name='org.apache.beam.model.job_management.v1.GetJobMetricsRequest.job_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2073,
+  serialized_end=2111,
+)
+
+
+_GETJOBMETRICSRESPONSE = _descriptor.Descriptor(
+  name='GetJobMetricsResponse',
+  full_name='org.apache.beam.model.job_management.v1.GetJobMetricsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='metrics', full_name='org.apache.beam.model.job_management.v1.GetJobMetricsResponse.metrics', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2113,
+  serialized_end=2209,
+)
+
+
+_METRICRESULTS = _descriptor.Descriptor(
+  name='MetricResults',
+  full_name='org.apache.beam.model.job_management.v1.MetricResults',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='attempted', full_name='org.apache.beam.model.job_management.v1.MetricResults.attempted', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='committed', full_name='org.apache.beam.model.job_management.v1.MetricResults.committed', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2212,
+  serialized_end=2367,
+)
+
+
+_DESCRIBEPIPELINEOPTIONSREQUEST = _descriptor.Descriptor(
+  name='DescribePipelineOptionsRequest',
+  full_name='org.apache.beam.model.job_management.v1.DescribePipelineOptionsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2369,
+  serialized_end=2401,
+)
+
+
+_PIPELINEOPTIONTYPE = _descriptor.Descriptor(
+  name='PipelineOptionType',
+  full_name='org.apache.beam.model.job_management.v1.PipelineOptionType',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _PIPELINEOPTIONTYPE_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2403,
+  serialized_end=2504,
+)
+
+
+_PIPELINEOPTIONDESCRIPTOR = _descriptor.Descriptor(
+  name='PipelineOptionDescriptor',
+  full_name='org.apache.beam.model.job_management.v1.PipelineOptionDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.job_management.v1.PipelineOptionDescriptor.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='org.apache.beam.model.job_management.v1.PipelineOptionDescriptor.type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='org.apache.beam.model.job_management.v1.PipelineOptionDescriptor.description', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='default_value', full_name='org.apache.beam.model.job_management.v1.PipelineOptionDescriptor.default_value', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='group', full_name='org.apache.beam.model.job_management.v1.PipelineOptionDescriptor.group', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2507,
+  serialized_end=2686,
+)
+
+
+_DESCRIBEPIPELINEOPTIONSRESPONSE = _descriptor.Descriptor(
+  name='DescribePipelineOptionsResponse',
+  full_name='org.apache.beam.model.job_management.v1.DescribePipelineOptionsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='options', full_name='org.apache.beam.model.job_management.v1.DescribePipelineOptionsResponse.options', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2688,
+  serialized_end=2805,
+)
+
+_PREPAREJOBREQUEST.fields_by_name['pipeline'].message_type = beam__runner__api__pb2._PIPELINE
+_PREPAREJOBREQUEST.fields_by_name['pipeline_options'].message_type = google_dot_protobuf_dot_struct__pb2._STRUCT
+_PREPAREJOBRESPONSE.fields_by_name['artifact_staging_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_CANCELJOBRESPONSE.fields_by_name['state'].enum_type = _JOBSTATE_ENUM
+_JOBINFO.fields_by_name['pipeline_options'].message_type = google_dot_protobuf_dot_struct__pb2._STRUCT
+_JOBINFO.fields_by_name['state'].enum_type = _JOBSTATE_ENUM
+_GETJOBSRESPONSE.fields_by_name['job_info'].message_type = _JOBINFO
+_JOBSTATEEVENT.fields_by_name['state'].enum_type = _JOBSTATE_ENUM
+_JOBSTATEEVENT.fields_by_name['timestamp'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_GETJOBPIPELINERESPONSE.fields_by_name['pipeline'].message_type = beam__runner__api__pb2._PIPELINE
+_JOBMESSAGE.fields_by_name['importance'].enum_type = _JOBMESSAGE_MESSAGEIMPORTANCE
+_JOBMESSAGE_MESSAGEIMPORTANCE.containing_type = _JOBMESSAGE
+_JOBMESSAGESRESPONSE.fields_by_name['message_response'].message_type = _JOBMESSAGE
+_JOBMESSAGESRESPONSE.fields_by_name['state_response'].message_type = _JOBSTATEEVENT
+_JOBMESSAGESRESPONSE.oneofs_by_name['response'].fields.append(
+  _JOBMESSAGESRESPONSE.fields_by_name['message_response'])
+_JOBMESSAGESRESPONSE.fields_by_name['message_response'].containing_oneof = _JOBMESSAGESRESPONSE.oneofs_by_name['response']
+_JOBMESSAGESRESPONSE.oneofs_by_name['response'].fields.append(
+  _JOBMESSAGESRESPONSE.fields_by_name['state_response'])
+_JOBMESSAGESRESPONSE.fields_by_name['state_response'].containing_oneof = _JOBMESSAGESRESPONSE.oneofs_by_name['response']
+_JOBSTATE_ENUM.containing_type = _JOBSTATE
+_GETJOBMETRICSRESPONSE.fields_by_name['metrics'].message_type = _METRICRESULTS
+_METRICRESULTS.fields_by_name['attempted'].message_type = metrics__pb2._MONITORINGINFO
+_METRICRESULTS.fields_by_name['committed'].message_type = metrics__pb2._MONITORINGINFO
+_PIPELINEOPTIONTYPE_ENUM.containing_type = _PIPELINEOPTIONTYPE
+_PIPELINEOPTIONDESCRIPTOR.fields_by_name['type'].enum_type = _PIPELINEOPTIONTYPE_ENUM
+_DESCRIBEPIPELINEOPTIONSRESPONSE.fields_by_name['options'].message_type = _PIPELINEOPTIONDESCRIPTOR
+DESCRIPTOR.message_types_by_name['PrepareJobRequest'] = _PREPAREJOBREQUEST
+DESCRIPTOR.message_types_by_name['PrepareJobResponse'] = _PREPAREJOBRESPONSE
+DESCRIPTOR.message_types_by_name['RunJobRequest'] = _RUNJOBREQUEST
+DESCRIPTOR.message_types_by_name['RunJobResponse'] = _RUNJOBRESPONSE
+DESCRIPTOR.message_types_by_name['CancelJobRequest'] = _CANCELJOBREQUEST
+DESCRIPTOR.message_types_by_name['CancelJobResponse'] = _CANCELJOBRESPONSE
+DESCRIPTOR.message_types_by_name['JobInfo'] = _JOBINFO
+DESCRIPTOR.message_types_by_name['GetJobsRequest'] = _GETJOBSREQUEST
+DESCRIPTOR.message_types_by_name['GetJobsResponse'] = _GETJOBSRESPONSE
+DESCRIPTOR.message_types_by_name['GetJobStateRequest'] = _GETJOBSTATEREQUEST
+DESCRIPTOR.message_types_by_name['JobStateEvent'] = _JOBSTATEEVENT
+DESCRIPTOR.message_types_by_name['GetJobPipelineRequest'] = _GETJOBPIPELINEREQUEST
+DESCRIPTOR.message_types_by_name['GetJobPipelineResponse'] = _GETJOBPIPELINERESPONSE
+DESCRIPTOR.message_types_by_name['JobMessagesRequest'] = _JOBMESSAGESREQUEST
+DESCRIPTOR.message_types_by_name['JobMessage'] = _JOBMESSAGE
+DESCRIPTOR.message_types_by_name['JobMessagesResponse'] = _JOBMESSAGESRESPONSE
+DESCRIPTOR.message_types_by_name['JobState'] = _JOBSTATE
+DESCRIPTOR.message_types_by_name['GetJobMetricsRequest'] = _GETJOBMETRICSREQUEST
+DESCRIPTOR.message_types_by_name['GetJobMetricsResponse'] = _GETJOBMETRICSRESPONSE
+DESCRIPTOR.message_types_by_name['MetricResults'] = _METRICRESULTS
+DESCRIPTOR.message_types_by_name['DescribePipelineOptionsRequest'] = _DESCRIBEPIPELINEOPTIONSREQUEST
+DESCRIPTOR.message_types_by_name['PipelineOptionType'] = _PIPELINEOPTIONTYPE
+DESCRIPTOR.message_types_by_name['PipelineOptionDescriptor'] = _PIPELINEOPTIONDESCRIPTOR
+DESCRIPTOR.message_types_by_name['DescribePipelineOptionsResponse'] = _DESCRIBEPIPELINEOPTIONSRESPONSE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+PrepareJobRequest = _reflection.GeneratedProtocolMessageType('PrepareJobRequest', (_message.Message,), dict(
+  DESCRIPTOR = _PREPAREJOBREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PrepareJobRequest)
+  ))
+_sym_db.RegisterMessage(PrepareJobRequest)
+
+PrepareJobResponse = _reflection.GeneratedProtocolMessageType('PrepareJobResponse', (_message.Message,), dict(
+  DESCRIPTOR = _PREPAREJOBRESPONSE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PrepareJobResponse)
+  ))
+_sym_db.RegisterMessage(PrepareJobResponse)
+
+RunJobRequest = _reflection.GeneratedProtocolMessageType('RunJobRequest', (_message.Message,), dict(
+  DESCRIPTOR = _RUNJOBREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.RunJobRequest)
+  ))
+_sym_db.RegisterMessage(RunJobRequest)
+
+RunJobResponse = _reflection.GeneratedProtocolMessageType('RunJobResponse', (_message.Message,), dict(
+  DESCRIPTOR = _RUNJOBRESPONSE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.RunJobResponse)
+  ))
+_sym_db.RegisterMessage(RunJobResponse)
+
+CancelJobRequest = _reflection.GeneratedProtocolMessageType('CancelJobRequest', (_message.Message,), dict(
+  DESCRIPTOR = _CANCELJOBREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CancelJobRequest)
+  ))
+_sym_db.RegisterMessage(CancelJobRequest)
+
+CancelJobResponse = _reflection.GeneratedProtocolMessageType('CancelJobResponse', (_message.Message,), dict(
+  DESCRIPTOR = _CANCELJOBRESPONSE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CancelJobResponse)
+  ))
+_sym_db.RegisterMessage(CancelJobResponse)
+
+JobInfo = _reflection.GeneratedProtocolMessageType('JobInfo', (_message.Message,), dict(
+  DESCRIPTOR = _JOBINFO,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobInfo)
+  ))
+_sym_db.RegisterMessage(JobInfo)
+
+GetJobsRequest = _reflection.GeneratedProtocolMessageType('GetJobsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETJOBSREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobsRequest)
+  ))
+_sym_db.RegisterMessage(GetJobsRequest)
+
+GetJobsResponse = _reflection.GeneratedProtocolMessageType('GetJobsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _GETJOBSRESPONSE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobsResponse)
+  ))
+_sym_db.RegisterMessage(GetJobsResponse)
+
+GetJobStateRequest = _reflection.GeneratedProtocolMessageType('GetJobStateRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETJOBSTATEREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobStateRequest)
+  ))
+_sym_db.RegisterMessage(GetJobStateRequest)
+
+JobStateEvent = _reflection.GeneratedProtocolMessageType('JobStateEvent', (_message.Message,), dict(
+  DESCRIPTOR = _JOBSTATEEVENT,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobStateEvent)
+  ))
+_sym_db.RegisterMessage(JobStateEvent)
+
+GetJobPipelineRequest = _reflection.GeneratedProtocolMessageType('GetJobPipelineRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETJOBPIPELINEREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobPipelineRequest)
+  ))
+_sym_db.RegisterMessage(GetJobPipelineRequest)
+
+GetJobPipelineResponse = _reflection.GeneratedProtocolMessageType('GetJobPipelineResponse', (_message.Message,), dict(
+  DESCRIPTOR = _GETJOBPIPELINERESPONSE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobPipelineResponse)
+  ))
+_sym_db.RegisterMessage(GetJobPipelineResponse)
+
+JobMessagesRequest = _reflection.GeneratedProtocolMessageType('JobMessagesRequest', (_message.Message,), dict(
+  DESCRIPTOR = _JOBMESSAGESREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobMessagesRequest)
+  ))
+_sym_db.RegisterMessage(JobMessagesRequest)
+
+JobMessage = _reflection.GeneratedProtocolMessageType('JobMessage', (_message.Message,), dict(
+  DESCRIPTOR = _JOBMESSAGE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobMessage)
+  ))
+_sym_db.RegisterMessage(JobMessage)
+
+JobMessagesResponse = _reflection.GeneratedProtocolMessageType('JobMessagesResponse', (_message.Message,), dict(
+  DESCRIPTOR = _JOBMESSAGESRESPONSE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobMessagesResponse)
+  ))
+_sym_db.RegisterMessage(JobMessagesResponse)
+
+JobState = _reflection.GeneratedProtocolMessageType('JobState', (_message.Message,), dict(
+  DESCRIPTOR = _JOBSTATE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobState)
+  ))
+_sym_db.RegisterMessage(JobState)
+
+GetJobMetricsRequest = _reflection.GeneratedProtocolMessageType('GetJobMetricsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETJOBMETRICSREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobMetricsRequest)
+  ))
+_sym_db.RegisterMessage(GetJobMetricsRequest)
+
+GetJobMetricsResponse = _reflection.GeneratedProtocolMessageType('GetJobMetricsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _GETJOBMETRICSRESPONSE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobMetricsResponse)
+  ))
+_sym_db.RegisterMessage(GetJobMetricsResponse)
+
+MetricResults = _reflection.GeneratedProtocolMessageType('MetricResults', (_message.Message,), dict(
+  DESCRIPTOR = _METRICRESULTS,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.MetricResults)
+  ))
+_sym_db.RegisterMessage(MetricResults)
+
+DescribePipelineOptionsRequest = _reflection.GeneratedProtocolMessageType('DescribePipelineOptionsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _DESCRIBEPIPELINEOPTIONSREQUEST,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.DescribePipelineOptionsRequest)
+  ))
+_sym_db.RegisterMessage(DescribePipelineOptionsRequest)
+
+PipelineOptionType = _reflection.GeneratedProtocolMessageType('PipelineOptionType', (_message.Message,), dict(
+  DESCRIPTOR = _PIPELINEOPTIONTYPE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PipelineOptionType)
+  ))
+_sym_db.RegisterMessage(PipelineOptionType)
+
+PipelineOptionDescriptor = _reflection.GeneratedProtocolMessageType('PipelineOptionDescriptor', (_message.Message,), dict(
+  DESCRIPTOR = _PIPELINEOPTIONDESCRIPTOR,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PipelineOptionDescriptor)
+  ))
+_sym_db.RegisterMessage(PipelineOptionDescriptor)
+
+DescribePipelineOptionsResponse = _reflection.GeneratedProtocolMessageType('DescribePipelineOptionsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _DESCRIBEPIPELINEOPTIONSRESPONSE,
+  __module__ = 'beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.DescribePipelineOptionsResponse)
+  ))
+_sym_db.RegisterMessage(DescribePipelineOptionsResponse)
+
+
+DESCRIPTOR.has_options = True
+DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\n&org.apache.beam.model.jobmanagement.v1B\006JobApiZ\020jobmanagement_v1'))
+
+_JOBSERVICE = _descriptor.ServiceDescriptor(
+  name='JobService',
+  full_name='org.apache.beam.model.job_management.v1.JobService',
+  file=DESCRIPTOR,
+  index=0,
+  options=None,
+  serialized_start=2808,
+  serialized_end=4206,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Prepare',
+    full_name='org.apache.beam.model.job_management.v1.JobService.Prepare',
+    index=0,
+    containing_service=None,
+    input_type=_PREPAREJOBREQUEST,
+    output_type=_PREPAREJOBRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Run',
+    full_name='org.apache.beam.model.job_management.v1.JobService.Run',
+    index=1,
+    containing_service=None,
+    input_type=_RUNJOBREQUEST,
+    output_type=_RUNJOBRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetJobs',
+    full_name='org.apache.beam.model.job_management.v1.JobService.GetJobs',
+    index=2,
+    containing_service=None,
+    input_type=_GETJOBSREQUEST,
+    output_type=_GETJOBSRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetState',
+    full_name='org.apache.beam.model.job_management.v1.JobService.GetState',
+    index=3,
+    containing_service=None,
+    input_type=_GETJOBSTATEREQUEST,
+    output_type=_JOBSTATEEVENT,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetPipeline',
+    full_name='org.apache.beam.model.job_management.v1.JobService.GetPipeline',
+    index=4,
+    containing_service=None,
+    input_type=_GETJOBPIPELINEREQUEST,
+    output_type=_GETJOBPIPELINERESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Cancel',
+    full_name='org.apache.beam.model.job_management.v1.JobService.Cancel',
+    index=5,
+    containing_service=None,
+    input_type=_CANCELJOBREQUEST,
+    output_type=_CANCELJOBRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetStateStream',
+    full_name='org.apache.beam.model.job_management.v1.JobService.GetStateStream',
+    index=6,
+    containing_service=None,
+    input_type=_GETJOBSTATEREQUEST,
+    output_type=_JOBSTATEEVENT,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetMessageStream',
+    full_name='org.apache.beam.model.job_management.v1.JobService.GetMessageStream',
+    index=7,
+    containing_service=None,
+    input_type=_JOBMESSAGESREQUEST,
+    output_type=_JOBMESSAGESRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetJobMetrics',
+    full_name='org.apache.beam.model.job_management.v1.JobService.GetJobMetrics',
+    index=8,
+    containing_service=None,
+    input_type=_GETJOBMETRICSREQUEST,
+    output_type=_GETJOBMETRICSRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='DescribePipelineOptions',
+    full_name='org.apache.beam.model.job_management.v1.JobService.DescribePipelineOptions',
+    index=9,
+    containing_service=None,
+    input_type=_DESCRIBEPIPELINEOPTIONSREQUEST,
+    output_type=_DESCRIBEPIPELINEOPTIONSRESPONSE,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_JOBSERVICE)
+
+DESCRIPTOR.services_by_name['JobService'] = _JOBSERVICE
+
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,211 @@
+from __future__ import absolute_import
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_provision_api.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import endpoints_pb2 as endpoints__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='beam_provision_api.proto',
+  package='org.apache.beam.model.fn_execution.v1',
+  syntax='proto3',
+  serialized_pb=_b('\n\x18\x62\x65\x61m_provision_api.proto\x12%org.apache.beam.model.fn_execution.v1\x1a\x0f\x65ndpoints.proto\x1a\x1cgoogle/protobuf/struct.proto\"\x19\n\x17GetProvisionInfoRequest\"^\n\x18GetProvisionInfoResponse\x12\x42\n\x04info\x18\x01 \x01(\x0b\x32\x34.org.apache.beam.model.fn_execution.v1.ProvisionInfo\"\xa7\x03\n\rProvisionInfo\x12\x31\n\x10pipeline_options\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x17\n\x0fretrieval_token\x18\x06 \x01(\t\x12P\n\x0fstatus_endpoint\x18\x07 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12Q\n\x10logging_endpoint\x18\x08 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12R\n\x11\x61rtifact_endpoint\x18\t \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12Q\n\x10\x63ontrol_endpoint\x18\n \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor2\xa8\x01\n\x10ProvisionService\x12\x93\x01\n\x10GetProvisionInfo\x12>.org.apache.beam.model.fn_execution.v1.GetProvisionInfoRequest\x1a?.org.apache.beam.model.fn_execution.v1.GetProvisionInfoResponseBD\n$org.apache.beam.model.fnexecution.v1B\x0cProvisionApiZ\x0e\x66nexecution_v1b\x06proto3')
+  ,
+  dependencies=[endpoints__pb2.DESCRIPTOR,google_dot_protobuf_dot_struct__pb2.DESCRIPTOR,])
+
+
+
+
+_GETPROVISIONINFOREQUEST = _descriptor.Descriptor(
+  name='GetProvisionInfoRequest',
+  full_name='org.apache.beam.model.fn_execution.v1.GetProvisionInfoRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=114,
+  serialized_end=139,
+)
+
+
+_GETPROVISIONINFORESPONSE = _descriptor.Descriptor(
+  name='GetProvisionInfoResponse',
+  full_name='org.apache.beam.model.fn_execution.v1.GetProvisionInfoResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='info', full_name='org.apache.beam.model.fn_execution.v1.GetProvisionInfoResponse.info', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=141,
+  serialized_end=235,
+)
+
+
+_PROVISIONINFO = _descriptor.Descriptor(
+  name='ProvisionInfo',
+  full_name='org.apache.beam.model.fn_execution.v1.ProvisionInfo',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pipeline_options', full_name='org.apache.beam.model.fn_execution.v1.ProvisionInfo.pipeline_options', index=0,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='retrieval_token', full_name='org.apache.beam.model.fn_execution.v1.ProvisionInfo.retrieval_token', index=1,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status_endpoint', full_name='org.apache.beam.model.fn_execution.v1.ProvisionInfo.status_endpoint', index=2,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='logging_endpoint', full_name='org.apache.beam.model.fn_execution.v1.ProvisionInfo.logging_endpoint', index=3,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='artifact_endpoint', full_name='org.apache.beam.model.fn_execution.v1.ProvisionInfo.artifact_endpoint', index=4,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='control_endpoint', full_name='org.apache.beam.model.fn_execution.v1.ProvisionInfo.control_endpoint', index=5,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=238,
+  serialized_end=661,
+)
+
+_GETPROVISIONINFORESPONSE.fields_by_name['info'].message_type = _PROVISIONINFO
+_PROVISIONINFO.fields_by_name['pipeline_options'].message_type = google_dot_protobuf_dot_struct__pb2._STRUCT
+_PROVISIONINFO.fields_by_name['status_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_PROVISIONINFO.fields_by_name['logging_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_PROVISIONINFO.fields_by_name['artifact_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_PROVISIONINFO.fields_by_name['control_endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+DESCRIPTOR.message_types_by_name['GetProvisionInfoRequest'] = _GETPROVISIONINFOREQUEST
+DESCRIPTOR.message_types_by_name['GetProvisionInfoResponse'] = _GETPROVISIONINFORESPONSE
+DESCRIPTOR.message_types_by_name['ProvisionInfo'] = _PROVISIONINFO
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+GetProvisionInfoRequest = _reflection.GeneratedProtocolMessageType('GetProvisionInfoRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETPROVISIONINFOREQUEST,
+  __module__ = 'beam_provision_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.GetProvisionInfoRequest)
+  ))
+_sym_db.RegisterMessage(GetProvisionInfoRequest)
+
+GetProvisionInfoResponse = _reflection.GeneratedProtocolMessageType('GetProvisionInfoResponse', (_message.Message,), dict(
+  DESCRIPTOR = _GETPROVISIONINFORESPONSE,
+  __module__ = 'beam_provision_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.GetProvisionInfoResponse)
+  ))
+_sym_db.RegisterMessage(GetProvisionInfoResponse)
+
+ProvisionInfo = _reflection.GeneratedProtocolMessageType('ProvisionInfo', (_message.Message,), dict(
+  DESCRIPTOR = _PROVISIONINFO,
+  __module__ = 'beam_provision_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProvisionInfo)
+  ))
+_sym_db.RegisterMessage(ProvisionInfo)
+
+
+DESCRIPTOR.has_options = True
+DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\n$org.apache.beam.model.fnexecution.v1B\014ProvisionApiZ\016fnexecution_v1'))
+
+_PROVISIONSERVICE = _descriptor.ServiceDescriptor(
+  name='ProvisionService',
+  full_name='org.apache.beam.model.fn_execution.v1.ProvisionService',
+  file=DESCRIPTOR,
+  index=0,
+  options=None,
+  serialized_start=664,
+  serialized_end=832,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='GetProvisionInfo',
+    full_name='org.apache.beam.model.fn_execution.v1.ProvisionService.GetProvisionInfo',
+    index=0,
+    containing_service=None,
+    input_type=_GETPROVISIONINFOREQUEST,
+    output_type=_GETPROVISIONINFORESPONSE,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_PROVISIONSERVICE)
+
+DESCRIPTOR.services_by_name['ProvisionService'] = _PROVISIONSERVICE
+
+# @@protoc_insertion_point(module_scope)
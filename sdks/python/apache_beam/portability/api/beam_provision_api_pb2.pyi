@@ -0,0 +1,119 @@
+# @generated by generate_proto_mypy_stubs.py.  Do not edit!
+import sys
+from endpoints_pb2 import (
+    ApiServiceDescriptor as endpoints_pb2___ApiServiceDescriptor,
+)
+
+from google.protobuf.descriptor import (
+    Descriptor as google___protobuf___descriptor___Descriptor,
+)
+
+from google.protobuf.message import (
+    Message as google___protobuf___message___Message,
+)
+
+from google.protobuf.struct_pb2 import (
+    Struct as google___protobuf___struct_pb2___Struct,
+)
+
+from typing import (
+    Optional as typing___Optional,
+    Text as typing___Text,
+    Union as typing___Union,
+)
+
+from typing_extensions import (
+    Literal as typing_extensions___Literal,
+)
+
+
+builtin___bool = bool
+builtin___bytes = bytes
+builtin___float = float
+builtin___int = int
+if sys.version_info < (3,):
+    builtin___buffer = buffer
+    builtin___unicode = unicode
+
+
+class GetProvisionInfoRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    def __init__(self,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> GetProvisionInfoRequest: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> GetProvisionInfoRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class GetProvisionInfoResponse(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def info(self) -> ProvisionInfo: ...
+
+    def __init__(self,
+        *,
+        info : typing___Optional[ProvisionInfo] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> GetProvisionInfoResponse: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> GetProvisionInfoResponse: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"info"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"info"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"info",b"info"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"info",b"info"]) -> None: ...
+
+class ProvisionInfo(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    retrieval_token = ... # type: typing___Text
+
+    @property
+    def pipeline_options(self) -> google___protobuf___struct_pb2___Struct: ...
+
+    @property
+    def status_endpoint(self) -> endpoints_pb2___ApiServiceDescriptor: ...
+
+    @property
+    def logging_endpoint(self) -> endpoints_pb2___ApiServiceDescriptor: ...
+
+    @property
+    def artifact_endpoint(self) -> endpoints_pb2___ApiServiceDescriptor: ...
+
+    @property
+    def control_endpoint(self) -> endpoints_pb2___ApiServiceDescriptor: ...
+
+    def __init__(self,
+        *,
+        pipeline_options : typing___Optional[google___protobuf___struct_pb2___Struct] = None,
+        retrieval_token : typing___Optional[typing___Text] = None,
+        status_endpoint : typing___Optional[endpoints_pb2___ApiServiceDescriptor] = None,
+        logging_endpoint : typing___Optional[endpoints_pb2___ApiServiceDescriptor] = None,
+        artifact_endpoint : typing___Optional[endpoints_pb2___ApiServiceDescriptor] = None,
+        control_endpoint : typing___Optional[endpoints_pb2___ApiServiceDescriptor] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> ProvisionInfo: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ProvisionInfo: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"artifact_endpoint",u"control_endpoint",u"logging_endpoint",u"pipeline_options",u"status_endpoint"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"artifact_endpoint",u"control_endpoint",u"logging_endpoint",u"pipeline_options",u"retrieval_token",u"status_endpoint"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"artifact_endpoint",b"artifact_endpoint",u"control_endpoint",b"control_endpoint",u"logging_endpoint",b"logging_endpoint",u"pipeline_options",b"pipeline_options",u"status_endpoint",b"status_endpoint"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"artifact_endpoint",b"artifact_endpoint",u"control_endpoint",b"control_endpoint",u"logging_endpoint",b"logging_endpoint",u"pipeline_options",b"pipeline_options",u"retrieval_token",b"retrieval_token",u"status_endpoint",b"status_endpoint"]) -> None: ...
@@ -0,0 +1,5707 @@
+from __future__ import absolute_import
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_runner_api.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import endpoints_pb2 as endpoints__pb2
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='beam_runner_api.proto',
+  package='org.apache.beam.model.pipeline.v1',
+  syntax='proto3',
+  serialized_pb=_b('\n\x15\x62\x65\x61m_runner_api.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x0f\x65ndpoints.proto\x1a\x19google/protobuf/any.proto\x1a google/protobuf/descriptor.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\xc2\x01\n\rBeamConstants\"\xb0\x01\n\tConstants\x12\x31\n\x14MIN_TIMESTAMP_MILLIS\x10\x00\x1a\x17\xaa\xb4\xfa\xc2\x05\x11-9223372036854775\x12\x30\n\x14MAX_TIMESTAMP_MILLIS\x10\x01\x1a\x16\xaa\xb4\xfa\xc2\x05\x10\x39\x32\x32\x33\x33\x37\x32\x30\x33\x36\x38\x35\x34\x37\x37\x35\x12>\n\"GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS\x10\x02\x1a\x16\xaa\xb4\xfa\xc2\x05\x10\x39\x32\x32\x33\x33\x37\x31\x39\x35\x30\x34\x35\x34\x37\x37\x35\"\xb5\x07\n\nComponents\x12Q\n\ntransforms\x18\x01 \x03(\x0b\x32=.org.apache.beam.model.pipeline.v1.Components.TransformsEntry\x12U\n\x0cpcollections\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.Components.PcollectionsEntry\x12\x64\n\x14windowing_strategies\x18\x03 \x03(\x0b\x32\x46.org.apache.beam.model.pipeline.v1.Components.WindowingStrategiesEntry\x12I\n\x06\x63oders\x18\x04 \x03(\x0b\x32\x39.org.apache.beam.model.pipeline.v1.Components.CodersEntry\x12U\n\x0c\x65nvironments\x18\x05 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.Components.EnvironmentsEntry\x1a`\n\x0fTransformsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12<\n\x05value\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform:\x02\x38\x01\x1a\x63\n\x11PcollectionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.PCollection:\x02\x38\x01\x1ap\n\x18WindowingStrategiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x43\n\x05value\x18\x02 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowingStrategy:\x02\x38\x01\x1aW\n\x0b\x43odersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x37\n\x05value\x18\x02 \x01(\x0b\x32(.org.apache.beam.model.pipeline.v1.Coder:\x02\x38\x01\x1a\x63\n\x11\x45nvironmentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment:\x02\x38\x01\"\xc5\x01\n\x08Pipeline\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12\x1a\n\x12root_transform_ids\x18\x02 \x03(\t\x12\x44\n\x0c\x64isplay_data\x18\x03 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x14\n\x0crequirements\x18\x04 \x03(\t\"\xcc\x03\n\nPTransform\x12\x13\n\x0bunique_name\x18\x05 \x01(\t\x12=\n\x04spec\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x15\n\rsubtransforms\x18\x02 \x03(\t\x12I\n\x06inputs\x18\x03 \x03(\x0b\x32\x39.org.apache.beam.model.pipeline.v1.PTransform.InputsEntry\x12K\n\x07outputs\x18\x04 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.PTransform.OutputsEntry\x12\x44\n\x0c\x64isplay_data\x18\x06 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x16\n\x0e\x65nvironment_id\x18\x07 \x01(\t\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a.\n\x0cOutputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb5\r\n\x13StandardPTransforms\"\xa9\x03\n\nPrimitives\x12)\n\x06PAR_DO\x10\x00\x1a\x1d\xa2\xb4\xfa\xc2\x05\x17\x62\x65\x61m:transform:pardo:v1\x12,\n\x07\x46LATTEN\x10\x01\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:transform:flatten:v1\x12\x36\n\x0cGROUP_BY_KEY\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:transform:group_by_key:v1\x12,\n\x07IMPULSE\x10\x03\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:transform:impulse:v1\x12\x37\n\x0e\x41SSIGN_WINDOWS\x10\x04\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:window_into:v1\x12\x33\n\x0bTEST_STREAM\x10\x05\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:transform:teststream:v1\x12\x34\n\x0bMAP_WINDOWS\x10\x06\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:map_windows:v1\x12\x38\n\rMERGE_WINDOWS\x10\x07\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:transform:merge_windows:v1\"t\n\x14\x44\x65precatedPrimitives\x12&\n\x04READ\x10\x00\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:transform:read:v1\x12\x34\n\x0b\x43REATE_VIEW\x10\x01\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:create_view:v1\"\xf2\x01\n\nComposites\x12<\n\x0f\x43OMBINE_PER_KEY\x10\x00\x1a\'\xa2\xb4\xfa\xc2\x05!beam:transform:combine_per_key:v1\x12>\n\x10\x43OMBINE_GLOBALLY\x10\x01\x1a(\xa2\xb4\xfa\xc2\x05\"beam:transform:combine_globally:v1\x12\x30\n\tRESHUFFLE\x10\x02\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:transform:reshuffle:v1\x12\x34\n\x0bWRITE_FILES\x10\x03\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:write_files:v1\"\xf5\x02\n\x11\x43ombineComponents\x12R\n\x1a\x43OMBINE_PER_KEY_PRECOMBINE\x10\x00\x1a\x32\xa2\xb4\xfa\xc2\x05,beam:transform:combine_per_key_precombine:v1\x12\x62\n\"COMBINE_PER_KEY_MERGE_ACCUMULATORS\x10\x01\x1a:\xa2\xb4\xfa\xc2\x05\x34\x62\x65\x61m:transform:combine_per_key_merge_accumulators:v1\x12\\\n\x1f\x43OMBINE_PER_KEY_EXTRACT_OUTPUTS\x10\x02\x1a\x37\xa2\xb4\xfa\xc2\x05\x31\x62\x65\x61m:transform:combine_per_key_extract_outputs:v1\x12J\n\x16\x43OMBINE_GROUPED_VALUES\x10\x03\x1a.\xa2\xb4\xfa\xc2\x05(beam:transform:combine_grouped_values:v1\"\x8e\x04\n\x19SplittableParDoComponents\x12L\n\x15PAIR_WITH_RESTRICTION\x10\x00\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:transform:sdf_pair_with_restriction:v1\x12\x44\n\x11SPLIT_RESTRICTION\x10\x01\x1a-\xa2\xb4\xfa\xc2\x05\'beam:transform:sdf_split_restriction:v1\x12N\n\x16PROCESS_KEYED_ELEMENTS\x10\x02\x1a\x32\xa2\xb4\xfa\xc2\x05,beam:transform:sdf_process_keyed_elements:v1\x12\x42\n\x10PROCESS_ELEMENTS\x10\x03\x1a,\xa2\xb4\xfa\xc2\x05&beam:transform:sdf_process_elements:v1\x12X\n\x1bSPLIT_AND_SIZE_RESTRICTIONS\x10\x04\x1a\x37\xa2\xb4\xfa\xc2\x05\x31\x62\x65\x61m:transform:sdf_split_and_size_restrictions:v1\x12o\n\'PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS\x10\x05\x1a\x42\xa2\xb4\xfa\xc2\x05<beam:transform:sdf_process_sized_element_and_restrictions:v1\"\x82\x01\n\x16StandardSideInputTypes\"h\n\x04\x45num\x12/\n\x08ITERABLE\x10\x00\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:side_input:iterable:v1\x12/\n\x08MULTIMAP\x10\x01\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:side_input:multimap:v1\"\xe0\x01\n\x0bPCollection\x12\x13\n\x0bunique_name\x18\x01 \x01(\t\x12\x10\n\x08\x63oder_id\x18\x02 \x01(\t\x12\x45\n\nis_bounded\x18\x03 \x01(\x0e\x32\x31.org.apache.beam.model.pipeline.v1.IsBounded.Enum\x12\x1d\n\x15windowing_strategy_id\x18\x04 \x01(\t\x12\x44\n\x0c\x64isplay_data\x18\x05 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\"\x99\x08\n\x0cParDoPayload\x12>\n\x05\x64o_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12@\n\nparameters\x18\x02 \x03(\x0b\x32,.org.apache.beam.model.pipeline.v1.Parameter\x12T\n\x0bside_inputs\x18\x03 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.ParDoPayload.SideInputsEntry\x12T\n\x0bstate_specs\x18\x04 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.ParDoPayload.StateSpecsEntry\x12T\n\x0btimer_specs\x18\x05 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.ParDoPayload.TimerSpecsEntry\x12\x61\n\x12timer_family_specs\x18\t \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ParDoPayload.TimerFamilySpecsEntry\x12\x12\n\nsplittable\x18\x06 \x01(\x08\x12\x1c\n\x14restriction_coder_id\x18\x07 \x01(\t\x12\x1d\n\x15requests_finalization\x18\x08 \x01(\x08\x12\"\n\x1arequires_time_sorted_input\x18\n \x01(\x08\x12\x1d\n\x15requires_stable_input\x18\x0b \x01(\x08\x1a_\n\x0fSideInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInput:\x02\x38\x01\x1a_\n\x0fStateSpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.StateSpec:\x02\x38\x01\x1a_\n\x0fTimerSpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.TimerSpec:\x02\x38\x01\x1ak\n\x15TimerFamilySpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x41\n\x05value\x18\x02 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.TimerFamilySpec:\x02\x38\x01\"\xad\x01\n\tParameter\x12\x44\n\x04type\x18\x01 \x01(\x0e\x32\x36.org.apache.beam.model.pipeline.v1.Parameter.Type.Enum\x1aZ\n\x04Type\"R\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\n\n\x06WINDOW\x10\x01\x12\x14\n\x10PIPELINE_OPTIONS\x10\x02\x12\x17\n\x13RESTRICTION_TRACKER\x10\x03\"\x92\x03\n\tStateSpec\x12]\n\x16read_modify_write_spec\x18\x01 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.ReadModifyWriteStateSpecH\x00\x12\x43\n\x08\x62\x61g_spec\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.BagStateSpecH\x00\x12O\n\x0e\x63ombining_spec\x18\x03 \x01(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.CombiningStateSpecH\x00\x12\x43\n\x08map_spec\x18\x04 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.MapStateSpecH\x00\x12\x43\n\x08set_spec\x18\x05 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.SetStateSpecH\x00\x42\x06\n\x04spec\",\n\x18ReadModifyWriteStateSpec\x12\x10\n\x08\x63oder_id\x18\x01 \x01(\t\"(\n\x0c\x42\x61gStateSpec\x12\x18\n\x10\x65lement_coder_id\x18\x01 \x01(\t\"w\n\x12\x43ombiningStateSpec\x12\x1c\n\x14\x61\x63\x63umulator_coder_id\x18\x01 \x01(\t\x12\x43\n\ncombine_fn\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"<\n\x0cMapStateSpec\x12\x14\n\x0ckey_coder_id\x18\x01 \x01(\t\x12\x16\n\x0evalue_coder_id\x18\x02 \x01(\t\"(\n\x0cSetStateSpec\x12\x18\n\x10\x65lement_coder_id\x18\x01 \x01(\t\"l\n\tTimerSpec\x12G\n\x0btime_domain\x18\x01 \x01(\x0e\x32\x32.org.apache.beam.model.pipeline.v1.TimeDomain.Enum\x12\x16\n\x0etimer_coder_id\x18\x02 \x01(\t\"y\n\x0fTimerFamilySpec\x12G\n\x0btime_domain\x18\x01 \x01(\x0e\x32\x32.org.apache.beam.model.pipeline.v1.TimeDomain.Enum\x12\x1d\n\x15timer_family_coder_id\x18\x02 \x01(\t\"@\n\tIsBounded\"3\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\r\n\tUNBOUNDED\x10\x01\x12\x0b\n\x07\x42OUNDED\x10\x02\"\x95\x01\n\x0bReadPayload\x12?\n\x06source\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x45\n\nis_bounded\x18\x02 \x01(\x0e\x32\x31.org.apache.beam.model.pipeline.v1.IsBounded.Enum\"W\n\x11WindowIntoPayload\x12\x42\n\twindow_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"s\n\x0e\x43ombinePayload\x12\x43\n\ncombine_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x1c\n\x14\x61\x63\x63umulator_coder_id\x18\x02 \x01(\t\"\xaf\x06\n\x11TestStreamPayload\x12\x10\n\x08\x63oder_id\x18\x01 \x01(\t\x12J\n\x06\x65vents\x18\x02 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event\x12I\n\x08\x65ndpoint\x18\x03 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x1a\xae\x04\n\x05\x45vent\x12\x66\n\x0fwatermark_event\x18\x01 \x01(\x0b\x32K.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceWatermarkH\x00\x12q\n\x15processing_time_event\x18\x02 \x01(\x0b\x32P.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceProcessingTimeH\x00\x12_\n\relement_event\x18\x03 \x01(\x0b\x32\x46.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AddElementsH\x00\x1a\x36\n\x10\x41\x64vanceWatermark\x12\x15\n\rnew_watermark\x18\x01 \x01(\x03\x12\x0b\n\x03tag\x18\x02 \x01(\t\x1a\x31\n\x15\x41\x64vanceProcessingTime\x12\x18\n\x10\x61\x64vance_duration\x18\x01 \x01(\x03\x1au\n\x0b\x41\x64\x64\x45lements\x12Y\n\x08\x65lements\x18\x01 \x03(\x0b\x32G.org.apache.beam.model.pipeline.v1.TestStreamPayload.TimestampedElement\x12\x0b\n\x03tag\x18\x03 \x01(\tB\x07\n\x05\x65vent\x1a@\n\x12TimestampedElement\x12\x17\n\x0f\x65ncoded_element\x18\x01 \x01(\x0c\x12\x11\n\ttimestamp\x18\x02 \x01(\x03\"#\n\rEventsRequest\x12\x12\n\noutput_ids\x18\x01 \x03(\t\"\x95\x03\n\x11WriteFilesPayload\x12=\n\x04sink\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12H\n\x0f\x66ormat_function\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x17\n\x0fwindowed_writes\x18\x03 \x01(\x08\x12\"\n\x1arunner_determined_sharding\x18\x04 \x01(\x08\x12Y\n\x0bside_inputs\x18\x05 \x03(\x0b\x32\x44.org.apache.beam.model.pipeline.v1.WriteFilesPayload.SideInputsEntry\x1a_\n\x0fSideInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInput:\x02\x38\x01\"c\n\x05\x43oder\x12=\n\x04spec\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x1b\n\x13\x63omponent_coder_ids\x18\x02 \x03(\t\"\xe1\x05\n\x0eStandardCoders\"\xce\x05\n\x04\x45num\x12$\n\x05\x42YTES\x10\x00\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:coder:bytes:v1\x12\x30\n\x0bSTRING_UTF8\x10\n\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:coder:string_utf8:v1\x12\x1e\n\x02KV\x10\x01\x1a\x16\xa2\xb4\xfa\xc2\x05\x10\x62\x65\x61m:coder:kv:v1\x12\"\n\x04\x42OOL\x10\x0c\x1a\x18\xa2\xb4\xfa\xc2\x05\x12\x62\x65\x61m:coder:bool:v1\x12&\n\x06VARINT\x10\x02\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:coder:varint:v1\x12&\n\x06\x44OUBLE\x10\x0b\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:coder:double:v1\x12*\n\x08ITERABLE\x10\x03\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:coder:iterable:v1\x12$\n\x05TIMER\x10\x04\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:coder:timer:v1\x12\x38\n\x0fINTERVAL_WINDOW\x10\x05\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:coder:interval_window:v1\x12\x34\n\rLENGTH_PREFIX\x10\x06\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:coder:length_prefix:v1\x12\x34\n\rGLOBAL_WINDOW\x10\x07\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:coder:global_window:v1\x12\x36\n\x0eWINDOWED_VALUE\x10\x08\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:coder:windowed_value:v1\x12\x42\n\x14PARAM_WINDOWED_VALUE\x10\x0e\x1a(\xa2\xb4\xfa\xc2\x05\"beam:coder:param_windowed_value:v1\x12\x44\n\x15STATE_BACKED_ITERABLE\x10\t\x1a)\xa2\xb4\xfa\xc2\x05#beam:coder:state_backed_iterable:v1\x12 \n\x03ROW\x10\r\x1a\x17\xa2\xb4\xfa\xc2\x05\x11\x62\x65\x61m:coder:row:v1\"\x8a\x05\n\x11WindowingStrategy\x12\x42\n\twindow_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12I\n\x0cmerge_status\x18\x02 \x01(\x0e\x32\x33.org.apache.beam.model.pipeline.v1.MergeStatus.Enum\x12\x17\n\x0fwindow_coder_id\x18\x03 \x01(\t\x12;\n\x07trigger\x18\x04 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12S\n\x11\x61\x63\x63umulation_mode\x18\x05 \x01(\x0e\x32\x38.org.apache.beam.model.pipeline.v1.AccumulationMode.Enum\x12G\n\x0boutput_time\x18\x06 \x01(\x0e\x32\x32.org.apache.beam.model.pipeline.v1.OutputTime.Enum\x12Q\n\x10\x63losing_behavior\x18\x07 \x01(\x0e\x32\x37.org.apache.beam.model.pipeline.v1.ClosingBehavior.Enum\x12\x18\n\x10\x61llowed_lateness\x18\x08 \x01(\x03\x12N\n\x0eOnTimeBehavior\x18\t \x01(\x0e\x32\x36.org.apache.beam.model.pipeline.v1.OnTimeBehavior.Enum\x12\x1d\n\x15\x61ssigns_to_one_window\x18\n \x01(\x08\x12\x16\n\x0e\x65nvironment_id\x18\x0b \x01(\t\"\\\n\x0bMergeStatus\"M\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0bNON_MERGING\x10\x01\x12\x0f\n\x0bNEEDS_MERGE\x10\x02\x12\x12\n\x0e\x41LREADY_MERGED\x10\x03\"]\n\x10\x41\x63\x63umulationMode\"I\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0e\n\nDISCARDING\x10\x01\x12\x10\n\x0c\x41\x43\x43UMULATING\x10\x02\x12\x0e\n\nRETRACTING\x10\x03\"Q\n\x0f\x43losingBehavior\">\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0b\x45MIT_ALWAYS\x10\x01\x12\x14\n\x10\x45MIT_IF_NONEMPTY\x10\x02\"P\n\x0eOnTimeBehavior\">\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0b\x46IRE_ALWAYS\x10\x01\x12\x14\n\x10\x46IRE_IF_NONEMPTY\x10\x02\"b\n\nOutputTime\"T\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x11\n\rEND_OF_WINDOW\x10\x01\x12\x12\n\x0eLATEST_IN_PANE\x10\x02\x12\x14\n\x10\x45\x41RLIEST_IN_PANE\x10\x03\"l\n\nTimeDomain\"^\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0e\n\nEVENT_TIME\x10\x01\x12\x13\n\x0fPROCESSING_TIME\x10\x02\x12 \n\x1cSYNCHRONIZED_PROCESSING_TIME\x10\x03\"\x82\x0e\n\x07Trigger\x12H\n\tafter_all\x18\x01 \x01(\x0b\x32\x33.org.apache.beam.model.pipeline.v1.Trigger.AfterAllH\x00\x12H\n\tafter_any\x18\x02 \x01(\x0b\x32\x33.org.apache.beam.model.pipeline.v1.Trigger.AfterAnyH\x00\x12J\n\nafter_each\x18\x03 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.Trigger.AfterEachH\x00\x12Z\n\x13\x61\x66ter_end_of_window\x18\x04 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.Trigger.AfterEndOfWindowH\x00\x12_\n\x15\x61\x66ter_processing_time\x18\x05 \x01(\x0b\x32>.org.apache.beam.model.pipeline.v1.Trigger.AfterProcessingTimeH\x00\x12x\n\"after_synchronized_processing_time\x18\x06 \x01(\x0b\x32J.org.apache.beam.model.pipeline.v1.Trigger.AfterSynchronizedProcessingTimeH\x00\x12\x43\n\x06\x61lways\x18\x0c \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.Trigger.AlwaysH\x00\x12\x45\n\x07\x64\x65\x66\x61ult\x18\x07 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.Trigger.DefaultH\x00\x12P\n\relement_count\x18\x08 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.Trigger.ElementCountH\x00\x12\x41\n\x05never\x18\t \x01(\x0b\x32\x30.org.apache.beam.model.pipeline.v1.Trigger.NeverH\x00\x12J\n\nor_finally\x18\n \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.Trigger.OrFinallyH\x00\x12\x43\n\x06repeat\x18\x0b \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.Trigger.RepeatH\x00\x1aK\n\x08\x41\x66terAll\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aK\n\x08\x41\x66terAny\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aL\n\tAfterEach\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1a\x97\x01\n\x10\x41\x66terEndOfWindow\x12\x41\n\rearly_firings\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12@\n\x0clate_firings\x18\x02 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aj\n\x13\x41\x66terProcessingTime\x12S\n\x14timestamp_transforms\x18\x01 \x03(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.TimestampTransform\x1a!\n\x1f\x41\x66terSynchronizedProcessingTime\x1a\t\n\x07\x44\x65\x66\x61ult\x1a%\n\x0c\x45lementCount\x12\x15\n\relement_count\x18\x01 \x01(\x05\x1a\x07\n\x05Never\x1a\x08\n\x06\x41lways\x1a\x82\x01\n\tOrFinally\x12\x38\n\x04main\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12;\n\x07\x66inally\x18\x02 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aH\n\x06Repeat\x12>\n\nsubtrigger\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.TriggerB\t\n\x07trigger\"\x96\x02\n\x12TimestampTransform\x12L\n\x05\x64\x65lay\x18\x01 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.TimestampTransform.DelayH\x00\x12Q\n\x08\x61lign_to\x18\x02 \x01(\x0b\x32=.org.apache.beam.model.pipeline.v1.TimestampTransform.AlignToH\x00\x1a\x1d\n\x05\x44\x65lay\x12\x14\n\x0c\x64\x65lay_millis\x18\x01 \x01(\x03\x1a)\n\x07\x41lignTo\x12\x0e\n\x06period\x18\x03 \x01(\x03\x12\x0e\n\x06offset\x18\x04 \x01(\x03\x42\x15\n\x13timestamp_transform\"\xe2\x01\n\tSideInput\x12G\n\x0e\x61\x63\x63\x65ss_pattern\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12@\n\x07view_fn\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12J\n\x11window_mapping_fn\x18\x03 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"\xc2\x02\n\x11StandardArtifacts\"\xeb\x01\n\x05Types\x12*\n\x04\x46ILE\x10\x00\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:artifact:type:file:v1\x12(\n\x03URL\x10\x01\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:artifact:type:url:v1\x12\x32\n\x08\x45MBEDDED\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:artifact:type:embedded:v1\x12*\n\x04PYPI\x10\x03\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:artifact:type:pypi:v1\x12,\n\x05MAVEN\x10\x04\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:artifact:type:maven:v1\"?\n\x05Roles\x12\x36\n\nSTAGING_TO\x10\x00\x1a&\xa2\xb4\xfa\xc2\x05 beam:artifact:role:staging_to:v1\"3\n\x13\x41rtifactFilePayload\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06sha256\x18\x02 \x01(\t\"\"\n\x12\x41rtifactUrlPayload\x12\x0c\n\x04path\x18\x01 \x01(\t\"#\n\x13\x45mbeddedFilePayload\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"3\n\x0bPyPIPayload\x12\x13\n\x0b\x61rtifact_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"8\n\x0cMavenPayload\x12\x10\n\x08\x61rtifact\x18\x01 \x01(\t\x12\x16\n\x0erepository_url\x18\x02 \x01(\t\"3\n\x1c\x41rtifactStagingToRolePayload\x12\x13\n\x0bstaged_name\x18\x01 \x01(\t\"e\n\x13\x41rtifactInformation\x12\x10\n\x08type_urn\x18\x01 \x01(\t\x12\x14\n\x0ctype_payload\x18\x02 \x01(\x0c\x12\x10\n\x08role_urn\x18\x03 \x01(\t\x12\x14\n\x0crole_payload\x18\x04 \x01(\x0c\"\xdb\x01\n\x0b\x45nvironment\x12\x0b\n\x03urn\x18\x02 \x01(\t\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\x12\x44\n\x0c\x64isplay_data\x18\x04 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x14\n\x0c\x63\x61pabilities\x18\x05 \x03(\t\x12L\n\x0c\x64\x65pendencies\x18\x06 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformationJ\x04\x08\x01\x10\x02\"\x9f\x01\n\x14StandardEnvironments\"\x86\x01\n\x0c\x45nvironments\x12$\n\x06\x44OCKER\x10\x00\x1a\x18\xa2\xb4\xfa\xc2\x05\x12\x62\x65\x61m:env:docker:v1\x12&\n\x07PROCESS\x10\x01\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:env:process:v1\x12(\n\x08\x45XTERNAL\x10\x02\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:env:external:v1\"(\n\rDockerPayload\x12\x17\n\x0f\x63ontainer_image\x18\x01 \x01(\t\"\xb0\x01\n\x0eProcessPayload\x12\n\n\x02os\x18\x01 \x01(\t\x12\x0c\n\x04\x61rch\x18\x02 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x03 \x01(\t\x12G\n\x03\x65nv\x18\x04 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.ProcessPayload.EnvEntry\x1a*\n\x08\x45nvEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xdb\x01\n\x0f\x45xternalPayload\x12I\n\x08\x65ndpoint\x18\x01 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12N\n\x06params\x18\x02 \x03(\x0b\x32>.org.apache.beam.model.pipeline.v1.ExternalPayload.ParamsEntry\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb9\x02\n\x11StandardProtocols\"\xa3\x02\n\x04\x45num\x12H\n\x19LEGACY_PROGRESS_REPORTING\x10\x00\x1a)\xa2\xb4\xfa\xc2\x05#beam:protocol:progress_reporting:v0\x12\x41\n\x12PROGRESS_REPORTING\x10\x01\x1a)\xa2\xb4\xfa\xc2\x05#beam:protocol:progress_reporting:v1\x12\x37\n\rWORKER_STATUS\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:protocol:worker_status:v1\x12U\n\x1cMULTI_CORE_BUNDLE_PROCESSING\x10\x03\x1a\x33\xa2\xb4\xfa\xc2\x05-beam:protocol:multi_core_bundle_processing:v1\"\xd7\x02\n\x14StandardRequirements\"\xbe\x02\n\x04\x45num\x12J\n\x1cREQUIRES_STATEFUL_PROCESSING\x10\x00\x1a(\xa2\xb4\xfa\xc2\x05\"beam:requirement:pardo:stateful:v1\x12N\n\x1cREQUIRES_BUNDLE_FINALIZATION\x10\x01\x1a,\xa2\xb4\xfa\xc2\x05&beam:requirement:pardo:finalization:v1\x12G\n\x15REQUIRES_STABLE_INPUT\x10\x02\x1a,\xa2\xb4\xfa\xc2\x05&beam:requirement:pardo:stable_input:v1\x12Q\n\x1aREQUIRES_TIME_SORTED_INPUT\x10\x03\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:requirement:pardo:time_sorted_input:v1\",\n\x0c\x46unctionSpec\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\"e\n\x13StandardDisplayData\"N\n\x0b\x44isplayData\x12?\n\x0fLABELLED_STRING\x10\x00\x1a*\xa2\xb4\xfa\xc2\x05$beam:display_data:labelled_string:v1\"5\n\x15LabelledStringPayload\x12\r\n\x05label\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"+\n\x0b\x44isplayData\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"\xc1\x06\n\x15MessageWithComponents\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12\x39\n\x05\x63oder\x18\x02 \x01(\x0b\x32(.org.apache.beam.model.pipeline.v1.CoderH\x00\x12L\n\x0f\x63ombine_payload\x18\x03 \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.CombinePayloadH\x00\x12H\n\rfunction_spec\x18\x04 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpecH\x00\x12I\n\x0epar_do_payload\x18\x06 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.ParDoPayloadH\x00\x12\x43\n\nptransform\x18\x07 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransformH\x00\x12\x45\n\x0bpcollection\x18\x08 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.PCollectionH\x00\x12\x46\n\x0cread_payload\x18\t \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.ReadPayloadH\x00\x12\x42\n\nside_input\x18\x0b \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInputH\x00\x12S\n\x13window_into_payload\x18\x0c \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowIntoPayloadH\x00\x12R\n\x12windowing_strategy\x18\r \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowingStrategyH\x00\x42\x06\n\x04root\"\xb9\x08\n\x16\x45xecutableStagePayload\x12\x43\n\x0b\x65nvironment\x18\x01 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment\x12g\n\x13wire_coder_settings\x18\t \x03(\x0b\x32J.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting\x12\r\n\x05input\x18\x02 \x01(\t\x12Z\n\x0bside_inputs\x18\x03 \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.SideInputId\x12\x12\n\ntransforms\x18\x04 \x03(\t\x12\x0f\n\x07outputs\x18\x05 \x03(\t\x12\x41\n\ncomponents\x18\x06 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12Z\n\x0buser_states\x18\x07 \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.UserStateId\x12Q\n\x06timers\x18\x08 \x03(\x0b\x32\x41.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerId\x12^\n\rtimerFamilies\x18\n \x03(\x0b\x32G.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerFamilyId\x1a\x37\n\x0bSideInputId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x37\n\x0bUserStateId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x33\n\x07TimerId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x39\n\rTimerFamilyId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\xac\x01\n\x10WireCoderSetting\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x12\x1c\n\x12input_or_output_id\x18\x03 \x01(\tH\x00\x12R\n\x05timer\x18\x04 \x01(\x0b\x32\x41.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerIdH\x00\x42\x08\n\x06target2\x8f\x01\n\x11TestStreamService\x12z\n\x06\x45vents\x12\x30.org.apache.beam.model.pipeline.v1.EventsRequest\x1a:.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event\"\x00\x30\x01:6\n\x08\x62\x65\x61m_urn\x12!.google.protobuf.EnumValueOptions\x18\xc4\xa6\xafX \x01(\t:;\n\rbeam_constant\x12!.google.protobuf.EnumValueOptions\x18\xc5\xa6\xafX \x01(\tB;\n!org.apache.beam.model.pipeline.v1B\tRunnerApiZ\x0bpipeline_v1b\x06proto3')
+  ,
+  dependencies=[endpoints__pb2.DESCRIPTOR,google_dot_protobuf_dot_any__pb2.DESCRIPTOR,google_dot_protobuf_dot_descriptor__pb2.DESCRIPTOR,google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,])
+
+
+BEAM_URN_FIELD_NUMBER = 185324356
+beam_urn = _descriptor.FieldDescriptor(
+  name='beam_urn', full_name='org.apache.beam.model.pipeline.v1.beam_urn', index=0,
+  number=185324356, type=9, cpp_type=9, label=1,
+  has_default_value=False, default_value=_b("").decode('utf-8'),
+  message_type=None, enum_type=None, containing_type=None,
+  is_extension=True, extension_scope=None,
+  options=None, file=DESCRIPTOR)
+BEAM_CONSTANT_FIELD_NUMBER = 185324357
+beam_constant = _descriptor.FieldDescriptor(
+  name='beam_constant', full_name='org.apache.beam.model.pipeline.v1.beam_constant', index=1,
+  number=185324357, type=9, cpp_type=9, label=1,
+  has_default_value=False, default_value=_b("").decode('utf-8'),
+  message_type=None, enum_type=None, containing_type=None,
+  is_extension=True, extension_scope=None,
+  options=None, file=DESCRIPTOR)
+
+_BEAMCONSTANTS_CONSTANTS = _descriptor.EnumDescriptor(
+  name='Constants',
+  full_name='org.apache.beam.model.pipeline.v1.BeamConstants.Constants',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='MIN_TIMESTAMP_MILLIS', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\252\264\372\302\005\021-9223372036854775')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MAX_TIMESTAMP_MILLIS', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\252\264\372\302\005\0209223372036854775')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\252\264\372\302\005\0209223371950454775')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=190,
+  serialized_end=366,
+)
+_sym_db.RegisterEnumDescriptor(_BEAMCONSTANTS_CONSTANTS)
+
+_STANDARDPTRANSFORMS_PRIMITIVES = _descriptor.EnumDescriptor(
+  name='Primitives',
+  full_name='org.apache.beam.model.pipeline.v1.StandardPTransforms.Primitives',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PAR_DO', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\027beam:transform:pardo:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FLATTEN', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\031beam:transform:flatten:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GROUP_BY_KEY', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\036beam:transform:group_by_key:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='IMPULSE', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\031beam:transform:impulse:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ASSIGN_WINDOWS', index=4, number=4,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:transform:window_into:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TEST_STREAM', index=5, number=5,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\034beam:transform:teststream:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MAP_WINDOWS', index=6, number=6,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:transform:map_windows:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MERGE_WINDOWS', index=7, number=7,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\037beam:transform:merge_windows:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2008,
+  serialized_end=2433,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDPTRANSFORMS_PRIMITIVES)
+
+_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES = _descriptor.EnumDescriptor(
+  name='DeprecatedPrimitives',
+  full_name='org.apache.beam.model.pipeline.v1.StandardPTransforms.DeprecatedPrimitives',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='READ', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\026beam:transform:read:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CREATE_VIEW', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:transform:create_view:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2435,
+  serialized_end=2551,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES)
+
+_STANDARDPTRANSFORMS_COMPOSITES = _descriptor.EnumDescriptor(
+  name='Composites',
+  full_name='org.apache.beam.model.pipeline.v1.StandardPTransforms.Composites',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='COMBINE_PER_KEY', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005!beam:transform:combine_per_key:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='COMBINE_GLOBALLY', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\"beam:transform:combine_globally:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='RESHUFFLE', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:transform:reshuffle:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WRITE_FILES', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:transform:write_files:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2554,
+  serialized_end=2796,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDPTRANSFORMS_COMPOSITES)
+
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS = _descriptor.EnumDescriptor(
+  name='CombineComponents',
+  full_name='org.apache.beam.model.pipeline.v1.StandardPTransforms.CombineComponents',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='COMBINE_PER_KEY_PRECOMBINE', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005,beam:transform:combine_per_key_precombine:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='COMBINE_PER_KEY_MERGE_ACCUMULATORS', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\0054beam:transform:combine_per_key_merge_accumulators:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='COMBINE_PER_KEY_EXTRACT_OUTPUTS', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\0051beam:transform:combine_per_key_extract_outputs:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='COMBINE_GROUPED_VALUES', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005(beam:transform:combine_grouped_values:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2799,
+  serialized_end=3172,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDPTRANSFORMS_COMBINECOMPONENTS)
+
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS = _descriptor.EnumDescriptor(
+  name='SplittableParDoComponents',
+  full_name='org.apache.beam.model.pipeline.v1.StandardPTransforms.SplittableParDoComponents',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PAIR_WITH_RESTRICTION', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005+beam:transform:sdf_pair_with_restriction:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SPLIT_RESTRICTION', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\'beam:transform:sdf_split_restriction:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PROCESS_KEYED_ELEMENTS', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005,beam:transform:sdf_process_keyed_elements:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PROCESS_ELEMENTS', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005&beam:transform:sdf_process_elements:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SPLIT_AND_SIZE_RESTRICTIONS', index=4, number=4,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\0051beam:transform:sdf_split_and_size_restrictions:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS', index=5, number=5,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005<beam:transform:sdf_process_sized_element_and_restrictions:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=3175,
+  serialized_end=3701,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS)
+
+_STANDARDSIDEINPUTTYPES_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.StandardSideInputTypes.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='ITERABLE', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:side_input:iterable:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MULTIMAP', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:side_input:multimap:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=3730,
+  serialized_end=3834,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDSIDEINPUTTYPES_ENUM)
+
+_PARAMETER_TYPE_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.Parameter.Type.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WINDOW', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PIPELINE_OPTIONS', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='RESTRICTION_TRACKER', index=3, number=3,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=5207,
+  serialized_end=5289,
+)
+_sym_db.RegisterEnumDescriptor(_PARAMETER_TYPE_ENUM)
+
+_ISBOUNDED_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.IsBounded.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UNBOUNDED', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BOUNDED', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=6255,
+  serialized_end=6306,
+)
+_sym_db.RegisterEnumDescriptor(_ISBOUNDED_ENUM)
+
+_STANDARDCODERS_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.StandardCoders.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='BYTES', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\023beam:coder:bytes:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STRING_UTF8', index=1, number=10,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\031beam:coder:string_utf8:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='KV', index=2, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\020beam:coder:kv:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BOOL', index=3, number=12,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\022beam:coder:bool:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='VARINT', index=4, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\024beam:coder:varint:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DOUBLE', index=5, number=11,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\024beam:coder:double:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ITERABLE', index=6, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\026beam:coder:iterable:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TIMER', index=7, number=4,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\023beam:coder:timer:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INTERVAL_WINDOW', index=8, number=5,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:coder:interval_window:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LENGTH_PREFIX', index=9, number=6,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:coder:length_prefix:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GLOBAL_WINDOW', index=10, number=7,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:coder:global_window:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WINDOWED_VALUE', index=11, number=8,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\034beam:coder:windowed_value:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PARAM_WINDOWED_VALUE', index=12, number=14,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\"beam:coder:param_windowed_value:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STATE_BACKED_ITERABLE', index=13, number=9,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005#beam:coder:state_backed_iterable:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ROW', index=14, number=13,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\021beam:coder:row:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=8050,
+  serialized_end=8768,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDCODERS_ENUM)
+
+_MERGESTATUS_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.MergeStatus.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NON_MERGING', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NEEDS_MERGE', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ALREADY_MERGED', index=3, number=3,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=9438,
+  serialized_end=9515,
+)
+_sym_db.RegisterEnumDescriptor(_MERGESTATUS_ENUM)
+
+_ACCUMULATIONMODE_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.AccumulationMode.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DISCARDING', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ACCUMULATING', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='RETRACTING', index=3, number=3,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=9537,
+  serialized_end=9610,
+)
+_sym_db.RegisterEnumDescriptor(_ACCUMULATIONMODE_ENUM)
+
+_CLOSINGBEHAVIOR_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.ClosingBehavior.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EMIT_ALWAYS', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EMIT_IF_NONEMPTY', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=9631,
+  serialized_end=9693,
+)
+_sym_db.RegisterEnumDescriptor(_CLOSINGBEHAVIOR_ENUM)
+
+_ONTIMEBEHAVIOR_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.OnTimeBehavior.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FIRE_ALWAYS', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FIRE_IF_NONEMPTY', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=9713,
+  serialized_end=9775,
+)
+_sym_db.RegisterEnumDescriptor(_ONTIMEBEHAVIOR_ENUM)
+
+_OUTPUTTIME_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.OutputTime.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='END_OF_WINDOW', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LATEST_IN_PANE', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EARLIEST_IN_PANE', index=3, number=3,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=9791,
+  serialized_end=9875,
+)
+_sym_db.RegisterEnumDescriptor(_OUTPUTTIME_ENUM)
+
+_TIMEDOMAIN_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.TimeDomain.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNSPECIFIED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EVENT_TIME', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PROCESSING_TIME', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SYNCHRONIZED_PROCESSING_TIME', index=3, number=3,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=9891,
+  serialized_end=9985,
+)
+_sym_db.RegisterEnumDescriptor(_TIMEDOMAIN_ENUM)
+
+_STANDARDARTIFACTS_TYPES = _descriptor.EnumDescriptor(
+  name='Types',
+  full_name='org.apache.beam.model.pipeline.v1.StandardArtifacts.Types',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='FILE', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\032beam:artifact:type:file:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='URL', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\031beam:artifact:type:url:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EMBEDDED', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\036beam:artifact:type:embedded:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PYPI', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\032beam:artifact:type:pypi:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MAVEN', index=4, number=4,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:artifact:type:maven:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=12317,
+  serialized_end=12552,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDARTIFACTS_TYPES)
+
+_STANDARDARTIFACTS_ROLES = _descriptor.EnumDescriptor(
+  name='Roles',
+  full_name='org.apache.beam.model.pipeline.v1.StandardArtifacts.Roles',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='STAGING_TO', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005 beam:artifact:role:staging_to:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=12554,
+  serialized_end=12617,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDARTIFACTS_ROLES)
+
+_STANDARDENVIRONMENTS_ENVIRONMENTS = _descriptor.EnumDescriptor(
+  name='Environments',
+  full_name='org.apache.beam.model.pipeline.v1.StandardEnvironments.Environments',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='DOCKER', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\022beam:env:docker:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PROCESS', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\023beam:env:process:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EXTERNAL', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\024beam:env:external:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=13260,
+  serialized_end=13394,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDENVIRONMENTS_ENVIRONMENTS)
+
+_STANDARDPROTOCOLS_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.StandardProtocols.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='LEGACY_PROGRESS_REPORTING', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005#beam:protocol:progress_reporting:v0')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PROGRESS_REPORTING', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005#beam:protocol:progress_reporting:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WORKER_STATUS', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\036beam:protocol:worker_status:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MULTI_CORE_BUNDLE_PROCESSING', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005-beam:protocol:multi_core_bundle_processing:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=13862,
+  serialized_end=14153,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDPROTOCOLS_ENUM)
+
+_STANDARDREQUIREMENTS_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.StandardRequirements.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='REQUIRES_STATEFUL_PROCESSING', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\"beam:requirement:pardo:stateful:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='REQUIRES_BUNDLE_FINALIZATION', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005&beam:requirement:pardo:finalization:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='REQUIRES_STABLE_INPUT', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005&beam:requirement:pardo:stable_input:v1')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='REQUIRES_TIME_SORTED_INPUT', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005+beam:requirement:pardo:time_sorted_input:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=14181,
+  serialized_end=14499,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDREQUIREMENTS_ENUM)
+
+_STANDARDDISPLAYDATA_DISPLAYDATA = _descriptor.EnumDescriptor(
+  name='DisplayData',
+  full_name='org.apache.beam.model.pipeline.v1.StandardDisplayData.DisplayData',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='LABELLED_STRING', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005$beam:display_data:labelled_string:v1')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=14570,
+  serialized_end=14648,
+)
+_sym_db.RegisterEnumDescriptor(_STANDARDDISPLAYDATA_DISPLAYDATA)
+
+
+_BEAMCONSTANTS = _descriptor.Descriptor(
+  name='BeamConstants',
+  full_name='org.apache.beam.model.pipeline.v1.BeamConstants',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _BEAMCONSTANTS_CONSTANTS,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=172,
+  serialized_end=366,
+)
+
+
+_COMPONENTS_TRANSFORMSENTRY = _descriptor.Descriptor(
+  name='TransformsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.Components.TransformsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.Components.TransformsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.Components.TransformsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=817,
+  serialized_end=913,
+)
+
+_COMPONENTS_PCOLLECTIONSENTRY = _descriptor.Descriptor(
+  name='PcollectionsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.Components.PcollectionsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.Components.PcollectionsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.Components.PcollectionsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=915,
+  serialized_end=1014,
+)
+
+_COMPONENTS_WINDOWINGSTRATEGIESENTRY = _descriptor.Descriptor(
+  name='WindowingStrategiesEntry',
+  full_name='org.apache.beam.model.pipeline.v1.Components.WindowingStrategiesEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.Components.WindowingStrategiesEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.Components.WindowingStrategiesEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1016,
+  serialized_end=1128,
+)
+
+_COMPONENTS_CODERSENTRY = _descriptor.Descriptor(
+  name='CodersEntry',
+  full_name='org.apache.beam.model.pipeline.v1.Components.CodersEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.Components.CodersEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.Components.CodersEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1130,
+  serialized_end=1217,
+)
+
+_COMPONENTS_ENVIRONMENTSENTRY = _descriptor.Descriptor(
+  name='EnvironmentsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.Components.EnvironmentsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.Components.EnvironmentsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.Components.EnvironmentsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1219,
+  serialized_end=1318,
+)
+
+_COMPONENTS = _descriptor.Descriptor(
+  name='Components',
+  full_name='org.apache.beam.model.pipeline.v1.Components',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transforms', full_name='org.apache.beam.model.pipeline.v1.Components.transforms', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pcollections', full_name='org.apache.beam.model.pipeline.v1.Components.pcollections', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='windowing_strategies', full_name='org.apache.beam.model.pipeline.v1.Components.windowing_strategies', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='coders', full_name='org.apache.beam.model.pipeline.v1.Components.coders', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environments', full_name='org.apache.beam.model.pipeline.v1.Components.environments', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_COMPONENTS_TRANSFORMSENTRY, _COMPONENTS_PCOLLECTIONSENTRY, _COMPONENTS_WINDOWINGSTRATEGIESENTRY, _COMPONENTS_CODERSENTRY, _COMPONENTS_ENVIRONMENTSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=369,
+  serialized_end=1318,
+)
+
+
+_PIPELINE = _descriptor.Descriptor(
+  name='Pipeline',
+  full_name='org.apache.beam.model.pipeline.v1.Pipeline',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='components', full_name='org.apache.beam.model.pipeline.v1.Pipeline.components', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='root_transform_ids', full_name='org.apache.beam.model.pipeline.v1.Pipeline.root_transform_ids', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='display_data', full_name='org.apache.beam.model.pipeline.v1.Pipeline.display_data', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='requirements', full_name='org.apache.beam.model.pipeline.v1.Pipeline.requirements', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1321,
+  serialized_end=1518,
+)
+
+
+_PTRANSFORM_INPUTSENTRY = _descriptor.Descriptor(
+  name='InputsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.PTransform.InputsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.PTransform.InputsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.PTransform.InputsEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1888,
+  serialized_end=1933,
+)
+
+_PTRANSFORM_OUTPUTSENTRY = _descriptor.Descriptor(
+  name='OutputsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.PTransform.OutputsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.PTransform.OutputsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.PTransform.OutputsEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1935,
+  serialized_end=1981,
+)
+
+_PTRANSFORM = _descriptor.Descriptor(
+  name='PTransform',
+  full_name='org.apache.beam.model.pipeline.v1.PTransform',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='unique_name', full_name='org.apache.beam.model.pipeline.v1.PTransform.unique_name', index=0,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='spec', full_name='org.apache.beam.model.pipeline.v1.PTransform.spec', index=1,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='subtransforms', full_name='org.apache.beam.model.pipeline.v1.PTransform.subtransforms', index=2,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='inputs', full_name='org.apache.beam.model.pipeline.v1.PTransform.inputs', index=3,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='outputs', full_name='org.apache.beam.model.pipeline.v1.PTransform.outputs', index=4,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='display_data', full_name='org.apache.beam.model.pipeline.v1.PTransform.display_data', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environment_id', full_name='org.apache.beam.model.pipeline.v1.PTransform.environment_id', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PTRANSFORM_INPUTSENTRY, _PTRANSFORM_OUTPUTSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1521,
+  serialized_end=1981,
+)
+
+
+_STANDARDPTRANSFORMS = _descriptor.Descriptor(
+  name='StandardPTransforms',
+  full_name='org.apache.beam.model.pipeline.v1.StandardPTransforms',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _STANDARDPTRANSFORMS_PRIMITIVES,
+    _STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES,
+    _STANDARDPTRANSFORMS_COMPOSITES,
+    _STANDARDPTRANSFORMS_COMBINECOMPONENTS,
+    _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1984,
+  serialized_end=3701,
+)
+
+
+_STANDARDSIDEINPUTTYPES = _descriptor.Descriptor(
+  name='StandardSideInputTypes',
+  full_name='org.apache.beam.model.pipeline.v1.StandardSideInputTypes',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _STANDARDSIDEINPUTTYPES_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3704,
+  serialized_end=3834,
+)
+
+
+_PCOLLECTION = _descriptor.Descriptor(
+  name='PCollection',
+  full_name='org.apache.beam.model.pipeline.v1.PCollection',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='unique_name', full_name='org.apache.beam.model.pipeline.v1.PCollection.unique_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='coder_id', full_name='org.apache.beam.model.pipeline.v1.PCollection.coder_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='is_bounded', full_name='org.apache.beam.model.pipeline.v1.PCollection.is_bounded', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='windowing_strategy_id', full_name='org.apache.beam.model.pipeline.v1.PCollection.windowing_strategy_id', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='display_data', full_name='org.apache.beam.model.pipeline.v1.PCollection.display_data', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3837,
+  serialized_end=4061,
+)
+
+
+_PARDOPAYLOAD_SIDEINPUTSENTRY = _descriptor.Descriptor(
+  name='SideInputsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.SideInputsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.SideInputsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.SideInputsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4715,
+  serialized_end=4810,
+)
+
+_PARDOPAYLOAD_STATESPECSENTRY = _descriptor.Descriptor(
+  name='StateSpecsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.StateSpecsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.StateSpecsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.StateSpecsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4812,
+  serialized_end=4907,
+)
+
+_PARDOPAYLOAD_TIMERSPECSENTRY = _descriptor.Descriptor(
+  name='TimerSpecsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.TimerSpecsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.TimerSpecsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.TimerSpecsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4909,
+  serialized_end=5004,
+)
+
+_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY = _descriptor.Descriptor(
+  name='TimerFamilySpecsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.TimerFamilySpecsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.TimerFamilySpecsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.TimerFamilySpecsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5006,
+  serialized_end=5113,
+)
+
+_PARDOPAYLOAD = _descriptor.Descriptor(
+  name='ParDoPayload',
+  full_name='org.apache.beam.model.pipeline.v1.ParDoPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='do_fn', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.do_fn', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='parameters', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.parameters', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_inputs', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.side_inputs', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state_specs', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.state_specs', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timer_specs', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.timer_specs', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timer_family_specs', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.timer_family_specs', index=5,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='splittable', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.splittable', index=6,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='restriction_coder_id', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.restriction_coder_id', index=7,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='requests_finalization', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.requests_finalization', index=8,
+      number=8, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='requires_time_sorted_input', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.requires_time_sorted_input', index=9,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='requires_stable_input', full_name='org.apache.beam.model.pipeline.v1.ParDoPayload.requires_stable_input', index=10,
+      number=11, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PARDOPAYLOAD_SIDEINPUTSENTRY, _PARDOPAYLOAD_STATESPECSENTRY, _PARDOPAYLOAD_TIMERSPECSENTRY, _PARDOPAYLOAD_TIMERFAMILYSPECSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4064,
+  serialized_end=5113,
+)
+
+
+_PARAMETER_TYPE = _descriptor.Descriptor(
+  name='Type',
+  full_name='org.apache.beam.model.pipeline.v1.Parameter.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _PARAMETER_TYPE_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5199,
+  serialized_end=5289,
+)
+
+_PARAMETER = _descriptor.Descriptor(
+  name='Parameter',
+  full_name='org.apache.beam.model.pipeline.v1.Parameter',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='org.apache.beam.model.pipeline.v1.Parameter.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PARAMETER_TYPE, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5116,
+  serialized_end=5289,
+)
+
+
+_STATESPEC = _descriptor.Descriptor(
+  name='StateSpec',
+  full_name='org.apache.beam.model.pipeline.v1.StateSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='read_modify_write_spec', full_name='org.apache.beam.model.pipeline.v1.StateSpec.read_modify_write_spec', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bag_spec', full_name='org.apache.beam.model.pipeline.v1.StateSpec.bag_spec', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='combining_spec', full_name='org.apache.beam.model.pipeline.v1.StateSpec.combining_spec', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='map_spec', full_name='org.apache.beam.model.pipeline.v1.StateSpec.map_spec', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='set_spec', full_name='org.apache.beam.model.pipeline.v1.StateSpec.set_spec', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='spec', full_name='org.apache.beam.model.pipeline.v1.StateSpec.spec',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=5292,
+  serialized_end=5694,
+)
+
+
+_READMODIFYWRITESTATESPEC = _descriptor.Descriptor(
+  name='ReadModifyWriteStateSpec',
+  full_name='org.apache.beam.model.pipeline.v1.ReadModifyWriteStateSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='coder_id', full_name='org.apache.beam.model.pipeline.v1.ReadModifyWriteStateSpec.coder_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5696,
+  serialized_end=5740,
+)
+
+
+_BAGSTATESPEC = _descriptor.Descriptor(
+  name='BagStateSpec',
+  full_name='org.apache.beam.model.pipeline.v1.BagStateSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='element_coder_id', full_name='org.apache.beam.model.pipeline.v1.BagStateSpec.element_coder_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5742,
+  serialized_end=5782,
+)
+
+
+_COMBININGSTATESPEC = _descriptor.Descriptor(
+  name='CombiningStateSpec',
+  full_name='org.apache.beam.model.pipeline.v1.CombiningStateSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='accumulator_coder_id', full_name='org.apache.beam.model.pipeline.v1.CombiningStateSpec.accumulator_coder_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='combine_fn', full_name='org.apache.beam.model.pipeline.v1.CombiningStateSpec.combine_fn', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5784,
+  serialized_end=5903,
+)
+
+
+_MAPSTATESPEC = _descriptor.Descriptor(
+  name='MapStateSpec',
+  full_name='org.apache.beam.model.pipeline.v1.MapStateSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key_coder_id', full_name='org.apache.beam.model.pipeline.v1.MapStateSpec.key_coder_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value_coder_id', full_name='org.apache.beam.model.pipeline.v1.MapStateSpec.value_coder_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5905,
+  serialized_end=5965,
+)
+
+
+_SETSTATESPEC = _descriptor.Descriptor(
+  name='SetStateSpec',
+  full_name='org.apache.beam.model.pipeline.v1.SetStateSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='element_coder_id', full_name='org.apache.beam.model.pipeline.v1.SetStateSpec.element_coder_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5967,
+  serialized_end=6007,
+)
+
+
+_TIMERSPEC = _descriptor.Descriptor(
+  name='TimerSpec',
+  full_name='org.apache.beam.model.pipeline.v1.TimerSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='time_domain', full_name='org.apache.beam.model.pipeline.v1.TimerSpec.time_domain', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timer_coder_id', full_name='org.apache.beam.model.pipeline.v1.TimerSpec.timer_coder_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6009,
+  serialized_end=6117,
+)
+
+
+_TIMERFAMILYSPEC = _descriptor.Descriptor(
+  name='TimerFamilySpec',
+  full_name='org.apache.beam.model.pipeline.v1.TimerFamilySpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='time_domain', full_name='org.apache.beam.model.pipeline.v1.TimerFamilySpec.time_domain', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timer_family_coder_id', full_name='org.apache.beam.model.pipeline.v1.TimerFamilySpec.timer_family_coder_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6119,
+  serialized_end=6240,
+)
+
+
+_ISBOUNDED = _descriptor.Descriptor(
+  name='IsBounded',
+  full_name='org.apache.beam.model.pipeline.v1.IsBounded',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _ISBOUNDED_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6242,
+  serialized_end=6306,
+)
+
+
+_READPAYLOAD = _descriptor.Descriptor(
+  name='ReadPayload',
+  full_name='org.apache.beam.model.pipeline.v1.ReadPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='source', full_name='org.apache.beam.model.pipeline.v1.ReadPayload.source', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='is_bounded', full_name='org.apache.beam.model.pipeline.v1.ReadPayload.is_bounded', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6309,
+  serialized_end=6458,
+)
+
+
+_WINDOWINTOPAYLOAD = _descriptor.Descriptor(
+  name='WindowIntoPayload',
+  full_name='org.apache.beam.model.pipeline.v1.WindowIntoPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='window_fn', full_name='org.apache.beam.model.pipeline.v1.WindowIntoPayload.window_fn', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6460,
+  serialized_end=6547,
+)
+
+
+_COMBINEPAYLOAD = _descriptor.Descriptor(
+  name='CombinePayload',
+  full_name='org.apache.beam.model.pipeline.v1.CombinePayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='combine_fn', full_name='org.apache.beam.model.pipeline.v1.CombinePayload.combine_fn', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='accumulator_coder_id', full_name='org.apache.beam.model.pipeline.v1.CombinePayload.accumulator_coder_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6549,
+  serialized_end=6664,
+)
+
+
+_TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK = _descriptor.Descriptor(
+  name='AdvanceWatermark',
+  full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceWatermark',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='new_watermark', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceWatermark.new_watermark', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='tag', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceWatermark.tag', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7183,
+  serialized_end=7237,
+)
+
+_TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME = _descriptor.Descriptor(
+  name='AdvanceProcessingTime',
+  full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceProcessingTime',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='advance_duration', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceProcessingTime.advance_duration', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7239,
+  serialized_end=7288,
+)
+
+_TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS = _descriptor.Descriptor(
+  name='AddElements',
+  full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AddElements',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='elements', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AddElements.elements', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='tag', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AddElements.tag', index=1,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7290,
+  serialized_end=7407,
+)
+
+_TESTSTREAMPAYLOAD_EVENT = _descriptor.Descriptor(
+  name='Event',
+  full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='watermark_event', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.watermark_event', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='processing_time_event', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.processing_time_event', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='element_event', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.element_event', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK, _TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME, _TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='event', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.event',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=6858,
+  serialized_end=7416,
+)
+
+_TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT = _descriptor.Descriptor(
+  name='TimestampedElement',
+  full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.TimestampedElement',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='encoded_element', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.TimestampedElement.encoded_element', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.TimestampedElement.timestamp', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7418,
+  serialized_end=7482,
+)
+
+_TESTSTREAMPAYLOAD = _descriptor.Descriptor(
+  name='TestStreamPayload',
+  full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='coder_id', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.coder_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='events', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.events', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='endpoint', full_name='org.apache.beam.model.pipeline.v1.TestStreamPayload.endpoint', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_TESTSTREAMPAYLOAD_EVENT, _TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6667,
+  serialized_end=7482,
+)
+
+
+_EVENTSREQUEST = _descriptor.Descriptor(
+  name='EventsRequest',
+  full_name='org.apache.beam.model.pipeline.v1.EventsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='output_ids', full_name='org.apache.beam.model.pipeline.v1.EventsRequest.output_ids', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7484,
+  serialized_end=7519,
+)
+
+
+_WRITEFILESPAYLOAD_SIDEINPUTSENTRY = _descriptor.Descriptor(
+  name='SideInputsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload.SideInputsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload.SideInputsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload.SideInputsEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4715,
+  serialized_end=4810,
+)
+
+_WRITEFILESPAYLOAD = _descriptor.Descriptor(
+  name='WriteFilesPayload',
+  full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sink', full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload.sink', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='format_function', full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload.format_function', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='windowed_writes', full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload.windowed_writes', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='runner_determined_sharding', full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload.runner_determined_sharding', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_inputs', full_name='org.apache.beam.model.pipeline.v1.WriteFilesPayload.side_inputs', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_WRITEFILESPAYLOAD_SIDEINPUTSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7522,
+  serialized_end=7927,
+)
+
+
+_CODER = _descriptor.Descriptor(
+  name='Coder',
+  full_name='org.apache.beam.model.pipeline.v1.Coder',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='spec', full_name='org.apache.beam.model.pipeline.v1.Coder.spec', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='component_coder_ids', full_name='org.apache.beam.model.pipeline.v1.Coder.component_coder_ids', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7929,
+  serialized_end=8028,
+)
+
+
+_STANDARDCODERS = _descriptor.Descriptor(
+  name='StandardCoders',
+  full_name='org.apache.beam.model.pipeline.v1.StandardCoders',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _STANDARDCODERS_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8031,
+  serialized_end=8768,
+)
+
+
+_WINDOWINGSTRATEGY = _descriptor.Descriptor(
+  name='WindowingStrategy',
+  full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='window_fn', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.window_fn', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='merge_status', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.merge_status', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='window_coder_id', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.window_coder_id', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='trigger', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.trigger', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='accumulation_mode', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.accumulation_mode', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='output_time', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.output_time', index=5,
+      number=6, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='closing_behavior', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.closing_behavior', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='allowed_lateness', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.allowed_lateness', index=7,
+      number=8, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='OnTimeBehavior', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.OnTimeBehavior', index=8,
+      number=9, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='assigns_to_one_window', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.assigns_to_one_window', index=9,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environment_id', full_name='org.apache.beam.model.pipeline.v1.WindowingStrategy.environment_id', index=10,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=8771,
+  serialized_end=9421,
+)
+
+
+_MERGESTATUS = _descriptor.Descriptor(
+  name='MergeStatus',
+  full_name='org.apache.beam.model.pipeline.v1.MergeStatus',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _MERGESTATUS_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9423,
+  serialized_end=9515,
+)
+
+
+_ACCUMULATIONMODE = _descriptor.Descriptor(
+  name='AccumulationMode',
+  full_name='org.apache.beam.model.pipeline.v1.AccumulationMode',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _ACCUMULATIONMODE_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9517,
+  serialized_end=9610,
+)
+
+
+_CLOSINGBEHAVIOR = _descriptor.Descriptor(
+  name='ClosingBehavior',
+  full_name='org.apache.beam.model.pipeline.v1.ClosingBehavior',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _CLOSINGBEHAVIOR_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9612,
+  serialized_end=9693,
+)
+
+
+_ONTIMEBEHAVIOR = _descriptor.Descriptor(
+  name='OnTimeBehavior',
+  full_name='org.apache.beam.model.pipeline.v1.OnTimeBehavior',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _ONTIMEBEHAVIOR_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9695,
+  serialized_end=9775,
+)
+
+
+_OUTPUTTIME = _descriptor.Descriptor(
+  name='OutputTime',
+  full_name='org.apache.beam.model.pipeline.v1.OutputTime',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _OUTPUTTIME_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9777,
+  serialized_end=9875,
+)
+
+
+_TIMEDOMAIN = _descriptor.Descriptor(
+  name='TimeDomain',
+  full_name='org.apache.beam.model.pipeline.v1.TimeDomain',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _TIMEDOMAIN_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9877,
+  serialized_end=9985,
+)
+
+
+_TRIGGER_AFTERALL = _descriptor.Descriptor(
+  name='AfterAll',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterAll',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='subtriggers', full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterAll.subtriggers', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10968,
+  serialized_end=11043,
+)
+
+_TRIGGER_AFTERANY = _descriptor.Descriptor(
+  name='AfterAny',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterAny',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='subtriggers', full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterAny.subtriggers', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11045,
+  serialized_end=11120,
+)
+
+_TRIGGER_AFTEREACH = _descriptor.Descriptor(
+  name='AfterEach',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterEach',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='subtriggers', full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterEach.subtriggers', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11122,
+  serialized_end=11198,
+)
+
+_TRIGGER_AFTERENDOFWINDOW = _descriptor.Descriptor(
+  name='AfterEndOfWindow',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterEndOfWindow',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='early_firings', full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterEndOfWindow.early_firings', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='late_firings', full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterEndOfWindow.late_firings', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11201,
+  serialized_end=11352,
+)
+
+_TRIGGER_AFTERPROCESSINGTIME = _descriptor.Descriptor(
+  name='AfterProcessingTime',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterProcessingTime',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timestamp_transforms', full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterProcessingTime.timestamp_transforms', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11354,
+  serialized_end=11460,
+)
+
+_TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME = _descriptor.Descriptor(
+  name='AfterSynchronizedProcessingTime',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.AfterSynchronizedProcessingTime',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11462,
+  serialized_end=11495,
+)
+
+_TRIGGER_DEFAULT = _descriptor.Descriptor(
+  name='Default',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.Default',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11497,
+  serialized_end=11506,
+)
+
+_TRIGGER_ELEMENTCOUNT = _descriptor.Descriptor(
+  name='ElementCount',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.ElementCount',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='element_count', full_name='org.apache.beam.model.pipeline.v1.Trigger.ElementCount.element_count', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11508,
+  serialized_end=11545,
+)
+
+_TRIGGER_NEVER = _descriptor.Descriptor(
+  name='Never',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.Never',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11547,
+  serialized_end=11554,
+)
+
+_TRIGGER_ALWAYS = _descriptor.Descriptor(
+  name='Always',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.Always',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11556,
+  serialized_end=11564,
+)
+
+_TRIGGER_ORFINALLY = _descriptor.Descriptor(
+  name='OrFinally',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.OrFinally',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='main', full_name='org.apache.beam.model.pipeline.v1.Trigger.OrFinally.main', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='finally', full_name='org.apache.beam.model.pipeline.v1.Trigger.OrFinally.finally', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11567,
+  serialized_end=11697,
+)
+
+_TRIGGER_REPEAT = _descriptor.Descriptor(
+  name='Repeat',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger.Repeat',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='subtrigger', full_name='org.apache.beam.model.pipeline.v1.Trigger.Repeat.subtrigger', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11699,
+  serialized_end=11771,
+)
+
+_TRIGGER = _descriptor.Descriptor(
+  name='Trigger',
+  full_name='org.apache.beam.model.pipeline.v1.Trigger',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='after_all', full_name='org.apache.beam.model.pipeline.v1.Trigger.after_all', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='after_any', full_name='org.apache.beam.model.pipeline.v1.Trigger.after_any', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='after_each', full_name='org.apache.beam.model.pipeline.v1.Trigger.after_each', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='after_end_of_window', full_name='org.apache.beam.model.pipeline.v1.Trigger.after_end_of_window', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='after_processing_time', full_name='org.apache.beam.model.pipeline.v1.Trigger.after_processing_time', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='after_synchronized_processing_time', full_name='org.apache.beam.model.pipeline.v1.Trigger.after_synchronized_processing_time', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='always', full_name='org.apache.beam.model.pipeline.v1.Trigger.always', index=6,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='default', full_name='org.apache.beam.model.pipeline.v1.Trigger.default', index=7,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='element_count', full_name='org.apache.beam.model.pipeline.v1.Trigger.element_count', index=8,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='never', full_name='org.apache.beam.model.pipeline.v1.Trigger.never', index=9,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='or_finally', full_name='org.apache.beam.model.pipeline.v1.Trigger.or_finally', index=10,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='repeat', full_name='org.apache.beam.model.pipeline.v1.Trigger.repeat', index=11,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_TRIGGER_AFTERALL, _TRIGGER_AFTERANY, _TRIGGER_AFTEREACH, _TRIGGER_AFTERENDOFWINDOW, _TRIGGER_AFTERPROCESSINGTIME, _TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME, _TRIGGER_DEFAULT, _TRIGGER_ELEMENTCOUNT, _TRIGGER_NEVER, _TRIGGER_ALWAYS, _TRIGGER_ORFINALLY, _TRIGGER_REPEAT, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='trigger', full_name='org.apache.beam.model.pipeline.v1.Trigger.trigger',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=9988,
+  serialized_end=11782,
+)
+
+
+_TIMESTAMPTRANSFORM_DELAY = _descriptor.Descriptor(
+  name='Delay',
+  full_name='org.apache.beam.model.pipeline.v1.TimestampTransform.Delay',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='delay_millis', full_name='org.apache.beam.model.pipeline.v1.TimestampTransform.Delay.delay_millis', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11968,
+  serialized_end=11997,
+)
+
+_TIMESTAMPTRANSFORM_ALIGNTO = _descriptor.Descriptor(
+  name='AlignTo',
+  full_name='org.apache.beam.model.pipeline.v1.TimestampTransform.AlignTo',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='period', full_name='org.apache.beam.model.pipeline.v1.TimestampTransform.AlignTo.period', index=0,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='org.apache.beam.model.pipeline.v1.TimestampTransform.AlignTo.offset', index=1,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11999,
+  serialized_end=12040,
+)
+
+_TIMESTAMPTRANSFORM = _descriptor.Descriptor(
+  name='TimestampTransform',
+  full_name='org.apache.beam.model.pipeline.v1.TimestampTransform',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='delay', full_name='org.apache.beam.model.pipeline.v1.TimestampTransform.delay', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='align_to', full_name='org.apache.beam.model.pipeline.v1.TimestampTransform.align_to', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_TIMESTAMPTRANSFORM_DELAY, _TIMESTAMPTRANSFORM_ALIGNTO, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='timestamp_transform', full_name='org.apache.beam.model.pipeline.v1.TimestampTransform.timestamp_transform',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=11785,
+  serialized_end=12063,
+)
+
+
+_SIDEINPUT = _descriptor.Descriptor(
+  name='SideInput',
+  full_name='org.apache.beam.model.pipeline.v1.SideInput',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='access_pattern', full_name='org.apache.beam.model.pipeline.v1.SideInput.access_pattern', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='view_fn', full_name='org.apache.beam.model.pipeline.v1.SideInput.view_fn', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='window_mapping_fn', full_name='org.apache.beam.model.pipeline.v1.SideInput.window_mapping_fn', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12066,
+  serialized_end=12292,
+)
+
+
+_STANDARDARTIFACTS = _descriptor.Descriptor(
+  name='StandardArtifacts',
+  full_name='org.apache.beam.model.pipeline.v1.StandardArtifacts',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _STANDARDARTIFACTS_TYPES,
+    _STANDARDARTIFACTS_ROLES,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12295,
+  serialized_end=12617,
+)
+
+
+_ARTIFACTFILEPAYLOAD = _descriptor.Descriptor(
+  name='ArtifactFilePayload',
+  full_name='org.apache.beam.model.pipeline.v1.ArtifactFilePayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='path', full_name='org.apache.beam.model.pipeline.v1.ArtifactFilePayload.path', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sha256', full_name='org.apache.beam.model.pipeline.v1.ArtifactFilePayload.sha256', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12619,
+  serialized_end=12670,
+)
+
+
+_ARTIFACTURLPAYLOAD = _descriptor.Descriptor(
+  name='ArtifactUrlPayload',
+  full_name='org.apache.beam.model.pipeline.v1.ArtifactUrlPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='path', full_name='org.apache.beam.model.pipeline.v1.ArtifactUrlPayload.path', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12672,
+  serialized_end=12706,
+)
+
+
+_EMBEDDEDFILEPAYLOAD = _descriptor.Descriptor(
+  name='EmbeddedFilePayload',
+  full_name='org.apache.beam.model.pipeline.v1.EmbeddedFilePayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='org.apache.beam.model.pipeline.v1.EmbeddedFilePayload.data', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12708,
+  serialized_end=12743,
+)
+
+
+_PYPIPAYLOAD = _descriptor.Descriptor(
+  name='PyPIPayload',
+  full_name='org.apache.beam.model.pipeline.v1.PyPIPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifact_id', full_name='org.apache.beam.model.pipeline.v1.PyPIPayload.artifact_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='org.apache.beam.model.pipeline.v1.PyPIPayload.version', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12745,
+  serialized_end=12796,
+)
+
+
+_MAVENPAYLOAD = _descriptor.Descriptor(
+  name='MavenPayload',
+  full_name='org.apache.beam.model.pipeline.v1.MavenPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='artifact', full_name='org.apache.beam.model.pipeline.v1.MavenPayload.artifact', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='repository_url', full_name='org.apache.beam.model.pipeline.v1.MavenPayload.repository_url', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12798,
+  serialized_end=12854,
+)
+
+
+_ARTIFACTSTAGINGTOROLEPAYLOAD = _descriptor.Descriptor(
+  name='ArtifactStagingToRolePayload',
+  full_name='org.apache.beam.model.pipeline.v1.ArtifactStagingToRolePayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='staged_name', full_name='org.apache.beam.model.pipeline.v1.ArtifactStagingToRolePayload.staged_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12856,
+  serialized_end=12907,
+)
+
+
+_ARTIFACTINFORMATION = _descriptor.Descriptor(
+  name='ArtifactInformation',
+  full_name='org.apache.beam.model.pipeline.v1.ArtifactInformation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_urn', full_name='org.apache.beam.model.pipeline.v1.ArtifactInformation.type_urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type_payload', full_name='org.apache.beam.model.pipeline.v1.ArtifactInformation.type_payload', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='role_urn', full_name='org.apache.beam.model.pipeline.v1.ArtifactInformation.role_urn', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='role_payload', full_name='org.apache.beam.model.pipeline.v1.ArtifactInformation.role_payload', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12909,
+  serialized_end=13010,
+)
+
+
+_ENVIRONMENT = _descriptor.Descriptor(
+  name='Environment',
+  full_name='org.apache.beam.model.pipeline.v1.Environment',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='org.apache.beam.model.pipeline.v1.Environment.urn', index=0,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.Environment.payload', index=1,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='display_data', full_name='org.apache.beam.model.pipeline.v1.Environment.display_data', index=2,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='capabilities', full_name='org.apache.beam.model.pipeline.v1.Environment.capabilities', index=3,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dependencies', full_name='org.apache.beam.model.pipeline.v1.Environment.dependencies', index=4,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13013,
+  serialized_end=13232,
+)
+
+
+_STANDARDENVIRONMENTS = _descriptor.Descriptor(
+  name='StandardEnvironments',
+  full_name='org.apache.beam.model.pipeline.v1.StandardEnvironments',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _STANDARDENVIRONMENTS_ENVIRONMENTS,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13235,
+  serialized_end=13394,
+)
+
+
+_DOCKERPAYLOAD = _descriptor.Descriptor(
+  name='DockerPayload',
+  full_name='org.apache.beam.model.pipeline.v1.DockerPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='container_image', full_name='org.apache.beam.model.pipeline.v1.DockerPayload.container_image', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13396,
+  serialized_end=13436,
+)
+
+
+_PROCESSPAYLOAD_ENVENTRY = _descriptor.Descriptor(
+  name='EnvEntry',
+  full_name='org.apache.beam.model.pipeline.v1.ProcessPayload.EnvEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.ProcessPayload.EnvEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.ProcessPayload.EnvEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13573,
+  serialized_end=13615,
+)
+
+_PROCESSPAYLOAD = _descriptor.Descriptor(
+  name='ProcessPayload',
+  full_name='org.apache.beam.model.pipeline.v1.ProcessPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='os', full_name='org.apache.beam.model.pipeline.v1.ProcessPayload.os', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='arch', full_name='org.apache.beam.model.pipeline.v1.ProcessPayload.arch', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='command', full_name='org.apache.beam.model.pipeline.v1.ProcessPayload.command', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='env', full_name='org.apache.beam.model.pipeline.v1.ProcessPayload.env', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROCESSPAYLOAD_ENVENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13439,
+  serialized_end=13615,
+)
+
+
+_EXTERNALPAYLOAD_PARAMSENTRY = _descriptor.Descriptor(
+  name='ParamsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.ExternalPayload.ParamsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.ExternalPayload.ParamsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.ExternalPayload.ParamsEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13792,
+  serialized_end=13837,
+)
+
+_EXTERNALPAYLOAD = _descriptor.Descriptor(
+  name='ExternalPayload',
+  full_name='org.apache.beam.model.pipeline.v1.ExternalPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='endpoint', full_name='org.apache.beam.model.pipeline.v1.ExternalPayload.endpoint', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='params', full_name='org.apache.beam.model.pipeline.v1.ExternalPayload.params', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_EXTERNALPAYLOAD_PARAMSENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13618,
+  serialized_end=13837,
+)
+
+
+_STANDARDPROTOCOLS = _descriptor.Descriptor(
+  name='StandardProtocols',
+  full_name='org.apache.beam.model.pipeline.v1.StandardProtocols',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _STANDARDPROTOCOLS_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13840,
+  serialized_end=14153,
+)
+
+
+_STANDARDREQUIREMENTS = _descriptor.Descriptor(
+  name='StandardRequirements',
+  full_name='org.apache.beam.model.pipeline.v1.StandardRequirements',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _STANDARDREQUIREMENTS_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=14156,
+  serialized_end=14499,
+)
+
+
+_FUNCTIONSPEC = _descriptor.Descriptor(
+  name='FunctionSpec',
+  full_name='org.apache.beam.model.pipeline.v1.FunctionSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='org.apache.beam.model.pipeline.v1.FunctionSpec.urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.FunctionSpec.payload', index=1,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=14501,
+  serialized_end=14545,
+)
+
+
+_STANDARDDISPLAYDATA = _descriptor.Descriptor(
+  name='StandardDisplayData',
+  full_name='org.apache.beam.model.pipeline.v1.StandardDisplayData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _STANDARDDISPLAYDATA_DISPLAYDATA,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=14547,
+  serialized_end=14648,
+)
+
+
+_LABELLEDSTRINGPAYLOAD = _descriptor.Descriptor(
+  name='LabelledStringPayload',
+  full_name='org.apache.beam.model.pipeline.v1.LabelledStringPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='label', full_name='org.apache.beam.model.pipeline.v1.LabelledStringPayload.label', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.LabelledStringPayload.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=14650,
+  serialized_end=14703,
+)
+
+
+_DISPLAYDATA = _descriptor.Descriptor(
+  name='DisplayData',
+  full_name='org.apache.beam.model.pipeline.v1.DisplayData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='org.apache.beam.model.pipeline.v1.DisplayData.urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.DisplayData.payload', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=14705,
+  serialized_end=14748,
+)
+
+
+_MESSAGEWITHCOMPONENTS = _descriptor.Descriptor(
+  name='MessageWithComponents',
+  full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='components', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.components', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='coder', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.coder', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='combine_payload', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.combine_payload', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='function_spec', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.function_spec', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='par_do_payload', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.par_do_payload', index=4,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ptransform', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.ptransform', index=5,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pcollection', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.pcollection', index=6,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='read_payload', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.read_payload', index=7,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_input', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.side_input', index=8,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='window_into_payload', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.window_into_payload', index=9,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='windowing_strategy', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.windowing_strategy', index=10,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='root', full_name='org.apache.beam.model.pipeline.v1.MessageWithComponents.root',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=14751,
+  serialized_end=15584,
+)
+
+
+_EXECUTABLESTAGEPAYLOAD_SIDEINPUTID = _descriptor.Descriptor(
+  name='SideInputId',
+  full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.SideInputId',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.SideInputId.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='local_name', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.SideInputId.local_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=16269,
+  serialized_end=16324,
+)
+
+_EXECUTABLESTAGEPAYLOAD_USERSTATEID = _descriptor.Descriptor(
+  name='UserStateId',
+  full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.UserStateId',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.UserStateId.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='local_name', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.UserStateId.local_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=16326,
+  serialized_end=16381,
+)
+
+_EXECUTABLESTAGEPAYLOAD_TIMERID = _descriptor.Descriptor(
+  name='TimerId',
+  full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerId',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerId.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='local_name', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerId.local_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=16383,
+  serialized_end=16434,
+)
+
+_EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID = _descriptor.Descriptor(
+  name='TimerFamilyId',
+  full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerFamilyId',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transform_id', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerFamilyId.transform_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='local_name', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerFamilyId.local_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=16436,
+  serialized_end=16493,
+)
+
+_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING = _descriptor.Descriptor(
+  name='WireCoderSetting',
+  full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting.urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting.payload', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input_or_output_id', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting.input_or_output_id', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timer', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting.timer', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='target', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting.target',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=16496,
+  serialized_end=16668,
+)
+
+_EXECUTABLESTAGEPAYLOAD = _descriptor.Descriptor(
+  name='ExecutableStagePayload',
+  full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='environment', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.environment', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='wire_coder_settings', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.wire_coder_settings', index=1,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.input', index=2,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='side_inputs', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.side_inputs', index=3,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='transforms', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.transforms', index=4,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='outputs', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.outputs', index=5,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='components', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.components', index=6,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='user_states', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.user_states', index=7,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timers', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.timers', index=8,
+      number=8, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timerFamilies', full_name='org.apache.beam.model.pipeline.v1.ExecutableStagePayload.timerFamilies', index=9,
+      number=10, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_EXECUTABLESTAGEPAYLOAD_SIDEINPUTID, _EXECUTABLESTAGEPAYLOAD_USERSTATEID, _EXECUTABLESTAGEPAYLOAD_TIMERID, _EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID, _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=15587,
+  serialized_end=16668,
+)
+
+_BEAMCONSTANTS_CONSTANTS.containing_type = _BEAMCONSTANTS
+_COMPONENTS_TRANSFORMSENTRY.fields_by_name['value'].message_type = _PTRANSFORM
+_COMPONENTS_TRANSFORMSENTRY.containing_type = _COMPONENTS
+_COMPONENTS_PCOLLECTIONSENTRY.fields_by_name['value'].message_type = _PCOLLECTION
+_COMPONENTS_PCOLLECTIONSENTRY.containing_type = _COMPONENTS
+_COMPONENTS_WINDOWINGSTRATEGIESENTRY.fields_by_name['value'].message_type = _WINDOWINGSTRATEGY
+_COMPONENTS_WINDOWINGSTRATEGIESENTRY.containing_type = _COMPONENTS
+_COMPONENTS_CODERSENTRY.fields_by_name['value'].message_type = _CODER
+_COMPONENTS_CODERSENTRY.containing_type = _COMPONENTS
+_COMPONENTS_ENVIRONMENTSENTRY.fields_by_name['value'].message_type = _ENVIRONMENT
+_COMPONENTS_ENVIRONMENTSENTRY.containing_type = _COMPONENTS
+_COMPONENTS.fields_by_name['transforms'].message_type = _COMPONENTS_TRANSFORMSENTRY
+_COMPONENTS.fields_by_name['pcollections'].message_type = _COMPONENTS_PCOLLECTIONSENTRY
+_COMPONENTS.fields_by_name['windowing_strategies'].message_type = _COMPONENTS_WINDOWINGSTRATEGIESENTRY
+_COMPONENTS.fields_by_name['coders'].message_type = _COMPONENTS_CODERSENTRY
+_COMPONENTS.fields_by_name['environments'].message_type = _COMPONENTS_ENVIRONMENTSENTRY
+_PIPELINE.fields_by_name['components'].message_type = _COMPONENTS
+_PIPELINE.fields_by_name['display_data'].message_type = _DISPLAYDATA
+_PTRANSFORM_INPUTSENTRY.containing_type = _PTRANSFORM
+_PTRANSFORM_OUTPUTSENTRY.containing_type = _PTRANSFORM
+_PTRANSFORM.fields_by_name['spec'].message_type = _FUNCTIONSPEC
+_PTRANSFORM.fields_by_name['inputs'].message_type = _PTRANSFORM_INPUTSENTRY
+_PTRANSFORM.fields_by_name['outputs'].message_type = _PTRANSFORM_OUTPUTSENTRY
+_PTRANSFORM.fields_by_name['display_data'].message_type = _DISPLAYDATA
+_STANDARDPTRANSFORMS_PRIMITIVES.containing_type = _STANDARDPTRANSFORMS
+_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.containing_type = _STANDARDPTRANSFORMS
+_STANDARDPTRANSFORMS_COMPOSITES.containing_type = _STANDARDPTRANSFORMS
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.containing_type = _STANDARDPTRANSFORMS
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.containing_type = _STANDARDPTRANSFORMS
+_STANDARDSIDEINPUTTYPES_ENUM.containing_type = _STANDARDSIDEINPUTTYPES
+_PCOLLECTION.fields_by_name['is_bounded'].enum_type = _ISBOUNDED_ENUM
+_PCOLLECTION.fields_by_name['display_data'].message_type = _DISPLAYDATA
+_PARDOPAYLOAD_SIDEINPUTSENTRY.fields_by_name['value'].message_type = _SIDEINPUT
+_PARDOPAYLOAD_SIDEINPUTSENTRY.containing_type = _PARDOPAYLOAD
+_PARDOPAYLOAD_STATESPECSENTRY.fields_by_name['value'].message_type = _STATESPEC
+_PARDOPAYLOAD_STATESPECSENTRY.containing_type = _PARDOPAYLOAD
+_PARDOPAYLOAD_TIMERSPECSENTRY.fields_by_name['value'].message_type = _TIMERSPEC
+_PARDOPAYLOAD_TIMERSPECSENTRY.containing_type = _PARDOPAYLOAD
+_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY.fields_by_name['value'].message_type = _TIMERFAMILYSPEC
+_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY.containing_type = _PARDOPAYLOAD
+_PARDOPAYLOAD.fields_by_name['do_fn'].message_type = _FUNCTIONSPEC
+_PARDOPAYLOAD.fields_by_name['parameters'].message_type = _PARAMETER
+_PARDOPAYLOAD.fields_by_name['side_inputs'].message_type = _PARDOPAYLOAD_SIDEINPUTSENTRY
+_PARDOPAYLOAD.fields_by_name['state_specs'].message_type = _PARDOPAYLOAD_STATESPECSENTRY
+_PARDOPAYLOAD.fields_by_name['timer_specs'].message_type = _PARDOPAYLOAD_TIMERSPECSENTRY
+_PARDOPAYLOAD.fields_by_name['timer_family_specs'].message_type = _PARDOPAYLOAD_TIMERFAMILYSPECSENTRY
+_PARAMETER_TYPE.containing_type = _PARAMETER
+_PARAMETER_TYPE_ENUM.containing_type = _PARAMETER_TYPE
+_PARAMETER.fields_by_name['type'].enum_type = _PARAMETER_TYPE_ENUM
+_STATESPEC.fields_by_name['read_modify_write_spec'].message_type = _READMODIFYWRITESTATESPEC
+_STATESPEC.fields_by_name['bag_spec'].message_type = _BAGSTATESPEC
+_STATESPEC.fields_by_name['combining_spec'].message_type = _COMBININGSTATESPEC
+_STATESPEC.fields_by_name['map_spec'].message_type = _MAPSTATESPEC
+_STATESPEC.fields_by_name['set_spec'].message_type = _SETSTATESPEC
+_STATESPEC.oneofs_by_name['spec'].fields.append(
+  _STATESPEC.fields_by_name['read_modify_write_spec'])
+_STATESPEC.fields_by_name['read_modify_write_spec'].containing_oneof = _STATESPEC.oneofs_by_name['spec']
+_STATESPEC.oneofs_by_name['spec'].fields.append(
+  _STATESPEC.fields_by_name['bag_spec'])
+_STATESPEC.fields_by_name['bag_spec'].containing_oneof = _STATESPEC.oneofs_by_name['spec']
+_STATESPEC.oneofs_by_name['spec'].fields.append(
+  _STATESPEC.fields_by_name['combining_spec'])
+_STATESPEC.fields_by_name['combining_spec'].containing_oneof = _STATESPEC.oneofs_by_name['spec']
+_STATESPEC.oneofs_by_name['spec'].fields.append(
+  _STATESPEC.fields_by_name['map_spec'])
+_STATESPEC.fields_by_name['map_spec'].containing_oneof = _STATESPEC.oneofs_by_name['spec']
+_STATESPEC.oneofs_by_name['spec'].fields.append(
+  _STATESPEC.fields_by_name['set_spec'])
+_STATESPEC.fields_by_name['set_spec'].containing_oneof = _STATESPEC.oneofs_by_name['spec']
+_COMBININGSTATESPEC.fields_by_name['combine_fn'].message_type = _FUNCTIONSPEC
+_TIMERSPEC.fields_by_name['time_domain'].enum_type = _TIMEDOMAIN_ENUM
+_TIMERFAMILYSPEC.fields_by_name['time_domain'].enum_type = _TIMEDOMAIN_ENUM
+_ISBOUNDED_ENUM.containing_type = _ISBOUNDED
+_READPAYLOAD.fields_by_name['source'].message_type = _FUNCTIONSPEC
+_READPAYLOAD.fields_by_name['is_bounded'].enum_type = _ISBOUNDED_ENUM
+_WINDOWINTOPAYLOAD.fields_by_name['window_fn'].message_type = _FUNCTIONSPEC
+_COMBINEPAYLOAD.fields_by_name['combine_fn'].message_type = _FUNCTIONSPEC
+_TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK.containing_type = _TESTSTREAMPAYLOAD_EVENT
+_TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME.containing_type = _TESTSTREAMPAYLOAD_EVENT
+_TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS.fields_by_name['elements'].message_type = _TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT
+_TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS.containing_type = _TESTSTREAMPAYLOAD_EVENT
+_TESTSTREAMPAYLOAD_EVENT.fields_by_name['watermark_event'].message_type = _TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK
+_TESTSTREAMPAYLOAD_EVENT.fields_by_name['processing_time_event'].message_type = _TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME
+_TESTSTREAMPAYLOAD_EVENT.fields_by_name['element_event'].message_type = _TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS
+_TESTSTREAMPAYLOAD_EVENT.containing_type = _TESTSTREAMPAYLOAD
+_TESTSTREAMPAYLOAD_EVENT.oneofs_by_name['event'].fields.append(
+  _TESTSTREAMPAYLOAD_EVENT.fields_by_name['watermark_event'])
+_TESTSTREAMPAYLOAD_EVENT.fields_by_name['watermark_event'].containing_oneof = _TESTSTREAMPAYLOAD_EVENT.oneofs_by_name['event']
+_TESTSTREAMPAYLOAD_EVENT.oneofs_by_name['event'].fields.append(
+  _TESTSTREAMPAYLOAD_EVENT.fields_by_name['processing_time_event'])
+_TESTSTREAMPAYLOAD_EVENT.fields_by_name['processing_time_event'].containing_oneof = _TESTSTREAMPAYLOAD_EVENT.oneofs_by_name['event']
+_TESTSTREAMPAYLOAD_EVENT.oneofs_by_name['event'].fields.append(
+  _TESTSTREAMPAYLOAD_EVENT.fields_by_name['element_event'])
+_TESTSTREAMPAYLOAD_EVENT.fields_by_name['element_event'].containing_oneof = _TESTSTREAMPAYLOAD_EVENT.oneofs_by_name['event']
+_TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT.containing_type = _TESTSTREAMPAYLOAD
+_TESTSTREAMPAYLOAD.fields_by_name['events'].message_type = _TESTSTREAMPAYLOAD_EVENT
+_TESTSTREAMPAYLOAD.fields_by_name['endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_WRITEFILESPAYLOAD_SIDEINPUTSENTRY.fields_by_name['value'].message_type = _SIDEINPUT
+_WRITEFILESPAYLOAD_SIDEINPUTSENTRY.containing_type = _WRITEFILESPAYLOAD
+_WRITEFILESPAYLOAD.fields_by_name['sink'].message_type = _FUNCTIONSPEC
+_WRITEFILESPAYLOAD.fields_by_name['format_function'].message_type = _FUNCTIONSPEC
+_WRITEFILESPAYLOAD.fields_by_name['side_inputs'].message_type = _WRITEFILESPAYLOAD_SIDEINPUTSENTRY
+_CODER.fields_by_name['spec'].message_type = _FUNCTIONSPEC
+_STANDARDCODERS_ENUM.containing_type = _STANDARDCODERS
+_WINDOWINGSTRATEGY.fields_by_name['window_fn'].message_type = _FUNCTIONSPEC
+_WINDOWINGSTRATEGY.fields_by_name['merge_status'].enum_type = _MERGESTATUS_ENUM
+_WINDOWINGSTRATEGY.fields_by_name['trigger'].message_type = _TRIGGER
+_WINDOWINGSTRATEGY.fields_by_name['accumulation_mode'].enum_type = _ACCUMULATIONMODE_ENUM
+_WINDOWINGSTRATEGY.fields_by_name['output_time'].enum_type = _OUTPUTTIME_ENUM
+_WINDOWINGSTRATEGY.fields_by_name['closing_behavior'].enum_type = _CLOSINGBEHAVIOR_ENUM
+_WINDOWINGSTRATEGY.fields_by_name['OnTimeBehavior'].enum_type = _ONTIMEBEHAVIOR_ENUM
+_MERGESTATUS_ENUM.containing_type = _MERGESTATUS
+_ACCUMULATIONMODE_ENUM.containing_type = _ACCUMULATIONMODE
+_CLOSINGBEHAVIOR_ENUM.containing_type = _CLOSINGBEHAVIOR
+_ONTIMEBEHAVIOR_ENUM.containing_type = _ONTIMEBEHAVIOR
+_OUTPUTTIME_ENUM.containing_type = _OUTPUTTIME
+_TIMEDOMAIN_ENUM.containing_type = _TIMEDOMAIN
+_TRIGGER_AFTERALL.fields_by_name['subtriggers'].message_type = _TRIGGER
+_TRIGGER_AFTERALL.containing_type = _TRIGGER
+_TRIGGER_AFTERANY.fields_by_name['subtriggers'].message_type = _TRIGGER
+_TRIGGER_AFTERANY.containing_type = _TRIGGER
+_TRIGGER_AFTEREACH.fields_by_name['subtriggers'].message_type = _TRIGGER
+_TRIGGER_AFTEREACH.containing_type = _TRIGGER
+_TRIGGER_AFTERENDOFWINDOW.fields_by_name['early_firings'].message_type = _TRIGGER
+_TRIGGER_AFTERENDOFWINDOW.fields_by_name['late_firings'].message_type = _TRIGGER
+_TRIGGER_AFTERENDOFWINDOW.containing_type = _TRIGGER
+_TRIGGER_AFTERPROCESSINGTIME.fields_by_name['timestamp_transforms'].message_type = _TIMESTAMPTRANSFORM
+_TRIGGER_AFTERPROCESSINGTIME.containing_type = _TRIGGER
+_TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME.containing_type = _TRIGGER
+_TRIGGER_DEFAULT.containing_type = _TRIGGER
+_TRIGGER_ELEMENTCOUNT.containing_type = _TRIGGER
+_TRIGGER_NEVER.containing_type = _TRIGGER
+_TRIGGER_ALWAYS.containing_type = _TRIGGER
+_TRIGGER_ORFINALLY.fields_by_name['main'].message_type = _TRIGGER
+_TRIGGER_ORFINALLY.fields_by_name['finally'].message_type = _TRIGGER
+_TRIGGER_ORFINALLY.containing_type = _TRIGGER
+_TRIGGER_REPEAT.fields_by_name['subtrigger'].message_type = _TRIGGER
+_TRIGGER_REPEAT.containing_type = _TRIGGER
+_TRIGGER.fields_by_name['after_all'].message_type = _TRIGGER_AFTERALL
+_TRIGGER.fields_by_name['after_any'].message_type = _TRIGGER_AFTERANY
+_TRIGGER.fields_by_name['after_each'].message_type = _TRIGGER_AFTEREACH
+_TRIGGER.fields_by_name['after_end_of_window'].message_type = _TRIGGER_AFTERENDOFWINDOW
+_TRIGGER.fields_by_name['after_processing_time'].message_type = _TRIGGER_AFTERPROCESSINGTIME
+_TRIGGER.fields_by_name['after_synchronized_processing_time'].message_type = _TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME
+_TRIGGER.fields_by_name['always'].message_type = _TRIGGER_ALWAYS
+_TRIGGER.fields_by_name['default'].message_type = _TRIGGER_DEFAULT
+_TRIGGER.fields_by_name['element_count'].message_type = _TRIGGER_ELEMENTCOUNT
+_TRIGGER.fields_by_name['never'].message_type = _TRIGGER_NEVER
+_TRIGGER.fields_by_name['or_finally'].message_type = _TRIGGER_ORFINALLY
+_TRIGGER.fields_by_name['repeat'].message_type = _TRIGGER_REPEAT
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['after_all'])
+_TRIGGER.fields_by_name['after_all'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['after_any'])
+_TRIGGER.fields_by_name['after_any'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['after_each'])
+_TRIGGER.fields_by_name['after_each'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['after_end_of_window'])
+_TRIGGER.fields_by_name['after_end_of_window'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['after_processing_time'])
+_TRIGGER.fields_by_name['after_processing_time'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['after_synchronized_processing_time'])
+_TRIGGER.fields_by_name['after_synchronized_processing_time'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['always'])
+_TRIGGER.fields_by_name['always'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['default'])
+_TRIGGER.fields_by_name['default'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['element_count'])
+_TRIGGER.fields_by_name['element_count'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['never'])
+_TRIGGER.fields_by_name['never'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['or_finally'])
+_TRIGGER.fields_by_name['or_finally'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TRIGGER.oneofs_by_name['trigger'].fields.append(
+  _TRIGGER.fields_by_name['repeat'])
+_TRIGGER.fields_by_name['repeat'].containing_oneof = _TRIGGER.oneofs_by_name['trigger']
+_TIMESTAMPTRANSFORM_DELAY.containing_type = _TIMESTAMPTRANSFORM
+_TIMESTAMPTRANSFORM_ALIGNTO.containing_type = _TIMESTAMPTRANSFORM
+_TIMESTAMPTRANSFORM.fields_by_name['delay'].message_type = _TIMESTAMPTRANSFORM_DELAY
+_TIMESTAMPTRANSFORM.fields_by_name['align_to'].message_type = _TIMESTAMPTRANSFORM_ALIGNTO
+_TIMESTAMPTRANSFORM.oneofs_by_name['timestamp_transform'].fields.append(
+  _TIMESTAMPTRANSFORM.fields_by_name['delay'])
+_TIMESTAMPTRANSFORM.fields_by_name['delay'].containing_oneof = _TIMESTAMPTRANSFORM.oneofs_by_name['timestamp_transform']
+_TIMESTAMPTRANSFORM.oneofs_by_name['timestamp_transform'].fields.append(
+  _TIMESTAMPTRANSFORM.fields_by_name['align_to'])
+_TIMESTAMPTRANSFORM.fields_by_name['align_to'].containing_oneof = _TIMESTAMPTRANSFORM.oneofs_by_name['timestamp_transform']
+_SIDEINPUT.fields_by_name['access_pattern'].message_type = _FUNCTIONSPEC
+_SIDEINPUT.fields_by_name['view_fn'].message_type = _FUNCTIONSPEC
+_SIDEINPUT.fields_by_name['window_mapping_fn'].message_type = _FUNCTIONSPEC
+_STANDARDARTIFACTS_TYPES.containing_type = _STANDARDARTIFACTS
+_STANDARDARTIFACTS_ROLES.containing_type = _STANDARDARTIFACTS
+_ENVIRONMENT.fields_by_name['display_data'].message_type = _DISPLAYDATA
+_ENVIRONMENT.fields_by_name['dependencies'].message_type = _ARTIFACTINFORMATION
+_STANDARDENVIRONMENTS_ENVIRONMENTS.containing_type = _STANDARDENVIRONMENTS
+_PROCESSPAYLOAD_ENVENTRY.containing_type = _PROCESSPAYLOAD
+_PROCESSPAYLOAD.fields_by_name['env'].message_type = _PROCESSPAYLOAD_ENVENTRY
+_EXTERNALPAYLOAD_PARAMSENTRY.containing_type = _EXTERNALPAYLOAD
+_EXTERNALPAYLOAD.fields_by_name['endpoint'].message_type = endpoints__pb2._APISERVICEDESCRIPTOR
+_EXTERNALPAYLOAD.fields_by_name['params'].message_type = _EXTERNALPAYLOAD_PARAMSENTRY
+_STANDARDPROTOCOLS_ENUM.containing_type = _STANDARDPROTOCOLS
+_STANDARDREQUIREMENTS_ENUM.containing_type = _STANDARDREQUIREMENTS
+_STANDARDDISPLAYDATA_DISPLAYDATA.containing_type = _STANDARDDISPLAYDATA
+_MESSAGEWITHCOMPONENTS.fields_by_name['components'].message_type = _COMPONENTS
+_MESSAGEWITHCOMPONENTS.fields_by_name['coder'].message_type = _CODER
+_MESSAGEWITHCOMPONENTS.fields_by_name['combine_payload'].message_type = _COMBINEPAYLOAD
+_MESSAGEWITHCOMPONENTS.fields_by_name['function_spec'].message_type = _FUNCTIONSPEC
+_MESSAGEWITHCOMPONENTS.fields_by_name['par_do_payload'].message_type = _PARDOPAYLOAD
+_MESSAGEWITHCOMPONENTS.fields_by_name['ptransform'].message_type = _PTRANSFORM
+_MESSAGEWITHCOMPONENTS.fields_by_name['pcollection'].message_type = _PCOLLECTION
+_MESSAGEWITHCOMPONENTS.fields_by_name['read_payload'].message_type = _READPAYLOAD
+_MESSAGEWITHCOMPONENTS.fields_by_name['side_input'].message_type = _SIDEINPUT
+_MESSAGEWITHCOMPONENTS.fields_by_name['window_into_payload'].message_type = _WINDOWINTOPAYLOAD
+_MESSAGEWITHCOMPONENTS.fields_by_name['windowing_strategy'].message_type = _WINDOWINGSTRATEGY
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['coder'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['coder'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['combine_payload'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['combine_payload'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['function_spec'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['function_spec'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['par_do_payload'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['par_do_payload'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['ptransform'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['ptransform'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['pcollection'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['pcollection'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['read_payload'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['read_payload'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['side_input'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['side_input'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['window_into_payload'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['window_into_payload'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_MESSAGEWITHCOMPONENTS.oneofs_by_name['root'].fields.append(
+  _MESSAGEWITHCOMPONENTS.fields_by_name['windowing_strategy'])
+_MESSAGEWITHCOMPONENTS.fields_by_name['windowing_strategy'].containing_oneof = _MESSAGEWITHCOMPONENTS.oneofs_by_name['root']
+_EXECUTABLESTAGEPAYLOAD_SIDEINPUTID.containing_type = _EXECUTABLESTAGEPAYLOAD
+_EXECUTABLESTAGEPAYLOAD_USERSTATEID.containing_type = _EXECUTABLESTAGEPAYLOAD
+_EXECUTABLESTAGEPAYLOAD_TIMERID.containing_type = _EXECUTABLESTAGEPAYLOAD
+_EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID.containing_type = _EXECUTABLESTAGEPAYLOAD
+_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.fields_by_name['timer'].message_type = _EXECUTABLESTAGEPAYLOAD_TIMERID
+_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.containing_type = _EXECUTABLESTAGEPAYLOAD
+_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.oneofs_by_name['target'].fields.append(
+  _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.fields_by_name['input_or_output_id'])
+_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.fields_by_name['input_or_output_id'].containing_oneof = _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.oneofs_by_name['target']
+_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.oneofs_by_name['target'].fields.append(
+  _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.fields_by_name['timer'])
+_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.fields_by_name['timer'].containing_oneof = _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING.oneofs_by_name['target']
+_EXECUTABLESTAGEPAYLOAD.fields_by_name['environment'].message_type = _ENVIRONMENT
+_EXECUTABLESTAGEPAYLOAD.fields_by_name['wire_coder_settings'].message_type = _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING
+_EXECUTABLESTAGEPAYLOAD.fields_by_name['side_inputs'].message_type = _EXECUTABLESTAGEPAYLOAD_SIDEINPUTID
+_EXECUTABLESTAGEPAYLOAD.fields_by_name['components'].message_type = _COMPONENTS
+_EXECUTABLESTAGEPAYLOAD.fields_by_name['user_states'].message_type = _EXECUTABLESTAGEPAYLOAD_USERSTATEID
+_EXECUTABLESTAGEPAYLOAD.fields_by_name['timers'].message_type = _EXECUTABLESTAGEPAYLOAD_TIMERID
+_EXECUTABLESTAGEPAYLOAD.fields_by_name['timerFamilies'].message_type = _EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID
+DESCRIPTOR.message_types_by_name['BeamConstants'] = _BEAMCONSTANTS
+DESCRIPTOR.message_types_by_name['Components'] = _COMPONENTS
+DESCRIPTOR.message_types_by_name['Pipeline'] = _PIPELINE
+DESCRIPTOR.message_types_by_name['PTransform'] = _PTRANSFORM
+DESCRIPTOR.message_types_by_name['StandardPTransforms'] = _STANDARDPTRANSFORMS
+DESCRIPTOR.message_types_by_name['StandardSideInputTypes'] = _STANDARDSIDEINPUTTYPES
+DESCRIPTOR.message_types_by_name['PCollection'] = _PCOLLECTION
+DESCRIPTOR.message_types_by_name['ParDoPayload'] = _PARDOPAYLOAD
+DESCRIPTOR.message_types_by_name['Parameter'] = _PARAMETER
+DESCRIPTOR.message_types_by_name['StateSpec'] = _STATESPEC
+DESCRIPTOR.message_types_by_name['ReadModifyWriteStateSpec'] = _READMODIFYWRITESTATESPEC
+DESCRIPTOR.message_types_by_name['BagStateSpec'] = _BAGSTATESPEC
+DESCRIPTOR.message_types_by_name['CombiningStateSpec'] = _COMBININGSTATESPEC
+DESCRIPTOR.message_types_by_name['MapStateSpec'] = _MAPSTATESPEC
+DESCRIPTOR.message_types_by_name['SetStateSpec'] = _SETSTATESPEC
+DESCRIPTOR.message_types_by_name['TimerSpec'] = _TIMERSPEC
+DESCRIPTOR.message_types_by_name['TimerFamilySpec'] = _TIMERFAMILYSPEC
+DESCRIPTOR.message_types_by_name['IsBounded'] = _ISBOUNDED
+DESCRIPTOR.message_types_by_name['ReadPayload'] = _READPAYLOAD
+DESCRIPTOR.message_types_by_name['WindowIntoPayload'] = _WINDOWINTOPAYLOAD
+DESCRIPTOR.message_types_by_name['CombinePayload'] = _COMBINEPAYLOAD
+DESCRIPTOR.message_types_by_name['TestStreamPayload'] = _TESTSTREAMPAYLOAD
+DESCRIPTOR.message_types_by_name['EventsRequest'] = _EVENTSREQUEST
+DESCRIPTOR.message_types_by_name['WriteFilesPayload'] = _WRITEFILESPAYLOAD
+DESCRIPTOR.message_types_by_name['Coder'] = _CODER
+DESCRIPTOR.message_types_by_name['StandardCoders'] = _STANDARDCODERS
+DESCRIPTOR.message_types_by_name['WindowingStrategy'] = _WINDOWINGSTRATEGY
+DESCRIPTOR.message_types_by_name['MergeStatus'] = _MERGESTATUS
+DESCRIPTOR.message_types_by_name['AccumulationMode'] = _ACCUMULATIONMODE
+DESCRIPTOR.message_types_by_name['ClosingBehavior'] = _CLOSINGBEHAVIOR
+DESCRIPTOR.message_types_by_name['OnTimeBehavior'] = _ONTIMEBEHAVIOR
+DESCRIPTOR.message_types_by_name['OutputTime'] = _OUTPUTTIME
+DESCRIPTOR.message_types_by_name['TimeDomain'] = _TIMEDOMAIN
+DESCRIPTOR.message_types_by_name['Trigger'] = _TRIGGER
+DESCRIPTOR.message_types_by_name['TimestampTransform'] = _TIMESTAMPTRANSFORM
+DESCRIPTOR.message_types_by_name['SideInput'] = _SIDEINPUT
+DESCRIPTOR.message_types_by_name['StandardArtifacts'] = _STANDARDARTIFACTS
+DESCRIPTOR.message_types_by_name['ArtifactFilePayload'] = _ARTIFACTFILEPAYLOAD
+DESCRIPTOR.message_types_by_name['ArtifactUrlPayload'] = _ARTIFACTURLPAYLOAD
+DESCRIPTOR.message_types_by_name['EmbeddedFilePayload'] = _EMBEDDEDFILEPAYLOAD
+DESCRIPTOR.message_types_by_name['PyPIPayload'] = _PYPIPAYLOAD
+DESCRIPTOR.message_types_by_name['MavenPayload'] = _MAVENPAYLOAD
+DESCRIPTOR.message_types_by_name['ArtifactStagingToRolePayload'] = _ARTIFACTSTAGINGTOROLEPAYLOAD
+DESCRIPTOR.message_types_by_name['ArtifactInformation'] = _ARTIFACTINFORMATION
+DESCRIPTOR.message_types_by_name['Environment'] = _ENVIRONMENT
+DESCRIPTOR.message_types_by_name['StandardEnvironments'] = _STANDARDENVIRONMENTS
+DESCRIPTOR.message_types_by_name['DockerPayload'] = _DOCKERPAYLOAD
+DESCRIPTOR.message_types_by_name['ProcessPayload'] = _PROCESSPAYLOAD
+DESCRIPTOR.message_types_by_name['ExternalPayload'] = _EXTERNALPAYLOAD
+DESCRIPTOR.message_types_by_name['StandardProtocols'] = _STANDARDPROTOCOLS
+DESCRIPTOR.message_types_by_name['StandardRequirements'] = _STANDARDREQUIREMENTS
+DESCRIPTOR.message_types_by_name['FunctionSpec'] = _FUNCTIONSPEC
+DESCRIPTOR.message_types_by_name['StandardDisplayData'] = _STANDARDDISPLAYDATA
+DESCRIPTOR.message_types_by_name['LabelledStringPayload'] = _LABELLEDSTRINGPAYLOAD
+DESCRIPTOR.message_types_by_name['DisplayData'] = _DISPLAYDATA
+DESCRIPTOR.message_types_by_name['MessageWithComponents'] = _MESSAGEWITHCOMPONENTS
+DESCRIPTOR.message_types_by_name['ExecutableStagePayload'] = _EXECUTABLESTAGEPAYLOAD
+DESCRIPTOR.extensions_by_name['beam_urn'] = beam_urn
+DESCRIPTOR.extensions_by_name['beam_constant'] = beam_constant
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+BeamConstants = _reflection.GeneratedProtocolMessageType('BeamConstants', (_message.Message,), dict(
+  DESCRIPTOR = _BEAMCONSTANTS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.BeamConstants)
+  ))
+_sym_db.RegisterMessage(BeamConstants)
+
+Components = _reflection.GeneratedProtocolMessageType('Components', (_message.Message,), dict(
+
+  TransformsEntry = _reflection.GeneratedProtocolMessageType('TransformsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _COMPONENTS_TRANSFORMSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.TransformsEntry)
+    ))
+  ,
+
+  PcollectionsEntry = _reflection.GeneratedProtocolMessageType('PcollectionsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _COMPONENTS_PCOLLECTIONSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.PcollectionsEntry)
+    ))
+  ,
+
+  WindowingStrategiesEntry = _reflection.GeneratedProtocolMessageType('WindowingStrategiesEntry', (_message.Message,), dict(
+    DESCRIPTOR = _COMPONENTS_WINDOWINGSTRATEGIESENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.WindowingStrategiesEntry)
+    ))
+  ,
+
+  CodersEntry = _reflection.GeneratedProtocolMessageType('CodersEntry', (_message.Message,), dict(
+    DESCRIPTOR = _COMPONENTS_CODERSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.CodersEntry)
+    ))
+  ,
+
+  EnvironmentsEntry = _reflection.GeneratedProtocolMessageType('EnvironmentsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _COMPONENTS_ENVIRONMENTSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.EnvironmentsEntry)
+    ))
+  ,
+  DESCRIPTOR = _COMPONENTS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components)
+  ))
+_sym_db.RegisterMessage(Components)
+_sym_db.RegisterMessage(Components.TransformsEntry)
+_sym_db.RegisterMessage(Components.PcollectionsEntry)
+_sym_db.RegisterMessage(Components.WindowingStrategiesEntry)
+_sym_db.RegisterMessage(Components.CodersEntry)
+_sym_db.RegisterMessage(Components.EnvironmentsEntry)
+
+Pipeline = _reflection.GeneratedProtocolMessageType('Pipeline', (_message.Message,), dict(
+  DESCRIPTOR = _PIPELINE,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Pipeline)
+  ))
+_sym_db.RegisterMessage(Pipeline)
+
+PTransform = _reflection.GeneratedProtocolMessageType('PTransform', (_message.Message,), dict(
+
+  InputsEntry = _reflection.GeneratedProtocolMessageType('InputsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PTRANSFORM_INPUTSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PTransform.InputsEntry)
+    ))
+  ,
+
+  OutputsEntry = _reflection.GeneratedProtocolMessageType('OutputsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PTRANSFORM_OUTPUTSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PTransform.OutputsEntry)
+    ))
+  ,
+  DESCRIPTOR = _PTRANSFORM,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PTransform)
+  ))
+_sym_db.RegisterMessage(PTransform)
+_sym_db.RegisterMessage(PTransform.InputsEntry)
+_sym_db.RegisterMessage(PTransform.OutputsEntry)
+
+StandardPTransforms = _reflection.GeneratedProtocolMessageType('StandardPTransforms', (_message.Message,), dict(
+  DESCRIPTOR = _STANDARDPTRANSFORMS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardPTransforms)
+  ))
+_sym_db.RegisterMessage(StandardPTransforms)
+
+StandardSideInputTypes = _reflection.GeneratedProtocolMessageType('StandardSideInputTypes', (_message.Message,), dict(
+  DESCRIPTOR = _STANDARDSIDEINPUTTYPES,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardSideInputTypes)
+  ))
+_sym_db.RegisterMessage(StandardSideInputTypes)
+
+PCollection = _reflection.GeneratedProtocolMessageType('PCollection', (_message.Message,), dict(
+  DESCRIPTOR = _PCOLLECTION,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PCollection)
+  ))
+_sym_db.RegisterMessage(PCollection)
+
+ParDoPayload = _reflection.GeneratedProtocolMessageType('ParDoPayload', (_message.Message,), dict(
+
+  SideInputsEntry = _reflection.GeneratedProtocolMessageType('SideInputsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PARDOPAYLOAD_SIDEINPUTSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload.SideInputsEntry)
+    ))
+  ,
+
+  StateSpecsEntry = _reflection.GeneratedProtocolMessageType('StateSpecsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PARDOPAYLOAD_STATESPECSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload.StateSpecsEntry)
+    ))
+  ,
+
+  TimerSpecsEntry = _reflection.GeneratedProtocolMessageType('TimerSpecsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PARDOPAYLOAD_TIMERSPECSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload.TimerSpecsEntry)
+    ))
+  ,
+
+  TimerFamilySpecsEntry = _reflection.GeneratedProtocolMessageType('TimerFamilySpecsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PARDOPAYLOAD_TIMERFAMILYSPECSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload.TimerFamilySpecsEntry)
+    ))
+  ,
+  DESCRIPTOR = _PARDOPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload)
+  ))
+_sym_db.RegisterMessage(ParDoPayload)
+_sym_db.RegisterMessage(ParDoPayload.SideInputsEntry)
+_sym_db.RegisterMessage(ParDoPayload.StateSpecsEntry)
+_sym_db.RegisterMessage(ParDoPayload.TimerSpecsEntry)
+_sym_db.RegisterMessage(ParDoPayload.TimerFamilySpecsEntry)
+
+Parameter = _reflection.GeneratedProtocolMessageType('Parameter', (_message.Message,), dict(
+
+  Type = _reflection.GeneratedProtocolMessageType('Type', (_message.Message,), dict(
+    DESCRIPTOR = _PARAMETER_TYPE,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Parameter.Type)
+    ))
+  ,
+  DESCRIPTOR = _PARAMETER,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Parameter)
+  ))
+_sym_db.RegisterMessage(Parameter)
+_sym_db.RegisterMessage(Parameter.Type)
+
+StateSpec = _reflection.GeneratedProtocolMessageType('StateSpec', (_message.Message,), dict(
+  DESCRIPTOR = _STATESPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StateSpec)
+  ))
+_sym_db.RegisterMessage(StateSpec)
+
+ReadModifyWriteStateSpec = _reflection.GeneratedProtocolMessageType('ReadModifyWriteStateSpec', (_message.Message,), dict(
+  DESCRIPTOR = _READMODIFYWRITESTATESPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ReadModifyWriteStateSpec)
+  ))
+_sym_db.RegisterMessage(ReadModifyWriteStateSpec)
+
+BagStateSpec = _reflection.GeneratedProtocolMessageType('BagStateSpec', (_message.Message,), dict(
+  DESCRIPTOR = _BAGSTATESPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.BagStateSpec)
+  ))
+_sym_db.RegisterMessage(BagStateSpec)
+
+CombiningStateSpec = _reflection.GeneratedProtocolMessageType('CombiningStateSpec', (_message.Message,), dict(
+  DESCRIPTOR = _COMBININGSTATESPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.CombiningStateSpec)
+  ))
+_sym_db.RegisterMessage(CombiningStateSpec)
+
+MapStateSpec = _reflection.GeneratedProtocolMessageType('MapStateSpec', (_message.Message,), dict(
+  DESCRIPTOR = _MAPSTATESPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MapStateSpec)
+  ))
+_sym_db.RegisterMessage(MapStateSpec)
+
+SetStateSpec = _reflection.GeneratedProtocolMessageType('SetStateSpec', (_message.Message,), dict(
+  DESCRIPTOR = _SETSTATESPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.SetStateSpec)
+  ))
+_sym_db.RegisterMessage(SetStateSpec)
+
+TimerSpec = _reflection.GeneratedProtocolMessageType('TimerSpec', (_message.Message,), dict(
+  DESCRIPTOR = _TIMERSPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimerSpec)
+  ))
+_sym_db.RegisterMessage(TimerSpec)
+
+TimerFamilySpec = _reflection.GeneratedProtocolMessageType('TimerFamilySpec', (_message.Message,), dict(
+  DESCRIPTOR = _TIMERFAMILYSPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimerFamilySpec)
+  ))
+_sym_db.RegisterMessage(TimerFamilySpec)
+
+IsBounded = _reflection.GeneratedProtocolMessageType('IsBounded', (_message.Message,), dict(
+  DESCRIPTOR = _ISBOUNDED,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.IsBounded)
+  ))
+_sym_db.RegisterMessage(IsBounded)
+
+ReadPayload = _reflection.GeneratedProtocolMessageType('ReadPayload', (_message.Message,), dict(
+  DESCRIPTOR = _READPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ReadPayload)
+  ))
+_sym_db.RegisterMessage(ReadPayload)
+
+WindowIntoPayload = _reflection.GeneratedProtocolMessageType('WindowIntoPayload', (_message.Message,), dict(
+  DESCRIPTOR = _WINDOWINTOPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.WindowIntoPayload)
+  ))
+_sym_db.RegisterMessage(WindowIntoPayload)
+
+CombinePayload = _reflection.GeneratedProtocolMessageType('CombinePayload', (_message.Message,), dict(
+  DESCRIPTOR = _COMBINEPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.CombinePayload)
+  ))
+_sym_db.RegisterMessage(CombinePayload)
+
+TestStreamPayload = _reflection.GeneratedProtocolMessageType('TestStreamPayload', (_message.Message,), dict(
+
+  Event = _reflection.GeneratedProtocolMessageType('Event', (_message.Message,), dict(
+
+    AdvanceWatermark = _reflection.GeneratedProtocolMessageType('AdvanceWatermark', (_message.Message,), dict(
+      DESCRIPTOR = _TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK,
+      __module__ = 'beam_runner_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceWatermark)
+      ))
+    ,
+
+    AdvanceProcessingTime = _reflection.GeneratedProtocolMessageType('AdvanceProcessingTime', (_message.Message,), dict(
+      DESCRIPTOR = _TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME,
+      __module__ = 'beam_runner_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceProcessingTime)
+      ))
+    ,
+
+    AddElements = _reflection.GeneratedProtocolMessageType('AddElements', (_message.Message,), dict(
+      DESCRIPTOR = _TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS,
+      __module__ = 'beam_runner_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AddElements)
+      ))
+    ,
+    DESCRIPTOR = _TESTSTREAMPAYLOAD_EVENT,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.Event)
+    ))
+  ,
+
+  TimestampedElement = _reflection.GeneratedProtocolMessageType('TimestampedElement', (_message.Message,), dict(
+    DESCRIPTOR = _TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.TimestampedElement)
+    ))
+  ,
+  DESCRIPTOR = _TESTSTREAMPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload)
+  ))
+_sym_db.RegisterMessage(TestStreamPayload)
+_sym_db.RegisterMessage(TestStreamPayload.Event)
+_sym_db.RegisterMessage(TestStreamPayload.Event.AdvanceWatermark)
+_sym_db.RegisterMessage(TestStreamPayload.Event.AdvanceProcessingTime)
+_sym_db.RegisterMessage(TestStreamPayload.Event.AddElements)
+_sym_db.RegisterMessage(TestStreamPayload.TimestampedElement)
+
+EventsRequest = _reflection.GeneratedProtocolMessageType('EventsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _EVENTSREQUEST,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.EventsRequest)
+  ))
+_sym_db.RegisterMessage(EventsRequest)
+
+WriteFilesPayload = _reflection.GeneratedProtocolMessageType('WriteFilesPayload', (_message.Message,), dict(
+
+  SideInputsEntry = _reflection.GeneratedProtocolMessageType('SideInputsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _WRITEFILESPAYLOAD_SIDEINPUTSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.WriteFilesPayload.SideInputsEntry)
+    ))
+  ,
+  DESCRIPTOR = _WRITEFILESPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.WriteFilesPayload)
+  ))
+_sym_db.RegisterMessage(WriteFilesPayload)
+_sym_db.RegisterMessage(WriteFilesPayload.SideInputsEntry)
+
+Coder = _reflection.GeneratedProtocolMessageType('Coder', (_message.Message,), dict(
+  DESCRIPTOR = _CODER,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Coder)
+  ))
+_sym_db.RegisterMessage(Coder)
+
+StandardCoders = _reflection.GeneratedProtocolMessageType('StandardCoders', (_message.Message,), dict(
+  DESCRIPTOR = _STANDARDCODERS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardCoders)
+  ))
+_sym_db.RegisterMessage(StandardCoders)
+
+WindowingStrategy = _reflection.GeneratedProtocolMessageType('WindowingStrategy', (_message.Message,), dict(
+  DESCRIPTOR = _WINDOWINGSTRATEGY,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.WindowingStrategy)
+  ))
+_sym_db.RegisterMessage(WindowingStrategy)
+
+MergeStatus = _reflection.GeneratedProtocolMessageType('MergeStatus', (_message.Message,), dict(
+  DESCRIPTOR = _MERGESTATUS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MergeStatus)
+  ))
+_sym_db.RegisterMessage(MergeStatus)
+
+AccumulationMode = _reflection.GeneratedProtocolMessageType('AccumulationMode', (_message.Message,), dict(
+  DESCRIPTOR = _ACCUMULATIONMODE,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.AccumulationMode)
+  ))
+_sym_db.RegisterMessage(AccumulationMode)
+
+ClosingBehavior = _reflection.GeneratedProtocolMessageType('ClosingBehavior', (_message.Message,), dict(
+  DESCRIPTOR = _CLOSINGBEHAVIOR,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ClosingBehavior)
+  ))
+_sym_db.RegisterMessage(ClosingBehavior)
+
+OnTimeBehavior = _reflection.GeneratedProtocolMessageType('OnTimeBehavior', (_message.Message,), dict(
+  DESCRIPTOR = _ONTIMEBEHAVIOR,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.OnTimeBehavior)
+  ))
+_sym_db.RegisterMessage(OnTimeBehavior)
+
+OutputTime = _reflection.GeneratedProtocolMessageType('OutputTime', (_message.Message,), dict(
+  DESCRIPTOR = _OUTPUTTIME,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.OutputTime)
+  ))
+_sym_db.RegisterMessage(OutputTime)
+
+TimeDomain = _reflection.GeneratedProtocolMessageType('TimeDomain', (_message.Message,), dict(
+  DESCRIPTOR = _TIMEDOMAIN,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimeDomain)
+  ))
+_sym_db.RegisterMessage(TimeDomain)
+
+Trigger = _reflection.GeneratedProtocolMessageType('Trigger', (_message.Message,), dict(
+
+  AfterAll = _reflection.GeneratedProtocolMessageType('AfterAll', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_AFTERALL,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterAll)
+    ))
+  ,
+
+  AfterAny = _reflection.GeneratedProtocolMessageType('AfterAny', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_AFTERANY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterAny)
+    ))
+  ,
+
+  AfterEach = _reflection.GeneratedProtocolMessageType('AfterEach', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_AFTEREACH,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterEach)
+    ))
+  ,
+
+  AfterEndOfWindow = _reflection.GeneratedProtocolMessageType('AfterEndOfWindow', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_AFTERENDOFWINDOW,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterEndOfWindow)
+    ))
+  ,
+
+  AfterProcessingTime = _reflection.GeneratedProtocolMessageType('AfterProcessingTime', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_AFTERPROCESSINGTIME,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterProcessingTime)
+    ))
+  ,
+
+  AfterSynchronizedProcessingTime = _reflection.GeneratedProtocolMessageType('AfterSynchronizedProcessingTime', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterSynchronizedProcessingTime)
+    ))
+  ,
+
+  Default = _reflection.GeneratedProtocolMessageType('Default', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_DEFAULT,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.Default)
+    ))
+  ,
+
+  ElementCount = _reflection.GeneratedProtocolMessageType('ElementCount', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_ELEMENTCOUNT,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.ElementCount)
+    ))
+  ,
+
+  Never = _reflection.GeneratedProtocolMessageType('Never', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_NEVER,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.Never)
+    ))
+  ,
+
+  Always = _reflection.GeneratedProtocolMessageType('Always', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_ALWAYS,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.Always)
+    ))
+  ,
+
+  OrFinally = _reflection.GeneratedProtocolMessageType('OrFinally', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_ORFINALLY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.OrFinally)
+    ))
+  ,
+
+  Repeat = _reflection.GeneratedProtocolMessageType('Repeat', (_message.Message,), dict(
+    DESCRIPTOR = _TRIGGER_REPEAT,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.Repeat)
+    ))
+  ,
+  DESCRIPTOR = _TRIGGER,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger)
+  ))
+_sym_db.RegisterMessage(Trigger)
+_sym_db.RegisterMessage(Trigger.AfterAll)
+_sym_db.RegisterMessage(Trigger.AfterAny)
+_sym_db.RegisterMessage(Trigger.AfterEach)
+_sym_db.RegisterMessage(Trigger.AfterEndOfWindow)
+_sym_db.RegisterMessage(Trigger.AfterProcessingTime)
+_sym_db.RegisterMessage(Trigger.AfterSynchronizedProcessingTime)
+_sym_db.RegisterMessage(Trigger.Default)
+_sym_db.RegisterMessage(Trigger.ElementCount)
+_sym_db.RegisterMessage(Trigger.Never)
+_sym_db.RegisterMessage(Trigger.Always)
+_sym_db.RegisterMessage(Trigger.OrFinally)
+_sym_db.RegisterMessage(Trigger.Repeat)
+
+TimestampTransform = _reflection.GeneratedProtocolMessageType('TimestampTransform', (_message.Message,), dict(
+
+  Delay = _reflection.GeneratedProtocolMessageType('Delay', (_message.Message,), dict(
+    DESCRIPTOR = _TIMESTAMPTRANSFORM_DELAY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimestampTransform.Delay)
+    ))
+  ,
+
+  AlignTo = _reflection.GeneratedProtocolMessageType('AlignTo', (_message.Message,), dict(
+    DESCRIPTOR = _TIMESTAMPTRANSFORM_ALIGNTO,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimestampTransform.AlignTo)
+    ))
+  ,
+  DESCRIPTOR = _TIMESTAMPTRANSFORM,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimestampTransform)
+  ))
+_sym_db.RegisterMessage(TimestampTransform)
+_sym_db.RegisterMessage(TimestampTransform.Delay)
+_sym_db.RegisterMessage(TimestampTransform.AlignTo)
+
+SideInput = _reflection.GeneratedProtocolMessageType('SideInput', (_message.Message,), dict(
+  DESCRIPTOR = _SIDEINPUT,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.SideInput)
+  ))
+_sym_db.RegisterMessage(SideInput)
+
+StandardArtifacts = _reflection.GeneratedProtocolMessageType('StandardArtifacts', (_message.Message,), dict(
+  DESCRIPTOR = _STANDARDARTIFACTS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardArtifacts)
+  ))
+_sym_db.RegisterMessage(StandardArtifacts)
+
+ArtifactFilePayload = _reflection.GeneratedProtocolMessageType('ArtifactFilePayload', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTFILEPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArtifactFilePayload)
+  ))
+_sym_db.RegisterMessage(ArtifactFilePayload)
+
+ArtifactUrlPayload = _reflection.GeneratedProtocolMessageType('ArtifactUrlPayload', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTURLPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArtifactUrlPayload)
+  ))
+_sym_db.RegisterMessage(ArtifactUrlPayload)
+
+EmbeddedFilePayload = _reflection.GeneratedProtocolMessageType('EmbeddedFilePayload', (_message.Message,), dict(
+  DESCRIPTOR = _EMBEDDEDFILEPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.EmbeddedFilePayload)
+  ))
+_sym_db.RegisterMessage(EmbeddedFilePayload)
+
+PyPIPayload = _reflection.GeneratedProtocolMessageType('PyPIPayload', (_message.Message,), dict(
+  DESCRIPTOR = _PYPIPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PyPIPayload)
+  ))
+_sym_db.RegisterMessage(PyPIPayload)
+
+MavenPayload = _reflection.GeneratedProtocolMessageType('MavenPayload', (_message.Message,), dict(
+  DESCRIPTOR = _MAVENPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MavenPayload)
+  ))
+_sym_db.RegisterMessage(MavenPayload)
+
+ArtifactStagingToRolePayload = _reflection.GeneratedProtocolMessageType('ArtifactStagingToRolePayload', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTSTAGINGTOROLEPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArtifactStagingToRolePayload)
+  ))
+_sym_db.RegisterMessage(ArtifactStagingToRolePayload)
+
+ArtifactInformation = _reflection.GeneratedProtocolMessageType('ArtifactInformation', (_message.Message,), dict(
+  DESCRIPTOR = _ARTIFACTINFORMATION,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArtifactInformation)
+  ))
+_sym_db.RegisterMessage(ArtifactInformation)
+
+Environment = _reflection.GeneratedProtocolMessageType('Environment', (_message.Message,), dict(
+  DESCRIPTOR = _ENVIRONMENT,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Environment)
+  ))
+_sym_db.RegisterMessage(Environment)
+
+StandardEnvironments = _reflection.GeneratedProtocolMessageType('StandardEnvironments', (_message.Message,), dict(
+  DESCRIPTOR = _STANDARDENVIRONMENTS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardEnvironments)
+  ))
+_sym_db.RegisterMessage(StandardEnvironments)
+
+DockerPayload = _reflection.GeneratedProtocolMessageType('DockerPayload', (_message.Message,), dict(
+  DESCRIPTOR = _DOCKERPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.DockerPayload)
+  ))
+_sym_db.RegisterMessage(DockerPayload)
+
+ProcessPayload = _reflection.GeneratedProtocolMessageType('ProcessPayload', (_message.Message,), dict(
+
+  EnvEntry = _reflection.GeneratedProtocolMessageType('EnvEntry', (_message.Message,), dict(
+    DESCRIPTOR = _PROCESSPAYLOAD_ENVENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ProcessPayload.EnvEntry)
+    ))
+  ,
+  DESCRIPTOR = _PROCESSPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ProcessPayload)
+  ))
+_sym_db.RegisterMessage(ProcessPayload)
+_sym_db.RegisterMessage(ProcessPayload.EnvEntry)
+
+ExternalPayload = _reflection.GeneratedProtocolMessageType('ExternalPayload', (_message.Message,), dict(
+
+  ParamsEntry = _reflection.GeneratedProtocolMessageType('ParamsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _EXTERNALPAYLOAD_PARAMSENTRY,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalPayload.ParamsEntry)
+    ))
+  ,
+  DESCRIPTOR = _EXTERNALPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalPayload)
+  ))
+_sym_db.RegisterMessage(ExternalPayload)
+_sym_db.RegisterMessage(ExternalPayload.ParamsEntry)
+
+StandardProtocols = _reflection.GeneratedProtocolMessageType('StandardProtocols', (_message.Message,), dict(
+  DESCRIPTOR = _STANDARDPROTOCOLS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardProtocols)
+  ))
+_sym_db.RegisterMessage(StandardProtocols)
+
+StandardRequirements = _reflection.GeneratedProtocolMessageType('StandardRequirements', (_message.Message,), dict(
+  DESCRIPTOR = _STANDARDREQUIREMENTS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardRequirements)
+  ))
+_sym_db.RegisterMessage(StandardRequirements)
+
+FunctionSpec = _reflection.GeneratedProtocolMessageType('FunctionSpec', (_message.Message,), dict(
+  DESCRIPTOR = _FUNCTIONSPEC,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.FunctionSpec)
+  ))
+_sym_db.RegisterMessage(FunctionSpec)
+
+StandardDisplayData = _reflection.GeneratedProtocolMessageType('StandardDisplayData', (_message.Message,), dict(
+  DESCRIPTOR = _STANDARDDISPLAYDATA,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardDisplayData)
+  ))
+_sym_db.RegisterMessage(StandardDisplayData)
+
+LabelledStringPayload = _reflection.GeneratedProtocolMessageType('LabelledStringPayload', (_message.Message,), dict(
+  DESCRIPTOR = _LABELLEDSTRINGPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.LabelledStringPayload)
+  ))
+_sym_db.RegisterMessage(LabelledStringPayload)
+
+DisplayData = _reflection.GeneratedProtocolMessageType('DisplayData', (_message.Message,), dict(
+  DESCRIPTOR = _DISPLAYDATA,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.DisplayData)
+  ))
+_sym_db.RegisterMessage(DisplayData)
+
+MessageWithComponents = _reflection.GeneratedProtocolMessageType('MessageWithComponents', (_message.Message,), dict(
+  DESCRIPTOR = _MESSAGEWITHCOMPONENTS,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MessageWithComponents)
+  ))
+_sym_db.RegisterMessage(MessageWithComponents)
+
+ExecutableStagePayload = _reflection.GeneratedProtocolMessageType('ExecutableStagePayload', (_message.Message,), dict(
+
+  SideInputId = _reflection.GeneratedProtocolMessageType('SideInputId', (_message.Message,), dict(
+    DESCRIPTOR = _EXECUTABLESTAGEPAYLOAD_SIDEINPUTID,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.SideInputId)
+    ))
+  ,
+
+  UserStateId = _reflection.GeneratedProtocolMessageType('UserStateId', (_message.Message,), dict(
+    DESCRIPTOR = _EXECUTABLESTAGEPAYLOAD_USERSTATEID,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.UserStateId)
+    ))
+  ,
+
+  TimerId = _reflection.GeneratedProtocolMessageType('TimerId', (_message.Message,), dict(
+    DESCRIPTOR = _EXECUTABLESTAGEPAYLOAD_TIMERID,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerId)
+    ))
+  ,
+
+  TimerFamilyId = _reflection.GeneratedProtocolMessageType('TimerFamilyId', (_message.Message,), dict(
+    DESCRIPTOR = _EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerFamilyId)
+    ))
+  ,
+
+  WireCoderSetting = _reflection.GeneratedProtocolMessageType('WireCoderSetting', (_message.Message,), dict(
+    DESCRIPTOR = _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING,
+    __module__ = 'beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting)
+    ))
+  ,
+  DESCRIPTOR = _EXECUTABLESTAGEPAYLOAD,
+  __module__ = 'beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload)
+  ))
+_sym_db.RegisterMessage(ExecutableStagePayload)
+_sym_db.RegisterMessage(ExecutableStagePayload.SideInputId)
+_sym_db.RegisterMessage(ExecutableStagePayload.UserStateId)
+_sym_db.RegisterMessage(ExecutableStagePayload.TimerId)
+_sym_db.RegisterMessage(ExecutableStagePayload.TimerFamilyId)
+_sym_db.RegisterMessage(ExecutableStagePayload.WireCoderSetting)
+
+google_dot_protobuf_dot_descriptor__pb2.EnumValueOptions.RegisterExtension(beam_urn)
+google_dot_protobuf_dot_descriptor__pb2.EnumValueOptions.RegisterExtension(beam_constant)
+
+DESCRIPTOR.has_options = True
+DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\n!org.apache.beam.model.pipeline.v1B\tRunnerApiZ\013pipeline_v1'))
+_BEAMCONSTANTS_CONSTANTS.values_by_name["MIN_TIMESTAMP_MILLIS"].has_options = True
+_BEAMCONSTANTS_CONSTANTS.values_by_name["MIN_TIMESTAMP_MILLIS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\252\264\372\302\005\021-9223372036854775'))
+_BEAMCONSTANTS_CONSTANTS.values_by_name["MAX_TIMESTAMP_MILLIS"].has_options = True
+_BEAMCONSTANTS_CONSTANTS.values_by_name["MAX_TIMESTAMP_MILLIS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\252\264\372\302\005\0209223372036854775'))
+_BEAMCONSTANTS_CONSTANTS.values_by_name["GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS"].has_options = True
+_BEAMCONSTANTS_CONSTANTS.values_by_name["GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\252\264\372\302\005\0209223371950454775'))
+_COMPONENTS_TRANSFORMSENTRY.has_options = True
+_COMPONENTS_TRANSFORMSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_COMPONENTS_PCOLLECTIONSENTRY.has_options = True
+_COMPONENTS_PCOLLECTIONSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_COMPONENTS_WINDOWINGSTRATEGIESENTRY.has_options = True
+_COMPONENTS_WINDOWINGSTRATEGIESENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_COMPONENTS_CODERSENTRY.has_options = True
+_COMPONENTS_CODERSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_COMPONENTS_ENVIRONMENTSENTRY.has_options = True
+_COMPONENTS_ENVIRONMENTSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PTRANSFORM_INPUTSENTRY.has_options = True
+_PTRANSFORM_INPUTSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PTRANSFORM_OUTPUTSENTRY.has_options = True
+_PTRANSFORM_OUTPUTSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["PAR_DO"].has_options = True
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["PAR_DO"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\027beam:transform:pardo:v1'))
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["FLATTEN"].has_options = True
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["FLATTEN"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\031beam:transform:flatten:v1'))
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["GROUP_BY_KEY"].has_options = True
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["GROUP_BY_KEY"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\036beam:transform:group_by_key:v1'))
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["IMPULSE"].has_options = True
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["IMPULSE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\031beam:transform:impulse:v1'))
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["ASSIGN_WINDOWS"].has_options = True
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["ASSIGN_WINDOWS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:transform:window_into:v1'))
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["TEST_STREAM"].has_options = True
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["TEST_STREAM"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\034beam:transform:teststream:v1'))
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["MAP_WINDOWS"].has_options = True
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["MAP_WINDOWS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:transform:map_windows:v1'))
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["MERGE_WINDOWS"].has_options = True
+_STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["MERGE_WINDOWS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\037beam:transform:merge_windows:v1'))
+_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.values_by_name["READ"].has_options = True
+_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.values_by_name["READ"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\026beam:transform:read:v1'))
+_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.values_by_name["CREATE_VIEW"].has_options = True
+_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.values_by_name["CREATE_VIEW"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:transform:create_view:v1'))
+_STANDARDPTRANSFORMS_COMPOSITES.values_by_name["COMBINE_PER_KEY"].has_options = True
+_STANDARDPTRANSFORMS_COMPOSITES.values_by_name["COMBINE_PER_KEY"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005!beam:transform:combine_per_key:v1'))
+_STANDARDPTRANSFORMS_COMPOSITES.values_by_name["COMBINE_GLOBALLY"].has_options = True
+_STANDARDPTRANSFORMS_COMPOSITES.values_by_name["COMBINE_GLOBALLY"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\"beam:transform:combine_globally:v1'))
+_STANDARDPTRANSFORMS_COMPOSITES.values_by_name["RESHUFFLE"].has_options = True
+_STANDARDPTRANSFORMS_COMPOSITES.values_by_name["RESHUFFLE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:transform:reshuffle:v1'))
+_STANDARDPTRANSFORMS_COMPOSITES.values_by_name["WRITE_FILES"].has_options = True
+_STANDARDPTRANSFORMS_COMPOSITES.values_by_name["WRITE_FILES"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:transform:write_files:v1'))
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_PRECOMBINE"].has_options = True
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_PRECOMBINE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005,beam:transform:combine_per_key_precombine:v1'))
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_MERGE_ACCUMULATORS"].has_options = True
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_MERGE_ACCUMULATORS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\0054beam:transform:combine_per_key_merge_accumulators:v1'))
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_EXTRACT_OUTPUTS"].has_options = True
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_EXTRACT_OUTPUTS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\0051beam:transform:combine_per_key_extract_outputs:v1'))
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_GROUPED_VALUES"].has_options = True
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_GROUPED_VALUES"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005(beam:transform:combine_grouped_values:v1'))
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PAIR_WITH_RESTRICTION"].has_options = True
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PAIR_WITH_RESTRICTION"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005+beam:transform:sdf_pair_with_restriction:v1'))
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["SPLIT_RESTRICTION"].has_options = True
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["SPLIT_RESTRICTION"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\'beam:transform:sdf_split_restriction:v1'))
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PROCESS_KEYED_ELEMENTS"].has_options = True
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PROCESS_KEYED_ELEMENTS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005,beam:transform:sdf_process_keyed_elements:v1'))
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PROCESS_ELEMENTS"].has_options = True
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PROCESS_ELEMENTS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005&beam:transform:sdf_process_elements:v1'))
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["SPLIT_AND_SIZE_RESTRICTIONS"].has_options = True
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["SPLIT_AND_SIZE_RESTRICTIONS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\0051beam:transform:sdf_split_and_size_restrictions:v1'))
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS"].has_options = True
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005<beam:transform:sdf_process_sized_element_and_restrictions:v1'))
+_STANDARDSIDEINPUTTYPES_ENUM.values_by_name["ITERABLE"].has_options = True
+_STANDARDSIDEINPUTTYPES_ENUM.values_by_name["ITERABLE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:side_input:iterable:v1'))
+_STANDARDSIDEINPUTTYPES_ENUM.values_by_name["MULTIMAP"].has_options = True
+_STANDARDSIDEINPUTTYPES_ENUM.values_by_name["MULTIMAP"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:side_input:multimap:v1'))
+_PARDOPAYLOAD_SIDEINPUTSENTRY.has_options = True
+_PARDOPAYLOAD_SIDEINPUTSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PARDOPAYLOAD_STATESPECSENTRY.has_options = True
+_PARDOPAYLOAD_STATESPECSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PARDOPAYLOAD_TIMERSPECSENTRY.has_options = True
+_PARDOPAYLOAD_TIMERSPECSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY.has_options = True
+_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_WRITEFILESPAYLOAD_SIDEINPUTSENTRY.has_options = True
+_WRITEFILESPAYLOAD_SIDEINPUTSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_STANDARDCODERS_ENUM.values_by_name["BYTES"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["BYTES"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\023beam:coder:bytes:v1'))
+_STANDARDCODERS_ENUM.values_by_name["STRING_UTF8"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["STRING_UTF8"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\031beam:coder:string_utf8:v1'))
+_STANDARDCODERS_ENUM.values_by_name["KV"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["KV"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\020beam:coder:kv:v1'))
+_STANDARDCODERS_ENUM.values_by_name["BOOL"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["BOOL"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\022beam:coder:bool:v1'))
+_STANDARDCODERS_ENUM.values_by_name["VARINT"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["VARINT"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\024beam:coder:varint:v1'))
+_STANDARDCODERS_ENUM.values_by_name["DOUBLE"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["DOUBLE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\024beam:coder:double:v1'))
+_STANDARDCODERS_ENUM.values_by_name["ITERABLE"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["ITERABLE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\026beam:coder:iterable:v1'))
+_STANDARDCODERS_ENUM.values_by_name["TIMER"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["TIMER"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\023beam:coder:timer:v1'))
+_STANDARDCODERS_ENUM.values_by_name["INTERVAL_WINDOW"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["INTERVAL_WINDOW"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\035beam:coder:interval_window:v1'))
+_STANDARDCODERS_ENUM.values_by_name["LENGTH_PREFIX"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["LENGTH_PREFIX"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:coder:length_prefix:v1'))
+_STANDARDCODERS_ENUM.values_by_name["GLOBAL_WINDOW"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["GLOBAL_WINDOW"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:coder:global_window:v1'))
+_STANDARDCODERS_ENUM.values_by_name["WINDOWED_VALUE"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["WINDOWED_VALUE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\034beam:coder:windowed_value:v1'))
+_STANDARDCODERS_ENUM.values_by_name["PARAM_WINDOWED_VALUE"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["PARAM_WINDOWED_VALUE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\"beam:coder:param_windowed_value:v1'))
+_STANDARDCODERS_ENUM.values_by_name["STATE_BACKED_ITERABLE"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["STATE_BACKED_ITERABLE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005#beam:coder:state_backed_iterable:v1'))
+_STANDARDCODERS_ENUM.values_by_name["ROW"].has_options = True
+_STANDARDCODERS_ENUM.values_by_name["ROW"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\021beam:coder:row:v1'))
+_STANDARDARTIFACTS_TYPES.values_by_name["FILE"].has_options = True
+_STANDARDARTIFACTS_TYPES.values_by_name["FILE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\032beam:artifact:type:file:v1'))
+_STANDARDARTIFACTS_TYPES.values_by_name["URL"].has_options = True
+_STANDARDARTIFACTS_TYPES.values_by_name["URL"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\031beam:artifact:type:url:v1'))
+_STANDARDARTIFACTS_TYPES.values_by_name["EMBEDDED"].has_options = True
+_STANDARDARTIFACTS_TYPES.values_by_name["EMBEDDED"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\036beam:artifact:type:embedded:v1'))
+_STANDARDARTIFACTS_TYPES.values_by_name["PYPI"].has_options = True
+_STANDARDARTIFACTS_TYPES.values_by_name["PYPI"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\032beam:artifact:type:pypi:v1'))
+_STANDARDARTIFACTS_TYPES.values_by_name["MAVEN"].has_options = True
+_STANDARDARTIFACTS_TYPES.values_by_name["MAVEN"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:artifact:type:maven:v1'))
+_STANDARDARTIFACTS_ROLES.values_by_name["STAGING_TO"].has_options = True
+_STANDARDARTIFACTS_ROLES.values_by_name["STAGING_TO"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005 beam:artifact:role:staging_to:v1'))
+_STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["DOCKER"].has_options = True
+_STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["DOCKER"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\022beam:env:docker:v1'))
+_STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["PROCESS"].has_options = True
+_STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["PROCESS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\023beam:env:process:v1'))
+_STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["EXTERNAL"].has_options = True
+_STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["EXTERNAL"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\024beam:env:external:v1'))
+_PROCESSPAYLOAD_ENVENTRY.has_options = True
+_PROCESSPAYLOAD_ENVENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_EXTERNALPAYLOAD_PARAMSENTRY.has_options = True
+_EXTERNALPAYLOAD_PARAMSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_STANDARDPROTOCOLS_ENUM.values_by_name["LEGACY_PROGRESS_REPORTING"].has_options = True
+_STANDARDPROTOCOLS_ENUM.values_by_name["LEGACY_PROGRESS_REPORTING"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005#beam:protocol:progress_reporting:v0'))
+_STANDARDPROTOCOLS_ENUM.values_by_name["PROGRESS_REPORTING"].has_options = True
+_STANDARDPROTOCOLS_ENUM.values_by_name["PROGRESS_REPORTING"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005#beam:protocol:progress_reporting:v1'))
+_STANDARDPROTOCOLS_ENUM.values_by_name["WORKER_STATUS"].has_options = True
+_STANDARDPROTOCOLS_ENUM.values_by_name["WORKER_STATUS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\036beam:protocol:worker_status:v1'))
+_STANDARDPROTOCOLS_ENUM.values_by_name["MULTI_CORE_BUNDLE_PROCESSING"].has_options = True
+_STANDARDPROTOCOLS_ENUM.values_by_name["MULTI_CORE_BUNDLE_PROCESSING"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005-beam:protocol:multi_core_bundle_processing:v1'))
+_STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_STATEFUL_PROCESSING"].has_options = True
+_STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_STATEFUL_PROCESSING"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\"beam:requirement:pardo:stateful:v1'))
+_STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_BUNDLE_FINALIZATION"].has_options = True
+_STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_BUNDLE_FINALIZATION"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005&beam:requirement:pardo:finalization:v1'))
+_STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_STABLE_INPUT"].has_options = True
+_STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_STABLE_INPUT"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005&beam:requirement:pardo:stable_input:v1'))
+_STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_TIME_SORTED_INPUT"].has_options = True
+_STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_TIME_SORTED_INPUT"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005+beam:requirement:pardo:time_sorted_input:v1'))
+_STANDARDDISPLAYDATA_DISPLAYDATA.values_by_name["LABELLED_STRING"].has_options = True
+_STANDARDDISPLAYDATA_DISPLAYDATA.values_by_name["LABELLED_STRING"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005$beam:display_data:labelled_string:v1'))
+
+_TESTSTREAMSERVICE = _descriptor.ServiceDescriptor(
+  name='TestStreamService',
+  full_name='org.apache.beam.model.pipeline.v1.TestStreamService',
+  file=DESCRIPTOR,
+  index=0,
+  options=None,
+  serialized_start=16671,
+  serialized_end=16814,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Events',
+    full_name='org.apache.beam.model.pipeline.v1.TestStreamService.Events',
+    index=0,
+    containing_service=None,
+    input_type=_EVENTSREQUEST,
+    output_type=_TESTSTREAMPAYLOAD_EVENT,
+    options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_TESTSTREAMSERVICE)
+
+DESCRIPTOR.services_by_name['TestStreamService'] = _TESTSTREAMSERVICE
+
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,170 @@
+from __future__ import absolute_import
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: external_transforms.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='external_transforms.proto',
+  package='org.apache.beam.model.pipeline.v1',
+  syntax='proto3',
+  serialized_pb=_b('\n\x19\x65xternal_transforms.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x15\x62\x65\x61m_runner_api.proto\"1\n\x0b\x43onfigValue\x12\x11\n\tcoder_urn\x18\x01 \x03(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"\xef\x01\n\x1c\x45xternalConfigurationPayload\x12i\n\rconfiguration\x18\x01 \x03(\x0b\x32R.org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload.ConfigurationEntry\x1a\x64\n\x12\x43onfigurationEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.ConfigValue:\x02\x38\x01\x42\x44\n!org.apache.beam.model.pipeline.v1B\x12\x45xternalTransformsZ\x0bpipeline_v1b\x06proto3')
+  ,
+  dependencies=[beam__runner__api__pb2.DESCRIPTOR,])
+
+
+
+
+_CONFIGVALUE = _descriptor.Descriptor(
+  name='ConfigValue',
+  full_name='org.apache.beam.model.pipeline.v1.ConfigValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='coder_urn', full_name='org.apache.beam.model.pipeline.v1.ConfigValue.coder_urn', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.ConfigValue.payload', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=87,
+  serialized_end=136,
+)
+
+
+_EXTERNALCONFIGURATIONPAYLOAD_CONFIGURATIONENTRY = _descriptor.Descriptor(
+  name='ConfigurationEntry',
+  full_name='org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload.ConfigurationEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload.ConfigurationEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload.ConfigurationEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=278,
+  serialized_end=378,
+)
+
+_EXTERNALCONFIGURATIONPAYLOAD = _descriptor.Descriptor(
+  name='ExternalConfigurationPayload',
+  full_name='org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='configuration', full_name='org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload.configuration', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_EXTERNALCONFIGURATIONPAYLOAD_CONFIGURATIONENTRY, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=139,
+  serialized_end=378,
+)
+
+_EXTERNALCONFIGURATIONPAYLOAD_CONFIGURATIONENTRY.fields_by_name['value'].message_type = _CONFIGVALUE
+_EXTERNALCONFIGURATIONPAYLOAD_CONFIGURATIONENTRY.containing_type = _EXTERNALCONFIGURATIONPAYLOAD
+_EXTERNALCONFIGURATIONPAYLOAD.fields_by_name['configuration'].message_type = _EXTERNALCONFIGURATIONPAYLOAD_CONFIGURATIONENTRY
+DESCRIPTOR.message_types_by_name['ConfigValue'] = _CONFIGVALUE
+DESCRIPTOR.message_types_by_name['ExternalConfigurationPayload'] = _EXTERNALCONFIGURATIONPAYLOAD
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ConfigValue = _reflection.GeneratedProtocolMessageType('ConfigValue', (_message.Message,), dict(
+  DESCRIPTOR = _CONFIGVALUE,
+  __module__ = 'external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ConfigValue)
+  ))
+_sym_db.RegisterMessage(ConfigValue)
+
+ExternalConfigurationPayload = _reflection.GeneratedProtocolMessageType('ExternalConfigurationPayload', (_message.Message,), dict(
+
+  ConfigurationEntry = _reflection.GeneratedProtocolMessageType('ConfigurationEntry', (_message.Message,), dict(
+    DESCRIPTOR = _EXTERNALCONFIGURATIONPAYLOAD_CONFIGURATIONENTRY,
+    __module__ = 'external_transforms_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload.ConfigurationEntry)
+    ))
+  ,
+  DESCRIPTOR = _EXTERNALCONFIGURATIONPAYLOAD,
+  __module__ = 'external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload)
+  ))
+_sym_db.RegisterMessage(ExternalConfigurationPayload)
+_sym_db.RegisterMessage(ExternalConfigurationPayload.ConfigurationEntry)
+
+
+DESCRIPTOR.has_options = True
+DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\n!org.apache.beam.model.pipeline.v1B\022ExternalTransformsZ\013pipeline_v1'))
+_EXTERNALCONFIGURATIONPAYLOAD_CONFIGURATIONENTRY.has_options = True
+_EXTERNALCONFIGURATIONPAYLOAD_CONFIGURATIONENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,1196 @@
+from __future__ import absolute_import
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: metrics.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf import descriptor_pb2
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='metrics.proto',
+  package='org.apache.beam.model.pipeline.v1',
+  syntax='proto3',
+  serialized_pb=_b('\n\rmetrics.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x15\x62\x65\x61m_runner_api.proto\x1a google/protobuf/descriptor.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\x90\x01\n\x12MonitoringInfoSpec\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x10\n\x08type_urn\x18\x02 \x01(\t\x12\x17\n\x0frequired_labels\x18\x03 \x03(\t\x12\x42\n\x0b\x61nnotations\x18\x04 \x03(\x0b\x32-.org.apache.beam.model.pipeline.v1.Annotation\"(\n\nAnnotation\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"\xa6\x12\n\x13MonitoringInfoSpecs\"\x8e\x12\n\x04\x45num\x12\xa0\x01\n\x0cUSER_COUNTER\x10\x00\x1a\x8d\x01\xd2\xa7\xa7\x96\x06\x86\x01\n\x10\x62\x65\x61m:metric:user\x12\x17\x62\x65\x61m:metrics:sum_int_64\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"<\n\x0b\x64\x65scription\x12-URN utilized to report user numeric counters.\x12\xab\x01\n\rELEMENT_COUNT\x10\x01\x1a\x97\x01\xd2\xa7\xa7\x96\x06\x90\x01\n\x1c\x62\x65\x61m:metric:element_count:v1\x12\x17\x62\x65\x61m:metrics:sum_int_64\x1a\x0bPCOLLECTION\"J\n\x0b\x64\x65scription\x12;The total elements output to a Pcollection by a PTransform.\x12\xcb\x02\n\x11SAMPLED_BYTE_SIZE\x10\x07\x1a\xb3\x02\xd2\xa7\xa7\x96\x06\xac\x02\n beam:metric:sampled_byte_size:v1\x12 beam:metrics:distribution_int_64\x1a\x0bPCOLLECTION\"\xd8\x01\n\x0b\x64\x65scription\x12\xc8\x01The total byte size and count of a sampled  set (or all) of elements in the pcollection. Sampling is used  because calculating the byte count involves serializing the  elements which is CPU intensive.\x12\xd7\x01\n\x12START_BUNDLE_MSECS\x10\x02\x1a\xbe\x01\xd2\xa7\xa7\x96\x06\xb7\x01\n6beam:metric:pardo_execution_time:start_bundle_msecs:v1\x12\x17\x62\x65\x61m:metrics:sum_int_64\x1a\nPTRANSFORM\"X\n\x0b\x64\x65scription\x12IThe total estimated execution time of the start bundlefunction in a pardo\x12\xdd\x01\n\x14PROCESS_BUNDLE_MSECS\x10\x03\x1a\xc2\x01\xd2\xa7\xa7\x96\x06\xbb\x01\n8beam:metric:pardo_execution_time:process_bundle_msecs:v1\x12\x17\x62\x65\x61m:metrics:sum_int_64\x1a\nPTRANSFORM\"Z\n\x0b\x64\x65scription\x12KThe total estimated execution time of the process bundlefunction in a pardo\x12\xdb\x01\n\x13\x46INISH_BUNDLE_MSECS\x10\x04\x1a\xc1\x01\xd2\xa7\xa7\x96\x06\xba\x01\n7beam:metric:pardo_execution_time:finish_bundle_msecs:v1\x12\x17\x62\x65\x61m:metrics:sum_int_64\x1a\nPTRANSFORM\"Z\n\x0b\x64\x65scription\x12KThe total estimated execution time of the finish bundle function in a pardo\x12\xb9\x01\n\x0bTOTAL_MSECS\x10\x05\x1a\xa7\x01\xd2\xa7\xa7\x96\x06\xa0\x01\n4beam:metric:ptransform_execution_time:total_msecs:v1\x12\x17\x62\x65\x61m:metrics:sum_int_64\x1a\nPTRANSFORM\"C\n\x0b\x64\x65scription\x12\x34The total estimated execution time of the ptransform\x12\xc8\x01\n\x19USER_DISTRIBUTION_COUNTER\x10\x06\x1a\xa8\x01\xd2\xa7\xa7\x96\x06\xa1\x01\n\x1d\x62\x65\x61m:metric:user_distribution\x12 beam:metrics:distribution_int_64\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"A\n\x0b\x64\x65scription\x12\x32URN utilized to report user distribution counters.\x12\xa2\x02\n\x0eWORK_REMAINING\x10\x08\x1a\x8d\x02\xd2\xa7\xa7\x96\x06\x86\x02\n,beam:metric:ptransform_progress:remaining:v1\x12\x1b\x62\x65\x61m:metrics:latest_doubles\x1a\nPTRANSFORM\"\xac\x01\n\x0b\x64\x65scription\x12\x9c\x01The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.\x12\xa2\x02\n\x0eWORK_COMPLETED\x10\t\x1a\x8d\x02\xd2\xa7\xa7\x96\x06\x86\x02\n,beam:metric:ptransform_progress:completed:v1\x12\x1b\x62\x65\x61m:metrics:latest_doubles\x1a\nPTRANSFORM\"\xac\x01\n\x0b\x64\x65scription\x12\x9c\x01The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.\"(\n\x18MonitoringInfoLabelProps\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x99\x05\n\x0eMonitoringInfo\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12W\n\x15monitoring_table_data\x18\x03 \x01(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.MonitoringTableDataH\x00\x12;\n\x06metric\x18\x04 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.MetricH\x00\x12\x11\n\x07payload\x18\x07 \x01(\x0cH\x00\x12M\n\x06labels\x18\x05 \x03(\x0b\x32=.org.apache.beam.model.pipeline.v1.MonitoringInfo.LabelsEntry\x12-\n\ttimestamp\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x8d\x02\n\x14MonitoringInfoLabels\x12!\n\tTRANSFORM\x10\x00\x1a\x12\xa2\xd4\xe0\xe5\x03\x0c\n\nPTRANSFORM\x12$\n\x0bPCOLLECTION\x10\x01\x1a\x13\xa2\xd4\xe0\xe5\x03\r\n\x0bPCOLLECTION\x12\x32\n\x12WINDOWING_STRATEGY\x10\x02\x1a\x1a\xa2\xd4\xe0\xe5\x03\x14\n\x12WINDOWING_STRATEGY\x12\x18\n\x05\x43ODER\x10\x03\x1a\r\xa2\xd4\xe0\xe5\x03\x07\n\x05\x43ODER\x12$\n\x0b\x45NVIRONMENT\x10\x04\x1a\x13\xa2\xd4\xe0\xe5\x03\r\n\x0b\x45NVIRONMENT\x12 \n\tNAMESPACE\x10\x05\x1a\x11\xa2\xd4\xe0\xe5\x03\x0b\n\tNAMESPACE\x12\x16\n\x04NAME\x10\x06\x1a\x0c\xa2\xd4\xe0\xe5\x03\x06\n\x04NAMEB\x06\n\x04\x64\x61ta\"\x8e\x02\n\x16MonitoringInfoTypeUrns\"\xf3\x01\n\x04\x45num\x12\x31\n\x0eSUM_INT64_TYPE\x10\x00\x1a\x1d\xa2\xb4\xfa\xc2\x05\x17\x62\x65\x61m:metrics:sum_int_64\x12\x43\n\x17\x44ISTRIBUTION_INT64_TYPE\x10\x01\x1a&\xa2\xb4\xfa\xc2\x05 beam:metrics:distribution_int_64\x12\x37\n\x11LATEST_INT64_TYPE\x10\x02\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:metrics:latest_int_64\x12:\n\x13LATEST_DOUBLES_TYPE\x10\x03\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:metrics:latest_doubles\"\xf2\x01\n\x06Metric\x12\x46\n\x0c\x63ounter_data\x18\x01 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.CounterDataH\x00\x12P\n\x11\x64istribution_data\x18\x02 \x01(\x0b\x32\x33.org.apache.beam.model.pipeline.v1.DistributionDataH\x00\x12\x46\n\x0c\x65xtrema_data\x18\x03 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.ExtremaDataH\x00\x42\x06\n\x04\x64\x61ta\"]\n\x0b\x43ounterData\x12\x15\n\x0bint64_value\x18\x01 \x01(\x03H\x00\x12\x16\n\x0c\x64ouble_value\x18\x02 \x01(\x01H\x00\x12\x16\n\x0cstring_value\x18\x03 \x01(\tH\x00\x42\x07\n\x05value\"\xbc\x01\n\x0b\x45xtremaData\x12M\n\x10int_extrema_data\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.IntExtremaDataH\x00\x12S\n\x13\x64ouble_extrema_data\x18\x02 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.DoubleExtremaDataH\x00\x42\t\n\x07\x65xtrema\"$\n\x0eIntExtremaData\x12\x12\n\nint_values\x18\x01 \x03(\x03\"*\n\x11\x44oubleExtremaData\x12\x15\n\rdouble_values\x18\x02 \x03(\x01\"\xda\x01\n\x10\x44istributionData\x12W\n\x15int_distribution_data\x18\x01 \x01(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.IntDistributionDataH\x00\x12]\n\x18\x64ouble_distribution_data\x18\x02 \x01(\x0b\x32\x39.org.apache.beam.model.pipeline.v1.DoubleDistributionDataH\x00\x42\x0e\n\x0c\x64istribution\"K\n\x13IntDistributionData\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12\x0b\n\x03sum\x18\x02 \x01(\x03\x12\x0b\n\x03min\x18\x03 \x01(\x03\x12\x0b\n\x03max\x18\x04 \x01(\x03\"N\n\x16\x44oubleDistributionData\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\x12\x0b\n\x03sum\x18\x02 \x01(\x01\x12\x0b\n\x03min\x18\x03 \x01(\x01\x12\x0b\n\x03max\x18\x04 \x01(\x01\"\x8d\x03\n\x13MonitoringTableData\x12\x14\n\x0c\x63olumn_names\x18\x01 \x03(\t\x12V\n\x08row_data\x18\x02 \x03(\x0b\x32\x44.org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringRow\x1a\x98\x01\n\x15MonitoringColumnValue\x12\x15\n\x0bint64_value\x18\x01 \x01(\x03H\x00\x12\x16\n\x0c\x64ouble_value\x18\x02 \x01(\x01H\x00\x12\x16\n\x0cstring_value\x18\x03 \x01(\tH\x00\x12/\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x42\x07\n\x05value\x1am\n\rMonitoringRow\x12\\\n\x06values\x18\x01 \x03(\x0b\x32L.org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringColumnValue:v\n\x0blabel_props\x12!.google.protobuf.EnumValueOptions\x18\xc4\x8a\xdc< \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.MonitoringInfoLabelProps:y\n\x14monitoring_info_spec\x12!.google.protobuf.EnumValueOptions\x18\xfa\xf4\xe4\x62 \x01(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.MonitoringInfoSpecB<\n!org.apache.beam.model.pipeline.v1B\nMetricsApiZ\x0bpipeline_v1b\x06proto3')
+  ,
+  dependencies=[beam__runner__api__pb2.DESCRIPTOR,google_dot_protobuf_dot_descriptor__pb2.DESCRIPTOR,google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,])
+
+
+LABEL_PROPS_FIELD_NUMBER = 127337796
+label_props = _descriptor.FieldDescriptor(
+  name='label_props', full_name='org.apache.beam.model.pipeline.v1.label_props', index=0,
+  number=127337796, type=11, cpp_type=10, label=1,
+  has_default_value=False, default_value=None,
+  message_type=None, enum_type=None, containing_type=None,
+  is_extension=True, extension_scope=None,
+  options=None, file=DESCRIPTOR)
+MONITORING_INFO_SPEC_FIELD_NUMBER = 207174266
+monitoring_info_spec = _descriptor.FieldDescriptor(
+  name='monitoring_info_spec', full_name='org.apache.beam.model.pipeline.v1.monitoring_info_spec', index=1,
+  number=207174266, type=11, cpp_type=10, label=1,
+  has_default_value=False, default_value=None,
+  message_type=None, enum_type=None, containing_type=None,
+  is_extension=True, extension_scope=None,
+  options=None, file=DESCRIPTOR)
+
+_MONITORINGINFOSPECS_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoSpecs.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='USER_COUNTER', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\206\001\n\020beam:metric:user\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"<\n\013description\022-URN utilized to report user numeric counters.')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ELEMENT_COUNT', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\220\001\n\034beam:metric:element_count:v1\022\027beam:metrics:sum_int_64\032\013PCOLLECTION\"J\n\013description\022;The total elements output to a Pcollection by a PTransform.')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SAMPLED_BYTE_SIZE', index=2, number=7,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\254\002\n beam:metric:sampled_byte_size:v1\022 beam:metrics:distribution_int_64\032\013PCOLLECTION\"\330\001\n\013description\022\310\001The total byte size and count of a sampled  set (or all) of elements in the pcollection. Sampling is used  because calculating the byte count involves serializing the  elements which is CPU intensive.')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='START_BUNDLE_MSECS', index=3, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\267\001\n6beam:metric:pardo_execution_time:start_bundle_msecs:v1\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\"X\n\013description\022IThe total estimated execution time of the start bundlefunction in a pardo')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PROCESS_BUNDLE_MSECS', index=4, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\273\001\n8beam:metric:pardo_execution_time:process_bundle_msecs:v1\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\"Z\n\013description\022KThe total estimated execution time of the process bundlefunction in a pardo')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FINISH_BUNDLE_MSECS', index=5, number=4,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\272\001\n7beam:metric:pardo_execution_time:finish_bundle_msecs:v1\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\"Z\n\013description\022KThe total estimated execution time of the finish bundle function in a pardo')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TOTAL_MSECS', index=6, number=5,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\240\001\n4beam:metric:ptransform_execution_time:total_msecs:v1\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\"C\n\013description\0224The total estimated execution time of the ptransform')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='USER_DISTRIBUTION_COUNTER', index=7, number=6,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\241\001\n\035beam:metric:user_distribution\022 beam:metrics:distribution_int_64\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"A\n\013description\0222URN utilized to report user distribution counters.')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WORK_REMAINING', index=8, number=8,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\206\002\n,beam:metric:ptransform_progress:remaining:v1\022\033beam:metrics:latest_doubles\032\nPTRANSFORM\"\254\001\n\013description\022\234\001The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WORK_COMPLETED', index=9, number=9,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\206\002\n,beam:metric:ptransform_progress:completed:v1\022\033beam:metrics:latest_doubles\032\nPTRANSFORM\"\254\001\n\013description\022\234\001The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=356,
+  serialized_end=2674,
+)
+_sym_db.RegisterEnumDescriptor(_MONITORINGINFOSPECS_ENUM)
+
+_MONITORINGINFO_MONITORINGINFOLABELS = _descriptor.EnumDescriptor(
+  name='MonitoringInfoLabels',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.MonitoringInfoLabels',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='TRANSFORM', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\014\n\nPTRANSFORM')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PCOLLECTION', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\r\n\013PCOLLECTION')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WINDOWING_STRATEGY', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\024\n\022WINDOWING_STRATEGY')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CODER', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\007\n\005CODER')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ENVIRONMENT', index=4, number=4,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\r\n\013ENVIRONMENT')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NAMESPACE', index=5, number=5,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\013\n\tNAMESPACE')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NAME', index=6, number=6,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\006\n\004NAME')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=3107,
+  serialized_end=3376,
+)
+_sym_db.RegisterEnumDescriptor(_MONITORINGINFO_MONITORINGINFOLABELS)
+
+_MONITORINGINFOTYPEURNS_ENUM = _descriptor.EnumDescriptor(
+  name='Enum',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoTypeUrns.Enum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='SUM_INT64_TYPE', index=0, number=0,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\027beam:metrics:sum_int_64')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DISTRIBUTION_INT64_TYPE', index=1, number=1,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005 beam:metrics:distribution_int_64')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LATEST_INT64_TYPE', index=2, number=2,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\032beam:metrics:latest_int_64')),
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LATEST_DOUBLES_TYPE', index=3, number=3,
+      options=_descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:metrics:latest_doubles')),
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=3414,
+  serialized_end=3657,
+)
+_sym_db.RegisterEnumDescriptor(_MONITORINGINFOTYPEURNS_ENUM)
+
+
+_MONITORINGINFOSPEC = _descriptor.Descriptor(
+  name='MonitoringInfoSpec',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoSpec',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoSpec.urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type_urn', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoSpec.type_urn', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='required_labels', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoSpec.required_labels', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='annotations', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoSpec.annotations', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=143,
+  serialized_end=287,
+)
+
+
+_ANNOTATION = _descriptor.Descriptor(
+  name='Annotation',
+  full_name='org.apache.beam.model.pipeline.v1.Annotation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.Annotation.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.Annotation.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=289,
+  serialized_end=329,
+)
+
+
+_MONITORINGINFOSPECS = _descriptor.Descriptor(
+  name='MonitoringInfoSpecs',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoSpecs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _MONITORINGINFOSPECS_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=332,
+  serialized_end=2674,
+)
+
+
+_MONITORINGINFOLABELPROPS = _descriptor.Descriptor(
+  name='MonitoringInfoLabelProps',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoLabelProps',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoLabelProps.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2676,
+  serialized_end=2716,
+)
+
+
+_MONITORINGINFO_LABELSENTRY = _descriptor.Descriptor(
+  name='LabelsEntry',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.LabelsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.LabelsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.LabelsEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=_descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001')),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3059,
+  serialized_end=3104,
+)
+
+_MONITORINGINFO = _descriptor.Descriptor(
+  name='MonitoringInfo',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.type', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='monitoring_table_data', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.monitoring_table_data', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='metric', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.metric', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.payload', index=4,
+      number=7, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='labels', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.labels', index=5,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.timestamp', index=6,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_MONITORINGINFO_LABELSENTRY, ],
+  enum_types=[
+    _MONITORINGINFO_MONITORINGINFOLABELS,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='data', full_name='org.apache.beam.model.pipeline.v1.MonitoringInfo.data',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=2719,
+  serialized_end=3384,
+)
+
+
+_MONITORINGINFOTYPEURNS = _descriptor.Descriptor(
+  name='MonitoringInfoTypeUrns',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringInfoTypeUrns',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _MONITORINGINFOTYPEURNS_ENUM,
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3387,
+  serialized_end=3657,
+)
+
+
+_METRIC = _descriptor.Descriptor(
+  name='Metric',
+  full_name='org.apache.beam.model.pipeline.v1.Metric',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='counter_data', full_name='org.apache.beam.model.pipeline.v1.Metric.counter_data', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='distribution_data', full_name='org.apache.beam.model.pipeline.v1.Metric.distribution_data', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='extrema_data', full_name='org.apache.beam.model.pipeline.v1.Metric.extrema_data', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='data', full_name='org.apache.beam.model.pipeline.v1.Metric.data',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=3660,
+  serialized_end=3902,
+)
+
+
+_COUNTERDATA = _descriptor.Descriptor(
+  name='CounterData',
+  full_name='org.apache.beam.model.pipeline.v1.CounterData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='int64_value', full_name='org.apache.beam.model.pipeline.v1.CounterData.int64_value', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='double_value', full_name='org.apache.beam.model.pipeline.v1.CounterData.double_value', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='string_value', full_name='org.apache.beam.model.pipeline.v1.CounterData.string_value', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.CounterData.value',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=3904,
+  serialized_end=3997,
+)
+
+
+_EXTREMADATA = _descriptor.Descriptor(
+  name='ExtremaData',
+  full_name='org.apache.beam.model.pipeline.v1.ExtremaData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='int_extrema_data', full_name='org.apache.beam.model.pipeline.v1.ExtremaData.int_extrema_data', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='double_extrema_data', full_name='org.apache.beam.model.pipeline.v1.ExtremaData.double_extrema_data', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='extrema', full_name='org.apache.beam.model.pipeline.v1.ExtremaData.extrema',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=4000,
+  serialized_end=4188,
+)
+
+
+_INTEXTREMADATA = _descriptor.Descriptor(
+  name='IntExtremaData',
+  full_name='org.apache.beam.model.pipeline.v1.IntExtremaData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='int_values', full_name='org.apache.beam.model.pipeline.v1.IntExtremaData.int_values', index=0,
+      number=1, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4190,
+  serialized_end=4226,
+)
+
+
+_DOUBLEEXTREMADATA = _descriptor.Descriptor(
+  name='DoubleExtremaData',
+  full_name='org.apache.beam.model.pipeline.v1.DoubleExtremaData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='double_values', full_name='org.apache.beam.model.pipeline.v1.DoubleExtremaData.double_values', index=0,
+      number=2, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4228,
+  serialized_end=4270,
+)
+
+
+_DISTRIBUTIONDATA = _descriptor.Descriptor(
+  name='DistributionData',
+  full_name='org.apache.beam.model.pipeline.v1.DistributionData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='int_distribution_data', full_name='org.apache.beam.model.pipeline.v1.DistributionData.int_distribution_data', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='double_distribution_data', full_name='org.apache.beam.model.pipeline.v1.DistributionData.double_distribution_data', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='distribution', full_name='org.apache.beam.model.pipeline.v1.DistributionData.distribution',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=4273,
+  serialized_end=4491,
+)
+
+
+_INTDISTRIBUTIONDATA = _descriptor.Descriptor(
+  name='IntDistributionData',
+  full_name='org.apache.beam.model.pipeline.v1.IntDistributionData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='count', full_name='org.apache.beam.model.pipeline.v1.IntDistributionData.count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sum', full_name='org.apache.beam.model.pipeline.v1.IntDistributionData.sum', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='min', full_name='org.apache.beam.model.pipeline.v1.IntDistributionData.min', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max', full_name='org.apache.beam.model.pipeline.v1.IntDistributionData.max', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4493,
+  serialized_end=4568,
+)
+
+
+_DOUBLEDISTRIBUTIONDATA = _descriptor.Descriptor(
+  name='DoubleDistributionData',
+  full_name='org.apache.beam.model.pipeline.v1.DoubleDistributionData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='count', full_name='org.apache.beam.model.pipeline.v1.DoubleDistributionData.count', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sum', full_name='org.apache.beam.model.pipeline.v1.DoubleDistributionData.sum', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='min', full_name='org.apache.beam.model.pipeline.v1.DoubleDistributionData.min', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max', full_name='org.apache.beam.model.pipeline.v1.DoubleDistributionData.max', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4570,
+  serialized_end=4648,
+)
+
+
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE = _descriptor.Descriptor(
+  name='MonitoringColumnValue',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringColumnValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='int64_value', full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringColumnValue.int64_value', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='double_value', full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringColumnValue.double_value', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='string_value', full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringColumnValue.string_value', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringColumnValue.timestamp', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='value', full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringColumnValue.value',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=4785,
+  serialized_end=4937,
+)
+
+_MONITORINGTABLEDATA_MONITORINGROW = _descriptor.Descriptor(
+  name='MonitoringRow',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringRow',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='values', full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringRow.values', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4939,
+  serialized_end=5048,
+)
+
+_MONITORINGTABLEDATA = _descriptor.Descriptor(
+  name='MonitoringTableData',
+  full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='column_names', full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.column_names', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='row_data', full_name='org.apache.beam.model.pipeline.v1.MonitoringTableData.row_data', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE, _MONITORINGTABLEDATA_MONITORINGROW, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4651,
+  serialized_end=5048,
+)
+
+_MONITORINGINFOSPEC.fields_by_name['annotations'].message_type = _ANNOTATION
+_MONITORINGINFOSPECS_ENUM.containing_type = _MONITORINGINFOSPECS
+_MONITORINGINFO_LABELSENTRY.containing_type = _MONITORINGINFO
+_MONITORINGINFO.fields_by_name['monitoring_table_data'].message_type = _MONITORINGTABLEDATA
+_MONITORINGINFO.fields_by_name['metric'].message_type = _METRIC
+_MONITORINGINFO.fields_by_name['labels'].message_type = _MONITORINGINFO_LABELSENTRY
+_MONITORINGINFO.fields_by_name['timestamp'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_MONITORINGINFO_MONITORINGINFOLABELS.containing_type = _MONITORINGINFO
+_MONITORINGINFO.oneofs_by_name['data'].fields.append(
+  _MONITORINGINFO.fields_by_name['monitoring_table_data'])
+_MONITORINGINFO.fields_by_name['monitoring_table_data'].containing_oneof = _MONITORINGINFO.oneofs_by_name['data']
+_MONITORINGINFO.oneofs_by_name['data'].fields.append(
+  _MONITORINGINFO.fields_by_name['metric'])
+_MONITORINGINFO.fields_by_name['metric'].containing_oneof = _MONITORINGINFO.oneofs_by_name['data']
+_MONITORINGINFO.oneofs_by_name['data'].fields.append(
+  _MONITORINGINFO.fields_by_name['payload'])
+_MONITORINGINFO.fields_by_name['payload'].containing_oneof = _MONITORINGINFO.oneofs_by_name['data']
+_MONITORINGINFOTYPEURNS_ENUM.containing_type = _MONITORINGINFOTYPEURNS
+_METRIC.fields_by_name['counter_data'].message_type = _COUNTERDATA
+_METRIC.fields_by_name['distribution_data'].message_type = _DISTRIBUTIONDATA
+_METRIC.fields_by_name['extrema_data'].message_type = _EXTREMADATA
+_METRIC.oneofs_by_name['data'].fields.append(
+  _METRIC.fields_by_name['counter_data'])
+_METRIC.fields_by_name['counter_data'].containing_oneof = _METRIC.oneofs_by_name['data']
+_METRIC.oneofs_by_name['data'].fields.append(
+  _METRIC.fields_by_name['distribution_data'])
+_METRIC.fields_by_name['distribution_data'].containing_oneof = _METRIC.oneofs_by_name['data']
+_METRIC.oneofs_by_name['data'].fields.append(
+  _METRIC.fields_by_name['extrema_data'])
+_METRIC.fields_by_name['extrema_data'].containing_oneof = _METRIC.oneofs_by_name['data']
+_COUNTERDATA.oneofs_by_name['value'].fields.append(
+  _COUNTERDATA.fields_by_name['int64_value'])
+_COUNTERDATA.fields_by_name['int64_value'].containing_oneof = _COUNTERDATA.oneofs_by_name['value']
+_COUNTERDATA.oneofs_by_name['value'].fields.append(
+  _COUNTERDATA.fields_by_name['double_value'])
+_COUNTERDATA.fields_by_name['double_value'].containing_oneof = _COUNTERDATA.oneofs_by_name['value']
+_COUNTERDATA.oneofs_by_name['value'].fields.append(
+  _COUNTERDATA.fields_by_name['string_value'])
+_COUNTERDATA.fields_by_name['string_value'].containing_oneof = _COUNTERDATA.oneofs_by_name['value']
+_EXTREMADATA.fields_by_name['int_extrema_data'].message_type = _INTEXTREMADATA
+_EXTREMADATA.fields_by_name['double_extrema_data'].message_type = _DOUBLEEXTREMADATA
+_EXTREMADATA.oneofs_by_name['extrema'].fields.append(
+  _EXTREMADATA.fields_by_name['int_extrema_data'])
+_EXTREMADATA.fields_by_name['int_extrema_data'].containing_oneof = _EXTREMADATA.oneofs_by_name['extrema']
+_EXTREMADATA.oneofs_by_name['extrema'].fields.append(
+  _EXTREMADATA.fields_by_name['double_extrema_data'])
+_EXTREMADATA.fields_by_name['double_extrema_data'].containing_oneof = _EXTREMADATA.oneofs_by_name['extrema']
+_DISTRIBUTIONDATA.fields_by_name['int_distribution_data'].message_type = _INTDISTRIBUTIONDATA
+_DISTRIBUTIONDATA.fields_by_name['double_distribution_data'].message_type = _DOUBLEDISTRIBUTIONDATA
+_DISTRIBUTIONDATA.oneofs_by_name['distribution'].fields.append(
+  _DISTRIBUTIONDATA.fields_by_name['int_distribution_data'])
+_DISTRIBUTIONDATA.fields_by_name['int_distribution_data'].containing_oneof = _DISTRIBUTIONDATA.oneofs_by_name['distribution']
+_DISTRIBUTIONDATA.oneofs_by_name['distribution'].fields.append(
+  _DISTRIBUTIONDATA.fields_by_name['double_distribution_data'])
+_DISTRIBUTIONDATA.fields_by_name['double_distribution_data'].containing_oneof = _DISTRIBUTIONDATA.oneofs_by_name['distribution']
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['timestamp'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.containing_type = _MONITORINGTABLEDATA
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.oneofs_by_name['value'].fields.append(
+  _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['int64_value'])
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['int64_value'].containing_oneof = _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.oneofs_by_name['value']
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.oneofs_by_name['value'].fields.append(
+  _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['double_value'])
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['double_value'].containing_oneof = _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.oneofs_by_name['value']
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.oneofs_by_name['value'].fields.append(
+  _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['string_value'])
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['string_value'].containing_oneof = _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.oneofs_by_name['value']
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.oneofs_by_name['value'].fields.append(
+  _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['timestamp'])
+_MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.fields_by_name['timestamp'].containing_oneof = _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE.oneofs_by_name['value']
+_MONITORINGTABLEDATA_MONITORINGROW.fields_by_name['values'].message_type = _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE
+_MONITORINGTABLEDATA_MONITORINGROW.containing_type = _MONITORINGTABLEDATA
+_MONITORINGTABLEDATA.fields_by_name['row_data'].message_type = _MONITORINGTABLEDATA_MONITORINGROW
+DESCRIPTOR.message_types_by_name['MonitoringInfoSpec'] = _MONITORINGINFOSPEC
+DESCRIPTOR.message_types_by_name['Annotation'] = _ANNOTATION
+DESCRIPTOR.message_types_by_name['MonitoringInfoSpecs'] = _MONITORINGINFOSPECS
+DESCRIPTOR.message_types_by_name['MonitoringInfoLabelProps'] = _MONITORINGINFOLABELPROPS
+DESCRIPTOR.message_types_by_name['MonitoringInfo'] = _MONITORINGINFO
+DESCRIPTOR.message_types_by_name['MonitoringInfoTypeUrns'] = _MONITORINGINFOTYPEURNS
+DESCRIPTOR.message_types_by_name['Metric'] = _METRIC
+DESCRIPTOR.message_types_by_name['CounterData'] = _COUNTERDATA
+DESCRIPTOR.message_types_by_name['ExtremaData'] = _EXTREMADATA
+DESCRIPTOR.message_types_by_name['IntExtremaData'] = _INTEXTREMADATA
+DESCRIPTOR.message_types_by_name['DoubleExtremaData'] = _DOUBLEEXTREMADATA
+DESCRIPTOR.message_types_by_name['DistributionData'] = _DISTRIBUTIONDATA
+DESCRIPTOR.message_types_by_name['IntDistributionData'] = _INTDISTRIBUTIONDATA
+DESCRIPTOR.message_types_by_name['DoubleDistributionData'] = _DOUBLEDISTRIBUTIONDATA
+DESCRIPTOR.message_types_by_name['MonitoringTableData'] = _MONITORINGTABLEDATA
+DESCRIPTOR.extensions_by_name['label_props'] = label_props
+DESCRIPTOR.extensions_by_name['monitoring_info_spec'] = monitoring_info_spec
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+MonitoringInfoSpec = _reflection.GeneratedProtocolMessageType('MonitoringInfoSpec', (_message.Message,), dict(
+  DESCRIPTOR = _MONITORINGINFOSPEC,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringInfoSpec)
+  ))
+_sym_db.RegisterMessage(MonitoringInfoSpec)
+
+Annotation = _reflection.GeneratedProtocolMessageType('Annotation', (_message.Message,), dict(
+  DESCRIPTOR = _ANNOTATION,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Annotation)
+  ))
+_sym_db.RegisterMessage(Annotation)
+
+MonitoringInfoSpecs = _reflection.GeneratedProtocolMessageType('MonitoringInfoSpecs', (_message.Message,), dict(
+  DESCRIPTOR = _MONITORINGINFOSPECS,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringInfoSpecs)
+  ))
+_sym_db.RegisterMessage(MonitoringInfoSpecs)
+
+MonitoringInfoLabelProps = _reflection.GeneratedProtocolMessageType('MonitoringInfoLabelProps', (_message.Message,), dict(
+  DESCRIPTOR = _MONITORINGINFOLABELPROPS,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringInfoLabelProps)
+  ))
+_sym_db.RegisterMessage(MonitoringInfoLabelProps)
+
+MonitoringInfo = _reflection.GeneratedProtocolMessageType('MonitoringInfo', (_message.Message,), dict(
+
+  LabelsEntry = _reflection.GeneratedProtocolMessageType('LabelsEntry', (_message.Message,), dict(
+    DESCRIPTOR = _MONITORINGINFO_LABELSENTRY,
+    __module__ = 'metrics_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringInfo.LabelsEntry)
+    ))
+  ,
+  DESCRIPTOR = _MONITORINGINFO,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringInfo)
+  ))
+_sym_db.RegisterMessage(MonitoringInfo)
+_sym_db.RegisterMessage(MonitoringInfo.LabelsEntry)
+
+MonitoringInfoTypeUrns = _reflection.GeneratedProtocolMessageType('MonitoringInfoTypeUrns', (_message.Message,), dict(
+  DESCRIPTOR = _MONITORINGINFOTYPEURNS,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringInfoTypeUrns)
+  ))
+_sym_db.RegisterMessage(MonitoringInfoTypeUrns)
+
+Metric = _reflection.GeneratedProtocolMessageType('Metric', (_message.Message,), dict(
+  DESCRIPTOR = _METRIC,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Metric)
+  ))
+_sym_db.RegisterMessage(Metric)
+
+CounterData = _reflection.GeneratedProtocolMessageType('CounterData', (_message.Message,), dict(
+  DESCRIPTOR = _COUNTERDATA,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.CounterData)
+  ))
+_sym_db.RegisterMessage(CounterData)
+
+ExtremaData = _reflection.GeneratedProtocolMessageType('ExtremaData', (_message.Message,), dict(
+  DESCRIPTOR = _EXTREMADATA,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExtremaData)
+  ))
+_sym_db.RegisterMessage(ExtremaData)
+
+IntExtremaData = _reflection.GeneratedProtocolMessageType('IntExtremaData', (_message.Message,), dict(
+  DESCRIPTOR = _INTEXTREMADATA,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.IntExtremaData)
+  ))
+_sym_db.RegisterMessage(IntExtremaData)
+
+DoubleExtremaData = _reflection.GeneratedProtocolMessageType('DoubleExtremaData', (_message.Message,), dict(
+  DESCRIPTOR = _DOUBLEEXTREMADATA,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.DoubleExtremaData)
+  ))
+_sym_db.RegisterMessage(DoubleExtremaData)
+
+DistributionData = _reflection.GeneratedProtocolMessageType('DistributionData', (_message.Message,), dict(
+  DESCRIPTOR = _DISTRIBUTIONDATA,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.DistributionData)
+  ))
+_sym_db.RegisterMessage(DistributionData)
+
+IntDistributionData = _reflection.GeneratedProtocolMessageType('IntDistributionData', (_message.Message,), dict(
+  DESCRIPTOR = _INTDISTRIBUTIONDATA,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.IntDistributionData)
+  ))
+_sym_db.RegisterMessage(IntDistributionData)
+
+DoubleDistributionData = _reflection.GeneratedProtocolMessageType('DoubleDistributionData', (_message.Message,), dict(
+  DESCRIPTOR = _DOUBLEDISTRIBUTIONDATA,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.DoubleDistributionData)
+  ))
+_sym_db.RegisterMessage(DoubleDistributionData)
+
+MonitoringTableData = _reflection.GeneratedProtocolMessageType('MonitoringTableData', (_message.Message,), dict(
+
+  MonitoringColumnValue = _reflection.GeneratedProtocolMessageType('MonitoringColumnValue', (_message.Message,), dict(
+    DESCRIPTOR = _MONITORINGTABLEDATA_MONITORINGCOLUMNVALUE,
+    __module__ = 'metrics_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringColumnValue)
+    ))
+  ,
+
+  MonitoringRow = _reflection.GeneratedProtocolMessageType('MonitoringRow', (_message.Message,), dict(
+    DESCRIPTOR = _MONITORINGTABLEDATA_MONITORINGROW,
+    __module__ = 'metrics_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringTableData.MonitoringRow)
+    ))
+  ,
+  DESCRIPTOR = _MONITORINGTABLEDATA,
+  __module__ = 'metrics_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MonitoringTableData)
+  ))
+_sym_db.RegisterMessage(MonitoringTableData)
+_sym_db.RegisterMessage(MonitoringTableData.MonitoringColumnValue)
+_sym_db.RegisterMessage(MonitoringTableData.MonitoringRow)
+
+label_props.message_type = _MONITORINGINFOLABELPROPS
+google_dot_protobuf_dot_descriptor__pb2.EnumValueOptions.RegisterExtension(label_props)
+monitoring_info_spec.message_type = _MONITORINGINFOSPEC
+google_dot_protobuf_dot_descriptor__pb2.EnumValueOptions.RegisterExtension(monitoring_info_spec)
+
+DESCRIPTOR.has_options = True
+DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\n!org.apache.beam.model.pipeline.v1B\nMetricsApiZ\013pipeline_v1'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["USER_COUNTER"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["USER_COUNTER"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\206\001\n\020beam:metric:user\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"<\n\013description\022-URN utilized to report user numeric counters.'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["ELEMENT_COUNT"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["ELEMENT_COUNT"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\220\001\n\034beam:metric:element_count:v1\022\027beam:metrics:sum_int_64\032\013PCOLLECTION\"J\n\013description\022;The total elements output to a Pcollection by a PTransform.'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["SAMPLED_BYTE_SIZE"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["SAMPLED_BYTE_SIZE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\254\002\n beam:metric:sampled_byte_size:v1\022 beam:metrics:distribution_int_64\032\013PCOLLECTION\"\330\001\n\013description\022\310\001The total byte size and count of a sampled  set (or all) of elements in the pcollection. Sampling is used  because calculating the byte count involves serializing the  elements which is CPU intensive.'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["START_BUNDLE_MSECS"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["START_BUNDLE_MSECS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\267\001\n6beam:metric:pardo_execution_time:start_bundle_msecs:v1\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\"X\n\013description\022IThe total estimated execution time of the start bundlefunction in a pardo'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["PROCESS_BUNDLE_MSECS"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["PROCESS_BUNDLE_MSECS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\273\001\n8beam:metric:pardo_execution_time:process_bundle_msecs:v1\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\"Z\n\013description\022KThe total estimated execution time of the process bundlefunction in a pardo'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["FINISH_BUNDLE_MSECS"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["FINISH_BUNDLE_MSECS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\272\001\n7beam:metric:pardo_execution_time:finish_bundle_msecs:v1\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\"Z\n\013description\022KThe total estimated execution time of the finish bundle function in a pardo'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["TOTAL_MSECS"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["TOTAL_MSECS"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\240\001\n4beam:metric:ptransform_execution_time:total_msecs:v1\022\027beam:metrics:sum_int_64\032\nPTRANSFORM\"C\n\013description\0224The total estimated execution time of the ptransform'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["USER_DISTRIBUTION_COUNTER"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["USER_DISTRIBUTION_COUNTER"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\241\001\n\035beam:metric:user_distribution\022 beam:metrics:distribution_int_64\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"A\n\013description\0222URN utilized to report user distribution counters.'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["WORK_REMAINING"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["WORK_REMAINING"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\206\002\n,beam:metric:ptransform_progress:remaining:v1\022\033beam:metrics:latest_doubles\032\nPTRANSFORM\"\254\001\n\013description\022\234\001The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.'))
+_MONITORINGINFOSPECS_ENUM.values_by_name["WORK_COMPLETED"].has_options = True
+_MONITORINGINFOSPECS_ENUM.values_by_name["WORK_COMPLETED"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\322\247\247\226\006\206\002\n,beam:metric:ptransform_progress:completed:v1\022\033beam:metrics:latest_doubles\032\nPTRANSFORM\"\254\001\n\013description\022\234\001The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.'))
+_MONITORINGINFO_LABELSENTRY.has_options = True
+_MONITORINGINFO_LABELSENTRY._options = _descriptor._ParseOptions(descriptor_pb2.MessageOptions(), _b('8\001'))
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["TRANSFORM"].has_options = True
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["TRANSFORM"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\014\n\nPTRANSFORM'))
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["PCOLLECTION"].has_options = True
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["PCOLLECTION"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\r\n\013PCOLLECTION'))
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["WINDOWING_STRATEGY"].has_options = True
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["WINDOWING_STRATEGY"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\024\n\022WINDOWING_STRATEGY'))
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["CODER"].has_options = True
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["CODER"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\007\n\005CODER'))
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["ENVIRONMENT"].has_options = True
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["ENVIRONMENT"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\r\n\013ENVIRONMENT'))
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["NAMESPACE"].has_options = True
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["NAMESPACE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\013\n\tNAMESPACE'))
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["NAME"].has_options = True
+_MONITORINGINFO_MONITORINGINFOLABELS.values_by_name["NAME"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\324\340\345\003\006\n\004NAME'))
+_MONITORINGINFOTYPEURNS_ENUM.values_by_name["SUM_INT64_TYPE"].has_options = True
+_MONITORINGINFOTYPEURNS_ENUM.values_by_name["SUM_INT64_TYPE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\027beam:metrics:sum_int_64'))
+_MONITORINGINFOTYPEURNS_ENUM.values_by_name["DISTRIBUTION_INT64_TYPE"].has_options = True
+_MONITORINGINFOTYPEURNS_ENUM.values_by_name["DISTRIBUTION_INT64_TYPE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005 beam:metrics:distribution_int_64'))
+_MONITORINGINFOTYPEURNS_ENUM.values_by_name["LATEST_INT64_TYPE"].has_options = True
+_MONITORINGINFOTYPEURNS_ENUM.values_by_name["LATEST_INT64_TYPE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\032beam:metrics:latest_int_64'))
+_MONITORINGINFOTYPEURNS_ENUM.values_by_name["LATEST_DOUBLES_TYPE"].has_options = True
+_MONITORINGINFOTYPEURNS_ENUM.values_by_name["LATEST_DOUBLES_TYPE"]._options = _descriptor._ParseOptions(descriptor_pb2.EnumValueOptions(), _b('\242\264\372\302\005\033beam:metrics:latest_doubles'))
+# @@protoc_insertion_point(module_scope)
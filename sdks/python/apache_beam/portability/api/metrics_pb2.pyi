@@ -0,0 +1,598 @@
+# @generated by generate_proto_mypy_stubs.py.  Do not edit!
+import sys
+from google.protobuf.descriptor import (
+    Descriptor as google___protobuf___descriptor___Descriptor,
+    EnumDescriptor as google___protobuf___descriptor___EnumDescriptor,
+    FieldDescriptor as google___protobuf___descriptor___FieldDescriptor,
+)
+
+from google.protobuf.internal.containers import (
+    RepeatedCompositeFieldContainer as google___protobuf___internal___containers___RepeatedCompositeFieldContainer,
+    RepeatedScalarFieldContainer as google___protobuf___internal___containers___RepeatedScalarFieldContainer,
+)
+
+from google.protobuf.message import (
+    Message as google___protobuf___message___Message,
+)
+
+from google.protobuf.timestamp_pb2 import (
+    Timestamp as google___protobuf___timestamp_pb2___Timestamp,
+)
+
+from typing import (
+    Iterable as typing___Iterable,
+    List as typing___List,
+    Mapping as typing___Mapping,
+    MutableMapping as typing___MutableMapping,
+    Optional as typing___Optional,
+    Text as typing___Text,
+    Tuple as typing___Tuple,
+    Union as typing___Union,
+    cast as typing___cast,
+)
+
+from typing_extensions import (
+    Literal as typing_extensions___Literal,
+)
+
+
+builtin___bool = bool
+builtin___bytes = bytes
+builtin___float = float
+builtin___int = int
+builtin___str = str
+if sys.version_info < (3,):
+    builtin___buffer = buffer
+    builtin___unicode = unicode
+
+
+class MonitoringInfoSpec(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    urn = ... # type: typing___Text
+    type_urn = ... # type: typing___Text
+    required_labels = ... # type: google___protobuf___internal___containers___RepeatedScalarFieldContainer[typing___Text]
+
+    @property
+    def annotations(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Annotation]: ...
+
+    def __init__(self,
+        *,
+        urn : typing___Optional[typing___Text] = None,
+        type_urn : typing___Optional[typing___Text] = None,
+        required_labels : typing___Optional[typing___Iterable[typing___Text]] = None,
+        annotations : typing___Optional[typing___Iterable[Annotation]] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> MonitoringInfoSpec: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringInfoSpec: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"annotations",u"required_labels",u"type_urn",u"urn"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"annotations",b"annotations",u"required_labels",b"required_labels",u"type_urn",b"type_urn",u"urn",b"urn"]) -> None: ...
+
+class Annotation(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    key = ... # type: typing___Text
+    value = ... # type: typing___Text
+
+    def __init__(self,
+        *,
+        key : typing___Optional[typing___Text] = None,
+        value : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> Annotation: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> Annotation: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"key",u"value"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
+
+class MonitoringInfoSpecs(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Enum(builtin___int):
+        DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+        @classmethod
+        def Name(cls, number: builtin___int) -> builtin___str: ...
+        @classmethod
+        def Value(cls, name: builtin___str) -> 'MonitoringInfoSpecs.Enum': ...
+        @classmethod
+        def keys(cls) -> typing___List[builtin___str]: ...
+        @classmethod
+        def values(cls) -> typing___List['MonitoringInfoSpecs.Enum']: ...
+        @classmethod
+        def items(cls) -> typing___List[typing___Tuple[builtin___str, 'MonitoringInfoSpecs.Enum']]: ...
+        USER_COUNTER = typing___cast('MonitoringInfoSpecs.Enum', 0)
+        ELEMENT_COUNT = typing___cast('MonitoringInfoSpecs.Enum', 1)
+        SAMPLED_BYTE_SIZE = typing___cast('MonitoringInfoSpecs.Enum', 7)
+        START_BUNDLE_MSECS = typing___cast('MonitoringInfoSpecs.Enum', 2)
+        PROCESS_BUNDLE_MSECS = typing___cast('MonitoringInfoSpecs.Enum', 3)
+        FINISH_BUNDLE_MSECS = typing___cast('MonitoringInfoSpecs.Enum', 4)
+        TOTAL_MSECS = typing___cast('MonitoringInfoSpecs.Enum', 5)
+        USER_DISTRIBUTION_COUNTER = typing___cast('MonitoringInfoSpecs.Enum', 6)
+        WORK_REMAINING = typing___cast('MonitoringInfoSpecs.Enum', 8)
+        WORK_COMPLETED = typing___cast('MonitoringInfoSpecs.Enum', 9)
+    USER_COUNTER = typing___cast('MonitoringInfoSpecs.Enum', 0)
+    ELEMENT_COUNT = typing___cast('MonitoringInfoSpecs.Enum', 1)
+    SAMPLED_BYTE_SIZE = typing___cast('MonitoringInfoSpecs.Enum', 7)
+    START_BUNDLE_MSECS = typing___cast('MonitoringInfoSpecs.Enum', 2)
+    PROCESS_BUNDLE_MSECS = typing___cast('MonitoringInfoSpecs.Enum', 3)
+    FINISH_BUNDLE_MSECS = typing___cast('MonitoringInfoSpecs.Enum', 4)
+    TOTAL_MSECS = typing___cast('MonitoringInfoSpecs.Enum', 5)
+    USER_DISTRIBUTION_COUNTER = typing___cast('MonitoringInfoSpecs.Enum', 6)
+    WORK_REMAINING = typing___cast('MonitoringInfoSpecs.Enum', 8)
+    WORK_COMPLETED = typing___cast('MonitoringInfoSpecs.Enum', 9)
+
+
+    def __init__(self,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> MonitoringInfoSpecs: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringInfoSpecs: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class MonitoringInfoLabelProps(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    name = ... # type: typing___Text
+
+    def __init__(self,
+        *,
+        name : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> MonitoringInfoLabelProps: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringInfoLabelProps: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"name"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"name",b"name"]) -> None: ...
+
+class MonitoringInfo(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class MonitoringInfoLabels(builtin___int):
+        DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+        @classmethod
+        def Name(cls, number: builtin___int) -> builtin___str: ...
+        @classmethod
+        def Value(cls, name: builtin___str) -> 'MonitoringInfo.MonitoringInfoLabels': ...
+        @classmethod
+        def keys(cls) -> typing___List[builtin___str]: ...
+        @classmethod
+        def values(cls) -> typing___List['MonitoringInfo.MonitoringInfoLabels']: ...
+        @classmethod
+        def items(cls) -> typing___List[typing___Tuple[builtin___str, 'MonitoringInfo.MonitoringInfoLabels']]: ...
+        TRANSFORM = typing___cast('MonitoringInfo.MonitoringInfoLabels', 0)
+        PCOLLECTION = typing___cast('MonitoringInfo.MonitoringInfoLabels', 1)
+        WINDOWING_STRATEGY = typing___cast('MonitoringInfo.MonitoringInfoLabels', 2)
+        CODER = typing___cast('MonitoringInfo.MonitoringInfoLabels', 3)
+        ENVIRONMENT = typing___cast('MonitoringInfo.MonitoringInfoLabels', 4)
+        NAMESPACE = typing___cast('MonitoringInfo.MonitoringInfoLabels', 5)
+        NAME = typing___cast('MonitoringInfo.MonitoringInfoLabels', 6)
+    TRANSFORM = typing___cast('MonitoringInfo.MonitoringInfoLabels', 0)
+    PCOLLECTION = typing___cast('MonitoringInfo.MonitoringInfoLabels', 1)
+    WINDOWING_STRATEGY = typing___cast('MonitoringInfo.MonitoringInfoLabels', 2)
+    CODER = typing___cast('MonitoringInfo.MonitoringInfoLabels', 3)
+    ENVIRONMENT = typing___cast('MonitoringInfo.MonitoringInfoLabels', 4)
+    NAMESPACE = typing___cast('MonitoringInfo.MonitoringInfoLabels', 5)
+    NAME = typing___cast('MonitoringInfo.MonitoringInfoLabels', 6)
+
+    class LabelsEntry(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        key = ... # type: typing___Text
+        value = ... # type: typing___Text
+
+        def __init__(self,
+            *,
+            key : typing___Optional[typing___Text] = None,
+            value : typing___Optional[typing___Text] = None,
+            ) -> None: ...
+        if sys.version_info >= (3,):
+            @classmethod
+            def FromString(cls, s: builtin___bytes) -> MonitoringInfo.LabelsEntry: ...
+        else:
+            @classmethod
+            def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringInfo.LabelsEntry: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",u"value"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
+
+    urn = ... # type: typing___Text
+    type = ... # type: typing___Text
+    payload = ... # type: builtin___bytes
+
+    @property
+    def monitoring_table_data(self) -> MonitoringTableData: ...
+
+    @property
+    def metric(self) -> Metric: ...
+
+    @property
+    def labels(self) -> typing___MutableMapping[typing___Text, typing___Text]: ...
+
+    @property
+    def timestamp(self) -> google___protobuf___timestamp_pb2___Timestamp: ...
+
+    def __init__(self,
+        *,
+        urn : typing___Optional[typing___Text] = None,
+        type : typing___Optional[typing___Text] = None,
+        monitoring_table_data : typing___Optional[MonitoringTableData] = None,
+        metric : typing___Optional[Metric] = None,
+        payload : typing___Optional[builtin___bytes] = None,
+        labels : typing___Optional[typing___Mapping[typing___Text, typing___Text]] = None,
+        timestamp : typing___Optional[google___protobuf___timestamp_pb2___Timestamp] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> MonitoringInfo: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringInfo: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"data",u"metric",u"monitoring_table_data",u"payload",u"timestamp"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"data",u"labels",u"metric",u"monitoring_table_data",u"payload",u"timestamp",u"type",u"urn"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"data",b"data",u"metric",b"metric",u"monitoring_table_data",b"monitoring_table_data",u"payload",b"payload",u"timestamp",b"timestamp"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"data",b"data",u"labels",b"labels",u"metric",b"metric",u"monitoring_table_data",b"monitoring_table_data",u"payload",b"payload",u"timestamp",b"timestamp",u"type",b"type",u"urn",b"urn"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"data",b"data"]) -> typing_extensions___Literal["monitoring_table_data","metric","payload"]: ...
+
+class MonitoringInfoTypeUrns(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Enum(builtin___int):
+        DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+        @classmethod
+        def Name(cls, number: builtin___int) -> builtin___str: ...
+        @classmethod
+        def Value(cls, name: builtin___str) -> 'MonitoringInfoTypeUrns.Enum': ...
+        @classmethod
+        def keys(cls) -> typing___List[builtin___str]: ...
+        @classmethod
+        def values(cls) -> typing___List['MonitoringInfoTypeUrns.Enum']: ...
+        @classmethod
+        def items(cls) -> typing___List[typing___Tuple[builtin___str, 'MonitoringInfoTypeUrns.Enum']]: ...
+        SUM_INT64_TYPE = typing___cast('MonitoringInfoTypeUrns.Enum', 0)
+        DISTRIBUTION_INT64_TYPE = typing___cast('MonitoringInfoTypeUrns.Enum', 1)
+        LATEST_INT64_TYPE = typing___cast('MonitoringInfoTypeUrns.Enum', 2)
+        LATEST_DOUBLES_TYPE = typing___cast('MonitoringInfoTypeUrns.Enum', 3)
+    SUM_INT64_TYPE = typing___cast('MonitoringInfoTypeUrns.Enum', 0)
+    DISTRIBUTION_INT64_TYPE = typing___cast('MonitoringInfoTypeUrns.Enum', 1)
+    LATEST_INT64_TYPE = typing___cast('MonitoringInfoTypeUrns.Enum', 2)
+    LATEST_DOUBLES_TYPE = typing___cast('MonitoringInfoTypeUrns.Enum', 3)
+
+
+    def __init__(self,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> MonitoringInfoTypeUrns: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringInfoTypeUrns: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class Metric(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def counter_data(self) -> CounterData: ...
+
+    @property
+    def distribution_data(self) -> DistributionData: ...
+
+    @property
+    def extrema_data(self) -> ExtremaData: ...
+
+    def __init__(self,
+        *,
+        counter_data : typing___Optional[CounterData] = None,
+        distribution_data : typing___Optional[DistributionData] = None,
+        extrema_data : typing___Optional[ExtremaData] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> Metric: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> Metric: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"counter_data",u"data",u"distribution_data",u"extrema_data"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"counter_data",u"data",u"distribution_data",u"extrema_data"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"counter_data",b"counter_data",u"data",b"data",u"distribution_data",b"distribution_data",u"extrema_data",b"extrema_data"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"counter_data",b"counter_data",u"data",b"data",u"distribution_data",b"distribution_data",u"extrema_data",b"extrema_data"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"data",b"data"]) -> typing_extensions___Literal["counter_data","distribution_data","extrema_data"]: ...
+
+class CounterData(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    int64_value = ... # type: builtin___int
+    double_value = ... # type: builtin___float
+    string_value = ... # type: typing___Text
+
+    def __init__(self,
+        *,
+        int64_value : typing___Optional[builtin___int] = None,
+        double_value : typing___Optional[builtin___float] = None,
+        string_value : typing___Optional[typing___Text] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> CounterData: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> CounterData: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"double_value",u"int64_value",u"string_value",u"value"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"double_value",u"int64_value",u"string_value",u"value"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"double_value",b"double_value",u"int64_value",b"int64_value",u"string_value",b"string_value",u"value",b"value"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"double_value",b"double_value",u"int64_value",b"int64_value",u"string_value",b"string_value",u"value",b"value"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"value",b"value"]) -> typing_extensions___Literal["int64_value","double_value","string_value"]: ...
+
+class ExtremaData(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def int_extrema_data(self) -> IntExtremaData: ...
+
+    @property
+    def double_extrema_data(self) -> DoubleExtremaData: ...
+
+    def __init__(self,
+        *,
+        int_extrema_data : typing___Optional[IntExtremaData] = None,
+        double_extrema_data : typing___Optional[DoubleExtremaData] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> ExtremaData: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ExtremaData: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"double_extrema_data",u"extrema",u"int_extrema_data"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"double_extrema_data",u"extrema",u"int_extrema_data"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"double_extrema_data",b"double_extrema_data",u"extrema",b"extrema",u"int_extrema_data",b"int_extrema_data"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"double_extrema_data",b"double_extrema_data",u"extrema",b"extrema",u"int_extrema_data",b"int_extrema_data"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"extrema",b"extrema"]) -> typing_extensions___Literal["int_extrema_data","double_extrema_data"]: ...
+
+class IntExtremaData(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    int_values = ... # type: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___int]
+
+    def __init__(self,
+        *,
+        int_values : typing___Optional[typing___Iterable[builtin___int]] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> IntExtremaData: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> IntExtremaData: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"int_values"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"int_values",b"int_values"]) -> None: ...
+
+class DoubleExtremaData(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    double_values = ... # type: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float]
+
+    def __init__(self,
+        *,
+        double_values : typing___Optional[typing___Iterable[builtin___float]] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> DoubleExtremaData: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> DoubleExtremaData: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"double_values"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"double_values",b"double_values"]) -> None: ...
+
+class DistributionData(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def int_distribution_data(self) -> IntDistributionData: ...
+
+    @property
+    def double_distribution_data(self) -> DoubleDistributionData: ...
+
+    def __init__(self,
+        *,
+        int_distribution_data : typing___Optional[IntDistributionData] = None,
+        double_distribution_data : typing___Optional[DoubleDistributionData] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> DistributionData: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> DistributionData: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"distribution",u"double_distribution_data",u"int_distribution_data"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"distribution",u"double_distribution_data",u"int_distribution_data"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"distribution",b"distribution",u"double_distribution_data",b"double_distribution_data",u"int_distribution_data",b"int_distribution_data"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"distribution",b"distribution",u"double_distribution_data",b"double_distribution_data",u"int_distribution_data",b"int_distribution_data"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"distribution",b"distribution"]) -> typing_extensions___Literal["int_distribution_data","double_distribution_data"]: ...
+
+class IntDistributionData(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    count = ... # type: builtin___int
+    sum = ... # type: builtin___int
+    min = ... # type: builtin___int
+    max = ... # type: builtin___int
+
+    def __init__(self,
+        *,
+        count : typing___Optional[builtin___int] = None,
+        sum : typing___Optional[builtin___int] = None,
+        min : typing___Optional[builtin___int] = None,
+        max : typing___Optional[builtin___int] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> IntDistributionData: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> IntDistributionData: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"count",u"max",u"min",u"sum"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"count",b"count",u"max",b"max",u"min",b"min",u"sum",b"sum"]) -> None: ...
+
+class DoubleDistributionData(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    count = ... # type: builtin___int
+    sum = ... # type: builtin___float
+    min = ... # type: builtin___float
+    max = ... # type: builtin___float
+
+    def __init__(self,
+        *,
+        count : typing___Optional[builtin___int] = None,
+        sum : typing___Optional[builtin___float] = None,
+        min : typing___Optional[builtin___float] = None,
+        max : typing___Optional[builtin___float] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> DoubleDistributionData: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> DoubleDistributionData: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"count",u"max",u"min",u"sum"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"count",b"count",u"max",b"max",u"min",b"min",u"sum",b"sum"]) -> None: ...
+
+class MonitoringTableData(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class MonitoringColumnValue(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        int64_value = ... # type: builtin___int
+        double_value = ... # type: builtin___float
+        string_value = ... # type: typing___Text
+
+        @property
+        def timestamp(self) -> google___protobuf___timestamp_pb2___Timestamp: ...
+
+        def __init__(self,
+            *,
+            int64_value : typing___Optional[builtin___int] = None,
+            double_value : typing___Optional[builtin___float] = None,
+            string_value : typing___Optional[typing___Text] = None,
+            timestamp : typing___Optional[google___protobuf___timestamp_pb2___Timestamp] = None,
+            ) -> None: ...
+        if sys.version_info >= (3,):
+            @classmethod
+            def FromString(cls, s: builtin___bytes) -> MonitoringTableData.MonitoringColumnValue: ...
+        else:
+            @classmethod
+            def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringTableData.MonitoringColumnValue: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"double_value",u"int64_value",u"string_value",u"timestamp",u"value"]) -> builtin___bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"double_value",u"int64_value",u"string_value",u"timestamp",u"value"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"double_value",b"double_value",u"int64_value",b"int64_value",u"string_value",b"string_value",u"timestamp",b"timestamp",u"value",b"value"]) -> builtin___bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"double_value",b"double_value",u"int64_value",b"int64_value",u"string_value",b"string_value",u"timestamp",b"timestamp",u"value",b"value"]) -> None: ...
+        def WhichOneof(self, oneof_group: typing_extensions___Literal[u"value",b"value"]) -> typing_extensions___Literal["int64_value","double_value","string_value","timestamp"]: ...
+
+    class MonitoringRow(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def values(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[MonitoringTableData.MonitoringColumnValue]: ...
+
+        def __init__(self,
+            *,
+            values : typing___Optional[typing___Iterable[MonitoringTableData.MonitoringColumnValue]] = None,
+            ) -> None: ...
+        if sys.version_info >= (3,):
+            @classmethod
+            def FromString(cls, s: builtin___bytes) -> MonitoringTableData.MonitoringRow: ...
+        else:
+            @classmethod
+            def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringTableData.MonitoringRow: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"values"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"values",b"values"]) -> None: ...
+
+    column_names = ... # type: google___protobuf___internal___containers___RepeatedScalarFieldContainer[typing___Text]
+
+    @property
+    def row_data(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[MonitoringTableData.MonitoringRow]: ...
+
+    def __init__(self,
+        *,
+        column_names : typing___Optional[typing___Iterable[typing___Text]] = None,
+        row_data : typing___Optional[typing___Iterable[MonitoringTableData.MonitoringRow]] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> MonitoringTableData: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> MonitoringTableData: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"column_names",u"row_data"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"column_names",b"column_names",u"row_data",b"row_data"]) -> None: ...
+
+label_props = ... # type: google___protobuf___descriptor___FieldDescriptor
+
+monitoring_info_spec = ... # type: google___protobuf___descriptor___FieldDescriptor
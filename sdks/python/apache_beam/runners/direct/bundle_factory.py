@@ -30,6 +30,7 @@ from typing import cast
 
 from apache_beam import pvalue
 from apache_beam.runners import common
+from apache_beam.utils.timestamp import MAX_TIMESTAMP
 from apache_beam.utils.windowed_value import WindowedValue
 
 
@@ -130,6 +131,10 @@ class _Bundle(common.Receiver):
     self._stacked = stacked
     self._committed = False
     self._tag = None  # optional tag information for this bundle
+    # Tracked as elements are added, so that watermark refreshes and executors
+    # do not need to iterate over the elements of pending bundles.
+    self._min_timestamp = MAX_TIMESTAMP
+    self._latest_window = None
 
   def get_elements_iterable(self, make_copy=False):
     # type: (bool) -> Iterable[WindowedValue]
@@ -167,6 +172,22 @@ class _Bundle(common.Receiver):
   def has_elements(self):
     return len(self._elements) > 0
 
+  @property
+  def min_timestamp(self):
+    """The minimum timestamp of the elements of this bundle.
+
+    Returns MAX_TIMESTAMP if the bundle has no elements.
+    """
+    return self._min_timestamp
+
+  @property
+  def latest_window(self):
+    """The window with the latest end among the elements' first windows.
+
+    Returns None if the bundle has no elements.
+    """
+    return self._latest_window
+
   @property
   def tag(self):
     return self._tag
@@ -188,6 +209,11 @@ class _Bundle(common.Receiver):
       element: WindowedValue
     """
     assert not self._committed
+    if element.timestamp < self._min_timestamp:
+      self._min_timestamp = element.timestamp
+    if element.windows and (self._latest_window is None or
+                            element.windows[0].end > self._latest_window.end):
+      self._latest_window = element.windows[0]
     if not self._stacked:
       self._elements.append(element)
       return
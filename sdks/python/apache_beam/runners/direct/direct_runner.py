@@ -27,7 +27,6 @@ from __future__ import absolute_import
 
 import itertools
 import logging
-import time
 import typing
 
 from google.protobuf import wrappers_pb2
@@ -35,6 +34,7 @@ from google.protobuf import wrappers_pb2
 import apache_beam as beam
 from apache_beam import coders
 from apache_beam import typehints
+from apache_beam.internal import pickler
 from apache_beam.internal.util import ArgumentPlaceholder
 from apache_beam.options.pipeline_options import DirectOptions
 from apache_beam.options.pipeline_options import StandardOptions
@@ -48,7 +48,6 @@ from apache_beam.runners.runner import PipelineRunner
 from apache_beam.runners.runner import PipelineState
 from apache_beam.transforms.core import CombinePerKey
 from apache_beam.transforms.core import CombineValuesDoFn
-from apache_beam.transforms.core import DoFn
 from apache_beam.transforms.core import ParDo
 from apache_beam.transforms.core import _GroupAlsoByWindow
 from apache_beam.transforms.core import _GroupAlsoByWindowDoFn
@@ -172,6 +171,34 @@ class _StreamingGroupAlsoByWindow(_GroupAlsoByWindow):
         context.windowing_strategies.get_by_id(payload.value))
 
 
+@typehints.with_input_types(typing.Tuple[K, typing.Iterable[V]])
+@typehints.with_output_types(typing.Tuple[K, typing.Any])
+class _StreamingCombineAlsoByWindow(_StreamingGroupAlsoByWindow):
+  """Streaming GroupAlsoByWindow placeholder for overriding in DirectRunner,
+  which combines the values of each pane with a CombineFn."""
+  urn = "direct_runner:streaming_cabw:v0.1"
+
+  def __init__(self, windowing, combine_fn):
+    super(_StreamingCombineAlsoByWindow, self).__init__(windowing)
+    self.combine_fn = combine_fn
+
+  # These are needed due to apply overloads.
+  def to_runner_api_parameter(self, context):
+    return (
+        _StreamingCombineAlsoByWindow.urn,
+        wrappers_pb2.BytesValue(
+            value=pickler.dumps((
+                context.windowing_strategies.get_id(self.windowing),
+                self.combine_fn))))
+
+  @staticmethod
+  @PTransform.register_urn(urn, wrappers_pb2.BytesValue)
+  def from_runner_api_parameter(unused_ptransform, payload, context):
+    windowing_id, combine_fn = pickler.loads(payload.value)
+    return _StreamingCombineAlsoByWindow(
+        context.windowing_strategies.get_by_id(windowing_id), combine_fn)
+
+
 def _get_transform_overrides(pipeline_options):
   # A list of PTransformOverride objects to be applied before running a pipeline
   # using DirectRunner.
@@ -182,6 +209,7 @@ def _get_transform_overrides(pipeline_options):
   # Importing following locally to avoid a circular dependency.
   from apache_beam.pipeline import PTransformOverride
   from apache_beam.runners.direct.helper_transforms import LiftedCombinePerKey
+  from apache_beam.runners.direct.helper_transforms import StreamingCombinePerKey
   from apache_beam.runners.direct.sdf_direct_runner import ProcessKeyedElementsViaKeyedWorkItemsOverride
   from apache_beam.runners.direct.sdf_direct_runner import SplittableParDoOverride
 
@@ -200,6 +228,19 @@ def _get_transform_overrides(pipeline_options):
       except NotImplementedError:
         return transform
 
+  class StreamingCombinePerKeyOverride(PTransformOverride):
+    def matches(self, applied_ptransform):
+      # Combining with default windowing is lifted by CombinePerKeyOverride.
+      if isinstance(applied_ptransform.transform, CombinePerKey):
+        return not applied_ptransform.inputs[0].windowing.is_default()
+
+    def get_replacement_transform(self, transform):
+      try:
+        return StreamingCombinePerKey(
+            transform.fn, transform.args, transform.kwargs)
+      except NotImplementedError:
+        return transform
+
   class StreamingGroupByKeyOverride(PTransformOverride):
     def matches(self, applied_ptransform):
       # Note: we match the exact class, since we replace it with a subclass.
@@ -212,12 +253,12 @@ def _get_transform_overrides(pipeline_options):
 
   class StreamingGroupAlsoByWindowOverride(PTransformOverride):
     def matches(self, applied_ptransform):
-      # Note: we match the exact class, since we replace it with a subclass.
+      # Note: we don't match the streaming subclasses we replace it with.
       transform = applied_ptransform.transform
       return (
           isinstance(applied_ptransform.transform, ParDo) and
           isinstance(transform.dofn, _GroupAlsoByWindowDoFn) and
-          transform.__class__ != _StreamingGroupAlsoByWindow)
+          not isinstance(transform, _StreamingGroupAlsoByWindow))
 
     def get_replacement_transform(self, transform):
       # Use specialized streaming implementation.
@@ -243,6 +284,7 @@ def _get_transform_overrides(pipeline_options):
 
   # Add streaming overrides, if necessary.
   if pipeline_options.view_as(StandardOptions).streaming:
+    overrides.append(StreamingCombinePerKeyOverride())
     overrides.append(StreamingGroupByKeyOverride())
     overrides.append(StreamingGroupAlsoByWindowOverride())
 
@@ -273,58 +315,6 @@ class _DirectReadFromPubSub(PTransform):
     return PCollection(self.pipeline, is_bounded=self._source.is_bounded())
 
 
-class _DirectWriteToPubSubFn(DoFn):
-  BUFFER_SIZE_ELEMENTS = 100
-  FLUSH_TIMEOUT_SECS = BUFFER_SIZE_ELEMENTS * 0.5
-
-  def __init__(self, sink):
-    self.project = sink.project
-    self.short_topic_name = sink.topic_name
-    self.id_label = sink.id_label
-    self.timestamp_attribute = sink.timestamp_attribute
-    self.with_attributes = sink.with_attributes
-
-    # TODO(BEAM-4275): Add support for id_label and timestamp_attribute.
-    if sink.id_label:
-      raise NotImplementedError(
-          'DirectRunner: id_label is not supported for '
-          'PubSub writes')
-    if sink.timestamp_attribute:
-      raise NotImplementedError(
-          'DirectRunner: timestamp_attribute is not '
-          'supported for PubSub writes')
-
-  def start_bundle(self):
-    self._buffer = []
-
-  def process(self, elem):
-    self._buffer.append(elem)
-    if len(self._buffer) >= self.BUFFER_SIZE_ELEMENTS:
-      self._flush()
-
-  def finish_bundle(self):
-    self._flush()
-
-  def _flush(self):
-    from google.cloud import pubsub
-    pub_client = pubsub.PublisherClient()
-    topic = pub_client.topic_path(self.project, self.short_topic_name)
-
-    if self.with_attributes:
-      futures = [
-          pub_client.publish(topic, elem.data, **elem.attributes)
-          for elem in self._buffer
-      ]
-    else:
-      futures = [pub_client.publish(topic, elem) for elem in self._buffer]
-
-    timer_start = time.time()
-    for future in futures:
-      remaining = self.FLUSH_TIMEOUT_SECS - (time.time() - timer_start)
-      future.result(remaining)
-    self._buffer = []
-
-
 def _get_pubsub_transform_overrides(pipeline_options):
   from apache_beam.io.gcp import pubsub as beam_pubsub
   from apache_beam.pipeline import PTransformOverride
@@ -352,7 +342,9 @@ def _get_pubsub_transform_overrides(pipeline_options):
         raise Exception(
             'PubSub I/O is only available in streaming mode '
             '(use the --streaming flag).')
-      return beam.ParDo(_DirectWriteToPubSubFn(transform._sink))
+      return beam.ParDo(
+          beam_pubsub._PubSubWriteDoFn(
+              transform._sink, **transform._publish_settings))
 
   return [ReadFromPubSubOverride(), WriteToPubSubOverride()]
 
@@ -24,6 +24,7 @@ import unittest
 from collections import defaultdict
 
 import hamcrest as hc
+import mock
 
 import apache_beam as beam
 from apache_beam.metrics.cells import DistributionData
@@ -32,16 +33,26 @@ from apache_beam.metrics.execution import MetricKey
 from apache_beam.metrics.execution import MetricResult
 from apache_beam.metrics.metric import Metrics
 from apache_beam.metrics.metricbase import MetricName
+from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.pipeline import Pipeline
 from apache_beam.runners import DirectRunner
 from apache_beam.runners import TestDirectRunner
 from apache_beam.runners import create_runner
+from apache_beam.runners.direct.bundle_factory import BundleFactory
 from apache_beam.runners.direct.evaluation_context import _ExecutionContext
 from apache_beam.runners.direct.transform_evaluator import _GroupByKeyOnlyEvaluator
 from apache_beam.runners.direct.transform_evaluator import _TransformEvaluator
+from apache_beam.runners.direct.watermark_manager import WatermarkManager
+from apache_beam.runners.direct.watermark_manager import _TransformWatermarks
 from apache_beam.testing import test_pipeline
+from apache_beam.testing.util import BeamAssertException
 from apache_beam.testing.util import assert_that
 from apache_beam.testing.util import equal_to
+from apache_beam.transforms.window import GlobalWindows
+from apache_beam.transforms.window import IntervalWindow
+from apache_beam.utils.timestamp import MAX_TIMESTAMP
+from apache_beam.utils.timestamp import Timestamp
+from apache_beam.utils.windowed_value import WindowedValue
 
 
 class DirectPipelineResultTest(unittest.TestCase):
@@ -134,6 +145,110 @@ class BundleBasedRunnerTest(unittest.TestCase):
     with test_pipeline.TestPipeline(runner='BundleBasedDirectRunner') as p:
       assert_that(p | beam.Impulse(), equal_to([b'']))
 
+  def test_multiple_workers(self):
+    options = PipelineOptions(direct_num_workers=4)
+    with test_pipeline.TestPipeline(runner='BundleBasedDirectRunner',
+                                    options=options) as p:
+      side = p | 'Side' >> beam.Create([10])
+      result = (
+          p
+          | beam.Create(range(100))
+          | beam.Map(
+              lambda x, y: (x % 7, x * y), beam.pvalue.AsSingleton(side))
+          | beam.CombinePerKey(sum))
+      assert_that(
+          result, equal_to([(k, 10 * sum(range(k, 100, 7))) for k in range(7)]))
+
+  def test_bundles_bounded_by_bytes(self):
+    class BundleSizesDoFn(beam.DoFn):
+      def start_bundle(self):
+        self._size = 0
+
+      def process(self, element):
+        self._size += 1
+
+      def finish_bundle(self):
+        yield GlobalWindows.windowed_value(self._size)
+
+    def check_bundle_sizes(sizes):
+      # Each grouped element encodes to a few hundred bytes, so the output of
+      # the GroupByKey is split into several bundles of a few elements each.
+      if sum(sizes) != 20 or len(sizes) < 2:
+        raise BeamAssertException('Unexpected bundle sizes: %s' % sizes)
+
+    with mock.patch.object(_GroupByKeyOnlyEvaluator,
+                           'MAX_BYTES_PER_BUNDLE',
+                           2000):
+      with test_pipeline.TestPipeline(runner='BundleBasedDirectRunner') as p:
+        sizes = (
+            p
+            | beam.Create(range(20))
+            | beam.Map(lambda x: (x, 'x' * 100))
+            | beam.GroupByKey()
+            | beam.ParDo(BundleSizesDoFn()))
+        assert_that(sizes, check_bundle_sizes)
+
+  def test_watermark_refreshes_coalesced(self):
+    managers = []
+    refreshes = []
+    update_watermarks = WatermarkManager.update_watermarks
+    refresh = _TransformWatermarks.refresh
+
+    def record_refreshes(self, *args):
+      managers.append(self)
+      refreshes.append([])
+      return update_watermarks(self, *args)
+
+    def record_refresh(self):
+      refreshes[-1].append(self)
+      return refresh(self)
+
+    with mock.patch.object(WatermarkManager,
+                           'update_watermarks',
+                           record_refreshes), mock.patch.object(
+                               _TransformWatermarks, 'refresh',
+                               record_refresh):
+      with test_pipeline.TestPipeline(runner='BundleBasedDirectRunner') as p:
+        # Nothing is pending on the Flatten or its inputs once Filter is
+        # done, so both paths from Filter advance in the same commit.
+        filtered = p | beam.Create([1, 2, 3]) | beam.Filter(lambda x: False)
+        mapped = filtered | beam.Map(lambda x: x)
+        result = (filtered, mapped) | beam.Flatten() | beam.Map(lambda x: x)
+        assert_that(result, equal_to([]))
+
+    # Each transform is refreshed at most once per commit, and only after
+    # the transforms producing its inputs.
+    watermarks = managers[0]._transform_to_watermarks
+    for refreshed in refreshes:
+      self.assertEqual(len(refreshed), len(set(refreshed)))
+      positions = {tw: i for i, tw in enumerate(refreshed)}
+      for transform, tw in watermarks.items():
+        for input_pvalue in transform.inputs:
+          if tw in positions and input_pvalue.producer:
+            self.assertLess(
+                positions.get(watermarks[input_pvalue.producer], -1),
+                positions[tw])
+    self.assertTrue(any(len(refreshed) > 1 for refreshed in refreshes))
+
+
+class BundleTest(unittest.TestCase):
+  def test_min_timestamp_and_latest_window(self):
+    pcoll = beam.Pipeline() | beam.Create([])
+    bundle = BundleFactory(stacked=True).create_bundle(pcoll)
+    self.assertFalse(bundle.has_elements())
+    self.assertEqual(bundle.min_timestamp, MAX_TIMESTAMP)
+    self.assertIsNone(bundle.latest_window)
+
+    early = IntervalWindow(0, 10)
+    late = IntervalWindow(5, 20)
+    bundle.add(WindowedValue('a', 7, [early]))
+    bundle.add(WindowedValue('b', 7, [early]))
+    bundle.add(WindowedValue('c', 12, [late]))
+    bundle.add(WindowedValue('d', 3, [early]))
+    bundle.commit(None)
+    self.assertEqual(bundle.min_timestamp, Timestamp(3))
+    self.assertEqual(bundle.latest_window, late)
+
 
 class DirectRunnerRetryTests(unittest.TestCase):
   def test_retry_fork_graph(self):
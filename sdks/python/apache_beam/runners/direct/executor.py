@@ -41,6 +41,7 @@ from future.moves import queue
 from future.utils import raise_
 
 from apache_beam.metrics.execution import MetricsContainer
+from apache_beam.options.pipeline_options import DirectOptions
 from apache_beam.runners.worker import statesampler
 from apache_beam.transforms import sideinputs
 from apache_beam.utils import counters
@@ -66,13 +67,9 @@ class _ExecutorService(object):
 
   class _ExecutorServiceWorker(threading.Thread):
     """Worker thread for executing a single task at a time."""
-
-    # Amount to block waiting for getting an item from the queue in seconds.
-    TIMEOUT = 5
-
     def __init__(
         self,
-        queue,  # type: queue.Queue[_ExecutorService.CallableTask]
+        queue,  # type: queue.Queue[Optional[_ExecutorService.CallableTask]]
         index):
       super(_ExecutorService._ExecutorServiceWorker, self).__init__()
       self.queue = queue
@@ -93,36 +90,27 @@ class _ExecutorService(object):
       self.name = 'Thread: %d, %s (%s)' % (
           self._index, name, 'executing' if task else 'idle')
 
-    def _get_task_or_none(self):
-      # type: () -> Optional[_ExecutorService.CallableTask]
-      try:
-        # Do not block indefinitely, otherwise we may not act for a requested
-        # shutdown.
-        return self.queue.get(
-            timeout=_ExecutorService._ExecutorServiceWorker.TIMEOUT)
-      except queue.Empty:
-        return None
-
     def run(self):
       state_sampler = statesampler.StateSampler('', counters.CounterFactory())
       statesampler.set_current_tracker(state_sampler)
       while not self.shutdown_requested:
-        task = self._get_task_or_none()
-        if task:
-          try:
-            if not self.shutdown_requested:
-              self._update_name(task)
-              task.call(state_sampler)
-              self._update_name()
-          finally:
-            self.queue.task_done()
+        # Block until a task is available. A requested shutdown wakes up the
+        # workers by enqueueing a None task for each of them.
+        task = self.queue.get()
+        try:
+          if task and not self.shutdown_requested:
+            self._update_name(task)
+            task.call(state_sampler)
+            self._update_name()
+        finally:
+          self.queue.task_done()
 
     def shutdown(self):
       self.shutdown_requested = True
 
   def __init__(self, num_workers):
     self.queue = queue.Queue(
-    )  # type: queue.Queue[_ExecutorService.CallableTask]
+    )  # type: queue.Queue[Optional[_ExecutorService.CallableTask]]
     self.workers = [
         _ExecutorService._ExecutorServiceWorker(self.queue, i)
         for i in range(num_workers)
@@ -135,11 +123,19 @@ class _ExecutorService(object):
     if not self.shutdown_requested:
       self.queue.put(task)
 
+  def is_idle(self):
+    # type: () -> bool
+
+    """Returns whether there are no tasks waiting for a worker."""
+    return self.queue.empty()
+
   def await_completion(self):
     for worker in self.workers:
       worker.join()
 
   def shutdown(self):
+    if self.shutdown_requested:
+      return
     self.shutdown_requested = True
 
     for worker in self.workers:
@@ -152,8 +148,10 @@ class _ExecutorService(object):
         self.queue.task_done()
       except queue.Empty:
         continue
-    # All existing threads will eventually terminate (after they complete their
-    # last task).
+    # Wake up the idle workers. All existing threads will eventually terminate
+    # (after they complete their last task).
+    for _ in self.workers:
+      self.queue.put(None)
 
 
 class _TransformEvaluationState(object):
@@ -315,13 +313,7 @@ class TransformExecutor(_ExecutorService.CallableTask):
     self._evaluation_context = evaluation_context
     self._input_bundle = input_bundle
     # For non-empty bundles, store the window of the max EOW.
-    # TODO(mariagh): Move to class _Bundle's inner _StackedWindowedValues
-    self._latest_main_input_window = None
-    if input_bundle.has_elements():
-      self._latest_main_input_window = input_bundle._elements[0].windows[0]
-      for elem in input_bundle.get_elements_iterable():
-        if elem.windows[0].end > self._latest_main_input_window.end:
-          self._latest_main_input_window = elem.windows[0]
+    self._latest_main_input_window = input_bundle.latest_window
     self._fired_timers = fired_timers
     self._applied_ptransform = applied_ptransform
     self._completion_callback = completion_callback
@@ -454,7 +446,7 @@ class _ExecutorServiceParallelExecutor(object):
       evaluation_context  # type: EvaluationContext
   ):
     self.executor_service = _ExecutorService(
-        _ExecutorServiceParallelExecutor.NUM_WORKERS)
+        self._num_workers(evaluation_context))
     self.transform_executor_services = _TransformExecutorServices(
         self.executor_service)
     self.value_to_consumers = value_to_consumers
@@ -467,6 +459,17 @@ class _ExecutorServiceParallelExecutor(object):
     self.default_completion_callback = _CompletionCallback(
         evaluation_context, self.all_updates)
 
+  @staticmethod
+  def _num_workers(evaluation_context):
+    # type: (EvaluationContext) -> int
+    options = evaluation_context.pipeline_options
+    if options is None:
+      return _ExecutorServiceParallelExecutor.NUM_WORKERS
+    # The monitor task shares the workers with the bundles being executed.
+    return max(
+        _ExecutorServiceParallelExecutor.NUM_WORKERS,
+        options.view_as(DirectOptions).direct_num_workers or 0)
+
   def start(self, roots):
     self.root_nodes = frozenset(roots)
     self.all_nodes = frozenset(
@@ -539,9 +542,17 @@ class _ExecutorServiceParallelExecutor(object):
       self._item_type = item_type
       self._queue = queue.Queue()
 
-    def poll(self):
+    def poll(self, timeout=None):
+      """Returns the next item, or None if there is none.
+
+      Args:
+        timeout: if given, seconds to block waiting for an item to arrive.
+      """
       try:
-        item = self._queue.get_nowait()
+        if timeout is None:
+          item = self._queue.get_nowait()
+        else:
+          item = self._queue.get(timeout=timeout)
         self._queue.task_done()
         return item
       except queue.Empty:
@@ -598,6 +609,11 @@ class _ExecutorServiceParallelExecutor(object):
 
   class _MonitorTask(_ExecutorService.CallableTask):
     """MonitorTask continuously runs to ensure that pipeline makes progress."""
+
+    # Seconds to wait for an update while other workers are executing bundles
+    # and no task is waiting for a worker, instead of resubmitting right away.
+    IDLE_WAIT_SECS = 0.1
+
     def __init__(self, executor):
       # type: (_ExecutorServiceParallelExecutor) -> None
       self._executor = executor
@@ -609,6 +625,9 @@ class _ExecutorServiceParallelExecutor(object):
     def call(self, state_sampler):
       try:
         update = self._executor.all_updates.poll()
+        if (update is None and self._executor.executor_service.is_idle() and
+            self._is_executing()):
+          update = self._executor.all_updates.poll(timeout=self.IDLE_WAIT_SECS)
         while update:
           if update.committed_bundle:
             self._executor.schedule_consumers(update.committed_bundle)
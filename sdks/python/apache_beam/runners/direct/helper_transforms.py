@@ -26,23 +26,29 @@ import typing
 import apache_beam as beam
 from apache_beam import typehints
 from apache_beam.internal.util import ArgumentPlaceholder
+from apache_beam.runners.direct.direct_runner import _StreamingCombineAlsoByWindow
+from apache_beam.runners.direct.direct_runner import _StreamingGroupByKeyOnly
 from apache_beam.transforms.combiners import _CurriedFn
+from apache_beam.typehints import trivial_inference
 from apache_beam.utils.windowed_value import WindowedValue
 
 
+def _curry_combine_fn(combine_fn, args, kwargs):
+  args_to_check = itertools.chain(args, kwargs.values())
+  if isinstance(combine_fn, _CurriedFn):
+    args_to_check = itertools.chain(
+        args_to_check, combine_fn.args, combine_fn.kwargs.values())
+  if any(isinstance(arg, ArgumentPlaceholder) for arg in args_to_check):
+    # This isn't implemented in dataflow either...
+    raise NotImplementedError('Deferred CombineFn side inputs.')
+  return beam.transforms.combiners.curry_combine_fn(combine_fn, args, kwargs)
+
+
 class LiftedCombinePerKey(beam.PTransform):
   """An implementation of CombinePerKey that does mapper-side pre-combining.
   """
   def __init__(self, combine_fn, args, kwargs):
-    args_to_check = itertools.chain(args, kwargs.values())
-    if isinstance(combine_fn, _CurriedFn):
-      args_to_check = itertools.chain(
-          args_to_check, combine_fn.args, combine_fn.kwargs.values())
-    if any(isinstance(arg, ArgumentPlaceholder) for arg in args_to_check):
-      # This isn't implemented in dataflow either...
-      raise NotImplementedError('Deferred CombineFn side inputs.')
-    self._combine_fn = beam.transforms.combiners.curry_combine_fn(
-        combine_fn, args, kwargs)
+    self._combine_fn = _curry_combine_fn(combine_fn, args, kwargs)
 
   def expand(self, pcoll):
     return (
@@ -52,6 +58,33 @@ class LiftedCombinePerKey(beam.PTransform):
         | beam.ParDo(FinishCombine(self._combine_fn)))
 
 
+class StreamingCombinePerKey(beam.PTransform):
+  """An implementation of CombinePerKey for streaming non-default windowing.
+
+  Values are combined as they arrive at the GroupByKey, so that only an
+  accumulator per key and window is kept between triggers firings.
+  """
+  def __init__(self, combine_fn, args, kwargs):
+    self._combine_fn = _curry_combine_fn(combine_fn, args, kwargs)
+
+  def expand(self, pcoll):
+    key_type, value_type = trivial_inference.key_value_types(pcoll.element_type)
+    reify_output_type = typehints.KV[key_type,
+                                     typehints.WindowedValue[value_type]]
+    gbk_output_type = typehints.KV[
+        key_type, typehints.Iterable[typehints.WindowedValue[value_type]]]
+    return (
+        pcoll
+        | 'ReifyWindows' >> beam.ParDo(beam.GroupByKey.ReifyWindows()).
+        with_output_types(reify_output_type)
+        | 'GroupByKey' >> _StreamingGroupByKeyOnly().with_input_types(
+            reify_output_type).with_output_types(gbk_output_type)
+        | 'CombineByWindow' >> _StreamingCombineAlsoByWindow(
+            pcoll.windowing, self._combine_fn).with_input_types(
+                gbk_output_type).with_output_types(
+                    typehints.KV[key_type, typehints.Any]))
+
+
 class PartialGroupByKeyCombiningValues(beam.DoFn):
   """Aggregates values into a per-key-window cache.
 
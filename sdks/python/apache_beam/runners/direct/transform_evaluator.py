@@ -45,6 +45,7 @@ from apache_beam.runners.common import DoFnRunner
 from apache_beam.runners.common import DoFnState
 from apache_beam.runners.dataflow.native_io.iobase import _NativeWrite  # pylint: disable=protected-access
 from apache_beam.runners.direct.direct_runner import _DirectReadFromPubSub
+from apache_beam.runners.direct.direct_runner import _StreamingCombineAlsoByWindow
 from apache_beam.runners.direct.direct_runner import _StreamingGroupAlsoByWindow
 from apache_beam.runners.direct.direct_runner import _StreamingGroupByKeyOnly
 from apache_beam.runners.direct.direct_userstate import DirectUserStateContext
@@ -63,6 +64,7 @@ from apache_beam.testing.test_stream import TimingInfo
 from apache_beam.testing.test_stream import WatermarkEvent
 from apache_beam.testing.test_stream import WindowedValueHolder
 from apache_beam.transforms import core
+from apache_beam.transforms.combiners import PhasedCombineFnExecutor
 from apache_beam.transforms.trigger import InMemoryUnmergedState
 from apache_beam.transforms.trigger import TimeDomain
 from apache_beam.transforms.trigger import _CombiningValueStateTag
@@ -73,6 +75,7 @@ from apache_beam.transforms.userstate import get_dofn_specs
 from apache_beam.transforms.userstate import is_stateful_dofn
 from apache_beam.transforms.window import GlobalWindows
 from apache_beam.transforms.window import WindowedValue
+from apache_beam.typehints import trivial_inference
 from apache_beam.typehints.typecheck import TypeCheckError
 from apache_beam.utils import counters
 from apache_beam.utils.timestamp import MIN_TIMESTAMP
@@ -235,6 +238,9 @@ class _TestStreamRootBundleProvider(RootBundleProvider):
 class _TransformEvaluator(object):
   """An evaluator of a specific application of a transform."""
 
+  # Number of elements encoded to estimate the size in bytes of a bundle.
+  _SIZE_SAMPLE_COUNT = 10
+
   def __init__(self,
                evaluation_context, # type: EvaluationContext
                applied_ptransform,  # type: AppliedPTransform
@@ -266,19 +272,31 @@ class _TransformEvaluator(object):
       output_pcollection,
       elements,
       max_element_per_bundle,
-      element_size_fn):
-    """Splits elements, an iterable, into multiple output bundles.
+      element_size_fn,
+      max_bytes_per_bundle=None):
+    """Splits elements, a list, into multiple output bundles.
 
     Args:
       output_pcollection: PCollection that the elements belong to.
-      elements: elements to be chunked into bundles.
+      elements: list of elements to be chunked into bundles. It is sampled
+        before being chunked when max_bytes_per_bundle is set.
       max_element_per_bundle: (approximately) the maximum element per bundle.
         If it is None, only a single bundle will be produced.
       element_size_fn: Function to return the size of a given element.
+      max_bytes_per_bundle: (approximately) the maximum encoded size in bytes
+        per bundle, estimated from a sample of the elements. If it is None,
+        bundles are only bounded by max_element_per_bundle.
 
     Returns:
       List of output uncommitted bundles with at least one bundle.
     """
+    if max_bytes_per_bundle and elements:
+      max_size_for_bytes = self._max_size_for_bytes(
+          output_pcollection, elements, element_size_fn, max_bytes_per_bundle)
+      if max_size_for_bytes and (not max_element_per_bundle or
+                                 max_size_for_bytes < max_element_per_bundle):
+        max_element_per_bundle = max_size_for_bytes
+
     bundle = self._evaluation_context.create_bundle(output_pcollection)
     bundle_size = 0
     bundles = [bundle]
@@ -292,6 +310,22 @@ class _TransformEvaluator(object):
       bundle_size += element_size_fn(element)
     return bundles
 
+  @staticmethod
+  def _max_size_for_bytes(
+      output_pcollection, elements, element_size_fn, max_bytes_per_bundle):
+    """Returns the bundle size (per element_size_fn) fitting the byte limit.
+
+    Only the first _SIZE_SAMPLE_COUNT elements are encoded, the rest are
+    assumed to be of the same average size.
+    """
+    coder = coders.registry.get_coder(output_pcollection.element_type)
+    sample = elements[:_TransformEvaluator._SIZE_SAMPLE_COUNT]
+    sample_bytes = sum(coder.estimate_size(e.value) for e in sample)
+    sample_size = sum(element_size_fn(e) for e in sample)
+    if not sample_bytes or not sample_size:
+      return None
+    return max(1, max_bytes_per_bundle * sample_size // sample_bytes)
+
   def start_bundle(self):
     """Starts a new bundle."""
     pass
@@ -333,6 +367,8 @@ class _BoundedReadEvaluator(_TransformEvaluator):
 
   # After some benchmarks, 1000 was optimal among {100,1000,10000}
   MAX_ELEMENT_PER_BUNDLE = 1000
+  # Bounds the bundles of large elements.
+  MAX_BYTES_PER_BUNDLE = 16 << 20
 
   def __init__(
       self,
@@ -359,7 +395,8 @@ class _BoundedReadEvaluator(_TransformEvaluator):
           output_pcollection,
           read_result,
           _BoundedReadEvaluator.MAX_ELEMENT_PER_BUNDLE,
-          lambda _: 1)
+          lambda _: 1,
+          _BoundedReadEvaluator.MAX_BYTES_PER_BUNDLE)
 
     if isinstance(self._source, io.iobase.BoundedSource):
       # Getting a RangeTracker for the default range of the source and reading
@@ -885,6 +922,9 @@ class _GroupByKeyOnlyEvaluator(_TransformEvaluator):
   """TransformEvaluator for _GroupByKeyOnly transform."""
 
   MAX_ELEMENT_PER_BUNDLE = None
+  # Splits the grouped output so that downstream bundles can be executed in
+  # parallel.
+  MAX_BYTES_PER_BUNDLE = 16 << 20
   ELEMENTS_TAG = _ListStateTag('elements')
   COMPLETION_TAG = _CombiningValueStateTag('completed', any)
 
@@ -966,7 +1006,8 @@ class _GroupByKeyOnlyEvaluator(_TransformEvaluator):
             self.output_pcollection,
             gbk_result,
             _GroupByKeyOnlyEvaluator.MAX_ELEMENT_PER_BUNDLE,
-            len_element_fn)
+            len_element_fn,
+            _GroupByKeyOnlyEvaluator.MAX_BYTES_PER_BUNDLE)
 
       self.global_state.add_state(
           None, _GroupByKeyOnlyEvaluator.COMPLETION_TAG, True)
@@ -1061,16 +1102,25 @@ class _StreamingGroupAlsoByWindowEvaluator(_TransformEvaluator):
   def start_bundle(self):
     assert len(self._outputs) == 1
     self.output_pcollection = list(self._outputs)[0]
+    transform = self._applied_ptransform.transform
+    phased_combine_fn = None
+    if isinstance(transform, _StreamingCombineAlsoByWindow):
+      phased_combine_fn = PhasedCombineFnExecutor(
+          'all', transform.combine_fn, (), {})
     self.driver = create_trigger_driver(
-        self._applied_ptransform.transform.windowing,
+        transform.windowing,
+        phased_combine_fn=phased_combine_fn,
         clock=self._evaluation_context._watermark_manager._clock)
     self.gabw_items = []
     self.keyed_holds = {}
 
     # The input type (which is the same as the output type) of a
-    # GroupAlsoByWindow will be Tuple[Any, Iter[Any]] or more specific.
+    # GroupAlsoByWindow will be Tuple[Any, Iter[Any]] or more specific. The
+    # output of a combining GroupAlsoByWindow may not be typed.
     kv_type_hint = self._applied_ptransform.outputs[None].element_type
-    key_type_hint = (kv_type_hint.tuple_types[0] if kv_type_hint else Any)
+    key_type_hint = (
+        trivial_inference.key_value_types(kv_type_hint)[0]
+        if kv_type_hint else Any)
     self.key_coder = coders.registry.get_coder(key_type_hint)
 
   def process_element(self, element):
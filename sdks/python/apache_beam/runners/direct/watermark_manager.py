@@ -21,6 +21,7 @@
 
 from __future__ import absolute_import
 
+import heapq
 import threading
 from builtins import object
 from typing import TYPE_CHECKING
@@ -74,6 +75,37 @@ class WatermarkManager(object):
       for consumer in consumers:
         self._update_input_transform_watermarks(consumer)
 
+    # The rank of each transform in a topological order of the graph.
+    self._ranks = self._topological_ranks()
+
+  def _consumers(self, applied_ptransform):
+    # type: (AppliedPTransform) -> Iterable[AppliedPTransform]
+    for pval in applied_ptransform.outputs.values():
+      if isinstance(pval, pvalue.DoOutputsTuple):
+        pvals = (v for v in pval)
+      else:
+        pvals = (pval, )
+      for v in pvals:
+        for consumer in self._value_to_consumers.get(v, ()):
+          yield consumer
+
+  def _topological_ranks(self):
+    # type: () -> Dict[AppliedPTransform, int]
+    in_degrees = dict.fromkeys(self._transform_to_watermarks, 0)
+    for applied_ptransform in self._transform_to_watermarks:
+      for consumer in self._consumers(applied_ptransform):
+        in_degrees[consumer] += 1
+    ranks = {}
+    ready = [t for t, in_degree in in_degrees.items() if not in_degree]
+    while ready:
+      applied_ptransform = ready.pop()
+      ranks[applied_ptransform] = len(ranks)
+      for consumer in self._consumers(applied_ptransform):
+        in_degrees[consumer] -= 1
+        if not in_degrees[consumer]:
+          ready.append(consumer)
+    return ranks
+
   def _update_input_transform_watermarks(self, applied_ptransform):
     # type: (AppliedPTransform) -> None
     assert isinstance(applied_ptransform, pipeline.AppliedPTransform)
@@ -160,26 +192,28 @@ class WatermarkManager(object):
       completed_tw.remove_pending(input_committed_bundle)
 
   def _refresh_watermarks(self, applied_ptransform, side_inputs_container):
+    """Refreshes the watermarks of a transform and of those downstream of it.
+
+    The refreshes are coalesced: a transform is refreshed once, after all the
+    transforms upstream of it, rather than once per path from the transform
+    whose bundle was committed.
+    """
     assert isinstance(applied_ptransform, pipeline.AppliedPTransform)
     unblocked_tasks = []
-    tw = self.get_watermarks(applied_ptransform)
-    if tw.refresh():
-      for pval in applied_ptransform.outputs.values():
-        if isinstance(pval, pvalue.DoOutputsTuple):
-          pvals = (v for v in pval)
-        else:
-          pvals = (pval, )
-        for v in pvals:
-          if v in self._value_to_consumers:  # If there are downstream consumers
-            consumers = self._value_to_consumers[v]
-            for consumer in consumers:
-              unblocked_tasks.extend(
-                  self._refresh_watermarks(consumer, side_inputs_container))
-      # Notify the side_inputs_container.
-      unblocked_tasks.extend(
-          side_inputs_container.
-          update_watermarks_for_transform_and_unblock_tasks(
-              applied_ptransform, tw))
+    queued = set([applied_ptransform])
+    to_refresh = [(self._ranks[applied_ptransform], applied_ptransform)]
+    while to_refresh:
+      _, transform = heapq.heappop(to_refresh)
+      tw = self.get_watermarks(transform)
+      if tw.refresh():
+        for consumer in self._consumers(transform):
+          if consumer not in queued:
+            queued.add(consumer)
+            heapq.heappush(to_refresh, (self._ranks[consumer], consumer))
+        # Notify the side_inputs_container.
+        unblocked_tasks.extend(
+            side_inputs_container.
+            update_watermarks_for_transform_and_unblock_tasks(transform, tw))
     return unblocked_tasks
 
   def extract_all_timers(self):
@@ -275,12 +309,10 @@ class _TransformWatermarks(object):
       min_pending_timestamp = WatermarkManager.WATERMARK_POS_INF
       has_pending_elements = False
       for input_bundle in self._pending:
-        # TODO(ccy): we can have the Bundle class keep track of the minimum
-        # timestamp so we don't have to do an iteration here.
-        for wv in input_bundle.get_elements_iterable():
+        if input_bundle.has_elements():
           has_pending_elements = True
-          if wv.timestamp < min_pending_timestamp:
-            min_pending_timestamp = wv.timestamp
+          if input_bundle.min_timestamp < min_pending_timestamp:
+            min_pending_timestamp = input_bundle.min_timestamp
 
       # If there is a pending element with a certain timestamp, we can at most
       # advance our watermark to the maximum timestamp less than that
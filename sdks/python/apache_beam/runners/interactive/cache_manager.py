@@ -23,16 +23,22 @@ from __future__ import print_function
 
 import collections
 import datetime
+import itertools
+import json
 import os
+import re
 import sys
 import tempfile
+import time
 import urllib
 
 import apache_beam as beam
 from apache_beam import coders
+from apache_beam.internal import pickler
 from apache_beam.io import filesystems
 from apache_beam.io import textio
 from apache_beam.io import tfrecordio
+from apache_beam.runners.interactive import chunked_file
 from apache_beam.transforms import combiners
 
 if sys.version_info[0] > 2:
@@ -68,13 +74,15 @@ class CacheManager(object):
     """Returns the latest version number of the PCollection cache."""
     raise NotImplementedError
 
-  def read(self, *labels):
-    # type (*str) -> Tuple[str, Generator[Any]]
+  def read(self, *labels, **args):
+    # type (*str, **Any) -> Tuple[str, Generator[Any]]
 
     """Return the PCollection as a list as well as the version number.
 
     Args:
       *labels: List of labels for PCollection instance.
+      **args: Optional arguments narrowing down what is read, e.g. a limit on
+        the number of elements. Supported arguments depend on the cache.
 
     Returns:
       A tuple containing an iterator for the items in the PCollection and the
@@ -139,17 +147,64 @@ class CacheManager(object):
     """Cleans up all the PCollection caches."""
     raise NotImplementedError
 
+  @property
+  def is_persistent(self):
+    # type () -> bool
+
+    """Returns if the caches outlive this cache manager.
+
+    A persistent cache manager can read caches written in previous sessions, so
+    its caches must be keyed by what produced them rather than by the identity
+    of objects in the current session.
+    """
+    return False
+
+  def enforce_size_limit(self):
+    # type () -> None
+
+    """Evicts caches to stay within the disk budget, if there is one."""
+    pass
+
 
 class FileBasedCacheManager(CacheManager):
   """Maps PCollections to local temp files for materialization."""
 
   _available_formats = {
       'text': (textio.ReadFromText, textio.WriteToText),
-      'tfrecord': (tfrecordio.ReadFromTFRecord, tfrecordio.WriteToTFRecord)
+      'tfrecord': (tfrecordio.ReadFromTFRecord, tfrecordio.WriteToTFRecord),
+      'chunked': (
+          chunked_file.ReadFromChunkedFile, chunked_file.WriteToChunkedFile)
   }
 
-  def __init__(self, cache_dir=None, cache_format='text'):
-    if cache_dir:
+  # Name of the file under cache_dir that records when each cache was last
+  # used, so that the least recently used caches are evicted first even across
+  # sessions.
+  _ACCESS_TIMES_FILE = '_access_times.json'
+
+  _SHARD_SUFFIX = re.compile(r'-\d+-of-\d+$')
+
+  def __init__(
+      self,
+      cache_dir=None,
+      cache_format='text',
+      persistent=False,
+      max_bytes=None):
+    """Initializes a FileBasedCacheManager.
+
+    Args:
+      cache_dir: (str) the directory where PCollection caches are kept.
+      cache_format: (str) the file format of the PCollection caches.
+      persistent: (bool) whether to keep caches in cache_dir itself after this
+        cache manager is cleaned up, so that later sessions using the same
+        cache_dir can reuse them. Requires cache_dir.
+      max_bytes: (int) the disk budget of all the caches in cache_dir. When
+        exceeded, the least recently used caches are evicted.
+    """
+    if persistent and not cache_dir:
+      raise ValueError('A persistent cache requires a cache_dir.')
+    if persistent:
+      self._cache_dir = cache_dir
+    elif cache_dir:
       self._cache_dir = filesystems.FileSystems.join(
           cache_dir,
           datetime.datetime.now().strftime("cache-%y-%m-%d-%H_%M_%S"))
@@ -157,28 +212,37 @@ class FileBasedCacheManager(CacheManager):
       self._cache_dir = tempfile.mkdtemp(
           prefix='interactive-temp-', dir=os.environ.get('TEST_TMPDIR', None))
     self._versions = collections.defaultdict(lambda: self._CacheVersion())
+    self._persistent = persistent
+    self._max_bytes = max_bytes
 
     if cache_format not in self._available_formats:
       raise ValueError("Unsupported cache format: '%s'." % cache_format)
+    self._cache_format = cache_format
     self._reader_class, self._writer_class = self._available_formats[
         cache_format]
     self._default_pcoder = (
         SafeFastPrimitivesCoder() if cache_format == 'text' else None)
 
-    # List of saved pcoders keyed by PCollection path. It is OK to keep this
-    # list in memory because once FileBasedCacheManager object is
-    # destroyed/re-created it loses the access to previously written cache
-    # objects anyways even if cache_dir already exists. In other words,
-    # it is not possible to resume execution of Beam pipeline from the
-    # saved cache if FileBasedCacheManager has been reset.
-    #
-    # However, if we are to implement better cache persistence, one needs
-    # to take care of keeping consistency between the cached PCollection
-    # and its PCoder type.
+    # List of saved pcoders keyed by PCollection path. A persistent cache
+    # manager also writes each pcoder next to its cache so that the cache can
+    # be decoded in later sessions; this dict then only saves the round trip.
     self._saved_pcoders = {}
 
+    # Last access time of caches keyed by PCollection path, loaded lazily from
+    # the access times file of a persistent cache.
+    self._access_times = None
+
+  @property
+  def is_persistent(self):
+    return self._persistent
+
   def exists(self, *labels):
-    return bool(self._match(*labels))
+    if not self._match(*labels):
+      return False
+    # A persisted cache is only usable if it can be decoded.
+    return (
+        not self._persistent or self._default_pcoder is not None or
+        filesystems.FileSystems.exists(self._pcoder_path(*labels)))
 
   def _latest_version(self, *labels):
     timestamp = 0
@@ -189,24 +253,70 @@ class FileBasedCacheManager(CacheManager):
 
   def save_pcoder(self, pcoder, *labels):
     self._saved_pcoders[self._path(*labels)] = pcoder
+    if self._persistent:
+      path = self._pcoder_path(*labels)
+      directory = filesystems.FileSystems.split(path)[0]
+      if not filesystems.FileSystems.exists(directory):
+        filesystems.FileSystems.mkdirs(directory)
+      with filesystems.FileSystems.create(path) as f:
+        f.write(pickler.dumps(pcoder))
 
   def load_pcoder(self, *labels):
-    return (
-        self._default_pcoder if self._default_pcoder is not None else
-        self._saved_pcoders[self._path(*labels)])
+    if self._default_pcoder is not None:
+      return self._default_pcoder
+    path = self._path(*labels)
+    if path not in self._saved_pcoders and self._persistent:
+      with filesystems.FileSystems.open(self._pcoder_path(*labels)) as f:
+        self._saved_pcoders[path] = pickler.loads(f.read())
+    return self._saved_pcoders[path]
+
+  def read(self, *labels, **args):
+    """Reads the cached PCollection.
+
+    Accepted args are `limit`, the maximum number of elements to read, and for
+    the 'chunked' cache format `min_timestamp` and `max_timestamp`, the range
+    of event timestamps to read, or `sample_size`, the number of elements to
+    sample at random.
+    """
+    limit = args.pop('limit', None)
+    if args and self._cache_format != 'chunked':
+      raise ValueError(
+          'Unsupported arguments for the %s cache format: %s' %
+          (self._cache_format, ', '.join(sorted(args))))
 
-  def read(self, *labels):
     # Return an iterator to an empty list if it doesn't exist.
     if not self.exists(*labels):
       return iter([]), -1
 
     # Otherwise, return a generator to the cached PCollection.
-    source = self.source(*labels)._source
-    range_tracker = source.get_range_tracker(None, None)
-    reader = source.read(range_tracker)
+    self._touch(*labels)
+    if self._cache_format == 'chunked':
+      reader = self._read_chunked(labels, limit, **args)
+    else:
+      source = self.source(*labels)._source
+      range_tracker = source.get_range_tracker(None, None)
+      reader = source.read(range_tracker)
+      if limit is not None:
+        reader = itertools.islice(reader, limit)
     version = self._latest_version(*labels)
     return reader, version
 
+  def _read_chunked(
+      self,
+      labels,
+      limit,
+      min_timestamp=None,
+      max_timestamp=None,
+      sample_size=None):
+    reader = chunked_file.ChunkedFileReader(
+        self._glob_path(*labels), self.load_pcoder(*labels))
+    if sample_size is not None:
+      if (limit is not None or min_timestamp is not None or
+          max_timestamp is not None):
+        raise ValueError('sample_size cannot be combined with other arguments.')
+      return iter(reader.sample(sample_size))
+    return reader.read(limit, min_timestamp, max_timestamp)
+
   def write(self, values, *labels):
     sink = self.sink(labels)._sink
     path = self._path(*labels)
@@ -216,20 +326,95 @@ class FileBasedCacheManager(CacheManager):
     for v in values:
       writer.write(v)
     writer.close()
+    self._touch(*labels)
+    self.enforce_size_limit()
 
   def source(self, *labels):
+    self._touch(*labels)
     return self._reader_class(
         self._glob_path(*labels), coder=self.load_pcoder(*labels))
 
   def sink(self, labels, is_capture=False):
+    self._touch(*labels)
     return self._writer_class(
         self._path(*labels), coder=self.load_pcoder(*labels))
 
   def cleanup(self):
-    if filesystems.FileSystems.exists(self._cache_dir):
+    # Persisted caches are meant to outlive this cache manager, only their
+    # access times need to be saved.
+    if self._persistent:
+      self.enforce_size_limit()
+    elif filesystems.FileSystems.exists(self._cache_dir):
       filesystems.FileSystems.delete([self._cache_dir])
     self._saved_pcoders = {}
 
+  def enforce_size_limit(self):
+    """Evicts the least recently used caches until they fit in max_bytes.
+
+    A cache is evicted as a whole, i.e. all of its shards and its pcoder. The
+    access times of a persistent cache are saved as well, so that the next
+    session evicts in the same order.
+    """
+    if self._max_bytes is None and not self._persistent:
+      return
+    access_times = self._load_access_times()
+    caches = collections.defaultdict(list)
+    pattern = filesystems.FileSystems.join(self._cache_dir, '*', '*-*-of-*')
+    for metadata in filesystems.FileSystems.match([pattern])[0].metadata_list:
+      if metadata.path.startswith(self._pcoder_dir()):
+        continue
+      caches[self._SHARD_SUFFIX.sub('', metadata.path)].append(metadata)
+
+    # Caches used in no session so far, e.g. written by a pipeline run, are
+    # as recent as their files.
+    for path, shards in caches.items():
+      if path not in access_times:
+        access_times[path] = max(
+            filesystems.FileSystems.last_updated(shard.path)
+            for shard in shards)
+    total_bytes = sum(
+        shard.size_in_bytes for shards in caches.values() for shard in shards)
+    for path in sorted(caches, key=lambda path: access_times[path]):
+      if self._max_bytes is None or total_bytes <= self._max_bytes:
+        break
+      to_delete = [shard.path for shard in caches[path]]
+      pcoder_path = filesystems.FileSystems.join(
+          self._pcoder_dir(), path[len(self._cache_dir):].lstrip('/' + os.sep))
+      if filesystems.FileSystems.exists(pcoder_path):
+        to_delete.append(pcoder_path)
+      filesystems.FileSystems.delete(to_delete)
+      total_bytes -= sum(shard.size_in_bytes for shard in caches[path])
+      self._saved_pcoders.pop(path, None)
+      del caches[path]
+
+    # Forget about caches that are gone, e.g. evicted by another session.
+    self._access_times = {path: access_times[path] for path in caches}
+    if self._persistent:
+      with filesystems.FileSystems.create(self._access_times_path()) as f:
+        f.write(json.dumps(self._access_times).encode('utf-8'))
+
+  def _touch(self, *labels):
+    self._load_access_times()[self._path(*labels)] = time.time()
+
+  def _load_access_times(self):
+    if self._access_times is None:
+      self._access_times = {}
+      path = self._access_times_path()
+      if self._persistent and filesystems.FileSystems.exists(path):
+        with filesystems.FileSystems.open(path) as f:
+          self._access_times = json.loads(f.read().decode('utf-8'))
+    return self._access_times
+
+  def _access_times_path(self):
+    return filesystems.FileSystems.join(
+        self._cache_dir, self._ACCESS_TIMES_FILE)
+
+  def _pcoder_dir(self):
+    return filesystems.FileSystems.join(self._cache_dir, '_pcoders')
+
+  def _pcoder_path(self, *labels):
+    return filesystems.FileSystems.join(self._pcoder_dir(), *labels)
+
   def _glob_path(self, *labels):
     return self._path(*labels) + '-*-of-*'
 
@@ -27,6 +27,7 @@ import tempfile
 import time
 import unittest
 
+import apache_beam as beam
 from apache_beam import coders
 from apache_beam.io import filesystems
 from apache_beam.runners.interactive import cache_manager as cache
@@ -180,6 +181,17 @@ class FileBasedCacheManagerTest(object):
     self.assertTrue(
         self.cache_manager.is_latest_version(version, prefix, cache_label))
 
+  def test_read_limit(self):
+    """Test that read() can stop after a given number of elements."""
+    prefix = 'full'
+    cache_label = 'some-cache-label'
+    cache_version_one = ['cache', 'version', 'one']
+
+    self.mock_write_cache(cache_version_one, prefix, cache_label)
+    reader, version = self.cache_manager.read(prefix, cache_label, limit=2)
+    self.assertListEqual(list(reader), ['cache', 'version'])
+    self.assertEqual(version, 0)
+
 
 class TextFileBasedCacheManagerTest(
     FileBasedCacheManagerTest,
@@ -188,6 +200,10 @@ class TextFileBasedCacheManagerTest(
 
   cache_format = 'text'
 
+  def test_read_unsupported_args(self):
+    with self.assertRaises(ValueError):
+      self.cache_manager.read('full', 'some-cache-label', sample_size=2)
+
 
 class TFRecordBasedCacheManagerTest(
     FileBasedCacheManagerTest,
@@ -197,5 +213,83 @@ class TFRecordBasedCacheManagerTest(
   cache_format = 'tfrecord'
 
 
+class ChunkedFileBasedCacheManagerTest(
+    FileBasedCacheManagerTest,
+    unittest.TestCase,
+):
+
+  cache_format = 'chunked'
+
+  def test_read_sample(self):
+    prefix = 'full'
+    cache_label = 'some-cache-label'
+    cache_version_one = ['cache', 'version', 'one']
+
+    self.mock_write_cache(cache_version_one, prefix, cache_label)
+    reader, _ = self.cache_manager.read(prefix, cache_label, sample_size=2)
+    sample = list(reader)
+    self.assertEqual(len(sample), 2)
+    self.assertTrue(set(sample).issubset(cache_version_one))
+
+
+class PersistentFileBasedCacheManagerTest(unittest.TestCase):
+  def setUp(self):
+    self.test_dir = tempfile.mkdtemp()
+
+  def tearDown(self):
+    shutil.rmtree(self.test_dir)
+
+  def new_cache_manager(self, max_bytes=None):
+    return cache.FileBasedCacheManager(
+        self.test_dir,
+        cache_format='tfrecord',
+        persistent=True,
+        max_bytes=max_bytes)
+
+  def write_cache(self, cache_manager, values, cache_label):
+    """Caches the values the way an instrumented pipeline run would."""
+    with beam.Pipeline() as p:
+      _ = p | beam.Create(values) | cache.WriteCache(cache_manager, cache_label)
+    cache_manager.enforce_size_limit()
+
+  def test_requires_cache_dir(self):
+    with self.assertRaises(ValueError):
+      cache.FileBasedCacheManager(persistent=True)
+
+  def test_reuse_across_cache_managers(self):
+    cache_manager = self.new_cache_manager()
+    self.assertTrue(cache_manager.is_persistent)
+    self.write_cache(cache_manager, ['cache', 'version', 'one'], 'label')
+    cache_manager.cleanup()
+
+    # A new session reads the cache with the persisted pcoder.
+    cache_manager = self.new_cache_manager()
+    self.assertTrue(cache_manager.exists('full', 'label'))
+    reader, version = cache_manager.read('full', 'label')
+    self.assertListEqual(list(reader), ['cache', 'version', 'one'])
+    self.assertEqual(version, 0)
+
+  def test_evicts_least_recently_used(self):
+    cache_manager = self.new_cache_manager()
+    self.write_cache(cache_manager, ['x' * 1000], 'a')
+    cache_size = sum(
+        metadata.size_in_bytes for metadata in filesystems.FileSystems.match(
+            [cache_manager._glob_path('full', 'a')])[0].metadata_list)
+
+    cache_manager = self.new_cache_manager(max_bytes=int(cache_size * 2.5))
+    self.write_cache(cache_manager, ['x' * 1000], 'b')
+    time.sleep(0.1)
+    # Using 'a' makes 'b' the least recently used cache.
+    reader, _ = cache_manager.read('full', 'a')
+    list(reader)
+    time.sleep(0.1)
+    self.write_cache(cache_manager, ['x' * 1000], 'c')
+
+    self.assertTrue(cache_manager.exists('full', 'a'))
+    self.assertFalse(cache_manager.exists('full', 'b'))
+    self.assertTrue(cache_manager.exists('full', 'c'))
+    self.assertFalse(os.path.exists(cache_manager._pcoder_path('full', 'b')))
+
+
 if __name__ == '__main__':
   unittest.main()
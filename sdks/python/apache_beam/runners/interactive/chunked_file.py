@@ -0,0 +1,369 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A chunked, compressed and indexed file format for PCollection caches.
+
+Encoded elements are grouped into chunks that are compressed independently.
+An index at the end of each file records the byte range, the number of
+elements and the range of event timestamps of every chunk. Reading the first
+elements of a cache, sampling it or reading a range of event timestamps thus
+only decompresses and decodes the chunks that are needed.
+
+The layout of a file is::
+
+  [chunk]* [index] [index length (8 bytes)] [magic (8 bytes)]
+
+The index is JSON encoded and is written when the file is closed, so that it
+goes through the same temporary file and rename steps as the chunks.
+"""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+from __future__ import division
+
+import json
+import random
+import struct
+import zlib
+from builtins import object
+from collections import namedtuple
+
+from apache_beam.coders.coder_impl import create_InputStream
+from apache_beam.coders.coder_impl import create_OutputStream
+from apache_beam.io import filebasedsink
+from apache_beam.io.filebasedsource import FileBasedSource
+from apache_beam.io.filesystem import CompressionTypes
+from apache_beam.io.filesystems import FileSystems
+from apache_beam.io.iobase import Read
+from apache_beam.io.iobase import Write
+from apache_beam.testing.test_stream import WindowedValueHolder
+from apache_beam.transforms import PTransform
+
+__all__ = ['ReadFromChunkedFile', 'WriteToChunkedFile', 'ChunkedFileReader']
+
+_MAGIC = b'BEAMCHK1'
+_TRAILER = struct.Struct('<Q8s')
+
+# A fast compression level: caches are written far more often than they are
+# read back in full.
+_COMPRESSION_LEVEL = 1
+
+
+class _ChunkInfo(namedtuple('_ChunkInfo',
+                            'offset length count min_timestamp max_timestamp')):
+  """Index entry of a chunk.
+
+  The timestamps are in microseconds, or None if the elements of the chunk
+  have no event timestamps.
+  """
+  __slots__ = ()
+
+  def overlaps(self, min_timestamp, max_timestamp):
+    if self.min_timestamp is None:
+      return True
+    return ((min_timestamp is None or self.max_timestamp >= min_timestamp) and
+            (max_timestamp is None or self.min_timestamp < max_timestamp))
+
+
+def element_timestamp(element):
+  """Returns the event timestamp of a cached element in micros, or None.
+
+  Interactive Beam caches elements as WindowedValueHolders; other elements do
+  not carry an event timestamp.
+  """
+  if isinstance(element, WindowedValueHolder):
+    return element.windowed_value.timestamp.micros
+  return None
+
+
+class _ChunkedFileWriter(object):
+  """Buffers encoded elements into compressed chunks of a file."""
+  def __init__(self, file_handle, elements_per_chunk):
+    self._file_handle = file_handle
+    self._elements_per_chunk = elements_per_chunk
+    self._offset = 0
+    self._index = []
+    self._reset_chunk()
+
+  def _reset_chunk(self):
+    self._chunk = create_OutputStream()
+    self._count = 0
+    self._min_timestamp = None
+    self._max_timestamp = None
+
+  def write(self, encoded_element, timestamp_micros):
+    self._chunk.write(encoded_element, True)
+    self._count += 1
+    if timestamp_micros is not None:
+      if self._min_timestamp is None or timestamp_micros < self._min_timestamp:
+        self._min_timestamp = timestamp_micros
+      if self._max_timestamp is None or timestamp_micros > self._max_timestamp:
+        self._max_timestamp = timestamp_micros
+    if self._count >= self._elements_per_chunk:
+      self._flush_chunk()
+
+  def _flush_chunk(self):
+    if not self._count:
+      return
+    data = zlib.compress(self._chunk.get(), _COMPRESSION_LEVEL)
+    self._file_handle.write(data)
+    self._index.append(
+        _ChunkInfo(
+            self._offset,
+            len(data),
+            self._count,
+            self._min_timestamp,
+            self._max_timestamp))
+    self._offset += len(data)
+    self._reset_chunk()
+
+  def close(self):
+    self._flush_chunk()
+    index = json.dumps([list(chunk) for chunk in self._index]).encode('utf-8')
+    self._file_handle.write(index)
+    self._file_handle.write(_TRAILER.pack(len(index), _MAGIC))
+    self._file_handle.close()
+
+
+def _read_index(file_handle):
+  """Reads the chunk index of an open chunked file."""
+  file_handle.seek(0, 2)
+  size = file_handle.tell()
+  if size < _TRAILER.size:
+    raise ValueError('Not a valid chunked file: too short.')
+  file_handle.seek(size - _TRAILER.size)
+  index_length, magic = _TRAILER.unpack(file_handle.read(_TRAILER.size))
+  if magic != _MAGIC:
+    raise ValueError('Not a valid chunked file: bad magic %r.' % magic)
+  file_handle.seek(size - _TRAILER.size - index_length)
+  index = json.loads(file_handle.read(index_length).decode('utf-8'))
+  return [_ChunkInfo(*chunk) for chunk in index]
+
+
+def _read_chunk(file_handle, chunk, coder):
+  """Returns the decoded elements of a chunk."""
+  file_handle.seek(chunk.offset)
+  stream = create_InputStream(zlib.decompress(file_handle.read(chunk.length)))
+  return [coder.decode(stream.read_all(True)) for _ in range(chunk.count)]
+
+
+class ChunkedFileReader(object):
+  """Reads chunked files, using their index to skip unneeded chunks.
+
+  Unlike the source returned by ReadFromChunkedFile, this is meant to be used
+  outside of a pipeline, e.g. to bring a cached PCollection into a notebook.
+  """
+  def __init__(self, file_pattern, coder, timestamp_fn=element_timestamp):
+    self._file_pattern = file_pattern
+    self._coder = coder
+    self._timestamp_fn = timestamp_fn
+
+  def _paths(self):
+    match = FileSystems.match([self._file_pattern])[0]
+    return sorted(metadata.path for metadata in match.metadata_list)
+
+  def _chunks(self):
+    """Yields (path, chunk) for all the chunks of all the files."""
+    for path in self._paths():
+      with FileSystems.open(
+          path, compression_type=CompressionTypes.UNCOMPRESSED) as f:
+        index = _read_index(f)
+      for chunk in index:
+        yield path, chunk
+
+  def count(self):
+    """Returns the number of elements, without decoding any of them."""
+    return sum(chunk.count for _, chunk in self._chunks())
+
+  def read(self, limit=None, min_timestamp=None, max_timestamp=None):
+    """Yields the elements in the order they were written.
+
+    Args:
+      limit: if given, yields at most this many elements.
+      min_timestamp: if given, only yields elements with an event timestamp
+        greater than or equal to it.
+      max_timestamp: if given, only yields elements with an event timestamp
+        less than it.
+
+    Elements without an event timestamp are skipped when a timestamp range is
+    given.
+    """
+    min_micros = min_timestamp.micros if min_timestamp is not None else None
+    max_micros = max_timestamp.micros if max_timestamp is not None else None
+    filter_timestamps = min_micros is not None or max_micros is not None
+    remaining = limit
+    if remaining is not None and remaining <= 0:
+      return
+    for path in self._paths():
+      with FileSystems.open(
+          path, compression_type=CompressionTypes.UNCOMPRESSED) as f:
+        for chunk in _read_index(f):
+          if not chunk.overlaps(min_micros, max_micros):
+            continue
+          for element in _read_chunk(f, chunk, self._coder):
+            if filter_timestamps:
+              timestamp = self._timestamp_fn(element)
+              if (timestamp is None or
+                  (min_micros is not None and timestamp < min_micros) or
+                  (max_micros is not None and timestamp >= max_micros)):
+                continue
+            yield element
+            if remaining is not None:
+              remaining -= 1
+              if not remaining:
+                return
+
+  def sample(self, n, seed=None):
+    """Returns a random sample of at most n elements.
+
+    The elements are drawn from chunks picked at random, so only the chunks
+    needed to gather n elements are decompressed.
+    """
+    rand = random.Random(seed)
+    chunks = list(self._chunks())
+    rand.shuffle(chunks)
+    sample = []
+    seen = 0
+    for path, chunk in chunks:
+      if seen >= n:
+        break
+      with FileSystems.open(
+          path, compression_type=CompressionTypes.UNCOMPRESSED) as f:
+        elements = _read_chunk(f, chunk, self._coder)
+      for element in elements:
+        # Reservoir sampling over the elements of the picked chunks.
+        seen += 1
+        if len(sample) < n:
+          sample.append(element)
+        else:
+          i = rand.randint(0, seen - 1)
+          if i < n:
+            sample[i] = element
+    return sample
+
+
+class _ChunkedFileSource(FileBasedSource):
+  """A source reading all the elements of chunked files."""
+  def __init__(self, file_pattern, coder, validate):
+    super(_ChunkedFileSource, self).__init__(
+        file_pattern=file_pattern,
+        compression_type=CompressionTypes.UNCOMPRESSED,
+        splittable=False,
+        validate=validate)
+    self._coder = coder
+
+  def read_records(self, file_name, offset_range_tracker):
+    if offset_range_tracker.start_position():
+      raise ValueError(
+          'Start position not 0:%s' % offset_range_tracker.start_position())
+
+    with self.open_file(file_name) as file_handle:
+      for chunk in _read_index(file_handle):
+        if not offset_range_tracker.try_claim(chunk.offset):
+          raise RuntimeError('Unable to claim position: %s' % chunk.offset)
+        for element in _read_chunk(file_handle, chunk, self._coder):
+          yield element
+
+
+class ReadFromChunkedFile(PTransform):
+  """Transform for reading chunked files."""
+  def __init__(self, file_pattern, coder, validate=True):
+    """Initialize a ReadFromChunkedFile transform.
+
+    Args:
+      file_pattern: A file glob pattern to read chunked files from.
+      coder: Coder used to decode each element.
+      validate: Boolean flag to verify that the files exist during the pipeline
+          creation time.
+    """
+    super(ReadFromChunkedFile, self).__init__()
+    self._source = _ChunkedFileSource(file_pattern, coder, validate)
+
+  def expand(self, pvalue):
+    return pvalue.pipeline | Read(self._source)
+
+
+class _ChunkedFileSink(filebasedsink.FileBasedSink):
+  """Sink for writing chunked files."""
+  def __init__(
+      self,
+      file_path_prefix,
+      coder,
+      file_name_suffix,
+      num_shards,
+      shard_name_template,
+      elements_per_chunk,
+      timestamp_fn):
+    super(_ChunkedFileSink, self).__init__(
+        file_path_prefix=file_path_prefix,
+        coder=coder,
+        file_name_suffix=file_name_suffix,
+        num_shards=num_shards,
+        shard_name_template=shard_name_template,
+        mime_type='application/octet-stream',
+        compression_type=CompressionTypes.UNCOMPRESSED)
+    self._elements_per_chunk = elements_per_chunk
+    self._timestamp_fn = timestamp_fn
+
+  def open(self, temp_path):
+    return _ChunkedFileWriter(
+        super(_ChunkedFileSink, self).open(temp_path), self._elements_per_chunk)
+
+  def write_record(self, file_handle, value):
+    file_handle.write(self.coder.encode(value), self._timestamp_fn(value))
+
+
+class WriteToChunkedFile(PTransform):
+  """Transform for writing chunked files."""
+  def __init__(
+      self,
+      file_path_prefix,
+      coder,
+      file_name_suffix='',
+      num_shards=0,
+      shard_name_template=None,
+      elements_per_chunk=1000,
+      timestamp_fn=element_timestamp):
+    """Initialize WriteToChunkedFile transform.
+
+    Args:
+      file_path_prefix: The file path to write to. The files written will begin
+        with this prefix, followed by a shard identifier (see num_shards), and
+        end in a common extension, if given by file_name_suffix.
+      coder: Coder used to encode each element.
+      file_name_suffix: Suffix for the files written.
+      num_shards: The number of files (shards) used for output. If not set, the
+        default value will be used.
+      shard_name_template: A template string containing placeholders for
+        the shard number and shard count. See WriteToTFRecord for details.
+      elements_per_chunk: The number of elements compressed together.
+      timestamp_fn: Function returning the event timestamp in micros of an
+        element, or None. Used to index the range of timestamps of chunks.
+    """
+    super(WriteToChunkedFile, self).__init__()
+    self._sink = _ChunkedFileSink(
+        file_path_prefix,
+        coder,
+        file_name_suffix,
+        num_shards,
+        shard_name_template,
+        elements_per_chunk,
+        timestamp_fn)
+
+  def expand(self, pcoll):
+    return pcoll | Write(self._sink)
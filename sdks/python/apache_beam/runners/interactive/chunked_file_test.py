@@ -0,0 +1,126 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+import apache_beam as beam
+from apache_beam import coders
+from apache_beam.runners.interactive import chunked_file
+from apache_beam.testing.test_pipeline import TestPipeline
+from apache_beam.testing.test_stream import WindowedValueHolder
+from apache_beam.testing.util import assert_that
+from apache_beam.testing.util import equal_to
+from apache_beam.transforms.window import GlobalWindow
+from apache_beam.utils.timestamp import Timestamp
+from apache_beam.utils.windowed_value import WindowedValue
+
+
+class ChunkedFileTest(unittest.TestCase):
+  def setUp(self):
+    self.test_dir = tempfile.mkdtemp()
+    self.path = os.path.join(self.test_dir, 'cache')
+
+  def tearDown(self):
+    shutil.rmtree(self.test_dir)
+
+  def _write(self, values, coder, elements_per_chunk=3):
+    sink = chunked_file.WriteToChunkedFile(
+        self.path, coder, elements_per_chunk=elements_per_chunk)._sink
+    writer = sink.open_writer(sink.initialize_write(), self.path)
+    for v in values:
+      writer.write(v)
+    writer.close()
+    return chunked_file.ChunkedFileReader(self.path + '*', coder)
+
+  def _write_timestamped(self, timestamps):
+    values = [
+        WindowedValueHolder(WindowedValue(t, t, [GlobalWindow()]))
+        for t in timestamps
+    ]
+    return self._write(values, coders.FastPrimitivesCoder())
+
+  def test_read_all(self):
+    reader = self._write(range(10), coders.VarIntCoder())
+    self.assertEqual(list(reader.read()), list(range(10)))
+    self.assertEqual(reader.count(), 10)
+
+  def test_read_empty(self):
+    reader = self._write([], coders.VarIntCoder())
+    self.assertEqual(list(reader.read()), [])
+    self.assertEqual(reader.count(), 0)
+
+  def test_read_limit_decompresses_needed_chunks_only(self):
+    reader = self._write(range(10), coders.VarIntCoder())
+    with mock.patch.object(chunked_file,
+                           '_read_chunk',
+                           wraps=chunked_file._read_chunk) as read_chunk:
+      self.assertEqual(list(reader.read(limit=4)), [0, 1, 2, 3])
+    self.assertEqual(read_chunk.call_count, 2)
+    self.assertEqual(list(reader.read(limit=0)), [])
+
+  def test_read_timestamp_range(self):
+    reader = self._write_timestamped([1, 2, 3, 10, 11, 12, 5, 6])
+    with mock.patch.object(chunked_file,
+                           '_read_chunk',
+                           wraps=chunked_file._read_chunk) as read_chunk:
+      values = [
+          e.windowed_value.value for e in reader.read(
+              min_timestamp=Timestamp(3), max_timestamp=Timestamp(10))
+      ]
+    self.assertEqual(values, [3, 5, 6])
+    # The chunk of elements with timestamps in [10, 12] is skipped.
+    self.assertEqual(read_chunk.call_count, 2)
+
+  def test_sample(self):
+    reader = self._write(range(100), coders.VarIntCoder(), 10)
+    sample = reader.sample(5, seed=1)
+    self.assertEqual(len(sample), 5)
+    self.assertEqual(len(set(sample)), 5)
+    self.assertTrue(set(sample).issubset(range(100)))
+    self.assertEqual(sorted(reader.sample(200)), list(range(100)))
+
+  def test_invalid_file(self):
+    with open(self.path, 'wb') as f:
+      f.write(b'not a chunked file')
+    reader = chunked_file.ChunkedFileReader(self.path, coders.BytesCoder())
+    with self.assertRaises(ValueError):
+      list(reader.read())
+
+  def test_pipeline_round_trip(self):
+    with TestPipeline() as p:
+      _ = (
+          p
+          | beam.Create(range(20))
+          | chunked_file.WriteToChunkedFile(
+              self.path, coders.VarIntCoder(), elements_per_chunk=7))
+    with TestPipeline() as p:
+      result = p | chunked_file.ReadFromChunkedFile(
+          self.path + '*', coders.VarIntCoder())
+      assert_that(result, equal_to(list(range(20))))
+
+
+if __name__ == '__main__':
+  unittest.main()
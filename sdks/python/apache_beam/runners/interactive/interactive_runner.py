@@ -61,14 +61,18 @@ class InteractiveRunner(runners.PipelineRunner):
       render_option=None,
       skip_display=True,
       force_compute=True,
-      blocking=True):
+      blocking=True,
+      persist_cache=False,
+      max_cache_bytes=None):
     """Constructor of InteractiveRunner.
 
     Args:
       underlying_runner: (runner.PipelineRunner)
       cache_dir: (str) the directory where PCollection caches are kept
       cache_format: (str) the file format that should be used for saving
-          PCollection caches. Available options are 'text' and 'tfrecord'.
+          PCollection caches. Available options are 'text', 'tfrecord' and
+          'chunked'. The latter is compressed and indexed, which speeds up
+          reading only a part of a cached PCollection.
       render_option: (str) this parameter decides how the pipeline graph is
           rendered. See display.pipeline_graph_renderer for available options.
       skip_display: (bool) whether to skip display operations when running the
@@ -81,12 +85,24 @@ class InteractiveRunner(runners.PipelineRunner):
           available data and run minimum pipeline fragment to only compute data
           not available.
       blocking: (bool) whether the pipeline run should be blocking or not.
+      persist_cache: (bool) whether to keep PCollection caches in cache_dir
+          across sessions. Caches are then keyed by a fingerprint of the
+          transforms producing the PCollections, and a PCollection whose
+          producing transforms are unchanged is read from its cache instead of
+          being computed again, regardless of force_compute.
+      max_cache_bytes: (int) the disk budget of the PCollection caches. When
+          exceeded after a pipeline run, the least recently used caches are
+          evicted.
     """
     self._underlying_runner = (
         underlying_runner or direct_runner.DirectRunner())
     if not ie.current_env().cache_manager():
       ie.current_env().set_cache_manager(
-          cache.FileBasedCacheManager(cache_dir, cache_format))
+          cache.FileBasedCacheManager(
+              cache_dir,
+              cache_format,
+              persistent=persist_cache,
+              max_bytes=max_cache_bytes))
     self._cache_manager = ie.current_env().cache_manager()
     self._render_option = render_option
     self._in_session = False
@@ -217,6 +233,7 @@ class InteractiveRunner(runners.PipelineRunner):
       # pylint: disable=dict-values-not-iterating
       ie.current_env().mark_pcollection_computed(
           pipeline_instrument.runner_pcoll_to_user_pcoll.values())
+      self._cache_manager.enforce_size_limit()
 
     return main_job_result
 
@@ -25,6 +25,8 @@ to transform original pipeline into a one-shot pipeline with interactivity.
 
 from __future__ import absolute_import
 
+import hashlib
+
 import apache_beam as beam
 from apache_beam.pipeline import PipelineVisitor
 from apache_beam.portability.api import beam_runner_api_pb2
@@ -88,6 +90,11 @@ class PipelineInstrument(object):
         # (Dict[str, str])
         self._cacheable_var_by_pcoll_id) = cacheables(self.pcolls_to_pcoll_id)
 
+    # A dict from pcoll_id to the fingerprint of the sub-pipeline producing it,
+    # computed lazily since only persistent caches need it.
+    # (Dict[str, str])
+    self._pcoll_fingerprints = None
+
     # A dict from cache key to PCollection that is read from cache.
     # If exists, caller should reuse the PCollection read. If not, caller
     # should create new transform and track the PCollection read from cache.
@@ -612,10 +619,13 @@ class PipelineInstrument(object):
     # computation has been completed.
 
     is_cached = self._cache_manager.exists('full', key)
+    # A persisted cache is keyed by what produced it and only becomes visible
+    # once it's completely written, thus it's always computed.
     is_computed = (
-        pcoll in self._runner_pcoll_to_user_pcoll and
-        self._runner_pcoll_to_user_pcoll[pcoll] in
-        ie.current_env().computed_pcollections)
+        self._cache_manager.is_persistent or (
+            pcoll in self._runner_pcoll_to_user_pcoll and
+            self._runner_pcoll_to_user_pcoll[pcoll] in
+            ie.current_env().computed_pcollections))
     if ((is_cached and is_computed) or is_unbounded_source_output):
       if key not in self._cached_pcoll_read:
         # Mutates the pipeline with cache read transform attached
@@ -754,9 +764,20 @@ class PipelineInstrument(object):
     'pcoll_id' of cacheable is not stable for cache_key, thus not included in
     cache key. A combination of 'var', 'version' and 'producer_version' is
     sufficient to identify a cached PCollection.
+
+    If the cache outlives the session, the identities of objects are not stable
+    either. The key is then made of 'var' and the fingerprint of the
+    sub-pipeline producing the PCollection, so that an unchanged PCollection
+    maps to the same cache in every session.
     """
     cacheable = self.cacheables.get(self._cacheable_key(pcoll), None)
     if cacheable:
+      if self._cache_manager and self._cache_manager.is_persistent:
+        if self._pcoll_fingerprints is None:
+          self._pcoll_fingerprints = pcoll_fingerprints(
+              self._original_pipeline_proto)
+        return '_'.join(
+            (cacheable['var'], self._pcoll_fingerprints[cacheable['pcoll_id']]))
       return '_'.join((
           cacheable['var'], cacheable['version'],
           cacheable['producer_version']))
@@ -855,6 +876,52 @@ def cacheable_key(pcoll, pcolls_to_pcoll_id, pcoll_version_map=None):
   return '_'.join((pcoll_version, pcoll_id))
 
 
+def pcoll_fingerprints(pipeline_proto):
+  """Fingerprints the sub-pipeline producing each PCollection.
+
+  The fingerprint of a PCollection covers the spec of its producing primitive
+  transform, the output tag, the coder of the PCollection and, recursively, the
+  fingerprints of the transform's inputs. It's stable across sessions as long
+  as the transforms and their serialized user code are unchanged, and it
+  ignores transform names and ids.
+
+  Returns:
+    A dict from pcoll_id to the hex digest fingerprint of the PCollection.
+  """
+  components = pipeline_proto.components
+  producers = {}
+  for transform in components.transforms.values():
+    if not transform.subtransforms:
+      for tag, pcoll_id in transform.outputs.items():
+        producers[pcoll_id] = (tag, transform)
+
+  fingerprints = {}
+
+  def fingerprint(pcoll_id):
+    if pcoll_id not in fingerprints:
+      h = hashlib.sha256()
+      coder_id = components.pcollections[pcoll_id].coder_id
+      if coder_id in components.coders:
+        h.update(
+            components.coders[coder_id].SerializeToString(deterministic=True))
+      else:
+        # With fake coders, the id is the pickled element type.
+        h.update(coder_id.encode('utf-8'))
+      if pcoll_id in producers:
+        tag, transform = producers[pcoll_id]
+        h.update(tag.encode('utf-8'))
+        h.update(transform.spec.SerializeToString(deterministic=True))
+        for input_tag, input_id in sorted(transform.inputs.items()):
+          h.update(input_tag.encode('utf-8'))
+          h.update(fingerprint(input_id).encode('utf-8'))
+      fingerprints[pcoll_id] = h.hexdigest()
+    return fingerprints[pcoll_id]
+
+  for pcoll_id in components.pcollections:
+    fingerprint(pcoll_id)
+  return fingerprints
+
+
 def has_unbounded_sources(pipeline):
   """Checks if a given pipeline has capturable sources."""
   return len(unbounded_sources(pipeline)) > 0
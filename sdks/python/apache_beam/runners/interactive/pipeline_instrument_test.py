@@ -110,6 +110,33 @@ class PipelineInstrumentTest(unittest.TestCase):
         pipeline_instrument.cache_key(cubes),
         'cubes_' + str(id(cubes)) + '_' + str(id(cubes.producer)))
 
+  def test_cache_key_with_persistent_cache(self):
+    ie.current_env().set_cache_manager(
+        cache.FileBasedCacheManager(
+            tempfile.mkdtemp(), cache_format='tfrecord', persistent=True))
+
+    def build_pipeline(square):
+      p = beam.Pipeline(interactive_runner.InteractiveRunner())
+      # pylint: disable=range-builtin-not-iterating
+      init_pcoll = p | 'Init Create' >> beam.Create(range(10))
+      squares = init_pcoll | 'Square' >> beam.Map(square)
+      ib.watch({'init_pcoll': init_pcoll, 'squares': squares})
+      pipeline_instrument = instr.build_pipeline_instrument(p)
+      return (
+          pipeline_instrument.cache_key(init_pcoll),
+          pipeline_instrument.cache_key(squares))
+
+    square = lambda x: x * x
+    init_key, squares_key = build_pipeline(square)
+    self.assertTrue(init_key.startswith('init_pcoll_'))
+    self.assertTrue(squares_key.startswith('squares_'))
+    # Keys don't depend on the identity of the PCollections.
+    self.assertEqual(build_pipeline(square), (init_key, squares_key))
+    # Keys of PCollections derived from changed transforms change.
+    init_key_2, squares_key_2 = build_pipeline(lambda x: x + x)
+    self.assertEqual(init_key_2, init_key)
+    self.assertNotEqual(squares_key_2, squares_key)
+
   def test_cacheables(self):
     p = beam.Pipeline(interactive_runner.InteractiveRunner())
     # pylint: disable=range-builtin-not-iterating
@@ -17,6 +17,10 @@
 """Implementation of an Artifact{Staging,Retrieval}Service.
 
 The staging service here can be backed by any beam filesystem.
+
+Artifacts staged with their hash are stored by content, and are shared by all
+the staging sessions of a service. A manifest may refer to such an artifact by
+its hash without staging it again in its own session.
 """
 
 # pytype: skip-file
@@ -28,8 +32,11 @@ from __future__ import print_function
 import hashlib
 import sys
 import threading
+import uuid
 import zipfile
+from typing import Dict
 from typing import Iterator
+from typing import Tuple
 
 from google.protobuf import json_format
 
@@ -44,9 +51,16 @@ class AbstractArtifactService(
 
   _DEFAULT_CHUNK_SIZE = 2 << 20  # 2mb
 
+  # Whether artifacts staged with their hash are stored by content.
+  _CONTENT_ADDRESSED = True
+
   def __init__(self, root, chunk_size=None):
     self._root = root
     self._chunk_size = chunk_size or self._DEFAULT_CHUNK_SIZE
+    # The paths of the artifacts staged by the sessions that are not committed
+    # yet, by retrieval token and name.
+    self._staged_paths = {}  # type: Dict[Tuple[str, str], str]
+    self._staged_paths_lock = threading.Lock()
 
   def _sha256(self, string):
     return hashlib.sha256(string.encode('utf-8')).hexdigest()
@@ -61,7 +75,7 @@ class AbstractArtifactService(
 
   def _temp_path(self, path):
     # type: (str) -> str
-    return path + '.tmp'
+    return '%s.%s.tmp' % (path, uuid.uuid4().hex)
 
   def _open(self, path, mode):
     raise NotImplementedError(type(self))
@@ -74,10 +88,18 @@ class AbstractArtifactService(
     # type: (str) -> None
     raise NotImplementedError(type(self))
 
+  def _exists(self, path):
+    # type: (str) -> bool
+    raise NotImplementedError(type(self))
+
   def _artifact_path(self, retrieval_token, name):
     # type: (str, str) -> str
     return self._join(self._dirname(retrieval_token), self._sha256(name))
 
+  def _content_path(self, sha256):
+    # type: (str) -> str
+    return self._join(self._root, 'artifacts', sha256)
+
   def _manifest_path(self, retrieval_token):
     # type: (str) -> str
     return retrieval_token
@@ -95,29 +117,57 @@ class AbstractArtifactService(
 
   def PutArtifact(self, request_iterator, context=None):
     # type: (...) -> beam_artifact_api_pb2.PutArtifactResponse
-    first = True
-    for request in request_iterator:
-      if first:
-        first = False
-        metadata = request.metadata.metadata
-        retrieval_token = self.retrieval_token(
-            request.metadata.staging_session_token)
-        artifact_path = self._artifact_path(retrieval_token, metadata.name)
-        temp_path = self._temp_path(artifact_path)
-        fout = self._open(temp_path, 'w')
-        hasher = hashlib.sha256()
-      else:
+    request_iterator = iter(request_iterator)
+    request = next(request_iterator)
+    metadata = request.metadata.metadata
+    retrieval_token = self.retrieval_token(
+        request.metadata.staging_session_token)
+    content_addressed = bool(metadata.sha256) and self._CONTENT_ADDRESSED
+    if content_addressed:
+      artifact_path = self._content_path(metadata.sha256)
+    else:
+      artifact_path = self._artifact_path(retrieval_token, metadata.name)
+
+    if content_addressed and self._exists(artifact_path):
+      # Already staged, possibly by another session.
+      for _ in request_iterator:
+        pass
+    else:
+      temp_path = self._temp_path(artifact_path)
+      fout = self._open(temp_path, 'w')
+      hasher = hashlib.sha256()
+      for request in request_iterator:
         hasher.update(request.data.data)
         fout.write(request.data.data)
-    fout.close()
-    data_hash = hasher.hexdigest()
-    if metadata.sha256 and metadata.sha256 != data_hash:
-      self._delete(temp_path)
-      raise ValueError(
-          'Bad metadata hash: %s vs %s' % (metadata.sha256, data_hash))
-    self._rename(temp_path, artifact_path)
+      fout.close()
+      data_hash = hasher.hexdigest()
+      if metadata.sha256 and metadata.sha256 != data_hash:
+        self._delete(temp_path)
+        raise ValueError(
+            'Bad metadata hash: %s vs %s' % (metadata.sha256, data_hash))
+      self._rename(temp_path, artifact_path)
+
+    with self._staged_paths_lock:
+      self._staged_paths[retrieval_token, metadata.name] = artifact_path
     return beam_artifact_api_pb2.PutArtifactResponse()
 
+  def _committed_path(self, retrieval_token, metadata):
+    # type: (str, beam_artifact_api_pb2.ArtifactMetadata) -> str
+    with self._staged_paths_lock:
+      staged_path = self._staged_paths.pop((retrieval_token, metadata.name),
+                                           None)
+    if staged_path:
+      return staged_path
+    elif metadata.sha256 and self._CONTENT_ADDRESSED:
+      content_path = self._content_path(metadata.sha256)
+      if not self._exists(content_path):
+        raise ValueError(
+            'Artifact %s with hash %s was never staged.' %
+            (metadata.name, metadata.sha256))
+      return content_path
+    else:
+      return self._artifact_path(retrieval_token, metadata.name)
+
   def CommitManifest(self,
                      request,  # type: beam_artifact_api_pb2.CommitManifestRequest
                      context=None):
@@ -128,7 +178,7 @@ class AbstractArtifactService(
         location=[
             beam_artifact_api_pb2.ProxyManifest.Location(
                 name=metadata.name,
-                uri=self._artifact_path(retrieval_token, metadata.name))
+                uri=self._committed_path(retrieval_token, metadata))
             for metadata in request.manifest.artifact
         ])
     with self._open(self._manifest_path(retrieval_token), 'w') as fout:
@@ -167,8 +217,12 @@ class ZipFileArtifactService(AbstractArtifactService):
   This is particularly useful for storing artifacts as part of an UberJar for
   submitting to an upstream runner's cluster.
 
-  Writing to zip files requires Python 3.6+.
+  Writing to zip files requires Python 3.6+. As zip files offer no move
+  operation, the artifacts are not stored by content.
   """
+
+  _CONTENT_ADDRESSED = False
+
   def __init__(self, path, internal_root, chunk_size=None):
     if sys.version_info < (3, 6):
       raise RuntimeError(
@@ -199,6 +253,10 @@ class ZipFileArtifactService(AbstractArtifactService):
     # ZipFile offers no delete operation: https://bugs.python.org/issue6818
     pass
 
+  def _exists(self, path):
+    # type: (str) -> bool
+    return path in self._zipfile.NameToInfo
+
   def _open(self, path, mode):
     if path.startswith('/'):
       raise ValueError(
@@ -251,6 +309,10 @@ class BeamFilesystemArtifactService(AbstractArtifactService):
     # type: (str) -> None
     filesystems.FileSystems.delete([path])
 
+  def _exists(self, path):
+    # type: (str) -> bool
+    return filesystems.FileSystems.exists(path)
+
   def _open(self, path, mode='r'):
     dir = self._dirname(path)
     if not filesystems.FileSystems.exists(dir):
@@ -177,6 +177,48 @@ class AbstractArtifactServiceTest(unittest.TestCase):
     with self.assertRaises(Exception):
       self.retrieve_artifact(retrieval_service, retrieval_token, 'missing')
 
+  def test_shared_content(self):
+    data = b'shared data'
+    sha256 = hashlib.sha256(data).hexdigest()
+
+    def commit(session, name):
+      return self._service.CommitManifest(
+          beam_artifact_api_pb2.CommitManifestRequest(
+              staging_session_token=session,
+              manifest=beam_artifact_api_pb2.Manifest(
+                  artifact=[
+                      beam_artifact_api_pb2.ArtifactMetadata(
+                          name=name, sha256=sha256)
+                  ]))).retrieval_token
+
+    self._service.PutArtifact(
+        [self.put_metadata('session1', 'name1', sha256), self.put_data(data)])
+    token1 = commit('session1', 'name1')
+    # An artifact staged with its hash may be committed without staging it.
+    token2 = commit('session2', 'name2')
+    self.assertEqual(
+        data, self.retrieve_artifact(self._service, token1, 'name1'))
+    self.assertEqual(
+        data, self.retrieve_artifact(self._service, token2, 'name2'))
+
+    # Staging it again is fine too.
+    self._service.PutArtifact(
+        [self.put_metadata('session3', 'name3', sha256), self.put_data(data)])
+    token3 = commit('session3', 'name3')
+    self.assertEqual(
+        data, self.retrieve_artifact(self._service, token3, 'name3'))
+
+    with self.assertRaises(ValueError):
+      self._service.CommitManifest(
+          beam_artifact_api_pb2.CommitManifestRequest(
+              staging_session_token='session4',
+              manifest=beam_artifact_api_pb2.Manifest(
+                  artifact=[
+                      beam_artifact_api_pb2.ArtifactMetadata(
+                          name='name4',
+                          sha256=hashlib.sha256(b'other').hexdigest())
+                  ])))
+
   def test_concurrent_requests(self):
 
     num_sessions = 7
@@ -230,6 +272,10 @@ class ZipFileArtifactServiceTest(AbstractArtifactServiceTest):
     return artifact_service.ZipFileArtifactService(
         os.path.join(staging_dir, 'test.zip'), 'root', chunk_size=10)
 
+  def test_shared_content(self):
+    # Zip files do not store artifacts by content.
+    pass
+
 
 class BeamFilesystemArtifactServiceTest(AbstractArtifactServiceTest):
   def create_service(self, staging_dir):
@@ -96,6 +96,7 @@ from apache_beam.transforms.window import GlobalWindow
 from apache_beam.transforms.window import GlobalWindows
 from apache_beam.utils import profiler
 from apache_beam.utils import proto_utils
+from apache_beam.utils import timestamp
 from apache_beam.utils import windowed_value
 from apache_beam.utils.thread_pool_executor import UnboundedThreadPoolExecutor
 
@@ -136,6 +137,10 @@ STATE_CACHE_SIZE = 100
 # Time-based flush is enabled in the fn_api_runner by default.
 DATA_BUFFER_TIME_LIMIT_MS = 1000
 
+# Timers set past this timestamp have been cleared by the SDK.
+_MAX_TIMER_TIMESTAMP = timestamp.Timestamp(
+    micros=int(common_urns.constants.MAX_TIMESTAMP_MILLIS.constant) * 1000)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -478,7 +483,9 @@ class FnApiRunner(runner.PipelineRunner):
       bundle_repeat=0,
       use_state_iterables=False,
       provision_info=None,  # type: Optional[ExtendedProvisionInfo]
-      progress_request_frequency=None):
+      progress_request_frequency=None,
+      fusion_breaks=()  # type: Iterable[str]
+  ):
     # type: (...) -> None
 
     """Creates a new Fn API Runner.
@@ -492,6 +499,11 @@ class FnApiRunner(runner.PipelineRunner):
       provision_info: provisioning info to make available to workers, or None
       progress_request_frequency: The frequency (in seconds) that the runner
           waits before requesting progress from the SDK.
+      fusion_breaks: ids or unique names of transforms whose outputs are
+          materialized rather than fused into their consumers, so that the
+          consumers are distributed over all workers. Also settable with the
+          fusion_breaks=<name>,<name>... experiment, for which the
+          PortableRunner follows the named transforms by a Reshuffle instead.
     """
     super(FnApiRunner, self).__init__()
     self._last_uid = -1
@@ -502,6 +514,7 @@ class FnApiRunner(runner.PipelineRunner):
     self._progress_frequency = progress_request_frequency
     self._profiler_factory = None  # type: Optional[Callable[..., profiler.Profile]]
     self._use_state_iterables = use_state_iterables
+    self._fusion_breaks = frozenset(fusion_breaks)
     self._provision_info = provision_info or ExtendedProvisionInfo(
         beam_provision_api_pb2.ProvisionInfo(
             retrieval_token='unused-retrieval-token'))
@@ -530,6 +543,10 @@ class FnApiRunner(runner.PipelineRunner):
     if not 'beam_fn_api' in experiments:
       experiments.append('beam_fn_api')
     options.view_as(pipeline_options.DebugOptions).experiments = experiments
+    fusion_breaks = options.view_as(
+        pipeline_options.DebugOptions).lookup_experiment('fusion_breaks')
+    if fusion_breaks:
+      self._fusion_breaks = self._fusion_breaks.union(fusion_breaks.split(','))
 
     # This is sometimes needed if type checking is disabled
     # to enforce that the inputs (and outputs) of GroupByKey operations
@@ -680,7 +697,8 @@ class FnApiRunner(runner.PipelineRunner):
             common_urns.primitives.FLATTEN.urn,
             common_urns.primitives.GROUP_BY_KEY.urn
         ]),
-        use_state_iterables=self._use_state_iterables)
+        use_state_iterables=self._use_state_iterables,
+        fusion_breaks=self._fusion_breaks)
 
   def run_stages(self,
                  stage_context,  # type: fn_api_runner_transforms.TransformContext
@@ -820,6 +838,10 @@ class FnApiRunner(runner.PipelineRunner):
                 key, windowed_key_timer.windows[0]] = windowed_key_timer
         out = create_OutputStream()
         for windowed_key_timer in timers_by_key_and_window.values():
+          _, timer = windowed_key_timer.value
+          if timer['timestamp'] > _MAX_TIMER_TIMESTAMP:
+            # This timer was cleared, see bundle_processor.OutputTimer.
+            continue
           windowed_timer_coder_impl.encode_to_stream(
               windowed_key_timer, out, True)
         deferred_inputs[transform_id] = _ListBuffer(
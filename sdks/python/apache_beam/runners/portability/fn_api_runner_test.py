@@ -52,7 +52,9 @@ from apache_beam.metrics.execution import MetricKey
 from apache_beam.metrics.metricbase import MetricName
 from apache_beam.options.pipeline_options import DebugOptions
 from apache_beam.options.pipeline_options import PipelineOptions
+from apache_beam.portability import common_urns
 from apache_beam.runners.portability import fn_api_runner
+from apache_beam.runners.portability import fn_api_runner_transforms
 from apache_beam.runners.sdf_utils import RestrictionTrackerView
 from apache_beam.runners.worker import data_plane
 from apache_beam.runners.worker import sdk_worker
@@ -270,6 +272,38 @@ class FnApiRunnerTest(unittest.TestCase):
           pcoll | beam.FlatMap(cross_product, beam.pvalue.AsList(derived)),
           equal_to([('a', 'a'), ('a', 'b'), ('b', 'a'), ('b', 'b')]))
 
+  def test_fusion_breaks(self):
+    with self.create_pipeline() as p:
+      p.options.view_as(DebugOptions).add_experiment('fusion_breaks=Expand')
+      assert_that(
+          p
+          | beam.Create([3, 4])
+          | 'Expand' >> beam.FlatMap(range)
+          | beam.Map(lambda x: x * x),
+          equal_to([0, 1, 4, 0, 1, 4, 9]))
+
+  def test_fusion_breaks_stage_graph(self):
+    p = beam.Pipeline()
+    _ = (
+        p
+        | beam.Create([3, 4])
+        | 'Expand' >> beam.FlatMap(range)
+        | 'Square' >> beam.Map(lambda x: x * x))
+    proto = p.to_runner_api()
+
+    _, fused_stages = fn_api_runner.FnApiRunner().create_stages(proto)
+    _, stages = fn_api_runner.FnApiRunner(
+        fusion_breaks=['Expand']).create_stages(proto)
+    self.assertEqual(len(stages), len(fused_stages) + 1)
+    [square_stage] = [
+        s for s in stages if 'Square' in [t.unique_name for t in s.transforms]
+    ]
+    self.assertNotIn('Expand', [t.unique_name for t in square_stage.transforms])
+
+    graph = fn_api_runner_transforms.stage_graph_debug_string(stages)
+    self.assertRegex(graph, r'reads materialize:\S+ from #\d')
+    self.assertIn('Square (%s)' % common_urns.primitives.PAR_DO.urn, graph)
+
   def test_pardo_state_only(self):
     index_state_spec = userstate.CombiningValueStateSpec('index', sum)
 
@@ -344,11 +378,6 @@ class FnApiRunnerTest(unittest.TestCase):
       assert_that(actual, equal_to(expected))
 
   def test_pardo_timers_clear(self):
-    if type(self).__name__ != 'FlinkRunnerTest':
-      # FnApiRunner fails to wire multiple timer collections
-      # this method can replace test_pardo_timers when the issue is fixed
-      self.skipTest('BEAM-7074: Multiple timer definitions not supported.')
-
     timer_spec = userstate.TimerSpec('timer', userstate.TimeDomain.WATERMARK)
     clear_timer_spec = userstate.TimerSpec(
         'clear_timer', userstate.TimeDomain.WATERMARK)
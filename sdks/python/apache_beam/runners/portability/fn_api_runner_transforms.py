@@ -324,11 +324,19 @@ class TransformContext(object):
   def __init__(self,
                components,  # type: beam_runner_api_pb2.Components
                known_runner_urns,  # type: FrozenSet[str]
-               use_state_iterables=False
+               use_state_iterables=False,
+               fusion_breaks=frozenset()  # type: Container[str]
               ):
     self.components = components
     self.known_runner_urns = known_runner_urns
     self.use_state_iterables = use_state_iterables
+    # The outputs of the transforms hinted as fanout points are always
+    # materialized, so that their consumers get their own stage.
+    self.fusion_break_pcolls = frozenset(
+        pcoll for transform_id,
+        transform in components.transforms.items() if
+        transform_id in fusion_breaks or transform.unique_name in fusion_breaks
+        for pcoll in transform.outputs.values())
     # ok to pass None for context because BytesCoder has no components
     coder_proto = coders.BytesCoder().to_runner_api(
         None)  # type: ignore[arg-type]
@@ -511,7 +519,8 @@ def pipeline_from_stages(pipeline_proto,  # type: beam_runner_api_pb2.Pipeline
 def create_and_optimize_stages(pipeline_proto,  # type: beam_runner_api_pb2.Pipeline
                                phases,
                                known_runner_urns,  # type: FrozenSet[str]
-                               use_state_iterables=False
+                               use_state_iterables=False,
+                               fusion_breaks=frozenset()  # type: Container[str]
                               ):
   # type: (...) -> Tuple[TransformContext, List[Stage]]
 
@@ -524,6 +533,9 @@ def create_and_optimize_stages(pipeline_proto,  # type: beam_runner_api_pb2.Pipe
       and receive a list of stages, and a pipeline context. Some available
       transformations are ``lift_combiners``, ``expand_sdf``, ``expand_gbk``,
       etc.
+    fusion_breaks (Container[str]): Ids or unique names of transforms whose
+      outputs should not be fused into their consumers, e.g. cheap transforms
+      with a large fanout followed by expensive ones.
 
   Returns:
     A tuple with a pipeline context, and a list of stages (i.e. an optimized
@@ -532,7 +544,8 @@ def create_and_optimize_stages(pipeline_proto,  # type: beam_runner_api_pb2.Pipe
   pipeline_context = TransformContext(
       pipeline_proto.components,
       known_runner_urns,
-      use_state_iterables=use_state_iterables)
+      use_state_iterables=use_state_iterables,
+      fusion_breaks=fusion_breaks)
 
   # Initial set of stages are singleton leaf transforms.
   stages = list(
@@ -548,10 +561,58 @@ def create_and_optimize_stages(pipeline_proto,  # type: beam_runner_api_pb2.Pipe
     _LOGGER.debug('%s %s' % (len(stages), [len(s.transforms) for s in stages]))
     _LOGGER.debug('Stages: %s', [str(s) for s in stages])
 
+  if _LOGGER.isEnabledFor(logging.DEBUG):
+    _LOGGER.debug('Stage graph:\n%s', stage_graph_debug_string(stages))
+
   # Return the (possibly mutated) context and ordered set of stages.
   return pipeline_context, stages
 
 
+def stage_graph_debug_string(stages):
+  # type: (Iterable[Stage]) -> str
+
+  """Returns a human readable description of a graph of stages.
+
+  Each stage is listed with its transforms, the buffers it reads and writes
+  over the data plane (along with the stages on the other side) and the
+  stages it must follow.
+  """
+  stages = list(stages)
+  index = {stage: ix for ix, stage in enumerate(stages)}
+  writers = collections.defaultdict(list)  # type: DefaultDict[bytes, List[int]]
+  for stage in stages:
+    for transform in stage.transforms:
+      if transform.spec.urn == bundle_processor.DATA_OUTPUT_URN:
+        writers[transform.spec.payload].append(index[stage])
+
+  def stage_refs(ixs):
+    return ', '.join('#%d' % ix for ix in sorted(ixs)) or '<none>'
+
+  lines = []
+  for stage in stages:
+    lines.append(
+        '#%d %s [environment: %s]' %
+        (index[stage], stage.name, stage.environment))
+    for transform in stage.transforms:
+      if transform.spec.urn == bundle_processor.DATA_INPUT_URN:
+        lines.append(
+            '    reads %s from %s' % (
+                transform.spec.payload.decode('utf-8'),
+                stage_refs(writers.get(transform.spec.payload, ()))))
+      elif transform.spec.urn == bundle_processor.DATA_OUTPUT_URN:
+        lines.append('    writes %s' % transform.spec.payload.decode('utf-8'))
+      else:
+        lines.append(
+            '    %s (%s)' % (transform.unique_name, transform.spec.urn))
+    for side_input in sorted(set(stage.side_inputs())):
+      lines.append('    side input %s' % side_input)
+    if stage.must_follow:
+      lines.append(
+          '    must follow %s' % stage_refs(
+              index[prev] for prev in stage.must_follow if prev in index))
+  return '\n'.join(lines)
+
+
 def optimize_pipeline(
     pipeline_proto,  # type: beam_runner_api_pb2.Pipeline
     phases,
@@ -1126,6 +1187,10 @@ def sink_flattens(stages, pipeline_context):
 
 def greedily_fuse(stages, pipeline_context):
   """Places transforms sharing an edge in the same stage, whenever possible.
+
+  PCollections in pipeline_context.fusion_break_pcolls are materialized even
+  when their producer and consumers could be fused, which lets the consumers
+  process them with more parallelism than their producer.
   """
   producers_by_pcoll = {}
   consumers_by_pcoll = collections.defaultdict(list)
@@ -1165,7 +1230,9 @@ def greedily_fuse(stages, pipeline_context):
       # Update consumer.must_follow set, as it's used in can_fuse.
       consumer.must_follow = frozenset(
           replacement(s) for s in consumer.must_follow)
-      if producer.can_fuse(consumer, pipeline_context):
+      if producer.can_fuse(consumer, pipeline_context) and (
+          producer == consumer or
+          pcoll not in pipeline_context.fusion_break_pcolls):
         fuse(producer, consumer)
       else:
         # If we can't fuse, do a read + write.
@@ -1319,9 +1386,9 @@ def inject_timer_pcollections(stages, pipeline_context):
       if transform.spec.urn in PAR_DO_URNS:
         payload = proto_utils.parse_Bytes(
             transform.spec.payload, beam_runner_api_pb2.ParDoPayload)
+        if payload.timer_specs and len(transform.inputs) > 1:
+          raise NotImplementedError('Timers and side inputs.')
         for tag, spec in payload.timer_specs.items():
-          if len(transform.inputs) > 1:
-            raise NotImplementedError('Timers and side inputs.')
           input_pcoll = pipeline_context.components.pcollections[next(
               iter(transform.inputs.values()))]
           # Create the appropriate coder for the timer PCollection.
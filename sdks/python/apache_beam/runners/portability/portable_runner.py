@@ -26,18 +26,22 @@ import threading
 import time
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Tuple
 
 import grpc
 
+from apache_beam import pvalue
 from apache_beam.metrics import metric
 from apache_beam.metrics.execution import MetricResult
 from apache_beam.options.pipeline_options import DebugOptions
 from apache_beam.options.pipeline_options import PortableOptions
 from apache_beam.options.pipeline_options import SetupOptions
 from apache_beam.options.pipeline_options import StandardOptions
+from apache_beam.pipeline import PipelineVisitor
 from apache_beam.portability import common_urns
 from apache_beam.portability.api import beam_job_api_pb2
 from apache_beam.portability.api import beam_runner_api_pb2
@@ -50,10 +54,12 @@ from apache_beam.runners.portability import portable_stager
 from apache_beam.runners.worker import sdk_worker_main
 from apache_beam.runners.worker import worker_pool_main
 from apache_beam.transforms import environments
+from apache_beam.transforms.util import Reshuffle
 
 if TYPE_CHECKING:
   from google.protobuf import struct_pb2  # pylint: disable=ungrouped-imports
   from apache_beam.options.pipeline_options import PipelineOptions
+  from apache_beam.pipeline import AppliedPTransform
   from apache_beam.pipeline import Pipeline
 
 __all__ = ['PortableRunner']
@@ -183,9 +189,15 @@ class JobServiceHandle(object):
 
     """Stage artifacts"""
     if artifact_staging_endpoint:
+      if self.options.view_as(PortableOptions).skip_staged_artifacts:
+        staged_hashes_path = portable_stager.default_staged_hashes_path(
+            artifact_staging_endpoint)
+      else:
+        staged_hashes_path = None
       stager = portable_stager.PortableStager(
           grpc.insecure_channel(artifact_staging_endpoint),
-          staging_session_token)
+          staging_session_token,
+          staged_hashes_path=staged_hashes_path)
       resources = []
       for _, env in pipeline.components.environments.items():
         for dep in env.dependencies:
@@ -310,6 +322,11 @@ class PortableRunner(runner.PipelineRunner):
     # type: (Pipeline, PipelineOptions) -> beam_runner_api_pb2.Pipeline
     portable_options = options.view_as(PortableOptions)
 
+    fusion_breaks = options.view_as(DebugOptions).lookup_experiment(
+        'fusion_breaks')
+    if fusion_breaks:
+      _insert_fusion_breaks(pipeline, fusion_breaks.split(','))
+
     proto_pipeline = pipeline.to_runner_api(
         default_environment=PortableRunner._create_environment(
             portable_options))
@@ -417,6 +434,76 @@ class PortableRunner(runner.PipelineRunner):
     return result
 
 
+def _insert_fusion_breaks(pipeline, names):
+  # type: (Pipeline, Iterable[str]) -> None
+
+  """Follows the transforms named in the fusion_breaks experiment by a
+  Reshuffle, so that the job's runner does not fuse them with their consumers.
+
+  The Reshuffle is applied next to the transform, as FusionBreak(<label>), and
+  the consumers of the transform are rewired to read its reshuffled output.
+  The names of the transforms of the pipeline are left unchanged.
+  """
+  names = frozenset(names)
+
+  class FusionBreakFinder(PipelineVisitor):
+    def __init__(self):
+      self.transforms = []  # type: List[AppliedPTransform]
+
+    def enter_composite_transform(self, transform_node):
+      self.visit_transform(transform_node)
+
+    def visit_transform(self, transform_node):
+      if (transform_node.full_label in names and
+          len(transform_node.outputs) == 1):
+        self.transforms.append(transform_node)
+
+  class ConsumerFinder(PipelineVisitor):
+    def __init__(self, pcoll):
+      self.pcoll = pcoll
+      self.consumers = []  # type: List[AppliedPTransform]
+
+    def enter_composite_transform(self, transform_node):
+      self.visit_transform(transform_node)
+
+    def visit_transform(self, transform_node):
+      if any(pval is self.pcoll for pval in transform_node.inputs) or any(
+          side_input.pvalue is self.pcoll
+          for side_input in transform_node.side_inputs):
+        self.consumers.append(transform_node)
+
+  finder = FusionBreakFinder()
+  pipeline.visit(finder)
+  for transform_node in finder.transforms:
+    pcoll, = transform_node.outputs.values()
+    if not isinstance(pcoll, pvalue.PCollection):
+      continue
+    consumers = ConsumerFinder(pcoll)
+    pipeline.visit(consumers)
+
+    pipeline.transforms_stack.append(transform_node.parent)
+    try:
+      reshuffled = pcoll | 'FusionBreak(%s)' % (
+          transform_node.full_label.rsplit('/', 1)[-1]) >> Reshuffle()
+    finally:
+      pipeline.transforms_stack.pop()
+
+    for consumer in consumers.consumers:
+      consumer.inputs = tuple(
+          reshuffled if pval is pcoll else pval for pval in consumer.inputs)
+      for side_input in consumer.side_inputs:
+        if side_input.pvalue is pcoll:
+          side_input.pvalue = reshuffled
+    # Composites which output the transform's output now output the
+    # reshuffled one, which is applied within them.
+    parent = transform_node.parent
+    while parent is not None:
+      for output_tag, output in list(parent.outputs.items()):
+        if output is pcoll:
+          parent.replace_output(reshuffled, output_tag)
+      parent = parent.parent
+
+
 class PortableMetrics(metric.MetricResults):
   def __init__(self, job_metrics_response):
     metrics = job_metrics_response.metrics
@@ -39,6 +39,7 @@ from apache_beam.options.pipeline_options import DebugOptions
 from apache_beam.options.pipeline_options import DirectOptions
 from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.options.pipeline_options import PortableOptions
+from apache_beam.portability import common_urns
 from apache_beam.portability import python_urns
 from apache_beam.portability.api import beam_job_api_pb2
 from apache_beam.portability.api import beam_job_api_pb2_grpc
@@ -388,6 +389,37 @@ class PortableRunnerInternalTest(unittest.TestCase):
     self.assertIn(
         'External environment endpoint must be set.', ctx.exception.args)
 
+  def test_fusion_breaks_reshuffle(self):
+    options = PipelineOptions([
+        '--experiments=fusion_breaks=Expand',
+        '--environment_type=EXTERNAL',
+        '--environment_config=localhost:50000',
+        '--sdk_location=container'
+    ])
+    p = beam.Pipeline(options=options)
+    _ = (
+        p
+        | beam.Create([3, 4])
+        | 'Expand' >> beam.FlatMap(range)
+        | 'Square' >> beam.Map(lambda x: x * x))
+    proto = PortableRunner.get_proto_pipeline(p, options)
+    transforms = {
+        t.unique_name: t
+        for t in proto.components.transforms.values()
+    }
+    self.assertEqual(
+        transforms['FusionBreak(Expand)'].spec.urn,
+        common_urns.composites.RESHUFFLE.urn)
+    self.assertEqual(
+        list(transforms['Expand'].outputs.values()),
+        list(transforms['FusionBreak(Expand)'].inputs.values()))
+    self.assertEqual(
+        list(transforms['Square'].inputs.values()),
+        list(transforms['FusionBreak(Expand)'].outputs.values()))
+    # The transform itself is not renamed.
+    self.assertEqual(
+        transforms['Expand'].spec.urn, common_urns.primitives.PAR_DO.urn)
+
 
 def hasDockerImage():
   image = environments.DockerEnvironment.default_docker_image()
@@ -24,14 +24,25 @@ from __future__ import division
 from __future__ import print_function
 
 import hashlib
+import json
+import logging
 import os
+import tempfile
+import threading
+from typing import Dict
 from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Set
+
+import grpc
 
 from apache_beam.portability.api import beam_artifact_api_pb2
 from apache_beam.portability.api import beam_artifact_api_pb2_grpc
 from apache_beam.runners.portability.stager import Stager
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class PortableStager(Stager):
   """An implementation of :class:`Stager` to stage files on
@@ -40,10 +51,20 @@ class PortableStager(Stager):
   The class keeps track of pushed files and commit manifest once all files are
   uploaded.
 
-  Note: This class is not thread safe and user of this class should ensure
-  thread safety.
+  If given a file listing the hashes of the artifacts previously staged on the
+  same service, the artifacts with one of these hashes are not uploaded again.
+  The service resolves them by their hash when committing the manifest. If the
+  service no longer holds some of them, they are uploaded and the manifest is
+  committed again.
   """
-  def __init__(self, artifact_service_channel, staging_session_token):
+
+  max_parallel_uploads = 8
+
+  def __init__(
+      self,
+      artifact_service_channel,
+      staging_session_token,
+      staged_hashes_path=None):
     """Creates a new Stager to stage file to ArtifactStagingService.
 
     Args:
@@ -53,12 +74,20 @@ class PortableStager(Stager):
       staging_session_token: A token to stage artifacts on
         ArtifactStagingService. The token is provided by the JobService prepare
         call.
+      staged_hashes_path: Optional path of a local file listing the hashes of
+        the artifacts staged on this service, which is updated when the
+        manifest is committed.
     """
     super(PortableStager, self).__init__()
     self._artifact_staging_stub = beam_artifact_api_pb2_grpc.\
         ArtifactStagingServiceStub(channel=artifact_service_channel)
     self._staging_session_token = staging_session_token
+    self._staged_hashes_path = staged_hashes_path
+    self._staged_hashes = _read_staged_hashes(staged_hashes_path)
+    self._lock = threading.Lock()
     self._artifacts = []  # type: List[beam_artifact_api_pb2.ArtifactMetadata]
+    # The local paths of the artifacts that were not uploaded, by name.
+    self._skipped_artifacts = {}  # type: Dict[str, str]
 
   def stage_artifact(self, local_path_to_artifact, artifact_name):
     # type: (str, str) -> None
@@ -74,12 +103,21 @@ class PortableStager(Stager):
           'Cannot stage {0} to artifact server. Only local files can be staged.'
           .format(local_path_to_artifact))
 
+    artifact_metadata = beam_artifact_api_pb2.ArtifactMetadata(
+        name=artifact_name,
+        sha256=_get_file_hash(local_path_to_artifact),
+        permissions=444)
+    if artifact_metadata.sha256 in self._staged_hashes:
+      with self._lock:
+        self._skipped_artifacts[artifact_name] = local_path_to_artifact
+    else:
+      self._put_artifact(local_path_to_artifact, artifact_metadata)
+    with self._lock:
+      self._artifacts.append(artifact_metadata)
+
+  def _put_artifact(self, local_path_to_artifact, artifact_metadata):
     def artifact_request_generator():
       # type: () -> Iterator[beam_artifact_api_pb2.PutArtifactRequest]
-      artifact_metadata = beam_artifact_api_pb2.ArtifactMetadata(
-          name=artifact_name,
-          sha256=_get_file_hash(local_path_to_artifact),
-          permissions=444)
       metadata = beam_artifact_api_pb2.PutArtifactMetadata(
           staging_session_token=self._staging_session_token,
           metadata=artifact_metadata)
@@ -93,19 +131,73 @@ class PortableStager(Stager):
           request = beam_artifact_api_pb2.PutArtifactRequest(
               data=beam_artifact_api_pb2.ArtifactChunk(data=chunk))
           yield request
-      self._artifacts.append(artifact_metadata)
 
     self._artifact_staging_stub.PutArtifact(artifact_request_generator())
 
   def commit_manifest(self):
     manifest = beam_artifact_api_pb2.Manifest(artifact=self._artifacts)
+    skipped_artifacts, self._skipped_artifacts = self._skipped_artifacts, {}
     self._artifacts = []
+    try:
+      retrieval_token = self._commit_manifest(manifest)
+    except grpc.RpcError:
+      if not skipped_artifacts:
+        raise
+      _LOGGER.info(
+          'Failed to commit the manifest without staging %d artifacts staged '
+          'in a previous session, staging them again.',
+          len(skipped_artifacts))
+      for artifact_metadata in manifest.artifact:
+        if artifact_metadata.name in skipped_artifacts:
+          self._put_artifact(
+              skipped_artifacts[artifact_metadata.name], artifact_metadata)
+      retrieval_token = self._commit_manifest(manifest)
+    if self._staged_hashes_path:
+      self._staged_hashes.update(
+          artifact_metadata.sha256 for artifact_metadata in manifest.artifact)
+      _write_staged_hashes(self._staged_hashes_path, self._staged_hashes)
+    return retrieval_token
+
+  def _commit_manifest(self, manifest):
     return self._artifact_staging_stub.CommitManifest(
         beam_artifact_api_pb2.CommitManifestRequest(
             manifest=manifest,
             staging_session_token=self._staging_session_token)).retrieval_token
 
 
+def default_staged_hashes_path(artifact_staging_endpoint):
+  # type: (str) -> str
+
+  """Returns a local path to keep the hashes staged on the given endpoint."""
+  return os.path.join(
+      tempfile.gettempdir(),
+      'beam-staged-artifacts',
+      hashlib.sha256(artifact_staging_endpoint.encode('utf-8')).hexdigest())
+
+
+def _read_staged_hashes(path):
+  # type: (Optional[str]) -> Set[str]
+  if path and os.path.exists(path):
+    try:
+      with open(path) as f:
+        return set(json.load(f))
+    except (IOError, ValueError):
+      _LOGGER.warning('Ignoring invalid staged hashes file %s', path)
+  return set()
+
+
+def _write_staged_hashes(path, staged_hashes):
+  # type: (str, Set[str]) -> None
+  directory = os.path.dirname(path)
+  if directory and not os.path.exists(directory):
+    os.makedirs(directory)
+  # Concurrent submissions may write this file, replace it atomically.
+  temp_path = '%s.%s.tmp' % (path, os.getpid())
+  with open(temp_path, 'w') as f:
+    json.dump(sorted(staged_hashes), f)
+  os.rename(temp_path, path)
+
+
 def _get_file_hash(path):
   hasher = hashlib.sha256()
   with open(path, 'rb') as f:
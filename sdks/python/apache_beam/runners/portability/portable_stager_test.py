@@ -35,6 +35,7 @@ import grpc
 
 from apache_beam.portability.api import beam_artifact_api_pb2
 from apache_beam.portability.api import beam_artifact_api_pb2_grpc
+from apache_beam.runners.portability import artifact_service
 from apache_beam.runners.portability import portable_stager
 from apache_beam.utils.thread_pool_executor import UnboundedThreadPoolExecutor
 
@@ -140,6 +141,70 @@ class PortableStagerTest(unittest.TestCase):
                      ].sort())
     self.assertEqual(retrieval_tokens, frozenset(['token']))
 
+  def test_stage_incrementally(self):
+    staged_hashes_path = os.path.join(self._temp_dir, 'staged_hashes')
+    for name in ('a', 'b', 'c'):
+      with open(os.path.join(self._temp_dir, name), 'w') as f:
+        f.write(name)
+
+    service = CountingArtifactService(self._remote_dir)
+    server = grpc.server(UnboundedThreadPoolExecutor())
+    beam_artifact_api_pb2_grpc.add_ArtifactStagingServiceServicer_to_server(
+        service, server)
+    port = server.add_insecure_port('[::]:0')
+    server.start()
+    channel = grpc.insecure_channel('localhost:%s' % port)
+
+    def stage(session, names):
+      stager = portable_stager.PortableStager(
+          channel, session, staged_hashes_path=staged_hashes_path)
+      stager.stage_job_resources([(os.path.join(self._temp_dir, name), name)
+                                  for name in names],
+                                 staging_location='')
+      retrieval_token = stager.commit_manifest()
+      return {
+          name: b''.join(
+              chunk.data for chunk in service.GetArtifact(
+                  beam_artifact_api_pb2.GetArtifactRequest(
+                      retrieval_token=retrieval_token, name=name)))
+          for name in names
+      }
+
+    try:
+      self.assertEqual(stage('session1', ['a', 'b']), {'a': b'a', 'b': b'b'})
+      self.assertEqual(service.num_puts, 2)
+
+      # Only the new and modified artifacts are uploaded.
+      with open(os.path.join(self._temp_dir, 'b'), 'w') as f:
+        f.write('modified')
+      self.assertEqual(
+          stage('session2', ['a', 'b', 'c']), {
+              'a': b'a', 'b': b'modified', 'c': b'c'
+          })
+      self.assertEqual(service.num_puts, 4)
+
+      # The artifacts are uploaded again if the service lost them.
+      shutil.rmtree(self._remote_dir)
+      self.assertEqual(
+          stage('session3', ['a', 'b']), {
+              'a': b'a', 'b': b'modified'
+          })
+      self.assertEqual(service.num_puts, 6)
+    finally:
+      channel.close()
+      server.stop(1)
+
+
+class CountingArtifactService(artifact_service.BeamFilesystemArtifactService):
+  def __init__(self, root):
+    super(CountingArtifactService, self).__init__(root)
+    self.num_puts = 0
+
+  def PutArtifact(self, request_iterator, context=None):
+    self.num_puts += 1
+    return super(CountingArtifactService,
+                 self).PutArtifact(request_iterator, context)
+
 
 class TestLocalFileSystemArtifactStagingServiceServicer(
     beam_artifact_api_pb2_grpc.ArtifactStagingServiceServicer):
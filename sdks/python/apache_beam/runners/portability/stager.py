@@ -55,6 +55,7 @@ import os
 import shutil
 import sys
 import tempfile
+from concurrent import futures
 from typing import List
 from typing import Optional
 
@@ -97,6 +98,11 @@ class Stager(object):
   Implementation of this stager has to implement :func:`stage_artifact` and
   :func:`commit_manifest`.
   """
+
+  # The number of artifacts staged concurrently. Stagers whose stage_artifact
+  # is thread safe may raise it.
+  max_parallel_uploads = 1
+
   def stage_artifact(self, local_path_to_artifact, artifact_name):
     # type: (str, str) -> None
 
@@ -300,11 +306,23 @@ class Stager(object):
       raise RuntimeError('The staging_location must be specified.')
 
     staged_resources = []
+    artifacts = []
     for file_path, staged_path in resources:
-      self.stage_artifact(
-          file_path, FileSystems.join(staging_location, staged_path))
+      artifacts.append(
+          (file_path, FileSystems.join(staging_location, staged_path)))
       staged_resources.append(staged_path)
 
+    num_threads = min(self.max_parallel_uploads, len(artifacts))
+    if num_threads > 1:
+      with futures.ThreadPoolExecutor(num_threads) as executor:
+        # Materializing the results raises the first failure, if any.
+        list(
+            executor.map(
+                lambda artifact: self.stage_artifact(*artifact), artifacts))
+    else:
+      for file_path, staged_path in artifacts:
+        self.stage_artifact(file_path, staged_path)
+
     return staged_resources
 
   def create_and_stage_job_resources(
@@ -348,11 +366,14 @@ class Stager(object):
     resources = self.create_job_resources(
         options, temp_dir, build_setup_args, populate_requirements_cache)
 
-    staged_resources = self.stage_job_resources(resources, staging_location)
-
-    # Delete all temp files created while staging job resources.
-    shutil.rmtree(temp_dir)
-    retrieval_token = self.commit_manifest()
+    try:
+      staged_resources = self.stage_job_resources(resources, staging_location)
+      retrieval_token = self.commit_manifest()
+    finally:
+      # Delete all temp files created while staging job resources. This is
+      # done after committing the manifest, which may need to stage some of
+      # them again.
+      shutil.rmtree(temp_dir)
     return retrieval_token, staged_resources
 
   @staticmethod
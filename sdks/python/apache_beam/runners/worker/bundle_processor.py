@@ -720,7 +720,8 @@ class BundleProcessor(object):
   def __init__(self,
                process_bundle_descriptor,  # type: beam_fn_api_pb2.ProcessBundleDescriptor
                state_handler,  # type: sdk_worker.CachingStateHandler
-               data_channel_factory  # type: data_plane.DataChannelFactory
+               data_channel_factory,  # type: data_plane.DataChannelFactory
+               process_latency_sampling_period=0  # type: int
               ):
     # type: (...) -> None
 
@@ -731,10 +732,13 @@ class BundleProcessor(object):
         a description of the stage that this ``BundleProcessor``is to execute.
       state_handler (CachingStateHandler).
       data_channel_factory (``data_plane.DataChannelFactory``).
+      process_latency_sampling_period (int): if set, the ParDo operations time
+        about one in this many of their calls to process.
     """
     self.process_bundle_descriptor = process_bundle_descriptor
     self.state_handler = state_handler
     self.data_channel_factory = data_channel_factory
+    self.process_latency_sampling_period = process_latency_sampling_period
     # TODO(robertwb): Figure out the correct prefix to use for output counters
     # from StateSampler.
     self.counter_factory = counters.CounterFactory()
@@ -756,7 +760,8 @@ class BundleProcessor(object):
         self.data_channel_factory,
         self.counter_factory,
         self.state_sampler,
-        self.state_handler)
+        self.state_handler,
+        self.process_latency_sampling_period)
 
     def is_side_input(transform_proto, tag):
       if transform_proto.spec.urn == common_urns.primitives.PAR_DO.urn:
@@ -1068,13 +1073,15 @@ class BeamTransformFactory(object):
                data_channel_factory,  # type: data_plane.DataChannelFactory
                counter_factory,
                state_sampler,  # type: statesampler.StateSampler
-               state_handler  # type: sdk_worker.CachingStateHandler
+               state_handler,  # type: sdk_worker.CachingStateHandler
+               process_latency_sampling_period=0  # type: int
               ):
     self.descriptor = descriptor
     self.data_channel_factory = data_channel_factory
     self.counter_factory = counter_factory
     self.state_sampler = state_sampler
     self.state_handler = state_handler
+    self.process_latency_sampling_period = process_latency_sampling_period
     self.context = pipeline_context.PipelineContext(
         descriptor,
         iterable_state_read=lambda token,
@@ -1525,6 +1532,7 @@ def _create_pardo_operation(
       side_inputs=None,  # Fn API uses proto definitions and the Fn State API
       output_coders=[output_coders[tag] for tag in output_tags])
 
+  sampling_period = factory.process_latency_sampling_period
   result = factory.augment_oldstyle_op(
       operation_cls(
           common.NameContext(transform_proto.unique_name, transform_id),
@@ -1533,7 +1541,8 @@ def _create_pardo_operation(
           factory.state_sampler,
           side_input_maps,
           user_state_context,
-          timer_inputs=timer_inputs),
+          timer_inputs=timer_inputs,
+          process_latency_sampling_period=sampling_period),
       transform_proto.unique_name,
       consumers,
       output_tags)
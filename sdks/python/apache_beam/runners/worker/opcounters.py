@@ -209,17 +209,23 @@ class OperationCounters(object):
       self.do_sample(windowed_value)
 
   def _observable_callback(self, inner_coder_impl, accumulator):
+    # The first elements of a stream are all measured, then about 10 ln(N)
+    # of N elements are, while the others are assumed to be of the mean size
+    # of the measured ones.
+    stream_stats = [0, 0, 0]  # elements, measured elements, measured size
+
     def _observable_callback_inner(value, is_encoded=False):
-      # TODO(ccy): If this stream is large, sample it as well.
-      # To do this, we'll need to compute the average size of elements
-      # in this stream to add the *total* size of this stream to accumulator.
-      # We'll also want make sure we sample at least some of this stream
-      # (as self.should_sample() may be sampling very sparsely by now).
       if is_encoded:
-        size = len(value)
-        accumulator.update(size)
+        accumulator.update(len(value))
+        return
+      stream_stats[0] += 1
+      if stream_stats[0] <= 10 or random.random() * stream_stats[0] < 10:
+        size = inner_coder_impl.estimate_size(value)
+        stream_stats[1] += 1
+        stream_stats[2] += size
       else:
-        accumulator.update(inner_coder_impl.estimate_size(value))
+        size = stream_stats[2] // stream_stats[1]
+      accumulator.update(size)
 
     return _observable_callback_inner
 
@@ -28,6 +28,7 @@ from builtins import object
 from builtins import range
 
 from apache_beam import coders
+from apache_beam.coders import observable
 from apache_beam.runners.worker import opcounters
 from apache_beam.runners.worker import statesampler
 from apache_beam.runners.worker.opcounters import OperationCounters
@@ -164,6 +165,24 @@ class OperationCountersTest(unittest.TestCase):
     total_size += coder.estimate_size(value)
     self.verify_counters(opcounts, 3, (float(total_size) / 3))
 
+  def test_update_large_observable(self):
+    random.seed(1720)
+    coder = coders.WindowedValueCoder(coders.FastPrimitivesCoder())
+    opcounts = OperationCounters(CounterFactory(), 'some-name', coder, 0)
+    values = observable.ObservableMixin()
+    value = GlobalWindows.windowed_value(values)
+    opcounts.update_from(value)
+    total_size = coder.get_impl().get_estimated_size_and_observables(value)[0]
+    for i in range(10000):
+      element = b'x' * (10 + i % 10)
+      values.notify_observers(element)
+      total_size += coders.FastPrimitivesCoder().estimate_size(element)
+    opcounts.update_collect()
+    self.assertAlmostEqual(
+        opcounts.mean_byte_counter.value()[0],
+        total_size,
+        delta=total_size * 0.05)
+
   def test_should_sample(self):
     # Order of magnitude more buckets than highest constant in code under test.
     buckets = [0] * 300
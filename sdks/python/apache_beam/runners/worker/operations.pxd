@@ -96,6 +96,11 @@ cdef class DoOperation(Operation):
   cdef public dict timer_inputs
   cdef dict timer_specs
   cdef public object input_info
+  cdef readonly long process_latency_sampling_period
+  cdef long process_latency_countdown
+  cdef readonly object process_latency
+
+  cdef inline bint _should_time_process(self)
 
 
 cdef class SdfProcessSizedElements(DoOperation):
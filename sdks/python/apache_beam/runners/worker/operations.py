@@ -26,6 +26,7 @@ from __future__ import absolute_import
 
 import collections
 import logging
+import random
 import sys
 import threading
 import time
@@ -66,6 +67,7 @@ from apache_beam.transforms import window
 from apache_beam.transforms.combiners import PhasedCombineFnExecutor
 from apache_beam.transforms.combiners import curry_combine_fn
 from apache_beam.transforms.window import GlobalWindows
+from apache_beam.utils.histogram import LogLinearHistogram
 from apache_beam.utils.windowed_value import WindowedValue
 
 if TYPE_CHECKING:
@@ -554,6 +556,8 @@ class _TaggedReceivers(dict):
 class DoOperation(Operation):
   """A Do operation that will execute a custom DoFn for each input element."""
 
+  PROCESS_LATENCY_URN = 'beam:metric:pardo_execution_time:process_latency_us'
+
   def __init__(self,
                name,  # type: common.NameContext
                spec,  # operation_specs.WorkerDoFn  # need to fix this type
@@ -561,7 +565,8 @@ class DoOperation(Operation):
                sampler,
                side_input_maps=None,
                user_state_context=None,
-               timer_inputs=None
+               timer_inputs=None,
+               process_latency_sampling_period=0
               ):
     super(DoOperation, self).__init__(name, spec, counter_factory, sampler)
     self.side_input_maps = side_input_maps
@@ -570,6 +575,11 @@ class DoOperation(Operation):
     # A mapping of timer tags to the input "PCollections" they come in on.
     self.timer_inputs = timer_inputs or {}
     self.input_info = None  # type: Optional[Tuple[str, str, coders.WindowedValueCoder, MutableMapping[str, str]]]
+    # If set, about one in process_latency_sampling_period calls to process
+    # are timed, in microseconds.
+    self.process_latency_sampling_period = process_latency_sampling_period
+    self.process_latency_countdown = 0
+    self.process_latency = LogLinearHistogram()
 
   def _read_side_inputs(self, tags_and_types):
     # type: (...) -> Iterator[apache_sideinputs.SideInputMap]
@@ -695,12 +705,34 @@ class DoOperation(Operation):
   def process(self, o):
     # type: (WindowedValue) -> None
     with self.scoped_process_state:
-      delayed_application = self.dofn_runner.process(o)
+      if self.process_latency_sampling_period and self._should_time_process():
+        start = time.time()
+        delayed_application = self.dofn_runner.process(o)
+        self.process_latency.add(int((time.time() - start) * 1e6))
+      else:
+        delayed_application = self.dofn_runner.process(o)
       if delayed_application:
         assert self.execution_context is not None
         self.execution_context.delayed_applications.append(
             (self, delayed_application))
 
+  def _should_time_process(self):
+    # type: () -> bool
+
+    """Determines whether to time the next call to process.
+
+    The gaps between two timed calls are drawn uniformly at random with the
+    sampling period as their mean, so that the timed calls do not align with
+    periodic patterns in the input, and a random number is drawn only once per
+    timed call.
+    """
+    self.process_latency_countdown -= 1
+    if self.process_latency_countdown > 0:
+      return False
+    self.process_latency_countdown = random.randint(
+        1, 2 * self.process_latency_sampling_period - 1)
+    return True
+
   def finalize_bundle(self):
     # type: () -> None
     self.dofn_runner.finalize()
@@ -732,6 +764,7 @@ class DoOperation(Operation):
     super(DoOperation, self).reset()
     for side_input_map in self.side_input_maps:
       side_input_map.reset()
+    self.process_latency = LogLinearHistogram()
     if self.user_state_context:
       self.user_state_context.reset()
     self.dofn_runner.bundle_finalizer_param.reset()
@@ -769,6 +802,12 @@ class DoOperation(Operation):
             ptransform=transform_id,
             tag=str(tag))
         infos[monitoring_infos.to_key(sampled_byte_count)] = sampled_byte_count
+    if self.process_latency.count():
+      mi = monitoring_infos.int64_histogram(
+          self.PROCESS_LATENCY_URN,
+          self.process_latency,
+          ptransform=transform_id)
+      infos[monitoring_infos.to_key(mi)] = mi
     return infos
 
 
@@ -0,0 +1,107 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for worker operations."""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import time
+import unittest
+
+from apache_beam import coders
+from apache_beam.internal import pickler
+from apache_beam.metrics import monitoring_infos
+from apache_beam.runners import common
+from apache_beam.runners.worker import operation_specs
+from apache_beam.runners.worker import operations
+from apache_beam.runners.worker import statesampler
+from apache_beam.transforms import core
+from apache_beam.transforms import window
+from apache_beam.utils.counters import CounterFactory
+from apache_beam.utils.windowed_value import WindowedValue
+
+
+class SleepDoFn(core.DoFn):
+  def process(self, element):
+    if element == 0:
+      time.sleep(0.05)
+    yield element
+
+
+class DoOperationTest(unittest.TestCase):
+  def create_do_operation(self, fn, process_latency_sampling_period):
+    counter_factory = CounterFactory()
+    state_sampler = statesampler.StateSampler('test', counter_factory)
+    spec = operation_specs.WorkerDoFn(
+        serialized_fn=pickler.dumps(
+            (fn, (), {}, [], core.Windowing(window.GlobalWindows()))),
+        output_tags=['out'],
+        input=None,
+        side_inputs=None,
+        output_coders=[coders.WindowedValueCoder(coders.VarIntCoder())])
+    op = operations.DoOperation(
+        common.NameContext('step', 'transform'),
+        spec,
+        counter_factory,
+        state_sampler,
+        process_latency_sampling_period=process_latency_sampling_period)
+    op.setup()
+    return op
+
+  def process_bundle(self, op, num_elements):
+    op.start()
+    for i in range(num_elements):
+      op.process(WindowedValue(i, 0, [window.GlobalWindow()]))
+    op.finish()
+
+  def process_latency(self, op):
+    infos = [
+        mi for mi in op.monitoring_infos('transform').values()
+        if mi.urn == operations.DoOperation.PROCESS_LATENCY_URN
+    ]
+    if not infos:
+      return None
+    [mi] = infos
+    self.assertEqual(mi.labels[monitoring_infos.PTRANSFORM_LABEL], 'transform')
+    return monitoring_infos.extract_histogram(mi)
+
+  def test_process_latency_disabled(self):
+    op = self.create_do_operation(SleepDoFn(), 0)
+    self.process_bundle(op, 10)
+    self.assertIsNone(self.process_latency(op))
+
+  def test_process_latency_all_timed(self):
+    op = self.create_do_operation(SleepDoFn(), 1)
+    self.process_bundle(op, 10)
+    latency = self.process_latency(op)
+    self.assertEqual(latency.count(), 10)
+    self.assertGreaterEqual(latency.max(), 50000)
+    self.assertLess(latency.percentile(50), 50000)
+
+    op.reset()
+    self.assertIsNone(self.process_latency(op))
+
+  def test_process_latency_sampled(self):
+    op = self.create_do_operation(SleepDoFn(), 10)
+    self.process_bundle(op, 10000)
+    self.assertTrue(500 < self.process_latency(op).count() < 2000)
+
+
+if __name__ == '__main__':
+  unittest.main()
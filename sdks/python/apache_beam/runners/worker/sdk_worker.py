@@ -26,7 +26,9 @@ from __future__ import print_function
 import abc
 import collections
 import contextlib
+import functools
 import logging
+import os
 import queue
 import sys
 import threading
@@ -50,6 +52,7 @@ from future.utils import raise_
 from future.utils import with_metaclass
 
 from apache_beam.coders import coder_impl
+from apache_beam.metrics import monitoring_infos
 from apache_beam.portability.api import beam_fn_api_pb2
 from apache_beam.portability.api import beam_fn_api_pb2_grpc
 from apache_beam.runners.worker import bundle_processor
@@ -60,11 +63,16 @@ from apache_beam.runners.worker.data_plane import PeriodicThread
 from apache_beam.runners.worker.statecache import StateCache
 from apache_beam.runners.worker.worker_id_interceptor import WorkerIdInterceptor
 from apache_beam.runners.worker.worker_status import FnApiWorkerStatusHandler
+from apache_beam.runners.worker.worker_status import tracked_thread_states
+from apache_beam.runners.worker.worker_status import tracked_thread_steps
 from apache_beam.utils.thread_pool_executor import UnboundedThreadPoolExecutor
 
 if TYPE_CHECKING:
   from apache_beam.portability.api import endpoints_pb2
+  from apache_beam.portability.api import metrics_pb2
   from apache_beam.utils.profiler import Profile
+  from apache_beam.utils.profiler import StackSampler
+  from apache_beam.utils.profiler import StepMemoryTracker
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -89,6 +97,13 @@ class SdkHarness(object):
                data_buffer_time_limit_ms=0,
                profiler_factory=None,  # type: Optional[Callable[..., Profile]]
                status_address=None,  # type: Optional[str]
+               stack_sampler_factory=None,  # type: Optional[Callable[..., StackSampler]]
+               memory_tracker_factory=None,  # type: Optional[Callable[..., StepMemoryTracker]]
+               # timing of the calls to process is disabled by default
+               process_latency_sampling_period=0,
+               # bundle processors are created on demand by default
+               bundle_processor_prewarm_count=0,
+               bundle_processor_memory_limit_bytes=0,
                ):
     self._alive = True
     self._worker_index = 0
@@ -117,13 +132,35 @@ class SdkHarness(object):
     self._bundle_processor_cache = BundleProcessorCache(
         state_handler_factory=self._state_handler_factory,
         data_channel_factory=self._data_channel_factory,
-        fns=self._fns)
+        fns=self._fns,
+        process_latency_sampling_period=process_latency_sampling_period,
+        prewarm_count=bundle_processor_prewarm_count,
+        memory_limit_bytes=bundle_processor_memory_limit_bytes)
+
+    if stack_sampler_factory:
+      self._stack_sampler = stack_sampler_factory(
+          functools.partial(
+              tracked_thread_states,
+              self._bundle_processor_cache))  # type: Optional[StackSampler]
+      self._stack_sampler.start()
+    else:
+      self._stack_sampler = None
+
+    if memory_tracker_factory:
+      self._memory_tracker = memory_tracker_factory(
+          functools.partial(tracked_thread_steps, self._bundle_processor_cache)
+      )  # type: Optional[StepMemoryTracker]
+      self._memory_tracker.start()
+    else:
+      self._memory_tracker = None
 
     if status_address:
       try:
         self._status_handler = FnApiWorkerStatusHandler(
-            status_address, self._bundle_processor_cache
-        )  # type: Optional[FnApiWorkerStatusHandler]
+            status_address,
+            self._bundle_processor_cache,
+            self._stack_sampler,
+            self._memory_tracker)  # type: Optional[FnApiWorkerStatusHandler]
       except Exception:
         traceback_string = traceback.format_exc()
         _LOGGER.warning(
@@ -178,6 +215,10 @@ class SdkHarness(object):
     self._bundle_processor_cache.shutdown()
     if self._status_handler:
       self._status_handler.close()
+    if self._stack_sampler:
+      self._stack_sampler.stop()
+    if self._memory_tracker:
+      self._memory_tracker.stop()
     _LOGGER.info('Done consuming work.')
 
   def _execute(self,
@@ -254,6 +295,9 @@ class SdkHarness(object):
     return SdkWorker(
         self._bundle_processor_cache,
         state_cache_metrics_fn=self._state_cache.get_monitoring_infos,
+        memory_metrics_fn=(
+            self._memory_tracker.monitoring_infos
+            if self._memory_tracker else list),
         profiler_factory=self._profiler_factory)
 
 
@@ -263,6 +307,13 @@ class BundleProcessorCache(object):
   ``BundleProcessor`` objects are cached by the id of their
   ``beam_fn_api_pb2.ProcessBundleDescriptor``.
 
+  Creating a ``BundleProcessor`` deserializes and sets up all of its DoFns,
+  which may take a while. To keep this off the critical path of the first
+  bundles, a number of processors can be created in the background for each
+  descriptor as soon as it is registered. Idle processors are shut down when
+  their descriptor has not been used for a while, or when the resident memory
+  of the process exceeds a limit.
+
   Attributes:
     fns (dict): A dictionary that maps bundle descriptor IDs to instances of
       ``beam_fn_api_pb2.ProcessBundleDescriptor``.
@@ -270,6 +321,12 @@ class BundleProcessorCache(object):
       handlers to be used by a ``bundle_processor.BundleProcessor`` during
       processing.
     data_channel_factory (``data_plane.DataChannelFactory``)
+    process_latency_sampling_period (int): If set, the ParDo operations time
+      about one in this many of their calls to process.
+    prewarm_count (int): The number of bundle processors to create in the
+      background for each registered descriptor.
+    memory_limit_bytes (int): If set, the idle bundle processors are shut down
+      whenever the resident memory of the process exceeds this many bytes.
     active_bundle_processors (dict): A dictionary, indexed by instruction IDs,
       containing ``bundle_processor.BundleProcessor`` objects that are currently
       active processing the corresponding instruction.
@@ -278,27 +335,53 @@ class BundleProcessorCache(object):
       performing processing.
   """
 
+  PREFIX = 'beam:metric:bundle_processor_cache:'
+
   def __init__(self,
                state_handler_factory,  # type: StateHandlerFactory
                data_channel_factory,  # type: data_plane.DataChannelFactory
-               fns  # type: Dict[str, beam_fn_api_pb2.ProcessBundleDescriptor]
+               fns,  # type: Dict[str, beam_fn_api_pb2.ProcessBundleDescriptor]
+               process_latency_sampling_period=0,  # type: int
+               prewarm_count=0,  # type: int
+               memory_limit_bytes=0  # type: int
               ):
     self.fns = fns
     self.state_handler_factory = state_handler_factory
     self.data_channel_factory = data_channel_factory
+    self.process_latency_sampling_period = process_latency_sampling_period
+    self.prewarm_count = prewarm_count
+    self.memory_limit_bytes = memory_limit_bytes
     self.active_bundle_processors = {
     }  # type: Dict[str, Tuple[str, bundle_processor.BundleProcessor]]
     self.cached_bundle_processors = collections.defaultdict(
         list)  # type: DefaultDict[str, List[bundle_processor.BundleProcessor]]
     self.last_access_times = \
         collections.defaultdict(float)  # type: DefaultDict[str, float]
+    # Guards the fields below.
+    self._lock = threading.Lock()
+    self._prewarming = collections.defaultdict(
+        list)  # type: DefaultDict[str, List[futures.Future]]
+    self._metrics = collections.defaultdict(int)  # type: DefaultDict[str, int]
+    self._closed = False
+    self._prewarm_executor = UnboundedThreadPoolExecutor()
     self._schedule_periodic_shutdown()
 
   def register(self, bundle_descriptor):
     # type: (beam_fn_api_pb2.ProcessBundleDescriptor) -> None
 
-    """Register a ``beam_fn_api_pb2.ProcessBundleDescriptor`` by its id."""
+    """Register a ``beam_fn_api_pb2.ProcessBundleDescriptor`` by its id.
+
+    Starts creating ``prewarm_count`` bundle processors for it in the
+    background.
+    """
     self.fns[bundle_descriptor.id] = bundle_descriptor
+    for _ in range(self.prewarm_count):
+      future = self._prewarm_executor.submit(
+          self._create_bundle_processor, bundle_descriptor.id)
+      with self._lock:
+        self._prewarming[bundle_descriptor.id].append(future)
+      future.add_done_callback(
+          functools.partial(self._prewarmed, bundle_descriptor.id))
 
   def get(self, instruction_id, bundle_descriptor_id):
     # type: (str, str) -> bundle_processor.BundleProcessor
@@ -307,16 +390,28 @@ class BundleProcessorCache(object):
     Return the requested ``BundleProcessor``, creating it if necessary.
 
     Moves the ``BundleProcessor`` from the inactive to the active cache.
+    Waits for a bundle processor being created in the background, if any,
+    rather than creating one more.
     """
     try:
       # pop() is threadsafe
       processor = self.cached_bundle_processors[bundle_descriptor_id].pop()
+      self._count('hit')
     except IndexError:
-      processor = bundle_processor.BundleProcessor(
-          self.fns[bundle_descriptor_id],
-          self.state_handler_factory.create_state_handler(
-              self.fns[bundle_descriptor_id].state_api_service_descriptor),
-          self.data_channel_factory)
+      with self._lock:
+        prewarming = self._prewarming[bundle_descriptor_id]
+        future = prewarming.pop() if prewarming else None
+      processor = None
+      if future is not None:
+        self._count('prewarm_wait')
+        try:
+          processor = future.result()
+        except Exception:  # pylint: disable=broad-except
+          # Creating it again below reports the failure to the runner.
+          pass
+      if processor is None:
+        self._count('miss')
+        processor = self._create_bundle_processor(bundle_descriptor_id)
     self.active_bundle_processors[
         instruction_id] = bundle_descriptor_id, processor
     return processor
@@ -345,12 +440,42 @@ class BundleProcessorCache(object):
     Release the requested ``BundleProcessor``.
 
     Resets the ``BundleProcessor`` and moves it from the active to the
-    inactive cache.
+    inactive cache, unless the process is using too much memory.
     """
     descriptor_id, processor = self.active_bundle_processors.pop(instruction_id)
+    if self._over_memory_limit():
+      processor.shutdown()
+      self._count('evicted')
+      self._shutdown_idle_bundle_processors()
+      return
     processor.reset()
-    self.last_access_times[descriptor_id] = time.time()
-    self.cached_bundle_processors[descriptor_id].append(processor)
+    with self._lock:
+      self.last_access_times[descriptor_id] = time.time()
+      self.cached_bundle_processors[descriptor_id].append(processor)
+
+  def monitoring_infos(self):
+    # type: () -> List[metrics_pb2.MonitoringInfo]
+
+    """Returns the counts of cache hits, misses and evictions since the last
+    call, along with the number of idle bundle processors.
+    """
+    with self._lock:
+      counts = dict(self._metrics)
+      self._metrics.clear()
+    if not counts:
+      return []
+    infos = [
+        monitoring_infos.int64_counter(self.PREFIX + name + '_total', count)
+        for name,
+        count in sorted(counts.items())
+    ]
+    infos.append(
+        monitoring_infos.int64_gauge(
+            self.PREFIX + 'idle',
+            sum(
+                len(processors)
+                for processors in self.cached_bundle_processors.values())))
+    return infos
 
   def shutdown(self):
     """
@@ -361,20 +486,96 @@ class BundleProcessorCache(object):
       self.periodic_shutdown.join()
       self.periodic_shutdown = None
 
-    for instruction_id in self.active_bundle_processors:
+    with self._lock:
+      self._closed = True
+      prewarming = [f for fs in self._prewarming.values() for f in fs]
+    for future in prewarming:
+      future.cancel()
+    self._prewarm_executor.shutdown()
+
+    for instruction_id in list(self.active_bundle_processors):
       self.active_bundle_processors[instruction_id][1].shutdown()
       del self.active_bundle_processors[instruction_id]
     for cached_bundle_processors in self.cached_bundle_processors.values():
       BundleProcessorCache._shutdown_cached_bundle_processors(
           cached_bundle_processors)
 
+  def _create_bundle_processor(self, bundle_descriptor_id):
+    # type: (str) -> bundle_processor.BundleProcessor
+    return bundle_processor.BundleProcessor(
+        self.fns[bundle_descriptor_id],
+        self.state_handler_factory.create_state_handler(
+            self.fns[bundle_descriptor_id].state_api_service_descriptor),
+        self.data_channel_factory,
+        self.process_latency_sampling_period)
+
+  def _prewarmed(self, bundle_descriptor_id, future):
+    # type: (str, futures.Future) -> None
+    with self._lock:
+      try:
+        self._prewarming[bundle_descriptor_id].remove(future)
+      except ValueError:
+        # Claimed by get().
+        return
+      closed = self._closed
+    if future.cancelled():
+      return
+    elif future.exception() is not None:
+      _LOGGER.warning(
+          'Failed to prewarm a bundle processor for %s: %s',
+          bundle_descriptor_id,
+          future.exception())
+    elif closed:
+      future.result().shutdown()
+    else:
+      self._count('prewarmed')
+      # The periodic shutdown iterates over these from another thread.
+      with self._lock:
+        self.last_access_times[bundle_descriptor_id] = time.time()
+        self.cached_bundle_processors[bundle_descriptor_id].append(
+            future.result())
+
+  def _count(self, name, value=1):
+    # type: (str, int) -> None
+    if value:
+      with self._lock:
+        self._metrics[name] += value
+
+  def _over_memory_limit(self):
+    # type: () -> bool
+    if not self.memory_limit_bytes:
+      return False
+    resident_bytes = _resident_memory_bytes()
+    return resident_bytes is not None and (
+        resident_bytes > self.memory_limit_bytes)
+
+  def _shutdown_idle_bundle_processors(self):
+    with self._lock:
+      all_cached_bundle_processors = list(
+          self.cached_bundle_processors.values())
+    for cached_bundle_processors in all_cached_bundle_processors:
+      self._count(
+          'evicted',
+          BundleProcessorCache._shutdown_cached_bundle_processors(
+              cached_bundle_processors))
+
   def _schedule_periodic_shutdown(self):
     def shutdown_inactive_bundle_processors():
-      for descriptor_id, last_access_time in self.last_access_times.items():
+      if self._over_memory_limit():
+        _LOGGER.info(
+            'Resident memory over %d bytes, '
+            'shutting down idle bundle processors.',
+            self.memory_limit_bytes)
+        self._shutdown_idle_bundle_processors()
+      with self._lock:
+        last_access_times = list(self.last_access_times.items())
+      for descriptor_id, last_access_time in last_access_times:
         if (time.time() - last_access_time >
             DEFAULT_BUNDLE_PROCESSOR_CACHE_SHUTDOWN_THRESHOLD_S):
-          BundleProcessorCache._shutdown_cached_bundle_processors(
-              self.cached_bundle_processors[descriptor_id])
+          self._count(
+              'evicted',
+              BundleProcessorCache._shutdown_cached_bundle_processors(
+                  self.cached_bundle_processors[descriptor_id]))
 
     self.periodic_shutdown = PeriodicThread(
         DEFAULT_BUNDLE_PROCESSOR_CACHE_SHUTDOWN_THRESHOLD_S,
@@ -384,13 +585,27 @@ class BundleProcessorCache(object):
 
   @staticmethod
   def _shutdown_cached_bundle_processors(cached_bundle_processors):
+    num_shutdown = 0
     try:
       while True:
         # pop() is threadsafe
         bundle_processor = cached_bundle_processors.pop()
         bundle_processor.shutdown()
+        num_shutdown += 1
     except IndexError:
       pass
+    return num_shutdown
+
+
+def _resident_memory_bytes():
+  # type: () -> Optional[int]
+
+  """Returns the resident memory of this process, or None if unknown."""
+  try:
+    with open('/proc/self/statm') as statm:
+      return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+  except (AttributeError, EnvironmentError, ValueError):
+    return None
 
 
 class SdkWorker(object):
@@ -400,9 +615,11 @@ class SdkWorker(object):
                state_cache_metrics_fn=list,
                profiler_factory=None,  # type: Optional[Callable[..., Profile]]
                log_lull_timeout_ns=None,
+               memory_metrics_fn=list,
               ):
     self.bundle_processor_cache = bundle_processor_cache
     self.state_cache_metrics_fn = state_cache_metrics_fn
+    self.memory_metrics_fn = memory_metrics_fn
     self.profiler_factory = profiler_factory
     self.log_lull_timeout_ns = (
         log_lull_timeout_ns or DEFAULT_LOG_LULL_TIMEOUT_NS)
@@ -451,6 +668,9 @@ class SdkWorker(object):
               bundle_processor.process_bundle(instruction_id))
           monitoring_infos = bundle_processor.monitoring_infos()
           monitoring_infos.extend(self.state_cache_metrics_fn())
+          monitoring_infos.extend(self.memory_metrics_fn())
+          monitoring_infos.extend(
+              self.bundle_processor_cache.monitoring_infos())
           response = beam_fn_api_pb2.InstructionResponse(
               instruction_id=instruction_id,
               process_bundle=beam_fn_api_pb2.ProcessBundleResponse(
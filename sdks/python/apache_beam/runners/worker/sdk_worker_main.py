@@ -155,7 +155,17 @@ def main(unused_argv):
         data_buffer_time_limit_ms=_get_data_buffer_time_limit_ms(
             sdk_pipeline_options),
         profiler_factory=profiler.Profile.factory_from_options(
-            sdk_pipeline_options.view_as(ProfilingOptions))).run()
+            sdk_pipeline_options.view_as(ProfilingOptions)),
+        stack_sampler_factory=profiler.StackSampler.factory_from_options(
+            sdk_pipeline_options.view_as(ProfilingOptions)),
+        memory_tracker_factory=profiler.StepMemoryTracker.factory_from_options(
+            sdk_pipeline_options.view_as(ProfilingOptions)),
+        process_latency_sampling_period=_get_process_latency_sampling_period(
+            sdk_pipeline_options),
+        bundle_processor_prewarm_count=_get_bundle_processor_prewarm_count(
+            sdk_pipeline_options),
+        bundle_processor_memory_limit_bytes=
+        _get_bundle_processor_memory_limit_bytes(sdk_pipeline_options)).run()
     _LOGGER.info('Python sdk harness exiting.')
   except:  # pylint: disable=broad-except
     _LOGGER.exception('Python sdk harness failed: ')
@@ -226,6 +236,51 @@ def _get_data_buffer_time_limit_ms(pipeline_options):
   return 0
 
 
+def _get_process_latency_sampling_period(pipeline_options):
+  """Defines how often the calls to process of the ParDos are timed.
+
+  Returns:
+    an int n such that about one in n calls to process is timed.
+      Default is 0 (disabled)
+  """
+  profiling_options = pipeline_options.view_as(ProfilingOptions)
+  if profiling_options.profile_process_latency:
+    return profiling_options.profile_process_latency_sampling_period
+  return 0
+
+
+def _get_bundle_processor_prewarm_count(pipeline_options):
+  """Defines how many bundle processors to create ahead of time.
+
+  Note: prewarm_bundle_processors is an experimental flag and might not be
+  available in future releases.
+
+  Returns:
+    an int indicating the number of bundle processors to create in the
+      background for each registered bundle descriptor. Default is 0
+      (disabled)
+  """
+  return int(
+      pipeline_options.view_as(DebugOptions).lookup_experiment(
+          'prewarm_bundle_processors', 0))
+
+
+def _get_bundle_processor_memory_limit_bytes(pipeline_options):
+  """Defines the memory usage above which idle bundle processors are evicted.
+
+  Note: bundle_processor_memory_limit_mb is an experimental flag and might
+  not be available in future releases.
+
+  Returns:
+    an int indicating the resident memory of the worker process in bytes
+      above which the idle bundle processors are shut down. Default is 0
+      (disabled)
+  """
+  return int(
+      pipeline_options.view_as(DebugOptions).lookup_experiment(
+          'bundle_processor_memory_limit_mb', 0)) << 20
+
+
 def _load_main_session(semi_persistent_directory):
   """Loads a pickled main session from the path specified."""
   if semi_persistent_directory:
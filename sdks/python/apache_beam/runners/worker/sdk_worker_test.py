@@ -25,12 +25,16 @@ from __future__ import print_function
 
 import contextlib
 import logging
+import threading
+import time
 import unittest
 from builtins import range
 
 import grpc
+import mock
 
 from apache_beam.coders import VarIntCoder
+from apache_beam.metrics import monitoring_infos
 from apache_beam.portability.api import beam_fn_api_pb2
 from apache_beam.portability.api import beam_fn_api_pb2_grpc
 from apache_beam.portability.api import beam_runner_api_pb2
@@ -118,6 +122,114 @@ class SdkWorkerTest(unittest.TestCase):
   def test_fn_registration(self):
     self._check_fn_registration_multi_request((1, 4), (4, 4))
 
+  def test_stack_sampler(self):
+    server = grpc.server(UnboundedThreadPoolExecutor())
+    beam_fn_api_pb2_grpc.add_BeamFnControlServicer_to_server(
+        BeamFnControlServicer([
+            beam_fn_api_pb2.InstructionRequest(
+                instruction_id='0', register=beam_fn_api_pb2.RegisterRequest())
+        ]),
+        server)
+    test_port = server.add_insecure_port("[::]:0")
+    server.start()
+
+    stack_sampler = mock.Mock()
+    stack_sampler_factory = mock.Mock(return_value=stack_sampler)
+    harness = sdk_worker.SdkHarness(
+        "localhost:%s" % test_port, stack_sampler_factory=stack_sampler_factory)
+    stack_sampler.start.assert_called_once_with()
+    harness.run()
+    stack_sampler.stop.assert_called_once_with()
+
+    # No thread is processing a bundle.
+    thread_states_fn, = stack_sampler_factory.call_args[0]
+    self.assertEqual(thread_states_fn(), {})
+
+
+class BundleProcessorCacheTest(unittest.TestCase):
+  def setUp(self):
+    patcher = mock.patch.object(
+        sdk_worker.bundle_processor, 'BundleProcessor', autospec=True)
+    self.bundle_processor_class = patcher.start()
+    self.bundle_processor_class.side_effect = lambda *args: mock.Mock()
+    self.addCleanup(patcher.stop)
+    self.descriptor = beam_fn_api_pb2.ProcessBundleDescriptor(id='descriptor')
+
+  def create_cache(self, **kwargs):
+    cache = sdk_worker.BundleProcessorCache(
+        mock.Mock(), mock.Mock(), {}, **kwargs)
+    self.addCleanup(cache.shutdown)
+    return cache
+
+  def counters(self, cache):
+    prefix = sdk_worker.BundleProcessorCache.PREFIX
+    return {
+        info.urn[len(prefix):]: monitoring_infos.extract_counter_value(info)
+        for info in cache.monitoring_infos()
+    }
+
+  def test_prewarm(self):
+    cache = self.create_cache(prewarm_count=2)
+    cache.register(self.descriptor)
+    while len(cache.cached_bundle_processors['descriptor']) < 2:
+      time.sleep(0.01)
+    self.assertEqual(self.bundle_processor_class.call_count, 2)
+
+    first = cache.get('instruction1', 'descriptor')
+    second = cache.get('instruction2', 'descriptor')
+    cache.get('instruction3', 'descriptor')
+    self.assertEqual(self.bundle_processor_class.call_count, 3)
+    cache.release('instruction1')
+    self.assertIs(cache.get('instruction4', 'descriptor'), first)
+    self.assertIsNot(first, second)
+
+    self.assertEqual(
+        self.counters(cache), {
+            'prewarmed_total': 2,
+            'hit_total': 3,
+            'miss_total': 1,
+            'idle': 0,
+        })
+    self.assertEqual(cache.monitoring_infos(), [])
+
+  def test_get_waits_for_prewarm(self):
+    proceed = threading.Event()
+    self.bundle_processor_class.side_effect = (
+        lambda *args: proceed.wait() and mock.Mock())
+    cache = self.create_cache(prewarm_count=1)
+    cache.register(self.descriptor)
+    getter = threading.Thread(
+        target=cache.get, args=('instruction', 'descriptor'))
+    getter.start()
+    # Wait for the getter to claim the bundle processor being prewarmed.
+    while cache._prewarming['descriptor']:
+      time.sleep(0.01)
+    proceed.set()
+    getter.join()
+
+    self.assertEqual(self.bundle_processor_class.call_count, 1)
+    self.assertIsNotNone(cache.lookup('instruction'))
+    self.assertEqual(cache.cached_bundle_processors['descriptor'], [])
+    self.assertEqual(self.counters(cache), {'prewarm_wait_total': 1, 'idle': 0})
+
+  def test_memory_limit(self):
+    cache = self.create_cache(memory_limit_bytes=1 << 40)
+    cache.register(self.descriptor)
+    idle = cache.get('instruction1', 'descriptor')
+    cache.release('instruction1')
+    processor = cache.get('instruction2', 'descriptor')
+    self.assertIs(processor, idle)
+    cache.get('instruction3', 'descriptor')
+    cache.release('instruction3')
+
+    with mock.patch.object(sdk_worker,
+                           '_resident_memory_bytes',
+                           return_value=2 << 40):
+      cache.release('instruction2')
+    processor.shutdown.assert_called_once_with()
+    self.assertEqual(cache.cached_bundle_processors['descriptor'], [])
+    self.assertEqual(self.counters(cache)['evicted_total'], 2)
+
 
 class CachingStateHandlerTest(unittest.TestCase):
   def test_caching(self):
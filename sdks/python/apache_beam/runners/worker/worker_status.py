@@ -100,20 +100,91 @@ def _active_processing_bundles_state(bundle_process_cache):
   return '\n'.join(active_bundles)
 
 
+def _tracked_state_samplers(bundle_process_cache):
+  """Yields the state samplers of the active bundle processors."""
+  for instruction in list(bundle_process_cache.active_bundle_processors.keys()):
+    processor = bundle_process_cache.lookup(instruction)
+    if processor and processor.state_sampler.tracked_thread:
+      yield processor.state_sampler
+
+
+def tracked_thread_states(bundle_process_cache):
+  """Returns the states of the threads processing bundles, by thread ident.
+
+  The states are the ones tracked by the state samplers of the active bundle
+  processors, named after the step and its state, e.g. 'MyStep/process'.
+  """
+  thread_states = {}
+  for state_sampler in _tracked_state_samplers(bundle_process_cache):
+    info = state_sampler.get_info()
+    state_name = info.state_name
+    name = state_name.name
+    if name.endswith('-msecs'):
+      name = name[:-len('-msecs')]
+    if state_name.step_name:
+      name = '%s/%s' % (state_name.step_name, name)
+    thread_states[info.tracked_thread.ident] = name
+  return thread_states
+
+
+def tracked_thread_steps(bundle_process_cache):
+  """Returns the ids of the transforms the threads processing bundles are in.
+
+  Threads which are not in the state of a transform are omitted.
+  """
+  thread_steps = {}
+  for state_sampler in _tracked_state_samplers(bundle_process_cache):
+    name_context = state_sampler.current_state().name_context
+    if name_context and name_context.transform_id:
+      thread_steps[state_sampler.tracked_thread.ident] = (
+          name_context.transform_id)
+  return thread_steps
+
+
+def _sampled_stacks(stack_sampler):
+  """Gather the stacks sampled by the stack sampler, for flame graphs."""
+  return '\n'.join([
+      '=' * 10 + 'SAMPLED STACKS' + '=' * 10,
+      stack_sampler.folded_stacks(),
+      '=' * 30
+  ])
+
+
+def _memory_usage(memory_tracker):
+  """Gather the memory held by each step, and the top allocation sites."""
+  memory_usage = ['=' * 10 + 'STEP MEMORY USAGE' + '=' * 10]
+  for step, live_bytes in sorted(memory_tracker.live_bytes().items(),
+                                 key=lambda x: x[1], reverse=True):
+    memory_usage.append('%s: %d bytes' % (step, live_bytes))
+  memory_usage.append('--- top allocation sites ---')
+  memory_usage.append(memory_tracker.top_allocation_sites())
+  memory_usage.append('=' * 30)
+  return '\n'.join(memory_usage)
+
+
 DONE = object()
 
 
 class FnApiWorkerStatusHandler(object):
   """FnApiWorkerStatusHandler handles worker status request from Runner. """
-  def __init__(self, status_address, bundle_process_cache=None):
+  def __init__(
+      self,
+      status_address,
+      bundle_process_cache=None,
+      stack_sampler=None,
+      memory_tracker=None):
     """Initialize FnApiWorkerStatusHandler.
 
     Args:
       status_address: The URL Runner uses to host the WorkerStatus server.
       bundle_process_cache: The BundleProcessor cache dict from sdk worker.
+      stack_sampler: The StackSampler of the sdk worker, if any.
+      memory_tracker: The StepMemoryTracker of the sdk worker, if any.
     """
     self._alive = True
     self._bundle_process_cache = bundle_process_cache
+    self._stack_sampler = stack_sampler
+    self._memory_tracker = memory_tracker
     ch = GRPCChannelFactory.insecure_channel(status_address)
     grpc.channel_ready_future(ch).result(timeout=60)
     self._status_channel = grpc.intercept_channel(ch, WorkerIdInterceptor())
@@ -152,6 +223,10 @@ class FnApiWorkerStatusHandler(object):
     all_status_sections = [
         _active_processing_bundles_state(self._bundle_process_cache)
     ] if self._bundle_process_cache else []
+    if self._stack_sampler:
+      all_status_sections.append(_sampled_stacks(self._stack_sampler))
+    if self._memory_tracker:
+      all_status_sections.append(_memory_usage(self._memory_tracker))
     all_status_sections.append(thread_dump())
     return '\n'.join(all_status_sections)
 
@@ -26,8 +26,14 @@ import mock
 
 from apache_beam.portability.api import beam_fn_api_pb2
 from apache_beam.portability.api import beam_fn_api_pb2_grpc
+from apache_beam.runners.common import NameContext
+from apache_beam.runners.worker.statesampler import StateSamplerInfo
 from apache_beam.runners.worker.worker_status import FnApiWorkerStatusHandler
+from apache_beam.runners.worker.worker_status import tracked_thread_states
+from apache_beam.runners.worker.worker_status import tracked_thread_steps
 from apache_beam.testing.util import timeout
+from apache_beam.utils.counters import CounterName
+from apache_beam.utils.profiler import StackSampler
 from apache_beam.utils.thread_pool_executor import UnboundedThreadPoolExecutor
 
 
@@ -87,6 +93,59 @@ class FnApiWorkerStatusHandlerTest(unittest.TestCase):
       self.assertIsNotNone(response.error)
     self.fn_status_handler.close()
 
+  @timeout(5)
+  def test_sampled_stacks_in_status(self):
+    stack_sampler = StackSampler(
+        thread_states_fn=lambda: {threading.current_thread().ident: 'MyStep'})
+    stack_sampler.sample_once()
+    status_handler = FnApiWorkerStatusHandler(
+        self.url, stack_sampler=stack_sampler)
+    status = status_handler.generate_status_response()
+    self.assertIn('SAMPLED STACKS', status)
+    self.assertIn('\nMyStep;', status)
+    status_handler.close()
+    self.fn_status_handler.close()
+
+  @timeout(5)
+  def test_memory_usage_in_status(self):
+    memory_tracker = mock.Mock()
+    memory_tracker.live_bytes.return_value = {'MyStep': 1024}
+    memory_tracker.top_allocation_sites.return_value = (
+        'my_file.py:1: size=1 KiB')
+    status_handler = FnApiWorkerStatusHandler(
+        self.url, memory_tracker=memory_tracker)
+    status = status_handler.generate_status_response()
+    self.assertIn('MyStep: 1024 bytes', status)
+    self.assertIn('my_file.py:1: size=1 KiB', status)
+    status_handler.close()
+    self.fn_status_handler.close()
+
+
+class TrackedThreadStatesTest(unittest.TestCase):
+  def setUp(self):
+    self.thread = threading.current_thread()
+    processor = mock.Mock()
+    processor.state_sampler.tracked_thread = self.thread
+    processor.state_sampler.get_info.return_value = StateSamplerInfo(
+        CounterName('process-msecs', step_name='MyStep'), 1, 0, self.thread)
+    processor.state_sampler.current_state.return_value.name_context = (
+        NameContext('MyStep', 'ref_AppliedPTransform_MyStep_3'))
+    self.bundle_process_cache = mock.Mock()
+    self.bundle_process_cache.active_bundle_processors = {
+        'instruction': processor
+    }
+    self.bundle_process_cache.lookup.return_value = processor
+
+  def test_tracked_thread_states(self):
+    self.assertEqual(
+        tracked_thread_states(self.bundle_process_cache),
+        {self.thread.ident: 'MyStep/process'})
+
+  def test_tracked_thread_steps(self):
+    self.assertEqual(
+        tracked_thread_steps(self.bundle_process_cache),
+        {self.thread.ident: 'ref_AppliedPTransform_MyStep_3'})
+
 
 if __name__ == '__main__':
   logging.getLogger().setLevel(logging.INFO)
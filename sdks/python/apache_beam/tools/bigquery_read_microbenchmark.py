@@ -0,0 +1,201 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements. See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A microbenchmark for decoding the files of BigQuery exports.
+
+Writes the same rows to local files in the formats of BigQuery JSON and Avro
+exports, and reads them with the sources used by BigQuery reads, to compare
+their decoding throughput.
+
+Run as
+  python -m apache_beam.tools.bigquery_read_microbenchmark
+"""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import datetime
+import decimal
+import json
+import logging
+import os
+import random
+import shutil
+import tempfile
+
+import pytz
+from fastavro import parse_schema
+from fastavro import writer
+
+from apache_beam.io.gcp import bigquery
+from apache_beam.io.gcp.internal.clients import bigquery as bigquery_api
+from apache_beam.io.source_test_utils import read_from_source
+from apache_beam.tools import utils
+
+TABLE_FIELDS = [
+    ('id', 'INTEGER', 'REQUIRED', {
+        'type': 'long'
+    }),
+    ('name', 'STRING', 'NULLABLE', ['null', 'string']),
+    ('score', 'FLOAT', 'NULLABLE', ['null', 'double']),
+    ('active', 'BOOLEAN', 'NULLABLE', ['null', 'boolean']),
+    (
+        'amount',
+        'NUMERIC',
+        'NULLABLE',
+        [
+            'null',
+            {
+                'type': 'bytes',
+                'logicalType': 'decimal',
+                'precision': 38,
+                'scale': 9
+            }
+        ]),
+    (
+        'created',
+        'TIMESTAMP',
+        'NULLABLE',
+        ['null', {
+            'type': 'long', 'logicalType': 'timestamp-micros'
+        }]),
+    ('tags', 'STRING', 'REPEATED', {
+        'type': 'array', 'items': 'string'
+    }),
+]
+
+
+def table_schema():
+  schema = bigquery_api.TableSchema()
+  for name, field_type, mode, _ in TABLE_FIELDS:
+    schema.fields.append(
+        bigquery_api.TableFieldSchema(name=name, type=field_type, mode=mode))
+  return schema
+
+
+def avro_schema():
+  return parse_schema({
+      'type': 'record',
+      'name': 'Root',
+      'fields': [{
+          'name': name, 'type': avro_type
+      } for name,
+                 _,
+                 _,
+                 avro_type in TABLE_FIELDS],
+  })
+
+
+def random_row(i):
+  return {
+      'id': i,
+      'name': 'name-%d' % random.randint(0, 1000000),
+      'score': random.random(),
+      'active': random.random() < 0.5,
+      'amount': decimal.Decimal(random.randint(0, 10**12)) / 1000,
+      'created': datetime.datetime(2020, 1, 1, tzinfo=pytz.utc) +
+      datetime.timedelta(seconds=random.randint(0, 10**8)),
+      'tags': ['tag-%d' % random.randint(0, 100) for _ in range(3)],
+  }
+
+
+def json_row(row):
+  # BigQuery exports integers, booleans and numerics as strings.
+  return json.dumps({
+      'id': str(row['id']),
+      'name': row['name'],
+      'score': row['score'],
+      'active': 'true' if row['active'] else 'false',
+      'amount': str(row['amount']),
+      'created': row['created'].strftime('%Y-%m-%d %H:%M:%S.%f UTC'),
+      'tags': row['tags'],
+  })
+
+
+def write_files(directory, num_rows):
+  rows = [random_row(i) for i in range(num_rows)]
+  json_path = os.path.join(directory, 'rows.json')
+  with open(json_path, 'w') as f:
+    for row in rows:
+      f.write(json_row(row) + '\n')
+  avro_path = os.path.join(directory, 'rows.avro')
+  with open(avro_path, 'wb') as f:
+    writer(f, avro_schema(), rows)
+  return json_path, avro_path
+
+
+def read_benchmark_factory(name, create_source):
+  """Creates a benchmark that reads all the rows of a source.
+
+  Args:
+    name: the name of the benchmark.
+    create_source: a callable returning the source to read.
+  """
+  class ReadBenchmark(object):
+    def __init__(self, unused_num_rows):
+      self._source = create_source()
+
+    def __call__(self):
+      read_from_source(self._source)
+
+  ReadBenchmark.__name__ = name
+  return ReadBenchmark
+
+
+def run_bigquery_read_benchmarks(num_runs, num_rows, seed, verbose):
+  random.seed(seed)
+  directory = tempfile.mkdtemp()
+  try:
+    json_path, avro_path = write_files(directory, num_rows)
+    custom_source_args = {'table': 'project:dataset.table'}
+    json_source = bigquery._CustomBigQuerySource(**custom_source_args)
+    avro_source = bigquery._CustomBigQuerySource(
+        use_avro_exports=True, **custom_source_args)
+    columnar_source = bigquery._CustomBigQuerySource(
+        use_avro_exports=True, columnar_batches=True, **custom_source_args)
+    benchmarks = [
+        read_benchmark_factory(
+            'JSON export',
+            lambda: json_source._create_source(json_path, table_schema())),
+        read_benchmark_factory(
+            'Avro export',
+            lambda: avro_source._create_source(avro_path, table_schema())),
+        read_benchmark_factory(
+            'Avro export, columnar batches',
+            lambda: columnar_source._create_source(avro_path, table_schema())),
+    ]
+    suite = [utils.BenchmarkConfig(b, num_rows, num_runs) for b in benchmarks]
+    return utils.run_benchmarks(suite, verbose=verbose)
+  finally:
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+  logging.basicConfig()
+
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--num_runs', default=10, type=int)
+  parser.add_argument('--num_rows', default=100000, type=int)
+  parser.add_argument('--seed', default=42, type=int)
+  options = parser.parse_args()
+
+  run_bigquery_read_benchmarks(
+      options.num_runs, options.num_rows, options.seed, verbose=True)
@@ -24,6 +24,10 @@ how the coders are used in PCollections: we encode and decode
 a list of elements. An element can be a string, a list of integers,
 a windowed value, or any other object we want a coder to process.
 
+Elements of hinted types are also encoded with the coders that the registry
+picks for their type hints when specialized coders are enabled, to compare
+them with the FastPrimitivesCoder.
+
 Run as:
   python -m apache_beam.tools.coders_microbenchmark
 
@@ -41,12 +45,15 @@ import re
 import string
 import sys
 
+import numpy as np
 from past.builtins import unicode
 
 from apache_beam.coders import proto2_coder_test_messages_pb2 as test_message
 from apache_beam.coders import coders
+from apache_beam.coders import typecoders
 from apache_beam.tools import utils
 from apache_beam.transforms import window
+from apache_beam.typehints import typehints
 from apache_beam.utils import windowed_value
 
 
@@ -121,6 +128,18 @@ def large_tuple():
   return tuple(large_list())
 
 
+def str_int_tuple():
+  return small_string(), small_int()
+
+
+def str_float_dict():
+  return {small_string(): random.random() for _ in range(10)}
+
+
+def float_array():
+  return np.array([random.random() for _ in range(100)])
+
+
 def small_dict():
   return {i: i for i in small_list()}
 
@@ -178,8 +197,12 @@ def run_coder_benchmarks(
     num_runs, input_size, seed, verbose, filter_regex='.*'):
   random.seed(seed)
 
-  # TODO(BEAM-4441): Pick coders using type hints, for example:
-  # tuple_coder = typecoders.registry.get_coder(typing.Tuple[int, ...])
+  specialized_registry = typecoders.CoderRegistry()
+  specialized_registry.use_specialized_coders()
+
+  def hinted_coder(typehint):
+    return specialized_registry.get_coder(typehint)
+
   benchmarks = [
       coder_benchmark_factory(coders.FastPrimitivesCoder(), small_int),
       coder_benchmark_factory(coders.FastPrimitivesCoder(), large_int),
@@ -197,6 +220,17 @@ def run_coder_benchmarks(
       coder_benchmark_factory(coders.FastPrimitivesCoder(), large_tuple),
       coder_benchmark_factory(coders.FastPrimitivesCoder(), small_dict),
       coder_benchmark_factory(coders.FastPrimitivesCoder(), large_dict),
+      coder_benchmark_factory(coders.FastPrimitivesCoder(), str_int_tuple),
+      coder_benchmark_factory(
+          hinted_coder(typehints.Tuple[unicode, int]), str_int_tuple),
+      coder_benchmark_factory(coders.FastPrimitivesCoder(), str_float_dict),
+      coder_benchmark_factory(
+          hinted_coder(typehints.Dict[unicode, float]), str_float_dict),
+      coder_benchmark_factory(hinted_coder(typehints.List[int]), small_list),
+      coder_benchmark_factory(coders.FastPrimitivesCoder(), float_array),
+      coder_benchmark_factory(hinted_coder(np.ndarray), float_array),
+      coder_benchmark_factory(
+          hinted_coder(typehints.Tuple[int, ...]), small_tuple),
       coder_benchmark_factory(
           coders.ProtoCoder(test_message.MessageWithMap),
           small_message_with_map),
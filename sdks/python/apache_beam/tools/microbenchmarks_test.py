@@ -27,8 +27,17 @@ from pkg_resources import DistributionNotFound
 from pkg_resources import get_distribution
 
 from apache_beam.tools import coders_microbenchmark
+from apache_beam.tools import trigger_driver_microbenchmark
 from apache_beam.tools import utils
 
+# Protect against environments where GCP dependencies are not available.
+# pylint: disable=wrong-import-order, wrong-import-position
+try:
+  from apache_beam.tools import bigquery_read_microbenchmark
+except ImportError:
+  bigquery_read_microbenchmark = None
+# pylint: enable=wrong-import-order, wrong-import-position
+
 
 class MicrobenchmarksTest(unittest.TestCase):
   def test_coders_microbenchmark(self):
@@ -37,6 +46,17 @@ class MicrobenchmarksTest(unittest.TestCase):
     coders_microbenchmark.run_coder_benchmarks(
         num_runs=1, input_size=10, seed=1, verbose=False)
 
+  @unittest.skipIf(
+      bigquery_read_microbenchmark is None,
+      'GCP dependencies are not installed')
+  def test_bigquery_read_microbenchmark(self):
+    bigquery_read_microbenchmark.run_bigquery_read_benchmarks(
+        num_runs=1, num_rows=10, seed=1, verbose=False)
+
+  def test_trigger_driver_microbenchmark(self):
+    trigger_driver_microbenchmark.run_trigger_driver_benchmarks(
+        num_runs=1, input_size=10, seed=1, verbose=False)
+
   def is_cython_installed(self):
     try:
       get_distribution('cython')
@@ -0,0 +1,128 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A microbenchmark for measuring the batch grouping of windowed values.
+
+This groups the values of a single key into windows the way a batch
+GroupByKey does, with the general trigger driver and with the driver
+specialised for non-merging windows with the default trigger.
+
+Run as:
+  python -m apache_beam.tools.trigger_driver_microbenchmark
+
+"""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+import argparse
+import logging
+import random
+import re
+
+from apache_beam.portability.api import beam_runner_api_pb2
+from apache_beam.runners.direct.clock import TestClock
+from apache_beam.tools import utils
+from apache_beam.transforms import trigger
+from apache_beam.transforms import window
+from apache_beam.transforms.core import Windowing
+from apache_beam.utils import windowed_value
+
+
+def trigger_driver_benchmark_factory(driver_fn, windowing, num_windows):
+  """Creates a benchmark that groups a key's values into windows.
+
+  Args:
+    driver_fn: a callable that creates a TriggerDriver for a Windowing.
+    windowing: the Windowing of the values.
+    num_windows: the number of distinct windows the values are spread over.
+  """
+  class TriggerDriverBenchmark(object):
+    def __init__(self, num_elements_per_benchmark):
+      self._driver = driver_fn(windowing)
+      self._windowed_values = []
+      for _ in range(num_elements_per_benchmark):
+        timestamp = random.randint(0, num_windows * 60 - 1)
+        self._windowed_values.append(
+            windowed_value.WindowedValue(
+                timestamp,
+                timestamp,
+                windowing.windowfn.assign(
+                    window.WindowFn.AssignContext(timestamp))))
+
+    def __call__(self):
+      for _ in self._driver.process_entire_key('key', self._windowed_values):
+        pass
+
+  TriggerDriverBenchmark.__name__ = "%s, %s, %s, %s windows" % (
+      driver_fn.__name__,
+      windowing.windowfn.__class__.__name__,
+      beam_runner_api_pb2.OutputTime.Enum.Name(windowing.timestamp_combiner),
+      num_windows)
+
+  return TriggerDriverBenchmark
+
+
+def general_driver(windowing):
+  return trigger.GeneralTriggerDriver(windowing, TestClock())
+
+
+def batch_driver(windowing):
+  return trigger.create_trigger_driver(windowing, is_batch=True)
+
+
+def run_trigger_driver_benchmarks(
+    num_runs, input_size, seed, verbose, filter_regex='.*'):
+  random.seed(seed)
+
+  benchmarks = []
+  for windowing in (
+      Windowing(window.FixedWindows(60)),
+      Windowing(window.SlidingWindows(60, 20)),
+      Windowing(
+          window.FixedWindows(60),
+          timestamp_combiner=window.TimestampCombiner.OUTPUT_AT_EARLIEST)):
+    for num_windows in (1, 100):
+      for driver_fn in (general_driver, batch_driver):
+        benchmarks.append(
+            trigger_driver_benchmark_factory(driver_fn, windowing, num_windows))
+
+  suite = [
+      utils.BenchmarkConfig(b, input_size, num_runs) for b in benchmarks
+      if re.search(filter_regex, b.__name__, flags=re.I)
+  ]
+  utils.run_benchmarks(suite, verbose=verbose)
+
+
+if __name__ == "__main__":
+  logging.basicConfig()
+
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--filter', default='.*')
+  parser.add_argument('--num_runs', default=20, type=int)
+  parser.add_argument('--num_elements_per_benchmark', default=10000, type=int)
+  parser.add_argument('--seed', default=42, type=int)
+  options = parser.parse_args()
+
+  run_trigger_driver_benchmarks(
+      options.num_runs,
+      options.num_elements_per_benchmark,
+      options.seed,
+      verbose=True,
+      filter_regex=options.filter)
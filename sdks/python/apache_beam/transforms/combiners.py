@@ -869,6 +869,7 @@ class PhasedCombineFnExecutor(object):
   def __init__(self, phase, fn, args, kwargs):
 
     self.combine_fn = curry_combine_fn(fn, args, kwargs)
+    self.phase = phase
 
     if phase == 'all':
       self.apply = self.full_combine
@@ -624,7 +624,8 @@ class DoFn(WithTypeHints, HasDisplayData, urns.RunnerApiFn):
 
     This is a good place to initialize transient in-memory resources, such as
     network connections. The resources can then be disposed in
-    ``DoFn.teardown``.
+    ``DoFn.teardown``. Large read-only resources can be shared by all the
+    instances of a worker process with :class:`apache_beam.utils.shared.Shared`.
     """
     pass
 
@@ -24,6 +24,7 @@ Triggers control when in processing time windows get emitted.
 
 from __future__ import absolute_import
 
+import bisect
 import collections
 import copy
 import logging
@@ -41,9 +42,12 @@ from apache_beam.coders import observable
 from apache_beam.portability.api import beam_runner_api_pb2
 from apache_beam.transforms import combiners
 from apache_beam.transforms import core
+from apache_beam.transforms.timeutil import DependsOnlyOnWindow
 from apache_beam.transforms.timeutil import TimeDomain
 from apache_beam.transforms.window import GlobalWindow
 from apache_beam.transforms.window import GlobalWindows
+from apache_beam.transforms.window import IntervalWindow
+from apache_beam.transforms.window import Sessions
 from apache_beam.transforms.window import TimestampCombiner
 from apache_beam.transforms.window import WindowedValue
 from apache_beam.transforms.window import WindowFn
@@ -878,10 +882,26 @@ class MergeableStateAdapter(SimpleState):
   # or other window_fns when a single element typically belongs to many windows.
 
   WINDOW_IDS = _ValueStateTag('window_ids')
+  # The (end, start) pairs of the known windows in sorted order, so that the
+  # windows overlapping a new one can be found without scanning all of them.
+  INTERVALS = _ValueStateTag('intervals')
 
-  def __init__(self, raw_state):
+  def __init__(self, raw_state, track_intervals=False):
+    """Initializes the adapter.
+
+    Args:
+      raw_state: the UnmergedState to wrap.
+      track_intervals: whether to index the known windows, which must be
+        IntervalWindows that never overlap each other once merged, by interval.
+        Enables overlapping_windows().
+    """
     self.raw_state = raw_state
     self.window_ids = self.raw_state.get_global_state(self.WINDOW_IDS, {})
+    self.intervals = None
+    if track_intervals:
+      self.intervals = self.raw_state.get_global_state(self.INTERVALS)
+      if self.intervals is None:
+        self.intervals = sorted((w.end, w.start) for w in self.window_ids)
     self.counter = None
 
   def set_timer(self, window, name, time_domain, timestamp):
@@ -926,6 +946,7 @@ class MergeableStateAdapter(SimpleState):
       self.raw_state.clear_state(window_id, tag)
     if tag is None:
       del self.window_ids[window]
+      self._remove_interval(window)
       self._persist_window_ids()
 
   def merge(self, to_be_merged, merge_result):
@@ -936,12 +957,29 @@ class MergeableStateAdapter(SimpleState):
             merge_window_ids = self.window_ids[merge_result]
           else:
             merge_window_ids = self.window_ids[merge_result] = []
+            self._add_interval(merge_result)
           merge_window_ids.extend(self.window_ids.pop(window))
+          self._remove_interval(window)
           self._persist_window_ids()
 
   def known_windows(self):
     return list(self.window_ids)
 
+  def is_known_window(self, window):
+    return window in self.window_ids
+
+  def overlapping_windows(self, window):
+    """Returns the known windows overlapping the given interval window."""
+    # Known windows don't overlap each other, so both their ends and starts are
+    # in the order of the intervals.
+    i = bisect.bisect_right(self.intervals, (window.start, MAX_TIMESTAMP))
+    overlapping = []
+    while i < len(self.intervals) and self.intervals[i][1] < window.end:
+      end, start = self.intervals[i]
+      overlapping.append(IntervalWindow(start, end))
+      i += 1
+    return overlapping
+
   def get_window(self, window_id):
     for window, ids in self.window_ids.items():
       if window_id in ids:
@@ -954,6 +992,7 @@ class MergeableStateAdapter(SimpleState):
 
     window_id = self._get_next_counter()
     self.window_ids[window] = [window_id]
+    self._add_interval(window)
     self._persist_window_ids()
     return window_id
 
@@ -968,8 +1007,21 @@ class MergeableStateAdapter(SimpleState):
     self.counter += 1
     return self.counter
 
+  def _add_interval(self, window):
+    if self.intervals is not None:
+      bisect.insort(self.intervals, (window.end, window.start))
+
+  def _remove_interval(self, window):
+    if self.intervals is not None:
+      interval = (window.end, window.start)
+      i = bisect.bisect_left(self.intervals, interval)
+      if i < len(self.intervals) and self.intervals[i] == interval:
+        del self.intervals[i]
+
   def _persist_window_ids(self):
     self.raw_state.set_global_state(self.WINDOW_IDS, self.window_ids)
+    if self.intervals is not None:
+      self.raw_state.set_global_state(self.INTERVALS, self.intervals)
 
   def __repr__(self):
     return '\n\t'.join([repr(self.window_ids)] +
@@ -988,12 +1040,16 @@ def create_trigger_driver(
         windowing.triggerfn == AfterCount(1) and is_batch):
     # Here we also just pass through all the values exactly once.
     driver = BatchGlobalTriggerDriver()
+  elif (is_batch and windowing.triggerfn == DefaultTrigger() and
+        not windowing.windowfn.is_merging()):
+    # Here every window fires once, with all its values.
+    driver = BatchNonMergingTriggerDriver(windowing)
   else:
-    driver = GeneralTriggerDriver(windowing, clock)
+    # The general driver combines values eagerly, as they arrive.
+    return GeneralTriggerDriver(windowing, clock, phased_combine_fn)
 
   if phased_combine_fn:
-    # TODO(ccy): Refactor GeneralTriggerDriver to combine values eagerly using
-    # the known phased_combine_fn here.
+    # Batch drivers output all values at once, which are combined then.
     driver = CombiningTriggerDriver(phased_combine_fn, driver)
   return driver
 
@@ -1114,6 +1170,82 @@ class BatchGlobalTriggerDriver(TriggerDriver):
     raise TypeError('Triggers never set or called for batch default windowing.')
 
 
+class BatchNonMergingTriggerDriver(TriggerDriver):
+  """Groups all received values by window, for non-merging windows.
+
+  With the default trigger in batch, the watermark passes the end of every
+  window only once all values are there, so each window fires exactly one
+  on-time pane holding all of its values, and no trigger state or timers are
+  needed.
+  """
+  # Like GeneralTriggerDriver, as the default trigger never finishes.
+  ONLY_FIRING = windowed_value.PaneInfo(
+      is_first=True,
+      is_last=False,
+      timing=windowed_value.PaneInfoTiming.ON_TIME,
+      index=0,
+      nonspeculative_index=0)
+
+  def __init__(self, windowing):
+    self.timestamp_combiner_impl = TimestampCombiner.get_impl(
+        windowing.timestamp_combiner, windowing.windowfn)
+
+  def process_elements(
+      self,
+      state,
+      windowed_values,
+      unused_output_watermark,
+      unused_input_watermark=MIN_TIMESTAMP):
+    timestamp_combiner_impl = self.timestamp_combiner_impl
+    windows_to_values = collections.defaultdict(list)
+    if isinstance(timestamp_combiner_impl, DependsOnlyOnWindow):
+      for wv in windowed_values:
+        for window in wv.windows:
+          windows_to_values[window].append(wv.value)
+      for window, values in windows_to_values.items():
+        yield WindowedValue(
+            values,
+            timestamp_combiner_impl.assign_output_time(window, None),
+            (window, ),
+            self.ONLY_FIRING)
+    else:
+      windows_to_output_times = {}
+      for wv in windowed_values:
+        for window in wv.windows:
+          windows_to_values[window].append(wv.value)
+          output_time = timestamp_combiner_impl.assign_output_time(
+              window, wv.timestamp)
+          if window in windows_to_output_times:
+            output_time = timestamp_combiner_impl.combine(
+                windows_to_output_times[window], output_time)
+          windows_to_output_times[window] = output_time
+      for window, values in windows_to_values.items():
+        yield WindowedValue(
+            values,
+            windows_to_output_times[window], (window, ),
+            self.ONLY_FIRING)
+
+  def process_timer(
+      self,
+      window_id,
+      name,
+      time_domain,
+      timestamp,
+      state,
+      input_watermark=None):
+    raise TypeError(
+        'Triggers never set or called for batch non-merging windowing.')
+
+  def process_entire_key(
+      self,
+      key,
+      windowed_values,
+      unused_output_watermark=None,
+      unused_input_watermark=None):
+    for wvalue in self.process_elements(None, windowed_values, MIN_TIMESTAMP):
+      yield wvalue.with_value((key, wvalue.value))
+
+
 class CombiningTriggerDriver(TriggerDriver):
   """Uses a phased_combine_fn to process output of wrapped TriggerDriver."""
   def __init__(self, phased_combine_fn, underlying):
@@ -1145,10 +1277,41 @@ class CombiningTriggerDriver(TriggerDriver):
       yield output.with_value(self.phased_combine_fn.apply(output.value))
 
 
+class _IncrementalPhasedCombineFn(core.CombineFn):
+  """Performs a phase of a combine one input at a time.
+
+  The inputs of the 'merge' and 'extract' phases are accumulators, and only the
+  'all' and 'extract' phases extract the output from the accumulator.
+  """
+  def __init__(self, phased_combine_fn):
+    self.phase = phased_combine_fn.phase
+    self.combine_fn = phased_combine_fn.combine_fn
+
+  def create_accumulator(self):
+    return self.combine_fn.create_accumulator()
+
+  def add_input(self, accumulator, element):
+    if self.phase in ('merge', 'extract'):
+      return self.combine_fn.merge_accumulators([accumulator, element])
+    return self.combine_fn.add_input(accumulator, element)
+
+  def merge_accumulators(self, accumulators):
+    return self.combine_fn.merge_accumulators(accumulators)
+
+  def compact(self, accumulator):
+    return self.combine_fn.compact(accumulator)
+
+  def extract_output(self, accumulator):
+    if self.phase in ('all', 'extract'):
+      return self.combine_fn.extract_output(accumulator)
+    return accumulator
+
+
 class GeneralTriggerDriver(TriggerDriver):
   """Breaks a series of bundle and timer firings into window (pane)s.
 
-  Suitable for all variants of Windowing.
+  Suitable for all variants of Windowing. If a phased_combine_fn is given, the
+  values of each pane are combined with it as they arrive.
   """
   ELEMENTS = _ListStateTag('elements')
   TOMBSTONE = _CombiningValueStateTag('tombstone', combiners.CountCombineFn())
@@ -1156,7 +1319,7 @@ class GeneralTriggerDriver(TriggerDriver):
   NONSPECULATIVE_INDEX = _CombiningValueStateTag(
       'nonspeculative_index', combiners.CountCombineFn())
 
-  def __init__(self, windowing, clock):
+  def __init__(self, windowing, clock, phased_combine_fn=None):
     self.clock = clock
     self.allowed_lateness = windowing.allowed_lateness
     self.window_fn = windowing.windowfn
@@ -1166,9 +1329,22 @@ class GeneralTriggerDriver(TriggerDriver):
     self.WATERMARK_HOLD = _WatermarkHoldStateTag(
         'watermark', self.timestamp_combiner_impl)
     # pylint: enable=invalid-name
+    if phased_combine_fn:
+      # Keep a single accumulator per window rather than all of its elements.
+      # pylint: disable=invalid-name
+      self.ELEMENTS = _CombiningValueStateTag(
+          'elements', _IncrementalPhasedCombineFn(phased_combine_fn))
+      # pylint: enable=invalid-name
     self.trigger_fn = windowing.triggerfn
     self.accumulation_mode = windowing.accumulation_mode
     self.is_merging = True
+    # Sessions only merge overlapping windows, which allows to merge a new
+    # window with the few known windows it overlaps instead of all of them.
+    self.merges_overlapping_intervals = isinstance(self.window_fn, Sessions)
+
+  def _state_adapter(self, state):
+    return MergeableStateAdapter(
+        state, track_intervals=self.merges_overlapping_intervals)
 
   def process_elements(
       self,
@@ -1177,7 +1353,7 @@ class GeneralTriggerDriver(TriggerDriver):
       output_watermark,
       input_watermark=MIN_TIMESTAMP):
     if self.is_merging:
-      state = MergeableStateAdapter(state)
+      state = self._state_adapter(state)
 
     windows_to_elements = collections.defaultdict(list)
     for wv in windowed_values:
@@ -1189,10 +1365,18 @@ class GeneralTriggerDriver(TriggerDriver):
 
     # First handle merging.
     if self.is_merging:
-      old_windows = set(state.known_windows())
-      all_windows = old_windows.union(list(windows_to_elements))
-
-      if all_windows != old_windows:
+      new_windows = [
+          window for window in windows_to_elements
+          if not state.is_known_window(window)
+      ]
+
+      if new_windows:
+        if self.merges_overlapping_intervals:
+          to_merge = set(new_windows)
+          for window in new_windows:
+            to_merge.update(state.overlapping_windows(window))
+        else:
+          to_merge = set(state.known_windows()).union(new_windows)
         merged_away = {}
 
         class TriggerMergeContext(WindowFn.MergeContext):
@@ -1205,7 +1389,7 @@ class GeneralTriggerDriver(TriggerDriver):
             self.trigger_fn.on_merge(
                 to_be_merged, merge_result, state.at(merge_result, self.clock))
 
-        self.window_fn.merge(TriggerMergeContext(all_windows))
+        self.window_fn.merge(TriggerMergeContext(to_merge))
 
         merged_windows_to_elements = collections.defaultdict(list)
         for window, values in windows_to_elements.items():
@@ -1260,7 +1444,7 @@ class GeneralTriggerDriver(TriggerDriver):
       input_watermark = timestamp
 
     if self.is_merging:
-      state = MergeableStateAdapter(state)
+      state = self._state_adapter(state)
     window = state.get_window(window_id)
     if state.get_state(window, self.TOMBSTONE):
       return
@@ -1349,8 +1533,11 @@ class InMemoryUnmergedState(UnmergedState):
     cloned_object.timers = copy.deepcopy(self.timers)
     cloned_object.global_state = copy.deepcopy(self.global_state)
     for window in self.state:
-      for tag in self.state[window]:
-        cloned_object.state[window][tag] = copy.copy(self.state[window][tag])
+      for tag, value in self.state[window].items():
+        # Accumulators may be mutated in place when adding inputs.
+        cloned_object.state[window][tag] = (
+            copy.copy(value)
+            if isinstance(value, list) else copy.deepcopy(value))
     return cloned_object
 
   def set_global_state(self, tag, value):
@@ -1379,8 +1566,13 @@ class InMemoryUnmergedState(UnmergedState):
     if isinstance(tag, _ValueStateTag):
       self.state[window][tag.tag] = value
     elif isinstance(tag, _CombiningValueStateTag):
-      # TODO(robertwb): Store merged accumulators.
-      self.state[window][tag.tag].append(value)
+      # Only the accumulator is kept, not the inputs.
+      state = self.state[window]
+      if tag.tag in state:
+        accumulator = state[tag.tag]
+      else:
+        accumulator = tag.combine_fn.create_accumulator()
+      state[tag.tag] = tag.combine_fn.add_input(accumulator, value)
     elif isinstance(tag, _ListStateTag):
       self.state[window][tag.tag].append(value)
     elif isinstance(tag, _SetStateTag):
@@ -1391,11 +1583,16 @@ class InMemoryUnmergedState(UnmergedState):
       raise ValueError('Invalid tag.', tag)
 
   def get_state(self, window, tag):
+    if isinstance(tag, _CombiningValueStateTag):
+      state = self.state.get(window, {})
+      if tag.tag in state:
+        accumulator = state[tag.tag]
+      else:
+        accumulator = tag.combine_fn.create_accumulator()
+      return tag.combine_fn.extract_output(accumulator)
     values = self.state[window][tag.tag]
     if isinstance(tag, _ValueStateTag):
       return values
-    elif isinstance(tag, _CombiningValueStateTag):
-      return tag.combine_fn.apply(values)
     elif isinstance(tag, _ListStateTag):
       return values
     elif isinstance(tag, _SetStateTag):
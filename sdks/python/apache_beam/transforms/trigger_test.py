@@ -45,6 +45,7 @@ from apache_beam.testing.test_pipeline import TestPipeline
 from apache_beam.testing.test_stream import TestStream
 from apache_beam.testing.util import assert_that
 from apache_beam.testing.util import equal_to
+from apache_beam.transforms import combiners
 from apache_beam.transforms import ptransform
 from apache_beam.transforms import trigger
 from apache_beam.transforms.core import Windowing
@@ -63,6 +64,7 @@ from apache_beam.transforms.trigger import TriggerFn
 from apache_beam.transforms.window import FixedWindows
 from apache_beam.transforms.window import IntervalWindow
 from apache_beam.transforms.window import Sessions
+from apache_beam.transforms.window import SlidingWindows
 from apache_beam.transforms.window import TimestampCombiner
 from apache_beam.transforms.window import TimestampedValue
 from apache_beam.transforms.window import WindowedValue
@@ -426,6 +428,78 @@ class TriggerTest(unittest.TestCase):
          IntervalWindow(0, 17): [set('abcdefgh')]},
         2)
 
+  def _run_sessions(self, driver, bundles):
+    state = InMemoryUnmergedState()
+    panes = collections.defaultdict(list)
+    for bundle in bundles:
+      for wvalue in driver.process_elements(state,
+                                            bundle,
+                                            MIN_TIMESTAMP,
+                                            MIN_TIMESTAMP):
+        panes[wvalue.windows[0]].append(wvalue.value)
+    while state.timers:
+      for timer_window, (name, time_domain,
+                         timestamp) in state.get_and_clear_timers():
+        for wvalue in driver.process_timer(timer_window,
+                                           name,
+                                           time_domain,
+                                           timestamp,
+                                           state):
+          panes[wvalue.windows[0]].append(wvalue.value)
+    return panes, state
+
+  def test_sessions_incremental_merge(self):
+    window_fn = Sessions(10)
+    windowing = Windowing(
+        window_fn,
+        AfterWatermark(early=AfterCount(3)),
+        AccumulationMode.ACCUMULATING)
+    rand = random.Random(0)
+    bundles = []
+    for _ in range(20):
+      bundle = []
+      for _ in range(rand.randint(1, 5)):
+        t = rand.randint(0, 500)
+        bundle.append(
+            WindowedValue(t, t, window_fn.assign(WindowFn.AssignContext(t, t))))
+      bundles.append(bundle)
+
+    incremental = GeneralTriggerDriver(windowing, TestClock())
+    self.assertTrue(incremental.merges_overlapping_intervals)
+    full = GeneralTriggerDriver(windowing, TestClock())
+    full.merges_overlapping_intervals = False
+
+    incremental_panes, _ = self._run_sessions(incremental, bundles)
+    full_panes, _ = self._run_sessions(full, bundles)
+    self.assertEqual(
+        {w: [sorted(p) for p in ps]
+         for w, ps in incremental_panes.items()},
+        {w: [sorted(p) for p in ps]
+         for w, ps in full_panes.items()})
+
+  def test_combining_driver_keeps_accumulators(self):
+    window_fn = Sessions(10)
+    driver = trigger.create_trigger_driver(
+        Windowing(
+            window_fn, Repeatedly(AfterCount(2)),
+            AccumulationMode.ACCUMULATING),
+        phased_combine_fn=combiners.PhasedCombineFnExecutor(
+            'all', beam.combiners.CountCombineFn(), (), {}),
+        clock=TestClock())
+    self.assertIsInstance(driver, GeneralTriggerDriver)
+    bundles = [[
+        WindowedValue(t, t, window_fn.assign(WindowFn.AssignContext(t, t)))
+    ] for t in [1, 5, 8, 30, 35]]
+
+    panes, state = self._run_sessions(driver, bundles)
+    self.assertEqual(
+        dict(panes), {
+            IntervalWindow(1, 15): [2], IntervalWindow(30, 45): [2]
+        })
+    # Only the count is kept for each window, not the elements.
+    for window_state in state.state.values():
+      self.assertNotIsInstance(window_state.get('elements', 0), list)
+
   def test_picklable_output(self):
     global_window = (trigger.GlobalWindow(), )
     driver = trigger.BatchGlobalTriggerDriver()
@@ -436,6 +510,29 @@ class TriggerTest(unittest.TestCase):
       self.assertEqual(
           pickle.loads(pickle.dumps(unwindowed)).value, list(range(10)))
 
+  def test_batch_non_merging_driver(self):
+    rand = random.Random(0)
+    timestamps = [rand.randint(0, 100) for _ in range(50)]
+    for window_fn in (FixedWindows(10), SlidingWindows(10, 5)):
+      for timestamp_combiner in (TimestampCombiner.OUTPUT_AT_EOW,
+                                 TimestampCombiner.OUTPUT_AT_EARLIEST,
+                                 TimestampCombiner.OUTPUT_AT_LATEST):
+        windowing = Windowing(window_fn, timestamp_combiner=timestamp_combiner)
+        driver = trigger.create_trigger_driver(windowing, is_batch=True)
+        self.assertIsInstance(driver, trigger.BatchNonMergingTriggerDriver)
+        windowed_values = [
+            WindowedValue(t, t, window_fn.assign(WindowFn.AssignContext(t, t)))
+            for t in timestamps
+        ]
+
+        def panes(driver):
+          return sorted(
+              (wv.windows, wv.timestamp, sorted(wv.value[1]), wv.pane_info)
+              for wv in driver.process_entire_key('key', windowed_values))
+
+        self.assertEqual(
+            panes(driver), panes(GeneralTriggerDriver(windowing, TestClock())))
+
 
 class RunnerApiTest(unittest.TestCase):
   def test_trigger_encoding(self):
@@ -516,6 +613,27 @@ class TriggerPipelineTest(unittest.TestCase):
     second_firing = [str(i) for i in elements]
     assert_that(records, equal_to(first_firing + second_firing))
 
+  def test_sessions_combine_per_key(self):
+    ts = (
+        TestStream().advance_watermark_to(0).add_elements([
+            TimestampedValue(('k', 1), 1),
+            TimestampedValue(('k', 2), 5),
+            TimestampedValue(('k', 4), 30)
+        ]).advance_watermark_to(12).add_elements(
+            [TimestampedValue(('k', 8), 12)]).advance_watermark_to_infinity())
+
+    options = PipelineOptions()
+    options.view_as(StandardOptions).streaming = True
+    with TestPipeline(options=options) as p:
+      result = (
+          p
+          | ts
+          | beam.WindowInto(Sessions(10))
+          | beam.CombinePerKey(sum)
+          | beam.ParDo(
+              lambda kv, w=beam.DoFn.WindowParam: [(kv, w.start, w.end)]))
+      assert_that(result, equal_to([(('k', 11), 1, 22), (('k', 4), 30, 40)]))
+
 
 class TranscriptTest(unittest.TestCase):
 
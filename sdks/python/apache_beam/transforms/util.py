@@ -48,6 +48,7 @@ from past.builtins import long
 from apache_beam import coders
 from apache_beam import typehints
 from apache_beam.metrics import Metrics
+from apache_beam.options.pipeline_options import StandardOptions
 from apache_beam.portability import common_urns
 from apache_beam.transforms import window
 from apache_beam.transforms.combiners import CountCombineFn
@@ -72,9 +73,11 @@ from apache_beam.transforms.userstate import on_timer
 from apache_beam.transforms.window import NonMergingWindowFn
 from apache_beam.transforms.window import TimestampCombiner
 from apache_beam.transforms.window import TimestampedValue
+from apache_beam.typehints import trivial_inference
 from apache_beam.utils import windowed_value
 from apache_beam.utils.annotations import deprecated
 from apache_beam.utils.annotations import experimental
+from apache_beam.utils.timestamp import Timestamp
 
 if TYPE_CHECKING:
   from apache_beam import pvalue
@@ -82,6 +85,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     'BatchElements',
+    'BatchElementsPerKey',
     'CoGroupByKey',
     'Distinct',
     'Keys',
@@ -298,6 +302,14 @@ class _BatchSizeEstimator(object):
         'BatchElements', 'batch_size')
     self._time_distribution = Metrics.distribution(
         'BatchElements', 'msec_per_batch')
+    # The most recently fitted model, time = fixed_cost + size * element_cost,
+    # exported so that batching of expensive (e.g. inference) steps can be
+    # inspected and tuned.
+    self._fixed_cost_gauge = Metrics.gauge('BatchElements', 'fixed_cost_nsec')
+    self._element_cost_gauge = Metrics.gauge(
+        'BatchElements', 'per_element_cost_nsec')
+    self._target_size_gauge = Metrics.gauge(
+        'BatchElements', 'target_batch_size')
     # Beam distributions only accept integer values, so we use this to
     # accumulate under-reported values until they add up to whole milliseconds.
     # (Milliseconds are chosen because that's conventionally used elsewhere in
@@ -426,6 +438,8 @@ class _BatchSizeEstimator(object):
     # Avoid nonsensical or division-by-zero errors below due to noise.
     a = max(a, 1e-10)
     b = max(b, 1e-20)
+    self._fixed_cost_gauge.set(int(a * 1e9))
+    self._element_cost_gauge.set(int(b * 1e9))
 
     last_batch_size = self._data[-1][0]
     cap = min(last_batch_size * self._MAX_GROWTH_FACTOR, self._max_batch_size)
@@ -449,7 +463,9 @@ class _BatchSizeEstimator(object):
     if len(self._data) > 10:
       target += int(target * self._variance * 2 * (random.random() - .5))
 
-    return int(max(self._min_batch_size + jitter, min(target, cap)))
+    result = int(max(self._min_batch_size + jitter, min(target, cap)))
+    self._target_size_gauge.set(result)
+    return result
 
   def next_batch_size(self):
     # Check if we should replay a previous batch size due to it not being
@@ -467,74 +483,244 @@ class _BatchSizeEstimator(object):
     return result
 
 
-class _GlobalWindowsBatchingDoFn(DoFn):
-  def __init__(self, batch_size_estimator):
+class _BatchingDoFn(DoFn):
+  """Base for DoFns that batch elements within a bundle.
+
+  A batch is emitted once it holds the estimator's current batch size, once
+  its elements reach max_batch_bytes, or once its first element has been
+  buffered for max_batch_duration_secs.
+  """
+  def __init__(
+      self,
+      batch_size_estimator,
+      max_batch_bytes=None,
+      element_size_fn=None,
+      max_batch_duration_secs=None):
     self._batch_size_estimator = batch_size_estimator
+    self._max_batch_bytes = max_batch_bytes
+    self._element_size_fn = element_size_fn
+    self._max_batch_duration_secs = max_batch_duration_secs
+
+  def _is_full(self, batch_len, batch_bytes, batch_start):
+    if batch_len >= self._batch_size:
+      return True
+    elif self._max_batch_bytes and batch_bytes >= self._max_batch_bytes:
+      return True
+    elif self._max_batch_duration_secs:
+      return (
+          self._batch_size_estimator._clock() - batch_start >=
+          self._max_batch_duration_secs)
+    return False
+
 
+class _GlobalWindowsBatchingDoFn(_BatchingDoFn):
   def start_bundle(self):
     self._batch = []
+    self._batch_bytes = 0
+    self._batch_start = None
     self._batch_size = self._batch_size_estimator.next_batch_size()
     # The first emit often involves non-trivial setup.
     self._batch_size_estimator.ignore_next_timing()
 
   def process(self, element):
+    if self._max_batch_bytes:
+      element_bytes = self._element_size_fn(element)
+      if (self._batch and
+          self._batch_bytes + element_bytes > self._max_batch_bytes):
+        for batch in self._flush():
+          yield batch
+      self._batch_bytes += element_bytes
+    if self._max_batch_duration_secs and not self._batch:
+      self._batch_start = self._batch_size_estimator._clock()
     self._batch.append(element)
-    if len(self._batch) >= self._batch_size:
-      with self._batch_size_estimator.record_time(self._batch_size):
-        yield self._batch
-      self._batch = []
-      self._batch_size = self._batch_size_estimator.next_batch_size()
+    if self._is_full(len(self._batch), self._batch_bytes, self._batch_start):
+      for batch in self._flush():
+        yield batch
+
+  def _flush(self):
+    with self._batch_size_estimator.record_time(len(self._batch)):
+      yield self._batch
+    self._batch = []
+    self._batch_bytes = 0
+    self._batch_size = self._batch_size_estimator.next_batch_size()
 
   def finish_bundle(self):
     if self._batch:
-      with self._batch_size_estimator.record_time(self._batch_size):
+      with self._batch_size_estimator.record_time(len(self._batch)):
         yield window.GlobalWindows.windowed_value(self._batch)
       self._batch = None
       self._batch_size = self._batch_size_estimator.next_batch_size()
 
 
-class _WindowAwareBatchingDoFn(DoFn):
+class _WindowAwareBatchingDoFn(_BatchingDoFn):
 
   _MAX_LIVE_WINDOWS = 10
 
-  def __init__(self, batch_size_estimator):
-    self._batch_size_estimator = batch_size_estimator
-
   def start_bundle(self):
     self._batches = collections.defaultdict(list)
+    self._batch_bytes = collections.defaultdict(int)
+    self._batch_starts = {}
     self._batch_size = self._batch_size_estimator.next_batch_size()
     # The first emit often involves non-trivial setup.
     self._batch_size_estimator.ignore_next_timing()
 
   def process(self, element, window=DoFn.WindowParam):
-    self._batches[window].append(element)
-    if len(self._batches[window]) >= self._batch_size:
-      with self._batch_size_estimator.record_time(self._batch_size):
-        yield windowed_value.WindowedValue(
-            self._batches[window], window.max_timestamp(), (window, ))
-      del self._batches[window]
-      self._batch_size = self._batch_size_estimator.next_batch_size()
+    for batch in self._add(window, element):
+      yield batch
+
+  def _add(self, batch_key, element):
+    if self._max_batch_bytes:
+      element_bytes = self._element_size_fn(element)
+      if (batch_key in self._batches and
+          self._batch_bytes[batch_key] + element_bytes > self._max_batch_bytes):
+        for batch in self._flush(batch_key):
+          yield batch
+      self._batch_bytes[batch_key] += element_bytes
+    batch = self._batches[batch_key]
+    if self._max_batch_duration_secs and not batch:
+      self._batch_starts[batch_key] = self._batch_size_estimator._clock()
+    batch.append(element)
+    if self._is_full(len(batch),
+                     self._batch_bytes[batch_key],
+                     self._batch_starts.get(batch_key)):
+      for batch in self._flush(batch_key):
+        yield batch
     elif len(self._batches) > self._MAX_LIVE_WINDOWS:
-      window, _ = sorted(
-          self._batches.items(),
-          key=lambda window_batch: len(window_batch[1]),
-          reverse=True)[0]
-      with self._batch_size_estimator.record_time(self._batch_size):
-        yield windowed_value.WindowedValue(
-            self._batches[window], window.max_timestamp(), (window, ))
-      del self._batches[window]
-      self._batch_size = self._batch_size_estimator.next_batch_size()
+      largest = max(
+          self._batches, key=lambda batch_key: len(self._batches[batch_key]))
+      for batch in self._flush(largest):
+        yield batch
+
+  def _flush(self, batch_key):
+    batch = self._batches.pop(batch_key)
+    self._batch_bytes.pop(batch_key, None)
+    self._batch_starts.pop(batch_key, None)
+    with self._batch_size_estimator.record_time(len(batch)):
+      yield self._windowed_batch(batch_key, batch)
+    self._batch_size = self._batch_size_estimator.next_batch_size()
+
+  def _windowed_batch(self, window, batch):
+    return windowed_value.WindowedValue(
+        batch, window.max_timestamp(), (window, ))
 
   def finish_bundle(self):
-    for window, batch in self._batches.items():
+    for batch_key, batch in self._batches.items():
       if batch:
-        with self._batch_size_estimator.record_time(self._batch_size):
-          yield windowed_value.WindowedValue(
-              batch, window.max_timestamp(), (window, ))
+        with self._batch_size_estimator.record_time(len(batch)):
+          yield self._windowed_batch(batch_key, batch)
     self._batches = None
     self._batch_size = self._batch_size_estimator.next_batch_size()
 
 
+class _KeyedBatchingDoFn(_WindowAwareBatchingDoFn):
+  """Batches the values of a keyed PCollection per key and window."""
+
+  _MAX_LIVE_WINDOWS = 100
+
+  def process(self, element, window=DoFn.WindowParam):
+    key, value = element
+    for batch in self._add((window, key), value):
+      yield batch
+
+  def _windowed_batch(self, window_and_key, batch):
+    window, key = window_and_key
+    return windowed_value.WindowedValue((key, batch),
+                                        window.max_timestamp(), (window, ))
+
+
+def _pardo_stateful_batch_elements(
+    input_coder,
+    batch_size_estimator,
+    max_batch_bytes=None,
+    element_size_fn=None,
+    max_batch_duration_secs=None):
+  """Batches the values of each key using state and timers.
+
+  Used where bundles give no bound on how long elements may be buffered (i.e.
+  in streaming), so batches are additionally flushed at the end of the window
+  and, if max_batch_duration_secs is set, once the first element of a batch
+  has been buffered for that long in processing time.
+  """
+  ELEMENT_STATE = BagStateSpec('values', input_coder)
+  COUNT_STATE = CombiningValueStateSpec('count', CountCombineFn())
+  BYTES_STATE = CombiningValueStateSpec('bytes', sum)
+  WINDOW_TIMER = TimerSpec('window_end', TimeDomain.WATERMARK)
+  BUFFERING_TIMER = TimerSpec('buffering_end', TimeDomain.REAL_TIME)
+
+  class _StatefulBatchingDoFn(DoFn):
+    def start_bundle(self):
+      self._batch_size = batch_size_estimator.next_batch_size()
+
+    def process(
+        self,
+        element,
+        window=DoFn.WindowParam,
+        element_state=DoFn.StateParam(ELEMENT_STATE),
+        count_state=DoFn.StateParam(COUNT_STATE),
+        bytes_state=DoFn.StateParam(BYTES_STATE),
+        window_timer=DoFn.TimerParam(WINDOW_TIMER),
+        buffering_timer=DoFn.TimerParam(BUFFERING_TIMER)):
+      count = count_state.read()
+      if max_batch_bytes:
+        element_bytes = element_size_fn(element[1])
+        if (count and bytes_state.read() + element_bytes > max_batch_bytes):
+          for batch in self._flush(element_state, count_state, bytes_state):
+            yield batch
+          count = 0
+        bytes_state.add(element_bytes)
+      if not count:
+        window_timer.set(window.max_timestamp())
+        if max_batch_duration_secs:
+          buffering_timer.set(Timestamp.now() + max_batch_duration_secs)
+      element_state.add(element)
+      count_state.add(1)
+      if (count + 1 >= self._batch_size or
+          (max_batch_bytes and bytes_state.read() >= max_batch_bytes)):
+        for batch in self._flush(element_state, count_state, bytes_state):
+          yield batch
+        buffering_timer.clear()
+
+    @on_timer(WINDOW_TIMER)
+    def window_end(
+        self,
+        element_state=DoFn.StateParam(ELEMENT_STATE),
+        count_state=DoFn.StateParam(COUNT_STATE),
+        bytes_state=DoFn.StateParam(BYTES_STATE)):
+      return self._flush(element_state, count_state, bytes_state)
+
+    @on_timer(BUFFERING_TIMER)
+    def buffering_end(
+        self,
+        element_state=DoFn.StateParam(ELEMENT_STATE),
+        count_state=DoFn.StateParam(COUNT_STATE),
+        bytes_state=DoFn.StateParam(BYTES_STATE)):
+      return self._flush(element_state, count_state, bytes_state)
+
+    def _flush(self, element_state, count_state, bytes_state):
+      elements = list(element_state.read())
+      if elements:
+        element_state.clear()
+        count_state.clear()
+        bytes_state.clear()
+        with batch_size_estimator.record_time(len(elements)):
+          yield elements[0][0], [value for _, value in elements]
+        self._batch_size = batch_size_estimator.next_batch_size()
+
+  return _StatefulBatchingDoFn()
+
+
+def _is_streaming(pcoll):
+  return (
+      getattr(pcoll.pipeline.runner, 'is_streaming', False) or
+      not pcoll.is_bounded or
+      pcoll.pipeline._options.view_as(StandardOptions).streaming)
+
+
+@typehints.with_output_types(Tuple[int, Any])
+def _with_shared_key(element):
+  return 0, element
+
+
 @typehints.with_input_types(T)
 @typehints.with_output_types(List[T])
 class BatchElements(PTransform):
@@ -552,6 +738,16 @@ class BatchElements(PTransform):
   This transform attempts to find the best batch size between the minimim
   and maximum parameters by profiling the time taken by (fused) downstream
   operations. For a fixed batch size, set the min and max to be equal.
+  The fitted fixed and per element costs are reported as the
+  ``BatchElements:fixed_cost_nsec`` and ``BatchElements:per_element_cost_nsec``
+  gauges.
+
+  Batches may additionally be bounded by their (estimated) encoded size in
+  bytes, and by how long their first element may wait for the batch to fill.
+  In streaming pipelines, where bundles do not bound how long elements are
+  buffered, batching is done with state and timers and partially filled
+  batches are emitted once max_batch_duration_secs has elapsed or the window
+  ends.
 
   Elements are batched per-window and batches emitted in the window
   corresponding to its contents.
@@ -568,6 +764,12 @@ class BatchElements(PTransform):
         linear interpolation
     clock: (optional) an alternative to time.time for measuring the cost of
         donwstream operations (mostly for testing)
+    max_batch_bytes: (optional) the largest total size, as given by
+        element_size_fn, of the elements in a batch
+    element_size_fn: (optional) a function returning the size of an element,
+        defaults to the estimated encoded size according to the input coder
+    max_batch_duration_secs: (optional) the longest time, in seconds, an
+        element may be buffered before its (partial) batch is emitted
   """
   def __init__(
       self,
@@ -576,7 +778,17 @@ class BatchElements(PTransform):
       target_batch_overhead=.05,
       target_batch_duration_secs=1,
       variance=0.25,
-      clock=time.time):
+      clock=time.time,
+      max_batch_bytes=None,
+      element_size_fn=None,
+      max_batch_duration_secs=None):
+    if max_batch_bytes is not None and max_batch_bytes <= 0:
+      raise ValueError(
+          "max_batch_bytes (%s) must be positive" % max_batch_bytes)
+    if max_batch_duration_secs is not None and max_batch_duration_secs <= 0:
+      raise ValueError(
+          "max_batch_duration_secs (%s) must be positive" %
+          max_batch_duration_secs)
     self._batch_size_estimator = _BatchSizeEstimator(
         min_batch_size=min_batch_size,
         max_batch_size=max_batch_size,
@@ -584,17 +796,66 @@ class BatchElements(PTransform):
         target_batch_duration_secs=target_batch_duration_secs,
         variance=variance,
         clock=clock)
+    self._max_batch_bytes = max_batch_bytes
+    self._element_size_fn = element_size_fn
+    self._max_batch_duration_secs = max_batch_duration_secs
+
+  def _batching_args(self, element_coder):
+    element_size_fn = self._element_size_fn
+    if self._max_batch_bytes and not element_size_fn:
+      element_size_fn = element_coder.estimate_size
+    return dict(
+        max_batch_bytes=self._max_batch_bytes,
+        element_size_fn=element_size_fn,
+        max_batch_duration_secs=self._max_batch_duration_secs)
 
   def expand(self, pcoll):
-    if getattr(pcoll.pipeline.runner, 'is_streaming', False):
-      raise NotImplementedError("Requires stateful processing (BEAM-2687)")
+    batching_args = self._batching_args(coders.registry.get_coder(pcoll))
+    if _is_streaming(pcoll):
+      keyed = pcoll | 'WithSharedKey' >> Map(_with_shared_key)
+      return (
+          keyed
+          | ParDo(
+              _pardo_stateful_batch_elements(
+                  coders.registry.get_coder(keyed),
+                  self._batch_size_estimator,
+                  **batching_args))
+          | 'DropKey' >> Map(lambda kv: kv[1]))
     elif pcoll.windowing.is_default():
       # This is the same logic as _GlobalWindowsBatchingDoFn, but optimized
       # for that simpler case.
       return pcoll | ParDo(
-          _GlobalWindowsBatchingDoFn(self._batch_size_estimator))
+          _GlobalWindowsBatchingDoFn(
+              self._batch_size_estimator, **batching_args))
     else:
-      return pcoll | ParDo(_WindowAwareBatchingDoFn(self._batch_size_estimator))
+      return pcoll | ParDo(
+          _WindowAwareBatchingDoFn(self._batch_size_estimator, **batching_args))
+
+
+@typehints.with_input_types(Tuple[K, V])
+@typehints.with_output_types(Tuple[K, List[V]])
+class BatchElementsPerKey(BatchElements):
+  """Like BatchElements, but batches the values of each key separately.
+
+  Consumes a PCollection of (key, value) pairs and produces a PCollection of
+  (key, [values]) pairs, so that a batch never mixes elements of different
+  keys. Accepts the same arguments as BatchElements; max_batch_bytes and
+  element_size_fn apply to the values only.
+  """
+  def expand(self, pcoll):
+    input_coder = coders.registry.get_coder(pcoll)
+    if input_coder.is_kv_coder():
+      value_coder = input_coder.value_coder()
+    else:
+      value_coder = input_coder
+    batching_args = self._batching_args(value_coder)
+    if _is_streaming(pcoll):
+      return pcoll | ParDo(
+          _pardo_stateful_batch_elements(
+              input_coder, self._batch_size_estimator, **batching_args))
+    else:
+      return pcoll | ParDo(
+          _KeyedBatchingDoFn(self._batch_size_estimator, **batching_args))
 
 
 class _IdentityWindowFn(NonMergingWindowFn):
@@ -750,61 +1011,197 @@ class GroupIntoBatches(PTransform):
 
   Windows are preserved (batches will contain elements from the same window)
 
+  Batches can also be emitted before they are full: once the buffered elements
+  reach max_batch_bytes, or once the first of them has been buffered for
+  max_buffering_duration_secs in processing time, so that a slow key cannot
+  hold elements indefinitely. The sizes of emitted batches and how long they
+  were buffered are reported as the ``GroupIntoBatches:batch_size`` and
+  ``GroupIntoBatches:buffering_msec`` distributions.
+
   GroupIntoBatches is experimental. Its use case will depend on the runner if
   it has support of States and Timers.
   """
-  def __init__(self, batch_size):
+  def __init__(
+      self,
+      batch_size,
+      max_buffering_duration_secs=None,
+      max_batch_bytes=None,
+      element_size_fn=None):
     """Create a new GroupIntoBatches with batch size.
 
     Arguments:
       batch_size: (required) How many elements should be in a batch
+      max_buffering_duration_secs: (optional) How long, in seconds, an element
+        may be buffered before its (partial) batch is emitted
+      max_batch_bytes: (optional) The largest total size, as given by
+        element_size_fn, of the values in a batch
+      element_size_fn: (optional) A function returning the size of a value,
+        defaults to the estimated encoded size according to the value coder
     """
     warnings.warn(
         'Use of GroupIntoBatches transform requires State/Timer '
         'support from the runner')
+    if (max_buffering_duration_secs is not None and
+        max_buffering_duration_secs <= 0):
+      raise ValueError(
+          'max_buffering_duration_secs (%s) must be positive' %
+          max_buffering_duration_secs)
+    if max_batch_bytes is not None and max_batch_bytes <= 0:
+      raise ValueError(
+          'max_batch_bytes (%s) must be positive' % max_batch_bytes)
     self.batch_size = batch_size
+    self.max_buffering_duration_secs = max_buffering_duration_secs
+    self.max_batch_bytes = max_batch_bytes
+    self.element_size_fn = element_size_fn
+
+  def _group_into_batches_fn(self, input_coder):
+    element_size_fn = self.element_size_fn
+    if self.max_batch_bytes and not element_size_fn:
+      element_size_fn = input_coder.value_coder().estimate_size
+    return _pardo_group_into_batches(
+        self.batch_size,
+        input_coder,
+        max_buffering_duration_secs=self.max_buffering_duration_secs,
+        max_batch_bytes=self.max_batch_bytes,
+        element_size_fn=element_size_fn)
 
   def expand(self, pcoll):
     input_coder = coders.registry.get_coder(pcoll)
-    return pcoll | ParDo(
-        _pardo_group_into_batches(self.batch_size, input_coder))
+    return pcoll | ParDo(self._group_into_batches_fn(input_coder))
+
+  @experimental()
+  @typehints.with_input_types(Tuple[K, V])
+  class WithShardedKey(PTransform):
+    """A GroupIntoBatches that spreads each key over several shards.
+
+    Batching is stateful per key, so all the elements of a key are buffered
+    and emitted by a single worker. This variant instead assigns each worker
+    its own shard of every key, so that hot keys are batched in parallel.
+    Batches still contain the original (key, value) elements of a single key
+    and window, but a key may now be spread over several partial batches.
+
+    Accepts the same arguments as GroupIntoBatches.
+    """
+    def __init__(self, batch_size, **kwargs):
+      self._group_into_batches = GroupIntoBatches(batch_size, **kwargs)
+
+    def expand(self, pcoll):
+      key_type, value_type = trivial_inference.key_value_types(
+          pcoll.element_type)
+      sharded = pcoll | 'ShardKeys' >> ParDo(_ShardKeysFn()).with_output_types(
+          Tuple[Tuple[key_type, int], value_type])
+      return (
+          sharded
+          | ParDo(
+              self._group_into_batches._group_into_batches_fn(
+                  coders.registry.get_coder(sharded)))
+          | 'UnshardKeys' >>
+          Map(lambda batch: [(key, value) for (key, _), value in batch]))
+
+
+class _ShardKeysFn(DoFn):
+  """Pairs each key with a shard id unique to this DoFn instance."""
+  def setup(self):
+    self._shard_id = random.getrandbits(32)
+
+  def process(self, element):
+    key, value = element
+    yield (key, self._shard_id), value
 
 
-def _pardo_group_into_batches(batch_size, input_coder):
+def _pardo_group_into_batches(
+    batch_size,
+    input_coder,
+    max_buffering_duration_secs=None,
+    max_batch_bytes=None,
+    element_size_fn=None):
   ELEMENT_STATE = BagStateSpec('values', input_coder)
   COUNT_STATE = CombiningValueStateSpec('count', input_coder, CountCombineFn())
+  BYTES_STATE = CombiningValueStateSpec('bytes', sum)
+  BUFFERING_START_STATE = BagStateSpec('buffering_start', coders.FloatCoder())
   EXPIRY_TIMER = TimerSpec('expiry', TimeDomain.WATERMARK)
+  BUFFERING_TIMER = TimerSpec('buffering', TimeDomain.REAL_TIME)
 
   class _GroupIntoBatchesDoFn(DoFn):
+    def __init__(self):
+      self._batch_size_distribution = Metrics.distribution(
+          'GroupIntoBatches', 'batch_size')
+      self._buffering_distribution = Metrics.distribution(
+          'GroupIntoBatches', 'buffering_msec')
+
     def process(
         self,
         element,
         window=DoFn.WindowParam,
         element_state=DoFn.StateParam(ELEMENT_STATE),
         count_state=DoFn.StateParam(COUNT_STATE),
-        expiry_timer=DoFn.TimerParam(EXPIRY_TIMER)):
-      # Allowed lateness not supported in Python SDK
-      # https://beam.apache.org/documentation/programming-guide/#watermarks-and-late-data
-      expiry_timer.set(window.end)
+        bytes_state=DoFn.StateParam(BYTES_STATE),
+        buffering_start_state=DoFn.StateParam(BUFFERING_START_STATE),
+        expiry_timer=DoFn.TimerParam(EXPIRY_TIMER),
+        buffering_timer=DoFn.TimerParam(BUFFERING_TIMER)):
+      count = count_state.read()
+      if max_batch_bytes:
+        element_bytes = element_size_fn(element[1])
+        if count and bytes_state.read() + element_bytes > max_batch_bytes:
+          for batch in self._flush(element_state,
+                                   count_state,
+                                   bytes_state,
+                                   buffering_start_state):
+            yield batch
+          count = 0
+        bytes_state.add(element_bytes)
+      if not count:
+        # Allowed lateness not supported in Python SDK
+        # https://beam.apache.org/documentation/programming-guide/#watermarks-and-late-data
+        expiry_timer.set(window.end)
+        buffering_start_state.add(time.time())
+        if max_buffering_duration_secs:
+          buffering_timer.set(Timestamp.now() + max_buffering_duration_secs)
       element_state.add(element)
       count_state.add(1)
-      count = count_state.read()
-      if count >= batch_size:
-        batch = [element for element in element_state.read()]
-        yield batch
-        element_state.clear()
-        count_state.clear()
+      if (count + 1 >= batch_size or
+          (max_batch_bytes and bytes_state.read() >= max_batch_bytes)):
+        for batch in self._flush(element_state,
+                                 count_state,
+                                 bytes_state,
+                                 buffering_start_state):
+          yield batch
+        if max_buffering_duration_secs:
+          buffering_timer.clear()
 
     @on_timer(EXPIRY_TIMER)
     def expiry(
         self,
         element_state=DoFn.StateParam(ELEMENT_STATE),
-        count_state=DoFn.StateParam(COUNT_STATE)):
+        count_state=DoFn.StateParam(COUNT_STATE),
+        bytes_state=DoFn.StateParam(BYTES_STATE),
+        buffering_start_state=DoFn.StateParam(BUFFERING_START_STATE)):
+      return self._flush(
+          element_state, count_state, bytes_state, buffering_start_state)
+
+    @on_timer(BUFFERING_TIMER)
+    def buffering_deadline(
+        self,
+        element_state=DoFn.StateParam(ELEMENT_STATE),
+        count_state=DoFn.StateParam(COUNT_STATE),
+        bytes_state=DoFn.StateParam(BYTES_STATE),
+        buffering_start_state=DoFn.StateParam(BUFFERING_START_STATE)):
+      return self._flush(
+          element_state, count_state, bytes_state, buffering_start_state)
+
+    def _flush(
+        self, element_state, count_state, bytes_state, buffering_start_state):
       batch = [element for element in element_state.read()]
       if batch:
+        buffering_start = min(buffering_start_state.read())
+        self._batch_size_distribution.update(len(batch))
+        self._buffering_distribution.update(
+            int(1e3 * (time.time() - buffering_start)))
         yield batch
         element_state.clear()
         count_state.clear()
+        bytes_state.clear()
+        buffering_start_state.clear()
 
   return _GroupIntoBatchesDoFn()
 
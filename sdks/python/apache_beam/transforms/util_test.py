@@ -39,6 +39,7 @@ from nose.plugins.attrib import attr
 import apache_beam as beam
 from apache_beam import WindowInto
 from apache_beam.coders import coders
+from apache_beam.metrics.metric import MetricsFilter
 from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.options.pipeline_options import StandardOptions
 from apache_beam.testing.test_pipeline import TestPipeline
@@ -111,6 +112,108 @@ class BatchElementsTest(unittest.TestCase):
           10, 7,         # elements in [30, 47)
       ]))
 
+  def test_max_batch_bytes(self):
+    with TestPipeline() as p:
+      res = (
+          p
+          | beam.Create(['a' * 10] * 9 + ['b' * 30])
+          | util.BatchElements(
+              min_batch_size=100,
+              max_batch_size=100,
+              max_batch_bytes=25,
+              element_size_fn=len)
+          | beam.Map(len))
+      assert_that(res, equal_to([2, 2, 2, 2, 1, 1]))
+
+  def test_windowed_max_batch_bytes(self):
+    with TestPipeline() as p:
+      res = (
+          p
+          | beam.Create(range(40), reshuffle=False)
+          | beam.Map(lambda t: window.TimestampedValue(t, t))
+          | beam.WindowInto(window.FixedWindows(20))
+          | util.BatchElements(
+              min_batch_size=100,
+              max_batch_size=100,
+              max_batch_bytes=5,
+              element_size_fn=lambda _: 1)
+          | beam.Map(len))
+      assert_that(res, equal_to([5] * 8))
+
+  def test_max_batch_duration(self):
+    clock = FakeClock()
+    batching_fn = util._GlobalWindowsBatchingDoFn(
+        util._BatchSizeEstimator(
+            min_batch_size=100, max_batch_size=100, clock=clock),
+        max_batch_duration_secs=10)
+    batching_fn.start_bundle()
+    batches = []
+    for i in range(12):
+      batches.extend(batching_fn.process(i))
+      clock.sleep(3)
+    batches.extend(wv.value for wv in batching_fn.finish_bundle())
+    self.assertEqual([[0, 1, 2, 3, 4], [5, 6, 7, 8, 9], [10, 11]], batches)
+
+  def test_batch_elements_per_key(self):
+    with TestPipeline() as p:
+      res = (
+          p
+          | beam.Create([('a', i) for i in range(5)] + [('b', i)
+                                                        for i in range(3)])
+          | util.BatchElementsPerKey(min_batch_size=2, max_batch_size=2)
+          | beam.MapTuple(lambda k, batch: (k, sorted(batch))))
+      assert_that(
+          res,
+          equal_to([('a', [0, 1]), ('a', [2, 3]), ('a', [4]), ('b', [0, 1]),
+                    ('b', [2])]))
+
+  def test_stateful_batching(self):
+    with TestPipeline() as p:
+      res = (
+          p
+          | beam.Create([('a', str(i))
+                         for i in range(7)] + [('b', 'x' * 10)] * 3)
+          | beam.ParDo(
+              util._pardo_stateful_batch_elements(
+                  coders.TupleCoder(
+                      [coders.StrUtf8Coder(), coders.FastPrimitivesCoder()]),
+                  util._BatchSizeEstimator(min_batch_size=3, max_batch_size=3),
+                  max_batch_bytes=25,
+                  element_size_fn=len))
+          | beam.MapTuple(lambda k, batch: (k, len(batch))))
+      assert_that(
+          res, equal_to([('a', 3), ('a', 3), ('a', 1), ('b', 2), ('b', 1)]))
+
+  def test_streaming_batches(self):
+    test_stream = (
+        TestStream().add_elements([
+            TimestampedValue(x, x) for x in range(10)
+        ]).advance_watermark_to(20).advance_watermark_to_infinity())
+    with TestPipeline(options=StandardOptions(streaming=True)) as p:
+      res = (
+          p
+          | test_stream
+          | beam.WindowInto(FixedWindows(5))
+          | util.BatchElements(
+              min_batch_size=3, max_batch_size=3, max_batch_duration_secs=60)
+          | beam.Map(sorted))
+      # Partial batches are flushed at the end of each window.
+      assert_that(res, equal_to([[0, 1, 2], [3, 4], [5, 6, 7], [8, 9]]))
+
+  def test_fitted_model_metrics(self):
+    p = TestPipeline()
+    _ = (
+        p
+        | beam.Create(range(100))
+        | util.BatchElements(max_batch_size=10, clock=FakeClock()))
+    result = p.run()
+    result.wait_until_finish()
+    gauges = result.metrics().query(
+        MetricsFilter().with_namespace('BatchElements'))['gauges']
+    self.assertEqual(
+        set(['fixed_cost_nsec', 'per_element_cost_nsec', 'target_batch_size']),
+        set(gauge.key.metric.name for gauge in gauges))
+
   def test_target_duration(self):
     clock = FakeClock()
     batch_estimator = util._BatchSizeEstimator(
@@ -659,6 +762,68 @@ class GroupIntoBatchesTest(unittest.TestCase):
                       GroupIntoBatchesTest.BATCH_SIZE))
           ]))
 
+  def test_max_batch_bytes(self):
+    with TestPipeline() as pipeline:
+      collection = (
+          pipeline
+          | beam.Create(
+              GroupIntoBatchesTest._create_test_data(), reshuffle=False)
+          | util.GroupIntoBatches(
+              GroupIntoBatchesTest.BATCH_SIZE,
+              max_batch_bytes=15,
+              element_size_fn=len)
+          | beam.Map(lambda batch: sum(len(v) for _, v in batch)))
+      # Values are added until the next one would exceed 15 bytes.
+      assert_that(collection, equal_to([14, 10, 12, 13, 11, 7]))
+
+  def test_buffering_timer(self):
+    with TestPipeline() as pipeline:
+      collection = (
+          pipeline
+          | beam.Create(GroupIntoBatchesTest._create_test_data())
+          | util.GroupIntoBatches(
+              GroupIntoBatchesTest.BATCH_SIZE, max_buffering_duration_secs=60)
+          | beam.FlatMap(lambda batch: [v for _, v in batch]))
+      assert_that(
+          collection,
+          equal_to([v for _, v in GroupIntoBatchesTest._create_test_data()]))
+
+  def test_with_sharded_key(self):
+    with TestPipeline() as pipeline:
+      collection = (
+          pipeline
+          | beam.Create(GroupIntoBatchesTest._create_test_data())
+          | util.GroupIntoBatches.WithShardedKey(
+              GroupIntoBatchesTest.BATCH_SIZE))
+      assert_that(
+          collection | 'Count' >> beam.combiners.Count.Globally(),
+          equal_to([2]),
+          label='CountBatches')
+      assert_that(
+          collection | beam.FlatMap(lambda batch: batch),
+          equal_to(GroupIntoBatchesTest._create_test_data()),
+          label='CheckElements')
+
+  def test_batch_metrics(self):
+    pipeline = TestPipeline()
+    _ = (
+        pipeline
+        | beam.Create(GroupIntoBatchesTest._create_test_data())
+        | util.GroupIntoBatches(GroupIntoBatchesTest.BATCH_SIZE))
+    result = pipeline.run()
+    result.wait_until_finish()
+    distributions = result.metrics().query(
+        MetricsFilter().with_namespace('GroupIntoBatches'))['distributions']
+    batch_sizes = [
+        d.committed for d in distributions if d.key.metric.name == 'batch_size'
+    ]
+    self.assertEqual(1, len(batch_sizes))
+    self.assertEqual(2, batch_sizes[0].count)
+    self.assertEqual(GroupIntoBatchesTest.NUM_ELEMENTS, batch_sizes[0].sum)
+    self.assertEqual(
+        set(['batch_size', 'buffering_msec']),
+        set(d.key.metric.name for d in distributions))
+
   @unittest.skip('BEAM-8748')
   def test_in_streaming_mode(self):
     timestamp_interval = 1
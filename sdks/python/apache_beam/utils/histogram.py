@@ -0,0 +1,199 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Mergeable histograms of non-negative integers.
+
+For internal use only; no backwards-compatibility guarantees.
+"""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+from __future__ import division
+
+from builtins import object
+from typing import Dict
+from typing import Iterator
+from typing import Tuple
+
+from apache_beam.coders import coder_impl
+
+
+class LogLinearHistogram(object):
+  """A histogram of non-negative integers with log-linear buckets.
+
+  Values are grouped by their power of two, and each power of two is split
+  into 2^precision_bits linear buckets, so that the width of the bucket of a
+  value v is at most v / 2^precision_bits. Values below 2^precision_bits get a
+  bucket each. This keeps the relative error of the reported percentiles
+  bounded (12.5% for the default precision) over any range of values, with a
+  few dozen buckets per order of magnitude at most.
+
+  The buckets only depend on the precision, hence two histograms of the same
+  precision are merged by adding up the counts of their buckets.
+  """
+  def __init__(self, precision_bits=3):
+    # type: (int) -> None
+    self._precision_bits = precision_bits
+    self._counts = {}  # type: Dict[int, int]
+    self._count = 0
+    self._sum = 0
+    self._min = 0
+    self._max = 0
+
+  def add(self, value):
+    # type: (int) -> None
+    if value < 0:
+      raise ValueError('Negative value %s' % value)
+    index = self._bucket_index(value)
+    self._counts[index] = self._counts.get(index, 0) + 1
+    if not self._count or value < self._min:
+      self._min = value
+    if value > self._max:
+      self._max = value
+    self._count += 1
+    self._sum += value
+
+  def merge(self, other):
+    # type: (LogLinearHistogram) -> None
+    if other._precision_bits != self._precision_bits:
+      raise ValueError(
+          'Cannot merge histograms of precisions %s and %s' %
+          (self._precision_bits, other._precision_bits))
+    if not other._count:
+      return
+    for index, count in other._counts.items():
+      self._counts[index] = self._counts.get(index, 0) + count
+    if not self._count or other._min < self._min:
+      self._min = other._min
+    self._max = max(self._max, other._max)
+    self._count += other._count
+    self._sum += other._sum
+
+  def count(self):
+    # type: () -> int
+    return self._count
+
+  def sum(self):
+    # type: () -> int
+    return self._sum
+
+  def min(self):
+    # type: () -> int
+    return self._min
+
+  def max(self):
+    # type: () -> int
+    return self._max
+
+  def mean(self):
+    # type: () -> float
+    return self._sum / self._count if self._count else 0.0
+
+  def buckets(self):
+    # type: () -> Iterator[Tuple[int, int, int]]
+
+    """Yields (lower, upper, count) for the non-empty buckets, in order.
+
+    A bucket holds the values in [lower, upper).
+    """
+    for index in sorted(self._counts):
+      lower, upper = self._bucket_bounds(index)
+      yield lower, upper, self._counts[index]
+
+  def percentile(self, percent):
+    # type: (float) -> int
+
+    """Returns an approximation of the given percentile of the values.
+
+    The result is the upper bound of the bucket holding the percentile,
+    clamped to the observed extremes of the values.
+    """
+    if not self._count:
+      return 0
+    rank = percent / 100 * self._count
+    seen = 0
+    for _, upper, count in self.buckets():
+      seen += count
+      if seen >= rank:
+        return max(self._min, min(upper - 1, self._max))
+    return self._max
+
+  def encode(self):
+    # type: () -> bytes
+    out = coder_impl.create_OutputStream()
+    out.write_var_int64(self._precision_bits)
+    out.write_var_int64(self._count)
+    out.write_var_int64(self._sum)
+    out.write_var_int64(self._min)
+    out.write_var_int64(self._max)
+    out.write_var_int64(len(self._counts))
+    for index, count in sorted(self._counts.items()):
+      out.write_var_int64(index)
+      out.write_var_int64(count)
+    return out.get()
+
+  @staticmethod
+  def decode(encoded):
+    # type: (bytes) -> LogLinearHistogram
+    in_stream = coder_impl.create_InputStream(encoded)
+    histogram = LogLinearHistogram(in_stream.read_var_int64())
+    histogram._count = in_stream.read_var_int64()
+    histogram._sum = in_stream.read_var_int64()
+    histogram._min = in_stream.read_var_int64()
+    histogram._max = in_stream.read_var_int64()
+    for _ in range(in_stream.read_var_int64()):
+      index = in_stream.read_var_int64()
+      histogram._counts[index] = in_stream.read_var_int64()
+    return histogram
+
+  def _bucket_index(self, value):
+    # type: (int) -> int
+    if value < 1 << self._precision_bits:
+      return value
+    shift = value.bit_length() - self._precision_bits - 1
+    return ((shift + 1) << self._precision_bits) + ((value >> shift) -
+                                                    (1 << self._precision_bits))
+
+  def _bucket_bounds(self, index):
+    # type: (int) -> Tuple[int, int]
+    if index < 1 << self._precision_bits:
+      return index, index + 1
+    shift = (index >> self._precision_bits) - 1
+    mantissa = (1 << self._precision_bits) + (
+        index & ((1 << self._precision_bits) - 1))
+    return mantissa << shift, (mantissa + 1) << shift
+
+  def __eq__(self, other):
+    return (
+        isinstance(other, LogLinearHistogram) and
+        self._precision_bits == other._precision_bits and
+        self._counts == other._counts and self._count == other._count and
+        self._sum == other._sum and self._min == other._min and
+        self._max == other._max)
+
+  def __ne__(self, other):
+    # TODO(BEAM-5949): Needed for Python 2 compatibility.
+    return not self == other
+
+  def __repr__(self):
+    return '<LogLinearHistogram count=%s min=%s p50=%s p99=%s max=%s>' % (
+        self._count,
+        self._min,
+        self.percentile(50),
+        self.percentile(99),
+        self._max)
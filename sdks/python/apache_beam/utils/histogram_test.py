@@ -0,0 +1,97 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for the histogram module."""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+from __future__ import division
+
+import random
+import unittest
+
+from apache_beam.utils.histogram import LogLinearHistogram
+
+
+class LogLinearHistogramTest(unittest.TestCase):
+  def test_buckets_partition_values(self):
+    histogram = LogLinearHistogram()
+    previous_upper = 0
+    for value in range(1 << 12):
+      histogram.add(value)
+    for lower, upper, count in histogram.buckets():
+      self.assertEqual(lower, previous_upper)
+      self.assertEqual(count, upper - lower)
+      # Bucket widths are bounded relative to their values.
+      self.assertLessEqual(upper - lower, max(1, lower // 8))
+      previous_upper = upper
+    self.assertEqual(previous_upper, 1 << 12)
+
+  def test_statistics(self):
+    histogram = LogLinearHistogram()
+    self.assertEqual(histogram.percentile(50), 0)
+    for value in [5, 1000, 3, 1000000]:
+      histogram.add(value)
+    self.assertEqual(histogram.count(), 4)
+    self.assertEqual(histogram.sum(), 1001008)
+    self.assertEqual(histogram.min(), 3)
+    self.assertEqual(histogram.max(), 1000000)
+    self.assertEqual(histogram.percentile(0), 3)
+    self.assertEqual(histogram.percentile(25), 3)
+    self.assertEqual(histogram.percentile(100), 1000000)
+    with self.assertRaises(ValueError):
+      histogram.add(-1)
+
+  def test_percentile_relative_error(self):
+    random.seed(0)
+    values = sorted(int(random.expovariate(1e-4)) for _ in range(10000))
+    histogram = LogLinearHistogram()
+    for value in values:
+      histogram.add(value)
+    for percent in (50, 90, 99, 99.9):
+      exact = values[int(percent / 100 * len(values)) - 1]
+      self.assertLessEqual(
+          abs(histogram.percentile(percent) - exact), exact / 8 + 1)
+
+  def test_merge(self):
+    values = [0, 7, 8, 100, 12345, 10**12]
+    merged = LogLinearHistogram()
+    merged.merge(LogLinearHistogram())
+    expected = LogLinearHistogram()
+    for i, value in enumerate(values):
+      expected.add(value)
+      other = LogLinearHistogram()
+      other.add(value)
+      if i % 2:
+        other.add(value)
+        expected.add(value)
+      merged.merge(other)
+    self.assertEqual(merged, expected)
+    with self.assertRaises(ValueError):
+      merged.merge(LogLinearHistogram(precision_bits=4))
+
+  def test_encoding(self):
+    histogram = LogLinearHistogram(precision_bits=5)
+    self.assertEqual(LogLinearHistogram.decode(histogram.encode()), histogram)
+    for value in [1, 2, 3, 2**40, 77]:
+      histogram.add(value)
+    self.assertEqual(LogLinearHistogram.decode(histogram.encode()), histogram)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -24,21 +24,27 @@ For internal use only; no backwards-compatibility guarantees.
 
 from __future__ import absolute_import
 
+import collections
 import cProfile  # pylint: disable=bad-python3-import
 import io
 import logging
 import os
 import pstats
 import random
+import sys
 import tempfile
+import threading
 import time
+import typing
 import warnings
 from builtins import object
 from threading import Timer
 from typing import Callable
 from typing import Optional
+from typing import Tuple  # pylint: disable=unused-import
 
 from apache_beam.io import filesystems
+from apache_beam.metrics import monitoring_infos
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -196,3 +202,402 @@ class MemoryReporter(object):
         '*** MemoryReport Heap:\n %s\n MemoryReport took %.1f seconds',
         heap_profile,
         time.time() - report_start_time)
+
+
+class StackSampler(object):
+  """A statistical profiler that continuously samples the stacks of threads.
+
+  Unlike Profile, which runs cProfile over whole bundles, the sampler has a
+  low overhead and can stay enabled, aggregating the sampled stacks across
+  bundles. Each stack is attributed to the state the thread was tracked in,
+  typically the step and its process/start/finish state, and stacks are
+  reported in the folded format of flame graphs, one per line::
+
+    <state>;<outermost frame>;...;<innermost frame> <number of samples>
+
+  Usage:::
+
+    sampler = StackSampler(sampling_period_ms=10)
+    sampler.start()
+    <do something>
+    sampler.stop()
+    print(sampler.folded_stacks())
+
+  If a profile_location is given, the folded stacks are also written there
+  every dump_interval_sec seconds while the sampler runs, and when it stops.
+  """
+
+  DEFAULT_SAMPLING_PERIOD_MS = 10
+  DEFAULT_DUMP_INTERVAL_SEC = 300
+
+  def __init__(
+      self,
+      sampling_period_ms=DEFAULT_SAMPLING_PERIOD_MS,
+      thread_states_fn=None,
+      profile_location=None,
+      dump_interval_sec=DEFAULT_DUMP_INTERVAL_SEC,
+      file_copy_fn=None,
+      time_prefix='%Y-%m-%d_%H_%M_%S-'):
+    """Initializes the sampler.
+
+    Args:
+      sampling_period_ms: the time between two samples.
+      thread_states_fn: a callable returning a dict from the ident of each
+        thread to sample to the name of the state it is in. If not given, all
+        threads are sampled and attributed to their thread name.
+      profile_location: path to periodically write the folded stacks to.
+      dump_interval_sec: the time between two writes to profile_location.
+      file_copy_fn: function to copy the dumped stacks to profile_location.
+      time_prefix: strftime format of the prefix of the dumped files.
+    """
+    self._sampling_period_sec = sampling_period_ms / 1000.0
+    self._thread_states_fn = thread_states_fn
+    self._profile_location = profile_location
+    self._dump_interval_sec = dump_interval_sec
+    self._file_copy_fn = file_copy_fn or Profile.default_file_copy_fn
+    self._time_prefix = time_prefix
+    self._profile_id = 'stacks-%d' % os.getpid()
+    # The number of samples of each stack, keyed by its state and code objects.
+    self._counts = collections.Counter()  # type: typing.Counter[Tuple]
+    self._lock = threading.Lock()
+    self._stopped = threading.Event()
+    self._thread = None  # type: Optional[threading.Thread]
+
+  def __enter__(self):
+    self.start()
+    return self
+
+  def __exit__(self, *args):
+    self.stop()
+
+  def start(self):
+    if self._thread:
+      return
+    self._stopped.clear()
+    self._thread = threading.Thread(target=self._run, name='stack_sampler')
+    self._thread.daemon = True
+    self._thread.start()
+
+  def stop(self):
+    if not self._thread:
+      return
+    self._stopped.set()
+    self._thread.join()
+    self._thread = None
+    if self._profile_location:
+      self.dump()
+
+  def _run(self):
+    next_dump = time.time() + self._dump_interval_sec
+    while not self._stopped.wait(self._sampling_period_sec):
+      try:
+        self.sample_once()
+        if self._profile_location and time.time() >= next_dump:
+          self.dump()
+          next_dump = time.time() + self._dump_interval_sec
+      except Exception:  # pylint: disable=broad-except
+        _LOGGER.warning('Failed to sample stacks.', exc_info=True)
+
+  def sample_once(self):
+    """Samples the current stack of the threads."""
+    frames = sys._current_frames()  # pylint: disable=protected-access
+    if self._thread_states_fn:
+      thread_states = self._thread_states_fn()
+    else:
+      thread_states = {
+          thread.ident: thread.name
+          for thread in threading.enumerate() if thread is not self._thread
+      }
+    stacks = []
+    for ident, state in thread_states.items():
+      frame = frames.get(ident)
+      stack = []
+      while frame is not None:
+        stack.append(frame.f_code)
+        frame = frame.f_back
+      if stack:
+        stack.append(state)
+        stack.reverse()
+        stacks.append(tuple(stack))
+    with self._lock:
+      self._counts.update(stacks)
+
+  def folded_stacks(self):
+    """Returns the sampled stacks in the folded format of flame graphs."""
+    with self._lock:
+      counts = list(self._counts.items())
+    lines = []
+    for stack, count in counts:
+      frames = [str(stack[0])]
+      for code in stack[1:]:
+        frames.append(
+            '%s (%s:%d)' %
+            (code.co_name, code.co_filename, code.co_firstlineno))
+      lines.append('%s %d' % (';'.join(frames), count))
+    return '\n'.join(sorted(lines))
+
+  def dump(self):
+    """Writes the sampled stacks to the profile location."""
+    dump_location = os.path.join(
+        self._profile_location,
+        time.strftime(self._time_prefix + self._profile_id))
+    fd, filename = tempfile.mkstemp()
+    try:
+      with os.fdopen(fd, 'w') as f:
+        f.write(self.folded_stacks())
+      _LOGGER.info('Copying sampled stacks to: [%s]', dump_location)
+      self._file_copy_fn(filename, dump_location)
+    finally:
+      os.remove(filename)
+
+  @staticmethod
+  def factory_from_options(options):
+    # type: (...) -> Optional[Callable[..., StackSampler]]
+    if options.profile_stacks:
+
+      def create_stack_sampler(thread_states_fn=None):
+        return StackSampler(
+            options.profile_stacks_sampling_period_ms,
+            thread_states_fn=thread_states_fn,
+            profile_location=options.profile_location)
+
+      return create_stack_sampler
+    return None
+
+
+def _beam_path(*names):
+  return os.path.join(os.path.dirname(os.path.dirname(__file__)), *names)
+
+
+# The code shared by all steps of a worker, which does not tell them apart.
+_HARNESS_PATHS = tuple([
+    os.path.join(_beam_path(name), '') for name in
+    ('coders', 'internal', 'metrics', 'runners', 'typehints', 'utils')
+] + [
+    _beam_path('transforms', 'core.py'),
+    os.path.join(os.path.dirname(os.__file__), '')
+])
+_NON_HARNESS_PATHS = tuple(
+    os.path.join(os.path.dirname(os.__file__), name, '')
+    for name in ('site-packages', 'dist-packages'))
+
+
+class StepMemoryTracker(object):
+  """Estimates the memory each step allocated and still holds.
+
+  The tracker traces allocations with tracemalloc, and periodically takes a
+  snapshot of the traced memory, grouped by the traceback of the allocations.
+  The memory a traceback gained since the previous snapshot is attributed to
+  the step of the thread whose current stack shares the most frames, by file
+  and line, with the traceback. The step of a thread is the current scoped
+  state of its state sampler. The frames of the harness (the Beam runners,
+  coders and utilities, and the Python standard library) are shared by all
+  steps and are not matched. Memory allocated only by such code is attributed
+  to no step, as is memory matching the threads of several steps equally well.
+  The memory a traceback frees is taken back from its steps in proportion.
+
+  The result is a best-effort estimate of the memory each step holds, e.g. in
+  buffers or caches, to tell which step holds the memory of a worker running
+  out of it. Memory is only attributed to a step if the call that allocated it
+  is still on the thread's stack when the snapshot is taken, as for a step
+  accumulating memory over a bundle. The top allocation sites are also
+  available. A snapshot takes time linear in the number of live allocations,
+  hence they are taken every 10 seconds by default.
+
+  Usage:::
+
+    tracker = StepMemoryTracker(thread_steps_fn=...)
+    tracker.start()
+    <do something>
+    print(tracker.live_bytes())
+    tracker.stop()
+
+  NOTE: tracemalloc is only available in Python 3; the tracker is a no-op in
+  Python 2.
+  """
+
+  LIVE_BYTES_URN = 'beam:metric:step_memory:live_bytes'
+  DEFAULT_SAMPLING_PERIOD_MS = 10000
+  DEFAULT_TRACEBACK_LIMIT = 32
+
+  def __init__(
+      self,
+      sampling_period_ms=DEFAULT_SAMPLING_PERIOD_MS,
+      thread_steps_fn=dict,
+      traceback_limit=DEFAULT_TRACEBACK_LIMIT):
+    """Initializes the tracker.
+
+    Args:
+      sampling_period_ms: the time between two snapshots of the traced memory.
+      thread_steps_fn: a callable returning a dict from the ident of each
+        thread processing a step to the id of that step.
+      traceback_limit: the number of frames tracemalloc stores for each
+        allocation, which are matched against the stacks of the threads.
+    """
+    try:
+      import tracemalloc  # pylint: disable=import-error
+      self._tracemalloc = tracemalloc
+    except ImportError:
+      warnings.warn('tracemalloc is not available; StepMemoryTracker disabled.')
+      self._tracemalloc = None
+    self._sampling_period_sec = sampling_period_ms / 1000.0
+    self._thread_steps_fn = thread_steps_fn
+    self._traceback_limit = traceback_limit
+    self._started_tracing = False
+    # The traced bytes of each traceback in the previous snapshot.
+    self._last_sizes = {}  # type: typing.Dict[typing.Any, int]
+    # The bytes of each traceback attributed to each step.
+    self._step_sizes = {
+    }  # type: typing.Dict[typing.Any, typing.Dict[str, float]]
+    # Whether each file of the stacks seen is code of the harness.
+    self._harness_files = {}  # type: typing.Dict[str, bool]
+    self._live_bytes = {}  # type: typing.Dict[str, int]
+    self._lock = threading.Lock()
+    self._stopped = threading.Event()
+    self._thread = None  # type: Optional[threading.Thread]
+
+  def __enter__(self):
+    self.start()
+    return self
+
+  def __exit__(self, *args):
+    self.stop()
+
+  def start(self):
+    if self._thread or not self._tracemalloc:
+      return
+    if not self._tracemalloc.is_tracing():
+      self._tracemalloc.start(self._traceback_limit)
+      self._started_tracing = True
+    self._last_sizes = self._traceback_sizes()
+    self._step_sizes = {}
+    self._stopped.clear()
+    self._thread = threading.Thread(
+        target=self._run, name='step_memory_tracker')
+    self._thread.daemon = True
+    self._thread.start()
+
+  def stop(self):
+    if not self._thread:
+      return
+    self._stopped.set()
+    self._thread.join()
+    self._thread = None
+    if self._started_tracing:
+      self._tracemalloc.stop()
+      self._started_tracing = False
+
+  def _run(self):
+    while not self._stopped.wait(self._sampling_period_sec):
+      try:
+        self.sample_once()
+      except Exception:  # pylint: disable=broad-except
+        _LOGGER.warning('Failed to sample memory.', exc_info=True)
+
+  def _traceback_sizes(self):
+    snapshot = self._tracemalloc.take_snapshot().filter_traces(
+        [self._tracemalloc.Filter(False, self._tracemalloc.__file__)])
+    return {
+        stat.traceback: stat.size
+        for stat in snapshot.statistics('traceback')
+    }
+
+  def sample_once(self):
+    """Attributes the memory allocated since the last sample to steps."""
+    # The stacks are taken first, as the snapshot may take a while.
+    thread_steps = self._thread_steps_fn()
+    thread_frames = []
+    frames = sys._current_frames()  # pylint: disable=protected-access
+    for ident, frame in frames.items():
+      if ident not in thread_steps:
+        continue
+      stack = set()
+      while frame is not None:
+        if not self._is_harness_file(frame.f_code.co_filename):
+          stack.add((frame.f_code.co_filename, frame.f_lineno))
+        frame = frame.f_back
+      thread_frames.append((thread_steps[ident], stack))
+    # The frames refer to this one, and to the memory of all threads.
+    frames = frame = None
+    sizes = self._traceback_sizes()
+
+    for traceback, step_sizes in list(self._step_sizes.items()):
+      size, last_size = sizes.get(traceback, 0), self._last_sizes[traceback]
+      if not size:
+        del self._step_sizes[traceback]
+      elif size < last_size:
+        for step in step_sizes:
+          step_sizes[step] *= float(size) / last_size
+    if thread_frames:
+      for traceback, size in sizes.items():
+        last_size = self._last_sizes.get(traceback, 0)
+        if size > last_size:
+          step = self._allocating_step(traceback, thread_frames)
+          if step is not None:
+            step_sizes = self._step_sizes.setdefault(traceback, {})
+            step_sizes[step] = step_sizes.get(step, 0) + size - last_size
+    live_bytes = collections.defaultdict(
+        float)  # type: typing.DefaultDict[str, float]
+    for step_sizes in self._step_sizes.values():
+      for step, size in step_sizes.items():
+        live_bytes[step] += size
+    self._last_sizes = sizes
+    with self._lock:
+      self._live_bytes = {
+          step: int(size)
+          for step, size in live_bytes.items() if size >= 1
+      }
+
+  def _is_harness_file(self, filename):
+    is_harness = self._harness_files.get(filename)
+    if is_harness is None:
+      is_harness = self._harness_files[filename] = (
+          filename.startswith(_HARNESS_PATHS) and
+          not filename.startswith(_NON_HARNESS_PATHS))
+    return is_harness
+
+  def _allocating_step(self, traceback, thread_frames):
+    """Returns the step of the thread whose stack best matches a traceback."""
+    frames = set((frame.filename, frame.lineno) for frame in traceback
+                 if not self._is_harness_file(frame.filename))
+    best_steps, best_score = set(), 0
+    for step, stack in thread_frames:
+      score = len(frames & stack)
+      if score > best_score:
+        best_steps, best_score = set([step]), score
+      elif score and score == best_score:
+        best_steps.add(step)
+    return best_steps.pop() if len(best_steps) == 1 else None
+
+  def live_bytes(self):
+    """Returns the estimated bytes held by each step, by step id."""
+    with self._lock:
+      return dict(self._live_bytes)
+
+  def monitoring_infos(self):
+    """Returns the bytes held by each step as gauge monitoring infos."""
+    return [
+        monitoring_infos.int64_gauge(
+            self.LIVE_BYTES_URN, live_bytes, ptransform=step) for step,
+        live_bytes in self.live_bytes().items()
+    ]
+
+  def top_allocation_sites(self, limit=10):
+    """Returns the sites holding the most traced memory, one per line."""
+    if not self._tracemalloc or not self._tracemalloc.is_tracing():
+      return ''
+    snapshot = self._tracemalloc.take_snapshot().filter_traces(
+        [self._tracemalloc.Filter(False, self._tracemalloc.__file__)])
+    return '\n'.join(
+        str(stat) for stat in snapshot.statistics('lineno')[:limit])
+
+  @staticmethod
+  def factory_from_options(options):
+    # type: (...) -> Optional[Callable[..., StepMemoryTracker]]
+    if options.profile_step_memory:
+
+      def create_memory_tracker(thread_steps_fn=dict):
+        return StepMemoryTracker(thread_steps_fn=thread_steps_fn)
+
+      return create_memory_tracker
+    return None
@@ -0,0 +1,213 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for the profiler module."""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent import futures
+
+import mock
+
+from apache_beam.metrics import monitoring_infos
+from apache_beam.options.pipeline_options import PipelineOptions
+from apache_beam.options.pipeline_options import ProfilingOptions
+from apache_beam.utils import profiler
+from apache_beam.utils.profiler import StackSampler
+from apache_beam.utils.profiler import StepMemoryTracker
+
+
+def _wait_on(event):
+  event.wait()
+
+
+class StackSamplerTest(unittest.TestCase):
+  def setUp(self):
+    self.done = threading.Event()
+    self.thread = threading.Thread(target=_wait_on, args=(self.done, ))
+    self.thread.start()
+
+  def tearDown(self):
+    self.done.set()
+    self.thread.join()
+
+  def test_stacks_attributed_to_state(self):
+    sampler = StackSampler(
+        thread_states_fn=lambda: {self.thread.ident: 'MyStep/process'})
+    for _ in range(3):
+      sampler.sample_once()
+
+    lines = sampler.folded_stacks().split('\n')
+    self.assertEqual(len(lines), 1)
+    stack, count = lines[0].rsplit(' ', 1)
+    self.assertEqual(count, '3')
+    frames = stack.split(';')
+    self.assertEqual(frames[0], 'MyStep/process')
+    self.assertIn('_wait_on (%s:' % __file__.rstrip('c'), stack)
+    self.assertTrue(frames[-1].startswith('wait ('))
+
+  def test_untracked_threads_not_sampled(self):
+    sampler = StackSampler(thread_states_fn=dict)
+    sampler.sample_once()
+    self.assertEqual(sampler.folded_stacks(), '')
+
+  def test_dump_on_stop(self):
+    profile_location = tempfile.mkdtemp()
+    try:
+      sampler = StackSampler(
+          sampling_period_ms=1,
+          thread_states_fn=lambda: {self.thread.ident: 'MyStep/process'},
+          profile_location=profile_location)
+      with sampler:
+        while not sampler.folded_stacks():
+          self.done.wait(0.01)
+      dumps = os.listdir(profile_location)
+      self.assertEqual(len(dumps), 1)
+      with open(os.path.join(profile_location, dumps[0])) as f:
+        self.assertTrue(f.read().startswith('MyStep/process;'))
+    finally:
+      shutil.rmtree(profile_location)
+
+  def test_factory_from_options(self):
+    self.assertIsNone(
+        StackSampler.factory_from_options(
+            PipelineOptions([]).view_as(ProfilingOptions)))
+    factory = StackSampler.factory_from_options(
+        PipelineOptions(['--profile_stacks']).view_as(ProfilingOptions))
+    self.assertIsInstance(factory(), StackSampler)
+
+
+@unittest.skipIf(sys.version_info[0] < 3, 'tracemalloc requires Python 3')
+class StepMemoryTrackerTest(unittest.TestCase):
+  def setUp(self):
+    self.thread_steps = {}
+    # This module stands for the code of the steps, rather than the harness.
+    patcher = mock.patch.object(
+        profiler,
+        '_NON_HARNESS_PATHS',
+        profiler._NON_HARNESS_PATHS + (__file__.rstrip('c'), ))
+    patcher.start()
+    self.addCleanup(patcher.stop)
+    # Samples are only taken explicitly.
+    self.tracker = StepMemoryTracker(
+        sampling_period_ms=1e9, thread_steps_fn=lambda: dict(self.thread_steps))
+    self.tracker.start()
+
+  def tearDown(self):
+    self.tracker.stop()
+
+  def _run_in_step(self, step, fn):
+    # Like the harness, runs the step in a thread of a pool.
+    with futures.ThreadPoolExecutor(1) as executor:
+      ident = executor.submit(threading.current_thread).result().ident
+      self.thread_steps[ident] = step
+      try:
+        return executor.submit(fn).result()
+      finally:
+        del self.thread_steps[ident]
+
+  def _allocate(self):
+    return [bytearray(1 << 20)]
+
+  def _allocate_and_sample(self):
+    held = [bytearray(1 << 20)]
+    self.tracker.sample_once()
+    return held
+
+  def _process(self):
+    # The memory is allocated within the call sampled.
+    return self._allocate_and_sample()
+
+  def _process_returned(self):
+    # The memory is allocated by a call which returned before the sample.
+    held = self._allocate()
+    self.tracker.sample_once()
+    return held
+
+  def test_live_bytes_attributed_to_step(self):
+    held = self._run_in_step('step1', self._process)
+    unattributed = self._allocate_and_sample()
+
+    live_bytes = self.tracker.live_bytes()
+    self.assertEqual(list(live_bytes), ['step1'])
+    self.assertGreaterEqual(live_bytes['step1'], 1 << 20)
+    self.assertLess(live_bytes['step1'], 2 << 20)
+
+    [mi] = self.tracker.monitoring_infos()
+    self.assertEqual(mi.urn, StepMemoryTracker.LIVE_BYTES_URN)
+    self.assertEqual(mi.labels[monitoring_infos.PTRANSFORM_LABEL], 'step1')
+    self.assertEqual(
+        monitoring_infos.extract_counter_value(mi), live_bytes['step1'])
+
+    self.assertIn(__file__.rstrip('c'), self.tracker.top_allocation_sites())
+    del held, unattributed
+
+  def test_returned_allocations_unattributed(self):
+    held = self._run_in_step('step1', self._process_returned)
+    self.assertLess(self.tracker.live_bytes().get('step1', 0), 1 << 20)
+    del held
+
+  def test_frees_taken_back(self):
+    held = self._run_in_step('step1', self._process)
+    self.assertGreaterEqual(self.tracker.live_bytes()['step1'], 1 << 20)
+
+    del held
+    self._run_in_step('step2', self.tracker.sample_once)
+    live_bytes = self.tracker.live_bytes()
+    self.assertLess(live_bytes.get('step1', 0), 1 << 20)
+    self.assertLess(live_bytes.get('step2', 0), 1 << 20)
+
+  def test_concurrent_steps(self):
+    started, release = threading.Event(), threading.Event()
+
+    def other_step():
+      started.set()
+      release.wait()
+
+    thread = threading.Thread(target=other_step)
+    thread.start()
+    started.wait()
+    self.thread_steps[thread.ident] = 'step2'
+    try:
+      held = self._run_in_step('step1', self._process)
+    finally:
+      release.set()
+      thread.join()
+    live_bytes = self.tracker.live_bytes()
+    self.assertGreaterEqual(live_bytes['step1'], 1 << 20)
+    self.assertLess(live_bytes.get('step2', 0), 1 << 20)
+    del held
+
+  def test_factory_from_options(self):
+    self.assertIsNone(
+        StepMemoryTracker.factory_from_options(
+            PipelineOptions([]).view_as(ProfilingOptions)))
+    factory = StepMemoryTracker.factory_from_options(
+        PipelineOptions(['--profile_step_memory']).view_as(ProfilingOptions))
+    self.assertIsInstance(factory(), StepMemoryTracker)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,175 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Resources shared by all the DoFn instances of a worker process.
+
+A worker creates a DoFn instance for each bundle processor, and runs several
+bundle processors at once, so resources set up in ``DoFn.setup`` are usually
+held many times over. For large read-only resources, such as models, a
+:class:`Shared` handle lets all the instances of a process use a single copy::
+
+  class PredictDoFn(beam.DoFn):
+    def __init__(self, model_path):
+      self._model_path = model_path
+      self._shared_model = shared.Shared()
+
+    def setup(self):
+      self._model = self._shared_model.acquire(
+          lambda: load_model(self._model_path))
+
+    def process(self, element):
+      yield self._model.predict(element)
+
+    def teardown(self):
+      self._shared_model.release()
+
+The resource is built by the first ``acquire`` and dropped once every handle
+holding it has been released. Handles unpickled from the same ``Shared``
+object, or created with the same tag, refer to the same resource.
+
+Shared resources are used by several threads at once, hence they must be
+thread safe, which read-only resources typically are.
+"""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import threading
+import uuid
+from builtins import object
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+
+class _SharedResource(object):
+  """A lazily constructed resource along with the number of its holders."""
+  def __init__(self):
+    self.ref_count = 0
+    self._lock = threading.Lock()
+    self._constructed = False
+    self._resource = None  # type: Any
+
+  def get(self, constructor):
+    # type: (Callable[[], Any]) -> Any
+    # Only one holder constructs the resource, while others wait for it.
+    with self._lock:
+      if not self._constructed:
+        self._resource = constructor()
+        self._constructed = True
+      return self._resource
+
+
+class _SharedResources(object):
+  """The shared resources of this process, by tag."""
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._resources = {}  # type: Dict[str, _SharedResource]
+
+  def acquire(self, tag, constructor):
+    # type: (str, Callable[[], Any]) -> Any
+    with self._lock:
+      resource = self._resources.get(tag)
+      if resource is None:
+        resource = self._resources[tag] = _SharedResource()
+      resource.ref_count += 1
+    try:
+      return resource.get(constructor)
+    except:
+      self.release(tag)
+      raise
+
+  def release(self, tag):
+    # type: (str) -> None
+    with self._lock:
+      resource = self._resources[tag]
+      resource.ref_count -= 1
+      if not resource.ref_count:
+        del self._resources[tag]
+
+  def ref_count(self, tag):
+    # type: (str) -> int
+    with self._lock:
+      resource = self._resources.get(tag)
+      return resource.ref_count if resource else 0
+
+
+_shared_resources = _SharedResources()
+
+
+class Shared(object):
+  """A handle to a resource shared by all the DoFn instances of a process.
+
+  A handle holds a reference to the resource between calls to
+  :meth:`acquire` and :meth:`release`, which are typically made from
+  ``DoFn.setup`` and ``DoFn.teardown``. Pickling a handle does not carry the
+  reference over.
+  """
+  def __init__(self, tag=None):
+    # type: (Optional[str]) -> None
+
+    """
+    Args:
+      tag: identifies the resource in the process. Defaults to a tag unique
+        to this handle and its pickled copies.
+    """
+    self._tag = tag if tag is not None else uuid.uuid4().hex
+    self._acquired = False
+
+  @property
+  def tag(self):
+    # type: () -> str
+    return self._tag
+
+  def acquire(self, constructor):
+    # type: (Callable[[], Any]) -> Any
+
+    """Returns the shared resource, building it if no handle holds it.
+
+    Args:
+      constructor: builds the resource, called once while the resource is
+        held by any handle.
+    """
+    resource = _shared_resources.acquire(self._tag, constructor)
+    if self._acquired:
+      # Hold a single reference per handle.
+      _shared_resources.release(self._tag)
+    self._acquired = True
+    return resource
+
+  def release(self):
+    # type: () -> None
+
+    """Releases the reference of this handle to the resource, if any.
+
+    The resource is dropped when no handle holds it anymore.
+    """
+    if self._acquired:
+      self._acquired = False
+      _shared_resources.release(self._tag)
+
+  def __getstate__(self):
+    return {'_tag': self._tag}
+
+  def __setstate__(self, state):
+    self._tag = state['_tag']
+    self._acquired = False
+
+  def __repr__(self):
+    return 'Shared(%r)' % self._tag
@@ -0,0 +1,118 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for the shared module."""
+
+# pytype: skip-file
+
+from __future__ import absolute_import
+
+import pickle
+import threading
+import time
+import unittest
+
+from apache_beam.utils import shared
+
+
+class SharedTest(unittest.TestCase):
+  def setUp(self):
+    self.constructed = []
+
+  def constructor(self):
+    resource = object()
+    self.constructed.append(resource)
+    return resource
+
+  def ref_count(self, handle):
+    return shared._shared_resources.ref_count(handle.tag)
+
+  def test_pickled_handles_share_resource(self):
+    handle = shared.Shared()
+    copies = [pickle.loads(pickle.dumps(handle)) for _ in range(3)]
+    resources = [copy.acquire(self.constructor) for copy in copies]
+    self.assertEqual(len(self.constructed), 1)
+    self.assertEqual(resources, self.constructed * 3)
+    self.assertEqual(self.ref_count(handle), 3)
+
+    # Acquiring again does not take another reference.
+    self.assertIs(copies[0].acquire(self.constructor), resources[0])
+    self.assertEqual(self.ref_count(handle), 3)
+
+    for copy in copies:
+      copy.release()
+      copy.release()
+    self.assertEqual(self.ref_count(handle), 0)
+    copies[0].acquire(self.constructor)
+    self.assertEqual(len(self.constructed), 2)
+    copies[0].release()
+
+  def test_tags(self):
+    first, second = shared.Shared('tag'), shared.Shared('tag')
+    self.assertIs(
+        first.acquire(self.constructor), second.acquire(self.constructor))
+    self.assertIsNot(
+        first.acquire(self.constructor),
+        shared.Shared().acquire(self.constructor))
+    first.release()
+    second.release()
+
+  def test_pickling_drops_reference(self):
+    handle = shared.Shared()
+    handle.acquire(self.constructor)
+    copy = pickle.loads(pickle.dumps(handle))
+    copy.release()
+    self.assertEqual(self.ref_count(handle), 1)
+    handle.release()
+    self.assertEqual(self.ref_count(handle), 0)
+
+  def test_failed_construction(self):
+    def fail():
+      raise ValueError('failed')
+
+    handle = shared.Shared()
+    with self.assertRaises(ValueError):
+      handle.acquire(fail)
+    self.assertEqual(self.ref_count(handle), 0)
+    handle.acquire(self.constructor)
+    self.assertEqual(len(self.constructed), 1)
+    handle.release()
+
+  def test_concurrent_acquire(self):
+    def slow_constructor():
+      time.sleep(0.1)
+      return self.constructor()
+
+    handles = [shared.Shared('concurrent') for _ in range(8)]
+    resources = []
+    threads = [
+        threading.Thread(
+            target=lambda h: resources.append(h.acquire(slow_constructor)),
+            args=(handle, )) for handle in handles
+    ]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+    self.assertEqual(len(self.constructed), 1)
+    self.assertEqual(resources, self.constructed * 8)
+    for handle in handles:
+      handle.release()
+
+
+if __name__ == '__main__':
+  unittest.main()